@@ -4,33 +4,11 @@ WARNING! All changes made in this file will be lost!
 """
 
 from os import linesep
-from pyleecan.Classes._check import check_init_dict, check_var, raise_
+from pyleecan.Classes._check import check_init_dict, check_var
 from pyleecan.Functions.save import save
 from pyleecan.Classes.Line import Line
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from pyleecan.Methods.Geometry.Arc.draw_FEMM import draw_FEMM
-except ImportError as error:
-    draw_FEMM = error
-
-try:
-    from pyleecan.Methods.Geometry.Arc.intersect_line import intersect_line
-except ImportError as error:
-    intersect_line = error
-
-try:
-    from pyleecan.Methods.Geometry.Arc.is_on_arc import is_on_arc
-except ImportError as error:
-    is_on_arc = error
-
-try:
-    from pyleecan.Methods.Geometry.Arc.split_line import split_line
-except ImportError as error:
-    split_line = error
-
-
+from pyleecan.Classes._lazy import LazyMethod
 from pyleecan.Classes._check import InitUnKnowClassError
 
 
@@ -39,45 +17,14 @@ class Arc(Line):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
     # cf Methods.Geometry.Arc.draw_FEMM
-    if isinstance(draw_FEMM, ImportError):
-        draw_FEMM = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Arc method draw_FEMM: " + str(draw_FEMM))
-            )
-        )
-    else:
-        draw_FEMM = draw_FEMM
+    draw_FEMM = LazyMethod("pyleecan.Methods.Geometry.Arc.draw_FEMM")
     # cf Methods.Geometry.Arc.intersect_line
-    if isinstance(intersect_line, ImportError):
-        intersect_line = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Arc method intersect_line: " + str(intersect_line)
-                )
-            )
-        )
-    else:
-        intersect_line = intersect_line
+    intersect_line = LazyMethod("pyleecan.Methods.Geometry.Arc.intersect_line")
     # cf Methods.Geometry.Arc.is_on_arc
-    if isinstance(is_on_arc, ImportError):
-        is_on_arc = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Arc method is_on_arc: " + str(is_on_arc))
-            )
-        )
-    else:
-        is_on_arc = is_on_arc
+    is_on_arc = LazyMethod("pyleecan.Methods.Geometry.Arc.is_on_arc")
     # cf Methods.Geometry.Arc.split_line
-    if isinstance(split_line, ImportError):
-        split_line = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Arc method split_line: " + str(split_line))
-            )
-        )
-    else:
-        split_line = split_line
+    split_line = LazyMethod("pyleecan.Methods.Geometry.Arc.split_line")
     # save method is available in all object
     save = save
 
@@ -94,7 +41,7 @@ class Arc(Line):
         if init_dict is not None:  # Initialisation by dict
             check_init_dict(init_dict, ["label"])
             # Overwrite default value with init_dict content
-            if "label" in list(init_dict.keys()):
+            if "label" in init_dict:
                 label = init_dict["label"]
         # Initialisation by argument
         # Call Line init
@@ -121,17 +68,24 @@ class Arc(Line):
             return False
         return True
 
-    def as_dict(self):
+    def as_dict(self, is_keep_array=False):
         """Convert this objet in a json seriable dict (can be use in __init__)
+        The ndarray are not converted to list if is_keep_array
         """
 
         # Get the properties inherited from Line
-        Arc_dict = super(Arc, self).as_dict()
+        Arc_dict = super(Arc, self).as_dict(is_keep_array=is_keep_array)
         # The class name is added to the dict fordeserialisation purpose
         # Overwrite the mother class name
         Arc_dict["__class__"] = "Arc"
         return Arc_dict
 
+    def _copy_to(self, obj):
+        """Copy the properties of this object in obj (called by copy)"""
+
+        # Copy the properties inherited from Line
+        super(Arc, self)._copy_to(obj)
+
     def _set_None(self):
         """Set all the properties to None (except pyleecan object)"""
 
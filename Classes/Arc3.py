@@ -4,78 +4,11 @@ WARNING! All changes made in this file will be lost!
 """
 
 from os import linesep
-from pyleecan.Classes._check import check_init_dict, check_var, raise_
+from pyleecan.Classes._check import check_init_dict, check_var
 from pyleecan.Functions.save import save
 from pyleecan.Classes.Arc import Arc
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from pyleecan.Methods.Geometry.Arc3.check import check
-except ImportError as error:
-    check = error
-
-try:
-    from pyleecan.Methods.Geometry.Arc3.comp_length import comp_length
-except ImportError as error:
-    comp_length = error
-
-try:
-    from pyleecan.Methods.Geometry.Arc3.comp_radius import comp_radius
-except ImportError as error:
-    comp_radius = error
-
-try:
-    from pyleecan.Methods.Geometry.Arc3.discretize import discretize
-except ImportError as error:
-    discretize = error
-
-try:
-    from pyleecan.Methods.Geometry.Arc3.get_angle import get_angle
-except ImportError as error:
-    get_angle = error
-
-try:
-    from pyleecan.Methods.Geometry.Arc3.get_begin import get_begin
-except ImportError as error:
-    get_begin = error
-
-try:
-    from pyleecan.Methods.Geometry.Arc3.get_center import get_center
-except ImportError as error:
-    get_center = error
-
-try:
-    from pyleecan.Methods.Geometry.Arc3.get_end import get_end
-except ImportError as error:
-    get_end = error
-
-try:
-    from pyleecan.Methods.Geometry.Arc3.get_middle import get_middle
-except ImportError as error:
-    get_middle = error
-
-try:
-    from pyleecan.Methods.Geometry.Arc3.reverse import reverse
-except ImportError as error:
-    reverse = error
-
-try:
-    from pyleecan.Methods.Geometry.Arc3.rotate import rotate
-except ImportError as error:
-    rotate = error
-
-try:
-    from pyleecan.Methods.Geometry.Arc3.split_half import split_half
-except ImportError as error:
-    split_half = error
-
-try:
-    from pyleecan.Methods.Geometry.Arc3.translate import translate
-except ImportError as error:
-    translate = error
-
-
+from pyleecan.Classes._lazy import LazyMethod
 from pyleecan.Classes._check import InitUnKnowClassError
 
 
@@ -84,124 +17,32 @@ class Arc3(Arc):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
     # cf Methods.Geometry.Arc3.check
-    if isinstance(check, ImportError):
-        check = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Arc3 method check: " + str(check))
-            )
-        )
-    else:
-        check = check
+    check = LazyMethod("pyleecan.Methods.Geometry.Arc3.check")
     # cf Methods.Geometry.Arc3.comp_length
-    if isinstance(comp_length, ImportError):
-        comp_length = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Arc3 method comp_length: " + str(comp_length))
-            )
-        )
-    else:
-        comp_length = comp_length
+    comp_length = LazyMethod("pyleecan.Methods.Geometry.Arc3.comp_length")
     # cf Methods.Geometry.Arc3.comp_radius
-    if isinstance(comp_radius, ImportError):
-        comp_radius = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Arc3 method comp_radius: " + str(comp_radius))
-            )
-        )
-    else:
-        comp_radius = comp_radius
+    comp_radius = LazyMethod("pyleecan.Methods.Geometry.Arc3.comp_radius")
     # cf Methods.Geometry.Arc3.discretize
-    if isinstance(discretize, ImportError):
-        discretize = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Arc3 method discretize: " + str(discretize))
-            )
-        )
-    else:
-        discretize = discretize
+    discretize = LazyMethod("pyleecan.Methods.Geometry.Arc3.discretize")
     # cf Methods.Geometry.Arc3.get_angle
-    if isinstance(get_angle, ImportError):
-        get_angle = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Arc3 method get_angle: " + str(get_angle))
-            )
-        )
-    else:
-        get_angle = get_angle
+    get_angle = LazyMethod("pyleecan.Methods.Geometry.Arc3.get_angle")
     # cf Methods.Geometry.Arc3.get_begin
-    if isinstance(get_begin, ImportError):
-        get_begin = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Arc3 method get_begin: " + str(get_begin))
-            )
-        )
-    else:
-        get_begin = get_begin
+    get_begin = LazyMethod("pyleecan.Methods.Geometry.Arc3.get_begin")
     # cf Methods.Geometry.Arc3.get_center
-    if isinstance(get_center, ImportError):
-        get_center = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Arc3 method get_center: " + str(get_center))
-            )
-        )
-    else:
-        get_center = get_center
+    get_center = LazyMethod("pyleecan.Methods.Geometry.Arc3.get_center")
     # cf Methods.Geometry.Arc3.get_end
-    if isinstance(get_end, ImportError):
-        get_end = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Arc3 method get_end: " + str(get_end))
-            )
-        )
-    else:
-        get_end = get_end
+    get_end = LazyMethod("pyleecan.Methods.Geometry.Arc3.get_end")
     # cf Methods.Geometry.Arc3.get_middle
-    if isinstance(get_middle, ImportError):
-        get_middle = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Arc3 method get_middle: " + str(get_middle))
-            )
-        )
-    else:
-        get_middle = get_middle
+    get_middle = LazyMethod("pyleecan.Methods.Geometry.Arc3.get_middle")
     # cf Methods.Geometry.Arc3.reverse
-    if isinstance(reverse, ImportError):
-        reverse = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Arc3 method reverse: " + str(reverse))
-            )
-        )
-    else:
-        reverse = reverse
+    reverse = LazyMethod("pyleecan.Methods.Geometry.Arc3.reverse")
     # cf Methods.Geometry.Arc3.rotate
-    if isinstance(rotate, ImportError):
-        rotate = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Arc3 method rotate: " + str(rotate))
-            )
-        )
-    else:
-        rotate = rotate
+    rotate = LazyMethod("pyleecan.Methods.Geometry.Arc3.rotate")
     # cf Methods.Geometry.Arc3.split_half
-    if isinstance(split_half, ImportError):
-        split_half = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Arc3 method split_half: " + str(split_half))
-            )
-        )
-    else:
-        split_half = split_half
+    split_half = LazyMethod("pyleecan.Methods.Geometry.Arc3.split_half")
     # cf Methods.Geometry.Arc3.translate
-    if isinstance(translate, ImportError):
-        translate = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Arc3 method translate: " + str(translate))
-            )
-        )
-    else:
-        translate = translate
+    translate = LazyMethod("pyleecan.Methods.Geometry.Arc3.translate")
     # save method is available in all object
     save = save
 
@@ -220,13 +61,13 @@ class Arc3(Arc):
         if init_dict is not None:  # Initialisation by dict
             check_init_dict(init_dict, ["begin", "end", "is_trigo_direction", "label"])
             # Overwrite default value with init_dict content
-            if "begin" in list(init_dict.keys()):
+            if "begin" in init_dict:
                 begin = init_dict["begin"]
-            if "end" in list(init_dict.keys()):
+            if "end" in init_dict:
                 end = init_dict["end"]
-            if "is_trigo_direction" in list(init_dict.keys()):
+            if "is_trigo_direction" in init_dict:
                 is_trigo_direction = init_dict["is_trigo_direction"]
-            if "label" in list(init_dict.keys()):
+            if "label" in init_dict:
                 label = init_dict["label"]
         # Initialisation by argument
         self.begin = begin
@@ -265,12 +106,13 @@ class Arc3(Arc):
             return False
         return True
 
-    def as_dict(self):
+    def as_dict(self, is_keep_array=False):
         """Convert this objet in a json seriable dict (can be use in __init__)
+        The ndarray are not converted to list if is_keep_array
         """
 
         # Get the properties inherited from Arc
-        Arc3_dict = super(Arc3, self).as_dict()
+        Arc3_dict = super(Arc3, self).as_dict(is_keep_array=is_keep_array)
         Arc3_dict["begin"] = self.begin
         Arc3_dict["end"] = self.end
         Arc3_dict["is_trigo_direction"] = self.is_trigo_direction
@@ -279,6 +121,15 @@ class Arc3(Arc):
         Arc3_dict["__class__"] = "Arc3"
         return Arc3_dict
 
+    def _copy_to(self, obj):
+        """Copy the properties of this object in obj (called by copy)"""
+
+        # Copy the properties inherited from Arc
+        super(Arc3, self)._copy_to(obj)
+        obj._begin = self._begin
+        obj._end = self._end
+        obj._is_trigo_direction = self._is_trigo_direction
+
     def _set_None(self):
         """Set all the properties to None (except pyleecan object)"""
 
@@ -296,6 +147,7 @@ class Arc3(Arc):
         """setter of begin"""
         check_var("begin", value, "complex")
         self._begin = value
+        self._clear_memo()
 
     # begin point of the arc
     # Type : complex
@@ -311,6 +163,7 @@ class Arc3(Arc):
         """setter of end"""
         check_var("end", value, "complex")
         self._end = value
+        self._clear_memo()
 
     # end of the arc
     # Type : complex
@@ -324,6 +177,7 @@ class Arc3(Arc):
         """setter of is_trigo_direction"""
         check_var("is_trigo_direction", value, "bool")
         self._is_trigo_direction = value
+        self._clear_memo()
 
     # Rotation direction of the arc
     # Type : bool
@@ -4,7 +4,7 @@ WARNING! All changes made in this file will be lost!
 """
 
 from os import linesep
-from pyleecan.Classes._check import check_init_dict, check_var, raise_
+from pyleecan.Classes._check import check_init_dict, check_var
 from pyleecan.Functions.save import save
 from pyleecan.Classes._frozen import FrozenClass
 
@@ -52,8 +52,9 @@ class Bore(FrozenClass):
             return False
         return True
 
-    def as_dict(self):
+    def as_dict(self, is_keep_array=False):
         """Convert this objet in a json seriable dict (can be use in __init__)
+        The ndarray are not converted to list if is_keep_array
         """
 
         Bore_dict = dict()
@@ -61,5 +62,10 @@ class Bore(FrozenClass):
         Bore_dict["__class__"] = "Bore"
         return Bore_dict
 
+    def _copy_to(self, obj):
+        """Copy the properties of this object in obj (called by copy)"""
+
+        pass
+
     def _set_None(self):
         """Set all the properties to None (except pyleecan object)"""
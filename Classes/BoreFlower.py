@@ -4,18 +4,11 @@ WARNING! All changes made in this file will be lost!
 """
 
 from os import linesep
-from pyleecan.Classes._check import check_init_dict, check_var, raise_
+from pyleecan.Classes._check import check_init_dict, check_var
 from pyleecan.Functions.save import save
 from pyleecan.Classes.Bore import Bore
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from pyleecan.Methods.Machine.BoreFlower.get_bore_line import get_bore_line
-except ImportError as error:
-    get_bore_line = error
-
-
+from pyleecan.Classes._lazy import LazyMethod
 from pyleecan.Classes._check import InitUnKnowClassError
 
 
@@ -25,16 +18,7 @@ class BoreFlower(Bore):
     VERSION = 1
 
     # cf Methods.Machine.BoreFlower.get_bore_line
-    if isinstance(get_bore_line, ImportError):
-        get_bore_line = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use BoreFlower method get_bore_line: " + str(get_bore_line)
-                )
-            )
-        )
-    else:
-        get_bore_line = get_bore_line
+    get_bore_line = LazyMethod("pyleecan.Methods.Machine.BoreFlower.get_bore_line")
     # save method is available in all object
     save = save
 
@@ -51,11 +35,11 @@ class BoreFlower(Bore):
         if init_dict is not None:  # Initialisation by dict
             check_init_dict(init_dict, ["N", "Rarc", "alpha"])
             # Overwrite default value with init_dict content
-            if "N" in list(init_dict.keys()):
+            if "N" in init_dict:
                 N = init_dict["N"]
-            if "Rarc" in list(init_dict.keys()):
+            if "Rarc" in init_dict:
                 Rarc = init_dict["Rarc"]
-            if "alpha" in list(init_dict.keys()):
+            if "alpha" in init_dict:
                 alpha = init_dict["alpha"]
         # Initialisation by argument
         self.N = N
@@ -94,12 +78,13 @@ class BoreFlower(Bore):
             return False
         return True
 
-    def as_dict(self):
+    def as_dict(self, is_keep_array=False):
         """Convert this objet in a json seriable dict (can be use in __init__)
+        The ndarray are not converted to list if is_keep_array
         """
 
         # Get the properties inherited from Bore
-        BoreFlower_dict = super(BoreFlower, self).as_dict()
+        BoreFlower_dict = super(BoreFlower, self).as_dict(is_keep_array=is_keep_array)
         BoreFlower_dict["N"] = self.N
         BoreFlower_dict["Rarc"] = self.Rarc
         BoreFlower_dict["alpha"] = self.alpha
@@ -108,6 +93,15 @@ class BoreFlower(Bore):
         BoreFlower_dict["__class__"] = "BoreFlower"
         return BoreFlower_dict
 
+    def _copy_to(self, obj):
+        """Copy the properties of this object in obj (called by copy)"""
+
+        # Copy the properties inherited from Bore
+        super(BoreFlower, self)._copy_to(obj)
+        obj._N = self._N
+        obj._Rarc = self._Rarc
+        obj._alpha = self._alpha
+
     def _set_None(self):
         """Set all the properties to None (except pyleecan object)"""
 
@@ -125,6 +119,7 @@ class BoreFlower(Bore):
         """setter of N"""
         check_var("N", value, "int", Vmin=0)
         self._N = value
+        self._clear_memo()
 
     # Number of flower arc
     # Type : int, min = 0
@@ -138,6 +133,7 @@ class BoreFlower(Bore):
         """setter of Rarc"""
         check_var("Rarc", value, "float", Vmin=0)
         self._Rarc = value
+        self._clear_memo()
 
     # Radius of the flower arc
     # Type : float, min = 0
@@ -151,6 +147,7 @@ class BoreFlower(Bore):
         """setter of alpha"""
         check_var("alpha", value, "float")
         self._alpha = value
+        self._clear_memo()
 
     # Angular offset for the arc
     # Type : float
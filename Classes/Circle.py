@@ -4,53 +4,11 @@ WARNING! All changes made in this file will be lost!
 """
 
 from os import linesep
-from pyleecan.Classes._check import check_init_dict, check_var, raise_
+from pyleecan.Classes._check import check_init_dict, check_var
 from pyleecan.Functions.save import save
 from pyleecan.Classes.Surface import Surface
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from pyleecan.Methods.Geometry.Circle.check import check
-except ImportError as error:
-    check = error
-
-try:
-    from pyleecan.Methods.Geometry.Circle.comp_length import comp_length
-except ImportError as error:
-    comp_length = error
-
-try:
-    from pyleecan.Methods.Geometry.Circle.comp_surface import comp_surface
-except ImportError as error:
-    comp_surface = error
-
-try:
-    from pyleecan.Methods.Geometry.Circle.discretize import discretize
-except ImportError as error:
-    discretize = error
-
-try:
-    from pyleecan.Methods.Geometry.Circle.get_lines import get_lines
-except ImportError as error:
-    get_lines = error
-
-try:
-    from pyleecan.Methods.Geometry.Circle.get_patch import get_patch
-except ImportError as error:
-    get_patch = error
-
-try:
-    from pyleecan.Methods.Geometry.Circle.rotate import rotate
-except ImportError as error:
-    rotate = error
-
-try:
-    from pyleecan.Methods.Geometry.Circle.translate import translate
-except ImportError as error:
-    translate = error
-
-
+from pyleecan.Classes._lazy import LazyMethod
 from pyleecan.Classes._check import InitUnKnowClassError
 
 
@@ -59,81 +17,22 @@ class Circle(Surface):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
     # cf Methods.Geometry.Circle.check
-    if isinstance(check, ImportError):
-        check = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Circle method check: " + str(check))
-            )
-        )
-    else:
-        check = check
+    check = LazyMethod("pyleecan.Methods.Geometry.Circle.check")
     # cf Methods.Geometry.Circle.comp_length
-    if isinstance(comp_length, ImportError):
-        comp_length = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Circle method comp_length: " + str(comp_length))
-            )
-        )
-    else:
-        comp_length = comp_length
+    comp_length = LazyMethod("pyleecan.Methods.Geometry.Circle.comp_length")
     # cf Methods.Geometry.Circle.comp_surface
-    if isinstance(comp_surface, ImportError):
-        comp_surface = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Circle method comp_surface: " + str(comp_surface)
-                )
-            )
-        )
-    else:
-        comp_surface = comp_surface
+    comp_surface = LazyMethod("pyleecan.Methods.Geometry.Circle.comp_surface")
     # cf Methods.Geometry.Circle.discretize
-    if isinstance(discretize, ImportError):
-        discretize = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Circle method discretize: " + str(discretize))
-            )
-        )
-    else:
-        discretize = discretize
+    discretize = LazyMethod("pyleecan.Methods.Geometry.Circle.discretize")
     # cf Methods.Geometry.Circle.get_lines
-    if isinstance(get_lines, ImportError):
-        get_lines = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Circle method get_lines: " + str(get_lines))
-            )
-        )
-    else:
-        get_lines = get_lines
+    get_lines = LazyMethod("pyleecan.Methods.Geometry.Circle.get_lines")
     # cf Methods.Geometry.Circle.get_patch
-    if isinstance(get_patch, ImportError):
-        get_patch = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Circle method get_patch: " + str(get_patch))
-            )
-        )
-    else:
-        get_patch = get_patch
+    get_patch = LazyMethod("pyleecan.Methods.Geometry.Circle.get_patch")
     # cf Methods.Geometry.Circle.rotate
-    if isinstance(rotate, ImportError):
-        rotate = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Circle method rotate: " + str(rotate))
-            )
-        )
-    else:
-        rotate = rotate
+    rotate = LazyMethod("pyleecan.Methods.Geometry.Circle.rotate")
     # cf Methods.Geometry.Circle.translate
-    if isinstance(translate, ImportError):
-        translate = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Circle method translate: " + str(translate))
-            )
-        )
-    else:
-        translate = translate
+    translate = LazyMethod("pyleecan.Methods.Geometry.Circle.translate")
     # save method is available in all object
     save = save
 
@@ -154,15 +53,15 @@ class Circle(Surface):
                 init_dict, ["radius", "center", "line_label", "point_ref", "label"]
             )
             # Overwrite default value with init_dict content
-            if "radius" in list(init_dict.keys()):
+            if "radius" in init_dict:
                 radius = init_dict["radius"]
-            if "center" in list(init_dict.keys()):
+            if "center" in init_dict:
                 center = init_dict["center"]
-            if "line_label" in list(init_dict.keys()):
+            if "line_label" in init_dict:
                 line_label = init_dict["line_label"]
-            if "point_ref" in list(init_dict.keys()):
+            if "point_ref" in init_dict:
                 point_ref = init_dict["point_ref"]
-            if "label" in list(init_dict.keys()):
+            if "label" in init_dict:
                 label = init_dict["label"]
         # Initialisation by argument
         self.radius = radius
@@ -201,12 +100,13 @@ class Circle(Surface):
             return False
         return True
 
-    def as_dict(self):
+    def as_dict(self, is_keep_array=False):
         """Convert this objet in a json seriable dict (can be use in __init__)
+        The ndarray are not converted to list if is_keep_array
         """
 
         # Get the properties inherited from Surface
-        Circle_dict = super(Circle, self).as_dict()
+        Circle_dict = super(Circle, self).as_dict(is_keep_array=is_keep_array)
         Circle_dict["radius"] = self.radius
         Circle_dict["center"] = self.center
         Circle_dict["line_label"] = self.line_label
@@ -215,6 +115,15 @@ class Circle(Surface):
         Circle_dict["__class__"] = "Circle"
         return Circle_dict
 
+    def _copy_to(self, obj):
+        """Copy the properties of this object in obj (called by copy)"""
+
+        # Copy the properties inherited from Surface
+        super(Circle, self)._copy_to(obj)
+        obj._radius = self._radius
+        obj._center = self._center
+        obj._line_label = self._line_label
+
     def _set_None(self):
         """Set all the properties to None (except pyleecan object)"""
 
@@ -232,6 +141,7 @@ class Circle(Surface):
         """setter of radius"""
         check_var("radius", value, "float", Vmin=0)
         self._radius = value
+        self._clear_memo()
 
     # Radius of the circle
     # Type : float, min = 0
@@ -247,6 +157,7 @@ class Circle(Surface):
         """setter of center"""
         check_var("center", value, "complex")
         self._center = value
+        self._clear_memo()
 
     # center of the Circle
     # Type : complex
@@ -262,6 +173,7 @@ class Circle(Surface):
         """setter of line_label"""
         check_var("line_label", value, "str")
         self._line_label = value
+        self._clear_memo()
 
     # Label to set to the lines
     # Type : str
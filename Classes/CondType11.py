@@ -4,40 +4,11 @@ WARNING! All changes made in this file will be lost!
 """
 
 from os import linesep
-from pyleecan.Classes._check import check_init_dict, check_var, raise_
+from pyleecan.Classes._check import check_init_dict, check_var
 from pyleecan.Functions.save import save
 from pyleecan.Classes.Conductor import Conductor
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from pyleecan.Methods.Machine.CondType11.comp_surface_active import (
-        comp_surface_active,
-    )
-except ImportError as error:
-    comp_surface_active = error
-
-try:
-    from pyleecan.Methods.Machine.CondType11.comp_height import comp_height
-except ImportError as error:
-    comp_height = error
-
-try:
-    from pyleecan.Methods.Machine.CondType11.comp_surface import comp_surface
-except ImportError as error:
-    comp_surface = error
-
-try:
-    from pyleecan.Methods.Machine.CondType11.comp_width import comp_width
-except ImportError as error:
-    comp_width = error
-
-try:
-    from pyleecan.Methods.Machine.CondType11.plot import plot
-except ImportError as error:
-    plot = error
-
-
+from pyleecan.Classes._lazy import LazyMethod
 from pyleecan.Classes._check import InitUnKnowClassError
 from pyleecan.Classes.Material import Material
 
@@ -47,61 +18,18 @@ class CondType11(Conductor):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
     # cf Methods.Machine.CondType11.comp_surface_active
-    if isinstance(comp_surface_active, ImportError):
-        comp_surface_active = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use CondType11 method comp_surface_active: "
-                    + str(comp_surface_active)
-                )
-            )
-        )
-    else:
-        comp_surface_active = comp_surface_active
+    comp_surface_active = LazyMethod(
+        "pyleecan.Methods.Machine.CondType11.comp_surface_active"
+    )
     # cf Methods.Machine.CondType11.comp_height
-    if isinstance(comp_height, ImportError):
-        comp_height = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use CondType11 method comp_height: " + str(comp_height)
-                )
-            )
-        )
-    else:
-        comp_height = comp_height
+    comp_height = LazyMethod("pyleecan.Methods.Machine.CondType11.comp_height")
     # cf Methods.Machine.CondType11.comp_surface
-    if isinstance(comp_surface, ImportError):
-        comp_surface = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use CondType11 method comp_surface: " + str(comp_surface)
-                )
-            )
-        )
-    else:
-        comp_surface = comp_surface
+    comp_surface = LazyMethod("pyleecan.Methods.Machine.CondType11.comp_surface")
     # cf Methods.Machine.CondType11.comp_width
-    if isinstance(comp_width, ImportError):
-        comp_width = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use CondType11 method comp_width: " + str(comp_width)
-                )
-            )
-        )
-    else:
-        comp_width = comp_width
+    comp_width = LazyMethod("pyleecan.Methods.Machine.CondType11.comp_width")
     # cf Methods.Machine.CondType11.plot
-    if isinstance(plot, ImportError):
-        plot = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use CondType11 method plot: " + str(plot))
-            )
-        )
-    else:
-        plot = plot
+    plot = LazyMethod("pyleecan.Methods.Machine.CondType11.plot")
     # save method is available in all object
     save = save
 
@@ -149,25 +77,25 @@ class CondType11(Conductor):
                 ],
             )
             # Overwrite default value with init_dict content
-            if "Hwire" in list(init_dict.keys()):
+            if "Hwire" in init_dict:
                 Hwire = init_dict["Hwire"]
-            if "Wwire" in list(init_dict.keys()):
+            if "Wwire" in init_dict:
                 Wwire = init_dict["Wwire"]
-            if "Nwppc_rad" in list(init_dict.keys()):
+            if "Nwppc_rad" in init_dict:
                 Nwppc_rad = init_dict["Nwppc_rad"]
-            if "Nwppc_tan" in list(init_dict.keys()):
+            if "Nwppc_tan" in init_dict:
                 Nwppc_tan = init_dict["Nwppc_tan"]
-            if "Wins_wire" in list(init_dict.keys()):
+            if "Wins_wire" in init_dict:
                 Wins_wire = init_dict["Wins_wire"]
-            if "Wins_coil" in list(init_dict.keys()):
+            if "Wins_coil" in init_dict:
                 Wins_coil = init_dict["Wins_coil"]
-            if "type_winding_shape" in list(init_dict.keys()):
+            if "type_winding_shape" in init_dict:
                 type_winding_shape = init_dict["type_winding_shape"]
-            if "alpha_ew" in list(init_dict.keys()):
+            if "alpha_ew" in init_dict:
                 alpha_ew = init_dict["alpha_ew"]
-            if "cond_mat" in list(init_dict.keys()):
+            if "cond_mat" in init_dict:
                 cond_mat = init_dict["cond_mat"]
-            if "ins_mat" in list(init_dict.keys()):
+            if "ins_mat" in init_dict:
                 ins_mat = init_dict["ins_mat"]
         # Initialisation by argument
         self.Hwire = Hwire
@@ -228,12 +156,13 @@ class CondType11(Conductor):
             return False
         return True
 
-    def as_dict(self):
+    def as_dict(self, is_keep_array=False):
         """Convert this objet in a json seriable dict (can be use in __init__)
+        The ndarray are not converted to list if is_keep_array
         """
 
         # Get the properties inherited from Conductor
-        CondType11_dict = super(CondType11, self).as_dict()
+        CondType11_dict = super(CondType11, self).as_dict(is_keep_array=is_keep_array)
         CondType11_dict["Hwire"] = self.Hwire
         CondType11_dict["Wwire"] = self.Wwire
         CondType11_dict["Nwppc_rad"] = self.Nwppc_rad
@@ -247,6 +176,20 @@ class CondType11(Conductor):
         CondType11_dict["__class__"] = "CondType11"
         return CondType11_dict
 
+    def _copy_to(self, obj):
+        """Copy the properties of this object in obj (called by copy)"""
+
+        # Copy the properties inherited from Conductor
+        super(CondType11, self)._copy_to(obj)
+        obj._Hwire = self._Hwire
+        obj._Wwire = self._Wwire
+        obj._Nwppc_rad = self._Nwppc_rad
+        obj._Nwppc_tan = self._Nwppc_tan
+        obj._Wins_wire = self._Wins_wire
+        obj._Wins_coil = self._Wins_coil
+        obj._type_winding_shape = self._type_winding_shape
+        obj._alpha_ew = self._alpha_ew
+
     def _set_None(self):
         """Set all the properties to None (except pyleecan object)"""
 
@@ -269,6 +212,7 @@ class CondType11(Conductor):
         """setter of Hwire"""
         check_var("Hwire", value, "float", Vmin=0)
         self._Hwire = value
+        self._clear_memo()
 
     # cf schematics, single wire height without insulation [m]
     # Type : float, min = 0
@@ -286,6 +230,7 @@ class CondType11(Conductor):
         """setter of Wwire"""
         check_var("Wwire", value, "float", Vmin=0)
         self._Wwire = value
+        self._clear_memo()
 
     # cf schematics, single wire width without insulation [m]
     # Type : float, min = 0
@@ -303,6 +248,7 @@ class CondType11(Conductor):
         """setter of Nwppc_rad"""
         check_var("Nwppc_rad", value, "int", Vmin=1)
         self._Nwppc_rad = value
+        self._clear_memo()
 
     # cf schematics, stator winding number of preformed wires (strands) in parallel per coil along radial (vertical) direction
     # Type : int, min = 1
@@ -320,6 +266,7 @@ class CondType11(Conductor):
         """setter of Nwppc_tan"""
         check_var("Nwppc_tan", value, "int", Vmin=1)
         self._Nwppc_tan = value
+        self._clear_memo()
 
     # cf schematics, stator winding number of preformed wires (strands) in parallel per coil along tangential (horizontal) direction
     # Type : int, min = 1
@@ -337,6 +284,7 @@ class CondType11(Conductor):
         """setter of Wins_wire"""
         check_var("Wins_wire", value, "float", Vmin=0)
         self._Wins_wire = value
+        self._clear_memo()
 
     # (advanced) cf schematics, winding strand insulation thickness [m]
     # Type : float, min = 0
@@ -354,6 +302,7 @@ class CondType11(Conductor):
         """setter of Wins_coil"""
         check_var("Wins_coil", value, "float", Vmin=0)
         self._Wins_coil = value
+        self._clear_memo()
 
     # (advanced) cf schematics, winding coil insulation  thickness [m]
     # Type : float, min = 0
@@ -371,6 +320,7 @@ class CondType11(Conductor):
         """setter of type_winding_shape"""
         check_var("type_winding_shape", value, "int", Vmin=0, Vmax=1)
         self._type_winding_shape = value
+        self._clear_memo()
 
     # type of winding shape for end winding length calculation\n0 for hairpin windings\n1 for normal windings
     # Type : int, min = 0, max = 1
@@ -388,6 +338,7 @@ class CondType11(Conductor):
         """setter of alpha_ew"""
         check_var("alpha_ew", value, "float", Vmin=0, Vmax=180)
         self._alpha_ew = value
+        self._clear_memo()
 
     # angle of winding overhang hairpin coils [deg]
     # Type : float, min = 0, max = 180
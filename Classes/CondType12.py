@@ -4,45 +4,11 @@ WARNING! All changes made in this file will be lost!
 """
 
 from os import linesep
-from pyleecan.Classes._check import check_init_dict, check_var, raise_
+from pyleecan.Classes._check import check_init_dict, check_var
 from pyleecan.Functions.save import save
 from pyleecan.Classes.Conductor import Conductor
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from pyleecan.Methods.Machine.CondType12.check import check
-except ImportError as error:
-    check = error
-
-try:
-    from pyleecan.Methods.Machine.CondType12.comp_surface_active import (
-        comp_surface_active,
-    )
-except ImportError as error:
-    comp_surface_active = error
-
-try:
-    from pyleecan.Methods.Machine.CondType12.comp_height import comp_height
-except ImportError as error:
-    comp_height = error
-
-try:
-    from pyleecan.Methods.Machine.CondType12.comp_surface import comp_surface
-except ImportError as error:
-    comp_surface = error
-
-try:
-    from pyleecan.Methods.Machine.CondType12.comp_width import comp_width
-except ImportError as error:
-    comp_width = error
-
-try:
-    from pyleecan.Methods.Machine.CondType12.plot import plot
-except ImportError as error:
-    plot = error
-
-
+from pyleecan.Classes._lazy import LazyMethod
 from pyleecan.Classes._check import InitUnKnowClassError
 from pyleecan.Classes.Material import Material
 
@@ -52,70 +18,20 @@ class CondType12(Conductor):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
     # cf Methods.Machine.CondType12.check
-    if isinstance(check, ImportError):
-        check = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use CondType12 method check: " + str(check))
-            )
-        )
-    else:
-        check = check
+    check = LazyMethod("pyleecan.Methods.Machine.CondType12.check")
     # cf Methods.Machine.CondType12.comp_surface_active
-    if isinstance(comp_surface_active, ImportError):
-        comp_surface_active = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use CondType12 method comp_surface_active: "
-                    + str(comp_surface_active)
-                )
-            )
-        )
-    else:
-        comp_surface_active = comp_surface_active
+    comp_surface_active = LazyMethod(
+        "pyleecan.Methods.Machine.CondType12.comp_surface_active"
+    )
     # cf Methods.Machine.CondType12.comp_height
-    if isinstance(comp_height, ImportError):
-        comp_height = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use CondType12 method comp_height: " + str(comp_height)
-                )
-            )
-        )
-    else:
-        comp_height = comp_height
+    comp_height = LazyMethod("pyleecan.Methods.Machine.CondType12.comp_height")
     # cf Methods.Machine.CondType12.comp_surface
-    if isinstance(comp_surface, ImportError):
-        comp_surface = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use CondType12 method comp_surface: " + str(comp_surface)
-                )
-            )
-        )
-    else:
-        comp_surface = comp_surface
+    comp_surface = LazyMethod("pyleecan.Methods.Machine.CondType12.comp_surface")
     # cf Methods.Machine.CondType12.comp_width
-    if isinstance(comp_width, ImportError):
-        comp_width = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use CondType12 method comp_width: " + str(comp_width)
-                )
-            )
-        )
-    else:
-        comp_width = comp_width
+    comp_width = LazyMethod("pyleecan.Methods.Machine.CondType12.comp_width")
     # cf Methods.Machine.CondType12.plot
-    if isinstance(plot, ImportError):
-        plot = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use CondType12 method plot: " + str(plot))
-            )
-        )
-    else:
-        plot = plot
+    plot = LazyMethod("pyleecan.Methods.Machine.CondType12.plot")
     # save method is available in all object
     save = save
 
@@ -157,19 +73,19 @@ class CondType12(Conductor):
                 ],
             )
             # Overwrite default value with init_dict content
-            if "Wwire" in list(init_dict.keys()):
+            if "Wwire" in init_dict:
                 Wwire = init_dict["Wwire"]
-            if "Wins_cond" in list(init_dict.keys()):
+            if "Wins_cond" in init_dict:
                 Wins_cond = init_dict["Wins_cond"]
-            if "Nwppc" in list(init_dict.keys()):
+            if "Nwppc" in init_dict:
                 Nwppc = init_dict["Nwppc"]
-            if "Wins_wire" in list(init_dict.keys()):
+            if "Wins_wire" in init_dict:
                 Wins_wire = init_dict["Wins_wire"]
-            if "Kwoh" in list(init_dict.keys()):
+            if "Kwoh" in init_dict:
                 Kwoh = init_dict["Kwoh"]
-            if "cond_mat" in list(init_dict.keys()):
+            if "cond_mat" in init_dict:
                 cond_mat = init_dict["cond_mat"]
-            if "ins_mat" in list(init_dict.keys()):
+            if "ins_mat" in init_dict:
                 ins_mat = init_dict["ins_mat"]
         # Initialisation by argument
         self.Wwire = Wwire
@@ -216,12 +132,13 @@ class CondType12(Conductor):
             return False
         return True
 
-    def as_dict(self):
+    def as_dict(self, is_keep_array=False):
         """Convert this objet in a json seriable dict (can be use in __init__)
+        The ndarray are not converted to list if is_keep_array
         """
 
         # Get the properties inherited from Conductor
-        CondType12_dict = super(CondType12, self).as_dict()
+        CondType12_dict = super(CondType12, self).as_dict(is_keep_array=is_keep_array)
         CondType12_dict["Wwire"] = self.Wwire
         CondType12_dict["Wins_cond"] = self.Wins_cond
         CondType12_dict["Nwppc"] = self.Nwppc
@@ -232,6 +149,17 @@ class CondType12(Conductor):
         CondType12_dict["__class__"] = "CondType12"
         return CondType12_dict
 
+    def _copy_to(self, obj):
+        """Copy the properties of this object in obj (called by copy)"""
+
+        # Copy the properties inherited from Conductor
+        super(CondType12, self)._copy_to(obj)
+        obj._Wwire = self._Wwire
+        obj._Wins_cond = self._Wins_cond
+        obj._Nwppc = self._Nwppc
+        obj._Wins_wire = self._Wins_wire
+        obj._Kwoh = self._Kwoh
+
     def _set_None(self):
         """Set all the properties to None (except pyleecan object)"""
 
@@ -251,6 +179,7 @@ class CondType12(Conductor):
         """setter of Wwire"""
         check_var("Wwire", value, "float", Vmin=0)
         self._Wwire = value
+        self._clear_memo()
 
     # cf schematics, single wire diameter without insulation [m]
     # Type : float, min = 0
@@ -268,6 +197,7 @@ class CondType12(Conductor):
         """setter of Wins_cond"""
         check_var("Wins_cond", value, "float", Vmin=0)
         self._Wins_cond = value
+        self._clear_memo()
 
     # (advanced) cf schematics, winding coil insulation diameter [m]
     # Type : float, min = 0
@@ -285,6 +215,7 @@ class CondType12(Conductor):
         """setter of Nwppc"""
         check_var("Nwppc", value, "int", Vmin=1)
         self._Nwppc = value
+        self._clear_memo()
 
     # cf schematics, winding number of random wires (strands) in parallel per coil
     # Type : int, min = 1
@@ -302,6 +233,7 @@ class CondType12(Conductor):
         """setter of Wins_wire"""
         check_var("Wins_wire", value, "float", Vmin=0)
         self._Wins_wire = value
+        self._clear_memo()
 
     # (advanced) cf schematics, winding strand insulation thickness [m]
     # Type : float, min = 0
@@ -319,6 +251,7 @@ class CondType12(Conductor):
         """setter of Kwoh"""
         check_var("Kwoh", value, "float", Vmin=0)
         self._Kwoh = value
+        self._clear_memo()
 
     # winding overhang factor which describes the fact that random round wire end-windings can be more or less compressed (0.5 for small motors, 0.8 for large motors) - can be used to tune the average turn length (relevant if type_cond==1)
     # Type : float, min = 0
@@ -4,40 +4,11 @@ WARNING! All changes made in this file will be lost!
 """
 
 from os import linesep
-from pyleecan.Classes._check import check_init_dict, check_var, raise_
+from pyleecan.Classes._check import check_init_dict, check_var
 from pyleecan.Functions.save import save
 from pyleecan.Classes.Conductor import Conductor
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from pyleecan.Methods.Machine.CondType21.comp_surface_active import (
-        comp_surface_active,
-    )
-except ImportError as error:
-    comp_surface_active = error
-
-try:
-    from pyleecan.Methods.Machine.CondType21.comp_height import comp_height
-except ImportError as error:
-    comp_height = error
-
-try:
-    from pyleecan.Methods.Machine.CondType21.comp_surface import comp_surface
-except ImportError as error:
-    comp_surface = error
-
-try:
-    from pyleecan.Methods.Machine.CondType21.comp_width import comp_width
-except ImportError as error:
-    comp_width = error
-
-try:
-    from pyleecan.Methods.Machine.CondType21.plot import plot
-except ImportError as error:
-    plot = error
-
-
+from pyleecan.Classes._lazy import LazyMethod
 from pyleecan.Classes._check import InitUnKnowClassError
 from pyleecan.Classes.Material import Material
 
@@ -47,61 +18,18 @@ class CondType21(Conductor):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
     # cf Methods.Machine.CondType21.comp_surface_active
-    if isinstance(comp_surface_active, ImportError):
-        comp_surface_active = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use CondType21 method comp_surface_active: "
-                    + str(comp_surface_active)
-                )
-            )
-        )
-    else:
-        comp_surface_active = comp_surface_active
+    comp_surface_active = LazyMethod(
+        "pyleecan.Methods.Machine.CondType21.comp_surface_active"
+    )
     # cf Methods.Machine.CondType21.comp_height
-    if isinstance(comp_height, ImportError):
-        comp_height = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use CondType21 method comp_height: " + str(comp_height)
-                )
-            )
-        )
-    else:
-        comp_height = comp_height
+    comp_height = LazyMethod("pyleecan.Methods.Machine.CondType21.comp_height")
     # cf Methods.Machine.CondType21.comp_surface
-    if isinstance(comp_surface, ImportError):
-        comp_surface = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use CondType21 method comp_surface: " + str(comp_surface)
-                )
-            )
-        )
-    else:
-        comp_surface = comp_surface
+    comp_surface = LazyMethod("pyleecan.Methods.Machine.CondType21.comp_surface")
     # cf Methods.Machine.CondType21.comp_width
-    if isinstance(comp_width, ImportError):
-        comp_width = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use CondType21 method comp_width: " + str(comp_width)
-                )
-            )
-        )
-    else:
-        comp_width = comp_width
+    comp_width = LazyMethod("pyleecan.Methods.Machine.CondType21.comp_width")
     # cf Methods.Machine.CondType21.plot
-    if isinstance(plot, ImportError):
-        plot = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use CondType21 method plot: " + str(plot))
-            )
-        )
-    else:
-        plot = plot
+    plot = LazyMethod("pyleecan.Methods.Machine.CondType21.plot")
     # save method is available in all object
     save = save
 
@@ -124,15 +52,15 @@ class CondType21(Conductor):
         if init_dict is not None:  # Initialisation by dict
             check_init_dict(init_dict, ["Hbar", "Wbar", "Wins", "cond_mat", "ins_mat"])
             # Overwrite default value with init_dict content
-            if "Hbar" in list(init_dict.keys()):
+            if "Hbar" in init_dict:
                 Hbar = init_dict["Hbar"]
-            if "Wbar" in list(init_dict.keys()):
+            if "Wbar" in init_dict:
                 Wbar = init_dict["Wbar"]
-            if "Wins" in list(init_dict.keys()):
+            if "Wins" in init_dict:
                 Wins = init_dict["Wins"]
-            if "cond_mat" in list(init_dict.keys()):
+            if "cond_mat" in init_dict:
                 cond_mat = init_dict["cond_mat"]
-            if "ins_mat" in list(init_dict.keys()):
+            if "ins_mat" in init_dict:
                 ins_mat = init_dict["ins_mat"]
         # Initialisation by argument
         self.Hbar = Hbar
@@ -171,12 +99,13 @@ class CondType21(Conductor):
             return False
         return True
 
-    def as_dict(self):
+    def as_dict(self, is_keep_array=False):
         """Convert this objet in a json seriable dict (can be use in __init__)
+        The ndarray are not converted to list if is_keep_array
         """
 
         # Get the properties inherited from Conductor
-        CondType21_dict = super(CondType21, self).as_dict()
+        CondType21_dict = super(CondType21, self).as_dict(is_keep_array=is_keep_array)
         CondType21_dict["Hbar"] = self.Hbar
         CondType21_dict["Wbar"] = self.Wbar
         CondType21_dict["Wins"] = self.Wins
@@ -185,6 +114,15 @@ class CondType21(Conductor):
         CondType21_dict["__class__"] = "CondType21"
         return CondType21_dict
 
+    def _copy_to(self, obj):
+        """Copy the properties of this object in obj (called by copy)"""
+
+        # Copy the properties inherited from Conductor
+        super(CondType21, self)._copy_to(obj)
+        obj._Hbar = self._Hbar
+        obj._Wbar = self._Wbar
+        obj._Wins = self._Wins
+
     def _set_None(self):
         """Set all the properties to None (except pyleecan object)"""
 
@@ -202,6 +140,7 @@ class CondType21(Conductor):
         """setter of Hbar"""
         check_var("Hbar", value, "float", Vmin=0)
         self._Hbar = value
+        self._clear_memo()
 
     # Bar height
     # Type : float, min = 0
@@ -215,6 +154,7 @@ class CondType21(Conductor):
         """setter of Wbar"""
         check_var("Wbar", value, "float", Vmin=0)
         self._Wbar = value
+        self._clear_memo()
 
     # Bar width
     # Type : float, min = 0
@@ -228,6 +168,7 @@ class CondType21(Conductor):
         """setter of Wins"""
         check_var("Wins", value, "float", Vmin=0)
         self._Wins = value
+        self._clear_memo()
 
     # Width of insulation
     # Type : float, min = 0
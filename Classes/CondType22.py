@@ -4,25 +4,11 @@ WARNING! All changes made in this file will be lost!
 """
 
 from os import linesep
-from pyleecan.Classes._check import check_init_dict, check_var, raise_
+from pyleecan.Classes._check import check_init_dict, check_var
 from pyleecan.Functions.save import save
 from pyleecan.Classes.Conductor import Conductor
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from pyleecan.Methods.Machine.CondType22.comp_surface_active import (
-        comp_surface_active,
-    )
-except ImportError as error:
-    comp_surface_active = error
-
-try:
-    from pyleecan.Methods.Machine.CondType22.comp_surface import comp_surface
-except ImportError as error:
-    comp_surface = error
-
-
+from pyleecan.Classes._lazy import LazyMethod
 from pyleecan.Classes._check import InitUnKnowClassError
 from pyleecan.Classes.Material import Material
 
@@ -32,30 +18,12 @@ class CondType22(Conductor):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
     # cf Methods.Machine.CondType22.comp_surface_active
-    if isinstance(comp_surface_active, ImportError):
-        comp_surface_active = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use CondType22 method comp_surface_active: "
-                    + str(comp_surface_active)
-                )
-            )
-        )
-    else:
-        comp_surface_active = comp_surface_active
+    comp_surface_active = LazyMethod(
+        "pyleecan.Methods.Machine.CondType22.comp_surface_active"
+    )
     # cf Methods.Machine.CondType22.comp_surface
-    if isinstance(comp_surface, ImportError):
-        comp_surface = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use CondType22 method comp_surface: " + str(comp_surface)
-                )
-            )
-        )
-    else:
-        comp_surface = comp_surface
+    comp_surface = LazyMethod("pyleecan.Methods.Machine.CondType22.comp_surface")
     # save method is available in all object
     save = save
 
@@ -76,11 +44,11 @@ class CondType22(Conductor):
         if init_dict is not None:  # Initialisation by dict
             check_init_dict(init_dict, ["Sbar", "cond_mat", "ins_mat"])
             # Overwrite default value with init_dict content
-            if "Sbar" in list(init_dict.keys()):
+            if "Sbar" in init_dict:
                 Sbar = init_dict["Sbar"]
-            if "cond_mat" in list(init_dict.keys()):
+            if "cond_mat" in init_dict:
                 cond_mat = init_dict["cond_mat"]
-            if "ins_mat" in list(init_dict.keys()):
+            if "ins_mat" in init_dict:
                 ins_mat = init_dict["ins_mat"]
         # Initialisation by argument
         self.Sbar = Sbar
@@ -111,18 +79,26 @@ class CondType22(Conductor):
             return False
         return True
 
-    def as_dict(self):
+    def as_dict(self, is_keep_array=False):
         """Convert this objet in a json seriable dict (can be use in __init__)
+        The ndarray are not converted to list if is_keep_array
         """
 
         # Get the properties inherited from Conductor
-        CondType22_dict = super(CondType22, self).as_dict()
+        CondType22_dict = super(CondType22, self).as_dict(is_keep_array=is_keep_array)
         CondType22_dict["Sbar"] = self.Sbar
         # The class name is added to the dict fordeserialisation purpose
         # Overwrite the mother class name
         CondType22_dict["__class__"] = "CondType22"
         return CondType22_dict
 
+    def _copy_to(self, obj):
+        """Copy the properties of this object in obj (called by copy)"""
+
+        # Copy the properties inherited from Conductor
+        super(CondType22, self)._copy_to(obj)
+        obj._Sbar = self._Sbar
+
     def _set_None(self):
         """Set all the properties to None (except pyleecan object)"""
 
@@ -138,6 +114,7 @@ class CondType22(Conductor):
         """setter of Sbar"""
         check_var("Sbar", value, "float", Vmin=0)
         self._Sbar = value
+        self._clear_memo()
 
     # Surface of the Slot
     # Type : float, min = 0
@@ -4,18 +4,11 @@ WARNING! All changes made in this file will be lost!
 """
 
 from os import linesep
-from pyleecan.Classes._check import check_init_dict, check_var, raise_
+from pyleecan.Classes._check import check_init_dict, check_var
 from pyleecan.Functions.save import save
 from pyleecan.Classes._frozen import FrozenClass
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from pyleecan.Methods.Machine.Conductor.check import check
-except ImportError as error:
-    check = error
-
-
+from pyleecan.Classes._lazy import LazyInit, LazyMethod
 from pyleecan.Classes._check import InitUnKnowClassError
 from pyleecan.Classes.Material import Material
 
@@ -26,14 +19,7 @@ class Conductor(FrozenClass):
     VERSION = 1
 
     # cf Methods.Machine.Conductor.check
-    if isinstance(check, ImportError):
-        check = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Conductor method check: " + str(check))
-            )
-        )
-    else:
-        check = check
+    check = LazyMethod("pyleecan.Methods.Machine.Conductor.check")
     # save method is available in all object
     save = save
 
@@ -54,9 +40,9 @@ class Conductor(FrozenClass):
         if init_dict is not None:  # Initialisation by dict
             check_init_dict(init_dict, ["cond_mat", "ins_mat"])
             # Overwrite default value with init_dict content
-            if "cond_mat" in list(init_dict.keys()):
+            if "cond_mat" in init_dict:
                 cond_mat = init_dict["cond_mat"]
-            if "ins_mat" in list(init_dict.keys()):
+            if "ins_mat" in init_dict:
                 ins_mat = init_dict["ins_mat"]
         # Initialisation by argument
         self.parent = None
@@ -107,23 +93,42 @@ class Conductor(FrozenClass):
             return False
         return True
 
-    def as_dict(self):
+    def as_dict(self, is_keep_array=False):
         """Convert this objet in a json seriable dict (can be use in __init__)
+        The ndarray are not converted to list if is_keep_array
         """
 
         Conductor_dict = dict()
         if self.cond_mat is None:
             Conductor_dict["cond_mat"] = None
         else:
-            Conductor_dict["cond_mat"] = self.cond_mat.as_dict()
+            Conductor_dict["cond_mat"] = self.cond_mat.as_dict(
+                is_keep_array=is_keep_array
+            )
         if self.ins_mat is None:
             Conductor_dict["ins_mat"] = None
         else:
-            Conductor_dict["ins_mat"] = self.ins_mat.as_dict()
+            Conductor_dict["ins_mat"] = self.ins_mat.as_dict(
+                is_keep_array=is_keep_array
+            )
         # The class name is added to the dict fordeserialisation purpose
         Conductor_dict["__class__"] = "Conductor"
         return Conductor_dict
 
+    def _copy_to(self, obj):
+        """Copy the properties of this object in obj (called by copy)"""
+
+        if self._cond_mat is None:
+            obj._cond_mat = None
+        else:
+            obj._cond_mat = self._cond_mat.copy()
+            obj._cond_mat.parent = obj
+        if self._ins_mat is None:
+            obj._ins_mat = None
+        else:
+            obj._ins_mat = self._ins_mat.copy()
+            obj._ins_mat.parent = obj
+
     def _set_None(self):
         """Set all the properties to None (except pyleecan object)"""
 
@@ -134,12 +139,16 @@ class Conductor(FrozenClass):
 
     def _get_cond_mat(self):
         """getter of cond_mat"""
+        if isinstance(self._cond_mat, LazyInit):
+            # Create the object of a lazy load
+            self._set_cond_mat(self._cond_mat.resolve())
         return self._cond_mat
 
     def _set_cond_mat(self, value):
         """setter of cond_mat"""
         check_var("cond_mat", value, "Material")
         self._cond_mat = value
+        self._clear_memo()
 
         if self._cond_mat is not None:
             self._cond_mat.parent = self
@@ -152,12 +161,16 @@ class Conductor(FrozenClass):
 
     def _get_ins_mat(self):
         """getter of ins_mat"""
+        if isinstance(self._ins_mat, LazyInit):
+            # Create the object of a lazy load
+            self._set_ins_mat(self._ins_mat.resolve())
         return self._ins_mat
 
     def _set_ins_mat(self, value):
         """setter of ins_mat"""
         check_var("ins_mat", value, "Material")
         self._ins_mat = value
+        self._clear_memo()
 
         if self._ins_mat is not None:
             self._ins_mat.parent = self
@@ -4,61 +4,12 @@ WARNING! All changes made in this file will be lost!
 """
 
 from os import linesep
-from pyleecan.Classes._check import set_array, check_init_dict, check_var, raise_
+from pyleecan.Classes._check import set_array, check_init_dict, check_var
 from pyleecan.Functions.save import save
 from pyleecan.Classes.Element import Element
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from pyleecan.Methods.Mesh.ElementMat.get_node2element import get_node2element
-except ImportError as error:
-    get_node2element = error
-
-try:
-    from pyleecan.Methods.Mesh.ElementMat.convert_element import convert_element
-except ImportError as error:
-    convert_element = error
-
-try:
-    from pyleecan.Methods.Mesh.ElementMat.add_element import add_element
-except ImportError as error:
-    add_element = error
-
-try:
-    from pyleecan.Methods.Mesh.ElementMat.get_connectivity import get_connectivity
-except ImportError as error:
-    get_connectivity = error
-
-try:
-    from pyleecan.Methods.Mesh.ElementMat.get_all_connectivity import (
-        get_all_connectivity,
-    )
-except ImportError as error:
-    get_all_connectivity = error
-
-try:
-    from pyleecan.Methods.Mesh.ElementMat.is_exist import is_exist
-except ImportError as error:
-    is_exist = error
-
-try:
-    from pyleecan.Methods.Mesh.ElementMat.get_new_tag import get_new_tag
-except ImportError as error:
-    get_new_tag = error
-
-try:
-    from pyleecan.Methods.Mesh.ElementMat.get_all_node_tags import get_all_node_tags
-except ImportError as error:
-    get_all_node_tags = error
-
-try:
-    from pyleecan.Methods.Mesh.ElementMat.get_group import get_group
-except ImportError as error:
-    get_group = error
-
-
 from numpy import array, array_equal
+from pyleecan.Classes._lazy import LazyMethod
 from pyleecan.Classes._check import InitUnKnowClassError
 
 
@@ -67,107 +18,30 @@ class ElementMat(Element):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
     # cf Methods.Mesh.ElementMat.get_node2element
-    if isinstance(get_node2element, ImportError):
-        get_node2element = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use ElementMat method get_node2element: "
-                    + str(get_node2element)
-                )
-            )
-        )
-    else:
-        get_node2element = get_node2element
+    get_node2element = LazyMethod("pyleecan.Methods.Mesh.ElementMat.get_node2element")
     # cf Methods.Mesh.ElementMat.convert_element
-    if isinstance(convert_element, ImportError):
-        convert_element = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use ElementMat method convert_element: "
-                    + str(convert_element)
-                )
-            )
-        )
-    else:
-        convert_element = convert_element
+    convert_element = LazyMethod("pyleecan.Methods.Mesh.ElementMat.convert_element")
     # cf Methods.Mesh.ElementMat.add_element
-    if isinstance(add_element, ImportError):
-        add_element = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use ElementMat method add_element: " + str(add_element)
-                )
-            )
-        )
-    else:
-        add_element = add_element
+    add_element = LazyMethod("pyleecan.Methods.Mesh.ElementMat.add_element")
     # cf Methods.Mesh.ElementMat.get_connectivity
-    if isinstance(get_connectivity, ImportError):
-        get_connectivity = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use ElementMat method get_connectivity: "
-                    + str(get_connectivity)
-                )
-            )
-        )
-    else:
-        get_connectivity = get_connectivity
+    get_connectivity = LazyMethod("pyleecan.Methods.Mesh.ElementMat.get_connectivity")
     # cf Methods.Mesh.ElementMat.get_all_connectivity
-    if isinstance(get_all_connectivity, ImportError):
-        get_all_connectivity = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use ElementMat method get_all_connectivity: "
-                    + str(get_all_connectivity)
-                )
-            )
-        )
-    else:
-        get_all_connectivity = get_all_connectivity
+    get_all_connectivity = LazyMethod(
+        "pyleecan.Methods.Mesh.ElementMat.get_all_connectivity"
+    )
     # cf Methods.Mesh.ElementMat.is_exist
-    if isinstance(is_exist, ImportError):
-        is_exist = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use ElementMat method is_exist: " + str(is_exist))
-            )
-        )
-    else:
-        is_exist = is_exist
+    is_exist = LazyMethod("pyleecan.Methods.Mesh.ElementMat.is_exist")
     # cf Methods.Mesh.ElementMat.get_new_tag
-    if isinstance(get_new_tag, ImportError):
-        get_new_tag = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use ElementMat method get_new_tag: " + str(get_new_tag)
-                )
-            )
-        )
-    else:
-        get_new_tag = get_new_tag
+    get_new_tag = LazyMethod("pyleecan.Methods.Mesh.ElementMat.get_new_tag")
     # cf Methods.Mesh.ElementMat.get_all_node_tags
-    if isinstance(get_all_node_tags, ImportError):
-        get_all_node_tags = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use ElementMat method get_all_node_tags: "
-                    + str(get_all_node_tags)
-                )
-            )
-        )
-    else:
-        get_all_node_tags = get_all_node_tags
+    get_all_node_tags = LazyMethod("pyleecan.Methods.Mesh.ElementMat.get_all_node_tags")
     # cf Methods.Mesh.ElementMat.get_group
-    if isinstance(get_group, ImportError):
-        get_group = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use ElementMat method get_group: " + str(get_group))
-            )
-        )
-    else:
-        get_group = get_group
+    get_group = LazyMethod("pyleecan.Methods.Mesh.ElementMat.get_group")
+    # cf Methods.Mesh.ElementMat.comp_node2element
+    comp_node2element = LazyMethod("pyleecan.Methods.Mesh.ElementMat.comp_node2element")
+    # cf Methods.Mesh.ElementMat.add_elements
+    add_elements = LazyMethod("pyleecan.Methods.Mesh.ElementMat.add_elements")
     # save method is available in all object
     save = save
 
@@ -195,15 +69,15 @@ class ElementMat(Element):
                 ["connectivity", "nb_elem", "nb_node_per_element", "group", "tag"],
             )
             # Overwrite default value with init_dict content
-            if "connectivity" in list(init_dict.keys()):
+            if "connectivity" in init_dict:
                 connectivity = init_dict["connectivity"]
-            if "nb_elem" in list(init_dict.keys()):
+            if "nb_elem" in init_dict:
                 nb_elem = init_dict["nb_elem"]
-            if "nb_node_per_element" in list(init_dict.keys()):
+            if "nb_node_per_element" in init_dict:
                 nb_node_per_element = init_dict["nb_node_per_element"]
-            if "group" in list(init_dict.keys()):
+            if "group" in init_dict:
                 group = init_dict["group"]
-            if "tag" in list(init_dict.keys()):
+            if "tag" in init_dict:
                 tag = init_dict["tag"]
         # Initialisation by argument
         # connectivity can be None, a ndarray or a list
@@ -257,24 +131,31 @@ class ElementMat(Element):
             return False
         return True
 
-    def as_dict(self):
+    def as_dict(self, is_keep_array=False):
         """Convert this objet in a json seriable dict (can be use in __init__)
+        The ndarray are not converted to list if is_keep_array
         """
 
         # Get the properties inherited from Element
-        ElementMat_dict = super(ElementMat, self).as_dict()
+        ElementMat_dict = super(ElementMat, self).as_dict(is_keep_array=is_keep_array)
         if self.connectivity is None:
             ElementMat_dict["connectivity"] = None
+        elif is_keep_array:
+            ElementMat_dict["connectivity"] = self.connectivity
         else:
             ElementMat_dict["connectivity"] = self.connectivity.tolist()
         ElementMat_dict["nb_elem"] = self.nb_elem
         ElementMat_dict["nb_node_per_element"] = self.nb_node_per_element
         if self.group is None:
             ElementMat_dict["group"] = None
+        elif is_keep_array:
+            ElementMat_dict["group"] = self.group
         else:
             ElementMat_dict["group"] = self.group.tolist()
         if self.tag is None:
             ElementMat_dict["tag"] = None
+        elif is_keep_array:
+            ElementMat_dict["tag"] = self.tag
         else:
             ElementMat_dict["tag"] = self.tag.tolist()
         # The class name is added to the dict fordeserialisation purpose
@@ -282,6 +163,26 @@ class ElementMat(Element):
         ElementMat_dict["__class__"] = "ElementMat"
         return ElementMat_dict
 
+    def _copy_to(self, obj):
+        """Copy the properties of this object in obj (called by copy)"""
+
+        # Copy the properties inherited from Element
+        super(ElementMat, self)._copy_to(obj)
+        if self._connectivity is None:
+            obj._connectivity = None
+        else:
+            obj._connectivity = self._connectivity.copy()
+        obj._nb_elem = self._nb_elem
+        obj._nb_node_per_element = self._nb_node_per_element
+        if self._group is None:
+            obj._group = None
+        else:
+            obj._group = self._group.copy()
+        if self._tag is None:
+            obj._tag = None
+        else:
+            obj._tag = self._tag.copy()
+
     def _set_None(self):
         """Set all the properties to None (except pyleecan object)"""
 
@@ -306,6 +207,7 @@ class ElementMat(Element):
                 pass
         check_var("connectivity", value, "ndarray")
         self._connectivity = value
+        self._clear_memo()
 
     # Matrix of connectivity for one element type
     # Type : ndarray
@@ -323,6 +225,7 @@ class ElementMat(Element):
         """setter of nb_elem"""
         check_var("nb_elem", value, "int")
         self._nb_elem = value
+        self._clear_memo()
 
     # Total number of elements
     # Type : int
@@ -338,6 +241,7 @@ class ElementMat(Element):
         """setter of nb_node_per_element"""
         check_var("nb_node_per_element", value, "int")
         self._nb_node_per_element = value
+        self._clear_memo()
 
     # Define the number of node per element
     # Type : int
@@ -360,6 +264,7 @@ class ElementMat(Element):
                 pass
         check_var("group", value, "ndarray")
         self._group = value
+        self._clear_memo()
 
     # Attribute a group number (int) to each element . This group number should correspond to a subpart of the machine.
     # Type : ndarray
@@ -382,6 +287,7 @@ class ElementMat(Element):
                 pass
         check_var("tag", value, "ndarray")
         self._tag = value
+        self._clear_memo()
 
     # Element tags
     # Type : ndarray
@@ -4,23 +4,11 @@ WARNING! All changes made in this file will be lost!
 """
 
 from os import linesep
-from pyleecan.Classes._check import check_init_dict, check_var, raise_
+from pyleecan.Classes._check import check_init_dict, check_var
 from pyleecan.Functions.save import save
 from pyleecan.Classes._frozen import FrozenClass
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from pyleecan.Methods.Simulation.Force.comp_force import comp_force
-except ImportError as error:
-    comp_force = error
-
-try:
-    from pyleecan.Methods.Simulation.Force.comp_force_nodal import comp_force_nodal
-except ImportError as error:
-    comp_force_nodal = error
-
-
+from pyleecan.Classes._lazy import LazyMethod
 from pyleecan.Classes._check import InitUnKnowClassError
 
 
@@ -29,27 +17,10 @@ class Force(FrozenClass):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
     # cf Methods.Simulation.Force.comp_force
-    if isinstance(comp_force, ImportError):
-        comp_force = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Force method comp_force: " + str(comp_force))
-            )
-        )
-    else:
-        comp_force = comp_force
+    comp_force = LazyMethod("pyleecan.Methods.Simulation.Force.comp_force")
     # cf Methods.Simulation.Force.comp_force_nodal
-    if isinstance(comp_force_nodal, ImportError):
-        comp_force_nodal = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Force method comp_force_nodal: " + str(comp_force_nodal)
-                )
-            )
-        )
-    else:
-        comp_force_nodal = comp_force_nodal
+    comp_force_nodal = LazyMethod("pyleecan.Methods.Simulation.Force.comp_force_nodal")
     # save method is available in all object
     save = save
 
@@ -66,7 +37,7 @@ class Force(FrozenClass):
         if init_dict is not None:  # Initialisation by dict
             check_init_dict(init_dict, ["is_comp_nodal_force"])
             # Overwrite default value with init_dict content
-            if "is_comp_nodal_force" in list(init_dict.keys()):
+            if "is_comp_nodal_force" in init_dict:
                 is_comp_nodal_force = init_dict["is_comp_nodal_force"]
         # Initialisation by argument
         self.parent = None
@@ -95,8 +66,9 @@ class Force(FrozenClass):
             return False
         return True
 
-    def as_dict(self):
+    def as_dict(self, is_keep_array=False):
         """Convert this objet in a json seriable dict (can be use in __init__)
+        The ndarray are not converted to list if is_keep_array
         """
 
         Force_dict = dict()
@@ -105,6 +77,11 @@ class Force(FrozenClass):
         Force_dict["__class__"] = "Force"
         return Force_dict
 
+    def _copy_to(self, obj):
+        """Copy the properties of this object in obj (called by copy)"""
+
+        obj._is_comp_nodal_force = self._is_comp_nodal_force
+
     def _set_None(self):
         """Set all the properties to None (except pyleecan object)"""
 
@@ -118,6 +95,7 @@ class Force(FrozenClass):
         """setter of is_comp_nodal_force"""
         check_var("is_comp_nodal_force", value, "bool")
         self._is_comp_nodal_force = value
+        self._clear_memo()
 
     # 1 to compute lumped tooth forces
     # Type : bool
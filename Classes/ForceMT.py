@@ -4,23 +4,11 @@ WARNING! All changes made in this file will be lost!
 """
 
 from os import linesep
-from pyleecan.Classes._check import check_init_dict, check_var, raise_
+from pyleecan.Classes._check import check_init_dict, check_var
 from pyleecan.Functions.save import save
 from pyleecan.Classes.Force import Force
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from pyleecan.Methods.Simulation.ForceMT.comp_force import comp_force
-except ImportError as error:
-    comp_force = error
-
-try:
-    from pyleecan.Methods.Simulation.ForceMT.comp_force_nodal import comp_force_nodal
-except ImportError as error:
-    comp_force_nodal = error
-
-
+from pyleecan.Classes._lazy import LazyMethod
 from pyleecan.Classes._check import InitUnKnowClassError
 
 
@@ -29,28 +17,12 @@ class ForceMT(Force):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
     # cf Methods.Simulation.ForceMT.comp_force
-    if isinstance(comp_force, ImportError):
-        comp_force = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use ForceMT method comp_force: " + str(comp_force))
-            )
-        )
-    else:
-        comp_force = comp_force
+    comp_force = LazyMethod("pyleecan.Methods.Simulation.ForceMT.comp_force")
     # cf Methods.Simulation.ForceMT.comp_force_nodal
-    if isinstance(comp_force_nodal, ImportError):
-        comp_force_nodal = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use ForceMT method comp_force_nodal: "
-                    + str(comp_force_nodal)
-                )
-            )
-        )
-    else:
-        comp_force_nodal = comp_force_nodal
+    comp_force_nodal = LazyMethod(
+        "pyleecan.Methods.Simulation.ForceMT.comp_force_nodal"
+    )
     # save method is available in all object
     save = save
 
@@ -67,7 +39,7 @@ class ForceMT(Force):
         if init_dict is not None:  # Initialisation by dict
             check_init_dict(init_dict, ["is_comp_nodal_force"])
             # Overwrite default value with init_dict content
-            if "is_comp_nodal_force" in list(init_dict.keys()):
+            if "is_comp_nodal_force" in init_dict:
                 is_comp_nodal_force = init_dict["is_comp_nodal_force"]
         # Initialisation by argument
         # Call Force init
@@ -94,17 +66,24 @@ class ForceMT(Force):
             return False
         return True
 
-    def as_dict(self):
+    def as_dict(self, is_keep_array=False):
         """Convert this objet in a json seriable dict (can be use in __init__)
+        The ndarray are not converted to list if is_keep_array
         """
 
         # Get the properties inherited from Force
-        ForceMT_dict = super(ForceMT, self).as_dict()
+        ForceMT_dict = super(ForceMT, self).as_dict(is_keep_array=is_keep_array)
         # The class name is added to the dict fordeserialisation purpose
         # Overwrite the mother class name
         ForceMT_dict["__class__"] = "ForceMT"
         return ForceMT_dict
 
+    def _copy_to(self, obj):
+        """Copy the properties of this object in obj (called by copy)"""
+
+        # Copy the properties inherited from Force
+        super(ForceMT, self)._copy_to(obj)
+
     def _set_None(self):
         """Set all the properties to None (except pyleecan object)"""
 
@@ -4,48 +4,11 @@ WARNING! All changes made in this file will be lost!
 """
 
 from os import linesep
-from pyleecan.Classes._check import check_init_dict, check_var, raise_
+from pyleecan.Classes._check import check_init_dict, check_var
 from pyleecan.Functions.save import save
 from pyleecan.Classes._frozen import FrozenClass
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from pyleecan.Methods.Machine.Frame.build_geometry import build_geometry
-except ImportError as error:
-    build_geometry = error
-
-try:
-    from pyleecan.Methods.Machine.Frame.comp_height_eq import comp_height_eq
-except ImportError as error:
-    comp_height_eq = error
-
-try:
-    from pyleecan.Methods.Machine.Frame.comp_mass import comp_mass
-except ImportError as error:
-    comp_mass = error
-
-try:
-    from pyleecan.Methods.Machine.Frame.comp_surface import comp_surface
-except ImportError as error:
-    comp_surface = error
-
-try:
-    from pyleecan.Methods.Machine.Frame.comp_volume import comp_volume
-except ImportError as error:
-    comp_volume = error
-
-try:
-    from pyleecan.Methods.Machine.Frame.get_length import get_length
-except ImportError as error:
-    get_length = error
-
-try:
-    from pyleecan.Methods.Machine.Frame.plot import plot
-except ImportError as error:
-    plot = error
-
-
+from pyleecan.Classes._lazy import LazyInit, LazyMethod
 from pyleecan.Classes._check import InitUnKnowClassError
 from pyleecan.Classes.Material import Material
 
@@ -55,74 +18,20 @@ class Frame(FrozenClass):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
     # cf Methods.Machine.Frame.build_geometry
-    if isinstance(build_geometry, ImportError):
-        build_geometry = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Frame method build_geometry: " + str(build_geometry)
-                )
-            )
-        )
-    else:
-        build_geometry = build_geometry
+    build_geometry = LazyMethod("pyleecan.Methods.Machine.Frame.build_geometry")
     # cf Methods.Machine.Frame.comp_height_eq
-    if isinstance(comp_height_eq, ImportError):
-        comp_height_eq = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Frame method comp_height_eq: " + str(comp_height_eq)
-                )
-            )
-        )
-    else:
-        comp_height_eq = comp_height_eq
+    comp_height_eq = LazyMethod("pyleecan.Methods.Machine.Frame.comp_height_eq")
     # cf Methods.Machine.Frame.comp_mass
-    if isinstance(comp_mass, ImportError):
-        comp_mass = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Frame method comp_mass: " + str(comp_mass))
-            )
-        )
-    else:
-        comp_mass = comp_mass
+    comp_mass = LazyMethod("pyleecan.Methods.Machine.Frame.comp_mass")
     # cf Methods.Machine.Frame.comp_surface
-    if isinstance(comp_surface, ImportError):
-        comp_surface = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Frame method comp_surface: " + str(comp_surface))
-            )
-        )
-    else:
-        comp_surface = comp_surface
+    comp_surface = LazyMethod("pyleecan.Methods.Machine.Frame.comp_surface")
     # cf Methods.Machine.Frame.comp_volume
-    if isinstance(comp_volume, ImportError):
-        comp_volume = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Frame method comp_volume: " + str(comp_volume))
-            )
-        )
-    else:
-        comp_volume = comp_volume
+    comp_volume = LazyMethod("pyleecan.Methods.Machine.Frame.comp_volume")
     # cf Methods.Machine.Frame.get_length
-    if isinstance(get_length, ImportError):
-        get_length = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Frame method get_length: " + str(get_length))
-            )
-        )
-    else:
-        get_length = get_length
+    get_length = LazyMethod("pyleecan.Methods.Machine.Frame.get_length")
     # cf Methods.Machine.Frame.plot
-    if isinstance(plot, ImportError):
-        plot = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Frame method plot: " + str(plot))
-            )
-        )
-    else:
-        plot = plot
+    plot = LazyMethod("pyleecan.Methods.Machine.Frame.plot")
     # save method is available in all object
     save = save
 
@@ -141,13 +50,13 @@ class Frame(FrozenClass):
         if init_dict is not None:  # Initialisation by dict
             check_init_dict(init_dict, ["Lfra", "Rint", "Rext", "mat_type"])
             # Overwrite default value with init_dict content
-            if "Lfra" in list(init_dict.keys()):
+            if "Lfra" in init_dict:
                 Lfra = init_dict["Lfra"]
-            if "Rint" in list(init_dict.keys()):
+            if "Rint" in init_dict:
                 Rint = init_dict["Rint"]
-            if "Rext" in list(init_dict.keys()):
+            if "Rext" in init_dict:
                 Rext = init_dict["Rext"]
-            if "mat_type" in list(init_dict.keys()):
+            if "mat_type" in init_dict:
                 mat_type = init_dict["mat_type"]
         # Initialisation by argument
         self.parent = None
@@ -197,8 +106,9 @@ class Frame(FrozenClass):
             return False
         return True
 
-    def as_dict(self):
+    def as_dict(self, is_keep_array=False):
         """Convert this objet in a json seriable dict (can be use in __init__)
+        The ndarray are not converted to list if is_keep_array
         """
 
         Frame_dict = dict()
@@ -208,11 +118,23 @@ class Frame(FrozenClass):
         if self.mat_type is None:
             Frame_dict["mat_type"] = None
         else:
-            Frame_dict["mat_type"] = self.mat_type.as_dict()
+            Frame_dict["mat_type"] = self.mat_type.as_dict(is_keep_array=is_keep_array)
         # The class name is added to the dict fordeserialisation purpose
         Frame_dict["__class__"] = "Frame"
         return Frame_dict
 
+    def _copy_to(self, obj):
+        """Copy the properties of this object in obj (called by copy)"""
+
+        obj._Lfra = self._Lfra
+        obj._Rint = self._Rint
+        obj._Rext = self._Rext
+        if self._mat_type is None:
+            obj._mat_type = None
+        else:
+            obj._mat_type = self._mat_type.copy()
+            obj._mat_type.parent = obj
+
     def _set_None(self):
         """Set all the properties to None (except pyleecan object)"""
 
@@ -230,6 +152,7 @@ class Frame(FrozenClass):
         """setter of Lfra"""
         check_var("Lfra", value, "float", Vmin=0)
         self._Lfra = value
+        self._clear_memo()
 
     # frame length [m]
     # Type : float, min = 0
@@ -243,6 +166,7 @@ class Frame(FrozenClass):
         """setter of Rint"""
         check_var("Rint", value, "float", Vmin=0)
         self._Rint = value
+        self._clear_memo()
 
     # frame internal radius
     # Type : float, min = 0
@@ -256,6 +180,7 @@ class Frame(FrozenClass):
         """setter of Rext"""
         check_var("Rext", value, "float", Vmin=0)
         self._Rext = value
+        self._clear_memo()
 
     # Frame external radius
     # Type : float, min = 0
@@ -263,12 +188,16 @@ class Frame(FrozenClass):
 
     def _get_mat_type(self):
         """getter of mat_type"""
+        if isinstance(self._mat_type, LazyInit):
+            # Create the object of a lazy load
+            self._set_mat_type(self._mat_type.resolve())
         return self._mat_type
 
     def _set_mat_type(self, value):
         """setter of mat_type"""
         check_var("mat_type", value, "Material")
         self._mat_type = value
+        self._clear_memo()
 
         if self._mat_type is not None:
             self._mat_type.parent = self
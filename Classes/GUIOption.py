@@ -4,10 +4,11 @@ WARNING! All changes made in this file will be lost!
 """
 
 from os import linesep
-from pyleecan.Classes._check import check_init_dict, check_var, raise_
+from pyleecan.Classes._check import check_init_dict, check_var
 from pyleecan.Functions.save import save
 from pyleecan.Classes._frozen import FrozenClass
 
+from pyleecan.Classes._lazy import LazyInit
 from pyleecan.Classes._check import InitUnKnowClassError
 from pyleecan.Classes.Unit import Unit
 
@@ -34,7 +35,7 @@ class GUIOption(FrozenClass):
         if init_dict is not None:  # Initialisation by dict
             check_init_dict(init_dict, ["unit"])
             # Overwrite default value with init_dict content
-            if "unit" in list(init_dict.keys()):
+            if "unit" in init_dict:
                 unit = init_dict["unit"]
         # Initialisation by argument
         self.parent = None
@@ -70,19 +71,29 @@ class GUIOption(FrozenClass):
             return False
         return True
 
-    def as_dict(self):
+    def as_dict(self, is_keep_array=False):
         """Convert this objet in a json seriable dict (can be use in __init__)
+        The ndarray are not converted to list if is_keep_array
         """
 
         GUIOption_dict = dict()
         if self.unit is None:
             GUIOption_dict["unit"] = None
         else:
-            GUIOption_dict["unit"] = self.unit.as_dict()
+            GUIOption_dict["unit"] = self.unit.as_dict(is_keep_array=is_keep_array)
         # The class name is added to the dict fordeserialisation purpose
         GUIOption_dict["__class__"] = "GUIOption"
         return GUIOption_dict
 
+    def _copy_to(self, obj):
+        """Copy the properties of this object in obj (called by copy)"""
+
+        if self._unit is None:
+            obj._unit = None
+        else:
+            obj._unit = self._unit.copy()
+            obj._unit.parent = obj
+
     def _set_None(self):
         """Set all the properties to None (except pyleecan object)"""
 
@@ -91,12 +102,16 @@ class GUIOption(FrozenClass):
 
     def _get_unit(self):
         """getter of unit"""
+        if isinstance(self._unit, LazyInit):
+            # Create the object of a lazy load
+            self._set_unit(self._unit.resolve())
         return self._unit
 
     def _set_unit(self, value):
         """setter of unit"""
         check_var("unit", value, "Unit")
         self._unit = value
+        self._clear_memo()
 
         if self._unit is not None:
             self._unit.parent = self
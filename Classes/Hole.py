@@ -4,43 +4,11 @@ WARNING! All changes made in this file will be lost!
 """
 
 from os import linesep
-from pyleecan.Classes._check import check_init_dict, check_var, raise_
+from pyleecan.Classes._check import check_init_dict, check_var
 from pyleecan.Functions.save import save
 from pyleecan.Classes._frozen import FrozenClass
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from pyleecan.Methods.Slot.Hole.comp_radius import comp_radius
-except ImportError as error:
-    comp_radius = error
-
-try:
-    from pyleecan.Methods.Slot.Hole.comp_surface import comp_surface
-except ImportError as error:
-    comp_surface = error
-
-try:
-    from pyleecan.Methods.Slot.Hole.get_is_stator import get_is_stator
-except ImportError as error:
-    get_is_stator = error
-
-try:
-    from pyleecan.Methods.Slot.Hole.get_Rbo import get_Rbo
-except ImportError as error:
-    get_Rbo = error
-
-try:
-    from pyleecan.Methods.Slot.Hole.has_magnet import has_magnet
-except ImportError as error:
-    has_magnet = error
-
-try:
-    from pyleecan.Methods.Slot.Hole.plot import plot
-except ImportError as error:
-    plot = error
-
-
+from pyleecan.Classes._lazy import LazyInit, LazyMethod
 from pyleecan.Classes._check import InitUnKnowClassError
 from pyleecan.Classes.Material import Material
 
@@ -50,63 +18,18 @@ class Hole(FrozenClass):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
     # cf Methods.Slot.Hole.comp_radius
-    if isinstance(comp_radius, ImportError):
-        comp_radius = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Hole method comp_radius: " + str(comp_radius))
-            )
-        )
-    else:
-        comp_radius = comp_radius
+    comp_radius = LazyMethod("pyleecan.Methods.Slot.Hole.comp_radius")
     # cf Methods.Slot.Hole.comp_surface
-    if isinstance(comp_surface, ImportError):
-        comp_surface = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Hole method comp_surface: " + str(comp_surface))
-            )
-        )
-    else:
-        comp_surface = comp_surface
+    comp_surface = LazyMethod("pyleecan.Methods.Slot.Hole.comp_surface")
     # cf Methods.Slot.Hole.get_is_stator
-    if isinstance(get_is_stator, ImportError):
-        get_is_stator = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Hole method get_is_stator: " + str(get_is_stator)
-                )
-            )
-        )
-    else:
-        get_is_stator = get_is_stator
+    get_is_stator = LazyMethod("pyleecan.Methods.Slot.Hole.get_is_stator")
     # cf Methods.Slot.Hole.get_Rbo
-    if isinstance(get_Rbo, ImportError):
-        get_Rbo = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Hole method get_Rbo: " + str(get_Rbo))
-            )
-        )
-    else:
-        get_Rbo = get_Rbo
+    get_Rbo = LazyMethod("pyleecan.Methods.Slot.Hole.get_Rbo")
     # cf Methods.Slot.Hole.has_magnet
-    if isinstance(has_magnet, ImportError):
-        has_magnet = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Hole method has_magnet: " + str(has_magnet))
-            )
-        )
-    else:
-        has_magnet = has_magnet
+    has_magnet = LazyMethod("pyleecan.Methods.Slot.Hole.has_magnet")
     # cf Methods.Slot.Hole.plot
-    if isinstance(plot, ImportError):
-        plot = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Hole method plot: " + str(plot))
-            )
-        )
-    else:
-        plot = plot
+    plot = LazyMethod("pyleecan.Methods.Slot.Hole.plot")
     # save method is available in all object
     save = save
 
@@ -125,9 +48,9 @@ class Hole(FrozenClass):
         if init_dict is not None:  # Initialisation by dict
             check_init_dict(init_dict, ["Zh", "mat_void"])
             # Overwrite default value with init_dict content
-            if "Zh" in list(init_dict.keys()):
+            if "Zh" in init_dict:
                 Zh = init_dict["Zh"]
-            if "mat_void" in list(init_dict.keys()):
+            if "mat_void" in init_dict:
                 mat_void = init_dict["mat_void"]
         # Initialisation by argument
         self.parent = None
@@ -167,8 +90,9 @@ class Hole(FrozenClass):
             return False
         return True
 
-    def as_dict(self):
+    def as_dict(self, is_keep_array=False):
         """Convert this objet in a json seriable dict (can be use in __init__)
+        The ndarray are not converted to list if is_keep_array
         """
 
         Hole_dict = dict()
@@ -176,11 +100,21 @@ class Hole(FrozenClass):
         if self.mat_void is None:
             Hole_dict["mat_void"] = None
         else:
-            Hole_dict["mat_void"] = self.mat_void.as_dict()
+            Hole_dict["mat_void"] = self.mat_void.as_dict(is_keep_array=is_keep_array)
         # The class name is added to the dict fordeserialisation purpose
         Hole_dict["__class__"] = "Hole"
         return Hole_dict
 
+    def _copy_to(self, obj):
+        """Copy the properties of this object in obj (called by copy)"""
+
+        obj._Zh = self._Zh
+        if self._mat_void is None:
+            obj._mat_void = None
+        else:
+            obj._mat_void = self._mat_void.copy()
+            obj._mat_void.parent = obj
+
     def _set_None(self):
         """Set all the properties to None (except pyleecan object)"""
 
@@ -196,6 +130,7 @@ class Hole(FrozenClass):
         """setter of Zh"""
         check_var("Zh", value, "int", Vmin=0, Vmax=1000)
         self._Zh = value
+        self._clear_memo()
 
     # Number of Hole around the circumference
     # Type : int, min = 0, max = 1000
@@ -205,12 +140,16 @@ class Hole(FrozenClass):
 
     def _get_mat_void(self):
         """getter of mat_void"""
+        if isinstance(self._mat_void, LazyInit):
+            # Create the object of a lazy load
+            self._set_mat_void(self._mat_void.resolve())
         return self._mat_void
 
     def _set_mat_void(self, value):
         """setter of mat_void"""
         check_var("mat_void", value, "Material")
         self._mat_void = value
+        self._clear_memo()
 
         if self._mat_void is not None:
             self._mat_void.parent = self
@@ -4,63 +4,11 @@ WARNING! All changes made in this file will be lost!
 """
 
 from os import linesep
-from pyleecan.Classes._check import check_init_dict, check_var, raise_
+from pyleecan.Classes._check import check_init_dict, check_var
 from pyleecan.Functions.save import save
 from pyleecan.Classes.HoleMag import HoleMag
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from pyleecan.Methods.Slot.HoleM50.build_geometry import build_geometry
-except ImportError as error:
-    build_geometry = error
-
-try:
-    from pyleecan.Methods.Slot.HoleM50.check import check
-except ImportError as error:
-    check = error
-
-try:
-    from pyleecan.Methods.Slot.HoleM50.comp_alpha import comp_alpha
-except ImportError as error:
-    comp_alpha = error
-
-try:
-    from pyleecan.Methods.Slot.HoleM50.comp_mass_magnets import comp_mass_magnets
-except ImportError as error:
-    comp_mass_magnets = error
-
-try:
-    from pyleecan.Methods.Slot.HoleM50.comp_radius import comp_radius
-except ImportError as error:
-    comp_radius = error
-
-try:
-    from pyleecan.Methods.Slot.HoleM50.comp_surface_magnets import comp_surface_magnets
-except ImportError as error:
-    comp_surface_magnets = error
-
-try:
-    from pyleecan.Methods.Slot.HoleM50.comp_volume_magnets import comp_volume_magnets
-except ImportError as error:
-    comp_volume_magnets = error
-
-try:
-    from pyleecan.Methods.Slot.HoleM50.comp_W5 import comp_W5
-except ImportError as error:
-    comp_W5 = error
-
-try:
-    from pyleecan.Methods.Slot.HoleM50.get_height_magnet import get_height_magnet
-except ImportError as error:
-    get_height_magnet = error
-
-try:
-    from pyleecan.Methods.Slot.HoleM50.remove_magnet import remove_magnet
-except ImportError as error:
-    remove_magnet = error
-
-
+from pyleecan.Classes._lazy import LazyInit, LazyMethod
 from pyleecan.Classes._check import InitUnKnowClassError
 from pyleecan.Classes.Magnet import Magnet
 from pyleecan.Classes.Material import Material
@@ -72,113 +20,30 @@ class HoleM50(HoleMag):
     VERSION = 1
     IS_SYMMETRICAL = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
     # cf Methods.Slot.HoleM50.build_geometry
-    if isinstance(build_geometry, ImportError):
-        build_geometry = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use HoleM50 method build_geometry: " + str(build_geometry)
-                )
-            )
-        )
-    else:
-        build_geometry = build_geometry
+    build_geometry = LazyMethod("pyleecan.Methods.Slot.HoleM50.build_geometry")
     # cf Methods.Slot.HoleM50.check
-    if isinstance(check, ImportError):
-        check = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use HoleM50 method check: " + str(check))
-            )
-        )
-    else:
-        check = check
+    check = LazyMethod("pyleecan.Methods.Slot.HoleM50.check")
     # cf Methods.Slot.HoleM50.comp_alpha
-    if isinstance(comp_alpha, ImportError):
-        comp_alpha = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use HoleM50 method comp_alpha: " + str(comp_alpha))
-            )
-        )
-    else:
-        comp_alpha = comp_alpha
+    comp_alpha = LazyMethod("pyleecan.Methods.Slot.HoleM50.comp_alpha")
     # cf Methods.Slot.HoleM50.comp_mass_magnets
-    if isinstance(comp_mass_magnets, ImportError):
-        comp_mass_magnets = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use HoleM50 method comp_mass_magnets: "
-                    + str(comp_mass_magnets)
-                )
-            )
-        )
-    else:
-        comp_mass_magnets = comp_mass_magnets
+    comp_mass_magnets = LazyMethod("pyleecan.Methods.Slot.HoleM50.comp_mass_magnets")
     # cf Methods.Slot.HoleM50.comp_radius
-    if isinstance(comp_radius, ImportError):
-        comp_radius = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use HoleM50 method comp_radius: " + str(comp_radius))
-            )
-        )
-    else:
-        comp_radius = comp_radius
+    comp_radius = LazyMethod("pyleecan.Methods.Slot.HoleM50.comp_radius")
     # cf Methods.Slot.HoleM50.comp_surface_magnets
-    if isinstance(comp_surface_magnets, ImportError):
-        comp_surface_magnets = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use HoleM50 method comp_surface_magnets: "
-                    + str(comp_surface_magnets)
-                )
-            )
-        )
-    else:
-        comp_surface_magnets = comp_surface_magnets
+    comp_surface_magnets = LazyMethod(
+        "pyleecan.Methods.Slot.HoleM50.comp_surface_magnets"
+    )
     # cf Methods.Slot.HoleM50.comp_volume_magnets
-    if isinstance(comp_volume_magnets, ImportError):
-        comp_volume_magnets = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use HoleM50 method comp_volume_magnets: "
-                    + str(comp_volume_magnets)
-                )
-            )
-        )
-    else:
-        comp_volume_magnets = comp_volume_magnets
+    comp_volume_magnets = LazyMethod(
+        "pyleecan.Methods.Slot.HoleM50.comp_volume_magnets"
+    )
     # cf Methods.Slot.HoleM50.comp_W5
-    if isinstance(comp_W5, ImportError):
-        comp_W5 = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use HoleM50 method comp_W5: " + str(comp_W5))
-            )
-        )
-    else:
-        comp_W5 = comp_W5
+    comp_W5 = LazyMethod("pyleecan.Methods.Slot.HoleM50.comp_W5")
     # cf Methods.Slot.HoleM50.get_height_magnet
-    if isinstance(get_height_magnet, ImportError):
-        get_height_magnet = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use HoleM50 method get_height_magnet: "
-                    + str(get_height_magnet)
-                )
-            )
-        )
-    else:
-        get_height_magnet = get_height_magnet
+    get_height_magnet = LazyMethod("pyleecan.Methods.Slot.HoleM50.get_height_magnet")
     # cf Methods.Slot.HoleM50.remove_magnet
-    if isinstance(remove_magnet, ImportError):
-        remove_magnet = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use HoleM50 method remove_magnet: " + str(remove_magnet)
-                )
-            )
-        )
-    else:
-        remove_magnet = remove_magnet
+    remove_magnet = LazyMethod("pyleecan.Methods.Slot.HoleM50.remove_magnet")
     # save method is available in all object
     save = save
 
@@ -236,33 +101,33 @@ class HoleM50(HoleMag):
                 ],
             )
             # Overwrite default value with init_dict content
-            if "H0" in list(init_dict.keys()):
+            if "H0" in init_dict:
                 H0 = init_dict["H0"]
-            if "W0" in list(init_dict.keys()):
+            if "W0" in init_dict:
                 W0 = init_dict["W0"]
-            if "H1" in list(init_dict.keys()):
+            if "H1" in init_dict:
                 H1 = init_dict["H1"]
-            if "W1" in list(init_dict.keys()):
+            if "W1" in init_dict:
                 W1 = init_dict["W1"]
-            if "H2" in list(init_dict.keys()):
+            if "H2" in init_dict:
                 H2 = init_dict["H2"]
-            if "W2" in list(init_dict.keys()):
+            if "W2" in init_dict:
                 W2 = init_dict["W2"]
-            if "H3" in list(init_dict.keys()):
+            if "H3" in init_dict:
                 H3 = init_dict["H3"]
-            if "W3" in list(init_dict.keys()):
+            if "W3" in init_dict:
                 W3 = init_dict["W3"]
-            if "H4" in list(init_dict.keys()):
+            if "H4" in init_dict:
                 H4 = init_dict["H4"]
-            if "W4" in list(init_dict.keys()):
+            if "W4" in init_dict:
                 W4 = init_dict["W4"]
-            if "magnet_0" in list(init_dict.keys()):
+            if "magnet_0" in init_dict:
                 magnet_0 = init_dict["magnet_0"]
-            if "magnet_1" in list(init_dict.keys()):
+            if "magnet_1" in init_dict:
                 magnet_1 = init_dict["magnet_1"]
-            if "Zh" in list(init_dict.keys()):
+            if "Zh" in init_dict:
                 Zh = init_dict["Zh"]
-            if "mat_void" in list(init_dict.keys()):
+            if "mat_void" in init_dict:
                 mat_void = init_dict["mat_void"]
         # Initialisation by argument
         self.H0 = H0
@@ -391,12 +256,13 @@ class HoleM50(HoleMag):
             return False
         return True
 
-    def as_dict(self):
+    def as_dict(self, is_keep_array=False):
         """Convert this objet in a json seriable dict (can be use in __init__)
+        The ndarray are not converted to list if is_keep_array
         """
 
         # Get the properties inherited from HoleMag
-        HoleM50_dict = super(HoleM50, self).as_dict()
+        HoleM50_dict = super(HoleM50, self).as_dict(is_keep_array=is_keep_array)
         HoleM50_dict["H0"] = self.H0
         HoleM50_dict["W0"] = self.W0
         HoleM50_dict["H1"] = self.H1
@@ -410,16 +276,46 @@ class HoleM50(HoleMag):
         if self.magnet_0 is None:
             HoleM50_dict["magnet_0"] = None
         else:
-            HoleM50_dict["magnet_0"] = self.magnet_0.as_dict()
+            HoleM50_dict["magnet_0"] = self.magnet_0.as_dict(
+                is_keep_array=is_keep_array
+            )
         if self.magnet_1 is None:
             HoleM50_dict["magnet_1"] = None
         else:
-            HoleM50_dict["magnet_1"] = self.magnet_1.as_dict()
+            HoleM50_dict["magnet_1"] = self.magnet_1.as_dict(
+                is_keep_array=is_keep_array
+            )
         # The class name is added to the dict fordeserialisation purpose
         # Overwrite the mother class name
         HoleM50_dict["__class__"] = "HoleM50"
         return HoleM50_dict
 
+    def _copy_to(self, obj):
+        """Copy the properties of this object in obj (called by copy)"""
+
+        # Copy the properties inherited from HoleMag
+        super(HoleM50, self)._copy_to(obj)
+        obj._H0 = self._H0
+        obj._W0 = self._W0
+        obj._H1 = self._H1
+        obj._W1 = self._W1
+        obj._H2 = self._H2
+        obj._W2 = self._W2
+        obj._H3 = self._H3
+        obj._W3 = self._W3
+        obj._H4 = self._H4
+        obj._W4 = self._W4
+        if self._magnet_0 is None:
+            obj._magnet_0 = None
+        else:
+            obj._magnet_0 = self._magnet_0.copy()
+            obj._magnet_0.parent = obj
+        if self._magnet_1 is None:
+            obj._magnet_1 = None
+        else:
+            obj._magnet_1 = self._magnet_1.copy()
+            obj._magnet_1.parent = obj
+
     def _set_None(self):
         """Set all the properties to None (except pyleecan object)"""
 
@@ -448,6 +344,7 @@ class HoleM50(HoleMag):
         """setter of H0"""
         check_var("H0", value, "float", Vmin=0)
         self._H0 = value
+        self._clear_memo()
 
     # Slot depth
     # Type : float, min = 0
@@ -461,6 +358,7 @@ class HoleM50(HoleMag):
         """setter of W0"""
         check_var("W0", value, "float", Vmin=0)
         self._W0 = value
+        self._clear_memo()
 
     # Slot opening
     # Type : float, min = 0
@@ -474,6 +372,7 @@ class HoleM50(HoleMag):
         """setter of H1"""
         check_var("H1", value, "float", Vmin=0)
         self._H1 = value
+        self._clear_memo()
 
     # Distance from the lamination Bore
     # Type : float, min = 0
@@ -489,6 +388,7 @@ class HoleM50(HoleMag):
         """setter of W1"""
         check_var("W1", value, "float", Vmin=0)
         self._W1 = value
+        self._clear_memo()
 
     # Tooth width (at V bottom)
     # Type : float, min = 0
@@ -502,6 +402,7 @@ class HoleM50(HoleMag):
         """setter of H2"""
         check_var("H2", value, "float", Vmin=0)
         self._H2 = value
+        self._clear_memo()
 
     # Additional depth for the magnet
     # Type : float, min = 0
@@ -517,6 +418,7 @@ class HoleM50(HoleMag):
         """setter of W2"""
         check_var("W2", value, "float", Vmin=0)
         self._W2 = value
+        self._clear_memo()
 
     # Distance Magnet to bottom of the V
     # Type : float, min = 0
@@ -532,6 +434,7 @@ class HoleM50(HoleMag):
         """setter of H3"""
         check_var("H3", value, "float", Vmin=0)
         self._H3 = value
+        self._clear_memo()
 
     # Magnet Height
     # Type : float, min = 0
@@ -545,6 +448,7 @@ class HoleM50(HoleMag):
         """setter of W3"""
         check_var("W3", value, "float", Vmin=0)
         self._W3 = value
+        self._clear_memo()
 
     # Tooth width (at V top)
     # Type : float, min = 0
@@ -558,6 +462,7 @@ class HoleM50(HoleMag):
         """setter of H4"""
         check_var("H4", value, "float", Vmin=0)
         self._H4 = value
+        self._clear_memo()
 
     # Slot top height
     # Type : float, min = 0
@@ -571,6 +476,7 @@ class HoleM50(HoleMag):
         """setter of W4"""
         check_var("W4", value, "float", Vmin=0)
         self._W4 = value
+        self._clear_memo()
 
     # Magnet Width
     # Type : float, min = 0
@@ -578,12 +484,16 @@ class HoleM50(HoleMag):
 
     def _get_magnet_0(self):
         """getter of magnet_0"""
+        if isinstance(self._magnet_0, LazyInit):
+            # Create the object of a lazy load
+            self._set_magnet_0(self._magnet_0.resolve())
         return self._magnet_0
 
     def _set_magnet_0(self, value):
         """setter of magnet_0"""
         check_var("magnet_0", value, "Magnet")
         self._magnet_0 = value
+        self._clear_memo()
 
         if self._magnet_0 is not None:
             self._magnet_0.parent = self
@@ -594,12 +504,16 @@ class HoleM50(HoleMag):
 
     def _get_magnet_1(self):
         """getter of magnet_1"""
+        if isinstance(self._magnet_1, LazyInit):
+            # Create the object of a lazy load
+            self._set_magnet_1(self._magnet_1.resolve())
         return self._magnet_1
 
     def _set_magnet_1(self, value):
         """setter of magnet_1"""
         check_var("magnet_1", value, "Magnet")
         self._magnet_1 = value
+        self._clear_memo()
 
         if self._magnet_1 is not None:
             self._magnet_1.parent = self
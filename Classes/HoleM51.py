@@ -4,63 +4,11 @@ WARNING! All changes made in this file will be lost!
 """
 
 from os import linesep
-from pyleecan.Classes._check import check_init_dict, check_var, raise_
+from pyleecan.Classes._check import check_init_dict, check_var
 from pyleecan.Functions.save import save
 from pyleecan.Classes.HoleMag import HoleMag
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from pyleecan.Methods.Slot.HoleM51.build_geometry import build_geometry
-except ImportError as error:
-    build_geometry = error
-
-try:
-    from pyleecan.Methods.Slot.HoleM51.check import check
-except ImportError as error:
-    check = error
-
-try:
-    from pyleecan.Methods.Slot.HoleM51.comp_alpha import comp_alpha
-except ImportError as error:
-    comp_alpha = error
-
-try:
-    from pyleecan.Methods.Slot.HoleM51.comp_mass_magnets import comp_mass_magnets
-except ImportError as error:
-    comp_mass_magnets = error
-
-try:
-    from pyleecan.Methods.Slot.HoleM51.comp_radius import comp_radius
-except ImportError as error:
-    comp_radius = error
-
-try:
-    from pyleecan.Methods.Slot.HoleM51.comp_surface_magnets import comp_surface_magnets
-except ImportError as error:
-    comp_surface_magnets = error
-
-try:
-    from pyleecan.Methods.Slot.HoleM51.comp_volume_magnets import comp_volume_magnets
-except ImportError as error:
-    comp_volume_magnets = error
-
-try:
-    from pyleecan.Methods.Slot.HoleM51.comp_width import comp_width
-except ImportError as error:
-    comp_width = error
-
-try:
-    from pyleecan.Methods.Slot.HoleM51.get_height_magnet import get_height_magnet
-except ImportError as error:
-    get_height_magnet = error
-
-try:
-    from pyleecan.Methods.Slot.HoleM51.remove_magnet import remove_magnet
-except ImportError as error:
-    remove_magnet = error
-
-
+from pyleecan.Classes._lazy import LazyInit, LazyMethod
 from pyleecan.Classes._check import InitUnKnowClassError
 from pyleecan.Classes.Magnet import Magnet
 from pyleecan.Classes.Material import Material
@@ -72,113 +20,30 @@ class HoleM51(HoleMag):
     VERSION = 1
     IS_SYMMETRICAL = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
     # cf Methods.Slot.HoleM51.build_geometry
-    if isinstance(build_geometry, ImportError):
-        build_geometry = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use HoleM51 method build_geometry: " + str(build_geometry)
-                )
-            )
-        )
-    else:
-        build_geometry = build_geometry
+    build_geometry = LazyMethod("pyleecan.Methods.Slot.HoleM51.build_geometry")
     # cf Methods.Slot.HoleM51.check
-    if isinstance(check, ImportError):
-        check = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use HoleM51 method check: " + str(check))
-            )
-        )
-    else:
-        check = check
+    check = LazyMethod("pyleecan.Methods.Slot.HoleM51.check")
     # cf Methods.Slot.HoleM51.comp_alpha
-    if isinstance(comp_alpha, ImportError):
-        comp_alpha = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use HoleM51 method comp_alpha: " + str(comp_alpha))
-            )
-        )
-    else:
-        comp_alpha = comp_alpha
+    comp_alpha = LazyMethod("pyleecan.Methods.Slot.HoleM51.comp_alpha")
     # cf Methods.Slot.HoleM51.comp_mass_magnets
-    if isinstance(comp_mass_magnets, ImportError):
-        comp_mass_magnets = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use HoleM51 method comp_mass_magnets: "
-                    + str(comp_mass_magnets)
-                )
-            )
-        )
-    else:
-        comp_mass_magnets = comp_mass_magnets
+    comp_mass_magnets = LazyMethod("pyleecan.Methods.Slot.HoleM51.comp_mass_magnets")
     # cf Methods.Slot.HoleM51.comp_radius
-    if isinstance(comp_radius, ImportError):
-        comp_radius = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use HoleM51 method comp_radius: " + str(comp_radius))
-            )
-        )
-    else:
-        comp_radius = comp_radius
+    comp_radius = LazyMethod("pyleecan.Methods.Slot.HoleM51.comp_radius")
     # cf Methods.Slot.HoleM51.comp_surface_magnets
-    if isinstance(comp_surface_magnets, ImportError):
-        comp_surface_magnets = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use HoleM51 method comp_surface_magnets: "
-                    + str(comp_surface_magnets)
-                )
-            )
-        )
-    else:
-        comp_surface_magnets = comp_surface_magnets
+    comp_surface_magnets = LazyMethod(
+        "pyleecan.Methods.Slot.HoleM51.comp_surface_magnets"
+    )
     # cf Methods.Slot.HoleM51.comp_volume_magnets
-    if isinstance(comp_volume_magnets, ImportError):
-        comp_volume_magnets = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use HoleM51 method comp_volume_magnets: "
-                    + str(comp_volume_magnets)
-                )
-            )
-        )
-    else:
-        comp_volume_magnets = comp_volume_magnets
+    comp_volume_magnets = LazyMethod(
+        "pyleecan.Methods.Slot.HoleM51.comp_volume_magnets"
+    )
     # cf Methods.Slot.HoleM51.comp_width
-    if isinstance(comp_width, ImportError):
-        comp_width = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use HoleM51 method comp_width: " + str(comp_width))
-            )
-        )
-    else:
-        comp_width = comp_width
+    comp_width = LazyMethod("pyleecan.Methods.Slot.HoleM51.comp_width")
     # cf Methods.Slot.HoleM51.get_height_magnet
-    if isinstance(get_height_magnet, ImportError):
-        get_height_magnet = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use HoleM51 method get_height_magnet: "
-                    + str(get_height_magnet)
-                )
-            )
-        )
-    else:
-        get_height_magnet = get_height_magnet
+    get_height_magnet = LazyMethod("pyleecan.Methods.Slot.HoleM51.get_height_magnet")
     # cf Methods.Slot.HoleM51.remove_magnet
-    if isinstance(remove_magnet, ImportError):
-        remove_magnet = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use HoleM51 method remove_magnet: " + str(remove_magnet)
-                )
-            )
-        )
-    else:
-        remove_magnet = remove_magnet
+    remove_magnet = LazyMethod("pyleecan.Methods.Slot.HoleM51.remove_magnet")
     # save method is available in all object
     save = save
 
@@ -242,37 +107,37 @@ class HoleM51(HoleMag):
                 ],
             )
             # Overwrite default value with init_dict content
-            if "H0" in list(init_dict.keys()):
+            if "H0" in init_dict:
                 H0 = init_dict["H0"]
-            if "H1" in list(init_dict.keys()):
+            if "H1" in init_dict:
                 H1 = init_dict["H1"]
-            if "H2" in list(init_dict.keys()):
+            if "H2" in init_dict:
                 H2 = init_dict["H2"]
-            if "W0" in list(init_dict.keys()):
+            if "W0" in init_dict:
                 W0 = init_dict["W0"]
-            if "W1" in list(init_dict.keys()):
+            if "W1" in init_dict:
                 W1 = init_dict["W1"]
-            if "W2" in list(init_dict.keys()):
+            if "W2" in init_dict:
                 W2 = init_dict["W2"]
-            if "W3" in list(init_dict.keys()):
+            if "W3" in init_dict:
                 W3 = init_dict["W3"]
-            if "W4" in list(init_dict.keys()):
+            if "W4" in init_dict:
                 W4 = init_dict["W4"]
-            if "W5" in list(init_dict.keys()):
+            if "W5" in init_dict:
                 W5 = init_dict["W5"]
-            if "W6" in list(init_dict.keys()):
+            if "W6" in init_dict:
                 W6 = init_dict["W6"]
-            if "W7" in list(init_dict.keys()):
+            if "W7" in init_dict:
                 W7 = init_dict["W7"]
-            if "magnet_0" in list(init_dict.keys()):
+            if "magnet_0" in init_dict:
                 magnet_0 = init_dict["magnet_0"]
-            if "magnet_1" in list(init_dict.keys()):
+            if "magnet_1" in init_dict:
                 magnet_1 = init_dict["magnet_1"]
-            if "magnet_2" in list(init_dict.keys()):
+            if "magnet_2" in init_dict:
                 magnet_2 = init_dict["magnet_2"]
-            if "Zh" in list(init_dict.keys()):
+            if "Zh" in init_dict:
                 Zh = init_dict["Zh"]
-            if "mat_void" in list(init_dict.keys()):
+            if "mat_void" in init_dict:
                 mat_void = init_dict["mat_void"]
         # Initialisation by argument
         self.H0 = H0
@@ -436,12 +301,13 @@ class HoleM51(HoleMag):
             return False
         return True
 
-    def as_dict(self):
+    def as_dict(self, is_keep_array=False):
         """Convert this objet in a json seriable dict (can be use in __init__)
+        The ndarray are not converted to list if is_keep_array
         """
 
         # Get the properties inherited from HoleMag
-        HoleM51_dict = super(HoleM51, self).as_dict()
+        HoleM51_dict = super(HoleM51, self).as_dict(is_keep_array=is_keep_array)
         HoleM51_dict["H0"] = self.H0
         HoleM51_dict["H1"] = self.H1
         HoleM51_dict["H2"] = self.H2
@@ -456,20 +322,58 @@ class HoleM51(HoleMag):
         if self.magnet_0 is None:
             HoleM51_dict["magnet_0"] = None
         else:
-            HoleM51_dict["magnet_0"] = self.magnet_0.as_dict()
+            HoleM51_dict["magnet_0"] = self.magnet_0.as_dict(
+                is_keep_array=is_keep_array
+            )
         if self.magnet_1 is None:
             HoleM51_dict["magnet_1"] = None
         else:
-            HoleM51_dict["magnet_1"] = self.magnet_1.as_dict()
+            HoleM51_dict["magnet_1"] = self.magnet_1.as_dict(
+                is_keep_array=is_keep_array
+            )
         if self.magnet_2 is None:
             HoleM51_dict["magnet_2"] = None
         else:
-            HoleM51_dict["magnet_2"] = self.magnet_2.as_dict()
+            HoleM51_dict["magnet_2"] = self.magnet_2.as_dict(
+                is_keep_array=is_keep_array
+            )
         # The class name is added to the dict fordeserialisation purpose
         # Overwrite the mother class name
         HoleM51_dict["__class__"] = "HoleM51"
         return HoleM51_dict
 
+    def _copy_to(self, obj):
+        """Copy the properties of this object in obj (called by copy)"""
+
+        # Copy the properties inherited from HoleMag
+        super(HoleM51, self)._copy_to(obj)
+        obj._H0 = self._H0
+        obj._H1 = self._H1
+        obj._H2 = self._H2
+        obj._W0 = self._W0
+        obj._W1 = self._W1
+        obj._W2 = self._W2
+        obj._W3 = self._W3
+        obj._W4 = self._W4
+        obj._W5 = self._W5
+        obj._W6 = self._W6
+        obj._W7 = self._W7
+        if self._magnet_0 is None:
+            obj._magnet_0 = None
+        else:
+            obj._magnet_0 = self._magnet_0.copy()
+            obj._magnet_0.parent = obj
+        if self._magnet_1 is None:
+            obj._magnet_1 = None
+        else:
+            obj._magnet_1 = self._magnet_1.copy()
+            obj._magnet_1.parent = obj
+        if self._magnet_2 is None:
+            obj._magnet_2 = None
+        else:
+            obj._magnet_2 = self._magnet_2.copy()
+            obj._magnet_2.parent = obj
+
     def _set_None(self):
         """Set all the properties to None (except pyleecan object)"""
 
@@ -501,6 +405,7 @@ class HoleM51(HoleMag):
         """setter of H0"""
         check_var("H0", value, "float", Vmin=0)
         self._H0 = value
+        self._clear_memo()
 
     # Hole depth
     # Type : float, min = 0
@@ -514,6 +419,7 @@ class HoleM51(HoleMag):
         """setter of H1"""
         check_var("H1", value, "float", Vmin=0)
         self._H1 = value
+        self._clear_memo()
 
     # Distance from the lamination Bore
     # Type : float, min = 0
@@ -529,6 +435,7 @@ class HoleM51(HoleMag):
         """setter of H2"""
         check_var("H2", value, "float", Vmin=0)
         self._H2 = value
+        self._clear_memo()
 
     # Hole width
     # Type : float, min = 0
@@ -542,6 +449,7 @@ class HoleM51(HoleMag):
         """setter of W0"""
         check_var("W0", value, "float", Vmin=0)
         self._W0 = value
+        self._clear_memo()
 
     # Hole bottom width
     # Type : float, min = 0
@@ -555,6 +463,7 @@ class HoleM51(HoleMag):
         """setter of W1"""
         check_var("W1", value, "float", Vmin=0)
         self._W1 = value
+        self._clear_memo()
 
     # Hole angular width
     # Type : float, min = 0
@@ -568,6 +477,7 @@ class HoleM51(HoleMag):
         """setter of W2"""
         check_var("W2", value, "float", Vmin=0)
         self._W2 = value
+        self._clear_memo()
 
     # magnet_1 position
     # Type : float, min = 0
@@ -581,6 +491,7 @@ class HoleM51(HoleMag):
         """setter of W3"""
         check_var("W3", value, "float", Vmin=0)
         self._W3 = value
+        self._clear_memo()
 
     # magnet_1 width
     # Type : float, min = 0
@@ -594,6 +505,7 @@ class HoleM51(HoleMag):
         """setter of W4"""
         check_var("W4", value, "float", Vmin=0)
         self._W4 = value
+        self._clear_memo()
 
     # magnet_2 position
     # Type : float, min = 0
@@ -607,6 +519,7 @@ class HoleM51(HoleMag):
         """setter of W5"""
         check_var("W5", value, "float", Vmin=0)
         self._W5 = value
+        self._clear_memo()
 
     # magnet_2 width
     # Type : float, min = 0
@@ -620,6 +533,7 @@ class HoleM51(HoleMag):
         """setter of W6"""
         check_var("W6", value, "float", Vmin=0)
         self._W6 = value
+        self._clear_memo()
 
     # magnet_0 position
     # Type : float, min = 0
@@ -633,6 +547,7 @@ class HoleM51(HoleMag):
         """setter of W7"""
         check_var("W7", value, "float", Vmin=0)
         self._W7 = value
+        self._clear_memo()
 
     # magnet_0 width
     # Type : float, min = 0
@@ -640,12 +555,16 @@ class HoleM51(HoleMag):
 
     def _get_magnet_0(self):
         """getter of magnet_0"""
+        if isinstance(self._magnet_0, LazyInit):
+            # Create the object of a lazy load
+            self._set_magnet_0(self._magnet_0.resolve())
         return self._magnet_0
 
     def _set_magnet_0(self, value):
         """setter of magnet_0"""
         check_var("magnet_0", value, "Magnet")
         self._magnet_0 = value
+        self._clear_memo()
 
         if self._magnet_0 is not None:
             self._magnet_0.parent = self
@@ -656,12 +575,16 @@ class HoleM51(HoleMag):
 
     def _get_magnet_1(self):
         """getter of magnet_1"""
+        if isinstance(self._magnet_1, LazyInit):
+            # Create the object of a lazy load
+            self._set_magnet_1(self._magnet_1.resolve())
         return self._magnet_1
 
     def _set_magnet_1(self, value):
         """setter of magnet_1"""
         check_var("magnet_1", value, "Magnet")
         self._magnet_1 = value
+        self._clear_memo()
 
         if self._magnet_1 is not None:
             self._magnet_1.parent = self
@@ -674,12 +597,16 @@ class HoleM51(HoleMag):
 
     def _get_magnet_2(self):
         """getter of magnet_2"""
+        if isinstance(self._magnet_2, LazyInit):
+            # Create the object of a lazy load
+            self._set_magnet_2(self._magnet_2.resolve())
         return self._magnet_2
 
     def _set_magnet_2(self, value):
         """setter of magnet_2"""
         check_var("magnet_2", value, "Magnet")
         self._magnet_2 = value
+        self._clear_memo()
 
         if self._magnet_2 is not None:
             self._magnet_2.parent = self
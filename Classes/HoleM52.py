@@ -4,68 +4,11 @@ WARNING! All changes made in this file will be lost!
 """
 
 from os import linesep
-from pyleecan.Classes._check import check_init_dict, check_var, raise_
+from pyleecan.Classes._check import check_init_dict, check_var
 from pyleecan.Functions.save import save
 from pyleecan.Classes.HoleMag import HoleMag
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from pyleecan.Methods.Slot.HoleM52.build_geometry import build_geometry
-except ImportError as error:
-    build_geometry = error
-
-try:
-    from pyleecan.Methods.Slot.HoleM52.check import check
-except ImportError as error:
-    check = error
-
-try:
-    from pyleecan.Methods.Slot.HoleM52.comp_alpha import comp_alpha
-except ImportError as error:
-    comp_alpha = error
-
-try:
-    from pyleecan.Methods.Slot.HoleM52.comp_mass_magnets import comp_mass_magnets
-except ImportError as error:
-    comp_mass_magnets = error
-
-try:
-    from pyleecan.Methods.Slot.HoleM52.comp_radius import comp_radius
-except ImportError as error:
-    comp_radius = error
-
-try:
-    from pyleecan.Methods.Slot.HoleM52.comp_surface import comp_surface
-except ImportError as error:
-    comp_surface = error
-
-try:
-    from pyleecan.Methods.Slot.HoleM52.comp_surface_magnets import comp_surface_magnets
-except ImportError as error:
-    comp_surface_magnets = error
-
-try:
-    from pyleecan.Methods.Slot.HoleM52.comp_volume_magnets import comp_volume_magnets
-except ImportError as error:
-    comp_volume_magnets = error
-
-try:
-    from pyleecan.Methods.Slot.HoleM52.comp_W1 import comp_W1
-except ImportError as error:
-    comp_W1 = error
-
-try:
-    from pyleecan.Methods.Slot.HoleM52.get_height_magnet import get_height_magnet
-except ImportError as error:
-    get_height_magnet = error
-
-try:
-    from pyleecan.Methods.Slot.HoleM52.remove_magnet import remove_magnet
-except ImportError as error:
-    remove_magnet = error
-
-
+from pyleecan.Classes._lazy import LazyInit, LazyMethod
 from pyleecan.Classes._check import InitUnKnowClassError
 from pyleecan.Classes.Magnet import Magnet
 from pyleecan.Classes.Material import Material
@@ -77,124 +20,32 @@ class HoleM52(HoleMag):
     VERSION = 1
     IS_SYMMETRICAL = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
     # cf Methods.Slot.HoleM52.build_geometry
-    if isinstance(build_geometry, ImportError):
-        build_geometry = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use HoleM52 method build_geometry: " + str(build_geometry)
-                )
-            )
-        )
-    else:
-        build_geometry = build_geometry
+    build_geometry = LazyMethod("pyleecan.Methods.Slot.HoleM52.build_geometry")
     # cf Methods.Slot.HoleM52.check
-    if isinstance(check, ImportError):
-        check = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use HoleM52 method check: " + str(check))
-            )
-        )
-    else:
-        check = check
+    check = LazyMethod("pyleecan.Methods.Slot.HoleM52.check")
     # cf Methods.Slot.HoleM52.comp_alpha
-    if isinstance(comp_alpha, ImportError):
-        comp_alpha = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use HoleM52 method comp_alpha: " + str(comp_alpha))
-            )
-        )
-    else:
-        comp_alpha = comp_alpha
+    comp_alpha = LazyMethod("pyleecan.Methods.Slot.HoleM52.comp_alpha")
     # cf Methods.Slot.HoleM52.comp_mass_magnets
-    if isinstance(comp_mass_magnets, ImportError):
-        comp_mass_magnets = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use HoleM52 method comp_mass_magnets: "
-                    + str(comp_mass_magnets)
-                )
-            )
-        )
-    else:
-        comp_mass_magnets = comp_mass_magnets
+    comp_mass_magnets = LazyMethod("pyleecan.Methods.Slot.HoleM52.comp_mass_magnets")
     # cf Methods.Slot.HoleM52.comp_radius
-    if isinstance(comp_radius, ImportError):
-        comp_radius = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use HoleM52 method comp_radius: " + str(comp_radius))
-            )
-        )
-    else:
-        comp_radius = comp_radius
+    comp_radius = LazyMethod("pyleecan.Methods.Slot.HoleM52.comp_radius")
     # cf Methods.Slot.HoleM52.comp_surface
-    if isinstance(comp_surface, ImportError):
-        comp_surface = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use HoleM52 method comp_surface: " + str(comp_surface)
-                )
-            )
-        )
-    else:
-        comp_surface = comp_surface
+    comp_surface = LazyMethod("pyleecan.Methods.Slot.HoleM52.comp_surface")
     # cf Methods.Slot.HoleM52.comp_surface_magnets
-    if isinstance(comp_surface_magnets, ImportError):
-        comp_surface_magnets = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use HoleM52 method comp_surface_magnets: "
-                    + str(comp_surface_magnets)
-                )
-            )
-        )
-    else:
-        comp_surface_magnets = comp_surface_magnets
+    comp_surface_magnets = LazyMethod(
+        "pyleecan.Methods.Slot.HoleM52.comp_surface_magnets"
+    )
     # cf Methods.Slot.HoleM52.comp_volume_magnets
-    if isinstance(comp_volume_magnets, ImportError):
-        comp_volume_magnets = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use HoleM52 method comp_volume_magnets: "
-                    + str(comp_volume_magnets)
-                )
-            )
-        )
-    else:
-        comp_volume_magnets = comp_volume_magnets
+    comp_volume_magnets = LazyMethod(
+        "pyleecan.Methods.Slot.HoleM52.comp_volume_magnets"
+    )
     # cf Methods.Slot.HoleM52.comp_W1
-    if isinstance(comp_W1, ImportError):
-        comp_W1 = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use HoleM52 method comp_W1: " + str(comp_W1))
-            )
-        )
-    else:
-        comp_W1 = comp_W1
+    comp_W1 = LazyMethod("pyleecan.Methods.Slot.HoleM52.comp_W1")
     # cf Methods.Slot.HoleM52.get_height_magnet
-    if isinstance(get_height_magnet, ImportError):
-        get_height_magnet = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use HoleM52 method get_height_magnet: "
-                    + str(get_height_magnet)
-                )
-            )
-        )
-    else:
-        get_height_magnet = get_height_magnet
+    get_height_magnet = LazyMethod("pyleecan.Methods.Slot.HoleM52.get_height_magnet")
     # cf Methods.Slot.HoleM52.remove_magnet
-    if isinstance(remove_magnet, ImportError):
-        remove_magnet = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use HoleM52 method remove_magnet: " + str(remove_magnet)
-                )
-            )
-        )
-    else:
-        remove_magnet = remove_magnet
+    remove_magnet = LazyMethod("pyleecan.Methods.Slot.HoleM52.remove_magnet")
     # save method is available in all object
     save = save
 
@@ -228,21 +79,21 @@ class HoleM52(HoleMag):
                 init_dict, ["H0", "W0", "H1", "W3", "H2", "magnet_0", "Zh", "mat_void"]
             )
             # Overwrite default value with init_dict content
-            if "H0" in list(init_dict.keys()):
+            if "H0" in init_dict:
                 H0 = init_dict["H0"]
-            if "W0" in list(init_dict.keys()):
+            if "W0" in init_dict:
                 W0 = init_dict["W0"]
-            if "H1" in list(init_dict.keys()):
+            if "H1" in init_dict:
                 H1 = init_dict["H1"]
-            if "W3" in list(init_dict.keys()):
+            if "W3" in init_dict:
                 W3 = init_dict["W3"]
-            if "H2" in list(init_dict.keys()):
+            if "H2" in init_dict:
                 H2 = init_dict["H2"]
-            if "magnet_0" in list(init_dict.keys()):
+            if "magnet_0" in init_dict:
                 magnet_0 = init_dict["magnet_0"]
-            if "Zh" in list(init_dict.keys()):
+            if "Zh" in init_dict:
                 Zh = init_dict["Zh"]
-            if "mat_void" in list(init_dict.keys()):
+            if "mat_void" in init_dict:
                 mat_void = init_dict["mat_void"]
         # Initialisation by argument
         self.H0 = H0
@@ -320,12 +171,13 @@ class HoleM52(HoleMag):
             return False
         return True
 
-    def as_dict(self):
+    def as_dict(self, is_keep_array=False):
         """Convert this objet in a json seriable dict (can be use in __init__)
+        The ndarray are not converted to list if is_keep_array
         """
 
         # Get the properties inherited from HoleMag
-        HoleM52_dict = super(HoleM52, self).as_dict()
+        HoleM52_dict = super(HoleM52, self).as_dict(is_keep_array=is_keep_array)
         HoleM52_dict["H0"] = self.H0
         HoleM52_dict["W0"] = self.W0
         HoleM52_dict["H1"] = self.H1
@@ -334,12 +186,30 @@ class HoleM52(HoleMag):
         if self.magnet_0 is None:
             HoleM52_dict["magnet_0"] = None
         else:
-            HoleM52_dict["magnet_0"] = self.magnet_0.as_dict()
+            HoleM52_dict["magnet_0"] = self.magnet_0.as_dict(
+                is_keep_array=is_keep_array
+            )
         # The class name is added to the dict fordeserialisation purpose
         # Overwrite the mother class name
         HoleM52_dict["__class__"] = "HoleM52"
         return HoleM52_dict
 
+    def _copy_to(self, obj):
+        """Copy the properties of this object in obj (called by copy)"""
+
+        # Copy the properties inherited from HoleMag
+        super(HoleM52, self)._copy_to(obj)
+        obj._H0 = self._H0
+        obj._W0 = self._W0
+        obj._H1 = self._H1
+        obj._W3 = self._W3
+        obj._H2 = self._H2
+        if self._magnet_0 is None:
+            obj._magnet_0 = None
+        else:
+            obj._magnet_0 = self._magnet_0.copy()
+            obj._magnet_0.parent = obj
+
     def _set_None(self):
         """Set all the properties to None (except pyleecan object)"""
 
@@ -361,6 +231,7 @@ class HoleM52(HoleMag):
         """setter of H0"""
         check_var("H0", value, "float", Vmin=0)
         self._H0 = value
+        self._clear_memo()
 
     # Slot depth
     # Type : float, min = 0
@@ -374,6 +245,7 @@ class HoleM52(HoleMag):
         """setter of W0"""
         check_var("W0", value, "float", Vmin=0)
         self._W0 = value
+        self._clear_memo()
 
     # Magnet width
     # Type : float, min = 0
@@ -387,6 +259,7 @@ class HoleM52(HoleMag):
         """setter of H1"""
         check_var("H1", value, "float", Vmin=0)
         self._H1 = value
+        self._clear_memo()
 
     # Magnet height
     # Type : float, min = 0
@@ -400,6 +273,7 @@ class HoleM52(HoleMag):
         """setter of W3"""
         check_var("W3", value, "float", Vmin=0)
         self._W3 = value
+        self._clear_memo()
 
     # Tooth width
     # Type : float, min = 0
@@ -413,6 +287,7 @@ class HoleM52(HoleMag):
         """setter of H2"""
         check_var("H2", value, "float", Vmin=0)
         self._H2 = value
+        self._clear_memo()
 
     # Additional depth for the magnet
     # Type : float, min = 0
@@ -422,12 +297,16 @@ class HoleM52(HoleMag):
 
     def _get_magnet_0(self):
         """getter of magnet_0"""
+        if isinstance(self._magnet_0, LazyInit):
+            # Create the object of a lazy load
+            self._set_magnet_0(self._magnet_0.resolve())
         return self._magnet_0
 
     def _set_magnet_0(self, value):
         """setter of magnet_0"""
         check_var("magnet_0", value, "Magnet")
         self._magnet_0 = value
+        self._clear_memo()
 
         if self._magnet_0 is not None:
             self._magnet_0.parent = self
@@ -4,38 +4,11 @@ WARNING! All changes made in this file will be lost!
 """
 
 from os import linesep
-from pyleecan.Classes._check import check_init_dict, check_var, raise_
+from pyleecan.Classes._check import check_init_dict, check_var
 from pyleecan.Functions.save import save
 from pyleecan.Classes.Hole import Hole
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from pyleecan.Methods.Slot.HoleM54.build_geometry import build_geometry
-except ImportError as error:
-    build_geometry = error
-
-try:
-    from pyleecan.Methods.Slot.HoleM54.check import check
-except ImportError as error:
-    check = error
-
-try:
-    from pyleecan.Methods.Slot.HoleM54.comp_radius import comp_radius
-except ImportError as error:
-    comp_radius = error
-
-try:
-    from pyleecan.Methods.Slot.HoleM54.comp_surface import comp_surface
-except ImportError as error:
-    comp_surface = error
-
-try:
-    from pyleecan.Methods.Slot.HoleM54.get_height_magnet import get_height_magnet
-except ImportError as error:
-    get_height_magnet = error
-
-
+from pyleecan.Classes._lazy import LazyMethod
 from pyleecan.Classes._check import InitUnKnowClassError
 from pyleecan.Classes.Material import Material
 
@@ -46,59 +19,16 @@ class HoleM54(Hole):
     VERSION = 1
     IS_SYMMETRICAL = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
     # cf Methods.Slot.HoleM54.build_geometry
-    if isinstance(build_geometry, ImportError):
-        build_geometry = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use HoleM54 method build_geometry: " + str(build_geometry)
-                )
-            )
-        )
-    else:
-        build_geometry = build_geometry
+    build_geometry = LazyMethod("pyleecan.Methods.Slot.HoleM54.build_geometry")
     # cf Methods.Slot.HoleM54.check
-    if isinstance(check, ImportError):
-        check = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use HoleM54 method check: " + str(check))
-            )
-        )
-    else:
-        check = check
+    check = LazyMethod("pyleecan.Methods.Slot.HoleM54.check")
     # cf Methods.Slot.HoleM54.comp_radius
-    if isinstance(comp_radius, ImportError):
-        comp_radius = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use HoleM54 method comp_radius: " + str(comp_radius))
-            )
-        )
-    else:
-        comp_radius = comp_radius
+    comp_radius = LazyMethod("pyleecan.Methods.Slot.HoleM54.comp_radius")
     # cf Methods.Slot.HoleM54.comp_surface
-    if isinstance(comp_surface, ImportError):
-        comp_surface = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use HoleM54 method comp_surface: " + str(comp_surface)
-                )
-            )
-        )
-    else:
-        comp_surface = comp_surface
+    comp_surface = LazyMethod("pyleecan.Methods.Slot.HoleM54.comp_surface")
     # cf Methods.Slot.HoleM54.get_height_magnet
-    if isinstance(get_height_magnet, ImportError):
-        get_height_magnet = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use HoleM54 method get_height_magnet: "
-                    + str(get_height_magnet)
-                )
-            )
-        )
-    else:
-        get_height_magnet = get_height_magnet
+    get_height_magnet = LazyMethod("pyleecan.Methods.Slot.HoleM54.get_height_magnet")
     # save method is available in all object
     save = save
 
@@ -119,17 +49,17 @@ class HoleM54(Hole):
         if init_dict is not None:  # Initialisation by dict
             check_init_dict(init_dict, ["H0", "H1", "W0", "R1", "Zh", "mat_void"])
             # Overwrite default value with init_dict content
-            if "H0" in list(init_dict.keys()):
+            if "H0" in init_dict:
                 H0 = init_dict["H0"]
-            if "H1" in list(init_dict.keys()):
+            if "H1" in init_dict:
                 H1 = init_dict["H1"]
-            if "W0" in list(init_dict.keys()):
+            if "W0" in init_dict:
                 W0 = init_dict["W0"]
-            if "R1" in list(init_dict.keys()):
+            if "R1" in init_dict:
                 R1 = init_dict["R1"]
-            if "Zh" in list(init_dict.keys()):
+            if "Zh" in init_dict:
                 Zh = init_dict["Zh"]
-            if "mat_void" in list(init_dict.keys()):
+            if "mat_void" in init_dict:
                 mat_void = init_dict["mat_void"]
         # Initialisation by argument
         self.H0 = H0
@@ -172,12 +102,13 @@ class HoleM54(Hole):
             return False
         return True
 
-    def as_dict(self):
+    def as_dict(self, is_keep_array=False):
         """Convert this objet in a json seriable dict (can be use in __init__)
+        The ndarray are not converted to list if is_keep_array
         """
 
         # Get the properties inherited from Hole
-        HoleM54_dict = super(HoleM54, self).as_dict()
+        HoleM54_dict = super(HoleM54, self).as_dict(is_keep_array=is_keep_array)
         HoleM54_dict["H0"] = self.H0
         HoleM54_dict["H1"] = self.H1
         HoleM54_dict["W0"] = self.W0
@@ -187,6 +118,16 @@ class HoleM54(Hole):
         HoleM54_dict["__class__"] = "HoleM54"
         return HoleM54_dict
 
+    def _copy_to(self, obj):
+        """Copy the properties of this object in obj (called by copy)"""
+
+        # Copy the properties inherited from Hole
+        super(HoleM54, self)._copy_to(obj)
+        obj._H0 = self._H0
+        obj._H1 = self._H1
+        obj._W0 = self._W0
+        obj._R1 = self._R1
+
     def _set_None(self):
         """Set all the properties to None (except pyleecan object)"""
 
@@ -205,6 +146,7 @@ class HoleM54(Hole):
         """setter of H0"""
         check_var("H0", value, "float", Vmin=0)
         self._H0 = value
+        self._clear_memo()
 
     # Hole depth
     # Type : float, min = 0
@@ -218,6 +160,7 @@ class HoleM54(Hole):
         """setter of H1"""
         check_var("H1", value, "float", Vmin=0)
         self._H1 = value
+        self._clear_memo()
 
     # Hole width
     # Type : float, min = 0
@@ -231,6 +174,7 @@ class HoleM54(Hole):
         """setter of W0"""
         check_var("W0", value, "float", Vmin=0)
         self._W0 = value
+        self._clear_memo()
 
     # Hole angular width
     # Type : float, min = 0
@@ -244,6 +188,7 @@ class HoleM54(Hole):
         """setter of R1"""
         check_var("R1", value, "float", Vmin=0)
         self._R1 = value
+        self._clear_memo()
 
     # Hole radius
     # Type : float, min = 0
@@ -4,18 +4,11 @@ WARNING! All changes made in this file will be lost!
 """
 
 from os import linesep
-from pyleecan.Classes._check import check_init_dict, check_var, raise_
+from pyleecan.Classes._check import check_init_dict, check_var
 from pyleecan.Functions.save import save
 from pyleecan.Classes.Hole import Hole
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from pyleecan.Methods.Slot.HoleMag.has_magnet import has_magnet
-except ImportError as error:
-    has_magnet = error
-
-
+from pyleecan.Classes._lazy import LazyMethod
 from pyleecan.Classes._check import InitUnKnowClassError
 from pyleecan.Classes.Material import Material
 
@@ -26,14 +19,7 @@ class HoleMag(Hole):
     VERSION = 1
 
     # cf Methods.Slot.HoleMag.has_magnet
-    if isinstance(has_magnet, ImportError):
-        has_magnet = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use HoleMag method has_magnet: " + str(has_magnet))
-            )
-        )
-    else:
-        has_magnet = has_magnet
+    has_magnet = LazyMethod("pyleecan.Methods.Slot.HoleMag.has_magnet")
     # save method is available in all object
     save = save
 
@@ -52,9 +38,9 @@ class HoleMag(Hole):
         if init_dict is not None:  # Initialisation by dict
             check_init_dict(init_dict, ["Zh", "mat_void"])
             # Overwrite default value with init_dict content
-            if "Zh" in list(init_dict.keys()):
+            if "Zh" in init_dict:
                 Zh = init_dict["Zh"]
-            if "mat_void" in list(init_dict.keys()):
+            if "mat_void" in init_dict:
                 mat_void = init_dict["mat_void"]
         # Initialisation by argument
         # Call Hole init
@@ -81,17 +67,24 @@ class HoleMag(Hole):
             return False
         return True
 
-    def as_dict(self):
+    def as_dict(self, is_keep_array=False):
         """Convert this objet in a json seriable dict (can be use in __init__)
+        The ndarray are not converted to list if is_keep_array
         """
 
         # Get the properties inherited from Hole
-        HoleMag_dict = super(HoleMag, self).as_dict()
+        HoleMag_dict = super(HoleMag, self).as_dict(is_keep_array=is_keep_array)
         # The class name is added to the dict fordeserialisation purpose
         # Overwrite the mother class name
         HoleMag_dict["__class__"] = "HoleMag"
         return HoleMag_dict
 
+    def _copy_to(self, obj):
+        """Copy the properties of this object in obj (called by copy)"""
+
+        # Copy the properties inherited from Hole
+        super(HoleMag, self)._copy_to(obj)
+
     def _set_None(self):
         """Set all the properties to None (except pyleecan object)"""
 
@@ -4,23 +4,11 @@ WARNING! All changes made in this file will be lost!
 """
 
 from os import linesep
-from pyleecan.Classes._check import check_init_dict, check_var, raise_
+from pyleecan.Classes._check import check_init_dict, check_var
 from pyleecan.Functions.save import save
 from pyleecan.Classes.ImportMatrix import ImportMatrix
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from pyleecan.Methods.Import.ImportGenMatrixSin.get_data import get_data
-except ImportError as error:
-    get_data = error
-
-try:
-    from pyleecan.Methods.Import.ImportGenMatrixSin.init_vector import init_vector
-except ImportError as error:
-    init_vector = error
-
-
+from pyleecan.Classes._lazy import LazyInit, LazyMethod
 from pyleecan.Classes._check import InitUnKnowClassError
 from pyleecan.Classes.ImportGenVectSin import ImportGenVectSin
 
@@ -30,30 +18,10 @@ class ImportGenMatrixSin(ImportMatrix):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
     # cf Methods.Import.ImportGenMatrixSin.get_data
-    if isinstance(get_data, ImportError):
-        get_data = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use ImportGenMatrixSin method get_data: " + str(get_data)
-                )
-            )
-        )
-    else:
-        get_data = get_data
+    get_data = LazyMethod("pyleecan.Methods.Import.ImportGenMatrixSin.get_data")
     # cf Methods.Import.ImportGenMatrixSin.init_vector
-    if isinstance(init_vector, ImportError):
-        init_vector = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use ImportGenMatrixSin method init_vector: "
-                    + str(init_vector)
-                )
-            )
-        )
-    else:
-        init_vector = init_vector
+    init_vector = LazyMethod("pyleecan.Methods.Import.ImportGenMatrixSin.init_vector")
     # save method is available in all object
     save = save
 
@@ -70,9 +38,9 @@ class ImportGenMatrixSin(ImportMatrix):
         if init_dict is not None:  # Initialisation by dict
             check_init_dict(init_dict, ["sin_list", "is_transpose"])
             # Overwrite default value with init_dict content
-            if "sin_list" in list(init_dict.keys()):
+            if "sin_list" in init_dict:
                 sin_list = init_dict["sin_list"]
-            if "is_transpose" in list(init_dict.keys()):
+            if "is_transpose" in init_dict:
                 is_transpose = init_dict["is_transpose"]
         # Initialisation by argument
         # sin_list can be None or a list of ImportGenVectSin object
@@ -80,11 +48,11 @@ class ImportGenMatrixSin(ImportMatrix):
         if type(sin_list) is list:
             for obj in sin_list:
                 if obj is None:  # Default value
-                    self.sin_list.append(ImportGenVectSin())
+                    self._sin_list.append(ImportGenVectSin())
                 elif isinstance(obj, dict):
-                    self.sin_list.append(ImportGenVectSin(init_dict=obj))
+                    self._sin_list.append(ImportGenVectSin(init_dict=obj))
                 else:
-                    self.sin_list.append(obj)
+                    self._sin_list.append(obj)
         elif sin_list is None:
             self.sin_list = list()
         else:
@@ -121,20 +89,37 @@ class ImportGenMatrixSin(ImportMatrix):
             return False
         return True
 
-    def as_dict(self):
+    def as_dict(self, is_keep_array=False):
         """Convert this objet in a json seriable dict (can be use in __init__)
+        The ndarray are not converted to list if is_keep_array
         """
 
         # Get the properties inherited from ImportMatrix
-        ImportGenMatrixSin_dict = super(ImportGenMatrixSin, self).as_dict()
+        ImportGenMatrixSin_dict = super(ImportGenMatrixSin, self).as_dict(
+            is_keep_array=is_keep_array
+        )
         ImportGenMatrixSin_dict["sin_list"] = list()
         for obj in self.sin_list:
-            ImportGenMatrixSin_dict["sin_list"].append(obj.as_dict())
+            ImportGenMatrixSin_dict["sin_list"].append(
+                obj.as_dict(is_keep_array=is_keep_array)
+            )
         # The class name is added to the dict fordeserialisation purpose
         # Overwrite the mother class name
         ImportGenMatrixSin_dict["__class__"] = "ImportGenMatrixSin"
         return ImportGenMatrixSin_dict
 
+    def _copy_to(self, obj):
+        """Copy the properties of this object in obj (called by copy)"""
+
+        # Copy the properties inherited from ImportMatrix
+        super(ImportGenMatrixSin, self)._copy_to(obj)
+        obj._sin_list = list()
+        for value in self._sin_list:
+            if value is not None:
+                value = value.copy()
+                value.parent = obj
+            obj._sin_list.append(value)
+
     def _set_None(self):
         """Set all the properties to None (except pyleecan object)"""
 
@@ -145,7 +130,11 @@ class ImportGenMatrixSin(ImportMatrix):
 
     def _get_sin_list(self):
         """getter of sin_list"""
-        for obj in self._sin_list:
+        for ii, obj in enumerate(self._sin_list):
+            if isinstance(obj, LazyInit):
+                # Create the object of a lazy load
+                obj = obj.resolve()
+                self._sin_list[ii] = obj
             if obj is not None:
                 obj.parent = self
         return self._sin_list
@@ -154,6 +143,7 @@ class ImportGenMatrixSin(ImportMatrix):
         """setter of sin_list"""
         check_var("sin_list", value, "[ImportGenVectSin]")
         self._sin_list = value
+        self._clear_memo()
 
         for obj in self._sin_list:
             if obj is not None:
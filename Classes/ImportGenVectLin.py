@@ -4,18 +4,11 @@ WARNING! All changes made in this file will be lost!
 """
 
 from os import linesep
-from pyleecan.Classes._check import check_init_dict, check_var, raise_
+from pyleecan.Classes._check import check_init_dict, check_var
 from pyleecan.Functions.save import save
 from pyleecan.Classes.ImportMatrix import ImportMatrix
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from pyleecan.Methods.Import.ImportGenVectLin.get_data import get_data
-except ImportError as error:
-    get_data = error
-
-
+from pyleecan.Classes._lazy import LazyMethod
 from pyleecan.Classes._check import InitUnKnowClassError
 
 
@@ -25,16 +18,7 @@ class ImportGenVectLin(ImportMatrix):
     VERSION = 1
 
     # cf Methods.Import.ImportGenVectLin.get_data
-    if isinstance(get_data, ImportError):
-        get_data = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use ImportGenVectLin method get_data: " + str(get_data)
-                )
-            )
-        )
-    else:
-        get_data = get_data
+    get_data = LazyMethod("pyleecan.Methods.Import.ImportGenVectLin.get_data")
     # save method is available in all object
     save = save
 
@@ -61,15 +45,15 @@ class ImportGenVectLin(ImportMatrix):
                 init_dict, ["start", "stop", "num", "endpoint", "is_transpose"]
             )
             # Overwrite default value with init_dict content
-            if "start" in list(init_dict.keys()):
+            if "start" in init_dict:
                 start = init_dict["start"]
-            if "stop" in list(init_dict.keys()):
+            if "stop" in init_dict:
                 stop = init_dict["stop"]
-            if "num" in list(init_dict.keys()):
+            if "num" in init_dict:
                 num = init_dict["num"]
-            if "endpoint" in list(init_dict.keys()):
+            if "endpoint" in init_dict:
                 endpoint = init_dict["endpoint"]
-            if "is_transpose" in list(init_dict.keys()):
+            if "is_transpose" in init_dict:
                 is_transpose = init_dict["is_transpose"]
         # Initialisation by argument
         self.start = start
@@ -112,12 +96,15 @@ class ImportGenVectLin(ImportMatrix):
             return False
         return True
 
-    def as_dict(self):
+    def as_dict(self, is_keep_array=False):
         """Convert this objet in a json seriable dict (can be use in __init__)
+        The ndarray are not converted to list if is_keep_array
         """
 
         # Get the properties inherited from ImportMatrix
-        ImportGenVectLin_dict = super(ImportGenVectLin, self).as_dict()
+        ImportGenVectLin_dict = super(ImportGenVectLin, self).as_dict(
+            is_keep_array=is_keep_array
+        )
         ImportGenVectLin_dict["start"] = self.start
         ImportGenVectLin_dict["stop"] = self.stop
         ImportGenVectLin_dict["num"] = self.num
@@ -127,6 +114,16 @@ class ImportGenVectLin(ImportMatrix):
         ImportGenVectLin_dict["__class__"] = "ImportGenVectLin"
         return ImportGenVectLin_dict
 
+    def _copy_to(self, obj):
+        """Copy the properties of this object in obj (called by copy)"""
+
+        # Copy the properties inherited from ImportMatrix
+        super(ImportGenVectLin, self)._copy_to(obj)
+        obj._start = self._start
+        obj._stop = self._stop
+        obj._num = self._num
+        obj._endpoint = self._endpoint
+
     def _set_None(self):
         """Set all the properties to None (except pyleecan object)"""
 
@@ -145,6 +142,7 @@ class ImportGenVectLin(ImportMatrix):
         """setter of start"""
         check_var("start", value, "float")
         self._start = value
+        self._clear_memo()
 
     # Begin point of the linspace
     # Type : float
@@ -160,6 +158,7 @@ class ImportGenVectLin(ImportMatrix):
         """setter of stop"""
         check_var("stop", value, "float")
         self._stop = value
+        self._clear_memo()
 
     # End point of the linspace
     # Type : float
@@ -175,6 +174,7 @@ class ImportGenVectLin(ImportMatrix):
         """setter of num"""
         check_var("num", value, "float")
         self._num = value
+        self._clear_memo()
 
     # Number of value in the linspace
     # Type : float
@@ -190,6 +190,7 @@ class ImportGenVectLin(ImportMatrix):
         """setter of endpoint"""
         check_var("endpoint", value, "bool")
         self._endpoint = value
+        self._clear_memo()
 
     # If True, stop is the last sample. Otherwise, it is not included
     # Type : bool
@@ -4,18 +4,11 @@ WARNING! All changes made in this file will be lost!
 """
 
 from os import linesep
-from pyleecan.Classes._check import check_init_dict, check_var, raise_
+from pyleecan.Classes._check import check_init_dict, check_var
 from pyleecan.Functions.save import save
 from pyleecan.Classes.ImportMatrix import ImportMatrix
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from pyleecan.Methods.Import.ImportGenVectSin.get_data import get_data
-except ImportError as error:
-    get_data = error
-
-
+from pyleecan.Classes._lazy import LazyMethod
 from pyleecan.Classes._check import InitUnKnowClassError
 
 
@@ -25,16 +18,7 @@ class ImportGenVectSin(ImportMatrix):
     VERSION = 1
 
     # cf Methods.Import.ImportGenVectSin.get_data
-    if isinstance(get_data, ImportError):
-        get_data = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use ImportGenVectSin method get_data: " + str(get_data)
-                )
-            )
-        )
-    else:
-        get_data = get_data
+    get_data = LazyMethod("pyleecan.Methods.Import.ImportGenVectSin.get_data")
     # save method is available in all object
     save = save
 
@@ -53,17 +37,17 @@ class ImportGenVectSin(ImportMatrix):
         if init_dict is not None:  # Initialisation by dict
             check_init_dict(init_dict, ["f", "A", "Phi", "N", "Tf", "is_transpose"])
             # Overwrite default value with init_dict content
-            if "f" in list(init_dict.keys()):
+            if "f" in init_dict:
                 f = init_dict["f"]
-            if "A" in list(init_dict.keys()):
+            if "A" in init_dict:
                 A = init_dict["A"]
-            if "Phi" in list(init_dict.keys()):
+            if "Phi" in init_dict:
                 Phi = init_dict["Phi"]
-            if "N" in list(init_dict.keys()):
+            if "N" in init_dict:
                 N = init_dict["N"]
-            if "Tf" in list(init_dict.keys()):
+            if "Tf" in init_dict:
                 Tf = init_dict["Tf"]
-            if "is_transpose" in list(init_dict.keys()):
+            if "is_transpose" in init_dict:
                 is_transpose = init_dict["is_transpose"]
         # Initialisation by argument
         self.f = f
@@ -110,12 +94,15 @@ class ImportGenVectSin(ImportMatrix):
             return False
         return True
 
-    def as_dict(self):
+    def as_dict(self, is_keep_array=False):
         """Convert this objet in a json seriable dict (can be use in __init__)
+        The ndarray are not converted to list if is_keep_array
         """
 
         # Get the properties inherited from ImportMatrix
-        ImportGenVectSin_dict = super(ImportGenVectSin, self).as_dict()
+        ImportGenVectSin_dict = super(ImportGenVectSin, self).as_dict(
+            is_keep_array=is_keep_array
+        )
         ImportGenVectSin_dict["f"] = self.f
         ImportGenVectSin_dict["A"] = self.A
         ImportGenVectSin_dict["Phi"] = self.Phi
@@ -126,6 +113,17 @@ class ImportGenVectSin(ImportMatrix):
         ImportGenVectSin_dict["__class__"] = "ImportGenVectSin"
         return ImportGenVectSin_dict
 
+    def _copy_to(self, obj):
+        """Copy the properties of this object in obj (called by copy)"""
+
+        # Copy the properties inherited from ImportMatrix
+        super(ImportGenVectSin, self)._copy_to(obj)
+        obj._f = self._f
+        obj._A = self._A
+        obj._Phi = self._Phi
+        obj._N = self._N
+        obj._Tf = self._Tf
+
     def _set_None(self):
         """Set all the properties to None (except pyleecan object)"""
 
@@ -145,6 +143,7 @@ class ImportGenVectSin(ImportMatrix):
         """setter of f"""
         check_var("f", value, "float", Vmin=0)
         self._f = value
+        self._clear_memo()
 
     # Frequency of the sinus to generate
     # Type : float, min = 0
@@ -160,6 +159,7 @@ class ImportGenVectSin(ImportMatrix):
         """setter of A"""
         check_var("A", value, "float")
         self._A = value
+        self._clear_memo()
 
     # Amplitude of the sinus to generate
     # Type : float
@@ -175,6 +175,7 @@ class ImportGenVectSin(ImportMatrix):
         """setter of Phi"""
         check_var("Phi", value, "float", Vmin=-6.29, Vmax=6.29)
         self._Phi = value
+        self._clear_memo()
 
     # Phase of the sinus to generate
     # Type : float, min = -6.29, max = 6.29
@@ -190,6 +191,7 @@ class ImportGenVectSin(ImportMatrix):
         """setter of N"""
         check_var("N", value, "int", Vmin=0)
         self._N = value
+        self._clear_memo()
 
     # Length of the vector to generate
     # Type : int, min = 0
@@ -203,6 +205,7 @@ class ImportGenVectSin(ImportMatrix):
         """setter of Tf"""
         check_var("Tf", value, "float", Vmin=0)
         self._Tf = value
+        self._clear_memo()
 
     # End time of the sinus generation
     # Type : float, min = 0
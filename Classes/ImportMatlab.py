@@ -4,18 +4,11 @@ WARNING! All changes made in this file will be lost!
 """
 
 from os import linesep
-from pyleecan.Classes._check import check_init_dict, check_var, raise_
+from pyleecan.Classes._check import check_init_dict, check_var
 from pyleecan.Functions.save import save
 from pyleecan.Classes.Import import Import
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from pyleecan.Methods.Import.ImportMatlab.get_data import get_data
-except ImportError as error:
-    get_data = error
-
-
+from pyleecan.Classes._lazy import LazyMethod
 from pyleecan.Classes._check import InitUnKnowClassError
 
 
@@ -25,14 +18,7 @@ class ImportMatlab(Import):
     VERSION = 1
 
     # cf Methods.Import.ImportMatlab.get_data
-    if isinstance(get_data, ImportError):
-        get_data = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use ImportMatlab method get_data: " + str(get_data))
-            )
-        )
-    else:
-        get_data = get_data
+    get_data = LazyMethod("pyleecan.Methods.Import.ImportMatlab.get_data")
     # save method is available in all object
     save = save
 
@@ -49,9 +35,9 @@ class ImportMatlab(Import):
         if init_dict is not None:  # Initialisation by dict
             check_init_dict(init_dict, ["file_path", "var_name"])
             # Overwrite default value with init_dict content
-            if "file_path" in list(init_dict.keys()):
+            if "file_path" in init_dict:
                 file_path = init_dict["file_path"]
-            if "var_name" in list(init_dict.keys()):
+            if "var_name" in init_dict:
                 var_name = init_dict["var_name"]
         # Initialisation by argument
         self.file_path = file_path
@@ -86,12 +72,15 @@ class ImportMatlab(Import):
             return False
         return True
 
-    def as_dict(self):
+    def as_dict(self, is_keep_array=False):
         """Convert this objet in a json seriable dict (can be use in __init__)
+        The ndarray are not converted to list if is_keep_array
         """
 
         # Get the properties inherited from Import
-        ImportMatlab_dict = super(ImportMatlab, self).as_dict()
+        ImportMatlab_dict = super(ImportMatlab, self).as_dict(
+            is_keep_array=is_keep_array
+        )
         ImportMatlab_dict["file_path"] = self.file_path
         ImportMatlab_dict["var_name"] = self.var_name
         # The class name is added to the dict fordeserialisation purpose
@@ -99,6 +88,14 @@ class ImportMatlab(Import):
         ImportMatlab_dict["__class__"] = "ImportMatlab"
         return ImportMatlab_dict
 
+    def _copy_to(self, obj):
+        """Copy the properties of this object in obj (called by copy)"""
+
+        # Copy the properties inherited from Import
+        super(ImportMatlab, self)._copy_to(obj)
+        obj._file_path = self._file_path
+        obj._var_name = self._var_name
+
     def _set_None(self):
         """Set all the properties to None (except pyleecan object)"""
 
@@ -115,6 +112,7 @@ class ImportMatlab(Import):
         """setter of file_path"""
         check_var("file_path", value, "str")
         self._file_path = value
+        self._clear_memo()
 
     # Path of the file to load
     # Type : str
@@ -130,6 +128,7 @@ class ImportMatlab(Import):
         """setter of var_name"""
         check_var("var_name", value, "str")
         self._var_name = value
+        self._clear_memo()
 
     # Name of the variable to load
     # Type : str
@@ -4,18 +4,11 @@ WARNING! All changes made in this file will be lost!
 """
 
 from os import linesep
-from pyleecan.Classes._check import check_init_dict, check_var, raise_
+from pyleecan.Classes._check import check_init_dict, check_var
 from pyleecan.Functions.save import save
 from pyleecan.Classes.Import import Import
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from pyleecan.Methods.Import.ImportMatrix.edit_matrix import edit_matrix
-except ImportError as error:
-    edit_matrix = error
-
-
+from pyleecan.Classes._lazy import LazyMethod
 from pyleecan.Classes._check import InitUnKnowClassError
 
 
@@ -25,16 +18,7 @@ class ImportMatrix(Import):
     VERSION = 1
 
     # cf Methods.Import.ImportMatrix.edit_matrix
-    if isinstance(edit_matrix, ImportError):
-        edit_matrix = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use ImportMatrix method edit_matrix: " + str(edit_matrix)
-                )
-            )
-        )
-    else:
-        edit_matrix = edit_matrix
+    edit_matrix = LazyMethod("pyleecan.Methods.Import.ImportMatrix.edit_matrix")
     # save method is available in all object
     save = save
 
@@ -51,7 +35,7 @@ class ImportMatrix(Import):
         if init_dict is not None:  # Initialisation by dict
             check_init_dict(init_dict, ["is_transpose"])
             # Overwrite default value with init_dict content
-            if "is_transpose" in list(init_dict.keys()):
+            if "is_transpose" in init_dict:
                 is_transpose = init_dict["is_transpose"]
         # Initialisation by argument
         self.is_transpose = is_transpose
@@ -82,18 +66,28 @@ class ImportMatrix(Import):
             return False
         return True
 
-    def as_dict(self):
+    def as_dict(self, is_keep_array=False):
         """Convert this objet in a json seriable dict (can be use in __init__)
+        The ndarray are not converted to list if is_keep_array
         """
 
         # Get the properties inherited from Import
-        ImportMatrix_dict = super(ImportMatrix, self).as_dict()
+        ImportMatrix_dict = super(ImportMatrix, self).as_dict(
+            is_keep_array=is_keep_array
+        )
         ImportMatrix_dict["is_transpose"] = self.is_transpose
         # The class name is added to the dict fordeserialisation purpose
         # Overwrite the mother class name
         ImportMatrix_dict["__class__"] = "ImportMatrix"
         return ImportMatrix_dict
 
+    def _copy_to(self, obj):
+        """Copy the properties of this object in obj (called by copy)"""
+
+        # Copy the properties inherited from Import
+        super(ImportMatrix, self)._copy_to(obj)
+        obj._is_transpose = self._is_transpose
+
     def _set_None(self):
         """Set all the properties to None (except pyleecan object)"""
 
@@ -109,6 +103,7 @@ class ImportMatrix(Import):
         """setter of is_transpose"""
         check_var("is_transpose", value, "bool")
         self._is_transpose = value
+        self._clear_memo()
 
     # 1 to transpose the Imported/Generated matrix
     # Type : bool
@@ -4,19 +4,12 @@ WARNING! All changes made in this file will be lost!
 """
 
 from os import linesep
-from pyleecan.Classes._check import set_array, check_init_dict, check_var, raise_
+from pyleecan.Classes._check import set_array, check_init_dict, check_var
 from pyleecan.Functions.save import save
 from pyleecan.Classes.ImportMatrix import ImportMatrix
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from pyleecan.Methods.Import.ImportMatrixVal.get_data import get_data
-except ImportError as error:
-    get_data = error
-
-
 from numpy import array, array_equal
+from pyleecan.Classes._lazy import LazyMethod
 from pyleecan.Classes._check import InitUnKnowClassError
 
 
@@ -26,16 +19,7 @@ class ImportMatrixVal(ImportMatrix):
     VERSION = 1
 
     # cf Methods.Import.ImportMatrixVal.get_data
-    if isinstance(get_data, ImportError):
-        get_data = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use ImportMatrixVal method get_data: " + str(get_data)
-                )
-            )
-        )
-    else:
-        get_data = get_data
+    get_data = LazyMethod("pyleecan.Methods.Import.ImportMatrixVal.get_data")
     # save method is available in all object
     save = save
 
@@ -52,9 +36,9 @@ class ImportMatrixVal(ImportMatrix):
         if init_dict is not None:  # Initialisation by dict
             check_init_dict(init_dict, ["value", "is_transpose"])
             # Overwrite default value with init_dict content
-            if "value" in list(init_dict.keys()):
+            if "value" in init_dict:
                 value = init_dict["value"]
-            if "is_transpose" in list(init_dict.keys()):
+            if "is_transpose" in init_dict:
                 is_transpose = init_dict["is_transpose"]
         # Initialisation by argument
         # value can be None, a ndarray or a list
@@ -86,14 +70,19 @@ class ImportMatrixVal(ImportMatrix):
             return False
         return True
 
-    def as_dict(self):
+    def as_dict(self, is_keep_array=False):
         """Convert this objet in a json seriable dict (can be use in __init__)
+        The ndarray are not converted to list if is_keep_array
         """
 
         # Get the properties inherited from ImportMatrix
-        ImportMatrixVal_dict = super(ImportMatrixVal, self).as_dict()
+        ImportMatrixVal_dict = super(ImportMatrixVal, self).as_dict(
+            is_keep_array=is_keep_array
+        )
         if self.value is None:
             ImportMatrixVal_dict["value"] = None
+        elif is_keep_array:
+            ImportMatrixVal_dict["value"] = self.value
         else:
             ImportMatrixVal_dict["value"] = self.value.tolist()
         # The class name is added to the dict fordeserialisation purpose
@@ -101,6 +90,16 @@ class ImportMatrixVal(ImportMatrix):
         ImportMatrixVal_dict["__class__"] = "ImportMatrixVal"
         return ImportMatrixVal_dict
 
+    def _copy_to(self, obj):
+        """Copy the properties of this object in obj (called by copy)"""
+
+        # Copy the properties inherited from ImportMatrix
+        super(ImportMatrixVal, self)._copy_to(obj)
+        if self._value is None:
+            obj._value = None
+        else:
+            obj._value = self._value.copy()
+
     def _set_None(self):
         """Set all the properties to None (except pyleecan object)"""
 
@@ -121,6 +120,7 @@ class ImportMatrixVal(ImportMatrix):
                 pass
         check_var("value", value, "ndarray")
         self._value = value
+        self._clear_memo()
 
     # The matrix to return
     # Type : ndarray
@@ -4,18 +4,11 @@ WARNING! All changes made in this file will be lost!
 """
 
 from os import linesep
-from pyleecan.Classes._check import check_init_dict, check_var, raise_
+from pyleecan.Classes._check import check_init_dict, check_var
 from pyleecan.Functions.save import save
 from pyleecan.Classes.ImportMatrix import ImportMatrix
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from pyleecan.Methods.Import.ImportMatrixXls.get_data import get_data
-except ImportError as error:
-    get_data = error
-
-
+from pyleecan.Classes._lazy import LazyMethod
 from pyleecan.Classes._check import InitUnKnowClassError
 
 
@@ -25,16 +18,7 @@ class ImportMatrixXls(ImportMatrix):
     VERSION = 1
 
     # cf Methods.Import.ImportMatrixXls.get_data
-    if isinstance(get_data, ImportError):
-        get_data = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use ImportMatrixXls method get_data: " + str(get_data)
-                )
-            )
-        )
-    else:
-        get_data = get_data
+    get_data = LazyMethod("pyleecan.Methods.Import.ImportMatrixXls.get_data")
     # save method is available in all object
     save = save
 
@@ -61,15 +45,15 @@ class ImportMatrixXls(ImportMatrix):
                 init_dict, ["file_path", "sheet", "skiprows", "usecols", "is_transpose"]
             )
             # Overwrite default value with init_dict content
-            if "file_path" in list(init_dict.keys()):
+            if "file_path" in init_dict:
                 file_path = init_dict["file_path"]
-            if "sheet" in list(init_dict.keys()):
+            if "sheet" in init_dict:
                 sheet = init_dict["sheet"]
-            if "skiprows" in list(init_dict.keys()):
+            if "skiprows" in init_dict:
                 skiprows = init_dict["skiprows"]
-            if "usecols" in list(init_dict.keys()):
+            if "usecols" in init_dict:
                 usecols = init_dict["usecols"]
-            if "is_transpose" in list(init_dict.keys()):
+            if "is_transpose" in init_dict:
                 is_transpose = init_dict["is_transpose"]
         # Initialisation by argument
         self.file_path = file_path
@@ -112,12 +96,15 @@ class ImportMatrixXls(ImportMatrix):
             return False
         return True
 
-    def as_dict(self):
+    def as_dict(self, is_keep_array=False):
         """Convert this objet in a json seriable dict (can be use in __init__)
+        The ndarray are not converted to list if is_keep_array
         """
 
         # Get the properties inherited from ImportMatrix
-        ImportMatrixXls_dict = super(ImportMatrixXls, self).as_dict()
+        ImportMatrixXls_dict = super(ImportMatrixXls, self).as_dict(
+            is_keep_array=is_keep_array
+        )
         ImportMatrixXls_dict["file_path"] = self.file_path
         ImportMatrixXls_dict["sheet"] = self.sheet
         ImportMatrixXls_dict["skiprows"] = self.skiprows
@@ -127,6 +114,16 @@ class ImportMatrixXls(ImportMatrix):
         ImportMatrixXls_dict["__class__"] = "ImportMatrixXls"
         return ImportMatrixXls_dict
 
+    def _copy_to(self, obj):
+        """Copy the properties of this object in obj (called by copy)"""
+
+        # Copy the properties inherited from ImportMatrix
+        super(ImportMatrixXls, self)._copy_to(obj)
+        obj._file_path = self._file_path
+        obj._sheet = self._sheet
+        obj._skiprows = self._skiprows
+        obj._usecols = self._usecols
+
     def _set_None(self):
         """Set all the properties to None (except pyleecan object)"""
 
@@ -145,6 +142,7 @@ class ImportMatrixXls(ImportMatrix):
         """setter of file_path"""
         check_var("file_path", value, "str")
         self._file_path = value
+        self._clear_memo()
 
     # Path of the file to load
     # Type : str
@@ -160,6 +158,7 @@ class ImportMatrixXls(ImportMatrix):
         """setter of sheet"""
         check_var("sheet", value, "str")
         self._sheet = value
+        self._clear_memo()
 
     # Name of the sheet to load
     # Type : str
@@ -175,6 +174,7 @@ class ImportMatrixXls(ImportMatrix):
         """setter of skiprows"""
         check_var("skiprows", value, "int", Vmin=0)
         self._skiprows = value
+        self._clear_memo()
 
     # To skip some rows in the file (header)
     # Type : int, min = 0
@@ -192,6 +192,7 @@ class ImportMatrixXls(ImportMatrix):
         """setter of usecols"""
         check_var("usecols", value, "str")
         self._usecols = value
+        self._clear_memo()
 
     # To select the range of column to use
     # Type : str
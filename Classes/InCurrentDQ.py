@@ -4,18 +4,11 @@ WARNING! All changes made in this file will be lost!
 """
 
 from os import linesep
-from pyleecan.Classes._check import check_init_dict, check_var, raise_
+from pyleecan.Classes._check import check_init_dict, check_var
 from pyleecan.Functions.save import save
 from pyleecan.Classes.Input import Input
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from pyleecan.Methods.Simulation.InCurrentDQ.gen_input import gen_input
-except ImportError as error:
-    gen_input = error
-
-
+from pyleecan.Classes._lazy import LazyInit, LazyMethod
 from pyleecan.Classes._check import InitUnKnowClassError
 from pyleecan.Classes.Import import Import
 
@@ -26,14 +19,7 @@ class InCurrentDQ(Input):
     VERSION = 1
 
     # cf Methods.Simulation.InCurrentDQ.gen_input
-    if isinstance(gen_input, ImportError):
-        gen_input = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use InCurrentDQ method gen_input: " + str(gen_input))
-            )
-        )
-    else:
-        gen_input = gen_input
+    gen_input = LazyMethod("pyleecan.Methods.Simulation.InCurrentDQ.gen_input")
     # save method is available in all object
     save = save
 
@@ -85,21 +71,21 @@ class InCurrentDQ(Input):
                 ],
             )
             # Overwrite default value with init_dict content
-            if "time" in list(init_dict.keys()):
+            if "time" in init_dict:
                 time = init_dict["time"]
-            if "angle" in list(init_dict.keys()):
+            if "angle" in init_dict:
                 angle = init_dict["angle"]
-            if "Is" in list(init_dict.keys()):
+            if "Is" in init_dict:
                 Is = init_dict["Is"]
-            if "Ir" in list(init_dict.keys()):
+            if "Ir" in init_dict:
                 Ir = init_dict["Ir"]
-            if "angle_rotor" in list(init_dict.keys()):
+            if "angle_rotor" in init_dict:
                 angle_rotor = init_dict["angle_rotor"]
-            if "Nr" in list(init_dict.keys()):
+            if "Nr" in init_dict:
                 Nr = init_dict["Nr"]
-            if "rot_dir" in list(init_dict.keys()):
+            if "rot_dir" in init_dict:
                 rot_dir = init_dict["rot_dir"]
-            if "angle_rotor_initial" in list(init_dict.keys()):
+            if "angle_rotor_initial" in init_dict:
                 angle_rotor_initial = init_dict["angle_rotor_initial"]
         # Initialisation by argument
         # time can be None, a Import object or a dict
@@ -312,36 +298,39 @@ class InCurrentDQ(Input):
             return False
         return True
 
-    def as_dict(self):
+    def as_dict(self, is_keep_array=False):
         """Convert this objet in a json seriable dict (can be use in __init__)
+        The ndarray are not converted to list if is_keep_array
         """
 
         # Get the properties inherited from Input
-        InCurrentDQ_dict = super(InCurrentDQ, self).as_dict()
+        InCurrentDQ_dict = super(InCurrentDQ, self).as_dict(is_keep_array=is_keep_array)
         if self.time is None:
             InCurrentDQ_dict["time"] = None
         else:
-            InCurrentDQ_dict["time"] = self.time.as_dict()
+            InCurrentDQ_dict["time"] = self.time.as_dict(is_keep_array=is_keep_array)
         if self.angle is None:
             InCurrentDQ_dict["angle"] = None
         else:
-            InCurrentDQ_dict["angle"] = self.angle.as_dict()
+            InCurrentDQ_dict["angle"] = self.angle.as_dict(is_keep_array=is_keep_array)
         if self.Is is None:
             InCurrentDQ_dict["Is"] = None
         else:
-            InCurrentDQ_dict["Is"] = self.Is.as_dict()
+            InCurrentDQ_dict["Is"] = self.Is.as_dict(is_keep_array=is_keep_array)
         if self.Ir is None:
             InCurrentDQ_dict["Ir"] = None
         else:
-            InCurrentDQ_dict["Ir"] = self.Ir.as_dict()
+            InCurrentDQ_dict["Ir"] = self.Ir.as_dict(is_keep_array=is_keep_array)
         if self.angle_rotor is None:
             InCurrentDQ_dict["angle_rotor"] = None
         else:
-            InCurrentDQ_dict["angle_rotor"] = self.angle_rotor.as_dict()
+            InCurrentDQ_dict["angle_rotor"] = self.angle_rotor.as_dict(
+                is_keep_array=is_keep_array
+            )
         if self.Nr is None:
             InCurrentDQ_dict["Nr"] = None
         else:
-            InCurrentDQ_dict["Nr"] = self.Nr.as_dict()
+            InCurrentDQ_dict["Nr"] = self.Nr.as_dict(is_keep_array=is_keep_array)
         InCurrentDQ_dict["rot_dir"] = self.rot_dir
         InCurrentDQ_dict["angle_rotor_initial"] = self.angle_rotor_initial
         # The class name is added to the dict fordeserialisation purpose
@@ -349,6 +338,44 @@ class InCurrentDQ(Input):
         InCurrentDQ_dict["__class__"] = "InCurrentDQ"
         return InCurrentDQ_dict
 
+    def _copy_to(self, obj):
+        """Copy the properties of this object in obj (called by copy)"""
+
+        # Copy the properties inherited from Input
+        super(InCurrentDQ, self)._copy_to(obj)
+        if self._time is None:
+            obj._time = None
+        else:
+            obj._time = self._time.copy()
+            obj._time.parent = obj
+        if self._angle is None:
+            obj._angle = None
+        else:
+            obj._angle = self._angle.copy()
+            obj._angle.parent = obj
+        if self._Is is None:
+            obj._Is = None
+        else:
+            obj._Is = self._Is.copy()
+            obj._Is.parent = obj
+        if self._Ir is None:
+            obj._Ir = None
+        else:
+            obj._Ir = self._Ir.copy()
+            obj._Ir.parent = obj
+        if self._angle_rotor is None:
+            obj._angle_rotor = None
+        else:
+            obj._angle_rotor = self._angle_rotor.copy()
+            obj._angle_rotor.parent = obj
+        if self._Nr is None:
+            obj._Nr = None
+        else:
+            obj._Nr = self._Nr.copy()
+            obj._Nr.parent = obj
+        obj._rot_dir = self._rot_dir
+        obj._angle_rotor_initial = self._angle_rotor_initial
+
     def _set_None(self):
         """Set all the properties to None (except pyleecan object)"""
 
@@ -371,12 +398,16 @@ class InCurrentDQ(Input):
 
     def _get_time(self):
         """getter of time"""
+        if isinstance(self._time, LazyInit):
+            # Create the object of a lazy load
+            self._set_time(self._time.resolve())
         return self._time
 
     def _set_time(self, value):
         """setter of time"""
         check_var("time", value, "Import")
         self._time = value
+        self._clear_memo()
 
         if self._time is not None:
             self._time.parent = self
@@ -391,12 +422,16 @@ class InCurrentDQ(Input):
 
     def _get_angle(self):
         """getter of angle"""
+        if isinstance(self._angle, LazyInit):
+            # Create the object of a lazy load
+            self._set_angle(self._angle.resolve())
         return self._angle
 
     def _set_angle(self, value):
         """setter of angle"""
         check_var("angle", value, "Import")
         self._angle = value
+        self._clear_memo()
 
         if self._angle is not None:
             self._angle.parent = self
@@ -411,12 +446,16 @@ class InCurrentDQ(Input):
 
     def _get_Is(self):
         """getter of Is"""
+        if isinstance(self._Is, LazyInit):
+            # Create the object of a lazy load
+            self._set_Is(self._Is.resolve())
         return self._Is
 
     def _set_Is(self, value):
         """setter of Is"""
         check_var("Is", value, "Import")
         self._Is = value
+        self._clear_memo()
 
         if self._Is is not None:
             self._Is.parent = self
@@ -431,12 +470,16 @@ class InCurrentDQ(Input):
 
     def _get_Ir(self):
         """getter of Ir"""
+        if isinstance(self._Ir, LazyInit):
+            # Create the object of a lazy load
+            self._set_Ir(self._Ir.resolve())
         return self._Ir
 
     def _set_Ir(self, value):
         """setter of Ir"""
         check_var("Ir", value, "Import")
         self._Ir = value
+        self._clear_memo()
 
         if self._Ir is not None:
             self._Ir.parent = self
@@ -451,12 +494,16 @@ class InCurrentDQ(Input):
 
     def _get_angle_rotor(self):
         """getter of angle_rotor"""
+        if isinstance(self._angle_rotor, LazyInit):
+            # Create the object of a lazy load
+            self._set_angle_rotor(self._angle_rotor.resolve())
         return self._angle_rotor
 
     def _set_angle_rotor(self, value):
         """setter of angle_rotor"""
         check_var("angle_rotor", value, "Import")
         self._angle_rotor = value
+        self._clear_memo()
 
         if self._angle_rotor is not None:
             self._angle_rotor.parent = self
@@ -471,12 +518,16 @@ class InCurrentDQ(Input):
 
     def _get_Nr(self):
         """getter of Nr"""
+        if isinstance(self._Nr, LazyInit):
+            # Create the object of a lazy load
+            self._set_Nr(self._Nr.resolve())
         return self._Nr
 
     def _set_Nr(self, value):
         """setter of Nr"""
         check_var("Nr", value, "Import")
         self._Nr = value
+        self._clear_memo()
 
         if self._Nr is not None:
             self._Nr.parent = self
@@ -497,6 +548,7 @@ class InCurrentDQ(Input):
         """setter of rot_dir"""
         check_var("rot_dir", value, "float", Vmin=-1, Vmax=1)
         self._rot_dir = value
+        self._clear_memo()
 
     # Rotation direction of the rotor 1 trigo, -1 clockwise
     # Type : float, min = -1, max = 1
@@ -514,6 +566,7 @@ class InCurrentDQ(Input):
         """setter of angle_rotor_initial"""
         check_var("angle_rotor_initial", value, "float")
         self._angle_rotor_initial = value
+        self._clear_memo()
 
     # Initial angular position of the rotor at t=0
     # Type : float
@@ -4,18 +4,11 @@ WARNING! All changes made in this file will be lost!
 """
 
 from os import linesep
-from pyleecan.Classes._check import check_init_dict, check_var, raise_
+from pyleecan.Classes._check import check_init_dict, check_var
 from pyleecan.Functions.save import save
 from pyleecan.Classes.Input import Input
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from pyleecan.Methods.Simulation.InFlux.gen_input import gen_input
-except ImportError as error:
-    gen_input = error
-
-
+from pyleecan.Classes._lazy import LazyInit, LazyMethod
 from pyleecan.Classes._check import InitUnKnowClassError
 from pyleecan.Classes.Import import Import
 
@@ -26,14 +19,7 @@ class InFlux(Input):
     VERSION = 1
 
     # cf Methods.Simulation.InFlux.gen_input
-    if isinstance(gen_input, ImportError):
-        gen_input = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use InFlux method gen_input: " + str(gen_input))
-            )
-        )
-    else:
-        gen_input = gen_input
+    gen_input = LazyMethod("pyleecan.Methods.Simulation.InFlux.gen_input")
     # save method is available in all object
     save = save
 
@@ -58,13 +44,13 @@ class InFlux(Input):
         if init_dict is not None:  # Initialisation by dict
             check_init_dict(init_dict, ["time", "angle", "Br", "Bt"])
             # Overwrite default value with init_dict content
-            if "time" in list(init_dict.keys()):
+            if "time" in init_dict:
                 time = init_dict["time"]
-            if "angle" in list(init_dict.keys()):
+            if "angle" in init_dict:
                 angle = init_dict["angle"]
-            if "Br" in list(init_dict.keys()):
+            if "Br" in init_dict:
                 Br = init_dict["Br"]
-            if "Bt" in list(init_dict.keys()):
+            if "Bt" in init_dict:
                 Bt = init_dict["Bt"]
         # Initialisation by argument
         # time can be None, a Import object or a dict
@@ -207,33 +193,60 @@ class InFlux(Input):
             return False
         return True
 
-    def as_dict(self):
+    def as_dict(self, is_keep_array=False):
         """Convert this objet in a json seriable dict (can be use in __init__)
+        The ndarray are not converted to list if is_keep_array
         """
 
         # Get the properties inherited from Input
-        InFlux_dict = super(InFlux, self).as_dict()
+        InFlux_dict = super(InFlux, self).as_dict(is_keep_array=is_keep_array)
         if self.time is None:
             InFlux_dict["time"] = None
         else:
-            InFlux_dict["time"] = self.time.as_dict()
+            InFlux_dict["time"] = self.time.as_dict(is_keep_array=is_keep_array)
         if self.angle is None:
             InFlux_dict["angle"] = None
         else:
-            InFlux_dict["angle"] = self.angle.as_dict()
+            InFlux_dict["angle"] = self.angle.as_dict(is_keep_array=is_keep_array)
         if self.Br is None:
             InFlux_dict["Br"] = None
         else:
-            InFlux_dict["Br"] = self.Br.as_dict()
+            InFlux_dict["Br"] = self.Br.as_dict(is_keep_array=is_keep_array)
         if self.Bt is None:
             InFlux_dict["Bt"] = None
         else:
-            InFlux_dict["Bt"] = self.Bt.as_dict()
+            InFlux_dict["Bt"] = self.Bt.as_dict(is_keep_array=is_keep_array)
         # The class name is added to the dict fordeserialisation purpose
         # Overwrite the mother class name
         InFlux_dict["__class__"] = "InFlux"
         return InFlux_dict
 
+    def _copy_to(self, obj):
+        """Copy the properties of this object in obj (called by copy)"""
+
+        # Copy the properties inherited from Input
+        super(InFlux, self)._copy_to(obj)
+        if self._time is None:
+            obj._time = None
+        else:
+            obj._time = self._time.copy()
+            obj._time.parent = obj
+        if self._angle is None:
+            obj._angle = None
+        else:
+            obj._angle = self._angle.copy()
+            obj._angle.parent = obj
+        if self._Br is None:
+            obj._Br = None
+        else:
+            obj._Br = self._Br.copy()
+            obj._Br.parent = obj
+        if self._Bt is None:
+            obj._Bt = None
+        else:
+            obj._Bt = self._Bt.copy()
+            obj._Bt.parent = obj
+
     def _set_None(self):
         """Set all the properties to None (except pyleecan object)"""
 
@@ -250,12 +263,16 @@ class InFlux(Input):
 
     def _get_time(self):
         """getter of time"""
+        if isinstance(self._time, LazyInit):
+            # Create the object of a lazy load
+            self._set_time(self._time.resolve())
         return self._time
 
     def _set_time(self, value):
         """setter of time"""
         check_var("time", value, "Import")
         self._time = value
+        self._clear_memo()
 
         if self._time is not None:
             self._time.parent = self
@@ -270,12 +287,16 @@ class InFlux(Input):
 
     def _get_angle(self):
         """getter of angle"""
+        if isinstance(self._angle, LazyInit):
+            # Create the object of a lazy load
+            self._set_angle(self._angle.resolve())
         return self._angle
 
     def _set_angle(self, value):
         """setter of angle"""
         check_var("angle", value, "Import")
         self._angle = value
+        self._clear_memo()
 
         if self._angle is not None:
             self._angle.parent = self
@@ -290,12 +311,16 @@ class InFlux(Input):
 
     def _get_Br(self):
         """getter of Br"""
+        if isinstance(self._Br, LazyInit):
+            # Create the object of a lazy load
+            self._set_Br(self._Br.resolve())
         return self._Br
 
     def _set_Br(self, value):
         """setter of Br"""
         check_var("Br", value, "Import")
         self._Br = value
+        self._clear_memo()
 
         if self._Br is not None:
             self._Br.parent = self
@@ -306,12 +331,16 @@ class InFlux(Input):
 
     def _get_Bt(self):
         """getter of Bt"""
+        if isinstance(self._Bt, LazyInit):
+            # Create the object of a lazy load
+            self._set_Bt(self._Bt.resolve())
         return self._Bt
 
     def _set_Bt(self, value):
         """setter of Bt"""
         check_var("Bt", value, "Import")
         self._Bt = value
+        self._clear_memo()
 
         if self._Bt is not None:
             self._Bt.parent = self
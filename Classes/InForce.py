@@ -4,18 +4,11 @@ WARNING! All changes made in this file will be lost!
 """
 
 from os import linesep
-from pyleecan.Classes._check import check_init_dict, check_var, raise_
+from pyleecan.Classes._check import check_init_dict, check_var
 from pyleecan.Functions.save import save
 from pyleecan.Classes.Input import Input
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from pyleecan.Methods.Simulation.InForce.gen_input import gen_input
-except ImportError as error:
-    gen_input = error
-
-
+from pyleecan.Classes._lazy import LazyInit, LazyMethod
 from pyleecan.Classes._check import InitUnKnowClassError
 from pyleecan.Classes.Import import Import
 
@@ -26,14 +19,7 @@ class InForce(Input):
     VERSION = 1
 
     # cf Methods.Simulation.InForce.gen_input
-    if isinstance(gen_input, ImportError):
-        gen_input = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use InForce method gen_input: " + str(gen_input))
-            )
-        )
-    else:
-        gen_input = gen_input
+    gen_input = LazyMethod("pyleecan.Methods.Simulation.InForce.gen_input")
     # save method is available in all object
     save = save
 
@@ -58,13 +44,13 @@ class InForce(Input):
         if init_dict is not None:  # Initialisation by dict
             check_init_dict(init_dict, ["time", "angle", "Prad", "Ptan"])
             # Overwrite default value with init_dict content
-            if "time" in list(init_dict.keys()):
+            if "time" in init_dict:
                 time = init_dict["time"]
-            if "angle" in list(init_dict.keys()):
+            if "angle" in init_dict:
                 angle = init_dict["angle"]
-            if "Prad" in list(init_dict.keys()):
+            if "Prad" in init_dict:
                 Prad = init_dict["Prad"]
-            if "Ptan" in list(init_dict.keys()):
+            if "Ptan" in init_dict:
                 Ptan = init_dict["Ptan"]
         # Initialisation by argument
         # time can be None, a Import object or a dict
@@ -207,33 +193,60 @@ class InForce(Input):
             return False
         return True
 
-    def as_dict(self):
+    def as_dict(self, is_keep_array=False):
         """Convert this objet in a json seriable dict (can be use in __init__)
+        The ndarray are not converted to list if is_keep_array
         """
 
         # Get the properties inherited from Input
-        InForce_dict = super(InForce, self).as_dict()
+        InForce_dict = super(InForce, self).as_dict(is_keep_array=is_keep_array)
         if self.time is None:
             InForce_dict["time"] = None
         else:
-            InForce_dict["time"] = self.time.as_dict()
+            InForce_dict["time"] = self.time.as_dict(is_keep_array=is_keep_array)
         if self.angle is None:
             InForce_dict["angle"] = None
         else:
-            InForce_dict["angle"] = self.angle.as_dict()
+            InForce_dict["angle"] = self.angle.as_dict(is_keep_array=is_keep_array)
         if self.Prad is None:
             InForce_dict["Prad"] = None
         else:
-            InForce_dict["Prad"] = self.Prad.as_dict()
+            InForce_dict["Prad"] = self.Prad.as_dict(is_keep_array=is_keep_array)
         if self.Ptan is None:
             InForce_dict["Ptan"] = None
         else:
-            InForce_dict["Ptan"] = self.Ptan.as_dict()
+            InForce_dict["Ptan"] = self.Ptan.as_dict(is_keep_array=is_keep_array)
         # The class name is added to the dict fordeserialisation purpose
         # Overwrite the mother class name
         InForce_dict["__class__"] = "InForce"
         return InForce_dict
 
+    def _copy_to(self, obj):
+        """Copy the properties of this object in obj (called by copy)"""
+
+        # Copy the properties inherited from Input
+        super(InForce, self)._copy_to(obj)
+        if self._time is None:
+            obj._time = None
+        else:
+            obj._time = self._time.copy()
+            obj._time.parent = obj
+        if self._angle is None:
+            obj._angle = None
+        else:
+            obj._angle = self._angle.copy()
+            obj._angle.parent = obj
+        if self._Prad is None:
+            obj._Prad = None
+        else:
+            obj._Prad = self._Prad.copy()
+            obj._Prad.parent = obj
+        if self._Ptan is None:
+            obj._Ptan = None
+        else:
+            obj._Ptan = self._Ptan.copy()
+            obj._Ptan.parent = obj
+
     def _set_None(self):
         """Set all the properties to None (except pyleecan object)"""
 
@@ -250,12 +263,16 @@ class InForce(Input):
 
     def _get_time(self):
         """getter of time"""
+        if isinstance(self._time, LazyInit):
+            # Create the object of a lazy load
+            self._set_time(self._time.resolve())
         return self._time
 
     def _set_time(self, value):
         """setter of time"""
         check_var("time", value, "Import")
         self._time = value
+        self._clear_memo()
 
         if self._time is not None:
             self._time.parent = self
@@ -270,12 +287,16 @@ class InForce(Input):
 
     def _get_angle(self):
         """getter of angle"""
+        if isinstance(self._angle, LazyInit):
+            # Create the object of a lazy load
+            self._set_angle(self._angle.resolve())
         return self._angle
 
     def _set_angle(self, value):
         """setter of angle"""
         check_var("angle", value, "Import")
         self._angle = value
+        self._clear_memo()
 
         if self._angle is not None:
             self._angle.parent = self
@@ -290,12 +311,16 @@ class InForce(Input):
 
     def _get_Prad(self):
         """getter of Prad"""
+        if isinstance(self._Prad, LazyInit):
+            # Create the object of a lazy load
+            self._set_Prad(self._Prad.resolve())
         return self._Prad
 
     def _set_Prad(self, value):
         """setter of Prad"""
         check_var("Prad", value, "Import")
         self._Prad = value
+        self._clear_memo()
 
         if self._Prad is not None:
             self._Prad.parent = self
@@ -308,12 +333,16 @@ class InForce(Input):
 
     def _get_Ptan(self):
         """getter of Ptan"""
+        if isinstance(self._Ptan, LazyInit):
+            # Create the object of a lazy load
+            self._set_Ptan(self._Ptan.resolve())
         return self._Ptan
 
     def _set_Ptan(self, value):
         """setter of Ptan"""
         check_var("Ptan", value, "Import")
         self._Ptan = value
+        self._clear_memo()
 
         if self._Ptan is not None:
             self._Ptan.parent = self
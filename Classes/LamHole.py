@@ -4,57 +4,11 @@ WARNING! All changes made in this file will be lost!
 """
 
 from os import linesep
-from pyleecan.Classes._check import check_init_dict, check_var, raise_
+from pyleecan.Classes._check import check_init_dict, check_var
 from pyleecan.Functions.save import save
 from pyleecan.Classes.Lamination import Lamination
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from pyleecan.Methods.Machine.LamHole.build_geometry import build_geometry
-except ImportError as error:
-    build_geometry = error
-
-try:
-    from pyleecan.Methods.Machine.LamHole.comp_height_yoke import comp_height_yoke
-except ImportError as error:
-    comp_height_yoke = error
-
-try:
-    from pyleecan.Methods.Machine.LamHole.comp_masses import comp_masses
-except ImportError as error:
-    comp_masses = error
-
-try:
-    from pyleecan.Methods.Machine.LamHole.comp_surfaces import comp_surfaces
-except ImportError as error:
-    comp_surfaces = error
-
-try:
-    from pyleecan.Methods.Machine.LamHole.comp_volumes import comp_volumes
-except ImportError as error:
-    comp_volumes = error
-
-try:
-    from pyleecan.Methods.Machine.LamHole.get_pole_pair_number import (
-        get_pole_pair_number,
-    )
-except ImportError as error:
-    get_pole_pair_number = error
-
-try:
-    from pyleecan.Methods.Machine.LamHole.plot import plot
-except ImportError as error:
-    plot = error
-
-try:
-    from pyleecan.Methods.Machine.LamHole.comp_radius_mid_yoke import (
-        comp_radius_mid_yoke,
-    )
-except ImportError as error:
-    comp_radius_mid_yoke = error
-
-
+from pyleecan.Classes._lazy import LazyInit, LazyMethod
 from pyleecan.Classes._check import InitUnKnowClassError
 from pyleecan.Classes.Hole import Hole
 from pyleecan.Classes.Bore import Bore
@@ -67,94 +21,28 @@ class LamHole(Lamination):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
     # cf Methods.Machine.LamHole.build_geometry
-    if isinstance(build_geometry, ImportError):
-        build_geometry = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use LamHole method build_geometry: " + str(build_geometry)
-                )
-            )
-        )
-    else:
-        build_geometry = build_geometry
+    build_geometry = LazyMethod("pyleecan.Methods.Machine.LamHole.build_geometry")
     # cf Methods.Machine.LamHole.comp_height_yoke
-    if isinstance(comp_height_yoke, ImportError):
-        comp_height_yoke = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use LamHole method comp_height_yoke: "
-                    + str(comp_height_yoke)
-                )
-            )
-        )
-    else:
-        comp_height_yoke = comp_height_yoke
+    comp_height_yoke = LazyMethod("pyleecan.Methods.Machine.LamHole.comp_height_yoke")
     # cf Methods.Machine.LamHole.comp_masses
-    if isinstance(comp_masses, ImportError):
-        comp_masses = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use LamHole method comp_masses: " + str(comp_masses))
-            )
-        )
-    else:
-        comp_masses = comp_masses
+    comp_masses = LazyMethod("pyleecan.Methods.Machine.LamHole.comp_masses")
     # cf Methods.Machine.LamHole.comp_surfaces
-    if isinstance(comp_surfaces, ImportError):
-        comp_surfaces = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use LamHole method comp_surfaces: " + str(comp_surfaces)
-                )
-            )
-        )
-    else:
-        comp_surfaces = comp_surfaces
+    comp_surfaces = LazyMethod("pyleecan.Methods.Machine.LamHole.comp_surfaces")
     # cf Methods.Machine.LamHole.comp_volumes
-    if isinstance(comp_volumes, ImportError):
-        comp_volumes = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use LamHole method comp_volumes: " + str(comp_volumes)
-                )
-            )
-        )
-    else:
-        comp_volumes = comp_volumes
+    comp_volumes = LazyMethod("pyleecan.Methods.Machine.LamHole.comp_volumes")
     # cf Methods.Machine.LamHole.get_pole_pair_number
-    if isinstance(get_pole_pair_number, ImportError):
-        get_pole_pair_number = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use LamHole method get_pole_pair_number: "
-                    + str(get_pole_pair_number)
-                )
-            )
-        )
-    else:
-        get_pole_pair_number = get_pole_pair_number
+    get_pole_pair_number = LazyMethod(
+        "pyleecan.Methods.Machine.LamHole.get_pole_pair_number"
+    )
     # cf Methods.Machine.LamHole.plot
-    if isinstance(plot, ImportError):
-        plot = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use LamHole method plot: " + str(plot))
-            )
-        )
-    else:
-        plot = plot
+    plot = LazyMethod("pyleecan.Methods.Machine.LamHole.plot")
     # cf Methods.Machine.LamHole.comp_radius_mid_yoke
-    if isinstance(comp_radius_mid_yoke, ImportError):
-        comp_radius_mid_yoke = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use LamHole method comp_radius_mid_yoke: "
-                    + str(comp_radius_mid_yoke)
-                )
-            )
-        )
-    else:
-        comp_radius_mid_yoke = comp_radius_mid_yoke
+    comp_radius_mid_yoke = LazyMethod(
+        "pyleecan.Methods.Machine.LamHole.comp_radius_mid_yoke"
+    )
+    # cf Methods.Machine.LamHole.comp_periodicity
+    comp_periodicity = LazyMethod("pyleecan.Methods.Machine.LamHole.comp_periodicity")
     # save method is available in all object
     save = save
 
@@ -208,31 +96,31 @@ class LamHole(Lamination):
                 ],
             )
             # Overwrite default value with init_dict content
-            if "hole" in list(init_dict.keys()):
+            if "hole" in init_dict:
                 hole = init_dict["hole"]
-            if "bore" in list(init_dict.keys()):
+            if "bore" in init_dict:
                 bore = init_dict["bore"]
-            if "L1" in list(init_dict.keys()):
+            if "L1" in init_dict:
                 L1 = init_dict["L1"]
-            if "mat_type" in list(init_dict.keys()):
+            if "mat_type" in init_dict:
                 mat_type = init_dict["mat_type"]
-            if "Nrvd" in list(init_dict.keys()):
+            if "Nrvd" in init_dict:
                 Nrvd = init_dict["Nrvd"]
-            if "Wrvd" in list(init_dict.keys()):
+            if "Wrvd" in init_dict:
                 Wrvd = init_dict["Wrvd"]
-            if "Kf1" in list(init_dict.keys()):
+            if "Kf1" in init_dict:
                 Kf1 = init_dict["Kf1"]
-            if "is_internal" in list(init_dict.keys()):
+            if "is_internal" in init_dict:
                 is_internal = init_dict["is_internal"]
-            if "Rint" in list(init_dict.keys()):
+            if "Rint" in init_dict:
                 Rint = init_dict["Rint"]
-            if "Rext" in list(init_dict.keys()):
+            if "Rext" in init_dict:
                 Rext = init_dict["Rext"]
-            if "is_stator" in list(init_dict.keys()):
+            if "is_stator" in init_dict:
                 is_stator = init_dict["is_stator"]
-            if "axial_vent" in list(init_dict.keys()):
+            if "axial_vent" in init_dict:
                 axial_vent = init_dict["axial_vent"]
-            if "notch" in list(init_dict.keys()):
+            if "notch" in init_dict:
                 notch = init_dict["notch"]
         # Initialisation by argument
         # hole can be None or a list of Hole object
@@ -240,7 +128,7 @@ class LamHole(Lamination):
         if type(hole) is list:
             for obj in hole:
                 if obj is None:  # Default value
-                    self.hole.append(Hole())
+                    self._hole.append(Hole())
                 elif isinstance(obj, dict):
                     # Check that the type is correct (including daughter)
                     class_name = obj.get("__class__")
@@ -264,9 +152,9 @@ class LamHole(Lamination):
                         "pyleecan.Classes." + class_name, fromlist=[class_name]
                     )
                     class_obj = getattr(module, class_name)
-                    self.hole.append(class_obj(init_dict=obj))
+                    self._hole.append(class_obj(init_dict=obj))
                 else:
-                    self.hole.append(obj)
+                    self._hole.append(obj)
         elif hole is None:
             self.hole = list()
         else:
@@ -341,24 +229,42 @@ class LamHole(Lamination):
             return False
         return True
 
-    def as_dict(self):
+    def as_dict(self, is_keep_array=False):
         """Convert this objet in a json seriable dict (can be use in __init__)
+        The ndarray are not converted to list if is_keep_array
         """
 
         # Get the properties inherited from Lamination
-        LamHole_dict = super(LamHole, self).as_dict()
+        LamHole_dict = super(LamHole, self).as_dict(is_keep_array=is_keep_array)
         LamHole_dict["hole"] = list()
         for obj in self.hole:
-            LamHole_dict["hole"].append(obj.as_dict())
+            LamHole_dict["hole"].append(obj.as_dict(is_keep_array=is_keep_array))
         if self.bore is None:
             LamHole_dict["bore"] = None
         else:
-            LamHole_dict["bore"] = self.bore.as_dict()
+            LamHole_dict["bore"] = self.bore.as_dict(is_keep_array=is_keep_array)
         # The class name is added to the dict fordeserialisation purpose
         # Overwrite the mother class name
         LamHole_dict["__class__"] = "LamHole"
         return LamHole_dict
 
+    def _copy_to(self, obj):
+        """Copy the properties of this object in obj (called by copy)"""
+
+        # Copy the properties inherited from Lamination
+        super(LamHole, self)._copy_to(obj)
+        obj._hole = list()
+        for value in self._hole:
+            if value is not None:
+                value = value.copy()
+                value.parent = obj
+            obj._hole.append(value)
+        if self._bore is None:
+            obj._bore = None
+        else:
+            obj._bore = self._bore.copy()
+            obj._bore.parent = obj
+
     def _set_None(self):
         """Set all the properties to None (except pyleecan object)"""
 
@@ -371,7 +277,11 @@ class LamHole(Lamination):
 
     def _get_hole(self):
         """getter of hole"""
-        for obj in self._hole:
+        for ii, obj in enumerate(self._hole):
+            if isinstance(obj, LazyInit):
+                # Create the object of a lazy load
+                obj = obj.resolve()
+                self._hole[ii] = obj
             if obj is not None:
                 obj.parent = self
         return self._hole
@@ -380,6 +290,7 @@ class LamHole(Lamination):
         """setter of hole"""
         check_var("hole", value, "[Hole]")
         self._hole = value
+        self._clear_memo()
 
         for obj in self._hole:
             if obj is not None:
@@ -391,12 +302,16 @@ class LamHole(Lamination):
 
     def _get_bore(self):
         """getter of bore"""
+        if isinstance(self._bore, LazyInit):
+            # Create the object of a lazy load
+            self._set_bore(self._bore.resolve())
         return self._bore
 
     def _set_bore(self, value):
         """setter of bore"""
         check_var("bore", value, "Bore")
         self._bore = value
+        self._clear_memo()
 
         if self._bore is not None:
             self._bore.parent = self
@@ -4,55 +4,11 @@ WARNING! All changes made in this file will be lost!
 """
 
 from os import linesep
-from pyleecan.Classes._check import check_init_dict, check_var, raise_
+from pyleecan.Classes._check import check_init_dict, check_var
 from pyleecan.Functions.save import save
 from pyleecan.Classes.Lamination import Lamination
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from pyleecan.Methods.Machine.LamSlot.build_geometry import build_geometry
-except ImportError as error:
-    build_geometry = error
-
-try:
-    from pyleecan.Methods.Machine.LamSlot.check import check
-except ImportError as error:
-    check = error
-
-try:
-    from pyleecan.Methods.Machine.LamSlot.comp_radius_mec import comp_radius_mec
-except ImportError as error:
-    comp_radius_mec = error
-
-try:
-    from pyleecan.Methods.Machine.LamSlot.comp_surfaces import comp_surfaces
-except ImportError as error:
-    comp_surfaces = error
-
-try:
-    from pyleecan.Methods.Machine.LamSlot.get_pole_pair_number import (
-        get_pole_pair_number,
-    )
-except ImportError as error:
-    get_pole_pair_number = error
-
-try:
-    from pyleecan.Methods.Machine.LamSlot.plot import plot
-except ImportError as error:
-    plot = error
-
-try:
-    from pyleecan.Methods.Machine.LamSlot.comp_height_yoke import comp_height_yoke
-except ImportError as error:
-    comp_height_yoke = error
-
-try:
-    from pyleecan.Methods.Machine.LamSlot.get_Zs import get_Zs
-except ImportError as error:
-    get_Zs = error
-
-
+from pyleecan.Classes._lazy import LazyInit, LazyMethod
 from pyleecan.Classes._check import InitUnKnowClassError
 from pyleecan.Classes.Slot import Slot
 from pyleecan.Classes.Material import Material
@@ -65,91 +21,26 @@ class LamSlot(Lamination):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
     # cf Methods.Machine.LamSlot.build_geometry
-    if isinstance(build_geometry, ImportError):
-        build_geometry = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use LamSlot method build_geometry: " + str(build_geometry)
-                )
-            )
-        )
-    else:
-        build_geometry = build_geometry
+    build_geometry = LazyMethod("pyleecan.Methods.Machine.LamSlot.build_geometry")
     # cf Methods.Machine.LamSlot.check
-    if isinstance(check, ImportError):
-        check = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use LamSlot method check: " + str(check))
-            )
-        )
-    else:
-        check = check
+    check = LazyMethod("pyleecan.Methods.Machine.LamSlot.check")
     # cf Methods.Machine.LamSlot.comp_radius_mec
-    if isinstance(comp_radius_mec, ImportError):
-        comp_radius_mec = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use LamSlot method comp_radius_mec: " + str(comp_radius_mec)
-                )
-            )
-        )
-    else:
-        comp_radius_mec = comp_radius_mec
+    comp_radius_mec = LazyMethod("pyleecan.Methods.Machine.LamSlot.comp_radius_mec")
     # cf Methods.Machine.LamSlot.comp_surfaces
-    if isinstance(comp_surfaces, ImportError):
-        comp_surfaces = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use LamSlot method comp_surfaces: " + str(comp_surfaces)
-                )
-            )
-        )
-    else:
-        comp_surfaces = comp_surfaces
+    comp_surfaces = LazyMethod("pyleecan.Methods.Machine.LamSlot.comp_surfaces")
     # cf Methods.Machine.LamSlot.get_pole_pair_number
-    if isinstance(get_pole_pair_number, ImportError):
-        get_pole_pair_number = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use LamSlot method get_pole_pair_number: "
-                    + str(get_pole_pair_number)
-                )
-            )
-        )
-    else:
-        get_pole_pair_number = get_pole_pair_number
+    get_pole_pair_number = LazyMethod(
+        "pyleecan.Methods.Machine.LamSlot.get_pole_pair_number"
+    )
     # cf Methods.Machine.LamSlot.plot
-    if isinstance(plot, ImportError):
-        plot = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use LamSlot method plot: " + str(plot))
-            )
-        )
-    else:
-        plot = plot
+    plot = LazyMethod("pyleecan.Methods.Machine.LamSlot.plot")
     # cf Methods.Machine.LamSlot.comp_height_yoke
-    if isinstance(comp_height_yoke, ImportError):
-        comp_height_yoke = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use LamSlot method comp_height_yoke: "
-                    + str(comp_height_yoke)
-                )
-            )
-        )
-    else:
-        comp_height_yoke = comp_height_yoke
+    comp_height_yoke = LazyMethod("pyleecan.Methods.Machine.LamSlot.comp_height_yoke")
     # cf Methods.Machine.LamSlot.get_Zs
-    if isinstance(get_Zs, ImportError):
-        get_Zs = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use LamSlot method get_Zs: " + str(get_Zs))
-            )
-        )
-    else:
-        get_Zs = get_Zs
+    get_Zs = LazyMethod("pyleecan.Methods.Machine.LamSlot.get_Zs")
+    # cf Methods.Machine.LamSlot.comp_periodicity
+    comp_periodicity = LazyMethod("pyleecan.Methods.Machine.LamSlot.comp_periodicity")
     # save method is available in all object
     save = save
 
@@ -201,29 +92,29 @@ class LamSlot(Lamination):
                 ],
             )
             # Overwrite default value with init_dict content
-            if "slot" in list(init_dict.keys()):
+            if "slot" in init_dict:
                 slot = init_dict["slot"]
-            if "L1" in list(init_dict.keys()):
+            if "L1" in init_dict:
                 L1 = init_dict["L1"]
-            if "mat_type" in list(init_dict.keys()):
+            if "mat_type" in init_dict:
                 mat_type = init_dict["mat_type"]
-            if "Nrvd" in list(init_dict.keys()):
+            if "Nrvd" in init_dict:
                 Nrvd = init_dict["Nrvd"]
-            if "Wrvd" in list(init_dict.keys()):
+            if "Wrvd" in init_dict:
                 Wrvd = init_dict["Wrvd"]
-            if "Kf1" in list(init_dict.keys()):
+            if "Kf1" in init_dict:
                 Kf1 = init_dict["Kf1"]
-            if "is_internal" in list(init_dict.keys()):
+            if "is_internal" in init_dict:
                 is_internal = init_dict["is_internal"]
-            if "Rint" in list(init_dict.keys()):
+            if "Rint" in init_dict:
                 Rint = init_dict["Rint"]
-            if "Rext" in list(init_dict.keys()):
+            if "Rext" in init_dict:
                 Rext = init_dict["Rext"]
-            if "is_stator" in list(init_dict.keys()):
+            if "is_stator" in init_dict:
                 is_stator = init_dict["is_stator"]
-            if "axial_vent" in list(init_dict.keys()):
+            if "axial_vent" in init_dict:
                 axial_vent = init_dict["axial_vent"]
-            if "notch" in list(init_dict.keys()):
+            if "notch" in init_dict:
                 notch = init_dict["notch"]
         # Initialisation by argument
         # slot can be None, a Slot object or a dict
@@ -308,21 +199,33 @@ class LamSlot(Lamination):
             return False
         return True
 
-    def as_dict(self):
+    def as_dict(self, is_keep_array=False):
         """Convert this objet in a json seriable dict (can be use in __init__)
+        The ndarray are not converted to list if is_keep_array
         """
 
         # Get the properties inherited from Lamination
-        LamSlot_dict = super(LamSlot, self).as_dict()
+        LamSlot_dict = super(LamSlot, self).as_dict(is_keep_array=is_keep_array)
         if self.slot is None:
             LamSlot_dict["slot"] = None
         else:
-            LamSlot_dict["slot"] = self.slot.as_dict()
+            LamSlot_dict["slot"] = self.slot.as_dict(is_keep_array=is_keep_array)
         # The class name is added to the dict fordeserialisation purpose
         # Overwrite the mother class name
         LamSlot_dict["__class__"] = "LamSlot"
         return LamSlot_dict
 
+    def _copy_to(self, obj):
+        """Copy the properties of this object in obj (called by copy)"""
+
+        # Copy the properties inherited from Lamination
+        super(LamSlot, self)._copy_to(obj)
+        if self._slot is None:
+            obj._slot = None
+        else:
+            obj._slot = self._slot.copy()
+            obj._slot.parent = obj
+
     def _set_None(self):
         """Set all the properties to None (except pyleecan object)"""
 
@@ -333,12 +236,16 @@ class LamSlot(Lamination):
 
     def _get_slot(self):
         """getter of slot"""
+        if isinstance(self._slot, LazyInit):
+            # Create the object of a lazy load
+            self._set_slot(self._slot.resolve())
         return self._slot
 
     def _set_slot(self, value):
         """setter of slot"""
         check_var("slot", value, "Slot")
         self._slot = value
+        self._clear_memo()
 
         if self._slot is not None:
             self._slot.parent = self
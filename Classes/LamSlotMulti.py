@@ -4,61 +4,12 @@ WARNING! All changes made in this file will be lost!
 """
 
 from os import linesep
-from pyleecan.Classes._check import set_array, check_init_dict, check_var, raise_
+from pyleecan.Classes._check import set_array, check_init_dict, check_var
 from pyleecan.Functions.save import save
 from pyleecan.Classes.Lamination import Lamination
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from pyleecan.Methods.Machine.LamSlotMulti.build_geometry import build_geometry
-except ImportError as error:
-    build_geometry = error
-
-try:
-    from pyleecan.Methods.Machine.LamSlotMulti.check import check
-except ImportError as error:
-    check = error
-
-try:
-    from pyleecan.Methods.Machine.LamSlotMulti.comp_radius_mec import comp_radius_mec
-except ImportError as error:
-    comp_radius_mec = error
-
-try:
-    from pyleecan.Methods.Machine.LamSlotMulti.comp_surfaces import comp_surfaces
-except ImportError as error:
-    comp_surfaces = error
-
-try:
-    from pyleecan.Methods.Machine.LamSlotMulti.get_pole_pair_number import (
-        get_pole_pair_number,
-    )
-except ImportError as error:
-    get_pole_pair_number = error
-
-try:
-    from pyleecan.Methods.Machine.LamSlotMulti.plot import plot
-except ImportError as error:
-    plot = error
-
-try:
-    from pyleecan.Methods.Machine.LamSlotMulti.comp_height_yoke import comp_height_yoke
-except ImportError as error:
-    comp_height_yoke = error
-
-try:
-    from pyleecan.Methods.Machine.LamSlotMulti.get_Zs import get_Zs
-except ImportError as error:
-    get_Zs = error
-
-try:
-    from pyleecan.Methods.Machine.LamSlotMulti.get_bore_desc import get_bore_desc
-except ImportError as error:
-    get_bore_desc = error
-
-
 from numpy import array, array_equal
+from pyleecan.Classes._lazy import LazyInit, LazyMethod
 from pyleecan.Classes._check import InitUnKnowClassError
 from pyleecan.Classes.Slot import Slot
 from pyleecan.Classes.Material import Material
@@ -71,104 +22,34 @@ class LamSlotMulti(Lamination):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
     # cf Methods.Machine.LamSlotMulti.build_geometry
-    if isinstance(build_geometry, ImportError):
-        build_geometry = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use LamSlotMulti method build_geometry: "
-                    + str(build_geometry)
-                )
-            )
-        )
-    else:
-        build_geometry = build_geometry
+    build_geometry = LazyMethod("pyleecan.Methods.Machine.LamSlotMulti.build_geometry")
     # cf Methods.Machine.LamSlotMulti.check
-    if isinstance(check, ImportError):
-        check = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use LamSlotMulti method check: " + str(check))
-            )
-        )
-    else:
-        check = check
+    check = LazyMethod("pyleecan.Methods.Machine.LamSlotMulti.check")
     # cf Methods.Machine.LamSlotMulti.comp_radius_mec
-    if isinstance(comp_radius_mec, ImportError):
-        comp_radius_mec = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use LamSlotMulti method comp_radius_mec: "
-                    + str(comp_radius_mec)
-                )
-            )
-        )
-    else:
-        comp_radius_mec = comp_radius_mec
+    comp_radius_mec = LazyMethod(
+        "pyleecan.Methods.Machine.LamSlotMulti.comp_radius_mec"
+    )
     # cf Methods.Machine.LamSlotMulti.comp_surfaces
-    if isinstance(comp_surfaces, ImportError):
-        comp_surfaces = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use LamSlotMulti method comp_surfaces: " + str(comp_surfaces)
-                )
-            )
-        )
-    else:
-        comp_surfaces = comp_surfaces
+    comp_surfaces = LazyMethod("pyleecan.Methods.Machine.LamSlotMulti.comp_surfaces")
     # cf Methods.Machine.LamSlotMulti.get_pole_pair_number
-    if isinstance(get_pole_pair_number, ImportError):
-        get_pole_pair_number = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use LamSlotMulti method get_pole_pair_number: "
-                    + str(get_pole_pair_number)
-                )
-            )
-        )
-    else:
-        get_pole_pair_number = get_pole_pair_number
+    get_pole_pair_number = LazyMethod(
+        "pyleecan.Methods.Machine.LamSlotMulti.get_pole_pair_number"
+    )
     # cf Methods.Machine.LamSlotMulti.plot
-    if isinstance(plot, ImportError):
-        plot = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use LamSlotMulti method plot: " + str(plot))
-            )
-        )
-    else:
-        plot = plot
+    plot = LazyMethod("pyleecan.Methods.Machine.LamSlotMulti.plot")
     # cf Methods.Machine.LamSlotMulti.comp_height_yoke
-    if isinstance(comp_height_yoke, ImportError):
-        comp_height_yoke = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use LamSlotMulti method comp_height_yoke: "
-                    + str(comp_height_yoke)
-                )
-            )
-        )
-    else:
-        comp_height_yoke = comp_height_yoke
+    comp_height_yoke = LazyMethod(
+        "pyleecan.Methods.Machine.LamSlotMulti.comp_height_yoke"
+    )
     # cf Methods.Machine.LamSlotMulti.get_Zs
-    if isinstance(get_Zs, ImportError):
-        get_Zs = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use LamSlotMulti method get_Zs: " + str(get_Zs))
-            )
-        )
-    else:
-        get_Zs = get_Zs
+    get_Zs = LazyMethod("pyleecan.Methods.Machine.LamSlotMulti.get_Zs")
     # cf Methods.Machine.LamSlotMulti.get_bore_desc
-    if isinstance(get_bore_desc, ImportError):
-        get_bore_desc = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use LamSlotMulti method get_bore_desc: " + str(get_bore_desc)
-                )
-            )
-        )
-    else:
-        get_bore_desc = get_bore_desc
+    get_bore_desc = LazyMethod("pyleecan.Methods.Machine.LamSlotMulti.get_bore_desc")
+    # cf Methods.Machine.LamSlotMulti.comp_periodicity
+    comp_periodicity = LazyMethod(
+        "pyleecan.Methods.Machine.LamSlotMulti.comp_periodicity"
+    )
     # save method is available in all object
     save = save
 
@@ -220,31 +101,31 @@ class LamSlotMulti(Lamination):
                 ],
             )
             # Overwrite default value with init_dict content
-            if "slot_list" in list(init_dict.keys()):
+            if "slot_list" in init_dict:
                 slot_list = init_dict["slot_list"]
-            if "alpha" in list(init_dict.keys()):
+            if "alpha" in init_dict:
                 alpha = init_dict["alpha"]
-            if "L1" in list(init_dict.keys()):
+            if "L1" in init_dict:
                 L1 = init_dict["L1"]
-            if "mat_type" in list(init_dict.keys()):
+            if "mat_type" in init_dict:
                 mat_type = init_dict["mat_type"]
-            if "Nrvd" in list(init_dict.keys()):
+            if "Nrvd" in init_dict:
                 Nrvd = init_dict["Nrvd"]
-            if "Wrvd" in list(init_dict.keys()):
+            if "Wrvd" in init_dict:
                 Wrvd = init_dict["Wrvd"]
-            if "Kf1" in list(init_dict.keys()):
+            if "Kf1" in init_dict:
                 Kf1 = init_dict["Kf1"]
-            if "is_internal" in list(init_dict.keys()):
+            if "is_internal" in init_dict:
                 is_internal = init_dict["is_internal"]
-            if "Rint" in list(init_dict.keys()):
+            if "Rint" in init_dict:
                 Rint = init_dict["Rint"]
-            if "Rext" in list(init_dict.keys()):
+            if "Rext" in init_dict:
                 Rext = init_dict["Rext"]
-            if "is_stator" in list(init_dict.keys()):
+            if "is_stator" in init_dict:
                 is_stator = init_dict["is_stator"]
-            if "axial_vent" in list(init_dict.keys()):
+            if "axial_vent" in init_dict:
                 axial_vent = init_dict["axial_vent"]
-            if "notch" in list(init_dict.keys()):
+            if "notch" in init_dict:
                 notch = init_dict["notch"]
         # Initialisation by argument
         # slot_list can be None or a list of Slot object
@@ -252,7 +133,7 @@ class LamSlotMulti(Lamination):
         if type(slot_list) is list:
             for obj in slot_list:
                 if obj is None:  # Default value
-                    self.slot_list.append(Slot())
+                    self._slot_list.append(Slot())
                 elif isinstance(obj, dict):
                     # Check that the type is correct (including daughter)
                     class_name = obj.get("__class__")
@@ -293,9 +174,9 @@ class LamSlotMulti(Lamination):
                         "pyleecan.Classes." + class_name, fromlist=[class_name]
                     )
                     class_obj = getattr(module, class_name)
-                    self.slot_list.append(class_obj(init_dict=obj))
+                    self._slot_list.append(class_obj(init_dict=obj))
                 else:
-                    self.slot_list.append(obj)
+                    self._slot_list.append(obj)
         elif slot_list is None:
             self.slot_list = list()
         else:
@@ -355,17 +236,24 @@ class LamSlotMulti(Lamination):
             return False
         return True
 
-    def as_dict(self):
+    def as_dict(self, is_keep_array=False):
         """Convert this objet in a json seriable dict (can be use in __init__)
+        The ndarray are not converted to list if is_keep_array
         """
 
         # Get the properties inherited from Lamination
-        LamSlotMulti_dict = super(LamSlotMulti, self).as_dict()
+        LamSlotMulti_dict = super(LamSlotMulti, self).as_dict(
+            is_keep_array=is_keep_array
+        )
         LamSlotMulti_dict["slot_list"] = list()
         for obj in self.slot_list:
-            LamSlotMulti_dict["slot_list"].append(obj.as_dict())
+            LamSlotMulti_dict["slot_list"].append(
+                obj.as_dict(is_keep_array=is_keep_array)
+            )
         if self.alpha is None:
             LamSlotMulti_dict["alpha"] = None
+        elif is_keep_array:
+            LamSlotMulti_dict["alpha"] = self.alpha
         else:
             LamSlotMulti_dict["alpha"] = self.alpha.tolist()
         # The class name is added to the dict fordeserialisation purpose
@@ -373,6 +261,22 @@ class LamSlotMulti(Lamination):
         LamSlotMulti_dict["__class__"] = "LamSlotMulti"
         return LamSlotMulti_dict
 
+    def _copy_to(self, obj):
+        """Copy the properties of this object in obj (called by copy)"""
+
+        # Copy the properties inherited from Lamination
+        super(LamSlotMulti, self)._copy_to(obj)
+        obj._slot_list = list()
+        for value in self._slot_list:
+            if value is not None:
+                value = value.copy()
+                value.parent = obj
+            obj._slot_list.append(value)
+        if self._alpha is None:
+            obj._alpha = None
+        else:
+            obj._alpha = self._alpha.copy()
+
     def _set_None(self):
         """Set all the properties to None (except pyleecan object)"""
 
@@ -384,7 +288,11 @@ class LamSlotMulti(Lamination):
 
     def _get_slot_list(self):
         """getter of slot_list"""
-        for obj in self._slot_list:
+        for ii, obj in enumerate(self._slot_list):
+            if isinstance(obj, LazyInit):
+                # Create the object of a lazy load
+                obj = obj.resolve()
+                self._slot_list[ii] = obj
             if obj is not None:
                 obj.parent = self
         return self._slot_list
@@ -393,6 +301,7 @@ class LamSlotMulti(Lamination):
         """setter of slot_list"""
         check_var("slot_list", value, "[Slot]")
         self._slot_list = value
+        self._clear_memo()
 
         for obj in self._slot_list:
             if obj is not None:
@@ -417,6 +326,7 @@ class LamSlotMulti(Lamination):
                 pass
         check_var("alpha", value, "ndarray")
         self._alpha = value
+        self._clear_memo()
 
     # Angular position of the Slots
     # Type : ndarray
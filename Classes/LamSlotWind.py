@@ -4,75 +4,11 @@ WARNING! All changes made in this file will be lost!
 """
 
 from os import linesep
-from pyleecan.Classes._check import check_init_dict, check_var, raise_
+from pyleecan.Classes._check import check_init_dict, check_var
 from pyleecan.Functions.save import save
 from pyleecan.Classes.LamSlot import LamSlot
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from pyleecan.Methods.Machine.LamSlotWind.build_geometry import build_geometry
-except ImportError as error:
-    build_geometry = error
-
-try:
-    from pyleecan.Methods.Machine.LamSlotWind.check import check
-except ImportError as error:
-    check = error
-
-try:
-    from pyleecan.Methods.Machine.LamSlotWind.comp_masses import comp_masses
-except ImportError as error:
-    comp_masses = error
-
-try:
-    from pyleecan.Methods.Machine.LamSlotWind.comp_surfaces import comp_surfaces
-except ImportError as error:
-    comp_surfaces = error
-
-try:
-    from pyleecan.Methods.Machine.LamSlotWind.comp_volumes import comp_volumes
-except ImportError as error:
-    comp_volumes = error
-
-try:
-    from pyleecan.Methods.Machine.LamSlotWind.get_pole_pair_number import (
-        get_pole_pair_number,
-    )
-except ImportError as error:
-    get_pole_pair_number = error
-
-try:
-    from pyleecan.Methods.Machine.LamSlotWind.get_name_phase import get_name_phase
-except ImportError as error:
-    get_name_phase = error
-
-try:
-    from pyleecan.Methods.Machine.LamSlotWind.plot import plot
-except ImportError as error:
-    plot = error
-
-try:
-    from pyleecan.Methods.Machine.LamSlotWind.plot_winding import plot_winding
-except ImportError as error:
-    plot_winding = error
-
-try:
-    from pyleecan.Methods.Machine.LamSlotWind.comp_fill_factor import comp_fill_factor
-except ImportError as error:
-    comp_fill_factor = error
-
-try:
-    from pyleecan.Methods.Machine.LamSlotWind.comp_output_geo import comp_output_geo
-except ImportError as error:
-    comp_output_geo = error
-
-try:
-    from pyleecan.Methods.Machine.LamSlotWind.get_polar_eq import get_polar_eq
-except ImportError as error:
-    get_polar_eq = error
-
-
+from pyleecan.Classes._lazy import LazyInit, LazyMethod
 from pyleecan.Classes._check import InitUnKnowClassError
 from pyleecan.Classes.Winding import Winding
 from pyleecan.Classes.Slot import Slot
@@ -86,140 +22,42 @@ class LamSlotWind(LamSlot):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
     # cf Methods.Machine.LamSlotWind.build_geometry
-    if isinstance(build_geometry, ImportError):
-        build_geometry = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use LamSlotWind method build_geometry: "
-                    + str(build_geometry)
-                )
-            )
-        )
-    else:
-        build_geometry = build_geometry
+    build_geometry = LazyMethod("pyleecan.Methods.Machine.LamSlotWind.build_geometry")
     # cf Methods.Machine.LamSlotWind.check
-    if isinstance(check, ImportError):
-        check = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use LamSlotWind method check: " + str(check))
-            )
-        )
-    else:
-        check = check
+    check = LazyMethod("pyleecan.Methods.Machine.LamSlotWind.check")
     # cf Methods.Machine.LamSlotWind.comp_masses
-    if isinstance(comp_masses, ImportError):
-        comp_masses = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use LamSlotWind method comp_masses: " + str(comp_masses)
-                )
-            )
-        )
-    else:
-        comp_masses = comp_masses
+    comp_masses = LazyMethod("pyleecan.Methods.Machine.LamSlotWind.comp_masses")
     # cf Methods.Machine.LamSlotWind.comp_surfaces
-    if isinstance(comp_surfaces, ImportError):
-        comp_surfaces = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use LamSlotWind method comp_surfaces: " + str(comp_surfaces)
-                )
-            )
-        )
-    else:
-        comp_surfaces = comp_surfaces
+    comp_surfaces = LazyMethod("pyleecan.Methods.Machine.LamSlotWind.comp_surfaces")
     # cf Methods.Machine.LamSlotWind.comp_volumes
-    if isinstance(comp_volumes, ImportError):
-        comp_volumes = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use LamSlotWind method comp_volumes: " + str(comp_volumes)
-                )
-            )
-        )
-    else:
-        comp_volumes = comp_volumes
+    comp_volumes = LazyMethod("pyleecan.Methods.Machine.LamSlotWind.comp_volumes")
     # cf Methods.Machine.LamSlotWind.get_pole_pair_number
-    if isinstance(get_pole_pair_number, ImportError):
-        get_pole_pair_number = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use LamSlotWind method get_pole_pair_number: "
-                    + str(get_pole_pair_number)
-                )
-            )
-        )
-    else:
-        get_pole_pair_number = get_pole_pair_number
+    get_pole_pair_number = LazyMethod(
+        "pyleecan.Methods.Machine.LamSlotWind.get_pole_pair_number"
+    )
     # cf Methods.Machine.LamSlotWind.get_name_phase
-    if isinstance(get_name_phase, ImportError):
-        get_name_phase = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use LamSlotWind method get_name_phase: "
-                    + str(get_name_phase)
-                )
-            )
-        )
-    else:
-        get_name_phase = get_name_phase
+    get_name_phase = LazyMethod("pyleecan.Methods.Machine.LamSlotWind.get_name_phase")
     # cf Methods.Machine.LamSlotWind.plot
-    if isinstance(plot, ImportError):
-        plot = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use LamSlotWind method plot: " + str(plot))
-            )
-        )
-    else:
-        plot = plot
+    plot = LazyMethod("pyleecan.Methods.Machine.LamSlotWind.plot")
     # cf Methods.Machine.LamSlotWind.plot_winding
-    if isinstance(plot_winding, ImportError):
-        plot_winding = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use LamSlotWind method plot_winding: " + str(plot_winding)
-                )
-            )
-        )
-    else:
-        plot_winding = plot_winding
+    plot_winding = LazyMethod("pyleecan.Methods.Machine.LamSlotWind.plot_winding")
     # cf Methods.Machine.LamSlotWind.comp_fill_factor
-    if isinstance(comp_fill_factor, ImportError):
-        comp_fill_factor = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use LamSlotWind method comp_fill_factor: "
-                    + str(comp_fill_factor)
-                )
-            )
-        )
-    else:
-        comp_fill_factor = comp_fill_factor
+    comp_fill_factor = LazyMethod(
+        "pyleecan.Methods.Machine.LamSlotWind.comp_fill_factor"
+    )
     # cf Methods.Machine.LamSlotWind.comp_output_geo
-    if isinstance(comp_output_geo, ImportError):
-        comp_output_geo = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use LamSlotWind method comp_output_geo: "
-                    + str(comp_output_geo)
-                )
-            )
-        )
-    else:
-        comp_output_geo = comp_output_geo
+    comp_output_geo = LazyMethod("pyleecan.Methods.Machine.LamSlotWind.comp_output_geo")
     # cf Methods.Machine.LamSlotWind.get_polar_eq
-    if isinstance(get_polar_eq, ImportError):
-        get_polar_eq = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use LamSlotWind method get_polar_eq: " + str(get_polar_eq)
-                )
-            )
-        )
-    else:
-        get_polar_eq = get_polar_eq
+    get_polar_eq = LazyMethod("pyleecan.Methods.Machine.LamSlotWind.get_polar_eq")
+    # cf Methods.Machine.LamSlotWind.build_geometry_wind
+    build_geometry_wind = LazyMethod(
+        "pyleecan.Methods.Machine.LamSlotWind.build_geometry_wind"
+    )
+    # cf Methods.Machine.LamSlotWind.comp_periodicity
+    comp_periodicity = LazyMethod(
+        "pyleecan.Methods.Machine.LamSlotWind.comp_periodicity"
+    )
     # save method is available in all object
     save = save
 
@@ -277,33 +115,33 @@ class LamSlotWind(LamSlot):
                 ],
             )
             # Overwrite default value with init_dict content
-            if "Ksfill" in list(init_dict.keys()):
+            if "Ksfill" in init_dict:
                 Ksfill = init_dict["Ksfill"]
-            if "winding" in list(init_dict.keys()):
+            if "winding" in init_dict:
                 winding = init_dict["winding"]
-            if "slot" in list(init_dict.keys()):
+            if "slot" in init_dict:
                 slot = init_dict["slot"]
-            if "L1" in list(init_dict.keys()):
+            if "L1" in init_dict:
                 L1 = init_dict["L1"]
-            if "mat_type" in list(init_dict.keys()):
+            if "mat_type" in init_dict:
                 mat_type = init_dict["mat_type"]
-            if "Nrvd" in list(init_dict.keys()):
+            if "Nrvd" in init_dict:
                 Nrvd = init_dict["Nrvd"]
-            if "Wrvd" in list(init_dict.keys()):
+            if "Wrvd" in init_dict:
                 Wrvd = init_dict["Wrvd"]
-            if "Kf1" in list(init_dict.keys()):
+            if "Kf1" in init_dict:
                 Kf1 = init_dict["Kf1"]
-            if "is_internal" in list(init_dict.keys()):
+            if "is_internal" in init_dict:
                 is_internal = init_dict["is_internal"]
-            if "Rint" in list(init_dict.keys()):
+            if "Rint" in init_dict:
                 Rint = init_dict["Rint"]
-            if "Rext" in list(init_dict.keys()):
+            if "Rext" in init_dict:
                 Rext = init_dict["Rext"]
-            if "is_stator" in list(init_dict.keys()):
+            if "is_stator" in init_dict:
                 is_stator = init_dict["is_stator"]
-            if "axial_vent" in list(init_dict.keys()):
+            if "axial_vent" in init_dict:
                 axial_vent = init_dict["axial_vent"]
-            if "notch" in list(init_dict.keys()):
+            if "notch" in init_dict:
                 notch = init_dict["notch"]
         # Initialisation by argument
         self.Ksfill = Ksfill
@@ -378,22 +216,37 @@ class LamSlotWind(LamSlot):
             return False
         return True
 
-    def as_dict(self):
+    def as_dict(self, is_keep_array=False):
         """Convert this objet in a json seriable dict (can be use in __init__)
+        The ndarray are not converted to list if is_keep_array
         """
 
         # Get the properties inherited from LamSlot
-        LamSlotWind_dict = super(LamSlotWind, self).as_dict()
+        LamSlotWind_dict = super(LamSlotWind, self).as_dict(is_keep_array=is_keep_array)
         LamSlotWind_dict["Ksfill"] = self.Ksfill
         if self.winding is None:
             LamSlotWind_dict["winding"] = None
         else:
-            LamSlotWind_dict["winding"] = self.winding.as_dict()
+            LamSlotWind_dict["winding"] = self.winding.as_dict(
+                is_keep_array=is_keep_array
+            )
         # The class name is added to the dict fordeserialisation purpose
         # Overwrite the mother class name
         LamSlotWind_dict["__class__"] = "LamSlotWind"
         return LamSlotWind_dict
 
+    def _copy_to(self, obj):
+        """Copy the properties of this object in obj (called by copy)"""
+
+        # Copy the properties inherited from LamSlot
+        super(LamSlotWind, self)._copy_to(obj)
+        obj._Ksfill = self._Ksfill
+        if self._winding is None:
+            obj._winding = None
+        else:
+            obj._winding = self._winding.copy()
+            obj._winding.parent = obj
+
     def _set_None(self):
         """Set all the properties to None (except pyleecan object)"""
 
@@ -411,6 +264,7 @@ class LamSlotWind(LamSlot):
         """setter of Ksfill"""
         check_var("Ksfill", value, "float", Vmin=0, Vmax=1)
         self._Ksfill = value
+        self._clear_memo()
 
     # Imposed Slot Fill factor (if None, will be computed according to the winding and the slot)
     # Type : float, min = 0, max = 1
@@ -422,12 +276,16 @@ class LamSlotWind(LamSlot):
 
     def _get_winding(self):
         """getter of winding"""
+        if isinstance(self._winding, LazyInit):
+            # Create the object of a lazy load
+            self._set_winding(self._winding.resolve())
         return self._winding
 
     def _set_winding(self, value):
         """setter of winding"""
         check_var("winding", value, "Winding")
         self._winding = value
+        self._clear_memo()
 
         if self._winding is not None:
             self._winding.parent = self
@@ -4,35 +4,11 @@ WARNING! All changes made in this file will be lost!
 """
 
 from os import linesep
-from pyleecan.Classes._check import check_init_dict, check_var, raise_
+from pyleecan.Classes._check import check_init_dict, check_var
 from pyleecan.Functions.save import save
 from pyleecan.Classes.LamSlotWind import LamSlotWind
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from pyleecan.Methods.Machine.LamSquirrelCage.build_geometry import build_geometry
-except ImportError as error:
-    build_geometry = error
-
-try:
-    from pyleecan.Methods.Machine.LamSquirrelCage.check import check
-except ImportError as error:
-    check = error
-
-try:
-    from pyleecan.Methods.Machine.LamSquirrelCage.comp_length_ring import (
-        comp_length_ring,
-    )
-except ImportError as error:
-    comp_length_ring = error
-
-try:
-    from pyleecan.Methods.Machine.LamSquirrelCage.plot import plot
-except ImportError as error:
-    plot = error
-
-
+from pyleecan.Classes._lazy import LazyInit, LazyMethod
 from pyleecan.Classes._check import InitUnKnowClassError
 from pyleecan.Classes.Material import Material
 from pyleecan.Classes.Winding import Winding
@@ -46,49 +22,18 @@ class LamSquirrelCage(LamSlotWind):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
     # cf Methods.Machine.LamSquirrelCage.build_geometry
-    if isinstance(build_geometry, ImportError):
-        build_geometry = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use LamSquirrelCage method build_geometry: "
-                    + str(build_geometry)
-                )
-            )
-        )
-    else:
-        build_geometry = build_geometry
+    build_geometry = LazyMethod(
+        "pyleecan.Methods.Machine.LamSquirrelCage.build_geometry"
+    )
     # cf Methods.Machine.LamSquirrelCage.check
-    if isinstance(check, ImportError):
-        check = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use LamSquirrelCage method check: " + str(check))
-            )
-        )
-    else:
-        check = check
+    check = LazyMethod("pyleecan.Methods.Machine.LamSquirrelCage.check")
     # cf Methods.Machine.LamSquirrelCage.comp_length_ring
-    if isinstance(comp_length_ring, ImportError):
-        comp_length_ring = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use LamSquirrelCage method comp_length_ring: "
-                    + str(comp_length_ring)
-                )
-            )
-        )
-    else:
-        comp_length_ring = comp_length_ring
+    comp_length_ring = LazyMethod(
+        "pyleecan.Methods.Machine.LamSquirrelCage.comp_length_ring"
+    )
     # cf Methods.Machine.LamSquirrelCage.plot
-    if isinstance(plot, ImportError):
-        plot = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use LamSquirrelCage method plot: " + str(plot))
-            )
-        )
-    else:
-        plot = plot
+    plot = LazyMethod("pyleecan.Methods.Machine.LamSquirrelCage.plot")
     # save method is available in all object
     save = save
 
@@ -154,39 +99,39 @@ class LamSquirrelCage(LamSlotWind):
                 ],
             )
             # Overwrite default value with init_dict content
-            if "Hscr" in list(init_dict.keys()):
+            if "Hscr" in init_dict:
                 Hscr = init_dict["Hscr"]
-            if "Lscr" in list(init_dict.keys()):
+            if "Lscr" in init_dict:
                 Lscr = init_dict["Lscr"]
-            if "ring_mat" in list(init_dict.keys()):
+            if "ring_mat" in init_dict:
                 ring_mat = init_dict["ring_mat"]
-            if "Ksfill" in list(init_dict.keys()):
+            if "Ksfill" in init_dict:
                 Ksfill = init_dict["Ksfill"]
-            if "winding" in list(init_dict.keys()):
+            if "winding" in init_dict:
                 winding = init_dict["winding"]
-            if "slot" in list(init_dict.keys()):
+            if "slot" in init_dict:
                 slot = init_dict["slot"]
-            if "L1" in list(init_dict.keys()):
+            if "L1" in init_dict:
                 L1 = init_dict["L1"]
-            if "mat_type" in list(init_dict.keys()):
+            if "mat_type" in init_dict:
                 mat_type = init_dict["mat_type"]
-            if "Nrvd" in list(init_dict.keys()):
+            if "Nrvd" in init_dict:
                 Nrvd = init_dict["Nrvd"]
-            if "Wrvd" in list(init_dict.keys()):
+            if "Wrvd" in init_dict:
                 Wrvd = init_dict["Wrvd"]
-            if "Kf1" in list(init_dict.keys()):
+            if "Kf1" in init_dict:
                 Kf1 = init_dict["Kf1"]
-            if "is_internal" in list(init_dict.keys()):
+            if "is_internal" in init_dict:
                 is_internal = init_dict["is_internal"]
-            if "Rint" in list(init_dict.keys()):
+            if "Rint" in init_dict:
                 Rint = init_dict["Rint"]
-            if "Rext" in list(init_dict.keys()):
+            if "Rext" in init_dict:
                 Rext = init_dict["Rext"]
-            if "is_stator" in list(init_dict.keys()):
+            if "is_stator" in init_dict:
                 is_stator = init_dict["is_stator"]
-            if "axial_vent" in list(init_dict.keys()):
+            if "axial_vent" in init_dict:
                 axial_vent = init_dict["axial_vent"]
-            if "notch" in list(init_dict.keys()):
+            if "notch" in init_dict:
                 notch = init_dict["notch"]
         # Initialisation by argument
         self.Hscr = Hscr
@@ -249,23 +194,41 @@ class LamSquirrelCage(LamSlotWind):
             return False
         return True
 
-    def as_dict(self):
+    def as_dict(self, is_keep_array=False):
         """Convert this objet in a json seriable dict (can be use in __init__)
+        The ndarray are not converted to list if is_keep_array
         """
 
         # Get the properties inherited from LamSlotWind
-        LamSquirrelCage_dict = super(LamSquirrelCage, self).as_dict()
+        LamSquirrelCage_dict = super(LamSquirrelCage, self).as_dict(
+            is_keep_array=is_keep_array
+        )
         LamSquirrelCage_dict["Hscr"] = self.Hscr
         LamSquirrelCage_dict["Lscr"] = self.Lscr
         if self.ring_mat is None:
             LamSquirrelCage_dict["ring_mat"] = None
         else:
-            LamSquirrelCage_dict["ring_mat"] = self.ring_mat.as_dict()
+            LamSquirrelCage_dict["ring_mat"] = self.ring_mat.as_dict(
+                is_keep_array=is_keep_array
+            )
         # The class name is added to the dict fordeserialisation purpose
         # Overwrite the mother class name
         LamSquirrelCage_dict["__class__"] = "LamSquirrelCage"
         return LamSquirrelCage_dict
 
+    def _copy_to(self, obj):
+        """Copy the properties of this object in obj (called by copy)"""
+
+        # Copy the properties inherited from LamSlotWind
+        super(LamSquirrelCage, self)._copy_to(obj)
+        obj._Hscr = self._Hscr
+        obj._Lscr = self._Lscr
+        if self._ring_mat is None:
+            obj._ring_mat = None
+        else:
+            obj._ring_mat = self._ring_mat.copy()
+            obj._ring_mat.parent = obj
+
     def _set_None(self):
         """Set all the properties to None (except pyleecan object)"""
 
@@ -284,6 +247,7 @@ class LamSquirrelCage(LamSlotWind):
         """setter of Hscr"""
         check_var("Hscr", value, "float", Vmin=0)
         self._Hscr = value
+        self._clear_memo()
 
     # short circuit ring section radial height [m]
     # Type : float, min = 0
@@ -301,6 +265,7 @@ class LamSquirrelCage(LamSlotWind):
         """setter of Lscr"""
         check_var("Lscr", value, "float", Vmin=0)
         self._Lscr = value
+        self._clear_memo()
 
     # short circuit ring section axial length
     # Type : float, min = 0
@@ -312,12 +277,16 @@ class LamSquirrelCage(LamSlotWind):
 
     def _get_ring_mat(self):
         """getter of ring_mat"""
+        if isinstance(self._ring_mat, LazyInit):
+            # Create the object of a lazy load
+            self._set_ring_mat(self._ring_mat.resolve())
         return self._ring_mat
 
     def _set_ring_mat(self, value):
         """setter of ring_mat"""
         check_var("ring_mat", value, "Material")
         self._ring_mat = value
+        self._clear_memo()
 
         if self._ring_mat is not None:
             self._ring_mat.parent = self
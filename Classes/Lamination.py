@@ -4,105 +4,11 @@ WARNING! All changes made in this file will be lost!
 """
 
 from os import linesep
-from pyleecan.Classes._check import check_init_dict, check_var, raise_
+from pyleecan.Classes._check import check_init_dict, check_var
 from pyleecan.Functions.save import save
 from pyleecan.Classes._frozen import FrozenClass
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from pyleecan.Methods.Machine.Lamination.build_geometry import build_geometry
-except ImportError as error:
-    build_geometry = error
-
-try:
-    from pyleecan.Methods.Machine.Lamination.check import check
-except ImportError as error:
-    check = error
-
-try:
-    from pyleecan.Methods.Machine.Lamination.comp_length import comp_length
-except ImportError as error:
-    comp_length = error
-
-try:
-    from pyleecan.Methods.Machine.Lamination.comp_masses import comp_masses
-except ImportError as error:
-    comp_masses = error
-
-try:
-    from pyleecan.Methods.Machine.Lamination.comp_radius_mec import comp_radius_mec
-except ImportError as error:
-    comp_radius_mec = error
-
-try:
-    from pyleecan.Methods.Machine.Lamination.comp_surface_axial_vent import (
-        comp_surface_axial_vent,
-    )
-except ImportError as error:
-    comp_surface_axial_vent = error
-
-try:
-    from pyleecan.Methods.Machine.Lamination.comp_surfaces import comp_surfaces
-except ImportError as error:
-    comp_surfaces = error
-
-try:
-    from pyleecan.Methods.Machine.Lamination.comp_volumes import comp_volumes
-except ImportError as error:
-    comp_volumes = error
-
-try:
-    from pyleecan.Methods.Machine.Lamination.get_bore_line import get_bore_line
-except ImportError as error:
-    get_bore_line = error
-
-try:
-    from pyleecan.Methods.Machine.Lamination.get_Rbo import get_Rbo
-except ImportError as error:
-    get_Rbo = error
-
-try:
-    from pyleecan.Methods.Machine.Lamination.get_Ryoke import get_Ryoke
-except ImportError as error:
-    get_Ryoke = error
-
-try:
-    from pyleecan.Methods.Machine.Lamination.get_name_phase import get_name_phase
-except ImportError as error:
-    get_name_phase = error
-
-try:
-    from pyleecan.Methods.Machine.Lamination.plot import plot
-except ImportError as error:
-    plot = error
-
-try:
-    from pyleecan.Methods.Machine.Lamination.comp_output_geo import comp_output_geo
-except ImportError as error:
-    comp_output_geo = error
-
-try:
-    from pyleecan.Methods.Machine.Lamination.get_polar_eq import get_polar_eq
-except ImportError as error:
-    get_polar_eq = error
-
-try:
-    from pyleecan.Methods.Machine.Lamination.is_outwards import is_outwards
-except ImportError as error:
-    is_outwards = error
-
-try:
-    from pyleecan.Methods.Machine.Lamination.comp_height_yoke import comp_height_yoke
-except ImportError as error:
-    comp_height_yoke = error
-
-try:
-    from pyleecan.Methods.Machine.Lamination.get_notch_list import get_notch_list
-except ImportError as error:
-    get_notch_list = error
-
-
+from pyleecan.Classes._lazy import LazyInit, LazyMethod
 from pyleecan.Classes._check import InitUnKnowClassError
 from pyleecan.Classes.Material import Material
 from pyleecan.Classes.Hole import Hole
@@ -114,201 +20,50 @@ class Lamination(FrozenClass):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
     # cf Methods.Machine.Lamination.build_geometry
-    if isinstance(build_geometry, ImportError):
-        build_geometry = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Lamination method build_geometry: " + str(build_geometry)
-                )
-            )
-        )
-    else:
-        build_geometry = build_geometry
+    build_geometry = LazyMethod("pyleecan.Methods.Machine.Lamination.build_geometry")
     # cf Methods.Machine.Lamination.check
-    if isinstance(check, ImportError):
-        check = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Lamination method check: " + str(check))
-            )
-        )
-    else:
-        check = check
+    check = LazyMethod("pyleecan.Methods.Machine.Lamination.check")
     # cf Methods.Machine.Lamination.comp_length
-    if isinstance(comp_length, ImportError):
-        comp_length = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Lamination method comp_length: " + str(comp_length)
-                )
-            )
-        )
-    else:
-        comp_length = comp_length
+    comp_length = LazyMethod("pyleecan.Methods.Machine.Lamination.comp_length")
     # cf Methods.Machine.Lamination.comp_masses
-    if isinstance(comp_masses, ImportError):
-        comp_masses = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Lamination method comp_masses: " + str(comp_masses)
-                )
-            )
-        )
-    else:
-        comp_masses = comp_masses
+    comp_masses = LazyMethod("pyleecan.Methods.Machine.Lamination.comp_masses")
     # cf Methods.Machine.Lamination.comp_radius_mec
-    if isinstance(comp_radius_mec, ImportError):
-        comp_radius_mec = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Lamination method comp_radius_mec: "
-                    + str(comp_radius_mec)
-                )
-            )
-        )
-    else:
-        comp_radius_mec = comp_radius_mec
+    comp_radius_mec = LazyMethod("pyleecan.Methods.Machine.Lamination.comp_radius_mec")
     # cf Methods.Machine.Lamination.comp_surface_axial_vent
-    if isinstance(comp_surface_axial_vent, ImportError):
-        comp_surface_axial_vent = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Lamination method comp_surface_axial_vent: "
-                    + str(comp_surface_axial_vent)
-                )
-            )
-        )
-    else:
-        comp_surface_axial_vent = comp_surface_axial_vent
+    comp_surface_axial_vent = LazyMethod(
+        "pyleecan.Methods.Machine.Lamination.comp_surface_axial_vent"
+    )
     # cf Methods.Machine.Lamination.comp_surfaces
-    if isinstance(comp_surfaces, ImportError):
-        comp_surfaces = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Lamination method comp_surfaces: " + str(comp_surfaces)
-                )
-            )
-        )
-    else:
-        comp_surfaces = comp_surfaces
+    comp_surfaces = LazyMethod("pyleecan.Methods.Machine.Lamination.comp_surfaces")
     # cf Methods.Machine.Lamination.comp_volumes
-    if isinstance(comp_volumes, ImportError):
-        comp_volumes = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Lamination method comp_volumes: " + str(comp_volumes)
-                )
-            )
-        )
-    else:
-        comp_volumes = comp_volumes
+    comp_volumes = LazyMethod("pyleecan.Methods.Machine.Lamination.comp_volumes")
     # cf Methods.Machine.Lamination.get_bore_line
-    if isinstance(get_bore_line, ImportError):
-        get_bore_line = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Lamination method get_bore_line: " + str(get_bore_line)
-                )
-            )
-        )
-    else:
-        get_bore_line = get_bore_line
+    get_bore_line = LazyMethod("pyleecan.Methods.Machine.Lamination.get_bore_line")
     # cf Methods.Machine.Lamination.get_Rbo
-    if isinstance(get_Rbo, ImportError):
-        get_Rbo = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Lamination method get_Rbo: " + str(get_Rbo))
-            )
-        )
-    else:
-        get_Rbo = get_Rbo
+    get_Rbo = LazyMethod("pyleecan.Methods.Machine.Lamination.get_Rbo")
     # cf Methods.Machine.Lamination.get_Ryoke
-    if isinstance(get_Ryoke, ImportError):
-        get_Ryoke = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Lamination method get_Ryoke: " + str(get_Ryoke))
-            )
-        )
-    else:
-        get_Ryoke = get_Ryoke
+    get_Ryoke = LazyMethod("pyleecan.Methods.Machine.Lamination.get_Ryoke")
     # cf Methods.Machine.Lamination.get_name_phase
-    if isinstance(get_name_phase, ImportError):
-        get_name_phase = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Lamination method get_name_phase: " + str(get_name_phase)
-                )
-            )
-        )
-    else:
-        get_name_phase = get_name_phase
+    get_name_phase = LazyMethod("pyleecan.Methods.Machine.Lamination.get_name_phase")
     # cf Methods.Machine.Lamination.plot
-    if isinstance(plot, ImportError):
-        plot = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Lamination method plot: " + str(plot))
-            )
-        )
-    else:
-        plot = plot
+    plot = LazyMethod("pyleecan.Methods.Machine.Lamination.plot")
     # cf Methods.Machine.Lamination.comp_output_geo
-    if isinstance(comp_output_geo, ImportError):
-        comp_output_geo = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Lamination method comp_output_geo: "
-                    + str(comp_output_geo)
-                )
-            )
-        )
-    else:
-        comp_output_geo = comp_output_geo
+    comp_output_geo = LazyMethod("pyleecan.Methods.Machine.Lamination.comp_output_geo")
     # cf Methods.Machine.Lamination.get_polar_eq
-    if isinstance(get_polar_eq, ImportError):
-        get_polar_eq = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Lamination method get_polar_eq: " + str(get_polar_eq)
-                )
-            )
-        )
-    else:
-        get_polar_eq = get_polar_eq
+    get_polar_eq = LazyMethod("pyleecan.Methods.Machine.Lamination.get_polar_eq")
     # cf Methods.Machine.Lamination.is_outwards
-    if isinstance(is_outwards, ImportError):
-        is_outwards = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Lamination method is_outwards: " + str(is_outwards)
-                )
-            )
-        )
-    else:
-        is_outwards = is_outwards
+    is_outwards = LazyMethod("pyleecan.Methods.Machine.Lamination.is_outwards")
     # cf Methods.Machine.Lamination.comp_height_yoke
-    if isinstance(comp_height_yoke, ImportError):
-        comp_height_yoke = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Lamination method comp_height_yoke: "
-                    + str(comp_height_yoke)
-                )
-            )
-        )
-    else:
-        comp_height_yoke = comp_height_yoke
+    comp_height_yoke = LazyMethod(
+        "pyleecan.Methods.Machine.Lamination.comp_height_yoke"
+    )
     # cf Methods.Machine.Lamination.get_notch_list
-    if isinstance(get_notch_list, ImportError):
-        get_notch_list = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Lamination method get_notch_list: " + str(get_notch_list)
-                )
-            )
-        )
-    else:
-        get_notch_list = get_notch_list
+    get_notch_list = LazyMethod("pyleecan.Methods.Machine.Lamination.get_notch_list")
+    # cf Methods.Machine.Lamination.comp_periodicity
+    comp_periodicity = LazyMethod(
+        "pyleecan.Methods.Machine.Lamination.comp_periodicity"
+    )
     # save method is available in all object
     save = save
 
@@ -356,27 +111,27 @@ class Lamination(FrozenClass):
                 ],
             )
             # Overwrite default value with init_dict content
-            if "L1" in list(init_dict.keys()):
+            if "L1" in init_dict:
                 L1 = init_dict["L1"]
-            if "mat_type" in list(init_dict.keys()):
+            if "mat_type" in init_dict:
                 mat_type = init_dict["mat_type"]
-            if "Nrvd" in list(init_dict.keys()):
+            if "Nrvd" in init_dict:
                 Nrvd = init_dict["Nrvd"]
-            if "Wrvd" in list(init_dict.keys()):
+            if "Wrvd" in init_dict:
                 Wrvd = init_dict["Wrvd"]
-            if "Kf1" in list(init_dict.keys()):
+            if "Kf1" in init_dict:
                 Kf1 = init_dict["Kf1"]
-            if "is_internal" in list(init_dict.keys()):
+            if "is_internal" in init_dict:
                 is_internal = init_dict["is_internal"]
-            if "Rint" in list(init_dict.keys()):
+            if "Rint" in init_dict:
                 Rint = init_dict["Rint"]
-            if "Rext" in list(init_dict.keys()):
+            if "Rext" in init_dict:
                 Rext = init_dict["Rext"]
-            if "is_stator" in list(init_dict.keys()):
+            if "is_stator" in init_dict:
                 is_stator = init_dict["is_stator"]
-            if "axial_vent" in list(init_dict.keys()):
+            if "axial_vent" in init_dict:
                 axial_vent = init_dict["axial_vent"]
-            if "notch" in list(init_dict.keys()):
+            if "notch" in init_dict:
                 notch = init_dict["notch"]
         # Initialisation by argument
         self.parent = None
@@ -398,7 +153,7 @@ class Lamination(FrozenClass):
         if type(axial_vent) is list:
             for obj in axial_vent:
                 if obj is None:  # Default value
-                    self.axial_vent.append(Hole())
+                    self._axial_vent.append(Hole())
                 elif isinstance(obj, dict):
                     # Check that the type is correct (including daughter)
                     class_name = obj.get("__class__")
@@ -424,9 +179,9 @@ class Lamination(FrozenClass):
                         "pyleecan.Classes." + class_name, fromlist=[class_name]
                     )
                     class_obj = getattr(module, class_name)
-                    self.axial_vent.append(class_obj(init_dict=obj))
+                    self._axial_vent.append(class_obj(init_dict=obj))
                 else:
-                    self.axial_vent.append(obj)
+                    self._axial_vent.append(obj)
         elif axial_vent is None:
             self.axial_vent = list()
         else:
@@ -436,7 +191,7 @@ class Lamination(FrozenClass):
         if type(notch) is list:
             for obj in notch:
                 if obj is None:  # Default value
-                    self.notch.append(Notch())
+                    self._notch.append(Notch())
                 elif isinstance(obj, dict):
                     # Check that the type is correct (including daughter)
                     class_name = obj.get("__class__")
@@ -451,9 +206,9 @@ class Lamination(FrozenClass):
                         "pyleecan.Classes." + class_name, fromlist=[class_name]
                     )
                     class_obj = getattr(module, class_name)
-                    self.notch.append(class_obj(init_dict=obj))
+                    self._notch.append(class_obj(init_dict=obj))
                 else:
-                    self.notch.append(obj)
+                    self._notch.append(obj)
         elif notch is None:
             self.notch = list()
         else:
@@ -533,8 +288,9 @@ class Lamination(FrozenClass):
             return False
         return True
 
-    def as_dict(self):
+    def as_dict(self, is_keep_array=False):
         """Convert this objet in a json seriable dict (can be use in __init__)
+        The ndarray are not converted to list if is_keep_array
         """
 
         Lamination_dict = dict()
@@ -542,7 +298,9 @@ class Lamination(FrozenClass):
         if self.mat_type is None:
             Lamination_dict["mat_type"] = None
         else:
-            Lamination_dict["mat_type"] = self.mat_type.as_dict()
+            Lamination_dict["mat_type"] = self.mat_type.as_dict(
+                is_keep_array=is_keep_array
+            )
         Lamination_dict["Nrvd"] = self.Nrvd
         Lamination_dict["Wrvd"] = self.Wrvd
         Lamination_dict["Kf1"] = self.Kf1
@@ -552,14 +310,45 @@ class Lamination(FrozenClass):
         Lamination_dict["is_stator"] = self.is_stator
         Lamination_dict["axial_vent"] = list()
         for obj in self.axial_vent:
-            Lamination_dict["axial_vent"].append(obj.as_dict())
+            Lamination_dict["axial_vent"].append(
+                obj.as_dict(is_keep_array=is_keep_array)
+            )
         Lamination_dict["notch"] = list()
         for obj in self.notch:
-            Lamination_dict["notch"].append(obj.as_dict())
+            Lamination_dict["notch"].append(obj.as_dict(is_keep_array=is_keep_array))
         # The class name is added to the dict fordeserialisation purpose
         Lamination_dict["__class__"] = "Lamination"
         return Lamination_dict
 
+    def _copy_to(self, obj):
+        """Copy the properties of this object in obj (called by copy)"""
+
+        obj._L1 = self._L1
+        if self._mat_type is None:
+            obj._mat_type = None
+        else:
+            obj._mat_type = self._mat_type.copy()
+            obj._mat_type.parent = obj
+        obj._Nrvd = self._Nrvd
+        obj._Wrvd = self._Wrvd
+        obj._Kf1 = self._Kf1
+        obj._is_internal = self._is_internal
+        obj._Rint = self._Rint
+        obj._Rext = self._Rext
+        obj._is_stator = self._is_stator
+        obj._axial_vent = list()
+        for value in self._axial_vent:
+            if value is not None:
+                value = value.copy()
+                value.parent = obj
+            obj._axial_vent.append(value)
+        obj._notch = list()
+        for value in self._notch:
+            if value is not None:
+                value = value.copy()
+                value.parent = obj
+            obj._notch.append(value)
+
     def _set_None(self):
         """Set all the properties to None (except pyleecan object)"""
 
@@ -586,6 +375,7 @@ class Lamination(FrozenClass):
         """setter of L1"""
         check_var("L1", value, "float", Vmin=0, Vmax=100)
         self._L1 = value
+        self._clear_memo()
 
     # Lamination stack active length [m] without radial ventilation airducts but including insulation layers between lamination sheets
     # Type : float, min = 0, max = 100
@@ -597,12 +387,16 @@ class Lamination(FrozenClass):
 
     def _get_mat_type(self):
         """getter of mat_type"""
+        if isinstance(self._mat_type, LazyInit):
+            # Create the object of a lazy load
+            self._set_mat_type(self._mat_type.resolve())
         return self._mat_type
 
     def _set_mat_type(self, value):
         """setter of mat_type"""
         check_var("mat_type", value, "Material")
         self._mat_type = value
+        self._clear_memo()
 
         if self._mat_type is not None:
             self._mat_type.parent = self
@@ -621,6 +415,7 @@ class Lamination(FrozenClass):
         """setter of Nrvd"""
         check_var("Nrvd", value, "int", Vmin=0)
         self._Nrvd = value
+        self._clear_memo()
 
     # number of radial air ventilation ducts in lamination
     # Type : int, min = 0
@@ -638,6 +433,7 @@ class Lamination(FrozenClass):
         """setter of Wrvd"""
         check_var("Wrvd", value, "float", Vmin=0)
         self._Wrvd = value
+        self._clear_memo()
 
     # axial width of ventilation ducts in lamination
     # Type : float, min = 0
@@ -655,6 +451,7 @@ class Lamination(FrozenClass):
         """setter of Kf1"""
         check_var("Kf1", value, "float", Vmin=0, Vmax=1)
         self._Kf1 = value
+        self._clear_memo()
 
     # lamination stacking / packing factor
     # Type : float, min = 0, max = 1
@@ -670,6 +467,7 @@ class Lamination(FrozenClass):
         """setter of is_internal"""
         check_var("is_internal", value, "bool")
         self._is_internal = value
+        self._clear_memo()
 
     # 1 for internal lamination topology, 0 for external lamination
     # Type : bool
@@ -687,6 +485,7 @@ class Lamination(FrozenClass):
         """setter of Rint"""
         check_var("Rint", value, "float", Vmin=0)
         self._Rint = value
+        self._clear_memo()
 
     # To fill
     # Type : float, min = 0
@@ -700,6 +499,7 @@ class Lamination(FrozenClass):
         """setter of Rext"""
         check_var("Rext", value, "float", Vmin=0)
         self._Rext = value
+        self._clear_memo()
 
     # To fill
     # Type : float, min = 0
@@ -713,6 +513,7 @@ class Lamination(FrozenClass):
         """setter of is_stator"""
         check_var("is_stator", value, "bool")
         self._is_stator = value
+        self._clear_memo()
 
     # To fill
     # Type : bool
@@ -720,7 +521,11 @@ class Lamination(FrozenClass):
 
     def _get_axial_vent(self):
         """getter of axial_vent"""
-        for obj in self._axial_vent:
+        for ii, obj in enumerate(self._axial_vent):
+            if isinstance(obj, LazyInit):
+                # Create the object of a lazy load
+                obj = obj.resolve()
+                self._axial_vent[ii] = obj
             if obj is not None:
                 obj.parent = self
         return self._axial_vent
@@ -729,6 +534,7 @@ class Lamination(FrozenClass):
         """setter of axial_vent"""
         check_var("axial_vent", value, "[Hole]")
         self._axial_vent = value
+        self._clear_memo()
 
         for obj in self._axial_vent:
             if obj is not None:
@@ -742,7 +548,11 @@ class Lamination(FrozenClass):
 
     def _get_notch(self):
         """getter of notch"""
-        for obj in self._notch:
+        for ii, obj in enumerate(self._notch):
+            if isinstance(obj, LazyInit):
+                # Create the object of a lazy load
+                obj = obj.resolve()
+                self._notch[ii] = obj
             if obj is not None:
                 obj.parent = self
         return self._notch
@@ -751,6 +561,7 @@ class Lamination(FrozenClass):
         """setter of notch"""
         check_var("notch", value, "[Notch]")
         self._notch = value
+        self._clear_memo()
 
         for obj in self._notch:
             if obj is not None:
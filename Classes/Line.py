@@ -4,7 +4,7 @@ WARNING! All changes made in this file will be lost!
 """
 
 from os import linesep
-from pyleecan.Classes._check import check_init_dict, check_var, raise_
+from pyleecan.Classes._check import check_init_dict, check_var
 from pyleecan.Functions.save import save
 from pyleecan.Classes._frozen import FrozenClass
 
@@ -32,7 +32,7 @@ class Line(FrozenClass):
         if init_dict is not None:  # Initialisation by dict
             check_init_dict(init_dict, ["label"])
             # Overwrite default value with init_dict content
-            if "label" in list(init_dict.keys()):
+            if "label" in init_dict:
                 label = init_dict["label"]
         # Initialisation by argument
         self.parent = None
@@ -61,8 +61,9 @@ class Line(FrozenClass):
             return False
         return True
 
-    def as_dict(self):
+    def as_dict(self, is_keep_array=False):
         """Convert this objet in a json seriable dict (can be use in __init__)
+        The ndarray are not converted to list if is_keep_array
         """
 
         Line_dict = dict()
@@ -71,6 +72,11 @@ class Line(FrozenClass):
         Line_dict["__class__"] = "Line"
         return Line_dict
 
+    def _copy_to(self, obj):
+        """Copy the properties of this object in obj (called by copy)"""
+
+        obj._label = self._label
+
     def _set_None(self):
         """Set all the properties to None (except pyleecan object)"""
 
@@ -84,6 +90,7 @@ class Line(FrozenClass):
         """setter of label"""
         check_var("label", value, "str")
         self._label = value
+        self._clear_memo()
 
     # the label of the Line (EX: Yoke_side)
     # Type : str
@@ -4,79 +4,11 @@ WARNING! All changes made in this file will be lost!
 """
 
 from os import linesep
-from pyleecan.Classes._check import check_init_dict, check_var, raise_
+from pyleecan.Classes._check import check_init_dict, check_var
 from pyleecan.Functions.save import save
 from pyleecan.Classes._frozen import FrozenClass
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from pyleecan.Methods.Machine.Machine.build_geometry import build_geometry
-except ImportError as error:
-    build_geometry = error
-
-try:
-    from pyleecan.Methods.Machine.Machine.check import check
-except ImportError as error:
-    check = error
-
-try:
-    from pyleecan.Methods.Machine.Machine.comp_masses import comp_masses
-except ImportError as error:
-    comp_masses = error
-
-try:
-    from pyleecan.Methods.Machine.Machine.comp_width_airgap_mag import (
-        comp_width_airgap_mag,
-    )
-except ImportError as error:
-    comp_width_airgap_mag = error
-
-try:
-    from pyleecan.Methods.Machine.Machine.comp_width_airgap_mec import (
-        comp_width_airgap_mec,
-    )
-except ImportError as error:
-    comp_width_airgap_mec = error
-
-try:
-    from pyleecan.Methods.Machine.Machine.get_lamination import get_lamination
-except ImportError as error:
-    get_lamination = error
-
-try:
-    from pyleecan.Methods.Machine.Machine.comp_Rgap_mec import comp_Rgap_mec
-except ImportError as error:
-    comp_Rgap_mec = error
-
-try:
-    from pyleecan.Methods.Machine.Machine.plot import plot
-except ImportError as error:
-    plot = error
-
-try:
-    from pyleecan.Methods.Machine.Machine.comp_output_geo import comp_output_geo
-except ImportError as error:
-    comp_output_geo = error
-
-try:
-    from pyleecan.Methods.Machine.Machine.comp_length_airgap_active import (
-        comp_length_airgap_active,
-    )
-except ImportError as error:
-    comp_length_airgap_active = error
-
-try:
-    from pyleecan.Methods.Machine.Machine.get_polar_eq import get_polar_eq
-except ImportError as error:
-    get_polar_eq = error
-
-try:
-    from pyleecan.Methods.Machine.Machine.plot_anim_rotor import plot_anim_rotor
-except ImportError as error:
-    plot_anim_rotor = error
-
-
+from pyleecan.Classes._lazy import LazyInit, LazyMethod
 from pyleecan.Classes._check import InitUnKnowClassError
 from pyleecan.Classes.Lamination import Lamination
 from pyleecan.Classes.Frame import Frame
@@ -88,136 +20,38 @@ class Machine(FrozenClass):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
     # cf Methods.Machine.Machine.build_geometry
-    if isinstance(build_geometry, ImportError):
-        build_geometry = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Machine method build_geometry: " + str(build_geometry)
-                )
-            )
-        )
-    else:
-        build_geometry = build_geometry
+    build_geometry = LazyMethod("pyleecan.Methods.Machine.Machine.build_geometry")
     # cf Methods.Machine.Machine.check
-    if isinstance(check, ImportError):
-        check = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Machine method check: " + str(check))
-            )
-        )
-    else:
-        check = check
+    check = LazyMethod("pyleecan.Methods.Machine.Machine.check")
     # cf Methods.Machine.Machine.comp_masses
-    if isinstance(comp_masses, ImportError):
-        comp_masses = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Machine method comp_masses: " + str(comp_masses))
-            )
-        )
-    else:
-        comp_masses = comp_masses
+    comp_masses = LazyMethod("pyleecan.Methods.Machine.Machine.comp_masses")
     # cf Methods.Machine.Machine.comp_width_airgap_mag
-    if isinstance(comp_width_airgap_mag, ImportError):
-        comp_width_airgap_mag = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Machine method comp_width_airgap_mag: "
-                    + str(comp_width_airgap_mag)
-                )
-            )
-        )
-    else:
-        comp_width_airgap_mag = comp_width_airgap_mag
+    comp_width_airgap_mag = LazyMethod(
+        "pyleecan.Methods.Machine.Machine.comp_width_airgap_mag"
+    )
     # cf Methods.Machine.Machine.comp_width_airgap_mec
-    if isinstance(comp_width_airgap_mec, ImportError):
-        comp_width_airgap_mec = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Machine method comp_width_airgap_mec: "
-                    + str(comp_width_airgap_mec)
-                )
-            )
-        )
-    else:
-        comp_width_airgap_mec = comp_width_airgap_mec
+    comp_width_airgap_mec = LazyMethod(
+        "pyleecan.Methods.Machine.Machine.comp_width_airgap_mec"
+    )
     # cf Methods.Machine.Machine.get_lamination
-    if isinstance(get_lamination, ImportError):
-        get_lamination = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Machine method get_lamination: " + str(get_lamination)
-                )
-            )
-        )
-    else:
-        get_lamination = get_lamination
+    get_lamination = LazyMethod("pyleecan.Methods.Machine.Machine.get_lamination")
     # cf Methods.Machine.Machine.comp_Rgap_mec
-    if isinstance(comp_Rgap_mec, ImportError):
-        comp_Rgap_mec = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Machine method comp_Rgap_mec: " + str(comp_Rgap_mec)
-                )
-            )
-        )
-    else:
-        comp_Rgap_mec = comp_Rgap_mec
+    comp_Rgap_mec = LazyMethod("pyleecan.Methods.Machine.Machine.comp_Rgap_mec")
     # cf Methods.Machine.Machine.plot
-    if isinstance(plot, ImportError):
-        plot = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Machine method plot: " + str(plot))
-            )
-        )
-    else:
-        plot = plot
+    plot = LazyMethod("pyleecan.Methods.Machine.Machine.plot")
     # cf Methods.Machine.Machine.comp_output_geo
-    if isinstance(comp_output_geo, ImportError):
-        comp_output_geo = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Machine method comp_output_geo: " + str(comp_output_geo)
-                )
-            )
-        )
-    else:
-        comp_output_geo = comp_output_geo
+    comp_output_geo = LazyMethod("pyleecan.Methods.Machine.Machine.comp_output_geo")
     # cf Methods.Machine.Machine.comp_length_airgap_active
-    if isinstance(comp_length_airgap_active, ImportError):
-        comp_length_airgap_active = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Machine method comp_length_airgap_active: "
-                    + str(comp_length_airgap_active)
-                )
-            )
-        )
-    else:
-        comp_length_airgap_active = comp_length_airgap_active
+    comp_length_airgap_active = LazyMethod(
+        "pyleecan.Methods.Machine.Machine.comp_length_airgap_active"
+    )
     # cf Methods.Machine.Machine.get_polar_eq
-    if isinstance(get_polar_eq, ImportError):
-        get_polar_eq = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Machine method get_polar_eq: " + str(get_polar_eq)
-                )
-            )
-        )
-    else:
-        get_polar_eq = get_polar_eq
+    get_polar_eq = LazyMethod("pyleecan.Methods.Machine.Machine.get_polar_eq")
     # cf Methods.Machine.Machine.plot_anim_rotor
-    if isinstance(plot_anim_rotor, ImportError):
-        plot_anim_rotor = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Machine method plot_anim_rotor: " + str(plot_anim_rotor)
-                )
-            )
-        )
-    else:
-        plot_anim_rotor = plot_anim_rotor
+    plot_anim_rotor = LazyMethod("pyleecan.Methods.Machine.Machine.plot_anim_rotor")
+    # cf Methods.Machine.Machine.comp_periodicity
+    comp_periodicity = LazyMethod("pyleecan.Methods.Machine.Machine.comp_periodicity")
     # save method is available in all object
     save = save
 
@@ -255,19 +89,19 @@ class Machine(FrozenClass):
                 ["rotor", "stator", "frame", "shaft", "name", "desc", "type_machine"],
             )
             # Overwrite default value with init_dict content
-            if "rotor" in list(init_dict.keys()):
+            if "rotor" in init_dict:
                 rotor = init_dict["rotor"]
-            if "stator" in list(init_dict.keys()):
+            if "stator" in init_dict:
                 stator = init_dict["stator"]
-            if "frame" in list(init_dict.keys()):
+            if "frame" in init_dict:
                 frame = init_dict["frame"]
-            if "shaft" in list(init_dict.keys()):
+            if "shaft" in init_dict:
                 shaft = init_dict["shaft"]
-            if "name" in list(init_dict.keys()):
+            if "name" in init_dict:
                 name = init_dict["name"]
-            if "desc" in list(init_dict.keys()):
+            if "desc" in init_dict:
                 desc = init_dict["desc"]
-            if "type_machine" in list(init_dict.keys()):
+            if "type_machine" in init_dict:
                 type_machine = init_dict["type_machine"]
         # Initialisation by argument
         self.parent = None
@@ -382,27 +216,28 @@ class Machine(FrozenClass):
             return False
         return True
 
-    def as_dict(self):
+    def as_dict(self, is_keep_array=False):
         """Convert this objet in a json seriable dict (can be use in __init__)
+        The ndarray are not converted to list if is_keep_array
         """
 
         Machine_dict = dict()
         if self.rotor is None:
             Machine_dict["rotor"] = None
         else:
-            Machine_dict["rotor"] = self.rotor.as_dict()
+            Machine_dict["rotor"] = self.rotor.as_dict(is_keep_array=is_keep_array)
         if self.stator is None:
             Machine_dict["stator"] = None
         else:
-            Machine_dict["stator"] = self.stator.as_dict()
+            Machine_dict["stator"] = self.stator.as_dict(is_keep_array=is_keep_array)
         if self.frame is None:
             Machine_dict["frame"] = None
         else:
-            Machine_dict["frame"] = self.frame.as_dict()
+            Machine_dict["frame"] = self.frame.as_dict(is_keep_array=is_keep_array)
         if self.shaft is None:
             Machine_dict["shaft"] = None
         else:
-            Machine_dict["shaft"] = self.shaft.as_dict()
+            Machine_dict["shaft"] = self.shaft.as_dict(is_keep_array=is_keep_array)
         Machine_dict["name"] = self.name
         Machine_dict["desc"] = self.desc
         Machine_dict["type_machine"] = self.type_machine
@@ -410,6 +245,33 @@ class Machine(FrozenClass):
         Machine_dict["__class__"] = "Machine"
         return Machine_dict
 
+    def _copy_to(self, obj):
+        """Copy the properties of this object in obj (called by copy)"""
+
+        if self._rotor is None:
+            obj._rotor = None
+        else:
+            obj._rotor = self._rotor.copy()
+            obj._rotor.parent = obj
+        if self._stator is None:
+            obj._stator = None
+        else:
+            obj._stator = self._stator.copy()
+            obj._stator.parent = obj
+        if self._frame is None:
+            obj._frame = None
+        else:
+            obj._frame = self._frame.copy()
+            obj._frame.parent = obj
+        if self._shaft is None:
+            obj._shaft = None
+        else:
+            obj._shaft = self._shaft.copy()
+            obj._shaft.parent = obj
+        obj._name = self._name
+        obj._desc = self._desc
+        obj._type_machine = self._type_machine
+
     def _set_None(self):
         """Set all the properties to None (except pyleecan object)"""
 
@@ -427,12 +289,16 @@ class Machine(FrozenClass):
 
     def _get_rotor(self):
         """getter of rotor"""
+        if isinstance(self._rotor, LazyInit):
+            # Create the object of a lazy load
+            self._set_rotor(self._rotor.resolve())
         return self._rotor
 
     def _set_rotor(self, value):
         """setter of rotor"""
         check_var("rotor", value, "Lamination")
         self._rotor = value
+        self._clear_memo()
 
         if self._rotor is not None:
             self._rotor.parent = self
@@ -443,12 +309,16 @@ class Machine(FrozenClass):
 
     def _get_stator(self):
         """getter of stator"""
+        if isinstance(self._stator, LazyInit):
+            # Create the object of a lazy load
+            self._set_stator(self._stator.resolve())
         return self._stator
 
     def _set_stator(self, value):
         """setter of stator"""
         check_var("stator", value, "Lamination")
         self._stator = value
+        self._clear_memo()
 
         if self._stator is not None:
             self._stator.parent = self
@@ -459,12 +329,16 @@ class Machine(FrozenClass):
 
     def _get_frame(self):
         """getter of frame"""
+        if isinstance(self._frame, LazyInit):
+            # Create the object of a lazy load
+            self._set_frame(self._frame.resolve())
         return self._frame
 
     def _set_frame(self, value):
         """setter of frame"""
         check_var("frame", value, "Frame")
         self._frame = value
+        self._clear_memo()
 
         if self._frame is not None:
             self._frame.parent = self
@@ -475,12 +349,16 @@ class Machine(FrozenClass):
 
     def _get_shaft(self):
         """getter of shaft"""
+        if isinstance(self._shaft, LazyInit):
+            # Create the object of a lazy load
+            self._set_shaft(self._shaft.resolve())
         return self._shaft
 
     def _set_shaft(self, value):
         """setter of shaft"""
         check_var("shaft", value, "Shaft")
         self._shaft = value
+        self._clear_memo()
 
         if self._shaft is not None:
             self._shaft.parent = self
@@ -497,6 +375,7 @@ class Machine(FrozenClass):
         """setter of name"""
         check_var("name", value, "str")
         self._name = value
+        self._clear_memo()
 
     # Name of the machine
     # Type : str
@@ -510,6 +389,7 @@ class Machine(FrozenClass):
         """setter of desc"""
         check_var("desc", value, "str")
         self._desc = value
+        self._clear_memo()
 
     # Machine description
     # Type : str
@@ -523,6 +403,7 @@ class Machine(FrozenClass):
         """setter of type_machine"""
         check_var("type_machine", value, "int")
         self._type_machine = value
+        self._clear_memo()
 
     # Integer to store the machine type (for the GUI, should be replaced by a test of the object type)
     # Type : int
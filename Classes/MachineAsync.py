@@ -4,18 +4,11 @@ WARNING! All changes made in this file will be lost!
 """
 
 from os import linesep
-from pyleecan.Classes._check import check_init_dict, check_var, raise_
+from pyleecan.Classes._check import check_init_dict, check_var
 from pyleecan.Functions.save import save
 from pyleecan.Classes.Machine import Machine
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from pyleecan.Methods.Machine.MachineAsync.is_synchronous import is_synchronous
-except ImportError as error:
-    is_synchronous = error
-
-
+from pyleecan.Classes._lazy import LazyMethod
 from pyleecan.Classes._check import InitUnKnowClassError
 from pyleecan.Classes.Lamination import Lamination
 from pyleecan.Classes.Frame import Frame
@@ -28,17 +21,7 @@ class MachineAsync(Machine):
     VERSION = 1
 
     # cf Methods.Machine.MachineAsync.is_synchronous
-    if isinstance(is_synchronous, ImportError):
-        is_synchronous = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use MachineAsync method is_synchronous: "
-                    + str(is_synchronous)
-                )
-            )
-        )
-    else:
-        is_synchronous = is_synchronous
+    is_synchronous = LazyMethod("pyleecan.Methods.Machine.MachineAsync.is_synchronous")
     # save method is available in all object
     save = save
 
@@ -76,19 +59,19 @@ class MachineAsync(Machine):
                 ["rotor", "stator", "frame", "shaft", "name", "desc", "type_machine"],
             )
             # Overwrite default value with init_dict content
-            if "rotor" in list(init_dict.keys()):
+            if "rotor" in init_dict:
                 rotor = init_dict["rotor"]
-            if "stator" in list(init_dict.keys()):
+            if "stator" in init_dict:
                 stator = init_dict["stator"]
-            if "frame" in list(init_dict.keys()):
+            if "frame" in init_dict:
                 frame = init_dict["frame"]
-            if "shaft" in list(init_dict.keys()):
+            if "shaft" in init_dict:
                 shaft = init_dict["shaft"]
-            if "name" in list(init_dict.keys()):
+            if "name" in init_dict:
                 name = init_dict["name"]
-            if "desc" in list(init_dict.keys()):
+            if "desc" in init_dict:
                 desc = init_dict["desc"]
-            if "type_machine" in list(init_dict.keys()):
+            if "type_machine" in init_dict:
                 type_machine = init_dict["type_machine"]
         # Initialisation by argument
         # Call Machine init
@@ -123,17 +106,26 @@ class MachineAsync(Machine):
             return False
         return True
 
-    def as_dict(self):
+    def as_dict(self, is_keep_array=False):
         """Convert this objet in a json seriable dict (can be use in __init__)
+        The ndarray are not converted to list if is_keep_array
         """
 
         # Get the properties inherited from Machine
-        MachineAsync_dict = super(MachineAsync, self).as_dict()
+        MachineAsync_dict = super(MachineAsync, self).as_dict(
+            is_keep_array=is_keep_array
+        )
         # The class name is added to the dict fordeserialisation purpose
         # Overwrite the mother class name
         MachineAsync_dict["__class__"] = "MachineAsync"
         return MachineAsync_dict
 
+    def _copy_to(self, obj):
+        """Copy the properties of this object in obj (called by copy)"""
+
+        # Copy the properties inherited from Machine
+        super(MachineAsync, self)._copy_to(obj)
+
     def _set_None(self):
         """Set all the properties to None (except pyleecan object)"""
 
@@ -4,23 +4,11 @@ WARNING! All changes made in this file will be lost!
 """
 
 from os import linesep
-from pyleecan.Classes._check import check_init_dict, check_var, raise_
+from pyleecan.Classes._check import check_init_dict, check_var
 from pyleecan.Functions.save import save
 from pyleecan.Classes.MachineAsync import MachineAsync
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from pyleecan.Methods.Machine.MachineDFIM.check import check
-except ImportError as error:
-    check = error
-
-try:
-    from pyleecan.Methods.Machine.MachineDFIM.get_machine_type import get_machine_type
-except ImportError as error:
-    get_machine_type = error
-
-
+from pyleecan.Classes._lazy import LazyMethod
 from pyleecan.Classes._check import InitUnKnowClassError
 from pyleecan.Classes.Lamination import Lamination
 from pyleecan.Classes.Frame import Frame
@@ -32,28 +20,12 @@ class MachineDFIM(MachineAsync):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
     # cf Methods.Machine.MachineDFIM.check
-    if isinstance(check, ImportError):
-        check = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use MachineDFIM method check: " + str(check))
-            )
-        )
-    else:
-        check = check
+    check = LazyMethod("pyleecan.Methods.Machine.MachineDFIM.check")
     # cf Methods.Machine.MachineDFIM.get_machine_type
-    if isinstance(get_machine_type, ImportError):
-        get_machine_type = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use MachineDFIM method get_machine_type: "
-                    + str(get_machine_type)
-                )
-            )
-        )
-    else:
-        get_machine_type = get_machine_type
+    get_machine_type = LazyMethod(
+        "pyleecan.Methods.Machine.MachineDFIM.get_machine_type"
+    )
     # save method is available in all object
     save = save
 
@@ -91,19 +63,19 @@ class MachineDFIM(MachineAsync):
                 ["rotor", "stator", "frame", "shaft", "name", "desc", "type_machine"],
             )
             # Overwrite default value with init_dict content
-            if "rotor" in list(init_dict.keys()):
+            if "rotor" in init_dict:
                 rotor = init_dict["rotor"]
-            if "stator" in list(init_dict.keys()):
+            if "stator" in init_dict:
                 stator = init_dict["stator"]
-            if "frame" in list(init_dict.keys()):
+            if "frame" in init_dict:
                 frame = init_dict["frame"]
-            if "shaft" in list(init_dict.keys()):
+            if "shaft" in init_dict:
                 shaft = init_dict["shaft"]
-            if "name" in list(init_dict.keys()):
+            if "name" in init_dict:
                 name = init_dict["name"]
-            if "desc" in list(init_dict.keys()):
+            if "desc" in init_dict:
                 desc = init_dict["desc"]
-            if "type_machine" in list(init_dict.keys()):
+            if "type_machine" in init_dict:
                 type_machine = init_dict["type_machine"]
         # Initialisation by argument
         # Call MachineAsync init
@@ -138,17 +110,24 @@ class MachineDFIM(MachineAsync):
             return False
         return True
 
-    def as_dict(self):
+    def as_dict(self, is_keep_array=False):
         """Convert this objet in a json seriable dict (can be use in __init__)
+        The ndarray are not converted to list if is_keep_array
         """
 
         # Get the properties inherited from MachineAsync
-        MachineDFIM_dict = super(MachineDFIM, self).as_dict()
+        MachineDFIM_dict = super(MachineDFIM, self).as_dict(is_keep_array=is_keep_array)
         # The class name is added to the dict fordeserialisation purpose
         # Overwrite the mother class name
         MachineDFIM_dict["__class__"] = "MachineDFIM"
         return MachineDFIM_dict
 
+    def _copy_to(self, obj):
+        """Copy the properties of this object in obj (called by copy)"""
+
+        # Copy the properties inherited from MachineAsync
+        super(MachineDFIM, self)._copy_to(obj)
+
     def _set_None(self):
         """Set all the properties to None (except pyleecan object)"""
 
@@ -4,25 +4,11 @@ WARNING! All changes made in this file will be lost!
 """
 
 from os import linesep
-from pyleecan.Classes._check import check_init_dict, check_var, raise_
+from pyleecan.Classes._check import check_init_dict, check_var
 from pyleecan.Functions.save import save
 from pyleecan.Classes.Machine import Machine
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from pyleecan.Methods.Machine.MachineSync.is_synchronous import is_synchronous
-except ImportError as error:
-    is_synchronous = error
-
-try:
-    from pyleecan.Methods.Machine.MachineSync.comp_initial_angle import (
-        comp_initial_angle,
-    )
-except ImportError as error:
-    comp_initial_angle = error
-
-
+from pyleecan.Classes._lazy import LazyMethod
 from pyleecan.Classes._check import InitUnKnowClassError
 from pyleecan.Classes.Lamination import Lamination
 from pyleecan.Classes.Frame import Frame
@@ -34,31 +20,12 @@ class MachineSync(Machine):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
     # cf Methods.Machine.MachineSync.is_synchronous
-    if isinstance(is_synchronous, ImportError):
-        is_synchronous = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use MachineSync method is_synchronous: "
-                    + str(is_synchronous)
-                )
-            )
-        )
-    else:
-        is_synchronous = is_synchronous
+    is_synchronous = LazyMethod("pyleecan.Methods.Machine.MachineSync.is_synchronous")
     # cf Methods.Machine.MachineSync.comp_initial_angle
-    if isinstance(comp_initial_angle, ImportError):
-        comp_initial_angle = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use MachineSync method comp_initial_angle: "
-                    + str(comp_initial_angle)
-                )
-            )
-        )
-    else:
-        comp_initial_angle = comp_initial_angle
+    comp_initial_angle = LazyMethod(
+        "pyleecan.Methods.Machine.MachineSync.comp_initial_angle"
+    )
     # save method is available in all object
     save = save
 
@@ -96,19 +63,19 @@ class MachineSync(Machine):
                 ["rotor", "stator", "frame", "shaft", "name", "desc", "type_machine"],
             )
             # Overwrite default value with init_dict content
-            if "rotor" in list(init_dict.keys()):
+            if "rotor" in init_dict:
                 rotor = init_dict["rotor"]
-            if "stator" in list(init_dict.keys()):
+            if "stator" in init_dict:
                 stator = init_dict["stator"]
-            if "frame" in list(init_dict.keys()):
+            if "frame" in init_dict:
                 frame = init_dict["frame"]
-            if "shaft" in list(init_dict.keys()):
+            if "shaft" in init_dict:
                 shaft = init_dict["shaft"]
-            if "name" in list(init_dict.keys()):
+            if "name" in init_dict:
                 name = init_dict["name"]
-            if "desc" in list(init_dict.keys()):
+            if "desc" in init_dict:
                 desc = init_dict["desc"]
-            if "type_machine" in list(init_dict.keys()):
+            if "type_machine" in init_dict:
                 type_machine = init_dict["type_machine"]
         # Initialisation by argument
         # Call Machine init
@@ -143,17 +110,24 @@ class MachineSync(Machine):
             return False
         return True
 
-    def as_dict(self):
+    def as_dict(self, is_keep_array=False):
         """Convert this objet in a json seriable dict (can be use in __init__)
+        The ndarray are not converted to list if is_keep_array
         """
 
         # Get the properties inherited from Machine
-        MachineSync_dict = super(MachineSync, self).as_dict()
+        MachineSync_dict = super(MachineSync, self).as_dict(is_keep_array=is_keep_array)
         # The class name is added to the dict fordeserialisation purpose
         # Overwrite the mother class name
         MachineSync_dict["__class__"] = "MachineSync"
         return MachineSync_dict
 
+    def _copy_to(self, obj):
+        """Copy the properties of this object in obj (called by copy)"""
+
+        # Copy the properties inherited from Machine
+        super(MachineSync, self)._copy_to(obj)
+
     def _set_None(self):
         """Set all the properties to None (except pyleecan object)"""
 
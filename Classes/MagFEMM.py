@@ -4,38 +4,12 @@ WARNING! All changes made in this file will be lost!
 """
 
 from os import linesep
-from pyleecan.Classes._check import check_init_dict, check_var, raise_
+from pyleecan.Classes._check import check_init_dict, check_var
 from pyleecan.Functions.save import save
 from pyleecan.Classes.Magnetics import Magnetics
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from pyleecan.Methods.Simulation.MagFEMM.comp_flux_airgap import comp_flux_airgap
-except ImportError as error:
-    comp_flux_airgap = error
-
-try:
-    from pyleecan.Methods.Simulation.MagFEMM.get_path_save import get_path_save
-except ImportError as error:
-    get_path_save = error
-
-try:
-    from pyleecan.Methods.Simulation.MagFEMM.solve_FEMM import solve_FEMM
-except ImportError as error:
-    solve_FEMM = error
-
-try:
-    from pyleecan.Methods.Simulation.MagFEMM.get_meshsolution import get_meshsolution
-except ImportError as error:
-    get_meshsolution = error
-
-try:
-    from pyleecan.Methods.Simulation.MagFEMM.get_path_save_fem import get_path_save_fem
-except ImportError as error:
-    get_path_save_fem = error
-
-
+from copy import deepcopy
+from pyleecan.Classes._lazy import LazyMethod
 from pyleecan.Classes._check import InitUnKnowClassError
 
 
@@ -44,63 +18,26 @@ class MagFEMM(Magnetics):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
     # cf Methods.Simulation.MagFEMM.comp_flux_airgap
-    if isinstance(comp_flux_airgap, ImportError):
-        comp_flux_airgap = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use MagFEMM method comp_flux_airgap: "
-                    + str(comp_flux_airgap)
-                )
-            )
-        )
-    else:
-        comp_flux_airgap = comp_flux_airgap
+    comp_flux_airgap = LazyMethod(
+        "pyleecan.Methods.Simulation.MagFEMM.comp_flux_airgap"
+    )
     # cf Methods.Simulation.MagFEMM.get_path_save
-    if isinstance(get_path_save, ImportError):
-        get_path_save = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use MagFEMM method get_path_save: " + str(get_path_save)
-                )
-            )
-        )
-    else:
-        get_path_save = get_path_save
+    get_path_save = LazyMethod("pyleecan.Methods.Simulation.MagFEMM.get_path_save")
     # cf Methods.Simulation.MagFEMM.solve_FEMM
-    if isinstance(solve_FEMM, ImportError):
-        solve_FEMM = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use MagFEMM method solve_FEMM: " + str(solve_FEMM))
-            )
-        )
-    else:
-        solve_FEMM = solve_FEMM
+    solve_FEMM = LazyMethod("pyleecan.Methods.Simulation.MagFEMM.solve_FEMM")
     # cf Methods.Simulation.MagFEMM.get_meshsolution
-    if isinstance(get_meshsolution, ImportError):
-        get_meshsolution = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use MagFEMM method get_meshsolution: "
-                    + str(get_meshsolution)
-                )
-            )
-        )
-    else:
-        get_meshsolution = get_meshsolution
+    get_meshsolution = LazyMethod(
+        "pyleecan.Methods.Simulation.MagFEMM.get_meshsolution"
+    )
     # cf Methods.Simulation.MagFEMM.get_path_save_fem
-    if isinstance(get_path_save_fem, ImportError):
-        get_path_save_fem = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use MagFEMM method get_path_save_fem: "
-                    + str(get_path_save_fem)
-                )
-            )
-        )
-    else:
-        get_path_save_fem = get_path_save_fem
+    get_path_save_fem = LazyMethod(
+        "pyleecan.Methods.Simulation.MagFEMM.get_path_save_fem"
+    )
+    # cf Methods.Simulation.MagFEMM.solve_FEMM_worker
+    solve_FEMM_worker = LazyMethod(
+        "pyleecan.Methods.Simulation.MagFEMM.solve_FEMM_worker"
+    )
     # save method is available in all object
     save = save
 
@@ -116,6 +53,8 @@ class MagFEMM(Magnetics):
         is_save_FEA=False,
         is_sliding_band=True,
         transform_list=[],
+        nb_worker=1,
+        is_periodicity_a=False,
         is_remove_slotS=False,
         is_remove_slotR=False,
         is_remove_vent=False,
@@ -154,6 +93,8 @@ class MagFEMM(Magnetics):
                     "is_save_FEA",
                     "is_sliding_band",
                     "transform_list",
+                    "nb_worker",
+                    "is_periodicity_a",
                     "is_remove_slotS",
                     "is_remove_slotR",
                     "is_remove_vent",
@@ -170,51 +111,55 @@ class MagFEMM(Magnetics):
                 ],
             )
             # Overwrite default value with init_dict content
-            if "Kmesh_fineness" in list(init_dict.keys()):
+            if "Kmesh_fineness" in init_dict:
                 Kmesh_fineness = init_dict["Kmesh_fineness"]
-            if "Kgeo_fineness" in list(init_dict.keys()):
+            if "Kgeo_fineness" in init_dict:
                 Kgeo_fineness = init_dict["Kgeo_fineness"]
-            if "type_calc_leakage" in list(init_dict.keys()):
+            if "type_calc_leakage" in init_dict:
                 type_calc_leakage = init_dict["type_calc_leakage"]
-            if "file_name" in list(init_dict.keys()):
+            if "file_name" in init_dict:
                 file_name = init_dict["file_name"]
-            if "FEMM_dict" in list(init_dict.keys()):
+            if "FEMM_dict" in init_dict:
                 FEMM_dict = init_dict["FEMM_dict"]
-            if "angle_stator" in list(init_dict.keys()):
+            if "angle_stator" in init_dict:
                 angle_stator = init_dict["angle_stator"]
-            if "is_get_mesh" in list(init_dict.keys()):
+            if "is_get_mesh" in init_dict:
                 is_get_mesh = init_dict["is_get_mesh"]
-            if "is_save_FEA" in list(init_dict.keys()):
+            if "is_save_FEA" in init_dict:
                 is_save_FEA = init_dict["is_save_FEA"]
-            if "is_sliding_band" in list(init_dict.keys()):
+            if "is_sliding_band" in init_dict:
                 is_sliding_band = init_dict["is_sliding_band"]
-            if "transform_list" in list(init_dict.keys()):
+            if "transform_list" in init_dict:
                 transform_list = init_dict["transform_list"]
-            if "is_remove_slotS" in list(init_dict.keys()):
+            if "nb_worker" in init_dict:
+                nb_worker = init_dict["nb_worker"]
+            if "is_periodicity_a" in init_dict:
+                is_periodicity_a = init_dict["is_periodicity_a"]
+            if "is_remove_slotS" in init_dict:
                 is_remove_slotS = init_dict["is_remove_slotS"]
-            if "is_remove_slotR" in list(init_dict.keys()):
+            if "is_remove_slotR" in init_dict:
                 is_remove_slotR = init_dict["is_remove_slotR"]
-            if "is_remove_vent" in list(init_dict.keys()):
+            if "is_remove_vent" in init_dict:
                 is_remove_vent = init_dict["is_remove_vent"]
-            if "is_mmfs" in list(init_dict.keys()):
+            if "is_mmfs" in init_dict:
                 is_mmfs = init_dict["is_mmfs"]
-            if "is_mmfr" in list(init_dict.keys()):
+            if "is_mmfr" in init_dict:
                 is_mmfr = init_dict["is_mmfr"]
-            if "is_stator_linear_BH" in list(init_dict.keys()):
+            if "is_stator_linear_BH" in init_dict:
                 is_stator_linear_BH = init_dict["is_stator_linear_BH"]
-            if "is_rotor_linear_BH" in list(init_dict.keys()):
+            if "is_rotor_linear_BH" in init_dict:
                 is_rotor_linear_BH = init_dict["is_rotor_linear_BH"]
-            if "is_symmetry_t" in list(init_dict.keys()):
+            if "is_symmetry_t" in init_dict:
                 is_symmetry_t = init_dict["is_symmetry_t"]
-            if "sym_t" in list(init_dict.keys()):
+            if "sym_t" in init_dict:
                 sym_t = init_dict["sym_t"]
-            if "is_antiper_t" in list(init_dict.keys()):
+            if "is_antiper_t" in init_dict:
                 is_antiper_t = init_dict["is_antiper_t"]
-            if "is_symmetry_a" in list(init_dict.keys()):
+            if "is_symmetry_a" in init_dict:
                 is_symmetry_a = init_dict["is_symmetry_a"]
-            if "sym_a" in list(init_dict.keys()):
+            if "sym_a" in init_dict:
                 sym_a = init_dict["sym_a"]
-            if "is_antiper_a" in list(init_dict.keys()):
+            if "is_antiper_a" in init_dict:
                 is_antiper_a = init_dict["is_antiper_a"]
         # Initialisation by argument
         self.Kmesh_fineness = Kmesh_fineness
@@ -227,6 +172,8 @@ class MagFEMM(Magnetics):
         self.is_save_FEA = is_save_FEA
         self.is_sliding_band = is_sliding_band
         self.transform_list = transform_list
+        self.nb_worker = nb_worker
+        self.is_periodicity_a = is_periodicity_a
         # Call Magnetics init
         super(MagFEMM, self).__init__(
             is_remove_slotS=is_remove_slotS,
@@ -261,7 +208,11 @@ class MagFEMM(Magnetics):
         MagFEMM_str += "is_get_mesh = " + str(self.is_get_mesh) + linesep
         MagFEMM_str += "is_save_FEA = " + str(self.is_save_FEA) + linesep
         MagFEMM_str += "is_sliding_band = " + str(self.is_sliding_band) + linesep
-        MagFEMM_str += "transform_list = " + linesep + str(self.transform_list)
+        MagFEMM_str += (
+            "transform_list = " + linesep + str(self.transform_list) + linesep
+        )
+        MagFEMM_str += "nb_worker = " + str(self.nb_worker) + linesep
+        MagFEMM_str += "is_periodicity_a = " + str(self.is_periodicity_a)
         return MagFEMM_str
 
     def __eq__(self, other):
@@ -293,14 +244,19 @@ class MagFEMM(Magnetics):
             return False
         if other.transform_list != self.transform_list:
             return False
+        if other.nb_worker != self.nb_worker:
+            return False
+        if other.is_periodicity_a != self.is_periodicity_a:
+            return False
         return True
 
-    def as_dict(self):
+    def as_dict(self, is_keep_array=False):
         """Convert this objet in a json seriable dict (can be use in __init__)
+        The ndarray are not converted to list if is_keep_array
         """
 
         # Get the properties inherited from Magnetics
-        MagFEMM_dict = super(MagFEMM, self).as_dict()
+        MagFEMM_dict = super(MagFEMM, self).as_dict(is_keep_array=is_keep_array)
         MagFEMM_dict["Kmesh_fineness"] = self.Kmesh_fineness
         MagFEMM_dict["Kgeo_fineness"] = self.Kgeo_fineness
         MagFEMM_dict["type_calc_leakage"] = self.type_calc_leakage
@@ -311,11 +267,31 @@ class MagFEMM(Magnetics):
         MagFEMM_dict["is_save_FEA"] = self.is_save_FEA
         MagFEMM_dict["is_sliding_band"] = self.is_sliding_band
         MagFEMM_dict["transform_list"] = self.transform_list
+        MagFEMM_dict["nb_worker"] = self.nb_worker
+        MagFEMM_dict["is_periodicity_a"] = self.is_periodicity_a
         # The class name is added to the dict fordeserialisation purpose
         # Overwrite the mother class name
         MagFEMM_dict["__class__"] = "MagFEMM"
         return MagFEMM_dict
 
+    def _copy_to(self, obj):
+        """Copy the properties of this object in obj (called by copy)"""
+
+        # Copy the properties inherited from Magnetics
+        super(MagFEMM, self)._copy_to(obj)
+        obj._Kmesh_fineness = self._Kmesh_fineness
+        obj._Kgeo_fineness = self._Kgeo_fineness
+        obj._type_calc_leakage = self._type_calc_leakage
+        obj._file_name = self._file_name
+        obj._FEMM_dict = deepcopy(self._FEMM_dict)
+        obj._angle_stator = self._angle_stator
+        obj._is_get_mesh = self._is_get_mesh
+        obj._is_save_FEA = self._is_save_FEA
+        obj._is_sliding_band = self._is_sliding_band
+        obj._transform_list = deepcopy(self._transform_list)
+        obj._nb_worker = self._nb_worker
+        obj._is_periodicity_a = self._is_periodicity_a
+
     def _set_None(self):
         """Set all the properties to None (except pyleecan object)"""
 
@@ -329,6 +305,8 @@ class MagFEMM(Magnetics):
         self.is_save_FEA = None
         self.is_sliding_band = None
         self.transform_list = None
+        self.nb_worker = None
+        self.is_periodicity_a = None
         # Set to None the properties inherited from Magnetics
         super(MagFEMM, self)._set_None()
 
@@ -340,6 +318,7 @@ class MagFEMM(Magnetics):
         """setter of Kmesh_fineness"""
         check_var("Kmesh_fineness", value, "float")
         self._Kmesh_fineness = value
+        self._clear_memo()
 
     # global coefficient to adjust mesh fineness in FEMM (1 : default , > 1 : finner , < 1 : less fine)
     # Type : float
@@ -357,6 +336,7 @@ class MagFEMM(Magnetics):
         """setter of Kgeo_fineness"""
         check_var("Kgeo_fineness", value, "float")
         self._Kgeo_fineness = value
+        self._clear_memo()
 
     # global coefficient to adjust geometry fineness in FEMM (1 : default , > 1 : finner , < 1 : less fine)
     # Type : float
@@ -374,6 +354,7 @@ class MagFEMM(Magnetics):
         """setter of type_calc_leakage"""
         check_var("type_calc_leakage", value, "int", Vmin=0, Vmax=1)
         self._type_calc_leakage = value
+        self._clear_memo()
 
     # 0 no leakage calculation /  1 calculation using single slot
     # Type : int, min = 0, max = 1
@@ -391,6 +372,7 @@ class MagFEMM(Magnetics):
         """setter of file_name"""
         check_var("file_name", value, "str")
         self._file_name = value
+        self._clear_memo()
 
     # Name of the file to save the FEMM model
     # Type : str
@@ -408,6 +390,7 @@ class MagFEMM(Magnetics):
         """setter of FEMM_dict"""
         check_var("FEMM_dict", value, "dict")
         self._FEMM_dict = value
+        self._clear_memo()
 
     # To enforce user-defined values for FEMM main parameters
     # Type : dict
@@ -425,6 +408,7 @@ class MagFEMM(Magnetics):
         """setter of angle_stator"""
         check_var("angle_stator", value, "float")
         self._angle_stator = value
+        self._clear_memo()
 
     # Angular position shift of the stator
     # Type : float
@@ -442,6 +426,7 @@ class MagFEMM(Magnetics):
         """setter of is_get_mesh"""
         check_var("is_get_mesh", value, "bool")
         self._is_get_mesh = value
+        self._clear_memo()
 
     # To save FEA mesh for latter post-procesing
     # Type : bool
@@ -459,6 +444,7 @@ class MagFEMM(Magnetics):
         """setter of is_save_FEA"""
         check_var("is_save_FEA", value, "bool")
         self._is_save_FEA = value
+        self._clear_memo()
 
     # To save FEA mesh and solution in .dat file
     # Type : bool
@@ -476,6 +462,7 @@ class MagFEMM(Magnetics):
         """setter of is_sliding_band"""
         check_var("is_sliding_band", value, "bool")
         self._is_sliding_band = value
+        self._clear_memo()
 
     # 0 to desactivate the sliding band
     # Type : bool
@@ -493,6 +480,7 @@ class MagFEMM(Magnetics):
         """setter of transform_list"""
         check_var("transform_list", value, "list")
         self._transform_list = value
+        self._clear_memo()
 
     # List of dictionnary to apply transformation on the machine surfaces. Key: label (to select the surface), type (rotate or translate), value (alpha or delta)
     # Type : list
@@ -501,3 +489,39 @@ class MagFEMM(Magnetics):
         fset=_set_transform_list,
         doc=u"""List of dictionnary to apply transformation on the machine surfaces. Key: label (to select the surface), type (rotate or translate), value (alpha or delta)""",
     )
+
+    def _get_nb_worker(self):
+        """getter of nb_worker"""
+        return self._nb_worker
+
+    def _set_nb_worker(self, value):
+        """setter of nb_worker"""
+        check_var("nb_worker", value, "int", Vmin=1)
+        self._nb_worker = value
+        self._clear_memo()
+
+    # Number of FEMM sessions to solve the time steps in parallel (1 to solve in the current session)
+    # Type : int, min = 1
+    nb_worker = property(
+        fget=_get_nb_worker,
+        fset=_set_nb_worker,
+        doc=u"""Number of FEMM sessions to solve the time steps in parallel (1 to solve in the current session)""",
+    )
+
+    def _get_is_periodicity_a(self):
+        """getter of is_periodicity_a"""
+        return self._is_periodicity_a
+
+    def _set_is_periodicity_a(self, value):
+        """setter of is_periodicity_a"""
+        check_var("is_periodicity_a", value, "bool")
+        self._is_periodicity_a = value
+        self._clear_memo()
+
+    # 1 to compute the model on the largest angular periodicity of the machine (slots, poles, winding and notches) instead of using is_symmetry_a, sym_a and is_antiper_a (requires the sliding band)
+    # Type : bool
+    is_periodicity_a = property(
+        fget=_get_is_periodicity_a,
+        fset=_set_is_periodicity_a,
+        doc=u"""1 to compute the model on the largest angular periodicity of the machine (slots, poles, winding and notches) instead of using is_symmetry_a, sym_a and is_antiper_a (requires the sliding band)""",
+    )
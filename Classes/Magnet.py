@@ -4,53 +4,11 @@ WARNING! All changes made in this file will be lost!
 """
 
 from os import linesep
-from pyleecan.Classes._check import check_init_dict, check_var, raise_
+from pyleecan.Classes._check import check_init_dict, check_var
 from pyleecan.Functions.save import save
 from pyleecan.Classes._frozen import FrozenClass
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from pyleecan.Methods.Machine.Magnet.comp_angle_opening import comp_angle_opening
-except ImportError as error:
-    comp_angle_opening = error
-
-try:
-    from pyleecan.Methods.Machine.Magnet.comp_height import comp_height
-except ImportError as error:
-    comp_height = error
-
-try:
-    from pyleecan.Methods.Machine.Magnet.comp_mass import comp_mass
-except ImportError as error:
-    comp_mass = error
-
-try:
-    from pyleecan.Methods.Machine.Magnet.comp_ratio_opening import comp_ratio_opening
-except ImportError as error:
-    comp_ratio_opening = error
-
-try:
-    from pyleecan.Methods.Machine.Magnet.comp_surface import comp_surface
-except ImportError as error:
-    comp_surface = error
-
-try:
-    from pyleecan.Methods.Machine.Magnet.comp_volume import comp_volume
-except ImportError as error:
-    comp_volume = error
-
-try:
-    from pyleecan.Methods.Machine.Magnet.is_outwards import is_outwards
-except ImportError as error:
-    is_outwards = error
-
-try:
-    from pyleecan.Methods.Machine.Magnet.plot import plot
-except ImportError as error:
-    plot = error
-
-
+from pyleecan.Classes._lazy import LazyInit, LazyMethod
 from pyleecan.Classes._check import InitUnKnowClassError
 from pyleecan.Classes.Material import Material
 
@@ -60,87 +18,26 @@ class Magnet(FrozenClass):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
     # cf Methods.Machine.Magnet.comp_angle_opening
-    if isinstance(comp_angle_opening, ImportError):
-        comp_angle_opening = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Magnet method comp_angle_opening: "
-                    + str(comp_angle_opening)
-                )
-            )
-        )
-    else:
-        comp_angle_opening = comp_angle_opening
+    comp_angle_opening = LazyMethod(
+        "pyleecan.Methods.Machine.Magnet.comp_angle_opening"
+    )
     # cf Methods.Machine.Magnet.comp_height
-    if isinstance(comp_height, ImportError):
-        comp_height = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Magnet method comp_height: " + str(comp_height))
-            )
-        )
-    else:
-        comp_height = comp_height
+    comp_height = LazyMethod("pyleecan.Methods.Machine.Magnet.comp_height")
     # cf Methods.Machine.Magnet.comp_mass
-    if isinstance(comp_mass, ImportError):
-        comp_mass = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Magnet method comp_mass: " + str(comp_mass))
-            )
-        )
-    else:
-        comp_mass = comp_mass
+    comp_mass = LazyMethod("pyleecan.Methods.Machine.Magnet.comp_mass")
     # cf Methods.Machine.Magnet.comp_ratio_opening
-    if isinstance(comp_ratio_opening, ImportError):
-        comp_ratio_opening = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Magnet method comp_ratio_opening: "
-                    + str(comp_ratio_opening)
-                )
-            )
-        )
-    else:
-        comp_ratio_opening = comp_ratio_opening
+    comp_ratio_opening = LazyMethod(
+        "pyleecan.Methods.Machine.Magnet.comp_ratio_opening"
+    )
     # cf Methods.Machine.Magnet.comp_surface
-    if isinstance(comp_surface, ImportError):
-        comp_surface = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Magnet method comp_surface: " + str(comp_surface)
-                )
-            )
-        )
-    else:
-        comp_surface = comp_surface
+    comp_surface = LazyMethod("pyleecan.Methods.Machine.Magnet.comp_surface")
     # cf Methods.Machine.Magnet.comp_volume
-    if isinstance(comp_volume, ImportError):
-        comp_volume = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Magnet method comp_volume: " + str(comp_volume))
-            )
-        )
-    else:
-        comp_volume = comp_volume
+    comp_volume = LazyMethod("pyleecan.Methods.Machine.Magnet.comp_volume")
     # cf Methods.Machine.Magnet.is_outwards
-    if isinstance(is_outwards, ImportError):
-        is_outwards = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Magnet method is_outwards: " + str(is_outwards))
-            )
-        )
-    else:
-        is_outwards = is_outwards
+    is_outwards = LazyMethod("pyleecan.Methods.Machine.Magnet.is_outwards")
     # cf Methods.Machine.Magnet.plot
-    if isinstance(plot, ImportError):
-        plot = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Magnet method plot: " + str(plot))
-            )
-        )
-    else:
-        plot = plot
+    plot = LazyMethod("pyleecan.Methods.Machine.Magnet.plot")
     # save method is available in all object
     save = save
 
@@ -159,11 +56,11 @@ class Magnet(FrozenClass):
         if init_dict is not None:  # Initialisation by dict
             check_init_dict(init_dict, ["mat_type", "type_magnetization", "Lmag"])
             # Overwrite default value with init_dict content
-            if "mat_type" in list(init_dict.keys()):
+            if "mat_type" in init_dict:
                 mat_type = init_dict["mat_type"]
-            if "type_magnetization" in list(init_dict.keys()):
+            if "type_magnetization" in init_dict:
                 type_magnetization = init_dict["type_magnetization"]
-            if "Lmag" in list(init_dict.keys()):
+            if "Lmag" in init_dict:
                 Lmag = init_dict["Lmag"]
         # Initialisation by argument
         self.parent = None
@@ -209,21 +106,33 @@ class Magnet(FrozenClass):
             return False
         return True
 
-    def as_dict(self):
+    def as_dict(self, is_keep_array=False):
         """Convert this objet in a json seriable dict (can be use in __init__)
+        The ndarray are not converted to list if is_keep_array
         """
 
         Magnet_dict = dict()
         if self.mat_type is None:
             Magnet_dict["mat_type"] = None
         else:
-            Magnet_dict["mat_type"] = self.mat_type.as_dict()
+            Magnet_dict["mat_type"] = self.mat_type.as_dict(is_keep_array=is_keep_array)
         Magnet_dict["type_magnetization"] = self.type_magnetization
         Magnet_dict["Lmag"] = self.Lmag
         # The class name is added to the dict fordeserialisation purpose
         Magnet_dict["__class__"] = "Magnet"
         return Magnet_dict
 
+    def _copy_to(self, obj):
+        """Copy the properties of this object in obj (called by copy)"""
+
+        if self._mat_type is None:
+            obj._mat_type = None
+        else:
+            obj._mat_type = self._mat_type.copy()
+            obj._mat_type.parent = obj
+        obj._type_magnetization = self._type_magnetization
+        obj._Lmag = self._Lmag
+
     def _set_None(self):
         """Set all the properties to None (except pyleecan object)"""
 
@@ -234,12 +143,16 @@ class Magnet(FrozenClass):
 
     def _get_mat_type(self):
         """getter of mat_type"""
+        if isinstance(self._mat_type, LazyInit):
+            # Create the object of a lazy load
+            self._set_mat_type(self._mat_type.resolve())
         return self._mat_type
 
     def _set_mat_type(self, value):
         """setter of mat_type"""
         check_var("mat_type", value, "Material")
         self._mat_type = value
+        self._clear_memo()
 
         if self._mat_type is not None:
             self._mat_type.parent = self
@@ -258,6 +171,7 @@ class Magnet(FrozenClass):
         """setter of type_magnetization"""
         check_var("type_magnetization", value, "int", Vmin=0, Vmax=5)
         self._type_magnetization = value
+        self._clear_memo()
 
     # Permanent magnet magnetization type: 0 for radial, 1 for parallel, 2 for Hallbach
     # Type : int, min = 0, max = 5
@@ -275,6 +189,7 @@ class Magnet(FrozenClass):
         """setter of Lmag"""
         check_var("Lmag", value, "float", Vmin=0)
         self._Lmag = value
+        self._clear_memo()
 
     # Magnet axial length
     # Type : float, min = 0
@@ -4,7 +4,7 @@ WARNING! All changes made in this file will be lost!
 """
 
 from os import linesep
-from pyleecan.Classes._check import check_init_dict, check_var, raise_
+from pyleecan.Classes._check import check_init_dict, check_var
 from pyleecan.Functions.save import save
 from pyleecan.Classes.Magnet import Magnet
 
@@ -35,11 +35,11 @@ class MagnetFlat(Magnet):
         if init_dict is not None:  # Initialisation by dict
             check_init_dict(init_dict, ["mat_type", "type_magnetization", "Lmag"])
             # Overwrite default value with init_dict content
-            if "mat_type" in list(init_dict.keys()):
+            if "mat_type" in init_dict:
                 mat_type = init_dict["mat_type"]
-            if "type_magnetization" in list(init_dict.keys()):
+            if "type_magnetization" in init_dict:
                 type_magnetization = init_dict["type_magnetization"]
-            if "Lmag" in list(init_dict.keys()):
+            if "Lmag" in init_dict:
                 Lmag = init_dict["Lmag"]
         # Initialisation by argument
         # Call Magnet init
@@ -68,17 +68,24 @@ class MagnetFlat(Magnet):
             return False
         return True
 
-    def as_dict(self):
+    def as_dict(self, is_keep_array=False):
         """Convert this objet in a json seriable dict (can be use in __init__)
+        The ndarray are not converted to list if is_keep_array
         """
 
         # Get the properties inherited from Magnet
-        MagnetFlat_dict = super(MagnetFlat, self).as_dict()
+        MagnetFlat_dict = super(MagnetFlat, self).as_dict(is_keep_array=is_keep_array)
         # The class name is added to the dict fordeserialisation purpose
         # Overwrite the mother class name
         MagnetFlat_dict["__class__"] = "MagnetFlat"
         return MagnetFlat_dict
 
+    def _copy_to(self, obj):
+        """Copy the properties of this object in obj (called by copy)"""
+
+        # Copy the properties inherited from Magnet
+        super(MagnetFlat, self)._copy_to(obj)
+
     def _set_None(self):
         """Set all the properties to None (except pyleecan object)"""
 
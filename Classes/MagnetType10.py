@@ -4,28 +4,11 @@ WARNING! All changes made in this file will be lost!
 """
 
 from os import linesep
-from pyleecan.Classes._check import check_init_dict, check_var, raise_
+from pyleecan.Classes._check import check_init_dict, check_var
 from pyleecan.Functions.save import save
 from pyleecan.Classes.MagnetFlat import MagnetFlat
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from pyleecan.Methods.Machine.MagnetType10.build_geometry import build_geometry
-except ImportError as error:
-    build_geometry = error
-
-try:
-    from pyleecan.Methods.Machine.MagnetType10.comp_height import comp_height
-except ImportError as error:
-    comp_height = error
-
-try:
-    from pyleecan.Methods.Machine.MagnetType10.comp_surface import comp_surface
-except ImportError as error:
-    comp_surface = error
-
-
+from pyleecan.Classes._lazy import LazyMethod
 from pyleecan.Classes._check import InitUnKnowClassError
 from pyleecan.Classes.Material import Material
 
@@ -37,41 +20,12 @@ class MagnetType10(MagnetFlat):
     IS_FLAT_BOT = 1
     IS_FLAT_TOP = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
     # cf Methods.Machine.MagnetType10.build_geometry
-    if isinstance(build_geometry, ImportError):
-        build_geometry = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use MagnetType10 method build_geometry: "
-                    + str(build_geometry)
-                )
-            )
-        )
-    else:
-        build_geometry = build_geometry
+    build_geometry = LazyMethod("pyleecan.Methods.Machine.MagnetType10.build_geometry")
     # cf Methods.Machine.MagnetType10.comp_height
-    if isinstance(comp_height, ImportError):
-        comp_height = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use MagnetType10 method comp_height: " + str(comp_height)
-                )
-            )
-        )
-    else:
-        comp_height = comp_height
+    comp_height = LazyMethod("pyleecan.Methods.Machine.MagnetType10.comp_height")
     # cf Methods.Machine.MagnetType10.comp_surface
-    if isinstance(comp_surface, ImportError):
-        comp_surface = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use MagnetType10 method comp_surface: " + str(comp_surface)
-                )
-            )
-        )
-    else:
-        comp_surface = comp_surface
+    comp_surface = LazyMethod("pyleecan.Methods.Machine.MagnetType10.comp_surface")
     # save method is available in all object
     save = save
 
@@ -100,15 +54,15 @@ class MagnetType10(MagnetFlat):
                 init_dict, ["Wmag", "Hmag", "mat_type", "type_magnetization", "Lmag"]
             )
             # Overwrite default value with init_dict content
-            if "Wmag" in list(init_dict.keys()):
+            if "Wmag" in init_dict:
                 Wmag = init_dict["Wmag"]
-            if "Hmag" in list(init_dict.keys()):
+            if "Hmag" in init_dict:
                 Hmag = init_dict["Hmag"]
-            if "mat_type" in list(init_dict.keys()):
+            if "mat_type" in init_dict:
                 mat_type = init_dict["mat_type"]
-            if "type_magnetization" in list(init_dict.keys()):
+            if "type_magnetization" in init_dict:
                 type_magnetization = init_dict["type_magnetization"]
-            if "Lmag" in list(init_dict.keys()):
+            if "Lmag" in init_dict:
                 Lmag = init_dict["Lmag"]
         # Initialisation by argument
         self.Wmag = Wmag
@@ -145,12 +99,15 @@ class MagnetType10(MagnetFlat):
             return False
         return True
 
-    def as_dict(self):
+    def as_dict(self, is_keep_array=False):
         """Convert this objet in a json seriable dict (can be use in __init__)
+        The ndarray are not converted to list if is_keep_array
         """
 
         # Get the properties inherited from MagnetFlat
-        MagnetType10_dict = super(MagnetType10, self).as_dict()
+        MagnetType10_dict = super(MagnetType10, self).as_dict(
+            is_keep_array=is_keep_array
+        )
         MagnetType10_dict["Wmag"] = self.Wmag
         MagnetType10_dict["Hmag"] = self.Hmag
         # The class name is added to the dict fordeserialisation purpose
@@ -158,6 +115,14 @@ class MagnetType10(MagnetFlat):
         MagnetType10_dict["__class__"] = "MagnetType10"
         return MagnetType10_dict
 
+    def _copy_to(self, obj):
+        """Copy the properties of this object in obj (called by copy)"""
+
+        # Copy the properties inherited from MagnetFlat
+        super(MagnetType10, self)._copy_to(obj)
+        obj._Wmag = self._Wmag
+        obj._Hmag = self._Hmag
+
     def _set_None(self):
         """Set all the properties to None (except pyleecan object)"""
 
@@ -174,6 +139,7 @@ class MagnetType10(MagnetFlat):
         """setter of Wmag"""
         check_var("Wmag", value, "float", Vmin=0)
         self._Wmag = value
+        self._clear_memo()
 
     # magnet bottom width [m]
     # Type : float, min = 0
@@ -187,6 +153,7 @@ class MagnetType10(MagnetFlat):
         """setter of Hmag"""
         check_var("Hmag", value, "float", Vmin=0)
         self._Hmag = value
+        self._clear_memo()
 
     # magnet radial height [m]
     # Type : float, min = 0
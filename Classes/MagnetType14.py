@@ -4,23 +4,11 @@ WARNING! All changes made in this file will be lost!
 """
 
 from os import linesep
-from pyleecan.Classes._check import check_init_dict, check_var, raise_
+from pyleecan.Classes._check import check_init_dict, check_var
 from pyleecan.Functions.save import save
 from pyleecan.Classes.MagnetPolar import MagnetPolar
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from pyleecan.Methods.Machine.MagnetType14.build_geometry import build_geometry
-except ImportError as error:
-    build_geometry = error
-
-try:
-    from pyleecan.Methods.Machine.MagnetType14.comp_height import comp_height
-except ImportError as error:
-    comp_height = error
-
-
+from pyleecan.Classes._lazy import LazyMethod
 from pyleecan.Classes._check import InitUnKnowClassError
 from pyleecan.Classes.Material import Material
 
@@ -32,30 +20,10 @@ class MagnetType14(MagnetPolar):
     IS_FLAT_BOT = 0
     IS_FLAT_TOP = 0
 
-    # Check ImportError to remove unnecessary dependencies in unused method
     # cf Methods.Machine.MagnetType14.build_geometry
-    if isinstance(build_geometry, ImportError):
-        build_geometry = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use MagnetType14 method build_geometry: "
-                    + str(build_geometry)
-                )
-            )
-        )
-    else:
-        build_geometry = build_geometry
+    build_geometry = LazyMethod("pyleecan.Methods.Machine.MagnetType14.build_geometry")
     # cf Methods.Machine.MagnetType14.comp_height
-    if isinstance(comp_height, ImportError):
-        comp_height = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use MagnetType14 method comp_height: " + str(comp_height)
-                )
-            )
-        )
-    else:
-        comp_height = comp_height
+    comp_height = LazyMethod("pyleecan.Methods.Machine.MagnetType14.comp_height")
     # save method is available in all object
     save = save
 
@@ -86,17 +54,17 @@ class MagnetType14(MagnetPolar):
                 ["Wmag", "Hmag", "Rtop", "mat_type", "type_magnetization", "Lmag"],
             )
             # Overwrite default value with init_dict content
-            if "Wmag" in list(init_dict.keys()):
+            if "Wmag" in init_dict:
                 Wmag = init_dict["Wmag"]
-            if "Hmag" in list(init_dict.keys()):
+            if "Hmag" in init_dict:
                 Hmag = init_dict["Hmag"]
-            if "Rtop" in list(init_dict.keys()):
+            if "Rtop" in init_dict:
                 Rtop = init_dict["Rtop"]
-            if "mat_type" in list(init_dict.keys()):
+            if "mat_type" in init_dict:
                 mat_type = init_dict["mat_type"]
-            if "type_magnetization" in list(init_dict.keys()):
+            if "type_magnetization" in init_dict:
                 type_magnetization = init_dict["type_magnetization"]
-            if "Lmag" in list(init_dict.keys()):
+            if "Lmag" in init_dict:
                 Lmag = init_dict["Lmag"]
         # Initialisation by argument
         self.Wmag = Wmag
@@ -137,12 +105,15 @@ class MagnetType14(MagnetPolar):
             return False
         return True
 
-    def as_dict(self):
+    def as_dict(self, is_keep_array=False):
         """Convert this objet in a json seriable dict (can be use in __init__)
+        The ndarray are not converted to list if is_keep_array
         """
 
         # Get the properties inherited from MagnetPolar
-        MagnetType14_dict = super(MagnetType14, self).as_dict()
+        MagnetType14_dict = super(MagnetType14, self).as_dict(
+            is_keep_array=is_keep_array
+        )
         MagnetType14_dict["Wmag"] = self.Wmag
         MagnetType14_dict["Hmag"] = self.Hmag
         MagnetType14_dict["Rtop"] = self.Rtop
@@ -151,6 +122,15 @@ class MagnetType14(MagnetPolar):
         MagnetType14_dict["__class__"] = "MagnetType14"
         return MagnetType14_dict
 
+    def _copy_to(self, obj):
+        """Copy the properties of this object in obj (called by copy)"""
+
+        # Copy the properties inherited from MagnetPolar
+        super(MagnetType14, self)._copy_to(obj)
+        obj._Wmag = self._Wmag
+        obj._Hmag = self._Hmag
+        obj._Rtop = self._Rtop
+
     def _set_None(self):
         """Set all the properties to None (except pyleecan object)"""
 
@@ -168,6 +148,7 @@ class MagnetType14(MagnetPolar):
         """setter of Wmag"""
         check_var("Wmag", value, "float", Vmin=0)
         self._Wmag = value
+        self._clear_memo()
 
     # magnet bottom width [rad]
     # Type : float, min = 0
@@ -183,6 +164,7 @@ class MagnetType14(MagnetPolar):
         """setter of Hmag"""
         check_var("Hmag", value, "float", Vmin=0)
         self._Hmag = value
+        self._clear_memo()
 
     # magnet radial height [m]
     # Type : float, min = 0
@@ -196,6 +178,7 @@ class MagnetType14(MagnetPolar):
         """setter of Rtop"""
         check_var("Rtop", value, "float", Vmin=0)
         self._Rtop = value
+        self._clear_memo()
 
     # radius of the circular top shape [m]
     # Type : float, min = 0
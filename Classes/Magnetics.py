@@ -4,28 +4,11 @@ WARNING! All changes made in this file will be lost!
 """
 
 from os import linesep
-from pyleecan.Classes._check import check_init_dict, check_var, raise_
+from pyleecan.Classes._check import check_init_dict, check_var
 from pyleecan.Functions.save import save
 from pyleecan.Classes._frozen import FrozenClass
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from pyleecan.Methods.Simulation.Magnetics.run import run
-except ImportError as error:
-    run = error
-
-try:
-    from pyleecan.Methods.Simulation.Magnetics.comp_time_angle import comp_time_angle
-except ImportError as error:
-    comp_time_angle = error
-
-try:
-    from pyleecan.Methods.Simulation.Magnetics.comp_emf import comp_emf
-except ImportError as error:
-    comp_emf = error
-
-
+from pyleecan.Classes._lazy import LazyMethod
 from pyleecan.Classes._check import InitUnKnowClassError
 
 
@@ -34,37 +17,14 @@ class Magnetics(FrozenClass):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
     # cf Methods.Simulation.Magnetics.run
-    if isinstance(run, ImportError):
-        run = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Magnetics method run: " + str(run))
-            )
-        )
-    else:
-        run = run
+    run = LazyMethod("pyleecan.Methods.Simulation.Magnetics.run")
     # cf Methods.Simulation.Magnetics.comp_time_angle
-    if isinstance(comp_time_angle, ImportError):
-        comp_time_angle = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Magnetics method comp_time_angle: "
-                    + str(comp_time_angle)
-                )
-            )
-        )
-    else:
-        comp_time_angle = comp_time_angle
+    comp_time_angle = LazyMethod(
+        "pyleecan.Methods.Simulation.Magnetics.comp_time_angle"
+    )
     # cf Methods.Simulation.Magnetics.comp_emf
-    if isinstance(comp_emf, ImportError):
-        comp_emf = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Magnetics method comp_emf: " + str(comp_emf))
-            )
-        )
-    else:
-        comp_emf = comp_emf
+    comp_emf = LazyMethod("pyleecan.Methods.Simulation.Magnetics.comp_emf")
     # save method is available in all object
     save = save
 
@@ -114,31 +74,31 @@ class Magnetics(FrozenClass):
                 ],
             )
             # Overwrite default value with init_dict content
-            if "is_remove_slotS" in list(init_dict.keys()):
+            if "is_remove_slotS" in init_dict:
                 is_remove_slotS = init_dict["is_remove_slotS"]
-            if "is_remove_slotR" in list(init_dict.keys()):
+            if "is_remove_slotR" in init_dict:
                 is_remove_slotR = init_dict["is_remove_slotR"]
-            if "is_remove_vent" in list(init_dict.keys()):
+            if "is_remove_vent" in init_dict:
                 is_remove_vent = init_dict["is_remove_vent"]
-            if "is_mmfs" in list(init_dict.keys()):
+            if "is_mmfs" in init_dict:
                 is_mmfs = init_dict["is_mmfs"]
-            if "is_mmfr" in list(init_dict.keys()):
+            if "is_mmfr" in init_dict:
                 is_mmfr = init_dict["is_mmfr"]
-            if "is_stator_linear_BH" in list(init_dict.keys()):
+            if "is_stator_linear_BH" in init_dict:
                 is_stator_linear_BH = init_dict["is_stator_linear_BH"]
-            if "is_rotor_linear_BH" in list(init_dict.keys()):
+            if "is_rotor_linear_BH" in init_dict:
                 is_rotor_linear_BH = init_dict["is_rotor_linear_BH"]
-            if "is_symmetry_t" in list(init_dict.keys()):
+            if "is_symmetry_t" in init_dict:
                 is_symmetry_t = init_dict["is_symmetry_t"]
-            if "sym_t" in list(init_dict.keys()):
+            if "sym_t" in init_dict:
                 sym_t = init_dict["sym_t"]
-            if "is_antiper_t" in list(init_dict.keys()):
+            if "is_antiper_t" in init_dict:
                 is_antiper_t = init_dict["is_antiper_t"]
-            if "is_symmetry_a" in list(init_dict.keys()):
+            if "is_symmetry_a" in init_dict:
                 is_symmetry_a = init_dict["is_symmetry_a"]
-            if "sym_a" in list(init_dict.keys()):
+            if "sym_a" in init_dict:
                 sym_a = init_dict["sym_a"]
-            if "is_antiper_a" in list(init_dict.keys()):
+            if "is_antiper_a" in init_dict:
                 is_antiper_a = init_dict["is_antiper_a"]
         # Initialisation by argument
         self.parent = None
@@ -219,8 +179,9 @@ class Magnetics(FrozenClass):
             return False
         return True
 
-    def as_dict(self):
+    def as_dict(self, is_keep_array=False):
         """Convert this objet in a json seriable dict (can be use in __init__)
+        The ndarray are not converted to list if is_keep_array
         """
 
         Magnetics_dict = dict()
@@ -241,6 +202,23 @@ class Magnetics(FrozenClass):
         Magnetics_dict["__class__"] = "Magnetics"
         return Magnetics_dict
 
+    def _copy_to(self, obj):
+        """Copy the properties of this object in obj (called by copy)"""
+
+        obj._is_remove_slotS = self._is_remove_slotS
+        obj._is_remove_slotR = self._is_remove_slotR
+        obj._is_remove_vent = self._is_remove_vent
+        obj._is_mmfs = self._is_mmfs
+        obj._is_mmfr = self._is_mmfr
+        obj._is_stator_linear_BH = self._is_stator_linear_BH
+        obj._is_rotor_linear_BH = self._is_rotor_linear_BH
+        obj._is_symmetry_t = self._is_symmetry_t
+        obj._sym_t = self._sym_t
+        obj._is_antiper_t = self._is_antiper_t
+        obj._is_symmetry_a = self._is_symmetry_a
+        obj._sym_a = self._sym_a
+        obj._is_antiper_a = self._is_antiper_a
+
     def _set_None(self):
         """Set all the properties to None (except pyleecan object)"""
 
@@ -266,6 +244,7 @@ class Magnetics(FrozenClass):
         """setter of is_remove_slotS"""
         check_var("is_remove_slotS", value, "bool")
         self._is_remove_slotS = value
+        self._clear_memo()
 
     # 1 to artificially remove stator slotting effects in permeance mmf calculations
     # Type : bool
@@ -283,6 +262,7 @@ class Magnetics(FrozenClass):
         """setter of is_remove_slotR"""
         check_var("is_remove_slotR", value, "bool")
         self._is_remove_slotR = value
+        self._clear_memo()
 
     # 1 to artificially remove rotor slotting effects in permeance mmf calculations
     # Type : bool
@@ -300,6 +280,7 @@ class Magnetics(FrozenClass):
         """setter of is_remove_vent"""
         check_var("is_remove_vent", value, "bool")
         self._is_remove_vent = value
+        self._clear_memo()
 
     # 1 to artificially remove the ventilations duct
     # Type : bool
@@ -317,6 +298,7 @@ class Magnetics(FrozenClass):
         """setter of is_mmfs"""
         check_var("is_mmfs", value, "bool")
         self._is_mmfs = value
+        self._clear_memo()
 
     # 1 to compute the stator magnetomotive force / stator armature magnetic field
     # Type : bool
@@ -334,6 +316,7 @@ class Magnetics(FrozenClass):
         """setter of is_mmfr"""
         check_var("is_mmfr", value, "bool")
         self._is_mmfr = value
+        self._clear_memo()
 
     # 1 to compute the rotor magnetomotive force / rotor magnetic field
     # Type : bool
@@ -351,6 +334,7 @@ class Magnetics(FrozenClass):
         """setter of is_stator_linear_BH"""
         check_var("is_stator_linear_BH", value, "int", Vmin=0, Vmax=2)
         self._is_stator_linear_BH = value
+        self._clear_memo()
 
     # 0 to use the B(H) curve, 1 to use linear B(H) curve according to mur_lin, 2 to enforce infinite permeability (mur_lin =100000)
     # Type : int, min = 0, max = 2
@@ -368,6 +352,7 @@ class Magnetics(FrozenClass):
         """setter of is_rotor_linear_BH"""
         check_var("is_rotor_linear_BH", value, "int", Vmin=0, Vmax=2)
         self._is_rotor_linear_BH = value
+        self._clear_memo()
 
     # 0 to use the B(H) curve, 1 to use linear B(H) curve according to mur_lin, 2 to enforce infinite permeability (mur_lin =100000)
     # Type : int, min = 0, max = 2
@@ -385,6 +370,7 @@ class Magnetics(FrozenClass):
         """setter of is_symmetry_t"""
         check_var("is_symmetry_t", value, "bool")
         self._is_symmetry_t = value
+        self._clear_memo()
 
     # 0 Compute on the complete time vector, 1 compute according to sym_t and is_antiper_t
     # Type : bool
@@ -402,6 +388,7 @@ class Magnetics(FrozenClass):
         """setter of sym_t"""
         check_var("sym_t", value, "int", Vmin=1)
         self._sym_t = value
+        self._clear_memo()
 
     # Number of symmetry for the time vector
     # Type : int, min = 1
@@ -419,6 +406,7 @@ class Magnetics(FrozenClass):
         """setter of is_antiper_t"""
         check_var("is_antiper_t", value, "bool")
         self._is_antiper_t = value
+        self._clear_memo()
 
     # To add an antiperiodicity to the time vector
     # Type : bool
@@ -436,6 +424,7 @@ class Magnetics(FrozenClass):
         """setter of is_symmetry_a"""
         check_var("is_symmetry_a", value, "bool")
         self._is_symmetry_a = value
+        self._clear_memo()
 
     # 0 Compute on the complete machine, 1 compute according to sym_a and is_antiper_a
     # Type : bool
@@ -453,6 +442,7 @@ class Magnetics(FrozenClass):
         """setter of sym_a"""
         check_var("sym_a", value, "int", Vmin=1)
         self._sym_a = value
+        self._clear_memo()
 
     # Number of symmetry for the angle vector
     # Type : int, min = 1
@@ -470,6 +460,7 @@ class Magnetics(FrozenClass):
         """setter of is_antiper_a"""
         check_var("is_antiper_a", value, "bool")
         self._is_antiper_a = value
+        self._clear_memo()
 
     # To add an antiperiodicity to the angle vector
     # Type : bool
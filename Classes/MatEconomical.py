@@ -4,7 +4,7 @@ WARNING! All changes made in this file will be lost!
 """
 
 from os import linesep
-from pyleecan.Classes._check import check_init_dict, check_var, raise_
+from pyleecan.Classes._check import check_init_dict, check_var
 from pyleecan.Functions.save import save
 from pyleecan.Classes._frozen import FrozenClass
 
@@ -32,9 +32,9 @@ class MatEconomical(FrozenClass):
         if init_dict is not None:  # Initialisation by dict
             check_init_dict(init_dict, ["cost_unit", "unit_name"])
             # Overwrite default value with init_dict content
-            if "cost_unit" in list(init_dict.keys()):
+            if "cost_unit" in init_dict:
                 cost_unit = init_dict["cost_unit"]
-            if "unit_name" in list(init_dict.keys()):
+            if "unit_name" in init_dict:
                 unit_name = init_dict["unit_name"]
         # Initialisation by argument
         self.parent = None
@@ -69,8 +69,9 @@ class MatEconomical(FrozenClass):
             return False
         return True
 
-    def as_dict(self):
+    def as_dict(self, is_keep_array=False):
         """Convert this objet in a json seriable dict (can be use in __init__)
+        The ndarray are not converted to list if is_keep_array
         """
 
         MatEconomical_dict = dict()
@@ -80,6 +81,12 @@ class MatEconomical(FrozenClass):
         MatEconomical_dict["__class__"] = "MatEconomical"
         return MatEconomical_dict
 
+    def _copy_to(self, obj):
+        """Copy the properties of this object in obj (called by copy)"""
+
+        obj._cost_unit = self._cost_unit
+        obj._unit_name = self._unit_name
+
     def _set_None(self):
         """Set all the properties to None (except pyleecan object)"""
 
@@ -94,6 +101,7 @@ class MatEconomical(FrozenClass):
         """setter of cost_unit"""
         check_var("cost_unit", value, "float", Vmin=0)
         self._cost_unit = value
+        self._clear_memo()
 
     # Cost of one kilo of material
     # Type : float, min = 0
@@ -111,6 +119,7 @@ class MatEconomical(FrozenClass):
         """setter of unit_name"""
         check_var("unit_name", value, "str")
         self._unit_name = value
+        self._clear_memo()
 
     # Name of the unit
     # Type : str
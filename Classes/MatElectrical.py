@@ -4,7 +4,7 @@ WARNING! All changes made in this file will be lost!
 """
 
 from os import linesep
-from pyleecan.Classes._check import check_init_dict, check_var, raise_
+from pyleecan.Classes._check import check_init_dict, check_var
 from pyleecan.Functions.save import save
 from pyleecan.Classes._frozen import FrozenClass
 
@@ -32,11 +32,11 @@ class MatElectrical(FrozenClass):
         if init_dict is not None:  # Initialisation by dict
             check_init_dict(init_dict, ["rho", "epsr", "alpha"])
             # Overwrite default value with init_dict content
-            if "rho" in list(init_dict.keys()):
+            if "rho" in init_dict:
                 rho = init_dict["rho"]
-            if "epsr" in list(init_dict.keys()):
+            if "epsr" in init_dict:
                 epsr = init_dict["epsr"]
-            if "alpha" in list(init_dict.keys()):
+            if "alpha" in init_dict:
                 alpha = init_dict["alpha"]
         # Initialisation by argument
         self.parent = None
@@ -75,8 +75,9 @@ class MatElectrical(FrozenClass):
             return False
         return True
 
-    def as_dict(self):
+    def as_dict(self, is_keep_array=False):
         """Convert this objet in a json seriable dict (can be use in __init__)
+        The ndarray are not converted to list if is_keep_array
         """
 
         MatElectrical_dict = dict()
@@ -87,6 +88,13 @@ class MatElectrical(FrozenClass):
         MatElectrical_dict["__class__"] = "MatElectrical"
         return MatElectrical_dict
 
+    def _copy_to(self, obj):
+        """Copy the properties of this object in obj (called by copy)"""
+
+        obj._rho = self._rho
+        obj._epsr = self._epsr
+        obj._alpha = self._alpha
+
     def _set_None(self):
         """Set all the properties to None (except pyleecan object)"""
 
@@ -102,6 +110,7 @@ class MatElectrical(FrozenClass):
         """setter of rho"""
         check_var("rho", value, "float", Vmin=0)
         self._rho = value
+        self._clear_memo()
 
     # Resistivity at 20 deg C
     # Type : float, min = 0
@@ -115,6 +124,7 @@ class MatElectrical(FrozenClass):
         """setter of epsr"""
         check_var("epsr", value, "float", Vmin=0)
         self._epsr = value
+        self._clear_memo()
 
     # Relative dielectric constant
     # Type : float, min = 0
@@ -130,6 +140,7 @@ class MatElectrical(FrozenClass):
         """setter of alpha"""
         check_var("alpha", value, "float", Vmin=0)
         self._alpha = value
+        self._clear_memo()
 
     # Thermal Coefficient
     # Type : float, min = 0
@@ -4,7 +4,7 @@ WARNING! All changes made in this file will be lost!
 """
 
 from os import linesep
-from pyleecan.Classes._check import check_init_dict, check_var, raise_
+from pyleecan.Classes._check import check_init_dict, check_var
 from pyleecan.Functions.save import save
 from pyleecan.Classes._frozen import FrozenClass
 
@@ -36,15 +36,15 @@ class MatHT(FrozenClass):
                 init_dict, ["lambda_x", "lambda_y", "lambda_z", "Cp", "alpha"]
             )
             # Overwrite default value with init_dict content
-            if "lambda_x" in list(init_dict.keys()):
+            if "lambda_x" in init_dict:
                 lambda_x = init_dict["lambda_x"]
-            if "lambda_y" in list(init_dict.keys()):
+            if "lambda_y" in init_dict:
                 lambda_y = init_dict["lambda_y"]
-            if "lambda_z" in list(init_dict.keys()):
+            if "lambda_z" in init_dict:
                 lambda_z = init_dict["lambda_z"]
-            if "Cp" in list(init_dict.keys()):
+            if "Cp" in init_dict:
                 Cp = init_dict["Cp"]
-            if "alpha" in list(init_dict.keys()):
+            if "alpha" in init_dict:
                 alpha = init_dict["alpha"]
         # Initialisation by argument
         self.parent = None
@@ -89,8 +89,9 @@ class MatHT(FrozenClass):
             return False
         return True
 
-    def as_dict(self):
+    def as_dict(self, is_keep_array=False):
         """Convert this objet in a json seriable dict (can be use in __init__)
+        The ndarray are not converted to list if is_keep_array
         """
 
         MatHT_dict = dict()
@@ -103,6 +104,15 @@ class MatHT(FrozenClass):
         MatHT_dict["__class__"] = "MatHT"
         return MatHT_dict
 
+    def _copy_to(self, obj):
+        """Copy the properties of this object in obj (called by copy)"""
+
+        obj._lambda_x = self._lambda_x
+        obj._lambda_y = self._lambda_y
+        obj._lambda_z = self._lambda_z
+        obj._Cp = self._Cp
+        obj._alpha = self._alpha
+
     def _set_None(self):
         """Set all the properties to None (except pyleecan object)"""
 
@@ -120,6 +130,7 @@ class MatHT(FrozenClass):
         """setter of lambda_x"""
         check_var("lambda_x", value, "float", Vmin=0)
         self._lambda_x = value
+        self._clear_memo()
 
     # thermal conductivity (XY is lamination plane, Z is rotation axis)
     # Type : float, min = 0
@@ -137,6 +148,7 @@ class MatHT(FrozenClass):
         """setter of lambda_y"""
         check_var("lambda_y", value, "float", Vmin=0)
         self._lambda_y = value
+        self._clear_memo()
 
     # thermal conductivity (XY is lamination plane, Z is rotation axis)
     # Type : float, min = 0
@@ -154,6 +166,7 @@ class MatHT(FrozenClass):
         """setter of lambda_z"""
         check_var("lambda_z", value, "float", Vmin=0)
         self._lambda_z = value
+        self._clear_memo()
 
     # thermal conductivity (XY is lamination plane, Z is rotation axis)
     # Type : float, min = 0
@@ -171,6 +184,7 @@ class MatHT(FrozenClass):
         """setter of Cp"""
         check_var("Cp", value, "float", Vmin=0)
         self._Cp = value
+        self._clear_memo()
 
     # specific heat capacity
     # Type : float, min = 0
@@ -184,6 +198,7 @@ class MatHT(FrozenClass):
         """setter of alpha"""
         check_var("alpha", value, "float", Vmin=0)
         self._alpha = value
+        self._clear_memo()
 
     # thermal expansion coefficient
     # Type : float, min = 0
@@ -4,23 +4,11 @@ WARNING! All changes made in this file will be lost!
 """
 
 from os import linesep
-from pyleecan.Classes._check import check_init_dict, check_var, raise_
+from pyleecan.Classes._check import check_init_dict, check_var
 from pyleecan.Functions.save import save
 from pyleecan.Classes._frozen import FrozenClass
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from pyleecan.Methods.Material.MatMagnetics.get_BH import get_BH
-except ImportError as error:
-    get_BH = error
-
-try:
-    from pyleecan.Methods.Material.MatMagnetics.plot_BH import plot_BH
-except ImportError as error:
-    plot_BH = error
-
-
+from pyleecan.Classes._lazy import LazyInit, LazyMethod
 from pyleecan.Classes._check import InitUnKnowClassError
 from pyleecan.Classes.ImportMatrix import ImportMatrix
 
@@ -30,25 +18,10 @@ class MatMagnetics(FrozenClass):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
     # cf Methods.Material.MatMagnetics.get_BH
-    if isinstance(get_BH, ImportError):
-        get_BH = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use MatMagnetics method get_BH: " + str(get_BH))
-            )
-        )
-    else:
-        get_BH = get_BH
+    get_BH = LazyMethod("pyleecan.Methods.Material.MatMagnetics.get_BH")
     # cf Methods.Material.MatMagnetics.plot_BH
-    if isinstance(plot_BH, ImportError):
-        plot_BH = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use MatMagnetics method plot_BH: " + str(plot_BH))
-            )
-        )
-    else:
-        plot_BH = plot_BH
+    plot_BH = LazyMethod("pyleecan.Methods.Material.MatMagnetics.plot_BH")
     # save method is available in all object
     save = save
 
@@ -71,17 +44,17 @@ class MatMagnetics(FrozenClass):
                 init_dict, ["mur_lin", "Hc", "Brm20", "alpha_Br", "Wlam", "BH_curve"]
             )
             # Overwrite default value with init_dict content
-            if "mur_lin" in list(init_dict.keys()):
+            if "mur_lin" in init_dict:
                 mur_lin = init_dict["mur_lin"]
-            if "Hc" in list(init_dict.keys()):
+            if "Hc" in init_dict:
                 Hc = init_dict["Hc"]
-            if "Brm20" in list(init_dict.keys()):
+            if "Brm20" in init_dict:
                 Brm20 = init_dict["Brm20"]
-            if "alpha_Br" in list(init_dict.keys()):
+            if "alpha_Br" in init_dict:
                 alpha_Br = init_dict["alpha_Br"]
-            if "Wlam" in list(init_dict.keys()):
+            if "Wlam" in init_dict:
                 Wlam = init_dict["Wlam"]
-            if "BH_curve" in list(init_dict.keys()):
+            if "BH_curve" in init_dict:
                 BH_curve = init_dict["BH_curve"]
         # Initialisation by argument
         self.parent = None
@@ -157,8 +130,9 @@ class MatMagnetics(FrozenClass):
             return False
         return True
 
-    def as_dict(self):
+    def as_dict(self, is_keep_array=False):
         """Convert this objet in a json seriable dict (can be use in __init__)
+        The ndarray are not converted to list if is_keep_array
         """
 
         MatMagnetics_dict = dict()
@@ -170,11 +144,27 @@ class MatMagnetics(FrozenClass):
         if self.BH_curve is None:
             MatMagnetics_dict["BH_curve"] = None
         else:
-            MatMagnetics_dict["BH_curve"] = self.BH_curve.as_dict()
+            MatMagnetics_dict["BH_curve"] = self.BH_curve.as_dict(
+                is_keep_array=is_keep_array
+            )
         # The class name is added to the dict fordeserialisation purpose
         MatMagnetics_dict["__class__"] = "MatMagnetics"
         return MatMagnetics_dict
 
+    def _copy_to(self, obj):
+        """Copy the properties of this object in obj (called by copy)"""
+
+        obj._mur_lin = self._mur_lin
+        obj._Hc = self._Hc
+        obj._Brm20 = self._Brm20
+        obj._alpha_Br = self._alpha_Br
+        obj._Wlam = self._Wlam
+        if self._BH_curve is None:
+            obj._BH_curve = None
+        else:
+            obj._BH_curve = self._BH_curve.copy()
+            obj._BH_curve.parent = obj
+
     def _set_None(self):
         """Set all the properties to None (except pyleecan object)"""
 
@@ -194,6 +184,7 @@ class MatMagnetics(FrozenClass):
         """setter of mur_lin"""
         check_var("mur_lin", value, "float", Vmin=0)
         self._mur_lin = value
+        self._clear_memo()
 
     # Relative magnetic permeability
     # Type : float, min = 0
@@ -209,6 +200,7 @@ class MatMagnetics(FrozenClass):
         """setter of Hc"""
         check_var("Hc", value, "float", Vmin=0)
         self._Hc = value
+        self._clear_memo()
 
     # Coercitivity field
     # Type : float, min = 0
@@ -222,6 +214,7 @@ class MatMagnetics(FrozenClass):
         """setter of Brm20"""
         check_var("Brm20", value, "float")
         self._Brm20 = value
+        self._clear_memo()
 
     # magnet remanence induction at 20degC
     # Type : float
@@ -239,6 +232,7 @@ class MatMagnetics(FrozenClass):
         """setter of alpha_Br"""
         check_var("alpha_Br", value, "float")
         self._alpha_Br = value
+        self._clear_memo()
 
     # temperature coefficient for remanent flux density /degC compared to 20degC
     # Type : float
@@ -256,6 +250,7 @@ class MatMagnetics(FrozenClass):
         """setter of Wlam"""
         check_var("Wlam", value, "float", Vmin=0)
         self._Wlam = value
+        self._clear_memo()
 
     # lamination sheet width without insulation [m] (0 == not laminated)
     # Type : float, min = 0
@@ -267,12 +262,16 @@ class MatMagnetics(FrozenClass):
 
     def _get_BH_curve(self):
         """getter of BH_curve"""
+        if isinstance(self._BH_curve, LazyInit):
+            # Create the object of a lazy load
+            self._set_BH_curve(self._BH_curve.resolve())
         return self._BH_curve
 
     def _set_BH_curve(self, value):
         """setter of BH_curve"""
         check_var("BH_curve", value, "ImportMatrix")
         self._BH_curve = value
+        self._clear_memo()
 
         if self._BH_curve is not None:
             self._BH_curve.parent = self
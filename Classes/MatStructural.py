@@ -4,7 +4,7 @@ WARNING! All changes made in this file will be lost!
 """
 
 from os import linesep
-from pyleecan.Classes._check import check_init_dict, check_var, raise_
+from pyleecan.Classes._check import check_init_dict, check_var
 from pyleecan.Functions.save import save
 from pyleecan.Classes._frozen import FrozenClass
 
@@ -59,25 +59,25 @@ class MatStructural(FrozenClass):
                 ],
             )
             # Overwrite default value with init_dict content
-            if "rho" in list(init_dict.keys()):
+            if "rho" in init_dict:
                 rho = init_dict["rho"]
-            if "Ex" in list(init_dict.keys()):
+            if "Ex" in init_dict:
                 Ex = init_dict["Ex"]
-            if "Ey" in list(init_dict.keys()):
+            if "Ey" in init_dict:
                 Ey = init_dict["Ey"]
-            if "Ez" in list(init_dict.keys()):
+            if "Ez" in init_dict:
                 Ez = init_dict["Ez"]
-            if "nu_xy" in list(init_dict.keys()):
+            if "nu_xy" in init_dict:
                 nu_xy = init_dict["nu_xy"]
-            if "nu_xz" in list(init_dict.keys()):
+            if "nu_xz" in init_dict:
                 nu_xz = init_dict["nu_xz"]
-            if "nu_yz" in list(init_dict.keys()):
+            if "nu_yz" in init_dict:
                 nu_yz = init_dict["nu_yz"]
-            if "Gxz" in list(init_dict.keys()):
+            if "Gxz" in init_dict:
                 Gxz = init_dict["Gxz"]
-            if "Gxy" in list(init_dict.keys()):
+            if "Gxy" in init_dict:
                 Gxy = init_dict["Gxy"]
-            if "Gyz" in list(init_dict.keys()):
+            if "Gyz" in init_dict:
                 Gyz = init_dict["Gyz"]
         # Initialisation by argument
         self.parent = None
@@ -144,8 +144,9 @@ class MatStructural(FrozenClass):
             return False
         return True
 
-    def as_dict(self):
+    def as_dict(self, is_keep_array=False):
         """Convert this objet in a json seriable dict (can be use in __init__)
+        The ndarray are not converted to list if is_keep_array
         """
 
         MatStructural_dict = dict()
@@ -163,6 +164,20 @@ class MatStructural(FrozenClass):
         MatStructural_dict["__class__"] = "MatStructural"
         return MatStructural_dict
 
+    def _copy_to(self, obj):
+        """Copy the properties of this object in obj (called by copy)"""
+
+        obj._rho = self._rho
+        obj._Ex = self._Ex
+        obj._Ey = self._Ey
+        obj._Ez = self._Ez
+        obj._nu_xy = self._nu_xy
+        obj._nu_xz = self._nu_xz
+        obj._nu_yz = self._nu_yz
+        obj._Gxz = self._Gxz
+        obj._Gxy = self._Gxy
+        obj._Gyz = self._Gyz
+
     def _set_None(self):
         """Set all the properties to None (except pyleecan object)"""
 
@@ -185,6 +200,7 @@ class MatStructural(FrozenClass):
         """setter of rho"""
         check_var("rho", value, "float", Vmin=0)
         self._rho = value
+        self._clear_memo()
 
     # mass per unit volume [kg/m3]
     # Type : float, min = 0
@@ -200,6 +216,7 @@ class MatStructural(FrozenClass):
         """setter of Ex"""
         check_var("Ex", value, "float", Vmin=0)
         self._Ex = value
+        self._clear_memo()
 
     # equivalent Young modulus (XY is lamination plane, Z is rotation axis)
     # Type : float, min = 0
@@ -217,6 +234,7 @@ class MatStructural(FrozenClass):
         """setter of Ey"""
         check_var("Ey", value, "float", Vmin=0)
         self._Ey = value
+        self._clear_memo()
 
     # equivalent Young modulus (XY is lamination plane, Z is rotation axis)
     # Type : float, min = 0
@@ -234,6 +252,7 @@ class MatStructural(FrozenClass):
         """setter of Ez"""
         check_var("Ez", value, "float", Vmin=0)
         self._Ez = value
+        self._clear_memo()
 
     # equivalent Young modulus (XY is lamination plane, Z is rotation axis)
     # Type : float, min = 0
@@ -251,6 +270,7 @@ class MatStructural(FrozenClass):
         """setter of nu_xy"""
         check_var("nu_xy", value, "float", Vmin=0)
         self._nu_xy = value
+        self._clear_memo()
 
     # equivalent Poisson ratio in the XY plane (XY is lamination plane, Z is rotation axis)
     # Type : float, min = 0
@@ -268,6 +288,7 @@ class MatStructural(FrozenClass):
         """setter of nu_xz"""
         check_var("nu_xz", value, "float", Vmin=0)
         self._nu_xz = value
+        self._clear_memo()
 
     # equivalent Poisson ratio in the XZ plane (XY is lamination plane, Z is rotation axis)
     # Type : float, min = 0
@@ -285,6 +306,7 @@ class MatStructural(FrozenClass):
         """setter of nu_yz"""
         check_var("nu_yz", value, "float", Vmin=0)
         self._nu_yz = value
+        self._clear_memo()
 
     # equivalent Poisson ratio in the YZ plane (XY is lamination plane, Z is rotation axis)
     # Type : float, min = 0
@@ -302,6 +324,7 @@ class MatStructural(FrozenClass):
         """setter of Gxz"""
         check_var("Gxz", value, "float", Vmin=0)
         self._Gxz = value
+        self._clear_memo()
 
     # shear modulus in XY plane (XY is lamination plane, Z is rotation axis)
     # Type : float, min = 0
@@ -319,6 +342,7 @@ class MatStructural(FrozenClass):
         """setter of Gxy"""
         check_var("Gxy", value, "float", Vmin=0)
         self._Gxy = value
+        self._clear_memo()
 
     # shear modulus in XZ plane (XY is lamination plane, Z is rotation axis)
     # Type : float, min = 0
@@ -336,6 +360,7 @@ class MatStructural(FrozenClass):
         """setter of Gyz"""
         check_var("Gyz", value, "float", Vmin=0)
         self._Gyz = value
+        self._clear_memo()
 
     # shear modulus in YZ plane (XY is lamination plane, Z is rotation axis)
     # Type : float, min = 0
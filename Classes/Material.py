@@ -4,10 +4,11 @@ WARNING! All changes made in this file will be lost!
 """
 
 from os import linesep
-from pyleecan.Classes._check import check_init_dict, check_var, raise_
+from pyleecan.Classes._check import check_init_dict, check_var
 from pyleecan.Functions.save import save
 from pyleecan.Classes._frozen import FrozenClass
 
+from pyleecan.Classes._lazy import LazyInit
 from pyleecan.Classes._check import InitUnKnowClassError
 from pyleecan.Classes.MatElectrical import MatElectrical
 from pyleecan.Classes.MatMagnetics import MatMagnetics
@@ -71,23 +72,23 @@ class Material(FrozenClass):
                 ],
             )
             # Overwrite default value with init_dict content
-            if "name" in list(init_dict.keys()):
+            if "name" in init_dict:
                 name = init_dict["name"]
-            if "is_isotropic" in list(init_dict.keys()):
+            if "is_isotropic" in init_dict:
                 is_isotropic = init_dict["is_isotropic"]
-            if "elec" in list(init_dict.keys()):
+            if "elec" in init_dict:
                 elec = init_dict["elec"]
-            if "mag" in list(init_dict.keys()):
+            if "mag" in init_dict:
                 mag = init_dict["mag"]
-            if "struct" in list(init_dict.keys()):
+            if "struct" in init_dict:
                 struct = init_dict["struct"]
-            if "HT" in list(init_dict.keys()):
+            if "HT" in init_dict:
                 HT = init_dict["HT"]
-            if "eco" in list(init_dict.keys()):
+            if "eco" in init_dict:
                 eco = init_dict["eco"]
-            if "desc" in list(init_dict.keys()):
+            if "desc" in init_dict:
                 desc = init_dict["desc"]
-            if "path" in list(init_dict.keys()):
+            if "path" in init_dict:
                 path = init_dict["path"]
         # Initialisation by argument
         self.parent = None
@@ -183,8 +184,9 @@ class Material(FrozenClass):
             return False
         return True
 
-    def as_dict(self):
+    def as_dict(self, is_keep_array=False):
         """Convert this objet in a json seriable dict (can be use in __init__)
+        The ndarray are not converted to list if is_keep_array
         """
 
         Material_dict = dict()
@@ -193,29 +195,62 @@ class Material(FrozenClass):
         if self.elec is None:
             Material_dict["elec"] = None
         else:
-            Material_dict["elec"] = self.elec.as_dict()
+            Material_dict["elec"] = self.elec.as_dict(is_keep_array=is_keep_array)
         if self.mag is None:
             Material_dict["mag"] = None
         else:
-            Material_dict["mag"] = self.mag.as_dict()
+            Material_dict["mag"] = self.mag.as_dict(is_keep_array=is_keep_array)
         if self.struct is None:
             Material_dict["struct"] = None
         else:
-            Material_dict["struct"] = self.struct.as_dict()
+            Material_dict["struct"] = self.struct.as_dict(is_keep_array=is_keep_array)
         if self.HT is None:
             Material_dict["HT"] = None
         else:
-            Material_dict["HT"] = self.HT.as_dict()
+            Material_dict["HT"] = self.HT.as_dict(is_keep_array=is_keep_array)
         if self.eco is None:
             Material_dict["eco"] = None
         else:
-            Material_dict["eco"] = self.eco.as_dict()
+            Material_dict["eco"] = self.eco.as_dict(is_keep_array=is_keep_array)
         Material_dict["desc"] = self.desc
         Material_dict["path"] = self.path
         # The class name is added to the dict fordeserialisation purpose
         Material_dict["__class__"] = "Material"
         return Material_dict
 
+    def _copy_to(self, obj):
+        """Copy the properties of this object in obj (called by copy)"""
+
+        obj._name = self._name
+        obj._is_isotropic = self._is_isotropic
+        if self._elec is None:
+            obj._elec = None
+        else:
+            obj._elec = self._elec.copy()
+            obj._elec.parent = obj
+        if self._mag is None:
+            obj._mag = None
+        else:
+            obj._mag = self._mag.copy()
+            obj._mag.parent = obj
+        if self._struct is None:
+            obj._struct = None
+        else:
+            obj._struct = self._struct.copy()
+            obj._struct.parent = obj
+        if self._HT is None:
+            obj._HT = None
+        else:
+            obj._HT = self._HT.copy()
+            obj._HT.parent = obj
+        if self._eco is None:
+            obj._eco = None
+        else:
+            obj._eco = self._eco.copy()
+            obj._eco.parent = obj
+        obj._desc = self._desc
+        obj._path = self._path
+
     def _set_None(self):
         """Set all the properties to None (except pyleecan object)"""
 
@@ -242,6 +277,7 @@ class Material(FrozenClass):
         """setter of name"""
         check_var("name", value, "str")
         self._name = value
+        self._clear_memo()
 
     # name of the material
     # Type : str
@@ -255,6 +291,7 @@ class Material(FrozenClass):
         """setter of is_isotropic"""
         check_var("is_isotropic", value, "bool")
         self._is_isotropic = value
+        self._clear_memo()
 
     # If True, uniformity in all orientations
     # Type : bool
@@ -266,12 +303,16 @@ class Material(FrozenClass):
 
     def _get_elec(self):
         """getter of elec"""
+        if isinstance(self._elec, LazyInit):
+            # Create the object of a lazy load
+            self._set_elec(self._elec.resolve())
         return self._elec
 
     def _set_elec(self, value):
         """setter of elec"""
         check_var("elec", value, "MatElectrical")
         self._elec = value
+        self._clear_memo()
 
         if self._elec is not None:
             self._elec.parent = self
@@ -284,12 +325,16 @@ class Material(FrozenClass):
 
     def _get_mag(self):
         """getter of mag"""
+        if isinstance(self._mag, LazyInit):
+            # Create the object of a lazy load
+            self._set_mag(self._mag.resolve())
         return self._mag
 
     def _set_mag(self, value):
         """setter of mag"""
         check_var("mag", value, "MatMagnetics")
         self._mag = value
+        self._clear_memo()
 
         if self._mag is not None:
             self._mag.parent = self
@@ -302,12 +347,16 @@ class Material(FrozenClass):
 
     def _get_struct(self):
         """getter of struct"""
+        if isinstance(self._struct, LazyInit):
+            # Create the object of a lazy load
+            self._set_struct(self._struct.resolve())
         return self._struct
 
     def _set_struct(self, value):
         """setter of struct"""
         check_var("struct", value, "MatStructural")
         self._struct = value
+        self._clear_memo()
 
         if self._struct is not None:
             self._struct.parent = self
@@ -322,12 +371,16 @@ class Material(FrozenClass):
 
     def _get_HT(self):
         """getter of HT"""
+        if isinstance(self._HT, LazyInit):
+            # Create the object of a lazy load
+            self._set_HT(self._HT.resolve())
         return self._HT
 
     def _set_HT(self, value):
         """setter of HT"""
         check_var("HT", value, "MatHT")
         self._HT = value
+        self._clear_memo()
 
         if self._HT is not None:
             self._HT.parent = self
@@ -340,12 +393,16 @@ class Material(FrozenClass):
 
     def _get_eco(self):
         """getter of eco"""
+        if isinstance(self._eco, LazyInit):
+            # Create the object of a lazy load
+            self._set_eco(self._eco.resolve())
         return self._eco
 
     def _set_eco(self, value):
         """setter of eco"""
         check_var("eco", value, "MatEconomical")
         self._eco = value
+        self._clear_memo()
 
         if self._eco is not None:
             self._eco.parent = self
@@ -364,6 +421,7 @@ class Material(FrozenClass):
         """setter of desc"""
         check_var("desc", value, "str")
         self._desc = value
+        self._clear_memo()
 
     # material description
     # Type : str
@@ -377,6 +435,7 @@ class Material(FrozenClass):
         """setter of path"""
         check_var("path", value, "str")
         self._path = value
+        self._clear_memo()
 
     # Path to the material file
     # Type : str
@@ -4,58 +4,11 @@ WARNING! All changes made in this file will be lost!
 """
 
 from os import linesep
-from pyleecan.Classes._check import check_init_dict, check_var, raise_
+from pyleecan.Classes._check import check_init_dict, check_var
 from pyleecan.Functions.save import save
 from pyleecan.Classes._frozen import FrozenClass
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from pyleecan.Methods.Mesh.Mesh.set_submesh import set_submesh
-except ImportError as error:
-    set_submesh = error
-
-try:
-    from pyleecan.Methods.Mesh.Mesh.get_all_node_coord import get_all_node_coord
-except ImportError as error:
-    get_all_node_coord = error
-
-try:
-    from pyleecan.Methods.Mesh.Mesh.add_element import add_element
-except ImportError as error:
-    add_element = error
-
-try:
-    from pyleecan.Methods.Mesh.Mesh.get_all_connectivity import get_all_connectivity
-except ImportError as error:
-    get_all_connectivity = error
-
-try:
-    from pyleecan.Methods.Mesh.Mesh.get_connectivity import get_connectivity
-except ImportError as error:
-    get_connectivity = error
-
-try:
-    from pyleecan.Methods.Mesh.Mesh.get_new_tag import get_new_tag
-except ImportError as error:
-    get_new_tag = error
-
-try:
-    from pyleecan.Methods.Mesh.Mesh.interface import interface
-except ImportError as error:
-    interface = error
-
-try:
-    from pyleecan.Methods.Mesh.Mesh.get_node_tags import get_node_tags
-except ImportError as error:
-    get_node_tags = error
-
-try:
-    from pyleecan.Methods.Mesh.Mesh.get_vertice import get_vertice
-except ImportError as error:
-    get_vertice = error
-
-
+from pyleecan.Classes._lazy import LazyInit, LazyMethod
 from pyleecan.Classes._check import InitUnKnowClassError
 from pyleecan.Classes.Element import Element
 from pyleecan.Classes.Node import Node
@@ -66,98 +19,24 @@ class Mesh(FrozenClass):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
     # cf Methods.Mesh.Mesh.set_submesh
-    if isinstance(set_submesh, ImportError):
-        set_submesh = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Mesh method set_submesh: " + str(set_submesh))
-            )
-        )
-    else:
-        set_submesh = set_submesh
+    set_submesh = LazyMethod("pyleecan.Methods.Mesh.Mesh.set_submesh")
     # cf Methods.Mesh.Mesh.get_all_node_coord
-    if isinstance(get_all_node_coord, ImportError):
-        get_all_node_coord = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Mesh method get_all_node_coord: "
-                    + str(get_all_node_coord)
-                )
-            )
-        )
-    else:
-        get_all_node_coord = get_all_node_coord
+    get_all_node_coord = LazyMethod("pyleecan.Methods.Mesh.Mesh.get_all_node_coord")
     # cf Methods.Mesh.Mesh.add_element
-    if isinstance(add_element, ImportError):
-        add_element = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Mesh method add_element: " + str(add_element))
-            )
-        )
-    else:
-        add_element = add_element
+    add_element = LazyMethod("pyleecan.Methods.Mesh.Mesh.add_element")
     # cf Methods.Mesh.Mesh.get_all_connectivity
-    if isinstance(get_all_connectivity, ImportError):
-        get_all_connectivity = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Mesh method get_all_connectivity: "
-                    + str(get_all_connectivity)
-                )
-            )
-        )
-    else:
-        get_all_connectivity = get_all_connectivity
+    get_all_connectivity = LazyMethod("pyleecan.Methods.Mesh.Mesh.get_all_connectivity")
     # cf Methods.Mesh.Mesh.get_connectivity
-    if isinstance(get_connectivity, ImportError):
-        get_connectivity = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Mesh method get_connectivity: " + str(get_connectivity)
-                )
-            )
-        )
-    else:
-        get_connectivity = get_connectivity
+    get_connectivity = LazyMethod("pyleecan.Methods.Mesh.Mesh.get_connectivity")
     # cf Methods.Mesh.Mesh.get_new_tag
-    if isinstance(get_new_tag, ImportError):
-        get_new_tag = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Mesh method get_new_tag: " + str(get_new_tag))
-            )
-        )
-    else:
-        get_new_tag = get_new_tag
+    get_new_tag = LazyMethod("pyleecan.Methods.Mesh.Mesh.get_new_tag")
     # cf Methods.Mesh.Mesh.interface
-    if isinstance(interface, ImportError):
-        interface = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Mesh method interface: " + str(interface))
-            )
-        )
-    else:
-        interface = interface
+    interface = LazyMethod("pyleecan.Methods.Mesh.Mesh.interface")
     # cf Methods.Mesh.Mesh.get_node_tags
-    if isinstance(get_node_tags, ImportError):
-        get_node_tags = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Mesh method get_node_tags: " + str(get_node_tags)
-                )
-            )
-        )
-    else:
-        get_node_tags = get_node_tags
+    get_node_tags = LazyMethod("pyleecan.Methods.Mesh.Mesh.get_node_tags")
     # cf Methods.Mesh.Mesh.get_vertice
-    if isinstance(get_vertice, ImportError):
-        get_vertice = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Mesh method get_vertice: " + str(get_vertice))
-            )
-        )
-    else:
-        get_vertice = get_vertice
+    get_vertice = LazyMethod("pyleecan.Methods.Mesh.Mesh.get_vertice")
     # save method is available in all object
     save = save
 
@@ -176,11 +55,11 @@ class Mesh(FrozenClass):
         if init_dict is not None:  # Initialisation by dict
             check_init_dict(init_dict, ["element", "node", "submesh"])
             # Overwrite default value with init_dict content
-            if "element" in list(init_dict.keys()):
+            if "element" in init_dict:
                 element = init_dict["element"]
-            if "node" in list(init_dict.keys()):
+            if "node" in init_dict:
                 node = init_dict["node"]
-            if "submesh" in list(init_dict.keys()):
+            if "submesh" in init_dict:
                 submesh = init_dict["submesh"]
         # Initialisation by argument
         self.parent = None
@@ -228,11 +107,11 @@ class Mesh(FrozenClass):
         if type(submesh) is list:
             for obj in submesh:
                 if obj is None:  # Default value
-                    self.submesh.append(Mesh())
+                    self._submesh.append(Mesh())
                 elif isinstance(obj, dict):
-                    self.submesh.append(Mesh(init_dict=obj))
+                    self._submesh.append(Mesh(init_dict=obj))
                 else:
-                    self.submesh.append(obj)
+                    self._submesh.append(obj)
         elif submesh is None:
             self.submesh = list()
         else:
@@ -285,25 +164,47 @@ class Mesh(FrozenClass):
             return False
         return True
 
-    def as_dict(self):
+    def as_dict(self, is_keep_array=False):
         """Convert this objet in a json seriable dict (can be use in __init__)
+        The ndarray are not converted to list if is_keep_array
         """
 
         Mesh_dict = dict()
         Mesh_dict["element"] = dict()
         for key, obj in self.element.items():
-            Mesh_dict["element"][key] = obj.as_dict()
+            Mesh_dict["element"][key] = obj.as_dict(is_keep_array=is_keep_array)
         if self.node is None:
             Mesh_dict["node"] = None
         else:
-            Mesh_dict["node"] = self.node.as_dict()
+            Mesh_dict["node"] = self.node.as_dict(is_keep_array=is_keep_array)
         Mesh_dict["submesh"] = list()
         for obj in self.submesh:
-            Mesh_dict["submesh"].append(obj.as_dict())
+            Mesh_dict["submesh"].append(obj.as_dict(is_keep_array=is_keep_array))
         # The class name is added to the dict fordeserialisation purpose
         Mesh_dict["__class__"] = "Mesh"
         return Mesh_dict
 
+    def _copy_to(self, obj):
+        """Copy the properties of this object in obj (called by copy)"""
+
+        obj._element = dict()
+        for key, value in self._element.items():
+            if value is not None:
+                value = value.copy()
+                value.parent = obj
+            obj._element[key] = value
+        if self._node is None:
+            obj._node = None
+        else:
+            obj._node = self._node.copy()
+            obj._node.parent = obj
+        obj._submesh = list()
+        for value in self._submesh:
+            if value is not None:
+                value = value.copy()
+                value.parent = obj
+            obj._submesh.append(value)
+
     def _set_None(self):
         """Set all the properties to None (except pyleecan object)"""
 
@@ -317,6 +218,10 @@ class Mesh(FrozenClass):
     def _get_element(self):
         """getter of element"""
         for key, obj in self._element.items():
+            if isinstance(obj, LazyInit):
+                # Create the object of a lazy load
+                obj = obj.resolve()
+                self._element[key] = obj
             if obj is not None:
                 obj.parent = self
         return self._element
@@ -325,6 +230,7 @@ class Mesh(FrozenClass):
         """setter of element"""
         check_var("element", value, "{Element}")
         self._element = value
+        self._clear_memo()
 
     # Storing connectivity
     # Type : {Element}
@@ -334,12 +240,16 @@ class Mesh(FrozenClass):
 
     def _get_node(self):
         """getter of node"""
+        if isinstance(self._node, LazyInit):
+            # Create the object of a lazy load
+            self._set_node(self._node.resolve())
         return self._node
 
     def _set_node(self, value):
         """setter of node"""
         check_var("node", value, "Node")
         self._node = value
+        self._clear_memo()
 
         if self._node is not None:
             self._node.parent = self
@@ -350,7 +260,11 @@ class Mesh(FrozenClass):
 
     def _get_submesh(self):
         """getter of submesh"""
-        for obj in self._submesh:
+        for ii, obj in enumerate(self._submesh):
+            if isinstance(obj, LazyInit):
+                # Create the object of a lazy load
+                obj = obj.resolve()
+                self._submesh[ii] = obj
             if obj is not None:
                 obj.parent = self
         return self._submesh
@@ -359,6 +273,7 @@ class Mesh(FrozenClass):
         """setter of submesh"""
         check_var("submesh", value, "[Mesh]")
         self._submesh = value
+        self._clear_memo()
 
         for obj in self._submesh:
             if obj is not None:
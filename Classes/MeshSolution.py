@@ -4,23 +4,11 @@ WARNING! All changes made in this file will be lost!
 """
 
 from os import linesep
-from pyleecan.Classes._check import check_init_dict, check_var, raise_
+from pyleecan.Classes._check import check_init_dict, check_var
 from pyleecan.Functions.save import save
 from pyleecan.Classes._frozen import FrozenClass
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from pyleecan.Methods.Mesh.MeshSolution.get_mesh import get_mesh
-except ImportError as error:
-    get_mesh = error
-
-try:
-    from pyleecan.Methods.Mesh.MeshSolution.get_solution import get_solution
-except ImportError as error:
-    get_solution = error
-
-
+from pyleecan.Classes._lazy import LazyInit, LazyMethod
 from pyleecan.Classes._check import InitUnKnowClassError
 from pyleecan.Classes.Mesh import Mesh
 from pyleecan.Classes.Solution import Solution
@@ -31,32 +19,21 @@ class MeshSolution(FrozenClass):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
     # cf Methods.Mesh.MeshSolution.get_mesh
-    if isinstance(get_mesh, ImportError):
-        get_mesh = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use MeshSolution method get_mesh: " + str(get_mesh))
-            )
-        )
-    else:
-        get_mesh = get_mesh
+    get_mesh = LazyMethod("pyleecan.Methods.Mesh.MeshSolution.get_mesh")
     # cf Methods.Mesh.MeshSolution.get_solution
-    if isinstance(get_solution, ImportError):
-        get_solution = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use MeshSolution method get_solution: " + str(get_solution)
-                )
-            )
-        )
-    else:
-        get_solution = get_solution
+    get_solution = LazyMethod("pyleecan.Methods.Mesh.MeshSolution.get_solution")
     # save method is available in all object
     save = save
 
     def __init__(
-        self, name="", mesh=list(), solution=list(), is_same_mesh=True, init_dict=None
+        self,
+        name="",
+        mesh=list(),
+        solution=list(),
+        is_same_mesh=True,
+        is_stacked_solution=False,
+        init_dict=None,
     ):
         """Constructor of the class. Can be use in two ways :
         - __init__ (arg1 = 1, arg3 = 5) every parameters have name and default values
@@ -68,16 +45,21 @@ class MeshSolution(FrozenClass):
         object or dict can be given for pyleecan Object"""
 
         if init_dict is not None:  # Initialisation by dict
-            check_init_dict(init_dict, ["name", "mesh", "solution", "is_same_mesh"])
+            check_init_dict(
+                init_dict,
+                ["name", "mesh", "solution", "is_same_mesh", "is_stacked_solution"],
+            )
             # Overwrite default value with init_dict content
-            if "name" in list(init_dict.keys()):
+            if "name" in init_dict:
                 name = init_dict["name"]
-            if "mesh" in list(init_dict.keys()):
+            if "mesh" in init_dict:
                 mesh = init_dict["mesh"]
-            if "solution" in list(init_dict.keys()):
+            if "solution" in init_dict:
                 solution = init_dict["solution"]
-            if "is_same_mesh" in list(init_dict.keys()):
+            if "is_same_mesh" in init_dict:
                 is_same_mesh = init_dict["is_same_mesh"]
+            if "is_stacked_solution" in init_dict:
+                is_stacked_solution = init_dict["is_stacked_solution"]
         # Initialisation by argument
         self.parent = None
         self.name = name
@@ -86,11 +68,11 @@ class MeshSolution(FrozenClass):
         if type(mesh) is list:
             for obj in mesh:
                 if obj is None:  # Default value
-                    self.mesh.append(Mesh())
+                    self._mesh.append(Mesh())
                 elif isinstance(obj, dict):
-                    self.mesh.append(Mesh(init_dict=obj))
+                    self._mesh.append(Mesh(init_dict=obj))
                 else:
-                    self.mesh.append(obj)
+                    self._mesh.append(obj)
         elif mesh is None:
             self.mesh = list()
         else:
@@ -100,16 +82,17 @@ class MeshSolution(FrozenClass):
         if type(solution) is list:
             for obj in solution:
                 if obj is None:  # Default value
-                    self.solution.append(Solution())
+                    self._solution.append(Solution())
                 elif isinstance(obj, dict):
-                    self.solution.append(Solution(init_dict=obj))
+                    self._solution.append(Solution(init_dict=obj))
                 else:
-                    self.solution.append(obj)
+                    self._solution.append(obj)
         elif solution is None:
             self.solution = list()
         else:
             self.solution = solution
         self.is_same_mesh = is_same_mesh
+        self.is_stacked_solution = is_stacked_solution
 
         # The class is frozen, for now it's impossible to add new properties
         self._freeze()
@@ -149,7 +132,8 @@ class MeshSolution(FrozenClass):
                 + linesep
                 + linesep
             )
-        MeshSolution_str += "is_same_mesh = " + str(self.is_same_mesh)
+        MeshSolution_str += "is_same_mesh = " + str(self.is_same_mesh) + linesep
+        MeshSolution_str += "is_stacked_solution = " + str(self.is_stacked_solution)
         return MeshSolution_str
 
     def __eq__(self, other):
@@ -165,25 +149,50 @@ class MeshSolution(FrozenClass):
             return False
         if other.is_same_mesh != self.is_same_mesh:
             return False
+        if other.is_stacked_solution != self.is_stacked_solution:
+            return False
         return True
 
-    def as_dict(self):
+    def as_dict(self, is_keep_array=False):
         """Convert this objet in a json seriable dict (can be use in __init__)
+        The ndarray are not converted to list if is_keep_array
         """
 
         MeshSolution_dict = dict()
         MeshSolution_dict["name"] = self.name
         MeshSolution_dict["mesh"] = list()
         for obj in self.mesh:
-            MeshSolution_dict["mesh"].append(obj.as_dict())
+            MeshSolution_dict["mesh"].append(obj.as_dict(is_keep_array=is_keep_array))
         MeshSolution_dict["solution"] = list()
         for obj in self.solution:
-            MeshSolution_dict["solution"].append(obj.as_dict())
+            MeshSolution_dict["solution"].append(
+                obj.as_dict(is_keep_array=is_keep_array)
+            )
         MeshSolution_dict["is_same_mesh"] = self.is_same_mesh
+        MeshSolution_dict["is_stacked_solution"] = self.is_stacked_solution
         # The class name is added to the dict fordeserialisation purpose
         MeshSolution_dict["__class__"] = "MeshSolution"
         return MeshSolution_dict
 
+    def _copy_to(self, obj):
+        """Copy the properties of this object in obj (called by copy)"""
+
+        obj._name = self._name
+        obj._mesh = list()
+        for value in self._mesh:
+            if value is not None:
+                value = value.copy()
+                value.parent = obj
+            obj._mesh.append(value)
+        obj._solution = list()
+        for value in self._solution:
+            if value is not None:
+                value = value.copy()
+                value.parent = obj
+            obj._solution.append(value)
+        obj._is_same_mesh = self._is_same_mesh
+        obj._is_stacked_solution = self._is_stacked_solution
+
     def _set_None(self):
         """Set all the properties to None (except pyleecan object)"""
 
@@ -193,6 +202,7 @@ class MeshSolution(FrozenClass):
         for obj in self.solution:
             obj._set_None()
         self.is_same_mesh = None
+        self.is_stacked_solution = None
 
     def _get_name(self):
         """getter of name"""
@@ -202,6 +212,7 @@ class MeshSolution(FrozenClass):
         """setter of name"""
         check_var("name", value, "str")
         self._name = value
+        self._clear_memo()
 
     # (Optional) Descriptive name of the mesh
     # Type : str
@@ -213,7 +224,11 @@ class MeshSolution(FrozenClass):
 
     def _get_mesh(self):
         """getter of mesh"""
-        for obj in self._mesh:
+        for ii, obj in enumerate(self._mesh):
+            if isinstance(obj, LazyInit):
+                # Create the object of a lazy load
+                obj = obj.resolve()
+                self._mesh[ii] = obj
             if obj is not None:
                 obj.parent = self
         return self._mesh
@@ -222,6 +237,7 @@ class MeshSolution(FrozenClass):
         """setter of mesh"""
         check_var("mesh", value, "[Mesh]")
         self._mesh = value
+        self._clear_memo()
 
         for obj in self._mesh:
             if obj is not None:
@@ -233,7 +249,11 @@ class MeshSolution(FrozenClass):
 
     def _get_solution(self):
         """getter of solution"""
-        for obj in self._solution:
+        for ii, obj in enumerate(self._solution):
+            if isinstance(obj, LazyInit):
+                # Create the object of a lazy load
+                obj = obj.resolve()
+                self._solution[ii] = obj
             if obj is not None:
                 obj.parent = self
         return self._solution
@@ -242,6 +262,7 @@ class MeshSolution(FrozenClass):
         """setter of solution"""
         check_var("solution", value, "[Solution]")
         self._solution = value
+        self._clear_memo()
 
         for obj in self._solution:
             if obj is not None:
@@ -263,6 +284,7 @@ class MeshSolution(FrozenClass):
         """setter of is_same_mesh"""
         check_var("is_same_mesh", value, "bool")
         self._is_same_mesh = value
+        self._clear_memo()
 
     # 1 if the mesh is the same at each time step
     # Type : bool
@@ -271,3 +293,21 @@ class MeshSolution(FrozenClass):
         fset=_set_is_same_mesh,
         doc=u"""1 if the mesh is the same at each time step""",
     )
+
+    def _get_is_stacked_solution(self):
+        """getter of is_stacked_solution"""
+        return self._is_stacked_solution
+
+    def _set_is_stacked_solution(self, value):
+        """setter of is_stacked_solution"""
+        check_var("is_stacked_solution", value, "bool")
+        self._is_stacked_solution = value
+        self._clear_memo()
+
+    # 1 if solution has a single Solution with the time steps stacked on the first axis of the fields (Nt, Nelem, k)
+    # Type : bool
+    is_stacked_solution = property(
+        fget=_get_is_stacked_solution,
+        fset=_set_is_stacked_solution,
+        doc=u"""1 if solution has a single Solution with the time steps stacked on the first axis of the fields (Nt, Nelem, k)""",
+    )
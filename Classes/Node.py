@@ -4,23 +4,11 @@ WARNING! All changes made in this file will be lost!
 """
 
 from os import linesep
-from pyleecan.Classes._check import check_init_dict, check_var, raise_
+from pyleecan.Classes._check import check_init_dict, check_var
 from pyleecan.Functions.save import save
 from pyleecan.Classes._frozen import FrozenClass
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from pyleecan.Methods.Mesh.Node.get_group import get_group
-except ImportError as error:
-    get_group = error
-
-try:
-    from pyleecan.Methods.Mesh.Node.get_coord import get_coord
-except ImportError as error:
-    get_coord = error
-
-
+from pyleecan.Classes._lazy import LazyMethod
 from pyleecan.Classes._check import InitUnKnowClassError
 
 
@@ -29,25 +17,10 @@ class Node(FrozenClass):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
     # cf Methods.Mesh.Node.get_group
-    if isinstance(get_group, ImportError):
-        get_group = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Node method get_group: " + str(get_group))
-            )
-        )
-    else:
-        get_group = get_group
+    get_group = LazyMethod("pyleecan.Methods.Mesh.Node.get_group")
     # cf Methods.Mesh.Node.get_coord
-    if isinstance(get_coord, ImportError):
-        get_coord = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Node method get_coord: " + str(get_coord))
-            )
-        )
-    else:
-        get_coord = get_coord
+    get_coord = LazyMethod("pyleecan.Methods.Mesh.Node.get_coord")
     # save method is available in all object
     save = save
 
@@ -84,8 +57,9 @@ class Node(FrozenClass):
             return False
         return True
 
-    def as_dict(self):
+    def as_dict(self, is_keep_array=False):
         """Convert this objet in a json seriable dict (can be use in __init__)
+        The ndarray are not converted to list if is_keep_array
         """
 
         Node_dict = dict()
@@ -93,5 +67,10 @@ class Node(FrozenClass):
         Node_dict["__class__"] = "Node"
         return Node_dict
 
+    def _copy_to(self, obj):
+        """Copy the properties of this object in obj (called by copy)"""
+
+        pass
+
     def _set_None(self):
         """Set all the properties to None (except pyleecan object)"""
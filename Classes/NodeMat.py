@@ -4,39 +4,12 @@ WARNING! All changes made in this file will be lost!
 """
 
 from os import linesep
-from pyleecan.Classes._check import set_array, check_init_dict, check_var, raise_
+from pyleecan.Classes._check import set_array, check_init_dict, check_var
 from pyleecan.Functions.save import save
 from pyleecan.Classes.Node import Node
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from pyleecan.Methods.Mesh.NodeMat.get_coord import get_coord
-except ImportError as error:
-    get_coord = error
-
-try:
-    from pyleecan.Methods.Mesh.NodeMat.get_tag import get_tag
-except ImportError as error:
-    get_tag = error
-
-try:
-    from pyleecan.Methods.Mesh.NodeMat.get_group import get_group
-except ImportError as error:
-    get_group = error
-
-try:
-    from pyleecan.Methods.Mesh.NodeMat.add_node import add_node
-except ImportError as error:
-    add_node = error
-
-try:
-    from pyleecan.Methods.Mesh.NodeMat.is_exist import is_exist
-except ImportError as error:
-    is_exist = error
-
-
 from numpy import array, array_equal
+from pyleecan.Classes._lazy import LazyMethod
 from pyleecan.Classes._check import InitUnKnowClassError
 
 
@@ -45,52 +18,26 @@ class NodeMat(Node):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
     # cf Methods.Mesh.NodeMat.get_coord
-    if isinstance(get_coord, ImportError):
-        get_coord = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use NodeMat method get_coord: " + str(get_coord))
-            )
-        )
-    else:
-        get_coord = get_coord
+    get_coord = LazyMethod("pyleecan.Methods.Mesh.NodeMat.get_coord")
     # cf Methods.Mesh.NodeMat.get_tag
-    if isinstance(get_tag, ImportError):
-        get_tag = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use NodeMat method get_tag: " + str(get_tag))
-            )
-        )
-    else:
-        get_tag = get_tag
+    get_tag = LazyMethod("pyleecan.Methods.Mesh.NodeMat.get_tag")
     # cf Methods.Mesh.NodeMat.get_group
-    if isinstance(get_group, ImportError):
-        get_group = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use NodeMat method get_group: " + str(get_group))
-            )
-        )
-    else:
-        get_group = get_group
+    get_group = LazyMethod("pyleecan.Methods.Mesh.NodeMat.get_group")
     # cf Methods.Mesh.NodeMat.add_node
-    if isinstance(add_node, ImportError):
-        add_node = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use NodeMat method add_node: " + str(add_node))
-            )
-        )
-    else:
-        add_node = add_node
+    add_node = LazyMethod("pyleecan.Methods.Mesh.NodeMat.add_node")
     # cf Methods.Mesh.NodeMat.is_exist
-    if isinstance(is_exist, ImportError):
-        is_exist = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use NodeMat method is_exist: " + str(is_exist))
-            )
-        )
-    else:
-        is_exist = is_exist
+    is_exist = LazyMethod("pyleecan.Methods.Mesh.NodeMat.is_exist")
+    # cf Methods.Mesh.NodeMat.get_index
+    get_index = LazyMethod("pyleecan.Methods.Mesh.NodeMat.get_index")
+    # cf Methods.Mesh.NodeMat.add_nodes
+    add_nodes = LazyMethod("pyleecan.Methods.Mesh.NodeMat.add_nodes")
+    # cf Methods.Mesh.NodeMat.get_grid
+    get_grid = LazyMethod("pyleecan.Methods.Mesh.NodeMat.get_grid")
+    # cf Methods.Mesh.NodeMat.get_close_index
+    get_close_index = LazyMethod("pyleecan.Methods.Mesh.NodeMat.get_close_index")
+    # cf Methods.Mesh.NodeMat.get_nearest
+    get_nearest = LazyMethod("pyleecan.Methods.Mesh.NodeMat.get_nearest")
     # save method is available in all object
     save = save
 
@@ -109,13 +56,13 @@ class NodeMat(Node):
         if init_dict is not None:  # Initialisation by dict
             check_init_dict(init_dict, ["coordinate", "nb_node", "tag", "delta"])
             # Overwrite default value with init_dict content
-            if "coordinate" in list(init_dict.keys()):
+            if "coordinate" in init_dict:
                 coordinate = init_dict["coordinate"]
-            if "nb_node" in list(init_dict.keys()):
+            if "nb_node" in init_dict:
                 nb_node = init_dict["nb_node"]
-            if "tag" in list(init_dict.keys()):
+            if "tag" in init_dict:
                 tag = init_dict["tag"]
-            if "delta" in list(init_dict.keys()):
+            if "delta" in init_dict:
                 delta = init_dict["delta"]
         # Initialisation by argument
         # coordinate can be None, a ndarray or a list
@@ -162,19 +109,24 @@ class NodeMat(Node):
             return False
         return True
 
-    def as_dict(self):
+    def as_dict(self, is_keep_array=False):
         """Convert this objet in a json seriable dict (can be use in __init__)
+        The ndarray are not converted to list if is_keep_array
         """
 
         # Get the properties inherited from Node
-        NodeMat_dict = super(NodeMat, self).as_dict()
+        NodeMat_dict = super(NodeMat, self).as_dict(is_keep_array=is_keep_array)
         if self.coordinate is None:
             NodeMat_dict["coordinate"] = None
+        elif is_keep_array:
+            NodeMat_dict["coordinate"] = self.coordinate
         else:
             NodeMat_dict["coordinate"] = self.coordinate.tolist()
         NodeMat_dict["nb_node"] = self.nb_node
         if self.tag is None:
             NodeMat_dict["tag"] = None
+        elif is_keep_array:
+            NodeMat_dict["tag"] = self.tag
         else:
             NodeMat_dict["tag"] = self.tag.tolist()
         NodeMat_dict["delta"] = self.delta
@@ -183,6 +135,22 @@ class NodeMat(Node):
         NodeMat_dict["__class__"] = "NodeMat"
         return NodeMat_dict
 
+    def _copy_to(self, obj):
+        """Copy the properties of this object in obj (called by copy)"""
+
+        # Copy the properties inherited from Node
+        super(NodeMat, self)._copy_to(obj)
+        if self._coordinate is None:
+            obj._coordinate = None
+        else:
+            obj._coordinate = self._coordinate.copy()
+        obj._nb_node = self._nb_node
+        if self._tag is None:
+            obj._tag = None
+        else:
+            obj._tag = self._tag.copy()
+        obj._delta = self._delta
+
     def _set_None(self):
         """Set all the properties to None (except pyleecan object)"""
 
@@ -206,6 +174,7 @@ class NodeMat(Node):
                 pass
         check_var("coordinate", value, "ndarray")
         self._coordinate = value
+        self._clear_memo()
 
     # Nodes coordinates
     # Type : ndarray
@@ -221,6 +190,7 @@ class NodeMat(Node):
         """setter of nb_node"""
         check_var("nb_node", value, "int")
         self._nb_node = value
+        self._clear_memo()
 
     # Total number of nodes
     # Type : int
@@ -241,6 +211,7 @@ class NodeMat(Node):
                 pass
         check_var("tag", value, "ndarray")
         self._tag = value
+        self._clear_memo()
 
     # Node tags
     # Type : ndarray
@@ -254,6 +225,7 @@ class NodeMat(Node):
         """setter of delta"""
         check_var("delta", value, "float")
         self._delta = value
+        self._clear_memo()
 
     # Sensibility for node searching
     # Type : float
@@ -4,18 +4,11 @@ WARNING! All changes made in this file will be lost!
 """
 
 from os import linesep
-from pyleecan.Classes._check import check_init_dict, check_var, raise_
+from pyleecan.Classes._check import check_init_dict, check_var
 from pyleecan.Functions.save import save
 from pyleecan.Classes.Notch import Notch
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from pyleecan.Methods.Machine.NotchEvenDist.get_notch_list import get_notch_list
-except ImportError as error:
-    get_notch_list = error
-
-
+from pyleecan.Classes._lazy import LazyInit, LazyMethod
 from pyleecan.Classes._check import InitUnKnowClassError
 from pyleecan.Classes.Slot import Slot
 
@@ -26,17 +19,7 @@ class NotchEvenDist(Notch):
     VERSION = 1
 
     # cf Methods.Machine.NotchEvenDist.get_notch_list
-    if isinstance(get_notch_list, ImportError):
-        get_notch_list = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use NotchEvenDist method get_notch_list: "
-                    + str(get_notch_list)
-                )
-            )
-        )
-    else:
-        get_notch_list = get_notch_list
+    get_notch_list = LazyMethod("pyleecan.Methods.Machine.NotchEvenDist.get_notch_list")
     # save method is available in all object
     save = save
 
@@ -55,9 +38,9 @@ class NotchEvenDist(Notch):
         if init_dict is not None:  # Initialisation by dict
             check_init_dict(init_dict, ["alpha", "notch_shape"])
             # Overwrite default value with init_dict content
-            if "alpha" in list(init_dict.keys()):
+            if "alpha" in init_dict:
                 alpha = init_dict["alpha"]
-            if "notch_shape" in list(init_dict.keys()):
+            if "notch_shape" in init_dict:
                 notch_shape = init_dict["notch_shape"]
         # Initialisation by argument
         self.alpha = alpha
@@ -136,22 +119,39 @@ class NotchEvenDist(Notch):
             return False
         return True
 
-    def as_dict(self):
+    def as_dict(self, is_keep_array=False):
         """Convert this objet in a json seriable dict (can be use in __init__)
+        The ndarray are not converted to list if is_keep_array
         """
 
         # Get the properties inherited from Notch
-        NotchEvenDist_dict = super(NotchEvenDist, self).as_dict()
+        NotchEvenDist_dict = super(NotchEvenDist, self).as_dict(
+            is_keep_array=is_keep_array
+        )
         NotchEvenDist_dict["alpha"] = self.alpha
         if self.notch_shape is None:
             NotchEvenDist_dict["notch_shape"] = None
         else:
-            NotchEvenDist_dict["notch_shape"] = self.notch_shape.as_dict()
+            NotchEvenDist_dict["notch_shape"] = self.notch_shape.as_dict(
+                is_keep_array=is_keep_array
+            )
         # The class name is added to the dict fordeserialisation purpose
         # Overwrite the mother class name
         NotchEvenDist_dict["__class__"] = "NotchEvenDist"
         return NotchEvenDist_dict
 
+    def _copy_to(self, obj):
+        """Copy the properties of this object in obj (called by copy)"""
+
+        # Copy the properties inherited from Notch
+        super(NotchEvenDist, self)._copy_to(obj)
+        obj._alpha = self._alpha
+        if self._notch_shape is None:
+            obj._notch_shape = None
+        else:
+            obj._notch_shape = self._notch_shape.copy()
+            obj._notch_shape.parent = obj
+
     def _set_None(self):
         """Set all the properties to None (except pyleecan object)"""
 
@@ -169,6 +169,7 @@ class NotchEvenDist(Notch):
         """setter of alpha"""
         check_var("alpha", value, "float")
         self._alpha = value
+        self._clear_memo()
 
     # angular positon of the first notch
     # Type : float
@@ -178,12 +179,16 @@ class NotchEvenDist(Notch):
 
     def _get_notch_shape(self):
         """getter of notch_shape"""
+        if isinstance(self._notch_shape, LazyInit):
+            # Create the object of a lazy load
+            self._set_notch_shape(self._notch_shape.resolve())
         return self._notch_shape
 
     def _set_notch_shape(self, value):
         """setter of notch_shape"""
         check_var("notch_shape", value, "Slot")
         self._notch_shape = value
+        self._clear_memo()
 
         if self._notch_shape is not None:
             self._notch_shape.parent = self
@@ -4,7 +4,7 @@ WARNING! All changes made in this file will be lost!
 """
 
 from os import linesep
-from pyleecan.Classes._check import set_array, check_init_dict, check_var, raise_
+from pyleecan.Classes._check import set_array, check_init_dict, check_var
 from pyleecan.Functions.save import save
 from pyleecan.Classes._frozen import FrozenClass
 
@@ -56,21 +56,21 @@ class OutElec(FrozenClass):
                 ],
             )
             # Overwrite default value with init_dict content
-            if "time" in list(init_dict.keys()):
+            if "time" in init_dict:
                 time = init_dict["time"]
-            if "angle" in list(init_dict.keys()):
+            if "angle" in init_dict:
                 angle = init_dict["angle"]
-            if "Is" in list(init_dict.keys()):
+            if "Is" in init_dict:
                 Is = init_dict["Is"]
-            if "Ir" in list(init_dict.keys()):
+            if "Ir" in init_dict:
                 Ir = init_dict["Ir"]
-            if "angle_rotor" in list(init_dict.keys()):
+            if "angle_rotor" in init_dict:
                 angle_rotor = init_dict["angle_rotor"]
-            if "Nr" in list(init_dict.keys()):
+            if "Nr" in init_dict:
                 Nr = init_dict["Nr"]
-            if "rot_dir" in list(init_dict.keys()):
+            if "rot_dir" in init_dict:
                 rot_dir = init_dict["rot_dir"]
-            if "angle_rotor_initial" in list(init_dict.keys()):
+            if "angle_rotor_initial" in init_dict:
                 angle_rotor_initial = init_dict["angle_rotor_initial"]
         # Initialisation by argument
         self.parent = None
@@ -135,33 +135,46 @@ class OutElec(FrozenClass):
             return False
         return True
 
-    def as_dict(self):
+    def as_dict(self, is_keep_array=False):
         """Convert this objet in a json seriable dict (can be use in __init__)
+        The ndarray are not converted to list if is_keep_array
         """
 
         OutElec_dict = dict()
         if self.time is None:
             OutElec_dict["time"] = None
+        elif is_keep_array:
+            OutElec_dict["time"] = self.time
         else:
             OutElec_dict["time"] = self.time.tolist()
         if self.angle is None:
             OutElec_dict["angle"] = None
+        elif is_keep_array:
+            OutElec_dict["angle"] = self.angle
         else:
             OutElec_dict["angle"] = self.angle.tolist()
         if self.Is is None:
             OutElec_dict["Is"] = None
+        elif is_keep_array:
+            OutElec_dict["Is"] = self.Is
         else:
             OutElec_dict["Is"] = self.Is.tolist()
         if self.Ir is None:
             OutElec_dict["Ir"] = None
+        elif is_keep_array:
+            OutElec_dict["Ir"] = self.Ir
         else:
             OutElec_dict["Ir"] = self.Ir.tolist()
         if self.angle_rotor is None:
             OutElec_dict["angle_rotor"] = None
+        elif is_keep_array:
+            OutElec_dict["angle_rotor"] = self.angle_rotor
         else:
             OutElec_dict["angle_rotor"] = self.angle_rotor.tolist()
         if self.Nr is None:
             OutElec_dict["Nr"] = None
+        elif is_keep_array:
+            OutElec_dict["Nr"] = self.Nr
         else:
             OutElec_dict["Nr"] = self.Nr.tolist()
         OutElec_dict["rot_dir"] = self.rot_dir
@@ -170,6 +183,36 @@ class OutElec(FrozenClass):
         OutElec_dict["__class__"] = "OutElec"
         return OutElec_dict
 
+    def _copy_to(self, obj):
+        """Copy the properties of this object in obj (called by copy)"""
+
+        if self._time is None:
+            obj._time = None
+        else:
+            obj._time = self._time.copy()
+        if self._angle is None:
+            obj._angle = None
+        else:
+            obj._angle = self._angle.copy()
+        if self._Is is None:
+            obj._Is = None
+        else:
+            obj._Is = self._Is.copy()
+        if self._Ir is None:
+            obj._Ir = None
+        else:
+            obj._Ir = self._Ir.copy()
+        if self._angle_rotor is None:
+            obj._angle_rotor = None
+        else:
+            obj._angle_rotor = self._angle_rotor.copy()
+        if self._Nr is None:
+            obj._Nr = None
+        else:
+            obj._Nr = self._Nr.copy()
+        obj._rot_dir = self._rot_dir
+        obj._angle_rotor_initial = self._angle_rotor_initial
+
     def _set_None(self):
         """Set all the properties to None (except pyleecan object)"""
 
@@ -195,6 +238,7 @@ class OutElec(FrozenClass):
                 pass
         check_var("time", value, "ndarray")
         self._time = value
+        self._clear_memo()
 
     # Electrical time vector (no symmetry)
     # Type : ndarray
@@ -215,6 +259,7 @@ class OutElec(FrozenClass):
                 pass
         check_var("angle", value, "ndarray")
         self._angle = value
+        self._clear_memo()
 
     # Electrical position vector (no symmetry)
     # Type : ndarray
@@ -237,6 +282,7 @@ class OutElec(FrozenClass):
                 pass
         check_var("Is", value, "ndarray")
         self._Is = value
+        self._clear_memo()
 
     # Stator currents as a function of time (each column correspond to one phase)
     # Type : ndarray
@@ -259,6 +305,7 @@ class OutElec(FrozenClass):
                 pass
         check_var("Ir", value, "ndarray")
         self._Ir = value
+        self._clear_memo()
 
     # Rotor currents as a function of time (each column correspond to one phase)
     # Type : ndarray
@@ -281,6 +328,7 @@ class OutElec(FrozenClass):
                 pass
         check_var("angle_rotor", value, "ndarray")
         self._angle_rotor = value
+        self._clear_memo()
 
     # Rotor angular position as a function of time (if None computed according to Nr)
     # Type : ndarray
@@ -303,6 +351,7 @@ class OutElec(FrozenClass):
                 pass
         check_var("Nr", value, "ndarray")
         self._Nr = value
+        self._clear_memo()
 
     # Rotor speed as a function of time
     # Type : ndarray
@@ -318,6 +367,7 @@ class OutElec(FrozenClass):
         """setter of rot_dir"""
         check_var("rot_dir", value, "float", Vmin=-1, Vmax=1)
         self._rot_dir = value
+        self._clear_memo()
 
     # Rotation direction of the rotor 1 trigo, -1 clockwise
     # Type : float, min = -1, max = 1
@@ -335,6 +385,7 @@ class OutElec(FrozenClass):
         """setter of angle_rotor_initial"""
         check_var("angle_rotor_initial", value, "float")
         self._angle_rotor_initial = value
+        self._clear_memo()
 
     # Initial angular position of the rotor at t=0
     # Type : float
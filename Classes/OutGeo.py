@@ -4,10 +4,11 @@ WARNING! All changes made in this file will be lost!
 """
 
 from os import linesep
-from pyleecan.Classes._check import check_init_dict, check_var, raise_
+from pyleecan.Classes._check import check_init_dict, check_var
 from pyleecan.Functions.save import save
 from pyleecan.Classes._frozen import FrozenClass
 
+from pyleecan.Classes._lazy import LazyInit
 from pyleecan.Classes._check import InitUnKnowClassError
 from pyleecan.Classes.OutGeoLam import OutGeoLam
 
@@ -49,17 +50,17 @@ class OutGeo(FrozenClass):
                 ["stator", "rotor", "Wgap_mec", "Wgap_mag", "Rgap_mec", "Lgap"],
             )
             # Overwrite default value with init_dict content
-            if "stator" in list(init_dict.keys()):
+            if "stator" in init_dict:
                 stator = init_dict["stator"]
-            if "rotor" in list(init_dict.keys()):
+            if "rotor" in init_dict:
                 rotor = init_dict["rotor"]
-            if "Wgap_mec" in list(init_dict.keys()):
+            if "Wgap_mec" in init_dict:
                 Wgap_mec = init_dict["Wgap_mec"]
-            if "Wgap_mag" in list(init_dict.keys()):
+            if "Wgap_mag" in init_dict:
                 Wgap_mag = init_dict["Wgap_mag"]
-            if "Rgap_mec" in list(init_dict.keys()):
+            if "Rgap_mec" in init_dict:
                 Rgap_mec = init_dict["Rgap_mec"]
-            if "Lgap" in list(init_dict.keys()):
+            if "Lgap" in init_dict:
                 Lgap = init_dict["Lgap"]
         # Initialisation by argument
         self.parent = None
@@ -122,19 +123,20 @@ class OutGeo(FrozenClass):
             return False
         return True
 
-    def as_dict(self):
+    def as_dict(self, is_keep_array=False):
         """Convert this objet in a json seriable dict (can be use in __init__)
+        The ndarray are not converted to list if is_keep_array
         """
 
         OutGeo_dict = dict()
         if self.stator is None:
             OutGeo_dict["stator"] = None
         else:
-            OutGeo_dict["stator"] = self.stator.as_dict()
+            OutGeo_dict["stator"] = self.stator.as_dict(is_keep_array=is_keep_array)
         if self.rotor is None:
             OutGeo_dict["rotor"] = None
         else:
-            OutGeo_dict["rotor"] = self.rotor.as_dict()
+            OutGeo_dict["rotor"] = self.rotor.as_dict(is_keep_array=is_keep_array)
         OutGeo_dict["Wgap_mec"] = self.Wgap_mec
         OutGeo_dict["Wgap_mag"] = self.Wgap_mag
         OutGeo_dict["Rgap_mec"] = self.Rgap_mec
@@ -143,6 +145,24 @@ class OutGeo(FrozenClass):
         OutGeo_dict["__class__"] = "OutGeo"
         return OutGeo_dict
 
+    def _copy_to(self, obj):
+        """Copy the properties of this object in obj (called by copy)"""
+
+        if self._stator is None:
+            obj._stator = None
+        else:
+            obj._stator = self._stator.copy()
+            obj._stator.parent = obj
+        if self._rotor is None:
+            obj._rotor = None
+        else:
+            obj._rotor = self._rotor.copy()
+            obj._rotor.parent = obj
+        obj._Wgap_mec = self._Wgap_mec
+        obj._Wgap_mag = self._Wgap_mag
+        obj._Rgap_mec = self._Rgap_mec
+        obj._Lgap = self._Lgap
+
     def _set_None(self):
         """Set all the properties to None (except pyleecan object)"""
 
@@ -157,12 +177,16 @@ class OutGeo(FrozenClass):
 
     def _get_stator(self):
         """getter of stator"""
+        if isinstance(self._stator, LazyInit):
+            # Create the object of a lazy load
+            self._set_stator(self._stator.resolve())
         return self._stator
 
     def _set_stator(self, value):
         """setter of stator"""
         check_var("stator", value, "OutGeoLam")
         self._stator = value
+        self._clear_memo()
 
         if self._stator is not None:
             self._stator.parent = self
@@ -175,12 +199,16 @@ class OutGeo(FrozenClass):
 
     def _get_rotor(self):
         """getter of rotor"""
+        if isinstance(self._rotor, LazyInit):
+            # Create the object of a lazy load
+            self._set_rotor(self._rotor.resolve())
         return self._rotor
 
     def _set_rotor(self, value):
         """setter of rotor"""
         check_var("rotor", value, "OutGeoLam")
         self._rotor = value
+        self._clear_memo()
 
         if self._rotor is not None:
             self._rotor.parent = self
@@ -199,6 +227,7 @@ class OutGeo(FrozenClass):
         """setter of Wgap_mec"""
         check_var("Wgap_mec", value, "float")
         self._Wgap_mec = value
+        self._clear_memo()
 
     # mechanical airgap width (minimal distance between the lamination including magnet)
     # Type : float
@@ -216,6 +245,7 @@ class OutGeo(FrozenClass):
         """setter of Wgap_mag"""
         check_var("Wgap_mag", value, "float")
         self._Wgap_mag = value
+        self._clear_memo()
 
     # the magnetic airgap width (distance beetween the two Laminations bore radius)
     # Type : float
@@ -233,6 +263,7 @@ class OutGeo(FrozenClass):
         """setter of Rgap_mec"""
         check_var("Rgap_mec", value, "float")
         self._Rgap_mec = value
+        self._clear_memo()
 
     # radius of the center of the mecanical airgap
     # Type : float
@@ -250,6 +281,7 @@ class OutGeo(FrozenClass):
         """setter of Lgap"""
         check_var("Lgap", value, "float")
         self._Lgap = value
+        self._clear_memo()
 
     # Airgap active length
     # Type : float
@@ -4,11 +4,12 @@ WARNING! All changes made in this file will be lost!
 """
 
 from os import linesep
-from pyleecan.Classes._check import set_array, check_init_dict, check_var, raise_
+from pyleecan.Classes._check import set_array, check_init_dict, check_var
 from pyleecan.Functions.save import save
 from pyleecan.Classes._frozen import FrozenClass
 
 from numpy import array, array_equal
+from copy import deepcopy
 from pyleecan.Classes._check import InitUnKnowClassError
 
 
@@ -56,21 +57,21 @@ class OutGeoLam(FrozenClass):
                 ],
             )
             # Overwrite default value with init_dict content
-            if "name_phase" in list(init_dict.keys()):
+            if "name_phase" in init_dict:
                 name_phase = init_dict["name_phase"]
-            if "BH_curve" in list(init_dict.keys()):
+            if "BH_curve" in init_dict:
                 BH_curve = init_dict["BH_curve"]
-            if "Ksfill" in list(init_dict.keys()):
+            if "Ksfill" in init_dict:
                 Ksfill = init_dict["Ksfill"]
-            if "S_slot" in list(init_dict.keys()):
+            if "S_slot" in init_dict:
                 S_slot = init_dict["S_slot"]
-            if "S_slot_wind" in list(init_dict.keys()):
+            if "S_slot_wind" in init_dict:
                 S_slot_wind = init_dict["S_slot_wind"]
-            if "S_wind_act" in list(init_dict.keys()):
+            if "S_wind_act" in init_dict:
                 S_wind_act = init_dict["S_wind_act"]
-            if "sym" in list(init_dict.keys()):
+            if "sym" in init_dict:
                 sym = init_dict["sym"]
-            if "is_asym_wind" in list(init_dict.keys()):
+            if "is_asym_wind" in init_dict:
                 is_asym_wind = init_dict["is_asym_wind"]
         # Initialisation by argument
         self.parent = None
@@ -130,14 +131,17 @@ class OutGeoLam(FrozenClass):
             return False
         return True
 
-    def as_dict(self):
+    def as_dict(self, is_keep_array=False):
         """Convert this objet in a json seriable dict (can be use in __init__)
+        The ndarray are not converted to list if is_keep_array
         """
 
         OutGeoLam_dict = dict()
         OutGeoLam_dict["name_phase"] = self.name_phase
         if self.BH_curve is None:
             OutGeoLam_dict["BH_curve"] = None
+        elif is_keep_array:
+            OutGeoLam_dict["BH_curve"] = self.BH_curve
         else:
             OutGeoLam_dict["BH_curve"] = self.BH_curve.tolist()
         OutGeoLam_dict["Ksfill"] = self.Ksfill
@@ -150,6 +154,21 @@ class OutGeoLam(FrozenClass):
         OutGeoLam_dict["__class__"] = "OutGeoLam"
         return OutGeoLam_dict
 
+    def _copy_to(self, obj):
+        """Copy the properties of this object in obj (called by copy)"""
+
+        obj._name_phase = deepcopy(self._name_phase)
+        if self._BH_curve is None:
+            obj._BH_curve = None
+        else:
+            obj._BH_curve = self._BH_curve.copy()
+        obj._Ksfill = self._Ksfill
+        obj._S_slot = self._S_slot
+        obj._S_slot_wind = self._S_slot_wind
+        obj._S_wind_act = self._S_wind_act
+        obj._sym = self._sym
+        obj._is_asym_wind = self._is_asym_wind
+
     def _set_None(self):
         """Set all the properties to None (except pyleecan object)"""
 
@@ -170,6 +189,7 @@ class OutGeoLam(FrozenClass):
         """setter of name_phase"""
         check_var("name_phase", value, "list")
         self._name_phase = value
+        self._clear_memo()
 
     # Name of the phases of the winding (if any)
     # Type : list
@@ -192,6 +212,7 @@ class OutGeoLam(FrozenClass):
                 pass
         check_var("BH_curve", value, "ndarray")
         self._BH_curve = value
+        self._clear_memo()
 
     # B(H) curve (two columns matrix, H and B(H))
     # Type : ndarray
@@ -209,6 +230,7 @@ class OutGeoLam(FrozenClass):
         """setter of Ksfill"""
         check_var("Ksfill", value, "float")
         self._Ksfill = value
+        self._clear_memo()
 
     # Slot fill factor
     # Type : float
@@ -222,6 +244,7 @@ class OutGeoLam(FrozenClass):
         """setter of S_slot"""
         check_var("S_slot", value, "float")
         self._S_slot = value
+        self._clear_memo()
 
     # Slot surface
     # Type : float
@@ -235,6 +258,7 @@ class OutGeoLam(FrozenClass):
         """setter of S_slot_wind"""
         check_var("S_slot_wind", value, "float")
         self._S_slot_wind = value
+        self._clear_memo()
 
     # Slot winding surface
     # Type : float
@@ -250,6 +274,7 @@ class OutGeoLam(FrozenClass):
         """setter of S_wind_act"""
         check_var("S_wind_act", value, "float")
         self._S_wind_act = value
+        self._clear_memo()
 
     # Conductor active surface
     # Type : float
@@ -265,6 +290,7 @@ class OutGeoLam(FrozenClass):
         """setter of sym"""
         check_var("sym", value, "int")
         self._sym = value
+        self._clear_memo()
 
     # Symmetry factor of the lamination (1=full machine; 2 = half;...)
     # Type : int
@@ -282,6 +308,7 @@ class OutGeoLam(FrozenClass):
         """setter of is_asym_wind"""
         check_var("is_asym_wind", value, "bool")
         self._is_asym_wind = value
+        self._clear_memo()
 
     # True if the winding has a asymmetry
     # Type : bool
@@ -4,11 +4,13 @@ WARNING! All changes made in this file will be lost!
 """
 
 from os import linesep
-from pyleecan.Classes._check import set_array, check_init_dict, check_var, raise_
+from pyleecan.Classes._check import set_array, check_init_dict, check_var
 from pyleecan.Functions.save import save
 from pyleecan.Classes._frozen import FrozenClass
 
 from numpy import array, array_equal
+from copy import deepcopy
+from pyleecan.Classes._lazy import LazyInit
 from pyleecan.Classes._check import InitUnKnowClassError
 from pyleecan.Classes.MeshSolution import MeshSolution
 
@@ -69,31 +71,31 @@ class OutMag(FrozenClass):
                 ],
             )
             # Overwrite default value with init_dict content
-            if "time" in list(init_dict.keys()):
+            if "time" in init_dict:
                 time = init_dict["time"]
-            if "angle" in list(init_dict.keys()):
+            if "angle" in init_dict:
                 angle = init_dict["angle"]
-            if "Nt_tot" in list(init_dict.keys()):
+            if "Nt_tot" in init_dict:
                 Nt_tot = init_dict["Nt_tot"]
-            if "Na_tot" in list(init_dict.keys()):
+            if "Na_tot" in init_dict:
                 Na_tot = init_dict["Na_tot"]
-            if "Br" in list(init_dict.keys()):
+            if "Br" in init_dict:
                 Br = init_dict["Br"]
-            if "Bt" in list(init_dict.keys()):
+            if "Bt" in init_dict:
                 Bt = init_dict["Bt"]
-            if "Tem" in list(init_dict.keys()):
+            if "Tem" in init_dict:
                 Tem = init_dict["Tem"]
-            if "Tem_av" in list(init_dict.keys()):
+            if "Tem_av" in init_dict:
                 Tem_av = init_dict["Tem_av"]
-            if "Tem_rip" in list(init_dict.keys()):
+            if "Tem_rip" in init_dict:
                 Tem_rip = init_dict["Tem_rip"]
-            if "Phi_wind_stator" in list(init_dict.keys()):
+            if "Phi_wind_stator" in init_dict:
                 Phi_wind_stator = init_dict["Phi_wind_stator"]
-            if "emf" in list(init_dict.keys()):
+            if "emf" in init_dict:
                 emf = init_dict["emf"]
-            if "meshsolution" in list(init_dict.keys()):
+            if "meshsolution" in init_dict:
                 meshsolution = init_dict["meshsolution"]
-            if "FEMM_dict" in list(init_dict.keys()):
+            if "FEMM_dict" in init_dict:
                 FEMM_dict = init_dict["FEMM_dict"]
         # Initialisation by argument
         self.parent = None
@@ -192,52 +194,111 @@ class OutMag(FrozenClass):
             return False
         return True
 
-    def as_dict(self):
+    def as_dict(self, is_keep_array=False):
         """Convert this objet in a json seriable dict (can be use in __init__)
+        The ndarray are not converted to list if is_keep_array
         """
 
         OutMag_dict = dict()
         if self.time is None:
             OutMag_dict["time"] = None
+        elif is_keep_array:
+            OutMag_dict["time"] = self.time
         else:
             OutMag_dict["time"] = self.time.tolist()
         if self.angle is None:
             OutMag_dict["angle"] = None
+        elif is_keep_array:
+            OutMag_dict["angle"] = self.angle
         else:
             OutMag_dict["angle"] = self.angle.tolist()
         OutMag_dict["Nt_tot"] = self.Nt_tot
         OutMag_dict["Na_tot"] = self.Na_tot
         if self.Br is None:
             OutMag_dict["Br"] = None
+        elif is_keep_array:
+            OutMag_dict["Br"] = self.Br
         else:
             OutMag_dict["Br"] = self.Br.tolist()
         if self.Bt is None:
             OutMag_dict["Bt"] = None
+        elif is_keep_array:
+            OutMag_dict["Bt"] = self.Bt
         else:
             OutMag_dict["Bt"] = self.Bt.tolist()
         if self.Tem is None:
             OutMag_dict["Tem"] = None
+        elif is_keep_array:
+            OutMag_dict["Tem"] = self.Tem
         else:
             OutMag_dict["Tem"] = self.Tem.tolist()
         OutMag_dict["Tem_av"] = self.Tem_av
         OutMag_dict["Tem_rip"] = self.Tem_rip
         if self.Phi_wind_stator is None:
             OutMag_dict["Phi_wind_stator"] = None
+        elif is_keep_array:
+            OutMag_dict["Phi_wind_stator"] = self.Phi_wind_stator
         else:
             OutMag_dict["Phi_wind_stator"] = self.Phi_wind_stator.tolist()
         if self.emf is None:
             OutMag_dict["emf"] = None
+        elif is_keep_array:
+            OutMag_dict["emf"] = self.emf
         else:
             OutMag_dict["emf"] = self.emf.tolist()
         if self.meshsolution is None:
             OutMag_dict["meshsolution"] = None
         else:
-            OutMag_dict["meshsolution"] = self.meshsolution.as_dict()
+            OutMag_dict["meshsolution"] = self.meshsolution.as_dict(
+                is_keep_array=is_keep_array
+            )
         OutMag_dict["FEMM_dict"] = self.FEMM_dict
         # The class name is added to the dict fordeserialisation purpose
         OutMag_dict["__class__"] = "OutMag"
         return OutMag_dict
 
+    def _copy_to(self, obj):
+        """Copy the properties of this object in obj (called by copy)"""
+
+        if self._time is None:
+            obj._time = None
+        else:
+            obj._time = self._time.copy()
+        if self._angle is None:
+            obj._angle = None
+        else:
+            obj._angle = self._angle.copy()
+        obj._Nt_tot = self._Nt_tot
+        obj._Na_tot = self._Na_tot
+        if self._Br is None:
+            obj._Br = None
+        else:
+            obj._Br = self._Br.copy()
+        if self._Bt is None:
+            obj._Bt = None
+        else:
+            obj._Bt = self._Bt.copy()
+        if self._Tem is None:
+            obj._Tem = None
+        else:
+            obj._Tem = self._Tem.copy()
+        obj._Tem_av = self._Tem_av
+        obj._Tem_rip = self._Tem_rip
+        if self._Phi_wind_stator is None:
+            obj._Phi_wind_stator = None
+        else:
+            obj._Phi_wind_stator = self._Phi_wind_stator.copy()
+        if self._emf is None:
+            obj._emf = None
+        else:
+            obj._emf = self._emf.copy()
+        if self._meshsolution is None:
+            obj._meshsolution = None
+        else:
+            obj._meshsolution = self._meshsolution.copy()
+            obj._meshsolution.parent = obj
+        obj._FEMM_dict = deepcopy(self._FEMM_dict)
+
     def _set_None(self):
         """Set all the properties to None (except pyleecan object)"""
 
@@ -269,6 +330,7 @@ class OutMag(FrozenClass):
                 pass
         check_var("time", value, "ndarray")
         self._time = value
+        self._clear_memo()
 
     # Magnetic time vector (no symmetry)
     # Type : ndarray
@@ -289,6 +351,7 @@ class OutMag(FrozenClass):
                 pass
         check_var("angle", value, "ndarray")
         self._angle = value
+        self._clear_memo()
 
     # Magnetic position vector (no symmetry)
     # Type : ndarray
@@ -306,6 +369,7 @@ class OutMag(FrozenClass):
         """setter of Nt_tot"""
         check_var("Nt_tot", value, "int")
         self._Nt_tot = value
+        self._clear_memo()
 
     # Length of the time vector
     # Type : int
@@ -321,6 +385,7 @@ class OutMag(FrozenClass):
         """setter of Na_tot"""
         check_var("Na_tot", value, "int")
         self._Na_tot = value
+        self._clear_memo()
 
     # Length of the angle vector
     # Type : int
@@ -341,6 +406,7 @@ class OutMag(FrozenClass):
                 pass
         check_var("Br", value, "ndarray")
         self._Br = value
+        self._clear_memo()
 
     # Radial airgap flux density
     # Type : ndarray
@@ -359,6 +425,7 @@ class OutMag(FrozenClass):
                 pass
         check_var("Bt", value, "ndarray")
         self._Bt = value
+        self._clear_memo()
 
     # Tangential airgap flux density
     # Type : ndarray
@@ -377,6 +444,7 @@ class OutMag(FrozenClass):
                 pass
         check_var("Tem", value, "ndarray")
         self._Tem = value
+        self._clear_memo()
 
     # Electromagnetic torque
     # Type : ndarray
@@ -390,6 +458,7 @@ class OutMag(FrozenClass):
         """setter of Tem_av"""
         check_var("Tem_av", value, "float")
         self._Tem_av = value
+        self._clear_memo()
 
     # Average Electromagnetic torque
     # Type : float
@@ -405,6 +474,7 @@ class OutMag(FrozenClass):
         """setter of Tem_rip"""
         check_var("Tem_rip", value, "float")
         self._Tem_rip = value
+        self._clear_memo()
 
     # Torque ripple
     # Type : float
@@ -423,6 +493,7 @@ class OutMag(FrozenClass):
                 pass
         check_var("Phi_wind_stator", value, "ndarray")
         self._Phi_wind_stator = value
+        self._clear_memo()
 
     # Stator winding flux
     # Type : ndarray
@@ -445,6 +516,7 @@ class OutMag(FrozenClass):
                 pass
         check_var("emf", value, "ndarray")
         self._emf = value
+        self._clear_memo()
 
     # Electromotive force
     # Type : ndarray
@@ -452,12 +524,16 @@ class OutMag(FrozenClass):
 
     def _get_meshsolution(self):
         """getter of meshsolution"""
+        if isinstance(self._meshsolution, LazyInit):
+            # Create the object of a lazy load
+            self._set_meshsolution(self._meshsolution.resolve())
         return self._meshsolution
 
     def _set_meshsolution(self, value):
         """setter of meshsolution"""
         check_var("meshsolution", value, "MeshSolution")
         self._meshsolution = value
+        self._clear_memo()
 
         if self._meshsolution is not None:
             self._meshsolution.parent = self
@@ -478,6 +554,7 @@ class OutMag(FrozenClass):
         """setter of FEMM_dict"""
         check_var("FEMM_dict", value, "dict")
         self._FEMM_dict = value
+        self._clear_memo()
 
     # Dictionnary containing the main FEMM parameter
     # Type : dict
@@ -4,7 +4,7 @@ WARNING! All changes made in this file will be lost!
 """
 
 from os import linesep
-from pyleecan.Classes._check import check_init_dict, check_var, raise_
+from pyleecan.Classes._check import check_init_dict, check_var
 from pyleecan.Functions.save import save
 from pyleecan.Classes._frozen import FrozenClass
 
@@ -32,9 +32,9 @@ class OutPost(FrozenClass):
         if init_dict is not None:  # Initialisation by dict
             check_init_dict(init_dict, ["legend_name", "line_color"])
             # Overwrite default value with init_dict content
-            if "legend_name" in list(init_dict.keys()):
+            if "legend_name" in init_dict:
                 legend_name = init_dict["legend_name"]
-            if "line_color" in list(init_dict.keys()):
+            if "line_color" in init_dict:
                 line_color = init_dict["line_color"]
         # Initialisation by argument
         self.parent = None
@@ -67,8 +67,9 @@ class OutPost(FrozenClass):
             return False
         return True
 
-    def as_dict(self):
+    def as_dict(self, is_keep_array=False):
         """Convert this objet in a json seriable dict (can be use in __init__)
+        The ndarray are not converted to list if is_keep_array
         """
 
         OutPost_dict = dict()
@@ -78,6 +79,12 @@ class OutPost(FrozenClass):
         OutPost_dict["__class__"] = "OutPost"
         return OutPost_dict
 
+    def _copy_to(self, obj):
+        """Copy the properties of this object in obj (called by copy)"""
+
+        obj._legend_name = self._legend_name
+        obj._line_color = self._line_color
+
     def _set_None(self):
         """Set all the properties to None (except pyleecan object)"""
 
@@ -92,6 +99,7 @@ class OutPost(FrozenClass):
         """setter of legend_name"""
         check_var("legend_name", value, "str")
         self._legend_name = value
+        self._clear_memo()
 
     # Name to use in the legend in case of comparison
     # Type : str
@@ -109,6 +117,7 @@ class OutPost(FrozenClass):
         """setter of line_color"""
         check_var("line_color", value, "str")
         self._line_color = value
+        self._clear_memo()
 
     # Color to use in case of comparison
     # Type : str
@@ -4,7 +4,7 @@ WARNING! All changes made in this file will be lost!
 """
 
 from os import linesep
-from pyleecan.Classes._check import set_array, check_init_dict, check_var, raise_
+from pyleecan.Classes._check import set_array, check_init_dict, check_var
 from pyleecan.Functions.save import save
 from pyleecan.Classes._frozen import FrozenClass
 
@@ -44,17 +44,17 @@ class OutStruct(FrozenClass):
                 init_dict, ["time", "angle", "Nt_tot", "Na_tot", "Prad", "Ptan"]
             )
             # Overwrite default value with init_dict content
-            if "time" in list(init_dict.keys()):
+            if "time" in init_dict:
                 time = init_dict["time"]
-            if "angle" in list(init_dict.keys()):
+            if "angle" in init_dict:
                 angle = init_dict["angle"]
-            if "Nt_tot" in list(init_dict.keys()):
+            if "Nt_tot" in init_dict:
                 Nt_tot = init_dict["Nt_tot"]
-            if "Na_tot" in list(init_dict.keys()):
+            if "Na_tot" in init_dict:
                 Na_tot = init_dict["Na_tot"]
-            if "Prad" in list(init_dict.keys()):
+            if "Prad" in init_dict:
                 Prad = init_dict["Prad"]
-            if "Ptan" in list(init_dict.keys()):
+            if "Ptan" in init_dict:
                 Ptan = init_dict["Ptan"]
         # Initialisation by argument
         self.parent = None
@@ -107,33 +107,64 @@ class OutStruct(FrozenClass):
             return False
         return True
 
-    def as_dict(self):
+    def as_dict(self, is_keep_array=False):
         """Convert this objet in a json seriable dict (can be use in __init__)
+        The ndarray are not converted to list if is_keep_array
         """
 
         OutStruct_dict = dict()
         if self.time is None:
             OutStruct_dict["time"] = None
+        elif is_keep_array:
+            OutStruct_dict["time"] = self.time
         else:
             OutStruct_dict["time"] = self.time.tolist()
         if self.angle is None:
             OutStruct_dict["angle"] = None
+        elif is_keep_array:
+            OutStruct_dict["angle"] = self.angle
         else:
             OutStruct_dict["angle"] = self.angle.tolist()
         OutStruct_dict["Nt_tot"] = self.Nt_tot
         OutStruct_dict["Na_tot"] = self.Na_tot
         if self.Prad is None:
             OutStruct_dict["Prad"] = None
+        elif is_keep_array:
+            OutStruct_dict["Prad"] = self.Prad
         else:
             OutStruct_dict["Prad"] = self.Prad.tolist()
         if self.Ptan is None:
             OutStruct_dict["Ptan"] = None
+        elif is_keep_array:
+            OutStruct_dict["Ptan"] = self.Ptan
         else:
             OutStruct_dict["Ptan"] = self.Ptan.tolist()
         # The class name is added to the dict fordeserialisation purpose
         OutStruct_dict["__class__"] = "OutStruct"
         return OutStruct_dict
 
+    def _copy_to(self, obj):
+        """Copy the properties of this object in obj (called by copy)"""
+
+        if self._time is None:
+            obj._time = None
+        else:
+            obj._time = self._time.copy()
+        if self._angle is None:
+            obj._angle = None
+        else:
+            obj._angle = self._angle.copy()
+        obj._Nt_tot = self._Nt_tot
+        obj._Na_tot = self._Na_tot
+        if self._Prad is None:
+            obj._Prad = None
+        else:
+            obj._Prad = self._Prad.copy()
+        if self._Ptan is None:
+            obj._Ptan = None
+        else:
+            obj._Ptan = self._Ptan.copy()
+
     def _set_None(self):
         """Set all the properties to None (except pyleecan object)"""
 
@@ -157,6 +188,7 @@ class OutStruct(FrozenClass):
                 pass
         check_var("time", value, "ndarray")
         self._time = value
+        self._clear_memo()
 
     # Structural time vector (no symmetry)
     # Type : ndarray
@@ -177,6 +209,7 @@ class OutStruct(FrozenClass):
                 pass
         check_var("angle", value, "ndarray")
         self._angle = value
+        self._clear_memo()
 
     # Structural position vector (no symmetry)
     # Type : ndarray
@@ -194,6 +227,7 @@ class OutStruct(FrozenClass):
         """setter of Nt_tot"""
         check_var("Nt_tot", value, "int")
         self._Nt_tot = value
+        self._clear_memo()
 
     # Length of the time vector
     # Type : int
@@ -209,6 +243,7 @@ class OutStruct(FrozenClass):
         """setter of Na_tot"""
         check_var("Na_tot", value, "int")
         self._Na_tot = value
+        self._clear_memo()
 
     # Length of the angle vector
     # Type : int
@@ -229,6 +264,7 @@ class OutStruct(FrozenClass):
                 pass
         check_var("Prad", value, "ndarray")
         self._Prad = value
+        self._clear_memo()
 
     # Radial magnetic air-gap surface force
     # Type : ndarray
@@ -249,6 +285,7 @@ class OutStruct(FrozenClass):
                 pass
         check_var("Ptan", value, "ndarray")
         self._Ptan = value
+        self._clear_memo()
 
     # Tangential magnetic air-gap surface force
     # Type : ndarray
@@ -4,52 +4,11 @@ WARNING! All changes made in this file will be lost!
 """
 
 from os import linesep
-from pyleecan.Classes._check import check_init_dict, check_var, raise_
+from pyleecan.Classes._check import check_init_dict, check_var
 from pyleecan.Functions.save import save
 from pyleecan.Classes._frozen import FrozenClass
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from pyleecan.Methods.Output.Output.getter.get_BH_stator import get_BH_stator
-except ImportError as error:
-    get_BH_stator = error
-
-try:
-    from pyleecan.Methods.Output.Output.getter.get_BH_rotor import get_BH_rotor
-except ImportError as error:
-    get_BH_rotor = error
-
-try:
-    from pyleecan.Methods.Output.Output.getter.get_path_result import get_path_result
-except ImportError as error:
-    get_path_result = error
-
-try:
-    from pyleecan.Methods.Output.Output.getter.get_angle_rotor import get_angle_rotor
-except ImportError as error:
-    get_angle_rotor = error
-
-try:
-    from pyleecan.Methods.Output.Output.plot.Magnetic.plot_B_space import plot_B_space
-except ImportError as error:
-    plot_B_space = error
-
-try:
-    from pyleecan.Methods.Output.Output.plot.Structural.plot_force_space import (
-        plot_force_space,
-    )
-except ImportError as error:
-    plot_force_space = error
-
-try:
-    from pyleecan.Methods.Output.Output.plot.Magnetic.plot_mesh_field import (
-        plot_mesh_field,
-    )
-except ImportError as error:
-    plot_mesh_field = error
-
-
+from pyleecan.Classes._lazy import LazyInit, LazyMethod
 from pyleecan.Classes._check import InitUnKnowClassError
 from pyleecan.Classes.Simulation import Simulation
 from pyleecan.Classes.OutGeo import OutGeo
@@ -64,84 +23,30 @@ class Output(FrozenClass):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
     # cf Methods.Output.Output.getter.get_BH_stator
-    if isinstance(get_BH_stator, ImportError):
-        get_BH_stator = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Output method get_BH_stator: " + str(get_BH_stator)
-                )
-            )
-        )
-    else:
-        get_BH_stator = get_BH_stator
+    get_BH_stator = LazyMethod("pyleecan.Methods.Output.Output.getter.get_BH_stator")
     # cf Methods.Output.Output.getter.get_BH_rotor
-    if isinstance(get_BH_rotor, ImportError):
-        get_BH_rotor = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Output method get_BH_rotor: " + str(get_BH_rotor)
-                )
-            )
-        )
-    else:
-        get_BH_rotor = get_BH_rotor
+    get_BH_rotor = LazyMethod("pyleecan.Methods.Output.Output.getter.get_BH_rotor")
     # cf Methods.Output.Output.getter.get_path_result
-    if isinstance(get_path_result, ImportError):
-        get_path_result = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Output method get_path_result: " + str(get_path_result)
-                )
-            )
-        )
-    else:
-        get_path_result = get_path_result
+    get_path_result = LazyMethod(
+        "pyleecan.Methods.Output.Output.getter.get_path_result"
+    )
     # cf Methods.Output.Output.getter.get_angle_rotor
-    if isinstance(get_angle_rotor, ImportError):
-        get_angle_rotor = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Output method get_angle_rotor: " + str(get_angle_rotor)
-                )
-            )
-        )
-    else:
-        get_angle_rotor = get_angle_rotor
+    get_angle_rotor = LazyMethod(
+        "pyleecan.Methods.Output.Output.getter.get_angle_rotor"
+    )
     # cf Methods.Output.Output.plot.Magnetic.plot_B_space
-    if isinstance(plot_B_space, ImportError):
-        plot_B_space = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Output method plot_B_space: " + str(plot_B_space)
-                )
-            )
-        )
-    else:
-        plot_B_space = plot_B_space
+    plot_B_space = LazyMethod(
+        "pyleecan.Methods.Output.Output.plot.Magnetic.plot_B_space"
+    )
     # cf Methods.Output.Output.plot.Structural.plot_force_space
-    if isinstance(plot_force_space, ImportError):
-        plot_force_space = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Output method plot_force_space: " + str(plot_force_space)
-                )
-            )
-        )
-    else:
-        plot_force_space = plot_force_space
+    plot_force_space = LazyMethod(
+        "pyleecan.Methods.Output.Output.plot.Structural.plot_force_space"
+    )
     # cf Methods.Output.Output.plot.Magnetic.plot_mesh_field
-    if isinstance(plot_mesh_field, ImportError):
-        plot_mesh_field = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Output method plot_mesh_field: " + str(plot_mesh_field)
-                )
-            )
-        )
-    else:
-        plot_mesh_field = plot_mesh_field
+    plot_mesh_field = LazyMethod(
+        "pyleecan.Methods.Output.Output.plot.Magnetic.plot_mesh_field"
+    )
     # save method is available in all object
     save = save
 
@@ -182,19 +87,19 @@ class Output(FrozenClass):
                 init_dict, ["simu", "path_res", "geo", "elec", "mag", "struct", "post"]
             )
             # Overwrite default value with init_dict content
-            if "simu" in list(init_dict.keys()):
+            if "simu" in init_dict:
                 simu = init_dict["simu"]
-            if "path_res" in list(init_dict.keys()):
+            if "path_res" in init_dict:
                 path_res = init_dict["path_res"]
-            if "geo" in list(init_dict.keys()):
+            if "geo" in init_dict:
                 geo = init_dict["geo"]
-            if "elec" in list(init_dict.keys()):
+            if "elec" in init_dict:
                 elec = init_dict["elec"]
-            if "mag" in list(init_dict.keys()):
+            if "mag" in init_dict:
                 mag = init_dict["mag"]
-            if "struct" in list(init_dict.keys()):
+            if "struct" in init_dict:
                 struct = init_dict["struct"]
-            if "post" in list(init_dict.keys()):
+            if "post" in init_dict:
                 post = init_dict["post"]
         # Initialisation by argument
         self.parent = None
@@ -298,40 +203,76 @@ class Output(FrozenClass):
             return False
         return True
 
-    def as_dict(self):
+    def as_dict(self, is_keep_array=False):
         """Convert this objet in a json seriable dict (can be use in __init__)
+        The ndarray are not converted to list if is_keep_array
         """
 
         Output_dict = dict()
         if self.simu is None:
             Output_dict["simu"] = None
         else:
-            Output_dict["simu"] = self.simu.as_dict()
+            Output_dict["simu"] = self.simu.as_dict(is_keep_array=is_keep_array)
         Output_dict["path_res"] = self.path_res
         if self.geo is None:
             Output_dict["geo"] = None
         else:
-            Output_dict["geo"] = self.geo.as_dict()
+            Output_dict["geo"] = self.geo.as_dict(is_keep_array=is_keep_array)
         if self.elec is None:
             Output_dict["elec"] = None
         else:
-            Output_dict["elec"] = self.elec.as_dict()
+            Output_dict["elec"] = self.elec.as_dict(is_keep_array=is_keep_array)
         if self.mag is None:
             Output_dict["mag"] = None
         else:
-            Output_dict["mag"] = self.mag.as_dict()
+            Output_dict["mag"] = self.mag.as_dict(is_keep_array=is_keep_array)
         if self.struct is None:
             Output_dict["struct"] = None
         else:
-            Output_dict["struct"] = self.struct.as_dict()
+            Output_dict["struct"] = self.struct.as_dict(is_keep_array=is_keep_array)
         if self.post is None:
             Output_dict["post"] = None
         else:
-            Output_dict["post"] = self.post.as_dict()
+            Output_dict["post"] = self.post.as_dict(is_keep_array=is_keep_array)
         # The class name is added to the dict fordeserialisation purpose
         Output_dict["__class__"] = "Output"
         return Output_dict
 
+    def _copy_to(self, obj):
+        """Copy the properties of this object in obj (called by copy)"""
+
+        if self._simu is None:
+            obj._simu = None
+        else:
+            obj._simu = self._simu.copy()
+            obj._simu.parent = obj
+        obj._path_res = self._path_res
+        if self._geo is None:
+            obj._geo = None
+        else:
+            obj._geo = self._geo.copy()
+            obj._geo.parent = obj
+        if self._elec is None:
+            obj._elec = None
+        else:
+            obj._elec = self._elec.copy()
+            obj._elec.parent = obj
+        if self._mag is None:
+            obj._mag = None
+        else:
+            obj._mag = self._mag.copy()
+            obj._mag.parent = obj
+        if self._struct is None:
+            obj._struct = None
+        else:
+            obj._struct = self._struct.copy()
+            obj._struct.parent = obj
+        if self._post is None:
+            obj._post = None
+        else:
+            obj._post = self._post.copy()
+            obj._post.parent = obj
+
     def _set_None(self):
         """Set all the properties to None (except pyleecan object)"""
 
@@ -351,12 +292,16 @@ class Output(FrozenClass):
 
     def _get_simu(self):
         """getter of simu"""
+        if isinstance(self._simu, LazyInit):
+            # Create the object of a lazy load
+            self._set_simu(self._simu.resolve())
         return self._simu
 
     def _set_simu(self, value):
         """setter of simu"""
         check_var("simu", value, "Simulation")
         self._simu = value
+        self._clear_memo()
 
         if self._simu is not None:
             self._simu.parent = self
@@ -377,6 +322,7 @@ class Output(FrozenClass):
         """setter of path_res"""
         check_var("path_res", value, "str")
         self._path_res = value
+        self._clear_memo()
 
     # Path to the folder to same the results
     # Type : str
@@ -388,12 +334,16 @@ class Output(FrozenClass):
 
     def _get_geo(self):
         """getter of geo"""
+        if isinstance(self._geo, LazyInit):
+            # Create the object of a lazy load
+            self._set_geo(self._geo.resolve())
         return self._geo
 
     def _set_geo(self, value):
         """setter of geo"""
         check_var("geo", value, "OutGeo")
         self._geo = value
+        self._clear_memo()
 
         if self._geo is not None:
             self._geo.parent = self
@@ -404,12 +354,16 @@ class Output(FrozenClass):
 
     def _get_elec(self):
         """getter of elec"""
+        if isinstance(self._elec, LazyInit):
+            # Create the object of a lazy load
+            self._set_elec(self._elec.resolve())
         return self._elec
 
     def _set_elec(self, value):
         """setter of elec"""
         check_var("elec", value, "OutElec")
         self._elec = value
+        self._clear_memo()
 
         if self._elec is not None:
             self._elec.parent = self
@@ -420,12 +374,16 @@ class Output(FrozenClass):
 
     def _get_mag(self):
         """getter of mag"""
+        if isinstance(self._mag, LazyInit):
+            # Create the object of a lazy load
+            self._set_mag(self._mag.resolve())
         return self._mag
 
     def _set_mag(self, value):
         """setter of mag"""
         check_var("mag", value, "OutMag")
         self._mag = value
+        self._clear_memo()
 
         if self._mag is not None:
             self._mag.parent = self
@@ -436,12 +394,16 @@ class Output(FrozenClass):
 
     def _get_struct(self):
         """getter of struct"""
+        if isinstance(self._struct, LazyInit):
+            # Create the object of a lazy load
+            self._set_struct(self._struct.resolve())
         return self._struct
 
     def _set_struct(self, value):
         """setter of struct"""
         check_var("struct", value, "OutStruct")
         self._struct = value
+        self._clear_memo()
 
         if self._struct is not None:
             self._struct.parent = self
@@ -454,12 +416,16 @@ class Output(FrozenClass):
 
     def _get_post(self):
         """getter of post"""
+        if isinstance(self._post, LazyInit):
+            # Create the object of a lazy load
+            self._set_post(self._post.resolve())
         return self._post
 
     def _set_post(self, value):
         """setter of post"""
         check_var("post", value, "OutPost")
         self._post = value
+        self._clear_memo()
 
         if self._post is not None:
             self._post.parent = self
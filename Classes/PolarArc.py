@@ -4,53 +4,11 @@ WARNING! All changes made in this file will be lost!
 """
 
 from os import linesep
-from pyleecan.Classes._check import check_init_dict, check_var, raise_
+from pyleecan.Classes._check import check_init_dict, check_var
 from pyleecan.Functions.save import save
 from pyleecan.Classes.Surface import Surface
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from pyleecan.Methods.Geometry.PolarArc.get_lines import get_lines
-except ImportError as error:
-    get_lines = error
-
-try:
-    from pyleecan.Methods.Geometry.PolarArc.rotate import rotate
-except ImportError as error:
-    rotate = error
-
-try:
-    from pyleecan.Methods.Geometry.PolarArc.translate import translate
-except ImportError as error:
-    translate = error
-
-try:
-    from pyleecan.Methods.Geometry.PolarArc.check import check
-except ImportError as error:
-    check = error
-
-try:
-    from pyleecan.Methods.Geometry.PolarArc.comp_length import comp_length
-except ImportError as error:
-    comp_length = error
-
-try:
-    from pyleecan.Methods.Geometry.PolarArc.discretize import discretize
-except ImportError as error:
-    discretize = error
-
-try:
-    from pyleecan.Methods.Geometry.PolarArc.get_patch import get_patch
-except ImportError as error:
-    get_patch = error
-
-try:
-    from pyleecan.Methods.Geometry.PolarArc.comp_surface import comp_surface
-except ImportError as error:
-    comp_surface = error
-
-
+from pyleecan.Classes._lazy import LazyMethod
 from pyleecan.Classes._check import InitUnKnowClassError
 
 
@@ -59,83 +17,22 @@ class PolarArc(Surface):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
     # cf Methods.Geometry.PolarArc.get_lines
-    if isinstance(get_lines, ImportError):
-        get_lines = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use PolarArc method get_lines: " + str(get_lines))
-            )
-        )
-    else:
-        get_lines = get_lines
+    get_lines = LazyMethod("pyleecan.Methods.Geometry.PolarArc.get_lines")
     # cf Methods.Geometry.PolarArc.rotate
-    if isinstance(rotate, ImportError):
-        rotate = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use PolarArc method rotate: " + str(rotate))
-            )
-        )
-    else:
-        rotate = rotate
+    rotate = LazyMethod("pyleecan.Methods.Geometry.PolarArc.rotate")
     # cf Methods.Geometry.PolarArc.translate
-    if isinstance(translate, ImportError):
-        translate = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use PolarArc method translate: " + str(translate))
-            )
-        )
-    else:
-        translate = translate
+    translate = LazyMethod("pyleecan.Methods.Geometry.PolarArc.translate")
     # cf Methods.Geometry.PolarArc.check
-    if isinstance(check, ImportError):
-        check = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use PolarArc method check: " + str(check))
-            )
-        )
-    else:
-        check = check
+    check = LazyMethod("pyleecan.Methods.Geometry.PolarArc.check")
     # cf Methods.Geometry.PolarArc.comp_length
-    if isinstance(comp_length, ImportError):
-        comp_length = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use PolarArc method comp_length: " + str(comp_length)
-                )
-            )
-        )
-    else:
-        comp_length = comp_length
+    comp_length = LazyMethod("pyleecan.Methods.Geometry.PolarArc.comp_length")
     # cf Methods.Geometry.PolarArc.discretize
-    if isinstance(discretize, ImportError):
-        discretize = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use PolarArc method discretize: " + str(discretize))
-            )
-        )
-    else:
-        discretize = discretize
+    discretize = LazyMethod("pyleecan.Methods.Geometry.PolarArc.discretize")
     # cf Methods.Geometry.PolarArc.get_patch
-    if isinstance(get_patch, ImportError):
-        get_patch = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use PolarArc method get_patch: " + str(get_patch))
-            )
-        )
-    else:
-        get_patch = get_patch
+    get_patch = LazyMethod("pyleecan.Methods.Geometry.PolarArc.get_patch")
     # cf Methods.Geometry.PolarArc.comp_surface
-    if isinstance(comp_surface, ImportError):
-        comp_surface = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use PolarArc method comp_surface: " + str(comp_surface)
-                )
-            )
-        )
-    else:
-        comp_surface = comp_surface
+    comp_surface = LazyMethod("pyleecan.Methods.Geometry.PolarArc.comp_surface")
     # save method is available in all object
     save = save
 
@@ -152,13 +49,13 @@ class PolarArc(Surface):
         if init_dict is not None:  # Initialisation by dict
             check_init_dict(init_dict, ["angle", "height", "point_ref", "label"])
             # Overwrite default value with init_dict content
-            if "angle" in list(init_dict.keys()):
+            if "angle" in init_dict:
                 angle = init_dict["angle"]
-            if "height" in list(init_dict.keys()):
+            if "height" in init_dict:
                 height = init_dict["height"]
-            if "point_ref" in list(init_dict.keys()):
+            if "point_ref" in init_dict:
                 point_ref = init_dict["point_ref"]
-            if "label" in list(init_dict.keys()):
+            if "label" in init_dict:
                 label = init_dict["label"]
         # Initialisation by argument
         self.angle = angle
@@ -193,12 +90,13 @@ class PolarArc(Surface):
             return False
         return True
 
-    def as_dict(self):
+    def as_dict(self, is_keep_array=False):
         """Convert this objet in a json seriable dict (can be use in __init__)
+        The ndarray are not converted to list if is_keep_array
         """
 
         # Get the properties inherited from Surface
-        PolarArc_dict = super(PolarArc, self).as_dict()
+        PolarArc_dict = super(PolarArc, self).as_dict(is_keep_array=is_keep_array)
         PolarArc_dict["angle"] = self.angle
         PolarArc_dict["height"] = self.height
         # The class name is added to the dict fordeserialisation purpose
@@ -206,6 +104,14 @@ class PolarArc(Surface):
         PolarArc_dict["__class__"] = "PolarArc"
         return PolarArc_dict
 
+    def _copy_to(self, obj):
+        """Copy the properties of this object in obj (called by copy)"""
+
+        # Copy the properties inherited from Surface
+        super(PolarArc, self)._copy_to(obj)
+        obj._angle = self._angle
+        obj._height = self._height
+
     def _set_None(self):
         """Set all the properties to None (except pyleecan object)"""
 
@@ -222,6 +128,7 @@ class PolarArc(Surface):
         """setter of angle"""
         check_var("angle", value, "float", Vmin=0)
         self._angle = value
+        self._clear_memo()
 
     # Polar angle
     # Type : float, min = 0
@@ -235,6 +142,7 @@ class PolarArc(Surface):
         """setter of height"""
         check_var("height", value, "float", Vmin=0)
         self._height = value
+        self._clear_memo()
 
     # The Heigth of the PolarAngle
     # Type : float, min = 0
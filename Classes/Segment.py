@@ -4,78 +4,11 @@ WARNING! All changes made in this file will be lost!
 """
 
 from os import linesep
-from pyleecan.Classes._check import check_init_dict, check_var, raise_
+from pyleecan.Classes._check import check_init_dict, check_var
 from pyleecan.Functions.save import save
 from pyleecan.Classes.Line import Line
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from pyleecan.Methods.Geometry.Segment.check import check
-except ImportError as error:
-    check = error
-
-try:
-    from pyleecan.Methods.Geometry.Segment.comp_length import comp_length
-except ImportError as error:
-    comp_length = error
-
-try:
-    from pyleecan.Methods.Geometry.Segment.discretize import discretize
-except ImportError as error:
-    discretize = error
-
-try:
-    from pyleecan.Methods.Geometry.Segment.draw_FEMM import draw_FEMM
-except ImportError as error:
-    draw_FEMM = error
-
-try:
-    from pyleecan.Methods.Geometry.Segment.get_begin import get_begin
-except ImportError as error:
-    get_begin = error
-
-try:
-    from pyleecan.Methods.Geometry.Segment.get_end import get_end
-except ImportError as error:
-    get_end = error
-
-try:
-    from pyleecan.Methods.Geometry.Segment.get_middle import get_middle
-except ImportError as error:
-    get_middle = error
-
-try:
-    from pyleecan.Methods.Geometry.Segment.intersect_line import intersect_line
-except ImportError as error:
-    intersect_line = error
-
-try:
-    from pyleecan.Methods.Geometry.Segment.reverse import reverse
-except ImportError as error:
-    reverse = error
-
-try:
-    from pyleecan.Methods.Geometry.Segment.rotate import rotate
-except ImportError as error:
-    rotate = error
-
-try:
-    from pyleecan.Methods.Geometry.Segment.split_half import split_half
-except ImportError as error:
-    split_half = error
-
-try:
-    from pyleecan.Methods.Geometry.Segment.split_line import split_line
-except ImportError as error:
-    split_line = error
-
-try:
-    from pyleecan.Methods.Geometry.Segment.translate import translate
-except ImportError as error:
-    translate = error
-
-
+from pyleecan.Classes._lazy import LazyMethod
 from pyleecan.Classes._check import InitUnKnowClassError
 
 
@@ -84,126 +17,32 @@ class Segment(Line):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
     # cf Methods.Geometry.Segment.check
-    if isinstance(check, ImportError):
-        check = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Segment method check: " + str(check))
-            )
-        )
-    else:
-        check = check
+    check = LazyMethod("pyleecan.Methods.Geometry.Segment.check")
     # cf Methods.Geometry.Segment.comp_length
-    if isinstance(comp_length, ImportError):
-        comp_length = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Segment method comp_length: " + str(comp_length))
-            )
-        )
-    else:
-        comp_length = comp_length
+    comp_length = LazyMethod("pyleecan.Methods.Geometry.Segment.comp_length")
     # cf Methods.Geometry.Segment.discretize
-    if isinstance(discretize, ImportError):
-        discretize = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Segment method discretize: " + str(discretize))
-            )
-        )
-    else:
-        discretize = discretize
+    discretize = LazyMethod("pyleecan.Methods.Geometry.Segment.discretize")
     # cf Methods.Geometry.Segment.draw_FEMM
-    if isinstance(draw_FEMM, ImportError):
-        draw_FEMM = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Segment method draw_FEMM: " + str(draw_FEMM))
-            )
-        )
-    else:
-        draw_FEMM = draw_FEMM
+    draw_FEMM = LazyMethod("pyleecan.Methods.Geometry.Segment.draw_FEMM")
     # cf Methods.Geometry.Segment.get_begin
-    if isinstance(get_begin, ImportError):
-        get_begin = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Segment method get_begin: " + str(get_begin))
-            )
-        )
-    else:
-        get_begin = get_begin
+    get_begin = LazyMethod("pyleecan.Methods.Geometry.Segment.get_begin")
     # cf Methods.Geometry.Segment.get_end
-    if isinstance(get_end, ImportError):
-        get_end = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Segment method get_end: " + str(get_end))
-            )
-        )
-    else:
-        get_end = get_end
+    get_end = LazyMethod("pyleecan.Methods.Geometry.Segment.get_end")
     # cf Methods.Geometry.Segment.get_middle
-    if isinstance(get_middle, ImportError):
-        get_middle = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Segment method get_middle: " + str(get_middle))
-            )
-        )
-    else:
-        get_middle = get_middle
+    get_middle = LazyMethod("pyleecan.Methods.Geometry.Segment.get_middle")
     # cf Methods.Geometry.Segment.intersect_line
-    if isinstance(intersect_line, ImportError):
-        intersect_line = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Segment method intersect_line: " + str(intersect_line)
-                )
-            )
-        )
-    else:
-        intersect_line = intersect_line
+    intersect_line = LazyMethod("pyleecan.Methods.Geometry.Segment.intersect_line")
     # cf Methods.Geometry.Segment.reverse
-    if isinstance(reverse, ImportError):
-        reverse = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Segment method reverse: " + str(reverse))
-            )
-        )
-    else:
-        reverse = reverse
+    reverse = LazyMethod("pyleecan.Methods.Geometry.Segment.reverse")
     # cf Methods.Geometry.Segment.rotate
-    if isinstance(rotate, ImportError):
-        rotate = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Segment method rotate: " + str(rotate))
-            )
-        )
-    else:
-        rotate = rotate
+    rotate = LazyMethod("pyleecan.Methods.Geometry.Segment.rotate")
     # cf Methods.Geometry.Segment.split_half
-    if isinstance(split_half, ImportError):
-        split_half = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Segment method split_half: " + str(split_half))
-            )
-        )
-    else:
-        split_half = split_half
+    split_half = LazyMethod("pyleecan.Methods.Geometry.Segment.split_half")
     # cf Methods.Geometry.Segment.split_line
-    if isinstance(split_line, ImportError):
-        split_line = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Segment method split_line: " + str(split_line))
-            )
-        )
-    else:
-        split_line = split_line
+    split_line = LazyMethod("pyleecan.Methods.Geometry.Segment.split_line")
     # cf Methods.Geometry.Segment.translate
-    if isinstance(translate, ImportError):
-        translate = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Segment method translate: " + str(translate))
-            )
-        )
-    else:
-        translate = translate
+    translate = LazyMethod("pyleecan.Methods.Geometry.Segment.translate")
     # save method is available in all object
     save = save
 
@@ -220,11 +59,11 @@ class Segment(Line):
         if init_dict is not None:  # Initialisation by dict
             check_init_dict(init_dict, ["begin", "end", "label"])
             # Overwrite default value with init_dict content
-            if "begin" in list(init_dict.keys()):
+            if "begin" in init_dict:
                 begin = init_dict["begin"]
-            if "end" in list(init_dict.keys()):
+            if "end" in init_dict:
                 end = init_dict["end"]
-            if "label" in list(init_dict.keys()):
+            if "label" in init_dict:
                 label = init_dict["label"]
         # Initialisation by argument
         self.begin = begin
@@ -259,12 +98,13 @@ class Segment(Line):
             return False
         return True
 
-    def as_dict(self):
+    def as_dict(self, is_keep_array=False):
         """Convert this objet in a json seriable dict (can be use in __init__)
+        The ndarray are not converted to list if is_keep_array
         """
 
         # Get the properties inherited from Line
-        Segment_dict = super(Segment, self).as_dict()
+        Segment_dict = super(Segment, self).as_dict(is_keep_array=is_keep_array)
         Segment_dict["begin"] = self.begin
         Segment_dict["end"] = self.end
         # The class name is added to the dict fordeserialisation purpose
@@ -272,6 +112,14 @@ class Segment(Line):
         Segment_dict["__class__"] = "Segment"
         return Segment_dict
 
+    def _copy_to(self, obj):
+        """Copy the properties of this object in obj (called by copy)"""
+
+        # Copy the properties inherited from Line
+        super(Segment, self)._copy_to(obj)
+        obj._begin = self._begin
+        obj._end = self._end
+
     def _set_None(self):
         """Set all the properties to None (except pyleecan object)"""
 
@@ -288,6 +136,7 @@ class Segment(Line):
         """setter of begin"""
         check_var("begin", value, "complex")
         self._begin = value
+        self._clear_memo()
 
     # begin point of the line
     # Type : complex
@@ -303,6 +152,7 @@ class Segment(Line):
         """setter of end"""
         check_var("end", value, "complex")
         self._end = value
+        self._clear_memo()
 
     # end point of the line
     # Type : complex
@@ -4,28 +4,11 @@ WARNING! All changes made in this file will be lost!
 """
 
 from os import linesep
-from pyleecan.Classes._check import check_init_dict, check_var, raise_
+from pyleecan.Classes._check import check_init_dict, check_var
 from pyleecan.Functions.save import save
 from pyleecan.Classes._frozen import FrozenClass
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from pyleecan.Methods.Machine.Shaft.build_geometry import build_geometry
-except ImportError as error:
-    build_geometry = error
-
-try:
-    from pyleecan.Methods.Machine.Shaft.comp_mass import comp_mass
-except ImportError as error:
-    comp_mass = error
-
-try:
-    from pyleecan.Methods.Machine.Shaft.plot import plot
-except ImportError as error:
-    plot = error
-
-
+from pyleecan.Classes._lazy import LazyInit, LazyMethod
 from pyleecan.Classes._check import InitUnKnowClassError
 from pyleecan.Classes.Material import Material
 
@@ -35,36 +18,12 @@ class Shaft(FrozenClass):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
     # cf Methods.Machine.Shaft.build_geometry
-    if isinstance(build_geometry, ImportError):
-        build_geometry = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Shaft method build_geometry: " + str(build_geometry)
-                )
-            )
-        )
-    else:
-        build_geometry = build_geometry
+    build_geometry = LazyMethod("pyleecan.Methods.Machine.Shaft.build_geometry")
     # cf Methods.Machine.Shaft.comp_mass
-    if isinstance(comp_mass, ImportError):
-        comp_mass = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Shaft method comp_mass: " + str(comp_mass))
-            )
-        )
-    else:
-        comp_mass = comp_mass
+    comp_mass = LazyMethod("pyleecan.Methods.Machine.Shaft.comp_mass")
     # cf Methods.Machine.Shaft.plot
-    if isinstance(plot, ImportError):
-        plot = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Shaft method plot: " + str(plot))
-            )
-        )
-    else:
-        plot = plot
+    plot = LazyMethod("pyleecan.Methods.Machine.Shaft.plot")
     # save method is available in all object
     save = save
 
@@ -83,11 +42,11 @@ class Shaft(FrozenClass):
         if init_dict is not None:  # Initialisation by dict
             check_init_dict(init_dict, ["Lshaft", "mat_type", "Drsh"])
             # Overwrite default value with init_dict content
-            if "Lshaft" in list(init_dict.keys()):
+            if "Lshaft" in init_dict:
                 Lshaft = init_dict["Lshaft"]
-            if "mat_type" in list(init_dict.keys()):
+            if "mat_type" in init_dict:
                 mat_type = init_dict["mat_type"]
-            if "Drsh" in list(init_dict.keys()):
+            if "Drsh" in init_dict:
                 Drsh = init_dict["Drsh"]
         # Initialisation by argument
         self.parent = None
@@ -133,8 +92,9 @@ class Shaft(FrozenClass):
             return False
         return True
 
-    def as_dict(self):
+    def as_dict(self, is_keep_array=False):
         """Convert this objet in a json seriable dict (can be use in __init__)
+        The ndarray are not converted to list if is_keep_array
         """
 
         Shaft_dict = dict()
@@ -142,12 +102,23 @@ class Shaft(FrozenClass):
         if self.mat_type is None:
             Shaft_dict["mat_type"] = None
         else:
-            Shaft_dict["mat_type"] = self.mat_type.as_dict()
+            Shaft_dict["mat_type"] = self.mat_type.as_dict(is_keep_array=is_keep_array)
         Shaft_dict["Drsh"] = self.Drsh
         # The class name is added to the dict fordeserialisation purpose
         Shaft_dict["__class__"] = "Shaft"
         return Shaft_dict
 
+    def _copy_to(self, obj):
+        """Copy the properties of this object in obj (called by copy)"""
+
+        obj._Lshaft = self._Lshaft
+        if self._mat_type is None:
+            obj._mat_type = None
+        else:
+            obj._mat_type = self._mat_type.copy()
+            obj._mat_type.parent = obj
+        obj._Drsh = self._Drsh
+
     def _set_None(self):
         """Set all the properties to None (except pyleecan object)"""
 
@@ -164,6 +135,7 @@ class Shaft(FrozenClass):
         """setter of Lshaft"""
         check_var("Lshaft", value, "float", Vmin=0, Vmax=100)
         self._Lshaft = value
+        self._clear_memo()
 
     # length of the rotor shaft [m] (used for weight & cost estimation only)
     # Type : float, min = 0, max = 100
@@ -175,12 +147,16 @@ class Shaft(FrozenClass):
 
     def _get_mat_type(self):
         """getter of mat_type"""
+        if isinstance(self._mat_type, LazyInit):
+            # Create the object of a lazy load
+            self._set_mat_type(self._mat_type.resolve())
         return self._mat_type
 
     def _set_mat_type(self, value):
         """setter of mat_type"""
         check_var("mat_type", value, "Material")
         self._mat_type = value
+        self._clear_memo()
 
         if self._mat_type is not None:
             self._mat_type.parent = self
@@ -199,6 +175,7 @@ class Shaft(FrozenClass):
         """setter of Drsh"""
         check_var("Drsh", value, "float", Vmin=0, Vmax=8)
         self._Drsh = value
+        self._clear_memo()
 
     # diameter of the rotor shaft [m], used to estimate bearing diameter for friction losses
     # Type : float, min = 0, max = 8
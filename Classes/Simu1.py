@@ -4,18 +4,11 @@ WARNING! All changes made in this file will be lost!
 """
 
 from os import linesep
-from pyleecan.Classes._check import check_init_dict, check_var, raise_
+from pyleecan.Classes._check import check_init_dict, check_var
 from pyleecan.Functions.save import save
 from pyleecan.Classes.Simulation import Simulation
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from pyleecan.Methods.Simulation.Simu1.run import run
-except ImportError as error:
-    run = error
-
-
+from pyleecan.Classes._lazy import LazyInit, LazyMethod
 from pyleecan.Classes._check import InitUnKnowClassError
 from pyleecan.Classes.Magnetics import Magnetics
 from pyleecan.Classes.Structural import Structural
@@ -29,14 +22,7 @@ class Simu1(Simulation):
     VERSION = 1
 
     # cf Methods.Simulation.Simu1.run
-    if isinstance(run, ImportError):
-        run = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Simu1 method run: " + str(run))
-            )
-        )
-    else:
-        run = run
+    run = LazyMethod("pyleecan.Methods.Simulation.Simu1.run")
     # save method is available in all object
     save = save
 
@@ -65,17 +51,17 @@ class Simu1(Simulation):
                 init_dict, ["mag", "struct", "name", "desc", "machine", "input"]
             )
             # Overwrite default value with init_dict content
-            if "mag" in list(init_dict.keys()):
+            if "mag" in init_dict:
                 mag = init_dict["mag"]
-            if "struct" in list(init_dict.keys()):
+            if "struct" in init_dict:
                 struct = init_dict["struct"]
-            if "name" in list(init_dict.keys()):
+            if "name" in init_dict:
                 name = init_dict["name"]
-            if "desc" in list(init_dict.keys()):
+            if "desc" in init_dict:
                 desc = init_dict["desc"]
-            if "machine" in list(init_dict.keys()):
+            if "machine" in init_dict:
                 machine = init_dict["machine"]
-            if "input" in list(init_dict.keys()):
+            if "input" in init_dict:
                 input = init_dict["input"]
         # Initialisation by argument
         # mag can be None, a Magnetics object or a dict
@@ -133,25 +119,42 @@ class Simu1(Simulation):
             return False
         return True
 
-    def as_dict(self):
+    def as_dict(self, is_keep_array=False):
         """Convert this objet in a json seriable dict (can be use in __init__)
+        The ndarray are not converted to list if is_keep_array
         """
 
         # Get the properties inherited from Simulation
-        Simu1_dict = super(Simu1, self).as_dict()
+        Simu1_dict = super(Simu1, self).as_dict(is_keep_array=is_keep_array)
         if self.mag is None:
             Simu1_dict["mag"] = None
         else:
-            Simu1_dict["mag"] = self.mag.as_dict()
+            Simu1_dict["mag"] = self.mag.as_dict(is_keep_array=is_keep_array)
         if self.struct is None:
             Simu1_dict["struct"] = None
         else:
-            Simu1_dict["struct"] = self.struct.as_dict()
+            Simu1_dict["struct"] = self.struct.as_dict(is_keep_array=is_keep_array)
         # The class name is added to the dict fordeserialisation purpose
         # Overwrite the mother class name
         Simu1_dict["__class__"] = "Simu1"
         return Simu1_dict
 
+    def _copy_to(self, obj):
+        """Copy the properties of this object in obj (called by copy)"""
+
+        # Copy the properties inherited from Simulation
+        super(Simu1, self)._copy_to(obj)
+        if self._mag is None:
+            obj._mag = None
+        else:
+            obj._mag = self._mag.copy()
+            obj._mag.parent = obj
+        if self._struct is None:
+            obj._struct = None
+        else:
+            obj._struct = self._struct.copy()
+            obj._struct.parent = obj
+
     def _set_None(self):
         """Set all the properties to None (except pyleecan object)"""
 
@@ -164,12 +167,16 @@ class Simu1(Simulation):
 
     def _get_mag(self):
         """getter of mag"""
+        if isinstance(self._mag, LazyInit):
+            # Create the object of a lazy load
+            self._set_mag(self._mag.resolve())
         return self._mag
 
     def _set_mag(self, value):
         """setter of mag"""
         check_var("mag", value, "Magnetics")
         self._mag = value
+        self._clear_memo()
 
         if self._mag is not None:
             self._mag.parent = self
@@ -180,12 +187,16 @@ class Simu1(Simulation):
 
     def _get_struct(self):
         """getter of struct"""
+        if isinstance(self._struct, LazyInit):
+            # Create the object of a lazy load
+            self._set_struct(self._struct.resolve())
         return self._struct
 
     def _set_struct(self, value):
         """setter of struct"""
         check_var("struct", value, "Structural")
         self._struct = value
+        self._clear_memo()
 
         if self._struct is not None:
             self._struct.parent = self
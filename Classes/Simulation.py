@@ -4,10 +4,11 @@ WARNING! All changes made in this file will be lost!
 """
 
 from os import linesep
-from pyleecan.Classes._check import check_init_dict, check_var, raise_
+from pyleecan.Classes._check import check_init_dict, check_var
 from pyleecan.Functions.save import save
 from pyleecan.Classes._frozen import FrozenClass
 
+from pyleecan.Classes._lazy import LazyInit
 from pyleecan.Classes._check import InitUnKnowClassError
 from pyleecan.Classes.Machine import Machine
 from pyleecan.Classes.Input import Input
@@ -38,13 +39,13 @@ class Simulation(FrozenClass):
         if init_dict is not None:  # Initialisation by dict
             check_init_dict(init_dict, ["name", "desc", "machine", "input"])
             # Overwrite default value with init_dict content
-            if "name" in list(init_dict.keys()):
+            if "name" in init_dict:
                 name = init_dict["name"]
-            if "desc" in list(init_dict.keys()):
+            if "desc" in init_dict:
                 desc = init_dict["desc"]
-            if "machine" in list(init_dict.keys()):
+            if "machine" in init_dict:
                 machine = init_dict["machine"]
-            if "input" in list(init_dict.keys()):
+            if "input" in init_dict:
                 input = init_dict["input"]
         # Initialisation by argument
         self.parent = None
@@ -136,8 +137,9 @@ class Simulation(FrozenClass):
             return False
         return True
 
-    def as_dict(self):
+    def as_dict(self, is_keep_array=False):
         """Convert this objet in a json seriable dict (can be use in __init__)
+        The ndarray are not converted to list if is_keep_array
         """
 
         Simulation_dict = dict()
@@ -146,15 +148,33 @@ class Simulation(FrozenClass):
         if self.machine is None:
             Simulation_dict["machine"] = None
         else:
-            Simulation_dict["machine"] = self.machine.as_dict()
+            Simulation_dict["machine"] = self.machine.as_dict(
+                is_keep_array=is_keep_array
+            )
         if self.input is None:
             Simulation_dict["input"] = None
         else:
-            Simulation_dict["input"] = self.input.as_dict()
+            Simulation_dict["input"] = self.input.as_dict(is_keep_array=is_keep_array)
         # The class name is added to the dict fordeserialisation purpose
         Simulation_dict["__class__"] = "Simulation"
         return Simulation_dict
 
+    def _copy_to(self, obj):
+        """Copy the properties of this object in obj (called by copy)"""
+
+        obj._name = self._name
+        obj._desc = self._desc
+        if self._machine is None:
+            obj._machine = None
+        else:
+            obj._machine = self._machine.copy()
+            obj._machine.parent = obj
+        if self._input is None:
+            obj._input = None
+        else:
+            obj._input = self._input.copy()
+            obj._input.parent = obj
+
     def _set_None(self):
         """Set all the properties to None (except pyleecan object)"""
 
@@ -173,6 +193,7 @@ class Simulation(FrozenClass):
         """setter of name"""
         check_var("name", value, "str")
         self._name = value
+        self._clear_memo()
 
     # Name of the simulation
     # Type : str
@@ -186,6 +207,7 @@ class Simulation(FrozenClass):
         """setter of desc"""
         check_var("desc", value, "str")
         self._desc = value
+        self._clear_memo()
 
     # Simulation description
     # Type : str
@@ -193,12 +215,16 @@ class Simulation(FrozenClass):
 
     def _get_machine(self):
         """getter of machine"""
+        if isinstance(self._machine, LazyInit):
+            # Create the object of a lazy load
+            self._set_machine(self._machine.resolve())
         return self._machine
 
     def _set_machine(self, value):
         """setter of machine"""
         check_var("machine", value, "Machine")
         self._machine = value
+        self._clear_memo()
 
         if self._machine is not None:
             self._machine.parent = self
@@ -211,12 +237,16 @@ class Simulation(FrozenClass):
 
     def _get_input(self):
         """getter of input"""
+        if isinstance(self._input, LazyInit):
+            # Create the object of a lazy load
+            self._set_input(self._input.resolve())
         return self._input
 
     def _set_input(self, value):
         """setter of input"""
         check_var("input", value, "Input")
         self._input = value
+        self._clear_memo()
 
         if self._input is not None:
             self._input.parent = self
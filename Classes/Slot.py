@@ -4,70 +4,11 @@ WARNING! All changes made in this file will be lost!
 """
 
 from os import linesep
-from pyleecan.Classes._check import check_init_dict, check_var, raise_
+from pyleecan.Classes._check import check_init_dict, check_var
 from pyleecan.Functions.save import save
 from pyleecan.Classes._frozen import FrozenClass
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from pyleecan.Methods.Slot.Slot.build_geometry_half_tooth import (
-        build_geometry_half_tooth,
-    )
-except ImportError as error:
-    build_geometry_half_tooth = error
-
-try:
-    from pyleecan.Methods.Slot.Slot.check import check
-except ImportError as error:
-    check = error
-
-try:
-    from pyleecan.Methods.Slot.Slot.comp_angle_opening import comp_angle_opening
-except ImportError as error:
-    comp_angle_opening = error
-
-try:
-    from pyleecan.Methods.Slot.Slot.comp_height import comp_height
-except ImportError as error:
-    comp_height = error
-
-try:
-    from pyleecan.Methods.Slot.Slot.comp_surface import comp_surface
-except ImportError as error:
-    comp_surface = error
-
-try:
-    from pyleecan.Methods.Slot.Slot.get_is_stator import get_is_stator
-except ImportError as error:
-    get_is_stator = error
-
-try:
-    from pyleecan.Methods.Slot.Slot.get_Rbo import get_Rbo
-except ImportError as error:
-    get_Rbo = error
-
-try:
-    from pyleecan.Methods.Slot.Slot.get_surface import get_surface
-except ImportError as error:
-    get_surface = error
-
-try:
-    from pyleecan.Methods.Slot.Slot.get_surface_tooth import get_surface_tooth
-except ImportError as error:
-    get_surface_tooth = error
-
-try:
-    from pyleecan.Methods.Slot.Slot.is_outwards import is_outwards
-except ImportError as error:
-    is_outwards = error
-
-try:
-    from pyleecan.Methods.Slot.Slot.plot import plot
-except ImportError as error:
-    plot = error
-
-
+from pyleecan.Classes._lazy import LazyMethod
 from pyleecan.Classes._check import InitUnKnowClassError
 
 
@@ -76,116 +17,30 @@ class Slot(FrozenClass):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
     # cf Methods.Slot.Slot.build_geometry_half_tooth
-    if isinstance(build_geometry_half_tooth, ImportError):
-        build_geometry_half_tooth = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Slot method build_geometry_half_tooth: "
-                    + str(build_geometry_half_tooth)
-                )
-            )
-        )
-    else:
-        build_geometry_half_tooth = build_geometry_half_tooth
+    build_geometry_half_tooth = LazyMethod(
+        "pyleecan.Methods.Slot.Slot.build_geometry_half_tooth"
+    )
     # cf Methods.Slot.Slot.check
-    if isinstance(check, ImportError):
-        check = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Slot method check: " + str(check))
-            )
-        )
-    else:
-        check = check
+    check = LazyMethod("pyleecan.Methods.Slot.Slot.check")
     # cf Methods.Slot.Slot.comp_angle_opening
-    if isinstance(comp_angle_opening, ImportError):
-        comp_angle_opening = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Slot method comp_angle_opening: "
-                    + str(comp_angle_opening)
-                )
-            )
-        )
-    else:
-        comp_angle_opening = comp_angle_opening
+    comp_angle_opening = LazyMethod("pyleecan.Methods.Slot.Slot.comp_angle_opening")
     # cf Methods.Slot.Slot.comp_height
-    if isinstance(comp_height, ImportError):
-        comp_height = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Slot method comp_height: " + str(comp_height))
-            )
-        )
-    else:
-        comp_height = comp_height
+    comp_height = LazyMethod("pyleecan.Methods.Slot.Slot.comp_height")
     # cf Methods.Slot.Slot.comp_surface
-    if isinstance(comp_surface, ImportError):
-        comp_surface = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Slot method comp_surface: " + str(comp_surface))
-            )
-        )
-    else:
-        comp_surface = comp_surface
+    comp_surface = LazyMethod("pyleecan.Methods.Slot.Slot.comp_surface")
     # cf Methods.Slot.Slot.get_is_stator
-    if isinstance(get_is_stator, ImportError):
-        get_is_stator = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Slot method get_is_stator: " + str(get_is_stator)
-                )
-            )
-        )
-    else:
-        get_is_stator = get_is_stator
+    get_is_stator = LazyMethod("pyleecan.Methods.Slot.Slot.get_is_stator")
     # cf Methods.Slot.Slot.get_Rbo
-    if isinstance(get_Rbo, ImportError):
-        get_Rbo = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Slot method get_Rbo: " + str(get_Rbo))
-            )
-        )
-    else:
-        get_Rbo = get_Rbo
+    get_Rbo = LazyMethod("pyleecan.Methods.Slot.Slot.get_Rbo")
     # cf Methods.Slot.Slot.get_surface
-    if isinstance(get_surface, ImportError):
-        get_surface = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Slot method get_surface: " + str(get_surface))
-            )
-        )
-    else:
-        get_surface = get_surface
+    get_surface = LazyMethod("pyleecan.Methods.Slot.Slot.get_surface")
     # cf Methods.Slot.Slot.get_surface_tooth
-    if isinstance(get_surface_tooth, ImportError):
-        get_surface_tooth = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Slot method get_surface_tooth: " + str(get_surface_tooth)
-                )
-            )
-        )
-    else:
-        get_surface_tooth = get_surface_tooth
+    get_surface_tooth = LazyMethod("pyleecan.Methods.Slot.Slot.get_surface_tooth")
     # cf Methods.Slot.Slot.is_outwards
-    if isinstance(is_outwards, ImportError):
-        is_outwards = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Slot method is_outwards: " + str(is_outwards))
-            )
-        )
-    else:
-        is_outwards = is_outwards
+    is_outwards = LazyMethod("pyleecan.Methods.Slot.Slot.is_outwards")
     # cf Methods.Slot.Slot.plot
-    if isinstance(plot, ImportError):
-        plot = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Slot method plot: " + str(plot))
-            )
-        )
-    else:
-        plot = plot
+    plot = LazyMethod("pyleecan.Methods.Slot.Slot.plot")
     # save method is available in all object
     save = save
 
@@ -202,7 +57,7 @@ class Slot(FrozenClass):
         if init_dict is not None:  # Initialisation by dict
             check_init_dict(init_dict, ["Zs"])
             # Overwrite default value with init_dict content
-            if "Zs" in list(init_dict.keys()):
+            if "Zs" in init_dict:
                 Zs = init_dict["Zs"]
         # Initialisation by argument
         self.parent = None
@@ -231,8 +86,9 @@ class Slot(FrozenClass):
             return False
         return True
 
-    def as_dict(self):
+    def as_dict(self, is_keep_array=False):
         """Convert this objet in a json seriable dict (can be use in __init__)
+        The ndarray are not converted to list if is_keep_array
         """
 
         Slot_dict = dict()
@@ -241,6 +97,11 @@ class Slot(FrozenClass):
         Slot_dict["__class__"] = "Slot"
         return Slot_dict
 
+    def _copy_to(self, obj):
+        """Copy the properties of this object in obj (called by copy)"""
+
+        obj._Zs = self._Zs
+
     def _set_None(self):
         """Set all the properties to None (except pyleecan object)"""
 
@@ -254,6 +115,7 @@ class Slot(FrozenClass):
         """setter of Zs"""
         check_var("Zs", value, "int", Vmin=0, Vmax=1000)
         self._Zs = value
+        self._clear_memo()
 
     # slot number
     # Type : int, min = 0, max = 1000
@@ -4,50 +4,11 @@ WARNING! All changes made in this file will be lost!
 """
 
 from os import linesep
-from pyleecan.Classes._check import check_init_dict, check_var, raise_
+from pyleecan.Classes._check import check_init_dict, check_var
 from pyleecan.Functions.save import save
 from pyleecan.Classes.Slot import Slot
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from pyleecan.Methods.Slot.Slot19._comp_point_coordinate import (
-        _comp_point_coordinate,
-    )
-except ImportError as error:
-    _comp_point_coordinate = error
-
-try:
-    from pyleecan.Methods.Slot.Slot19.build_geometry import build_geometry
-except ImportError as error:
-    build_geometry = error
-
-try:
-    from pyleecan.Methods.Slot.Slot19.check import check
-except ImportError as error:
-    check = error
-
-try:
-    from pyleecan.Methods.Slot.Slot19.comp_angle_opening import comp_angle_opening
-except ImportError as error:
-    comp_angle_opening = error
-
-try:
-    from pyleecan.Methods.Slot.Slot19.comp_angle_bottom import comp_angle_bottom
-except ImportError as error:
-    comp_angle_bottom = error
-
-try:
-    from pyleecan.Methods.Slot.Slot19.comp_height import comp_height
-except ImportError as error:
-    comp_height = error
-
-try:
-    from pyleecan.Methods.Slot.Slot19.comp_surface import comp_surface
-except ImportError as error:
-    comp_surface = error
-
-
+from pyleecan.Classes._lazy import LazyMethod
 from pyleecan.Classes._check import InitUnKnowClassError
 
 
@@ -57,83 +18,22 @@ class Slot19(Slot):
     VERSION = 1
     IS_SYMMETRICAL = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
     # cf Methods.Slot.Slot19._comp_point_coordinate
-    if isinstance(_comp_point_coordinate, ImportError):
-        _comp_point_coordinate = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Slot19 method _comp_point_coordinate: "
-                    + str(_comp_point_coordinate)
-                )
-            )
-        )
-    else:
-        _comp_point_coordinate = _comp_point_coordinate
+    _comp_point_coordinate = LazyMethod(
+        "pyleecan.Methods.Slot.Slot19._comp_point_coordinate"
+    )
     # cf Methods.Slot.Slot19.build_geometry
-    if isinstance(build_geometry, ImportError):
-        build_geometry = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Slot19 method build_geometry: " + str(build_geometry)
-                )
-            )
-        )
-    else:
-        build_geometry = build_geometry
+    build_geometry = LazyMethod("pyleecan.Methods.Slot.Slot19.build_geometry")
     # cf Methods.Slot.Slot19.check
-    if isinstance(check, ImportError):
-        check = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Slot19 method check: " + str(check))
-            )
-        )
-    else:
-        check = check
+    check = LazyMethod("pyleecan.Methods.Slot.Slot19.check")
     # cf Methods.Slot.Slot19.comp_angle_opening
-    if isinstance(comp_angle_opening, ImportError):
-        comp_angle_opening = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Slot19 method comp_angle_opening: "
-                    + str(comp_angle_opening)
-                )
-            )
-        )
-    else:
-        comp_angle_opening = comp_angle_opening
+    comp_angle_opening = LazyMethod("pyleecan.Methods.Slot.Slot19.comp_angle_opening")
     # cf Methods.Slot.Slot19.comp_angle_bottom
-    if isinstance(comp_angle_bottom, ImportError):
-        comp_angle_bottom = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Slot19 method comp_angle_bottom: "
-                    + str(comp_angle_bottom)
-                )
-            )
-        )
-    else:
-        comp_angle_bottom = comp_angle_bottom
+    comp_angle_bottom = LazyMethod("pyleecan.Methods.Slot.Slot19.comp_angle_bottom")
     # cf Methods.Slot.Slot19.comp_height
-    if isinstance(comp_height, ImportError):
-        comp_height = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Slot19 method comp_height: " + str(comp_height))
-            )
-        )
-    else:
-        comp_height = comp_height
+    comp_height = LazyMethod("pyleecan.Methods.Slot.Slot19.comp_height")
     # cf Methods.Slot.Slot19.comp_surface
-    if isinstance(comp_surface, ImportError):
-        comp_surface = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Slot19 method comp_surface: " + str(comp_surface)
-                )
-            )
-        )
-    else:
-        comp_surface = comp_surface
+    comp_surface = LazyMethod("pyleecan.Methods.Slot.Slot19.comp_surface")
     # save method is available in all object
     save = save
 
@@ -152,15 +52,15 @@ class Slot19(Slot):
         if init_dict is not None:  # Initialisation by dict
             check_init_dict(init_dict, ["W0", "H0", "W1", "Wx_is_rad", "Zs"])
             # Overwrite default value with init_dict content
-            if "W0" in list(init_dict.keys()):
+            if "W0" in init_dict:
                 W0 = init_dict["W0"]
-            if "H0" in list(init_dict.keys()):
+            if "H0" in init_dict:
                 H0 = init_dict["H0"]
-            if "W1" in list(init_dict.keys()):
+            if "W1" in init_dict:
                 W1 = init_dict["W1"]
-            if "Wx_is_rad" in list(init_dict.keys()):
+            if "Wx_is_rad" in init_dict:
                 Wx_is_rad = init_dict["Wx_is_rad"]
-            if "Zs" in list(init_dict.keys()):
+            if "Zs" in init_dict:
                 Zs = init_dict["Zs"]
         # Initialisation by argument
         self.W0 = W0
@@ -203,12 +103,13 @@ class Slot19(Slot):
             return False
         return True
 
-    def as_dict(self):
+    def as_dict(self, is_keep_array=False):
         """Convert this objet in a json seriable dict (can be use in __init__)
+        The ndarray are not converted to list if is_keep_array
         """
 
         # Get the properties inherited from Slot
-        Slot19_dict = super(Slot19, self).as_dict()
+        Slot19_dict = super(Slot19, self).as_dict(is_keep_array=is_keep_array)
         Slot19_dict["W0"] = self.W0
         Slot19_dict["H0"] = self.H0
         Slot19_dict["W1"] = self.W1
@@ -218,6 +119,16 @@ class Slot19(Slot):
         Slot19_dict["__class__"] = "Slot19"
         return Slot19_dict
 
+    def _copy_to(self, obj):
+        """Copy the properties of this object in obj (called by copy)"""
+
+        # Copy the properties inherited from Slot
+        super(Slot19, self)._copy_to(obj)
+        obj._W0 = self._W0
+        obj._H0 = self._H0
+        obj._W1 = self._W1
+        obj._Wx_is_rad = self._Wx_is_rad
+
     def _set_None(self):
         """Set all the properties to None (except pyleecan object)"""
 
@@ -236,6 +147,7 @@ class Slot19(Slot):
         """setter of W0"""
         check_var("W0", value, "float", Vmin=0)
         self._W0 = value
+        self._clear_memo()
 
     # Slot top width
     # Type : float, min = 0
@@ -249,6 +161,7 @@ class Slot19(Slot):
         """setter of H0"""
         check_var("H0", value, "float", Vmin=0)
         self._H0 = value
+        self._clear_memo()
 
     # Slot height
     # Type : float, min = 0
@@ -262,6 +175,7 @@ class Slot19(Slot):
         """setter of W1"""
         check_var("W1", value, "float", Vmin=0)
         self._W1 = value
+        self._clear_memo()
 
     # Slot bottom width.
     # Type : float, min = 0
@@ -275,6 +189,7 @@ class Slot19(Slot):
         """setter of Wx_is_rad"""
         check_var("Wx_is_rad", value, "bool")
         self._Wx_is_rad = value
+        self._clear_memo()
 
     # Wx unit, 0 for m, 1 for rad
     # Type : bool
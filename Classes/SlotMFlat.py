@@ -4,50 +4,11 @@ WARNING! All changes made in this file will be lost!
 """
 
 from os import linesep
-from pyleecan.Classes._check import check_init_dict, check_var, raise_
+from pyleecan.Classes._check import check_init_dict, check_var
 from pyleecan.Functions.save import save
 from pyleecan.Classes.SlotMag import SlotMag
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from pyleecan.Methods.Slot.SlotMFlat.build_geometry import build_geometry
-except ImportError as error:
-    build_geometry = error
-
-try:
-    from pyleecan.Methods.Slot.SlotMFlat.comp_angle_opening import comp_angle_opening
-except ImportError as error:
-    comp_angle_opening = error
-
-try:
-    from pyleecan.Methods.Slot.SlotMFlat.comp_angle_opening_magnet import (
-        comp_angle_opening_magnet,
-    )
-except ImportError as error:
-    comp_angle_opening_magnet = error
-
-try:
-    from pyleecan.Methods.Slot.SlotMFlat.comp_height import comp_height
-except ImportError as error:
-    comp_height = error
-
-try:
-    from pyleecan.Methods.Slot.SlotMFlat.comp_surface import comp_surface
-except ImportError as error:
-    comp_surface = error
-
-try:
-    from pyleecan.Methods.Slot.SlotMFlat.comp_W0m import comp_W0m
-except ImportError as error:
-    comp_W0m = error
-
-try:
-    from pyleecan.Methods.Slot.SlotMFlat.get_point_bottom import get_point_bottom
-except ImportError as error:
-    get_point_bottom = error
-
-
+from pyleecan.Classes._lazy import LazyInit, LazyMethod
 from pyleecan.Classes._check import InitUnKnowClassError
 from pyleecan.Classes.MagnetFlat import MagnetFlat
 
@@ -59,85 +20,24 @@ class SlotMFlat(SlotMag):
     IS_SYMMETRICAL = 1
     IS_INSET = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
     # cf Methods.Slot.SlotMFlat.build_geometry
-    if isinstance(build_geometry, ImportError):
-        build_geometry = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use SlotMFlat method build_geometry: " + str(build_geometry)
-                )
-            )
-        )
-    else:
-        build_geometry = build_geometry
+    build_geometry = LazyMethod("pyleecan.Methods.Slot.SlotMFlat.build_geometry")
     # cf Methods.Slot.SlotMFlat.comp_angle_opening
-    if isinstance(comp_angle_opening, ImportError):
-        comp_angle_opening = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use SlotMFlat method comp_angle_opening: "
-                    + str(comp_angle_opening)
-                )
-            )
-        )
-    else:
-        comp_angle_opening = comp_angle_opening
+    comp_angle_opening = LazyMethod(
+        "pyleecan.Methods.Slot.SlotMFlat.comp_angle_opening"
+    )
     # cf Methods.Slot.SlotMFlat.comp_angle_opening_magnet
-    if isinstance(comp_angle_opening_magnet, ImportError):
-        comp_angle_opening_magnet = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use SlotMFlat method comp_angle_opening_magnet: "
-                    + str(comp_angle_opening_magnet)
-                )
-            )
-        )
-    else:
-        comp_angle_opening_magnet = comp_angle_opening_magnet
+    comp_angle_opening_magnet = LazyMethod(
+        "pyleecan.Methods.Slot.SlotMFlat.comp_angle_opening_magnet"
+    )
     # cf Methods.Slot.SlotMFlat.comp_height
-    if isinstance(comp_height, ImportError):
-        comp_height = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use SlotMFlat method comp_height: " + str(comp_height)
-                )
-            )
-        )
-    else:
-        comp_height = comp_height
+    comp_height = LazyMethod("pyleecan.Methods.Slot.SlotMFlat.comp_height")
     # cf Methods.Slot.SlotMFlat.comp_surface
-    if isinstance(comp_surface, ImportError):
-        comp_surface = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use SlotMFlat method comp_surface: " + str(comp_surface)
-                )
-            )
-        )
-    else:
-        comp_surface = comp_surface
+    comp_surface = LazyMethod("pyleecan.Methods.Slot.SlotMFlat.comp_surface")
     # cf Methods.Slot.SlotMFlat.comp_W0m
-    if isinstance(comp_W0m, ImportError):
-        comp_W0m = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use SlotMFlat method comp_W0m: " + str(comp_W0m))
-            )
-        )
-    else:
-        comp_W0m = comp_W0m
+    comp_W0m = LazyMethod("pyleecan.Methods.Slot.SlotMFlat.comp_W0m")
     # cf Methods.Slot.SlotMFlat.get_point_bottom
-    if isinstance(get_point_bottom, ImportError):
-        get_point_bottom = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use SlotMFlat method get_point_bottom: "
-                    + str(get_point_bottom)
-                )
-            )
-        )
-    else:
-        get_point_bottom = get_point_bottom
+    get_point_bottom = LazyMethod("pyleecan.Methods.Slot.SlotMFlat.get_point_bottom")
     # save method is available in all object
     save = save
 
@@ -163,17 +63,17 @@ class SlotMFlat(SlotMag):
         if init_dict is not None:  # Initialisation by dict
             check_init_dict(init_dict, ["H0", "W0", "W0_is_rad", "magnet", "W3", "Zs"])
             # Overwrite default value with init_dict content
-            if "H0" in list(init_dict.keys()):
+            if "H0" in init_dict:
                 H0 = init_dict["H0"]
-            if "W0" in list(init_dict.keys()):
+            if "W0" in init_dict:
                 W0 = init_dict["W0"]
-            if "W0_is_rad" in list(init_dict.keys()):
+            if "W0_is_rad" in init_dict:
                 W0_is_rad = init_dict["W0_is_rad"]
-            if "magnet" in list(init_dict.keys()):
+            if "magnet" in init_dict:
                 magnet = init_dict["magnet"]
-            if "W3" in list(init_dict.keys()):
+            if "W3" in init_dict:
                 W3 = init_dict["W3"]
-            if "Zs" in list(init_dict.keys()):
+            if "Zs" in init_dict:
                 Zs = init_dict["Zs"]
         # Initialisation by argument
         self.H0 = H0
@@ -184,7 +84,7 @@ class SlotMFlat(SlotMag):
         if type(magnet) is list:
             for obj in magnet:
                 if obj is None:  # Default value
-                    self.magnet.append(MagnetFlat())
+                    self._magnet.append(MagnetFlat())
                 elif isinstance(obj, dict):
                     # Check that the type is correct (including daughter)
                     class_name = obj.get("__class__")
@@ -204,9 +104,9 @@ class SlotMFlat(SlotMag):
                         "pyleecan.Classes." + class_name, fromlist=[class_name]
                     )
                     class_obj = getattr(module, class_name)
-                    self.magnet.append(class_obj(init_dict=obj))
+                    self._magnet.append(class_obj(init_dict=obj))
                 else:
-                    self.magnet.append(obj)
+                    self._magnet.append(obj)
         elif magnet is None:
             self.magnet = list()
         else:
@@ -252,23 +152,39 @@ class SlotMFlat(SlotMag):
             return False
         return True
 
-    def as_dict(self):
+    def as_dict(self, is_keep_array=False):
         """Convert this objet in a json seriable dict (can be use in __init__)
+        The ndarray are not converted to list if is_keep_array
         """
 
         # Get the properties inherited from SlotMag
-        SlotMFlat_dict = super(SlotMFlat, self).as_dict()
+        SlotMFlat_dict = super(SlotMFlat, self).as_dict(is_keep_array=is_keep_array)
         SlotMFlat_dict["H0"] = self.H0
         SlotMFlat_dict["W0"] = self.W0
         SlotMFlat_dict["W0_is_rad"] = self.W0_is_rad
         SlotMFlat_dict["magnet"] = list()
         for obj in self.magnet:
-            SlotMFlat_dict["magnet"].append(obj.as_dict())
+            SlotMFlat_dict["magnet"].append(obj.as_dict(is_keep_array=is_keep_array))
         # The class name is added to the dict fordeserialisation purpose
         # Overwrite the mother class name
         SlotMFlat_dict["__class__"] = "SlotMFlat"
         return SlotMFlat_dict
 
+    def _copy_to(self, obj):
+        """Copy the properties of this object in obj (called by copy)"""
+
+        # Copy the properties inherited from SlotMag
+        super(SlotMFlat, self)._copy_to(obj)
+        obj._H0 = self._H0
+        obj._W0 = self._W0
+        obj._W0_is_rad = self._W0_is_rad
+        obj._magnet = list()
+        for value in self._magnet:
+            if value is not None:
+                value = value.copy()
+                value.parent = obj
+            obj._magnet.append(value)
+
     def _set_None(self):
         """Set all the properties to None (except pyleecan object)"""
 
@@ -288,6 +204,7 @@ class SlotMFlat(SlotMag):
         """setter of H0"""
         check_var("H0", value, "float", Vmin=0)
         self._H0 = value
+        self._clear_memo()
 
     # Slot isthmus height
     # Type : float, min = 0
@@ -301,6 +218,7 @@ class SlotMFlat(SlotMag):
         """setter of W0"""
         check_var("W0", value, "float", Vmin=0)
         self._W0 = value
+        self._clear_memo()
 
     # Slot isthmus width.
     # Type : float, min = 0
@@ -314,6 +232,7 @@ class SlotMFlat(SlotMag):
         """setter of W0_is_rad"""
         check_var("W0_is_rad", value, "bool")
         self._W0_is_rad = value
+        self._clear_memo()
 
     # W0 unit, 0 for m, 1 for rad
     # Type : bool
@@ -323,7 +242,11 @@ class SlotMFlat(SlotMag):
 
     def _get_magnet(self):
         """getter of magnet"""
-        for obj in self._magnet:
+        for ii, obj in enumerate(self._magnet):
+            if isinstance(obj, LazyInit):
+                # Create the object of a lazy load
+                obj = obj.resolve()
+                self._magnet[ii] = obj
             if obj is not None:
                 obj.parent = self
         return self._magnet
@@ -332,6 +255,7 @@ class SlotMFlat(SlotMag):
         """setter of magnet"""
         check_var("magnet", value, "[MagnetFlat]")
         self._magnet = value
+        self._clear_memo()
 
         for obj in self._magnet:
             if obj is not None:
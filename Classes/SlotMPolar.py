@@ -4,45 +4,11 @@ WARNING! All changes made in this file will be lost!
 """
 
 from os import linesep
-from pyleecan.Classes._check import check_init_dict, check_var, raise_
+from pyleecan.Classes._check import check_init_dict, check_var
 from pyleecan.Functions.save import save
 from pyleecan.Classes.SlotMag import SlotMag
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from pyleecan.Methods.Slot.SlotMPolar.build_geometry import build_geometry
-except ImportError as error:
-    build_geometry = error
-
-try:
-    from pyleecan.Methods.Slot.SlotMPolar.comp_angle_opening import comp_angle_opening
-except ImportError as error:
-    comp_angle_opening = error
-
-try:
-    from pyleecan.Methods.Slot.SlotMPolar.comp_angle_opening_magnet import (
-        comp_angle_opening_magnet,
-    )
-except ImportError as error:
-    comp_angle_opening_magnet = error
-
-try:
-    from pyleecan.Methods.Slot.SlotMPolar.comp_height import comp_height
-except ImportError as error:
-    comp_height = error
-
-try:
-    from pyleecan.Methods.Slot.SlotMPolar.comp_surface import comp_surface
-except ImportError as error:
-    comp_surface = error
-
-try:
-    from pyleecan.Methods.Slot.SlotMPolar.get_point_bottom import get_point_bottom
-except ImportError as error:
-    get_point_bottom = error
-
-
+from pyleecan.Classes._lazy import LazyInit, LazyMethod
 from pyleecan.Classes._check import InitUnKnowClassError
 from pyleecan.Classes.MagnetPolar import MagnetPolar
 
@@ -54,76 +20,22 @@ class SlotMPolar(SlotMag):
     IS_SYMMETRICAL = 1
     IS_INSET = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
     # cf Methods.Slot.SlotMPolar.build_geometry
-    if isinstance(build_geometry, ImportError):
-        build_geometry = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use SlotMPolar method build_geometry: " + str(build_geometry)
-                )
-            )
-        )
-    else:
-        build_geometry = build_geometry
+    build_geometry = LazyMethod("pyleecan.Methods.Slot.SlotMPolar.build_geometry")
     # cf Methods.Slot.SlotMPolar.comp_angle_opening
-    if isinstance(comp_angle_opening, ImportError):
-        comp_angle_opening = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use SlotMPolar method comp_angle_opening: "
-                    + str(comp_angle_opening)
-                )
-            )
-        )
-    else:
-        comp_angle_opening = comp_angle_opening
+    comp_angle_opening = LazyMethod(
+        "pyleecan.Methods.Slot.SlotMPolar.comp_angle_opening"
+    )
     # cf Methods.Slot.SlotMPolar.comp_angle_opening_magnet
-    if isinstance(comp_angle_opening_magnet, ImportError):
-        comp_angle_opening_magnet = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use SlotMPolar method comp_angle_opening_magnet: "
-                    + str(comp_angle_opening_magnet)
-                )
-            )
-        )
-    else:
-        comp_angle_opening_magnet = comp_angle_opening_magnet
+    comp_angle_opening_magnet = LazyMethod(
+        "pyleecan.Methods.Slot.SlotMPolar.comp_angle_opening_magnet"
+    )
     # cf Methods.Slot.SlotMPolar.comp_height
-    if isinstance(comp_height, ImportError):
-        comp_height = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use SlotMPolar method comp_height: " + str(comp_height)
-                )
-            )
-        )
-    else:
-        comp_height = comp_height
+    comp_height = LazyMethod("pyleecan.Methods.Slot.SlotMPolar.comp_height")
     # cf Methods.Slot.SlotMPolar.comp_surface
-    if isinstance(comp_surface, ImportError):
-        comp_surface = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use SlotMPolar method comp_surface: " + str(comp_surface)
-                )
-            )
-        )
-    else:
-        comp_surface = comp_surface
+    comp_surface = LazyMethod("pyleecan.Methods.Slot.SlotMPolar.comp_surface")
     # cf Methods.Slot.SlotMPolar.get_point_bottom
-    if isinstance(get_point_bottom, ImportError):
-        get_point_bottom = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use SlotMPolar method get_point_bottom: "
-                    + str(get_point_bottom)
-                )
-            )
-        )
-    else:
-        get_point_bottom = get_point_bottom
+    get_point_bottom = LazyMethod("pyleecan.Methods.Slot.SlotMPolar.get_point_bottom")
     # save method is available in all object
     save = save
 
@@ -140,15 +52,15 @@ class SlotMPolar(SlotMag):
         if init_dict is not None:  # Initialisation by dict
             check_init_dict(init_dict, ["W0", "H0", "magnet", "W3", "Zs"])
             # Overwrite default value with init_dict content
-            if "W0" in list(init_dict.keys()):
+            if "W0" in init_dict:
                 W0 = init_dict["W0"]
-            if "H0" in list(init_dict.keys()):
+            if "H0" in init_dict:
                 H0 = init_dict["H0"]
-            if "magnet" in list(init_dict.keys()):
+            if "magnet" in init_dict:
                 magnet = init_dict["magnet"]
-            if "W3" in list(init_dict.keys()):
+            if "W3" in init_dict:
                 W3 = init_dict["W3"]
-            if "Zs" in list(init_dict.keys()):
+            if "Zs" in init_dict:
                 Zs = init_dict["Zs"]
         # Initialisation by argument
         self.W0 = W0
@@ -158,7 +70,7 @@ class SlotMPolar(SlotMag):
         if type(magnet) is list:
             for obj in magnet:
                 if obj is None:  # Default value
-                    self.magnet.append(MagnetPolar())
+                    self._magnet.append(MagnetPolar())
                 elif isinstance(obj, dict):
                     # Check that the type is correct (including daughter)
                     class_name = obj.get("__class__")
@@ -177,9 +89,9 @@ class SlotMPolar(SlotMag):
                         "pyleecan.Classes." + class_name, fromlist=[class_name]
                     )
                     class_obj = getattr(module, class_name)
-                    self.magnet.append(class_obj(init_dict=obj))
+                    self._magnet.append(class_obj(init_dict=obj))
                 else:
-                    self.magnet.append(obj)
+                    self._magnet.append(obj)
         elif magnet is None:
             self.magnet = list()
         else:
@@ -222,22 +134,37 @@ class SlotMPolar(SlotMag):
             return False
         return True
 
-    def as_dict(self):
+    def as_dict(self, is_keep_array=False):
         """Convert this objet in a json seriable dict (can be use in __init__)
+        The ndarray are not converted to list if is_keep_array
         """
 
         # Get the properties inherited from SlotMag
-        SlotMPolar_dict = super(SlotMPolar, self).as_dict()
+        SlotMPolar_dict = super(SlotMPolar, self).as_dict(is_keep_array=is_keep_array)
         SlotMPolar_dict["W0"] = self.W0
         SlotMPolar_dict["H0"] = self.H0
         SlotMPolar_dict["magnet"] = list()
         for obj in self.magnet:
-            SlotMPolar_dict["magnet"].append(obj.as_dict())
+            SlotMPolar_dict["magnet"].append(obj.as_dict(is_keep_array=is_keep_array))
         # The class name is added to the dict fordeserialisation purpose
         # Overwrite the mother class name
         SlotMPolar_dict["__class__"] = "SlotMPolar"
         return SlotMPolar_dict
 
+    def _copy_to(self, obj):
+        """Copy the properties of this object in obj (called by copy)"""
+
+        # Copy the properties inherited from SlotMag
+        super(SlotMPolar, self)._copy_to(obj)
+        obj._W0 = self._W0
+        obj._H0 = self._H0
+        obj._magnet = list()
+        for value in self._magnet:
+            if value is not None:
+                value = value.copy()
+                value.parent = obj
+            obj._magnet.append(value)
+
     def _set_None(self):
         """Set all the properties to None (except pyleecan object)"""
 
@@ -256,6 +183,7 @@ class SlotMPolar(SlotMag):
         """setter of W0"""
         check_var("W0", value, "float", Vmin=0)
         self._W0 = value
+        self._clear_memo()
 
     # Slot isthmus width.
     # Type : float, min = 0
@@ -269,6 +197,7 @@ class SlotMPolar(SlotMag):
         """setter of H0"""
         check_var("H0", value, "float", Vmin=0)
         self._H0 = value
+        self._clear_memo()
 
     # Slot isthmus height
     # Type : float, min = 0
@@ -276,7 +205,11 @@ class SlotMPolar(SlotMag):
 
     def _get_magnet(self):
         """getter of magnet"""
-        for obj in self._magnet:
+        for ii, obj in enumerate(self._magnet):
+            if isinstance(obj, LazyInit):
+                # Create the object of a lazy load
+                obj = obj.resolve()
+                self._magnet[ii] = obj
             if obj is not None:
                 obj.parent = self
         return self._magnet
@@ -285,6 +218,7 @@ class SlotMPolar(SlotMag):
         """setter of magnet"""
         check_var("magnet", value, "[MagnetPolar]")
         self._magnet = value
+        self._clear_memo()
 
         for obj in self._magnet:
             if obj is not None:
@@ -4,7 +4,7 @@ WARNING! All changes made in this file will be lost!
 """
 
 from os import linesep
-from pyleecan.Classes._check import check_init_dict, check_var, raise_
+from pyleecan.Classes._check import check_init_dict, check_var
 from pyleecan.Functions.save import save
 from pyleecan.Classes.Slot import Slot
 
@@ -32,9 +32,9 @@ class SlotMag(Slot):
         if init_dict is not None:  # Initialisation by dict
             check_init_dict(init_dict, ["W3", "Zs"])
             # Overwrite default value with init_dict content
-            if "W3" in list(init_dict.keys()):
+            if "W3" in init_dict:
                 W3 = init_dict["W3"]
-            if "Zs" in list(init_dict.keys()):
+            if "Zs" in init_dict:
                 Zs = init_dict["Zs"]
         # Initialisation by argument
         self.W3 = W3
@@ -65,18 +65,26 @@ class SlotMag(Slot):
             return False
         return True
 
-    def as_dict(self):
+    def as_dict(self, is_keep_array=False):
         """Convert this objet in a json seriable dict (can be use in __init__)
+        The ndarray are not converted to list if is_keep_array
         """
 
         # Get the properties inherited from Slot
-        SlotMag_dict = super(SlotMag, self).as_dict()
+        SlotMag_dict = super(SlotMag, self).as_dict(is_keep_array=is_keep_array)
         SlotMag_dict["W3"] = self.W3
         # The class name is added to the dict fordeserialisation purpose
         # Overwrite the mother class name
         SlotMag_dict["__class__"] = "SlotMag"
         return SlotMag_dict
 
+    def _copy_to(self, obj):
+        """Copy the properties of this object in obj (called by copy)"""
+
+        # Copy the properties inherited from Slot
+        super(SlotMag, self)._copy_to(obj)
+        obj._W3 = self._W3
+
     def _set_None(self):
         """Set all the properties to None (except pyleecan object)"""
 
@@ -92,6 +100,7 @@ class SlotMag(Slot):
         """setter of W3"""
         check_var("W3", value, "float")
         self._W3 = value
+        self._clear_memo()
 
     # Angle between magnet in the slot
     # Type : float
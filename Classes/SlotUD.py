@@ -4,18 +4,12 @@ WARNING! All changes made in this file will be lost!
 """
 
 from os import linesep
-from pyleecan.Classes._check import check_init_dict, check_var, raise_
+from pyleecan.Classes._check import check_init_dict, check_var
 from pyleecan.Functions.save import save
 from pyleecan.Classes.Slot import Slot
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from pyleecan.Methods.Slot.SlotUD.build_geometry import build_geometry
-except ImportError as error:
-    build_geometry = error
-
-
+from copy import deepcopy
+from pyleecan.Classes._lazy import LazyMethod
 from pyleecan.Classes._check import InitUnKnowClassError
 
 
@@ -25,16 +19,7 @@ class SlotUD(Slot):
     VERSION = 1
 
     # cf Methods.Slot.SlotUD.build_geometry
-    if isinstance(build_geometry, ImportError):
-        build_geometry = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use SlotUD method build_geometry: " + str(build_geometry)
-                )
-            )
-        )
-    else:
-        build_geometry = build_geometry
+    build_geometry = LazyMethod("pyleecan.Methods.Slot.SlotUD.build_geometry")
     # save method is available in all object
     save = save
 
@@ -51,11 +36,11 @@ class SlotUD(Slot):
         if init_dict is not None:  # Initialisation by dict
             check_init_dict(init_dict, ["point_list", "is_sym", "Zs"])
             # Overwrite default value with init_dict content
-            if "point_list" in list(init_dict.keys()):
+            if "point_list" in init_dict:
                 point_list = init_dict["point_list"]
-            if "is_sym" in list(init_dict.keys()):
+            if "is_sym" in init_dict:
                 is_sym = init_dict["is_sym"]
-            if "Zs" in list(init_dict.keys()):
+            if "Zs" in init_dict:
                 Zs = init_dict["Zs"]
         # Initialisation by argument
         self.point_list = point_list
@@ -90,12 +75,13 @@ class SlotUD(Slot):
             return False
         return True
 
-    def as_dict(self):
+    def as_dict(self, is_keep_array=False):
         """Convert this objet in a json seriable dict (can be use in __init__)
+        The ndarray are not converted to list if is_keep_array
         """
 
         # Get the properties inherited from Slot
-        SlotUD_dict = super(SlotUD, self).as_dict()
+        SlotUD_dict = super(SlotUD, self).as_dict(is_keep_array=is_keep_array)
         SlotUD_dict["point_list"] = self.point_list
         SlotUD_dict["is_sym"] = self.is_sym
         # The class name is added to the dict fordeserialisation purpose
@@ -103,6 +89,14 @@ class SlotUD(Slot):
         SlotUD_dict["__class__"] = "SlotUD"
         return SlotUD_dict
 
+    def _copy_to(self, obj):
+        """Copy the properties of this object in obj (called by copy)"""
+
+        # Copy the properties inherited from Slot
+        super(SlotUD, self)._copy_to(obj)
+        obj._point_list = deepcopy(self._point_list)
+        obj._is_sym = self._is_sym
+
     def _set_None(self):
         """Set all the properties to None (except pyleecan object)"""
 
@@ -119,6 +113,7 @@ class SlotUD(Slot):
         """setter of point_list"""
         check_var("point_list", value, "list")
         self._point_list = value
+        self._clear_memo()
 
     # Coordinates of the slot points (will be connected in order with Segments)
     # Type : list
@@ -136,6 +131,7 @@ class SlotUD(Slot):
         """setter of is_sym"""
         check_var("is_sym", value, "bool")
         self._is_sym = value
+        self._clear_memo()
 
     # True to enter only half of the point coordinates
     # Type : bool
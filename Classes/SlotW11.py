@@ -4,60 +4,11 @@ WARNING! All changes made in this file will be lost!
 """
 
 from os import linesep
-from pyleecan.Classes._check import check_init_dict, check_var, raise_
+from pyleecan.Classes._check import check_init_dict, check_var
 from pyleecan.Functions.save import save
 from pyleecan.Classes.SlotWind import SlotWind
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from pyleecan.Methods.Slot.SlotW11._comp_point_coordinate import (
-        _comp_point_coordinate,
-    )
-except ImportError as error:
-    _comp_point_coordinate = error
-
-try:
-    from pyleecan.Methods.Slot.SlotW11.build_geometry import build_geometry
-except ImportError as error:
-    build_geometry = error
-
-try:
-    from pyleecan.Methods.Slot.SlotW11.build_geometry_wind import build_geometry_wind
-except ImportError as error:
-    build_geometry_wind = error
-
-try:
-    from pyleecan.Methods.Slot.SlotW11.check import check
-except ImportError as error:
-    check = error
-
-try:
-    from pyleecan.Methods.Slot.SlotW11.comp_angle_opening import comp_angle_opening
-except ImportError as error:
-    comp_angle_opening = error
-
-try:
-    from pyleecan.Methods.Slot.SlotW11.comp_height import comp_height
-except ImportError as error:
-    comp_height = error
-
-try:
-    from pyleecan.Methods.Slot.SlotW11.comp_height_wind import comp_height_wind
-except ImportError as error:
-    comp_height_wind = error
-
-try:
-    from pyleecan.Methods.Slot.SlotW11.comp_surface import comp_surface
-except ImportError as error:
-    comp_surface = error
-
-try:
-    from pyleecan.Methods.Slot.SlotW11.comp_surface_wind import comp_surface_wind
-except ImportError as error:
-    comp_surface_wind = error
-
-
+from pyleecan.Classes._lazy import LazyMethod
 from pyleecan.Classes._check import InitUnKnowClassError
 
 
@@ -66,107 +17,28 @@ class SlotW11(SlotWind):
     VERSION = 1
     IS_SYMMETRICAL = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
     # cf Methods.Slot.SlotW11._comp_point_coordinate
-    if isinstance(_comp_point_coordinate, ImportError):
-        _comp_point_coordinate = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use SlotW11 method _comp_point_coordinate: "
-                    + str(_comp_point_coordinate)
-                )
-            )
-        )
-    else:
-        _comp_point_coordinate = _comp_point_coordinate
+    _comp_point_coordinate = LazyMethod(
+        "pyleecan.Methods.Slot.SlotW11._comp_point_coordinate"
+    )
     # cf Methods.Slot.SlotW11.build_geometry
-    if isinstance(build_geometry, ImportError):
-        build_geometry = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use SlotW11 method build_geometry: " + str(build_geometry)
-                )
-            )
-        )
-    else:
-        build_geometry = build_geometry
+    build_geometry = LazyMethod("pyleecan.Methods.Slot.SlotW11.build_geometry")
     # cf Methods.Slot.SlotW11.build_geometry_wind
-    if isinstance(build_geometry_wind, ImportError):
-        build_geometry_wind = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use SlotW11 method build_geometry_wind: "
-                    + str(build_geometry_wind)
-                )
-            )
-        )
-    else:
-        build_geometry_wind = build_geometry_wind
+    build_geometry_wind = LazyMethod(
+        "pyleecan.Methods.Slot.SlotW11.build_geometry_wind"
+    )
     # cf Methods.Slot.SlotW11.check
-    if isinstance(check, ImportError):
-        check = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use SlotW11 method check: " + str(check))
-            )
-        )
-    else:
-        check = check
+    check = LazyMethod("pyleecan.Methods.Slot.SlotW11.check")
     # cf Methods.Slot.SlotW11.comp_angle_opening
-    if isinstance(comp_angle_opening, ImportError):
-        comp_angle_opening = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use SlotW11 method comp_angle_opening: "
-                    + str(comp_angle_opening)
-                )
-            )
-        )
-    else:
-        comp_angle_opening = comp_angle_opening
+    comp_angle_opening = LazyMethod("pyleecan.Methods.Slot.SlotW11.comp_angle_opening")
     # cf Methods.Slot.SlotW11.comp_height
-    if isinstance(comp_height, ImportError):
-        comp_height = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use SlotW11 method comp_height: " + str(comp_height))
-            )
-        )
-    else:
-        comp_height = comp_height
+    comp_height = LazyMethod("pyleecan.Methods.Slot.SlotW11.comp_height")
     # cf Methods.Slot.SlotW11.comp_height_wind
-    if isinstance(comp_height_wind, ImportError):
-        comp_height_wind = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use SlotW11 method comp_height_wind: "
-                    + str(comp_height_wind)
-                )
-            )
-        )
-    else:
-        comp_height_wind = comp_height_wind
+    comp_height_wind = LazyMethod("pyleecan.Methods.Slot.SlotW11.comp_height_wind")
     # cf Methods.Slot.SlotW11.comp_surface
-    if isinstance(comp_surface, ImportError):
-        comp_surface = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use SlotW11 method comp_surface: " + str(comp_surface)
-                )
-            )
-        )
-    else:
-        comp_surface = comp_surface
+    comp_surface = LazyMethod("pyleecan.Methods.Slot.SlotW11.comp_surface")
     # cf Methods.Slot.SlotW11.comp_surface_wind
-    if isinstance(comp_surface_wind, ImportError):
-        comp_surface_wind = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use SlotW11 method comp_surface_wind: "
-                    + str(comp_surface_wind)
-                )
-            )
-        )
-    else:
-        comp_surface_wind = comp_surface_wind
+    comp_surface_wind = LazyMethod("pyleecan.Methods.Slot.SlotW11.comp_surface_wind")
     # save method is available in all object
     save = save
 
@@ -197,23 +69,23 @@ class SlotW11(SlotWind):
                 init_dict, ["W0", "H0", "H1", "H1_is_rad", "W1", "H2", "W2", "R1", "Zs"]
             )
             # Overwrite default value with init_dict content
-            if "W0" in list(init_dict.keys()):
+            if "W0" in init_dict:
                 W0 = init_dict["W0"]
-            if "H0" in list(init_dict.keys()):
+            if "H0" in init_dict:
                 H0 = init_dict["H0"]
-            if "H1" in list(init_dict.keys()):
+            if "H1" in init_dict:
                 H1 = init_dict["H1"]
-            if "H1_is_rad" in list(init_dict.keys()):
+            if "H1_is_rad" in init_dict:
                 H1_is_rad = init_dict["H1_is_rad"]
-            if "W1" in list(init_dict.keys()):
+            if "W1" in init_dict:
                 W1 = init_dict["W1"]
-            if "H2" in list(init_dict.keys()):
+            if "H2" in init_dict:
                 H2 = init_dict["H2"]
-            if "W2" in list(init_dict.keys()):
+            if "W2" in init_dict:
                 W2 = init_dict["W2"]
-            if "R1" in list(init_dict.keys()):
+            if "R1" in init_dict:
                 R1 = init_dict["R1"]
-            if "Zs" in list(init_dict.keys()):
+            if "Zs" in init_dict:
                 Zs = init_dict["Zs"]
         # Initialisation by argument
         self.W0 = W0
@@ -272,12 +144,13 @@ class SlotW11(SlotWind):
             return False
         return True
 
-    def as_dict(self):
+    def as_dict(self, is_keep_array=False):
         """Convert this objet in a json seriable dict (can be use in __init__)
+        The ndarray are not converted to list if is_keep_array
         """
 
         # Get the properties inherited from SlotWind
-        SlotW11_dict = super(SlotW11, self).as_dict()
+        SlotW11_dict = super(SlotW11, self).as_dict(is_keep_array=is_keep_array)
         SlotW11_dict["W0"] = self.W0
         SlotW11_dict["H0"] = self.H0
         SlotW11_dict["H1"] = self.H1
@@ -291,6 +164,20 @@ class SlotW11(SlotWind):
         SlotW11_dict["__class__"] = "SlotW11"
         return SlotW11_dict
 
+    def _copy_to(self, obj):
+        """Copy the properties of this object in obj (called by copy)"""
+
+        # Copy the properties inherited from SlotWind
+        super(SlotW11, self)._copy_to(obj)
+        obj._W0 = self._W0
+        obj._H0 = self._H0
+        obj._H1 = self._H1
+        obj._H1_is_rad = self._H1_is_rad
+        obj._W1 = self._W1
+        obj._H2 = self._H2
+        obj._W2 = self._W2
+        obj._R1 = self._R1
+
     def _set_None(self):
         """Set all the properties to None (except pyleecan object)"""
 
@@ -313,6 +200,7 @@ class SlotW11(SlotWind):
         """setter of W0"""
         check_var("W0", value, "float", Vmin=0)
         self._W0 = value
+        self._clear_memo()
 
     # Slot isthmus width.
     # Type : float, min = 0
@@ -326,6 +214,7 @@ class SlotW11(SlotWind):
         """setter of H0"""
         check_var("H0", value, "float", Vmin=0)
         self._H0 = value
+        self._clear_memo()
 
     # Slot isthmus height.
     # Type : float, min = 0
@@ -339,6 +228,7 @@ class SlotW11(SlotWind):
         """setter of H1"""
         check_var("H1", value, "float", Vmin=0)
         self._H1 = value
+        self._clear_memo()
 
     # height or angle  (See Schematics)
     # Type : float, min = 0
@@ -354,6 +244,7 @@ class SlotW11(SlotWind):
         """setter of H1_is_rad"""
         check_var("H1_is_rad", value, "bool")
         self._H1_is_rad = value
+        self._clear_memo()
 
     # H1 unit, 0 for m, 1 for rad
     # Type : bool
@@ -369,6 +260,7 @@ class SlotW11(SlotWind):
         """setter of W1"""
         check_var("W1", value, "float", Vmin=0)
         self._W1 = value
+        self._clear_memo()
 
     # Slot top width.
     # Type : float, min = 0
@@ -382,6 +274,7 @@ class SlotW11(SlotWind):
         """setter of H2"""
         check_var("H2", value, "float", Vmin=0)
         self._H2 = value
+        self._clear_memo()
 
     # Slot height below wedge
     # Type : float, min = 0
@@ -395,6 +288,7 @@ class SlotW11(SlotWind):
         """setter of W2"""
         check_var("W2", value, "float", Vmin=0)
         self._W2 = value
+        self._clear_memo()
 
     # Slot bottom width.
     # Type : float, min = 0
@@ -408,6 +302,7 @@ class SlotW11(SlotWind):
         """setter of R1"""
         check_var("R1", value, "float", Vmin=0)
         self._R1 = value
+        self._clear_memo()
 
     # Slot bottom radius
     # Type : float, min = 0
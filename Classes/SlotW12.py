@@ -4,53 +4,11 @@ WARNING! All changes made in this file will be lost!
 """
 
 from os import linesep
-from pyleecan.Classes._check import check_init_dict, check_var, raise_
+from pyleecan.Classes._check import check_init_dict, check_var
 from pyleecan.Functions.save import save
 from pyleecan.Classes.SlotWind import SlotWind
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from pyleecan.Methods.Slot.SlotW12.build_geometry import build_geometry
-except ImportError as error:
-    build_geometry = error
-
-try:
-    from pyleecan.Methods.Slot.SlotW12.build_geometry_wind import build_geometry_wind
-except ImportError as error:
-    build_geometry_wind = error
-
-try:
-    from pyleecan.Methods.Slot.SlotW12.check import check
-except ImportError as error:
-    check = error
-
-try:
-    from pyleecan.Methods.Slot.SlotW12.comp_angle_opening import comp_angle_opening
-except ImportError as error:
-    comp_angle_opening = error
-
-try:
-    from pyleecan.Methods.Slot.SlotW12.comp_height import comp_height
-except ImportError as error:
-    comp_height = error
-
-try:
-    from pyleecan.Methods.Slot.SlotW12.comp_height_wind import comp_height_wind
-except ImportError as error:
-    comp_height_wind = error
-
-try:
-    from pyleecan.Methods.Slot.SlotW12.comp_surface import comp_surface
-except ImportError as error:
-    comp_surface = error
-
-try:
-    from pyleecan.Methods.Slot.SlotW12.comp_surface_wind import comp_surface_wind
-except ImportError as error:
-    comp_surface_wind = error
-
-
+from pyleecan.Classes._lazy import LazyMethod
 from pyleecan.Classes._check import InitUnKnowClassError
 
 
@@ -59,95 +17,24 @@ class SlotW12(SlotWind):
     VERSION = 1
     IS_SYMMETRICAL = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
     # cf Methods.Slot.SlotW12.build_geometry
-    if isinstance(build_geometry, ImportError):
-        build_geometry = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use SlotW12 method build_geometry: " + str(build_geometry)
-                )
-            )
-        )
-    else:
-        build_geometry = build_geometry
+    build_geometry = LazyMethod("pyleecan.Methods.Slot.SlotW12.build_geometry")
     # cf Methods.Slot.SlotW12.build_geometry_wind
-    if isinstance(build_geometry_wind, ImportError):
-        build_geometry_wind = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use SlotW12 method build_geometry_wind: "
-                    + str(build_geometry_wind)
-                )
-            )
-        )
-    else:
-        build_geometry_wind = build_geometry_wind
+    build_geometry_wind = LazyMethod(
+        "pyleecan.Methods.Slot.SlotW12.build_geometry_wind"
+    )
     # cf Methods.Slot.SlotW12.check
-    if isinstance(check, ImportError):
-        check = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use SlotW12 method check: " + str(check))
-            )
-        )
-    else:
-        check = check
+    check = LazyMethod("pyleecan.Methods.Slot.SlotW12.check")
     # cf Methods.Slot.SlotW12.comp_angle_opening
-    if isinstance(comp_angle_opening, ImportError):
-        comp_angle_opening = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use SlotW12 method comp_angle_opening: "
-                    + str(comp_angle_opening)
-                )
-            )
-        )
-    else:
-        comp_angle_opening = comp_angle_opening
+    comp_angle_opening = LazyMethod("pyleecan.Methods.Slot.SlotW12.comp_angle_opening")
     # cf Methods.Slot.SlotW12.comp_height
-    if isinstance(comp_height, ImportError):
-        comp_height = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use SlotW12 method comp_height: " + str(comp_height))
-            )
-        )
-    else:
-        comp_height = comp_height
+    comp_height = LazyMethod("pyleecan.Methods.Slot.SlotW12.comp_height")
     # cf Methods.Slot.SlotW12.comp_height_wind
-    if isinstance(comp_height_wind, ImportError):
-        comp_height_wind = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use SlotW12 method comp_height_wind: "
-                    + str(comp_height_wind)
-                )
-            )
-        )
-    else:
-        comp_height_wind = comp_height_wind
+    comp_height_wind = LazyMethod("pyleecan.Methods.Slot.SlotW12.comp_height_wind")
     # cf Methods.Slot.SlotW12.comp_surface
-    if isinstance(comp_surface, ImportError):
-        comp_surface = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use SlotW12 method comp_surface: " + str(comp_surface)
-                )
-            )
-        )
-    else:
-        comp_surface = comp_surface
+    comp_surface = LazyMethod("pyleecan.Methods.Slot.SlotW12.comp_surface")
     # cf Methods.Slot.SlotW12.comp_surface_wind
-    if isinstance(comp_surface_wind, ImportError):
-        comp_surface_wind = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use SlotW12 method comp_surface_wind: "
-                    + str(comp_surface_wind)
-                )
-            )
-        )
-    else:
-        comp_surface_wind = comp_surface_wind
+    comp_surface_wind = LazyMethod("pyleecan.Methods.Slot.SlotW12.comp_surface_wind")
     # save method is available in all object
     save = save
 
@@ -164,15 +51,15 @@ class SlotW12(SlotWind):
         if init_dict is not None:  # Initialisation by dict
             check_init_dict(init_dict, ["H0", "H1", "R1", "R2", "Zs"])
             # Overwrite default value with init_dict content
-            if "H0" in list(init_dict.keys()):
+            if "H0" in init_dict:
                 H0 = init_dict["H0"]
-            if "H1" in list(init_dict.keys()):
+            if "H1" in init_dict:
                 H1 = init_dict["H1"]
-            if "R1" in list(init_dict.keys()):
+            if "R1" in init_dict:
                 R1 = init_dict["R1"]
-            if "R2" in list(init_dict.keys()):
+            if "R2" in init_dict:
                 R2 = init_dict["R2"]
-            if "Zs" in list(init_dict.keys()):
+            if "Zs" in init_dict:
                 Zs = init_dict["Zs"]
         # Initialisation by argument
         self.H0 = H0
@@ -215,12 +102,13 @@ class SlotW12(SlotWind):
             return False
         return True
 
-    def as_dict(self):
+    def as_dict(self, is_keep_array=False):
         """Convert this objet in a json seriable dict (can be use in __init__)
+        The ndarray are not converted to list if is_keep_array
         """
 
         # Get the properties inherited from SlotWind
-        SlotW12_dict = super(SlotW12, self).as_dict()
+        SlotW12_dict = super(SlotW12, self).as_dict(is_keep_array=is_keep_array)
         SlotW12_dict["H0"] = self.H0
         SlotW12_dict["H1"] = self.H1
         SlotW12_dict["R1"] = self.R1
@@ -230,6 +118,16 @@ class SlotW12(SlotWind):
         SlotW12_dict["__class__"] = "SlotW12"
         return SlotW12_dict
 
+    def _copy_to(self, obj):
+        """Copy the properties of this object in obj (called by copy)"""
+
+        # Copy the properties inherited from SlotWind
+        super(SlotW12, self)._copy_to(obj)
+        obj._H0 = self._H0
+        obj._H1 = self._H1
+        obj._R1 = self._R1
+        obj._R2 = self._R2
+
     def _set_None(self):
         """Set all the properties to None (except pyleecan object)"""
 
@@ -248,6 +146,7 @@ class SlotW12(SlotWind):
         """setter of H0"""
         check_var("H0", value, "float", Vmin=0)
         self._H0 = value
+        self._clear_memo()
 
     # Slot isthmus height.
     # Type : float, min = 0
@@ -261,6 +160,7 @@ class SlotW12(SlotWind):
         """setter of H1"""
         check_var("H1", value, "float", Vmin=0)
         self._H1 = value
+        self._clear_memo()
 
     # Slot middle height
     # Type : float, min = 0
@@ -274,6 +174,7 @@ class SlotW12(SlotWind):
         """setter of R1"""
         check_var("R1", value, "float", Vmin=0)
         self._R1 = value
+        self._clear_memo()
 
     # Wedges radius
     # Type : float, min = 0
@@ -287,6 +188,7 @@ class SlotW12(SlotWind):
         """setter of R2"""
         check_var("R2", value, "float", Vmin=0)
         self._R2 = value
+        self._clear_memo()
 
     # Slot bottom radius
     # Type : float, min = 0
@@ -4,38 +4,11 @@ WARNING! All changes made in this file will be lost!
 """
 
 from os import linesep
-from pyleecan.Classes._check import check_init_dict, check_var, raise_
+from pyleecan.Classes._check import check_init_dict, check_var
 from pyleecan.Functions.save import save
 from pyleecan.Classes.Slot import Slot
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from pyleecan.Methods.Slot.SlotWind.comp_angle_wind_eq import comp_angle_wind_eq
-except ImportError as error:
-    comp_angle_wind_eq = error
-
-try:
-    from pyleecan.Methods.Slot.SlotWind.comp_height_wind import comp_height_wind
-except ImportError as error:
-    comp_height_wind = error
-
-try:
-    from pyleecan.Methods.Slot.SlotWind.comp_radius_mid_wind import comp_radius_mid_wind
-except ImportError as error:
-    comp_radius_mid_wind = error
-
-try:
-    from pyleecan.Methods.Slot.SlotWind.comp_surface_wind import comp_surface_wind
-except ImportError as error:
-    comp_surface_wind = error
-
-try:
-    from pyleecan.Methods.Slot.SlotWind.plot_wind import plot_wind
-except ImportError as error:
-    plot_wind = error
-
-
+from pyleecan.Classes._lazy import LazyMethod
 from pyleecan.Classes._check import InitUnKnowClassError
 
 
@@ -44,64 +17,18 @@ class SlotWind(Slot):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
     # cf Methods.Slot.SlotWind.comp_angle_wind_eq
-    if isinstance(comp_angle_wind_eq, ImportError):
-        comp_angle_wind_eq = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use SlotWind method comp_angle_wind_eq: "
-                    + str(comp_angle_wind_eq)
-                )
-            )
-        )
-    else:
-        comp_angle_wind_eq = comp_angle_wind_eq
+    comp_angle_wind_eq = LazyMethod("pyleecan.Methods.Slot.SlotWind.comp_angle_wind_eq")
     # cf Methods.Slot.SlotWind.comp_height_wind
-    if isinstance(comp_height_wind, ImportError):
-        comp_height_wind = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use SlotWind method comp_height_wind: "
-                    + str(comp_height_wind)
-                )
-            )
-        )
-    else:
-        comp_height_wind = comp_height_wind
+    comp_height_wind = LazyMethod("pyleecan.Methods.Slot.SlotWind.comp_height_wind")
     # cf Methods.Slot.SlotWind.comp_radius_mid_wind
-    if isinstance(comp_radius_mid_wind, ImportError):
-        comp_radius_mid_wind = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use SlotWind method comp_radius_mid_wind: "
-                    + str(comp_radius_mid_wind)
-                )
-            )
-        )
-    else:
-        comp_radius_mid_wind = comp_radius_mid_wind
+    comp_radius_mid_wind = LazyMethod(
+        "pyleecan.Methods.Slot.SlotWind.comp_radius_mid_wind"
+    )
     # cf Methods.Slot.SlotWind.comp_surface_wind
-    if isinstance(comp_surface_wind, ImportError):
-        comp_surface_wind = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use SlotWind method comp_surface_wind: "
-                    + str(comp_surface_wind)
-                )
-            )
-        )
-    else:
-        comp_surface_wind = comp_surface_wind
+    comp_surface_wind = LazyMethod("pyleecan.Methods.Slot.SlotWind.comp_surface_wind")
     # cf Methods.Slot.SlotWind.plot_wind
-    if isinstance(plot_wind, ImportError):
-        plot_wind = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use SlotWind method plot_wind: " + str(plot_wind))
-            )
-        )
-    else:
-        plot_wind = plot_wind
+    plot_wind = LazyMethod("pyleecan.Methods.Slot.SlotWind.plot_wind")
     # save method is available in all object
     save = save
 
@@ -118,7 +45,7 @@ class SlotWind(Slot):
         if init_dict is not None:  # Initialisation by dict
             check_init_dict(init_dict, ["Zs"])
             # Overwrite default value with init_dict content
-            if "Zs" in list(init_dict.keys()):
+            if "Zs" in init_dict:
                 Zs = init_dict["Zs"]
         # Initialisation by argument
         # Call Slot init
@@ -145,17 +72,24 @@ class SlotWind(Slot):
             return False
         return True
 
-    def as_dict(self):
+    def as_dict(self, is_keep_array=False):
         """Convert this objet in a json seriable dict (can be use in __init__)
+        The ndarray are not converted to list if is_keep_array
         """
 
         # Get the properties inherited from Slot
-        SlotWind_dict = super(SlotWind, self).as_dict()
+        SlotWind_dict = super(SlotWind, self).as_dict(is_keep_array=is_keep_array)
         # The class name is added to the dict fordeserialisation purpose
         # Overwrite the mother class name
         SlotWind_dict["__class__"] = "SlotWind"
         return SlotWind_dict
 
+    def _copy_to(self, obj):
+        """Copy the properties of this object in obj (called by copy)"""
+
+        # Copy the properties inherited from Slot
+        super(SlotWind, self)._copy_to(obj)
+
     def _set_None(self):
         """Set all the properties to None (except pyleecan object)"""
 
@@ -4,24 +4,12 @@ WARNING! All changes made in this file will be lost!
 """
 
 from os import linesep
-from pyleecan.Classes._check import check_init_dict, check_var, raise_
+from pyleecan.Classes._check import check_init_dict, check_var
 from pyleecan.Functions.save import save
 from pyleecan.Classes._frozen import FrozenClass
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from pyleecan.Methods.Mesh.Solution.get_field import get_field
-except ImportError as error:
-    get_field = error
-
-try:
-    from pyleecan.Methods.Mesh.Solution.set_field import set_field
-except ImportError as error:
-    set_field = error
-
-
 from numpy import array, empty
+from pyleecan.Classes._lazy import LazyMethod
 from pyleecan.Classes._check import InitUnKnowClassError
 
 
@@ -30,25 +18,10 @@ class Solution(FrozenClass):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
     # cf Methods.Mesh.Solution.get_field
-    if isinstance(get_field, ImportError):
-        get_field = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Solution method get_field: " + str(get_field))
-            )
-        )
-    else:
-        get_field = get_field
+    get_field = LazyMethod("pyleecan.Methods.Mesh.Solution.get_field")
     # cf Methods.Mesh.Solution.set_field
-    if isinstance(set_field, ImportError):
-        set_field = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Solution method set_field: " + str(set_field))
-            )
-        )
-    else:
-        set_field = set_field
+    set_field = LazyMethod("pyleecan.Methods.Mesh.Solution.set_field")
     # save method is available in all object
     save = save
 
@@ -67,13 +40,13 @@ class Solution(FrozenClass):
         if init_dict is not None:  # Initialisation by dict
             check_init_dict(init_dict, ["nodal", "edge", "face", "volume"])
             # Overwrite default value with init_dict content
-            if "nodal" in list(init_dict.keys()):
+            if "nodal" in init_dict:
                 nodal = init_dict["nodal"]
-            if "edge" in list(init_dict.keys()):
+            if "edge" in init_dict:
                 edge = init_dict["edge"]
-            if "face" in list(init_dict.keys()):
+            if "face" in init_dict:
                 face = init_dict["face"]
-            if "volume" in list(init_dict.keys()):
+            if "volume" in init_dict:
                 volume = init_dict["volume"]
         # Initialisation by argument
         self.parent = None
@@ -85,6 +58,8 @@ class Solution(FrozenClass):
                     value = empty(0)
                 elif isinstance(obj, list):
                     value = array(obj)
+                else:
+                    value = obj
                 self.nodal[key] = value
         elif nodal is None:
             self.nodal = dict()
@@ -98,6 +73,8 @@ class Solution(FrozenClass):
                     value = empty(0)
                 elif isinstance(obj, list):
                     value = array(obj)
+                else:
+                    value = obj
                 self.edge[key] = value
         elif edge is None:
             self.edge = dict()
@@ -111,6 +88,8 @@ class Solution(FrozenClass):
                     value = empty(0)
                 elif isinstance(obj, list):
                     value = array(obj)
+                else:
+                    value = obj
                 self.face[key] = value
         elif face is None:
             self.face = dict()
@@ -124,6 +103,8 @@ class Solution(FrozenClass):
                     value = empty(0)
                 elif isinstance(obj, list):
                     value = array(obj)
+                else:
+                    value = obj
                 self.volume[key] = value
         elif volume is None:
             self.volume = dict()
@@ -180,27 +161,44 @@ class Solution(FrozenClass):
             return False
         return True
 
-    def as_dict(self):
+    def as_dict(self, is_keep_array=False):
         """Convert this objet in a json seriable dict (can be use in __init__)
+        The ndarray are not converted to list if is_keep_array
         """
 
         Solution_dict = dict()
         Solution_dict["nodal"] = dict()
         for key, obj in self.nodal.items():
-            Solution_dict["nodal"][key] = obj.tolist()
+            Solution_dict["nodal"][key] = obj if is_keep_array else obj.tolist()
         Solution_dict["edge"] = dict()
         for key, obj in self.edge.items():
-            Solution_dict["edge"][key] = obj.tolist()
+            Solution_dict["edge"][key] = obj if is_keep_array else obj.tolist()
         Solution_dict["face"] = dict()
         for key, obj in self.face.items():
-            Solution_dict["face"][key] = obj.tolist()
+            Solution_dict["face"][key] = obj if is_keep_array else obj.tolist()
         Solution_dict["volume"] = dict()
         for key, obj in self.volume.items():
-            Solution_dict["volume"][key] = obj.tolist()
+            Solution_dict["volume"][key] = obj if is_keep_array else obj.tolist()
         # The class name is added to the dict fordeserialisation purpose
         Solution_dict["__class__"] = "Solution"
         return Solution_dict
 
+    def _copy_to(self, obj):
+        """Copy the properties of this object in obj (called by copy)"""
+
+        obj._nodal = dict()
+        for key, value in self._nodal.items():
+            obj._nodal[key] = value.copy()
+        obj._edge = dict()
+        for key, value in self._edge.items():
+            obj._edge[key] = value.copy()
+        obj._face = dict()
+        for key, value in self._face.items():
+            obj._face[key] = value.copy()
+        obj._volume = dict()
+        for key, value in self._volume.items():
+            obj._volume[key] = value.copy()
+
     def _set_None(self):
         """Set all the properties to None (except pyleecan object)"""
 
@@ -223,6 +221,7 @@ class Solution(FrozenClass):
                     pass
         check_var("nodal", value, "{ndarray}")
         self._nodal = value
+        self._clear_memo()
 
     # A solution related to nodes
     # Type : {ndarray}
@@ -244,6 +243,7 @@ class Solution(FrozenClass):
                     pass
         check_var("edge", value, "{ndarray}")
         self._edge = value
+        self._clear_memo()
 
     # A solution related to edges
     # Type : {ndarray}
@@ -265,6 +265,7 @@ class Solution(FrozenClass):
                     pass
         check_var("face", value, "{ndarray}")
         self._face = value
+        self._clear_memo()
 
     # A solution related to faces
     # Type : {ndarray}
@@ -286,6 +287,7 @@ class Solution(FrozenClass):
                     pass
         check_var("volume", value, "{ndarray}")
         self._volume = value
+        self._clear_memo()
 
     # A solution related to volumes
     # Type : {ndarray}
@@ -4,23 +4,11 @@ WARNING! All changes made in this file will be lost!
 """
 
 from os import linesep
-from pyleecan.Classes._check import check_init_dict, check_var, raise_
+from pyleecan.Classes._check import check_init_dict, check_var
 from pyleecan.Functions.save import save
 from pyleecan.Classes._frozen import FrozenClass
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from pyleecan.Methods.Simulation.Structural.run import run
-except ImportError as error:
-    run = error
-
-try:
-    from pyleecan.Methods.Simulation.Structural.comp_time_angle import comp_time_angle
-except ImportError as error:
-    comp_time_angle = error
-
-
+from pyleecan.Classes._lazy import LazyInit, LazyMethod
 from pyleecan.Classes._check import InitUnKnowClassError
 from pyleecan.Classes.Force import Force
 
@@ -30,28 +18,12 @@ class Structural(FrozenClass):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
     # cf Methods.Simulation.Structural.run
-    if isinstance(run, ImportError):
-        run = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Structural method run: " + str(run))
-            )
-        )
-    else:
-        run = run
+    run = LazyMethod("pyleecan.Methods.Simulation.Structural.run")
     # cf Methods.Simulation.Structural.comp_time_angle
-    if isinstance(comp_time_angle, ImportError):
-        comp_time_angle = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Structural method comp_time_angle: "
-                    + str(comp_time_angle)
-                )
-            )
-        )
-    else:
-        comp_time_angle = comp_time_angle
+    comp_time_angle = LazyMethod(
+        "pyleecan.Methods.Simulation.Structural.comp_time_angle"
+    )
     # save method is available in all object
     save = save
 
@@ -70,7 +42,7 @@ class Structural(FrozenClass):
         if init_dict is not None:  # Initialisation by dict
             check_init_dict(init_dict, ["force"])
             # Overwrite default value with init_dict content
-            if "force" in list(init_dict.keys()):
+            if "force" in init_dict:
                 force = init_dict["force"]
         # Initialisation by argument
         self.parent = None
@@ -115,19 +87,29 @@ class Structural(FrozenClass):
             return False
         return True
 
-    def as_dict(self):
+    def as_dict(self, is_keep_array=False):
         """Convert this objet in a json seriable dict (can be use in __init__)
+        The ndarray are not converted to list if is_keep_array
         """
 
         Structural_dict = dict()
         if self.force is None:
             Structural_dict["force"] = None
         else:
-            Structural_dict["force"] = self.force.as_dict()
+            Structural_dict["force"] = self.force.as_dict(is_keep_array=is_keep_array)
         # The class name is added to the dict fordeserialisation purpose
         Structural_dict["__class__"] = "Structural"
         return Structural_dict
 
+    def _copy_to(self, obj):
+        """Copy the properties of this object in obj (called by copy)"""
+
+        if self._force is None:
+            obj._force = None
+        else:
+            obj._force = self._force.copy()
+            obj._force.parent = obj
+
     def _set_None(self):
         """Set all the properties to None (except pyleecan object)"""
 
@@ -136,12 +118,16 @@ class Structural(FrozenClass):
 
     def _get_force(self):
         """getter of force"""
+        if isinstance(self._force, LazyInit):
+            # Create the object of a lazy load
+            self._set_force(self._force.resolve())
         return self._force
 
     def _set_force(self, value):
         """setter of force"""
         check_var("force", value, "Force")
         self._force = value
+        self._clear_memo()
 
         if self._force is not None:
             self._force.parent = self
@@ -0,0 +1,490 @@
+# -*- coding: utf-8 -*-
+"""File generated according to pyleecan/Generator/ClassesRef/Geometry/SurfArray.csv
+WARNING! All changes made in this file will be lost!
+"""
+
+from os import linesep
+from pyleecan.Classes._check import set_array, check_init_dict, check_var
+from pyleecan.Functions.save import save
+from pyleecan.Classes._frozen import FrozenClass
+
+from numpy import array, array_equal
+from copy import deepcopy
+from pyleecan.Classes._lazy import LazyMethod
+from pyleecan.Classes._check import InitUnKnowClassError
+
+
+class SurfArray(FrozenClass):
+    """Array representation of a list of SurfLine (the lines of all the surfaces are stored in arrays to be transformed at once)"""
+
+    VERSION = 1
+
+    # cf Methods.Geometry.SurfArray.set_surf_list
+    set_surf_list = LazyMethod("pyleecan.Methods.Geometry.SurfArray.set_surf_list")
+    # cf Methods.Geometry.SurfArray.get_surf_list
+    get_surf_list = LazyMethod("pyleecan.Methods.Geometry.SurfArray.get_surf_list")
+    # cf Methods.Geometry.SurfArray.rotate
+    rotate = LazyMethod("pyleecan.Methods.Geometry.SurfArray.rotate")
+    # cf Methods.Geometry.SurfArray.translate
+    translate = LazyMethod("pyleecan.Methods.Geometry.SurfArray.translate")
+    # cf Methods.Geometry.SurfArray.discretize
+    discretize = LazyMethod("pyleecan.Methods.Geometry.SurfArray.discretize")
+    # cf Methods.Geometry.SurfArray.duplicate
+    duplicate = LazyMethod("pyleecan.Methods.Geometry.SurfArray.duplicate")
+    # save method is available in all object
+    save = save
+
+    def __init__(
+        self,
+        line_type=None,
+        begin=None,
+        end=None,
+        center=None,
+        angle=None,
+        radius=None,
+        line_label=[],
+        surf_index=None,
+        label=[],
+        point_ref=None,
+        init_dict=None,
+    ):
+        """Constructor of the class. Can be use in two ways :
+        - __init__ (arg1 = 1, arg3 = 5) every parameters have name and default values
+            for Matrix, None will initialise the property with an empty Matrix
+            for pyleecan type, None will call the default constructor
+        - __init__ (init_dict = d) d must be a dictionnary wiht every properties as keys
+
+        ndarray or list can be given for Vector and Matrix
+        object or dict can be given for pyleecan Object"""
+
+        if init_dict is not None:  # Initialisation by dict
+            check_init_dict(
+                init_dict,
+                [
+                    "line_type",
+                    "begin",
+                    "end",
+                    "center",
+                    "angle",
+                    "radius",
+                    "line_label",
+                    "surf_index",
+                    "label",
+                    "point_ref",
+                ],
+            )
+            # Overwrite default value with init_dict content
+            if "line_type" in init_dict:
+                line_type = init_dict["line_type"]
+            if "begin" in init_dict:
+                begin = init_dict["begin"]
+            if "end" in init_dict:
+                end = init_dict["end"]
+            if "center" in init_dict:
+                center = init_dict["center"]
+            if "angle" in init_dict:
+                angle = init_dict["angle"]
+            if "radius" in init_dict:
+                radius = init_dict["radius"]
+            if "line_label" in init_dict:
+                line_label = init_dict["line_label"]
+            if "surf_index" in init_dict:
+                surf_index = init_dict["surf_index"]
+            if "label" in init_dict:
+                label = init_dict["label"]
+            if "point_ref" in init_dict:
+                point_ref = init_dict["point_ref"]
+        # Initialisation by argument
+        self.parent = None
+        # line_type can be None, a ndarray or a list
+        set_array(self, "line_type", line_type)
+        # begin can be None, a ndarray or a list
+        set_array(self, "begin", begin)
+        # end can be None, a ndarray or a list
+        set_array(self, "end", end)
+        # center can be None, a ndarray or a list
+        set_array(self, "center", center)
+        # angle can be None, a ndarray or a list
+        set_array(self, "angle", angle)
+        # radius can be None, a ndarray or a list
+        set_array(self, "radius", radius)
+        self.line_label = line_label
+        # surf_index can be None, a ndarray or a list
+        set_array(self, "surf_index", surf_index)
+        self.label = label
+        # point_ref can be None, a ndarray or a list
+        set_array(self, "point_ref", point_ref)
+
+        # The class is frozen, for now it's impossible to add new properties
+        self._freeze()
+
+    def __str__(self):
+        """Convert this objet in a readeable string (for print)"""
+
+        SurfArray_str = ""
+        if self.parent is None:
+            SurfArray_str += "parent = None " + linesep
+        else:
+            SurfArray_str += "parent = " + str(type(self.parent)) + " object" + linesep
+        SurfArray_str += (
+            "line_type = " + linesep + str(self.line_type) + linesep + linesep
+        )
+        SurfArray_str += "begin = " + linesep + str(self.begin) + linesep + linesep
+        SurfArray_str += "end = " + linesep + str(self.end) + linesep + linesep
+        SurfArray_str += "center = " + linesep + str(self.center) + linesep + linesep
+        SurfArray_str += "angle = " + linesep + str(self.angle) + linesep + linesep
+        SurfArray_str += "radius = " + linesep + str(self.radius) + linesep + linesep
+        SurfArray_str += "line_label = " + linesep + str(self.line_label) + linesep
+        SurfArray_str += (
+            "surf_index = " + linesep + str(self.surf_index) + linesep + linesep
+        )
+        SurfArray_str += "label = " + linesep + str(self.label) + linesep
+        SurfArray_str += "point_ref = " + linesep + str(self.point_ref)
+        return SurfArray_str
+
+    def __eq__(self, other):
+        """Compare two objects (skip parent)"""
+
+        if type(other) != type(self):
+            return False
+        if not array_equal(other.line_type, self.line_type):
+            return False
+        if not array_equal(other.begin, self.begin):
+            return False
+        if not array_equal(other.end, self.end):
+            return False
+        if not array_equal(other.center, self.center):
+            return False
+        if not array_equal(other.angle, self.angle):
+            return False
+        if not array_equal(other.radius, self.radius):
+            return False
+        if other.line_label != self.line_label:
+            return False
+        if not array_equal(other.surf_index, self.surf_index):
+            return False
+        if other.label != self.label:
+            return False
+        if not array_equal(other.point_ref, self.point_ref):
+            return False
+        return True
+
+    def as_dict(self, is_keep_array=False):
+        """Convert this objet in a json seriable dict (can be use in __init__)
+        The ndarray are not converted to list if is_keep_array
+        """
+
+        SurfArray_dict = dict()
+        if self.line_type is None:
+            SurfArray_dict["line_type"] = None
+        elif is_keep_array:
+            SurfArray_dict["line_type"] = self.line_type
+        else:
+            SurfArray_dict["line_type"] = self.line_type.tolist()
+        if self.begin is None:
+            SurfArray_dict["begin"] = None
+        elif is_keep_array:
+            SurfArray_dict["begin"] = self.begin
+        else:
+            SurfArray_dict["begin"] = self.begin.tolist()
+        if self.end is None:
+            SurfArray_dict["end"] = None
+        elif is_keep_array:
+            SurfArray_dict["end"] = self.end
+        else:
+            SurfArray_dict["end"] = self.end.tolist()
+        if self.center is None:
+            SurfArray_dict["center"] = None
+        elif is_keep_array:
+            SurfArray_dict["center"] = self.center
+        else:
+            SurfArray_dict["center"] = self.center.tolist()
+        if self.angle is None:
+            SurfArray_dict["angle"] = None
+        elif is_keep_array:
+            SurfArray_dict["angle"] = self.angle
+        else:
+            SurfArray_dict["angle"] = self.angle.tolist()
+        if self.radius is None:
+            SurfArray_dict["radius"] = None
+        elif is_keep_array:
+            SurfArray_dict["radius"] = self.radius
+        else:
+            SurfArray_dict["radius"] = self.radius.tolist()
+        SurfArray_dict["line_label"] = self.line_label
+        if self.surf_index is None:
+            SurfArray_dict["surf_index"] = None
+        elif is_keep_array:
+            SurfArray_dict["surf_index"] = self.surf_index
+        else:
+            SurfArray_dict["surf_index"] = self.surf_index.tolist()
+        SurfArray_dict["label"] = self.label
+        if self.point_ref is None:
+            SurfArray_dict["point_ref"] = None
+        elif is_keep_array:
+            SurfArray_dict["point_ref"] = self.point_ref
+        else:
+            SurfArray_dict["point_ref"] = self.point_ref.tolist()
+        # The class name is added to the dict fordeserialisation purpose
+        SurfArray_dict["__class__"] = "SurfArray"
+        return SurfArray_dict
+
+    def _copy_to(self, obj):
+        """Copy the properties of this object in obj (called by copy)"""
+
+        if self._line_type is None:
+            obj._line_type = None
+        else:
+            obj._line_type = self._line_type.copy()
+        if self._begin is None:
+            obj._begin = None
+        else:
+            obj._begin = self._begin.copy()
+        if self._end is None:
+            obj._end = None
+        else:
+            obj._end = self._end.copy()
+        if self._center is None:
+            obj._center = None
+        else:
+            obj._center = self._center.copy()
+        if self._angle is None:
+            obj._angle = None
+        else:
+            obj._angle = self._angle.copy()
+        if self._radius is None:
+            obj._radius = None
+        else:
+            obj._radius = self._radius.copy()
+        obj._line_label = deepcopy(self._line_label)
+        if self._surf_index is None:
+            obj._surf_index = None
+        else:
+            obj._surf_index = self._surf_index.copy()
+        obj._label = deepcopy(self._label)
+        if self._point_ref is None:
+            obj._point_ref = None
+        else:
+            obj._point_ref = self._point_ref.copy()
+
+    def _set_None(self):
+        """Set all the properties to None (except pyleecan object)"""
+
+        self.line_type = None
+        self.begin = None
+        self.end = None
+        self.center = None
+        self.angle = None
+        self.radius = None
+        self.line_label = None
+        self.surf_index = None
+        self.label = None
+        self.point_ref = None
+
+    def _get_line_type(self):
+        """getter of line_type"""
+        return self._line_type
+
+    def _set_line_type(self, value):
+        """setter of line_type"""
+        if type(value) is list:
+            try:
+                value = array(value)
+            except:
+                pass
+        check_var("line_type", value, "ndarray")
+        self._line_type = value
+        self._clear_memo()
+
+    # Type of each line (0: Segment, 1: Arc1, 2: Arc2, 3: Arc3)
+    # Type : ndarray
+    line_type = property(
+        fget=_get_line_type,
+        fset=_set_line_type,
+        doc=u"""Type of each line (0: Segment, 1: Arc1, 2: Arc2, 3: Arc3)""",
+    )
+
+    def _get_begin(self):
+        """getter of begin"""
+        return self._begin
+
+    def _set_begin(self, value):
+        """setter of begin"""
+        if type(value) is list:
+            try:
+                value = array(value)
+            except:
+                pass
+        check_var("begin", value, "ndarray")
+        self._begin = value
+        self._clear_memo()
+
+    # Begin point of each line
+    # Type : ndarray
+    begin = property(
+        fget=_get_begin, fset=_set_begin, doc=u"""Begin point of each line"""
+    )
+
+    def _get_end(self):
+        """getter of end"""
+        return self._end
+
+    def _set_end(self, value):
+        """setter of end"""
+        if type(value) is list:
+            try:
+                value = array(value)
+            except:
+                pass
+        check_var("end", value, "ndarray")
+        self._end = value
+        self._clear_memo()
+
+    # End point of each line
+    # Type : ndarray
+    end = property(fget=_get_end, fset=_set_end, doc=u"""End point of each line""")
+
+    def _get_center(self):
+        """getter of center"""
+        return self._center
+
+    def _set_center(self, value):
+        """setter of center"""
+        if type(value) is list:
+            try:
+                value = array(value)
+            except:
+                pass
+        check_var("center", value, "ndarray")
+        self._center = value
+        self._clear_memo()
+
+    # Center of each arc (0 for the segments)
+    # Type : ndarray
+    center = property(
+        fget=_get_center,
+        fset=_set_center,
+        doc=u"""Center of each arc (0 for the segments)""",
+    )
+
+    def _get_angle(self):
+        """getter of angle"""
+        return self._angle
+
+    def _set_angle(self, value):
+        """setter of angle"""
+        if type(value) is list:
+            try:
+                value = array(value)
+            except:
+                pass
+        check_var("angle", value, "ndarray")
+        self._angle = value
+        self._clear_memo()
+
+    # Opening angle of each arc (signed by the rotation direction; 0 for the segments)
+    # Type : ndarray
+    angle = property(
+        fget=_get_angle,
+        fset=_set_angle,
+        doc=u"""Opening angle of each arc (signed by the rotation direction; 0 for the segments)""",
+    )
+
+    def _get_radius(self):
+        """getter of radius"""
+        return self._radius
+
+    def _set_radius(self, value):
+        """setter of radius"""
+        if type(value) is list:
+            try:
+                value = array(value)
+            except:
+                pass
+        check_var("radius", value, "ndarray")
+        self._radius = value
+        self._clear_memo()
+
+    # Radius of each Arc1 (0 for the other lines)
+    # Type : ndarray
+    radius = property(
+        fget=_get_radius,
+        fset=_set_radius,
+        doc=u"""Radius of each Arc1 (0 for the other lines)""",
+    )
+
+    def _get_line_label(self):
+        """getter of line_label"""
+        return self._line_label
+
+    def _set_line_label(self, value):
+        """setter of line_label"""
+        check_var("line_label", value, "list")
+        self._line_label = value
+        self._clear_memo()
+
+    # Label of each line
+    # Type : list
+    line_label = property(
+        fget=_get_line_label, fset=_set_line_label, doc=u"""Label of each line"""
+    )
+
+    def _get_surf_index(self):
+        """getter of surf_index"""
+        return self._surf_index
+
+    def _set_surf_index(self, value):
+        """setter of surf_index"""
+        if type(value) is list:
+            try:
+                value = array(value)
+            except:
+                pass
+        check_var("surf_index", value, "ndarray")
+        self._surf_index = value
+        self._clear_memo()
+
+    # Index of the first line of each surface (and total number of lines)
+    # Type : ndarray
+    surf_index = property(
+        fget=_get_surf_index,
+        fset=_set_surf_index,
+        doc=u"""Index of the first line of each surface (and total number of lines)""",
+    )
+
+    def _get_label(self):
+        """getter of label"""
+        return self._label
+
+    def _set_label(self, value):
+        """setter of label"""
+        check_var("label", value, "list")
+        self._label = value
+        self._clear_memo()
+
+    # Label of each surface
+    # Type : list
+    label = property(fget=_get_label, fset=_set_label, doc=u"""Label of each surface""")
+
+    def _get_point_ref(self):
+        """getter of point_ref"""
+        return self._point_ref
+
+    def _set_point_ref(self, value):
+        """setter of point_ref"""
+        if type(value) is list:
+            try:
+                value = array(value)
+            except:
+                pass
+        check_var("point_ref", value, "ndarray")
+        self._point_ref = value
+        self._clear_memo()
+
+    # Reference point of each surface
+    # Type : ndarray
+    point_ref = property(
+        fget=_get_point_ref,
+        fset=_set_point_ref,
+        doc=u"""Reference point of each surface""",
+    )
@@ -4,58 +4,11 @@ WARNING! All changes made in this file will be lost!
 """
 
 from os import linesep
-from pyleecan.Classes._check import check_init_dict, check_var, raise_
+from pyleecan.Classes._check import check_init_dict, check_var
 from pyleecan.Functions.save import save
 from pyleecan.Classes.Surface import Surface
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from pyleecan.Methods.Geometry.SurfLine.get_lines import get_lines
-except ImportError as error:
-    get_lines = error
-
-try:
-    from pyleecan.Methods.Geometry.SurfLine.rotate import rotate
-except ImportError as error:
-    rotate = error
-
-try:
-    from pyleecan.Methods.Geometry.SurfLine.translate import translate
-except ImportError as error:
-    translate = error
-
-try:
-    from pyleecan.Methods.Geometry.SurfLine.check import check
-except ImportError as error:
-    check = error
-
-try:
-    from pyleecan.Methods.Geometry.SurfLine.comp_length import comp_length
-except ImportError as error:
-    comp_length = error
-
-try:
-    from pyleecan.Methods.Geometry.SurfLine.get_patch import get_patch
-except ImportError as error:
-    get_patch = error
-
-try:
-    from pyleecan.Methods.Geometry.SurfLine.discretize import discretize
-except ImportError as error:
-    discretize = error
-
-try:
-    from pyleecan.Methods.Geometry.SurfLine.comp_surface import comp_surface
-except ImportError as error:
-    comp_surface = error
-
-try:
-    from pyleecan.Methods.Geometry.SurfLine.plot_lines import plot_lines
-except ImportError as error:
-    plot_lines = error
-
-
+from pyleecan.Classes._lazy import LazyInit, LazyMethod
 from pyleecan.Classes._check import InitUnKnowClassError
 from pyleecan.Classes.Line import Line
 
@@ -65,92 +18,24 @@ class SurfLine(Surface):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
     # cf Methods.Geometry.SurfLine.get_lines
-    if isinstance(get_lines, ImportError):
-        get_lines = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use SurfLine method get_lines: " + str(get_lines))
-            )
-        )
-    else:
-        get_lines = get_lines
+    get_lines = LazyMethod("pyleecan.Methods.Geometry.SurfLine.get_lines")
     # cf Methods.Geometry.SurfLine.rotate
-    if isinstance(rotate, ImportError):
-        rotate = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use SurfLine method rotate: " + str(rotate))
-            )
-        )
-    else:
-        rotate = rotate
+    rotate = LazyMethod("pyleecan.Methods.Geometry.SurfLine.rotate")
     # cf Methods.Geometry.SurfLine.translate
-    if isinstance(translate, ImportError):
-        translate = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use SurfLine method translate: " + str(translate))
-            )
-        )
-    else:
-        translate = translate
+    translate = LazyMethod("pyleecan.Methods.Geometry.SurfLine.translate")
     # cf Methods.Geometry.SurfLine.check
-    if isinstance(check, ImportError):
-        check = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use SurfLine method check: " + str(check))
-            )
-        )
-    else:
-        check = check
+    check = LazyMethod("pyleecan.Methods.Geometry.SurfLine.check")
     # cf Methods.Geometry.SurfLine.comp_length
-    if isinstance(comp_length, ImportError):
-        comp_length = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use SurfLine method comp_length: " + str(comp_length)
-                )
-            )
-        )
-    else:
-        comp_length = comp_length
+    comp_length = LazyMethod("pyleecan.Methods.Geometry.SurfLine.comp_length")
     # cf Methods.Geometry.SurfLine.get_patch
-    if isinstance(get_patch, ImportError):
-        get_patch = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use SurfLine method get_patch: " + str(get_patch))
-            )
-        )
-    else:
-        get_patch = get_patch
+    get_patch = LazyMethod("pyleecan.Methods.Geometry.SurfLine.get_patch")
     # cf Methods.Geometry.SurfLine.discretize
-    if isinstance(discretize, ImportError):
-        discretize = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use SurfLine method discretize: " + str(discretize))
-            )
-        )
-    else:
-        discretize = discretize
+    discretize = LazyMethod("pyleecan.Methods.Geometry.SurfLine.discretize")
     # cf Methods.Geometry.SurfLine.comp_surface
-    if isinstance(comp_surface, ImportError):
-        comp_surface = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use SurfLine method comp_surface: " + str(comp_surface)
-                )
-            )
-        )
-    else:
-        comp_surface = comp_surface
+    comp_surface = LazyMethod("pyleecan.Methods.Geometry.SurfLine.comp_surface")
     # cf Methods.Geometry.SurfLine.plot_lines
-    if isinstance(plot_lines, ImportError):
-        plot_lines = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use SurfLine method plot_lines: " + str(plot_lines))
-            )
-        )
-    else:
-        plot_lines = plot_lines
+    plot_lines = LazyMethod("pyleecan.Methods.Geometry.SurfLine.plot_lines")
     # save method is available in all object
     save = save
 
@@ -167,11 +52,11 @@ class SurfLine(Surface):
         if init_dict is not None:  # Initialisation by dict
             check_init_dict(init_dict, ["line_list", "point_ref", "label"])
             # Overwrite default value with init_dict content
-            if "line_list" in list(init_dict.keys()):
+            if "line_list" in init_dict:
                 line_list = init_dict["line_list"]
-            if "point_ref" in list(init_dict.keys()):
+            if "point_ref" in init_dict:
                 point_ref = init_dict["point_ref"]
-            if "label" in list(init_dict.keys()):
+            if "label" in init_dict:
                 label = init_dict["label"]
         # Initialisation by argument
         # line_list can be None or a list of Line object
@@ -179,7 +64,7 @@ class SurfLine(Surface):
         if type(line_list) is list:
             for obj in line_list:
                 if obj is None:  # Default value
-                    self.line_list.append(Line())
+                    self._line_list.append(Line())
                 elif isinstance(obj, dict):
                     # Check that the type is correct (including daughter)
                     class_name = obj.get("__class__")
@@ -201,9 +86,9 @@ class SurfLine(Surface):
                         "pyleecan.Classes." + class_name, fromlist=[class_name]
                     )
                     class_obj = getattr(module, class_name)
-                    self.line_list.append(class_obj(init_dict=obj))
+                    self._line_list.append(class_obj(init_dict=obj))
                 else:
-                    self.line_list.append(obj)
+                    self._line_list.append(obj)
         elif line_list is None:
             self.line_list = list()
         else:
@@ -244,20 +129,33 @@ class SurfLine(Surface):
             return False
         return True
 
-    def as_dict(self):
+    def as_dict(self, is_keep_array=False):
         """Convert this objet in a json seriable dict (can be use in __init__)
+        The ndarray are not converted to list if is_keep_array
         """
 
         # Get the properties inherited from Surface
-        SurfLine_dict = super(SurfLine, self).as_dict()
+        SurfLine_dict = super(SurfLine, self).as_dict(is_keep_array=is_keep_array)
         SurfLine_dict["line_list"] = list()
         for obj in self.line_list:
-            SurfLine_dict["line_list"].append(obj.as_dict())
+            SurfLine_dict["line_list"].append(obj.as_dict(is_keep_array=is_keep_array))
         # The class name is added to the dict fordeserialisation purpose
         # Overwrite the mother class name
         SurfLine_dict["__class__"] = "SurfLine"
         return SurfLine_dict
 
+    def _copy_to(self, obj):
+        """Copy the properties of this object in obj (called by copy)"""
+
+        # Copy the properties inherited from Surface
+        super(SurfLine, self)._copy_to(obj)
+        obj._line_list = list()
+        for value in self._line_list:
+            if value is not None:
+                value = value.copy()
+                value.parent = obj
+            obj._line_list.append(value)
+
     def _set_None(self):
         """Set all the properties to None (except pyleecan object)"""
 
@@ -268,7 +166,11 @@ class SurfLine(Surface):
 
     def _get_line_list(self):
         """getter of line_list"""
-        for obj in self._line_list:
+        for ii, obj in enumerate(self._line_list):
+            if isinstance(obj, LazyInit):
+                # Create the object of a lazy load
+                obj = obj.resolve()
+                self._line_list[ii] = obj
             if obj is not None:
                 obj.parent = self
         return self._line_list
@@ -277,6 +179,7 @@ class SurfLine(Surface):
         """setter of line_list"""
         check_var("line_list", value, "[Line]")
         self._line_list = value
+        self._clear_memo()
 
         for obj in self._line_list:
             if obj is not None:
@@ -4,28 +4,11 @@ WARNING! All changes made in this file will be lost!
 """
 
 from os import linesep
-from pyleecan.Classes._check import check_init_dict, check_var, raise_
+from pyleecan.Classes._check import check_init_dict, check_var
 from pyleecan.Functions.save import save
 from pyleecan.Classes._frozen import FrozenClass
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from pyleecan.Methods.Geometry.Surface.comp_mesh_dict import comp_mesh_dict
-except ImportError as error:
-    comp_mesh_dict = error
-
-try:
-    from pyleecan.Methods.Geometry.Surface.draw_FEMM import draw_FEMM
-except ImportError as error:
-    draw_FEMM = error
-
-try:
-    from pyleecan.Methods.Geometry.Surface.plot import plot
-except ImportError as error:
-    plot = error
-
-
+from pyleecan.Classes._lazy import LazyMethod
 from pyleecan.Classes._check import InitUnKnowClassError
 
 
@@ -34,36 +17,12 @@ class Surface(FrozenClass):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
     # cf Methods.Geometry.Surface.comp_mesh_dict
-    if isinstance(comp_mesh_dict, ImportError):
-        comp_mesh_dict = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Surface method comp_mesh_dict: " + str(comp_mesh_dict)
-                )
-            )
-        )
-    else:
-        comp_mesh_dict = comp_mesh_dict
+    comp_mesh_dict = LazyMethod("pyleecan.Methods.Geometry.Surface.comp_mesh_dict")
     # cf Methods.Geometry.Surface.draw_FEMM
-    if isinstance(draw_FEMM, ImportError):
-        draw_FEMM = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Surface method draw_FEMM: " + str(draw_FEMM))
-            )
-        )
-    else:
-        draw_FEMM = draw_FEMM
+    draw_FEMM = LazyMethod("pyleecan.Methods.Geometry.Surface.draw_FEMM")
     # cf Methods.Geometry.Surface.plot
-    if isinstance(plot, ImportError):
-        plot = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Surface method plot: " + str(plot))
-            )
-        )
-    else:
-        plot = plot
+    plot = LazyMethod("pyleecan.Methods.Geometry.Surface.plot")
     # save method is available in all object
     save = save
 
@@ -80,9 +39,9 @@ class Surface(FrozenClass):
         if init_dict is not None:  # Initialisation by dict
             check_init_dict(init_dict, ["point_ref", "label"])
             # Overwrite default value with init_dict content
-            if "point_ref" in list(init_dict.keys()):
+            if "point_ref" in init_dict:
                 point_ref = init_dict["point_ref"]
-            if "label" in list(init_dict.keys()):
+            if "label" in init_dict:
                 label = init_dict["label"]
         # Initialisation by argument
         self.parent = None
@@ -115,8 +74,9 @@ class Surface(FrozenClass):
             return False
         return True
 
-    def as_dict(self):
+    def as_dict(self, is_keep_array=False):
         """Convert this objet in a json seriable dict (can be use in __init__)
+        The ndarray are not converted to list if is_keep_array
         """
 
         Surface_dict = dict()
@@ -126,6 +86,12 @@ class Surface(FrozenClass):
         Surface_dict["__class__"] = "Surface"
         return Surface_dict
 
+    def _copy_to(self, obj):
+        """Copy the properties of this object in obj (called by copy)"""
+
+        obj._point_ref = self._point_ref
+        obj._label = self._label
+
     def _set_None(self):
         """Set all the properties to None (except pyleecan object)"""
 
@@ -140,6 +106,7 @@ class Surface(FrozenClass):
         """setter of point_ref"""
         check_var("point_ref", value, "complex")
         self._point_ref = value
+        self._clear_memo()
 
     # Center of symmetry
     # Type : complex
@@ -155,6 +122,7 @@ class Surface(FrozenClass):
         """setter of label"""
         check_var("label", value, "str")
         self._label = value
+        self._clear_memo()
 
     # Label of the surface
     # Type : str
@@ -4,53 +4,11 @@ WARNING! All changes made in this file will be lost!
 """
 
 from os import linesep
-from pyleecan.Classes._check import check_init_dict, check_var, raise_
+from pyleecan.Classes._check import check_init_dict, check_var
 from pyleecan.Functions.save import save
 from pyleecan.Classes.Surface import Surface
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from pyleecan.Methods.Geometry.Trapeze.check import check
-except ImportError as error:
-    check = error
-
-try:
-    from pyleecan.Methods.Geometry.Trapeze.comp_length import comp_length
-except ImportError as error:
-    comp_length = error
-
-try:
-    from pyleecan.Methods.Geometry.Trapeze.comp_surface import comp_surface
-except ImportError as error:
-    comp_surface = error
-
-try:
-    from pyleecan.Methods.Geometry.Trapeze.discretize import discretize
-except ImportError as error:
-    discretize = error
-
-try:
-    from pyleecan.Methods.Geometry.Trapeze.get_lines import get_lines
-except ImportError as error:
-    get_lines = error
-
-try:
-    from pyleecan.Methods.Geometry.Trapeze.get_patch import get_patch
-except ImportError as error:
-    get_patch = error
-
-try:
-    from pyleecan.Methods.Geometry.Trapeze.rotate import rotate
-except ImportError as error:
-    rotate = error
-
-try:
-    from pyleecan.Methods.Geometry.Trapeze.translate import translate
-except ImportError as error:
-    translate = error
-
-
+from pyleecan.Classes._lazy import LazyMethod
 from pyleecan.Classes._check import InitUnKnowClassError
 
 
@@ -59,81 +17,22 @@ class Trapeze(Surface):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
     # cf Methods.Geometry.Trapeze.check
-    if isinstance(check, ImportError):
-        check = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Trapeze method check: " + str(check))
-            )
-        )
-    else:
-        check = check
+    check = LazyMethod("pyleecan.Methods.Geometry.Trapeze.check")
     # cf Methods.Geometry.Trapeze.comp_length
-    if isinstance(comp_length, ImportError):
-        comp_length = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Trapeze method comp_length: " + str(comp_length))
-            )
-        )
-    else:
-        comp_length = comp_length
+    comp_length = LazyMethod("pyleecan.Methods.Geometry.Trapeze.comp_length")
     # cf Methods.Geometry.Trapeze.comp_surface
-    if isinstance(comp_surface, ImportError):
-        comp_surface = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Trapeze method comp_surface: " + str(comp_surface)
-                )
-            )
-        )
-    else:
-        comp_surface = comp_surface
+    comp_surface = LazyMethod("pyleecan.Methods.Geometry.Trapeze.comp_surface")
     # cf Methods.Geometry.Trapeze.discretize
-    if isinstance(discretize, ImportError):
-        discretize = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Trapeze method discretize: " + str(discretize))
-            )
-        )
-    else:
-        discretize = discretize
+    discretize = LazyMethod("pyleecan.Methods.Geometry.Trapeze.discretize")
     # cf Methods.Geometry.Trapeze.get_lines
-    if isinstance(get_lines, ImportError):
-        get_lines = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Trapeze method get_lines: " + str(get_lines))
-            )
-        )
-    else:
-        get_lines = get_lines
+    get_lines = LazyMethod("pyleecan.Methods.Geometry.Trapeze.get_lines")
     # cf Methods.Geometry.Trapeze.get_patch
-    if isinstance(get_patch, ImportError):
-        get_patch = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Trapeze method get_patch: " + str(get_patch))
-            )
-        )
-    else:
-        get_patch = get_patch
+    get_patch = LazyMethod("pyleecan.Methods.Geometry.Trapeze.get_patch")
     # cf Methods.Geometry.Trapeze.rotate
-    if isinstance(rotate, ImportError):
-        rotate = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Trapeze method rotate: " + str(rotate))
-            )
-        )
-    else:
-        rotate = rotate
+    rotate = LazyMethod("pyleecan.Methods.Geometry.Trapeze.rotate")
     # cf Methods.Geometry.Trapeze.translate
-    if isinstance(translate, ImportError):
-        translate = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Trapeze method translate: " + str(translate))
-            )
-        )
-    else:
-        translate = translate
+    translate = LazyMethod("pyleecan.Methods.Geometry.Trapeze.translate")
     # save method is available in all object
     save = save
 
@@ -150,15 +49,15 @@ class Trapeze(Surface):
         if init_dict is not None:  # Initialisation by dict
             check_init_dict(init_dict, ["height", "W2", "W1", "point_ref", "label"])
             # Overwrite default value with init_dict content
-            if "height" in list(init_dict.keys()):
+            if "height" in init_dict:
                 height = init_dict["height"]
-            if "W2" in list(init_dict.keys()):
+            if "W2" in init_dict:
                 W2 = init_dict["W2"]
-            if "W1" in list(init_dict.keys()):
+            if "W1" in init_dict:
                 W1 = init_dict["W1"]
-            if "point_ref" in list(init_dict.keys()):
+            if "point_ref" in init_dict:
                 point_ref = init_dict["point_ref"]
-            if "label" in list(init_dict.keys()):
+            if "label" in init_dict:
                 label = init_dict["label"]
         # Initialisation by argument
         self.height = height
@@ -197,12 +96,13 @@ class Trapeze(Surface):
             return False
         return True
 
-    def as_dict(self):
+    def as_dict(self, is_keep_array=False):
         """Convert this objet in a json seriable dict (can be use in __init__)
+        The ndarray are not converted to list if is_keep_array
         """
 
         # Get the properties inherited from Surface
-        Trapeze_dict = super(Trapeze, self).as_dict()
+        Trapeze_dict = super(Trapeze, self).as_dict(is_keep_array=is_keep_array)
         Trapeze_dict["height"] = self.height
         Trapeze_dict["W2"] = self.W2
         Trapeze_dict["W1"] = self.W1
@@ -211,6 +111,15 @@ class Trapeze(Surface):
         Trapeze_dict["__class__"] = "Trapeze"
         return Trapeze_dict
 
+    def _copy_to(self, obj):
+        """Copy the properties of this object in obj (called by copy)"""
+
+        # Copy the properties inherited from Surface
+        super(Trapeze, self)._copy_to(obj)
+        obj._height = self._height
+        obj._W2 = self._W2
+        obj._W1 = self._W1
+
     def _set_None(self):
         """Set all the properties to None (except pyleecan object)"""
 
@@ -228,6 +137,7 @@ class Trapeze(Surface):
         """setter of height"""
         check_var("height", value, "float", Vmin=0)
         self._height = value
+        self._clear_memo()
 
     # the height of the Trapeze
     # Type : float, min = 0
@@ -243,6 +153,7 @@ class Trapeze(Surface):
         """setter of W2"""
         check_var("W2", value, "float", Vmin=0)
         self._W2 = value
+        self._clear_memo()
 
     # the big base of Trapeze
     # Type : float, min = 0
@@ -256,6 +167,7 @@ class Trapeze(Surface):
         """setter of W1"""
         check_var("W1", value, "float", Vmin=0)
         self._W1 = value
+        self._clear_memo()
 
     # the small base of the Trapeze
     # Type : float, min = 0
@@ -4,43 +4,11 @@ WARNING! All changes made in this file will be lost!
 """
 
 from os import linesep
-from pyleecan.Classes._check import check_init_dict, check_var, raise_
+from pyleecan.Classes._check import check_init_dict, check_var
 from pyleecan.Functions.save import save
 from pyleecan.Classes._frozen import FrozenClass
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from pyleecan.Methods.GUI_Option.Unit.get_m import get_m
-except ImportError as error:
-    get_m = error
-
-try:
-    from pyleecan.Methods.GUI_Option.Unit.get_m2 import get_m2
-except ImportError as error:
-    get_m2 = error
-
-try:
-    from pyleecan.Methods.GUI_Option.Unit.get_m_name import get_m_name
-except ImportError as error:
-    get_m_name = error
-
-try:
-    from pyleecan.Methods.GUI_Option.Unit.get_m2_name import get_m2_name
-except ImportError as error:
-    get_m2_name = error
-
-try:
-    from pyleecan.Methods.GUI_Option.Unit.set_m import set_m
-except ImportError as error:
-    set_m = error
-
-try:
-    from pyleecan.Methods.GUI_Option.Unit.set_m2 import set_m2
-except ImportError as error:
-    set_m2 = error
-
-
+from pyleecan.Classes._lazy import LazyMethod
 from pyleecan.Classes._check import InitUnKnowClassError
 
 
@@ -48,61 +16,18 @@ class Unit(FrozenClass):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
     # cf Methods.GUI_Option.Unit.get_m
-    if isinstance(get_m, ImportError):
-        get_m = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Unit method get_m: " + str(get_m))
-            )
-        )
-    else:
-        get_m = get_m
+    get_m = LazyMethod("pyleecan.Methods.GUI_Option.Unit.get_m")
     # cf Methods.GUI_Option.Unit.get_m2
-    if isinstance(get_m2, ImportError):
-        get_m2 = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Unit method get_m2: " + str(get_m2))
-            )
-        )
-    else:
-        get_m2 = get_m2
+    get_m2 = LazyMethod("pyleecan.Methods.GUI_Option.Unit.get_m2")
     # cf Methods.GUI_Option.Unit.get_m_name
-    if isinstance(get_m_name, ImportError):
-        get_m_name = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Unit method get_m_name: " + str(get_m_name))
-            )
-        )
-    else:
-        get_m_name = get_m_name
+    get_m_name = LazyMethod("pyleecan.Methods.GUI_Option.Unit.get_m_name")
     # cf Methods.GUI_Option.Unit.get_m2_name
-    if isinstance(get_m2_name, ImportError):
-        get_m2_name = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Unit method get_m2_name: " + str(get_m2_name))
-            )
-        )
-    else:
-        get_m2_name = get_m2_name
+    get_m2_name = LazyMethod("pyleecan.Methods.GUI_Option.Unit.get_m2_name")
     # cf Methods.GUI_Option.Unit.set_m
-    if isinstance(set_m, ImportError):
-        set_m = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Unit method set_m: " + str(set_m))
-            )
-        )
-    else:
-        set_m = set_m
+    set_m = LazyMethod("pyleecan.Methods.GUI_Option.Unit.set_m")
     # cf Methods.GUI_Option.Unit.set_m2
-    if isinstance(set_m2, ImportError):
-        set_m2 = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Unit method set_m2: " + str(set_m2))
-            )
-        )
-    else:
-        set_m2 = set_m2
+    set_m2 = LazyMethod("pyleecan.Methods.GUI_Option.Unit.set_m2")
     # save method is available in all object
     save = save
 
@@ -119,11 +44,11 @@ class Unit(FrozenClass):
         if init_dict is not None:  # Initialisation by dict
             check_init_dict(init_dict, ["unit_m", "unit_rad", "unit_m2"])
             # Overwrite default value with init_dict content
-            if "unit_m" in list(init_dict.keys()):
+            if "unit_m" in init_dict:
                 unit_m = init_dict["unit_m"]
-            if "unit_rad" in list(init_dict.keys()):
+            if "unit_rad" in init_dict:
                 unit_rad = init_dict["unit_rad"]
-            if "unit_m2" in list(init_dict.keys()):
+            if "unit_m2" in init_dict:
                 unit_m2 = init_dict["unit_m2"]
         # Initialisation by argument
         self.parent = None
@@ -160,8 +85,9 @@ class Unit(FrozenClass):
             return False
         return True
 
-    def as_dict(self):
+    def as_dict(self, is_keep_array=False):
         """Convert this objet in a json seriable dict (can be use in __init__)
+        The ndarray are not converted to list if is_keep_array
         """
 
         Unit_dict = dict()
@@ -172,6 +98,13 @@ class Unit(FrozenClass):
         Unit_dict["__class__"] = "Unit"
         return Unit_dict
 
+    def _copy_to(self, obj):
+        """Copy the properties of this object in obj (called by copy)"""
+
+        obj._unit_m = self._unit_m
+        obj._unit_rad = self._unit_rad
+        obj._unit_m2 = self._unit_m2
+
     def _set_None(self):
         """Set all the properties to None (except pyleecan object)"""
 
@@ -187,6 +120,7 @@ class Unit(FrozenClass):
         """setter of unit_m"""
         check_var("unit_m", value, "int", Vmin=0, Vmax=1)
         self._unit_m = value
+        self._clear_memo()
 
     # 0: use m, 1: use mm
     # Type : int, min = 0, max = 1
@@ -202,6 +136,7 @@ class Unit(FrozenClass):
         """setter of unit_rad"""
         check_var("unit_rad", value, "int", Vmin=0, Vmax=1)
         self._unit_rad = value
+        self._clear_memo()
 
     # 0: use rad, 1: use deg
     # Type : int, min = 0, max = 1
@@ -217,6 +152,7 @@ class Unit(FrozenClass):
         """setter of unit_m2"""
         check_var("unit_m2", value, "int", Vmin=0, Vmax=1)
         self._unit_m2 = value
+        self._clear_memo()
 
     # 0: use m^2, 1: use mm^2
     # Type : int, min = 0, max = 1
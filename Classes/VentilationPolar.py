@@ -4,38 +4,11 @@ WARNING! All changes made in this file will be lost!
 """
 
 from os import linesep
-from pyleecan.Classes._check import check_init_dict, check_var, raise_
+from pyleecan.Classes._check import check_init_dict, check_var
 from pyleecan.Functions.save import save
 from pyleecan.Classes.Hole import Hole
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from pyleecan.Methods.Slot.VentilationPolar.build_geometry import build_geometry
-except ImportError as error:
-    build_geometry = error
-
-try:
-    from pyleecan.Methods.Slot.VentilationPolar.check import check
-except ImportError as error:
-    check = error
-
-try:
-    from pyleecan.Methods.Slot.VentilationPolar.comp_radius import comp_radius
-except ImportError as error:
-    comp_radius = error
-
-try:
-    from pyleecan.Methods.Slot.VentilationPolar.comp_surface import comp_surface
-except ImportError as error:
-    comp_surface = error
-
-try:
-    from pyleecan.Methods.Slot.VentilationPolar.get_center import get_center
-except ImportError as error:
-    get_center = error
-
-
+from pyleecan.Classes._lazy import LazyMethod
 from pyleecan.Classes._check import InitUnKnowClassError
 from pyleecan.Classes.Material import Material
 
@@ -45,62 +18,16 @@ class VentilationPolar(Hole):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
     # cf Methods.Slot.VentilationPolar.build_geometry
-    if isinstance(build_geometry, ImportError):
-        build_geometry = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use VentilationPolar method build_geometry: "
-                    + str(build_geometry)
-                )
-            )
-        )
-    else:
-        build_geometry = build_geometry
+    build_geometry = LazyMethod("pyleecan.Methods.Slot.VentilationPolar.build_geometry")
     # cf Methods.Slot.VentilationPolar.check
-    if isinstance(check, ImportError):
-        check = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use VentilationPolar method check: " + str(check))
-            )
-        )
-    else:
-        check = check
+    check = LazyMethod("pyleecan.Methods.Slot.VentilationPolar.check")
     # cf Methods.Slot.VentilationPolar.comp_radius
-    if isinstance(comp_radius, ImportError):
-        comp_radius = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use VentilationPolar method comp_radius: " + str(comp_radius)
-                )
-            )
-        )
-    else:
-        comp_radius = comp_radius
+    comp_radius = LazyMethod("pyleecan.Methods.Slot.VentilationPolar.comp_radius")
     # cf Methods.Slot.VentilationPolar.comp_surface
-    if isinstance(comp_surface, ImportError):
-        comp_surface = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use VentilationPolar method comp_surface: "
-                    + str(comp_surface)
-                )
-            )
-        )
-    else:
-        comp_surface = comp_surface
+    comp_surface = LazyMethod("pyleecan.Methods.Slot.VentilationPolar.comp_surface")
     # cf Methods.Slot.VentilationPolar.get_center
-    if isinstance(get_center, ImportError):
-        get_center = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use VentilationPolar method get_center: " + str(get_center)
-                )
-            )
-        )
-    else:
-        get_center = get_center
+    get_center = LazyMethod("pyleecan.Methods.Slot.VentilationPolar.get_center")
     # save method is available in all object
     save = save
 
@@ -119,17 +46,17 @@ class VentilationPolar(Hole):
         if init_dict is not None:  # Initialisation by dict
             check_init_dict(init_dict, ["Alpha0", "D0", "H0", "W1", "Zh", "mat_void"])
             # Overwrite default value with init_dict content
-            if "Alpha0" in list(init_dict.keys()):
+            if "Alpha0" in init_dict:
                 Alpha0 = init_dict["Alpha0"]
-            if "D0" in list(init_dict.keys()):
+            if "D0" in init_dict:
                 D0 = init_dict["D0"]
-            if "H0" in list(init_dict.keys()):
+            if "H0" in init_dict:
                 H0 = init_dict["H0"]
-            if "W1" in list(init_dict.keys()):
+            if "W1" in init_dict:
                 W1 = init_dict["W1"]
-            if "Zh" in list(init_dict.keys()):
+            if "Zh" in init_dict:
                 Zh = init_dict["Zh"]
-            if "mat_void" in list(init_dict.keys()):
+            if "mat_void" in init_dict:
                 mat_void = init_dict["mat_void"]
         # Initialisation by argument
         self.Alpha0 = Alpha0
@@ -172,12 +99,15 @@ class VentilationPolar(Hole):
             return False
         return True
 
-    def as_dict(self):
+    def as_dict(self, is_keep_array=False):
         """Convert this objet in a json seriable dict (can be use in __init__)
+        The ndarray are not converted to list if is_keep_array
         """
 
         # Get the properties inherited from Hole
-        VentilationPolar_dict = super(VentilationPolar, self).as_dict()
+        VentilationPolar_dict = super(VentilationPolar, self).as_dict(
+            is_keep_array=is_keep_array
+        )
         VentilationPolar_dict["Alpha0"] = self.Alpha0
         VentilationPolar_dict["D0"] = self.D0
         VentilationPolar_dict["H0"] = self.H0
@@ -187,6 +117,16 @@ class VentilationPolar(Hole):
         VentilationPolar_dict["__class__"] = "VentilationPolar"
         return VentilationPolar_dict
 
+    def _copy_to(self, obj):
+        """Copy the properties of this object in obj (called by copy)"""
+
+        # Copy the properties inherited from Hole
+        super(VentilationPolar, self)._copy_to(obj)
+        obj._Alpha0 = self._Alpha0
+        obj._D0 = self._D0
+        obj._H0 = self._H0
+        obj._W1 = self._W1
+
     def _set_None(self):
         """Set all the properties to None (except pyleecan object)"""
 
@@ -205,6 +145,7 @@ class VentilationPolar(Hole):
         """setter of Alpha0"""
         check_var("Alpha0", value, "float", Vmin=0, Vmax=6.29)
         self._Alpha0 = value
+        self._clear_memo()
 
     # Shift angle of the hole around circumference
     # Type : float, min = 0, max = 6.29
@@ -222,6 +163,7 @@ class VentilationPolar(Hole):
         """setter of D0"""
         check_var("D0", value, "float", Vmin=0)
         self._D0 = value
+        self._clear_memo()
 
     # Height of the hole
     # Type : float, min = 0
@@ -235,6 +177,7 @@ class VentilationPolar(Hole):
         """setter of H0"""
         check_var("H0", value, "float", Vmin=0)
         self._H0 = value
+        self._clear_memo()
 
     # Radius of the bottom of Hole
     # Type : float, min = 0
@@ -248,6 +191,7 @@ class VentilationPolar(Hole):
         """setter of W1"""
         check_var("W1", value, "float", Vmin=0, Vmax=6.29)
         self._W1 = value
+        self._clear_memo()
 
     # Hole angular width
     # Type : float, min = 0, max = 6.29
@@ -4,38 +4,11 @@ WARNING! All changes made in this file will be lost!
 """
 
 from os import linesep
-from pyleecan.Classes._check import check_init_dict, check_var, raise_
+from pyleecan.Classes._check import check_init_dict, check_var
 from pyleecan.Functions.save import save
 from pyleecan.Classes.Hole import Hole
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from pyleecan.Methods.Slot.VentilationTrap.build_geometry import build_geometry
-except ImportError as error:
-    build_geometry = error
-
-try:
-    from pyleecan.Methods.Slot.VentilationTrap.check import check
-except ImportError as error:
-    check = error
-
-try:
-    from pyleecan.Methods.Slot.VentilationTrap.comp_radius import comp_radius
-except ImportError as error:
-    comp_radius = error
-
-try:
-    from pyleecan.Methods.Slot.VentilationTrap.comp_surface import comp_surface
-except ImportError as error:
-    comp_surface = error
-
-try:
-    from pyleecan.Methods.Slot.VentilationTrap.get_center import get_center
-except ImportError as error:
-    get_center = error
-
-
+from pyleecan.Classes._lazy import LazyMethod
 from pyleecan.Classes._check import InitUnKnowClassError
 from pyleecan.Classes.Material import Material
 
@@ -45,62 +18,16 @@ class VentilationTrap(Hole):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
     # cf Methods.Slot.VentilationTrap.build_geometry
-    if isinstance(build_geometry, ImportError):
-        build_geometry = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use VentilationTrap method build_geometry: "
-                    + str(build_geometry)
-                )
-            )
-        )
-    else:
-        build_geometry = build_geometry
+    build_geometry = LazyMethod("pyleecan.Methods.Slot.VentilationTrap.build_geometry")
     # cf Methods.Slot.VentilationTrap.check
-    if isinstance(check, ImportError):
-        check = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use VentilationTrap method check: " + str(check))
-            )
-        )
-    else:
-        check = check
+    check = LazyMethod("pyleecan.Methods.Slot.VentilationTrap.check")
     # cf Methods.Slot.VentilationTrap.comp_radius
-    if isinstance(comp_radius, ImportError):
-        comp_radius = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use VentilationTrap method comp_radius: " + str(comp_radius)
-                )
-            )
-        )
-    else:
-        comp_radius = comp_radius
+    comp_radius = LazyMethod("pyleecan.Methods.Slot.VentilationTrap.comp_radius")
     # cf Methods.Slot.VentilationTrap.comp_surface
-    if isinstance(comp_surface, ImportError):
-        comp_surface = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use VentilationTrap method comp_surface: "
-                    + str(comp_surface)
-                )
-            )
-        )
-    else:
-        comp_surface = comp_surface
+    comp_surface = LazyMethod("pyleecan.Methods.Slot.VentilationTrap.comp_surface")
     # cf Methods.Slot.VentilationTrap.get_center
-    if isinstance(get_center, ImportError):
-        get_center = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use VentilationTrap method get_center: " + str(get_center)
-                )
-            )
-        )
-    else:
-        get_center = get_center
+    get_center = LazyMethod("pyleecan.Methods.Slot.VentilationTrap.get_center")
     # save method is available in all object
     save = save
 
@@ -123,19 +50,19 @@ class VentilationTrap(Hole):
                 init_dict, ["Alpha0", "D0", "H0", "W1", "W2", "Zh", "mat_void"]
             )
             # Overwrite default value with init_dict content
-            if "Alpha0" in list(init_dict.keys()):
+            if "Alpha0" in init_dict:
                 Alpha0 = init_dict["Alpha0"]
-            if "D0" in list(init_dict.keys()):
+            if "D0" in init_dict:
                 D0 = init_dict["D0"]
-            if "H0" in list(init_dict.keys()):
+            if "H0" in init_dict:
                 H0 = init_dict["H0"]
-            if "W1" in list(init_dict.keys()):
+            if "W1" in init_dict:
                 W1 = init_dict["W1"]
-            if "W2" in list(init_dict.keys()):
+            if "W2" in init_dict:
                 W2 = init_dict["W2"]
-            if "Zh" in list(init_dict.keys()):
+            if "Zh" in init_dict:
                 Zh = init_dict["Zh"]
-            if "mat_void" in list(init_dict.keys()):
+            if "mat_void" in init_dict:
                 mat_void = init_dict["mat_void"]
         # Initialisation by argument
         self.Alpha0 = Alpha0
@@ -182,12 +109,15 @@ class VentilationTrap(Hole):
             return False
         return True
 
-    def as_dict(self):
+    def as_dict(self, is_keep_array=False):
         """Convert this objet in a json seriable dict (can be use in __init__)
+        The ndarray are not converted to list if is_keep_array
         """
 
         # Get the properties inherited from Hole
-        VentilationTrap_dict = super(VentilationTrap, self).as_dict()
+        VentilationTrap_dict = super(VentilationTrap, self).as_dict(
+            is_keep_array=is_keep_array
+        )
         VentilationTrap_dict["Alpha0"] = self.Alpha0
         VentilationTrap_dict["D0"] = self.D0
         VentilationTrap_dict["H0"] = self.H0
@@ -198,6 +128,17 @@ class VentilationTrap(Hole):
         VentilationTrap_dict["__class__"] = "VentilationTrap"
         return VentilationTrap_dict
 
+    def _copy_to(self, obj):
+        """Copy the properties of this object in obj (called by copy)"""
+
+        # Copy the properties inherited from Hole
+        super(VentilationTrap, self)._copy_to(obj)
+        obj._Alpha0 = self._Alpha0
+        obj._D0 = self._D0
+        obj._H0 = self._H0
+        obj._W1 = self._W1
+        obj._W2 = self._W2
+
     def _set_None(self):
         """Set all the properties to None (except pyleecan object)"""
 
@@ -217,6 +158,7 @@ class VentilationTrap(Hole):
         """setter of Alpha0"""
         check_var("Alpha0", value, "float", Vmin=0, Vmax=6.29)
         self._Alpha0 = value
+        self._clear_memo()
 
     # Shift angle of the hole around circumference
     # Type : float, min = 0, max = 6.29
@@ -234,6 +176,7 @@ class VentilationTrap(Hole):
         """setter of D0"""
         check_var("D0", value, "float", Vmin=0)
         self._D0 = value
+        self._clear_memo()
 
     # Hole height
     # Type : float, min = 0
@@ -247,6 +190,7 @@ class VentilationTrap(Hole):
         """setter of H0"""
         check_var("H0", value, "float", Vmin=0)
         self._H0 = value
+        self._clear_memo()
 
     # Radius of the hole bottom
     # Type : float, min = 0
@@ -260,6 +204,7 @@ class VentilationTrap(Hole):
         """setter of W1"""
         check_var("W1", value, "float", Vmin=0)
         self._W1 = value
+        self._clear_memo()
 
     # Hole small basis
     # Type : float, min = 0
@@ -273,6 +218,7 @@ class VentilationTrap(Hole):
         """setter of W2"""
         check_var("W2", value, "float", Vmin=0)
         self._W2 = value
+        self._clear_memo()
 
     # Hole large basis
     # Type : float, min = 0
@@ -4,40 +4,11 @@ WARNING! All changes made in this file will be lost!
 """
 
 from os import linesep
-from pyleecan.Classes._check import check_init_dict, check_var, raise_
+from pyleecan.Classes._check import check_init_dict, check_var
 from pyleecan.Functions.save import save
 from pyleecan.Classes._frozen import FrozenClass
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from pyleecan.Methods.Machine.Winding.comp_Ncspc import comp_Ncspc
-except ImportError as error:
-    comp_Ncspc = error
-
-try:
-    from pyleecan.Methods.Machine.Winding.comp_Ntspc import comp_Ntspc
-except ImportError as error:
-    comp_Ntspc = error
-
-try:
-    from pyleecan.Methods.Machine.Winding.comp_phasor_angle import comp_phasor_angle
-except ImportError as error:
-    comp_phasor_angle = error
-
-try:
-    from pyleecan.Methods.Machine.Winding.comp_resistance_norm import (
-        comp_resistance_norm,
-    )
-except ImportError as error:
-    comp_resistance_norm = error
-
-try:
-    from pyleecan.Methods.Machine.Winding.comp_winding_factor import comp_winding_factor
-except ImportError as error:
-    comp_winding_factor = error
-
-
+from pyleecan.Classes._lazy import LazyInit, LazyMethod
 from pyleecan.Classes._check import InitUnKnowClassError
 from pyleecan.Classes.Conductor import Conductor
 
@@ -47,61 +18,28 @@ class Winding(FrozenClass):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
     # cf Methods.Machine.Winding.comp_Ncspc
-    if isinstance(comp_Ncspc, ImportError):
-        comp_Ncspc = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Winding method comp_Ncspc: " + str(comp_Ncspc))
-            )
-        )
-    else:
-        comp_Ncspc = comp_Ncspc
+    comp_Ncspc = LazyMethod("pyleecan.Methods.Machine.Winding.comp_Ncspc")
     # cf Methods.Machine.Winding.comp_Ntspc
-    if isinstance(comp_Ntspc, ImportError):
-        comp_Ntspc = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Winding method comp_Ntspc: " + str(comp_Ntspc))
-            )
-        )
-    else:
-        comp_Ntspc = comp_Ntspc
+    comp_Ntspc = LazyMethod("pyleecan.Methods.Machine.Winding.comp_Ntspc")
     # cf Methods.Machine.Winding.comp_phasor_angle
-    if isinstance(comp_phasor_angle, ImportError):
-        comp_phasor_angle = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Winding method comp_phasor_angle: "
-                    + str(comp_phasor_angle)
-                )
-            )
-        )
-    else:
-        comp_phasor_angle = comp_phasor_angle
+    comp_phasor_angle = LazyMethod("pyleecan.Methods.Machine.Winding.comp_phasor_angle")
     # cf Methods.Machine.Winding.comp_resistance_norm
-    if isinstance(comp_resistance_norm, ImportError):
-        comp_resistance_norm = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Winding method comp_resistance_norm: "
-                    + str(comp_resistance_norm)
-                )
-            )
-        )
-    else:
-        comp_resistance_norm = comp_resistance_norm
+    comp_resistance_norm = LazyMethod(
+        "pyleecan.Methods.Machine.Winding.comp_resistance_norm"
+    )
     # cf Methods.Machine.Winding.comp_winding_factor
-    if isinstance(comp_winding_factor, ImportError):
-        comp_winding_factor = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Winding method comp_winding_factor: "
-                    + str(comp_winding_factor)
-                )
-            )
-        )
-    else:
-        comp_winding_factor = comp_winding_factor
+    comp_winding_factor = LazyMethod(
+        "pyleecan.Methods.Machine.Winding.comp_winding_factor"
+    )
+    # cf Methods.Machine.Winding.comp_winding_factor_mat
+    comp_winding_factor_mat = LazyMethod(
+        "pyleecan.Methods.Machine.Winding.comp_winding_factor_mat"
+    )
+    # cf Methods.Machine.Winding.comp_mmf_spectrum
+    comp_mmf_spectrum = LazyMethod("pyleecan.Methods.Machine.Winding.comp_mmf_spectrum")
+    # cf Methods.Machine.Winding.comp_periodicity
+    comp_periodicity = LazyMethod("pyleecan.Methods.Machine.Winding.comp_periodicity")
     # save method is available in all object
     save = save
 
@@ -145,23 +83,23 @@ class Winding(FrozenClass):
                 ],
             )
             # Overwrite default value with init_dict content
-            if "is_reverse_wind" in list(init_dict.keys()):
+            if "is_reverse_wind" in init_dict:
                 is_reverse_wind = init_dict["is_reverse_wind"]
-            if "Nslot_shift_wind" in list(init_dict.keys()):
+            if "Nslot_shift_wind" in init_dict:
                 Nslot_shift_wind = init_dict["Nslot_shift_wind"]
-            if "qs" in list(init_dict.keys()):
+            if "qs" in init_dict:
                 qs = init_dict["qs"]
-            if "Ntcoil" in list(init_dict.keys()):
+            if "Ntcoil" in init_dict:
                 Ntcoil = init_dict["Ntcoil"]
-            if "Npcpp" in list(init_dict.keys()):
+            if "Npcpp" in init_dict:
                 Npcpp = init_dict["Npcpp"]
-            if "type_connection" in list(init_dict.keys()):
+            if "type_connection" in init_dict:
                 type_connection = init_dict["type_connection"]
-            if "p" in list(init_dict.keys()):
+            if "p" in init_dict:
                 p = init_dict["p"]
-            if "Lewout" in list(init_dict.keys()):
+            if "Lewout" in init_dict:
                 Lewout = init_dict["Lewout"]
-            if "conductor" in list(init_dict.keys()):
+            if "conductor" in init_dict:
                 conductor = init_dict["conductor"]
         # Initialisation by argument
         self.parent = None
@@ -246,8 +184,9 @@ class Winding(FrozenClass):
             return False
         return True
 
-    def as_dict(self):
+    def as_dict(self, is_keep_array=False):
         """Convert this objet in a json seriable dict (can be use in __init__)
+        The ndarray are not converted to list if is_keep_array
         """
 
         Winding_dict = dict()
@@ -262,11 +201,30 @@ class Winding(FrozenClass):
         if self.conductor is None:
             Winding_dict["conductor"] = None
         else:
-            Winding_dict["conductor"] = self.conductor.as_dict()
+            Winding_dict["conductor"] = self.conductor.as_dict(
+                is_keep_array=is_keep_array
+            )
         # The class name is added to the dict fordeserialisation purpose
         Winding_dict["__class__"] = "Winding"
         return Winding_dict
 
+    def _copy_to(self, obj):
+        """Copy the properties of this object in obj (called by copy)"""
+
+        obj._is_reverse_wind = self._is_reverse_wind
+        obj._Nslot_shift_wind = self._Nslot_shift_wind
+        obj._qs = self._qs
+        obj._Ntcoil = self._Ntcoil
+        obj._Npcpp = self._Npcpp
+        obj._type_connection = self._type_connection
+        obj._p = self._p
+        obj._Lewout = self._Lewout
+        if self._conductor is None:
+            obj._conductor = None
+        else:
+            obj._conductor = self._conductor.copy()
+            obj._conductor.parent = obj
+
     def _set_None(self):
         """Set all the properties to None (except pyleecan object)"""
 
@@ -289,6 +247,7 @@ class Winding(FrozenClass):
         """setter of is_reverse_wind"""
         check_var("is_reverse_wind", value, "bool")
         self._is_reverse_wind = value
+        self._clear_memo()
 
     # 1 to reverse the default winding algorithm along the airgap (c, b, a instead of a, b, c along the trigonometric direction)
     # Type : bool
@@ -306,6 +265,7 @@ class Winding(FrozenClass):
         """setter of Nslot_shift_wind"""
         check_var("Nslot_shift_wind", value, "int")
         self._Nslot_shift_wind = value
+        self._clear_memo()
 
     # 0 not to change the stator winding connection matrix built by pyleecan number of slots to shift the coils obtained with pyleecan winding algorithm (a, b, c becomes b, c, a with Nslot_shift_wind1=1)
     # Type : int
@@ -323,6 +283,7 @@ class Winding(FrozenClass):
         """setter of qs"""
         check_var("qs", value, "int", Vmin=1, Vmax=100)
         self._qs = value
+        self._clear_memo()
 
     # number of phases
     # Type : int, min = 1, max = 100
@@ -336,6 +297,7 @@ class Winding(FrozenClass):
         """setter of Ntcoil"""
         check_var("Ntcoil", value, "int", Vmin=1, Vmax=1000)
         self._Ntcoil = value
+        self._clear_memo()
 
     # number of turns per coil
     # Type : int, min = 1, max = 1000
@@ -351,6 +313,7 @@ class Winding(FrozenClass):
         """setter of Npcpp"""
         check_var("Npcpp", value, "int", Vmin=1, Vmax=1000)
         self._Npcpp = value
+        self._clear_memo()
 
     # number of parallel circuits per phase (maximum 2p)
     # Type : int, min = 1, max = 1000
@@ -368,6 +331,7 @@ class Winding(FrozenClass):
         """setter of type_connection"""
         check_var("type_connection", value, "int", Vmin=0, Vmax=1)
         self._type_connection = value
+        self._clear_memo()
 
     # Winding connection : 0 star (Y), 1 triangle (delta)
     # Type : int, min = 0, max = 1
@@ -385,6 +349,7 @@ class Winding(FrozenClass):
         """setter of p"""
         check_var("p", value, "int", Vmin=1, Vmax=100)
         self._p = value
+        self._clear_memo()
 
     # pole pairs number
     # Type : int, min = 1, max = 100
@@ -398,6 +363,7 @@ class Winding(FrozenClass):
         """setter of Lewout"""
         check_var("Lewout", value, "float", Vmin=0, Vmax=100)
         self._Lewout = value
+        self._clear_memo()
 
     # straight length of the conductors outside the lamination before the curved part of winding overhang [m] - can be negative to tune the average turn length
     # Type : float, min = 0, max = 100
@@ -409,12 +375,16 @@ class Winding(FrozenClass):
 
     def _get_conductor(self):
         """getter of conductor"""
+        if isinstance(self._conductor, LazyInit):
+            # Create the object of a lazy load
+            self._set_conductor(self._conductor.resolve())
         return self._conductor
 
     def _set_conductor(self, value):
         """setter of conductor"""
         check_var("conductor", value, "Conductor")
         self._conductor = value
+        self._clear_memo()
 
         if self._conductor is not None:
             self._conductor.parent = self
@@ -4,25 +4,11 @@ WARNING! All changes made in this file will be lost!
 """
 
 from os import linesep
-from pyleecan.Classes._check import check_init_dict, check_var, raise_
+from pyleecan.Classes._check import check_init_dict, check_var
 from pyleecan.Functions.save import save
 from pyleecan.Classes.Winding import Winding
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from pyleecan.Methods.Machine.WindingCW2LT.comp_connection_mat import (
-        comp_connection_mat,
-    )
-except ImportError as error:
-    comp_connection_mat = error
-
-try:
-    from pyleecan.Methods.Machine.WindingCW2LT.get_dim_wind import get_dim_wind
-except ImportError as error:
-    get_dim_wind = error
-
-
+from pyleecan.Classes._lazy import LazyMethod
 from pyleecan.Classes._check import InitUnKnowClassError
 from pyleecan.Classes.Conductor import Conductor
 
@@ -32,30 +18,12 @@ class WindingCW2LT(Winding):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
     # cf Methods.Machine.WindingCW2LT.comp_connection_mat
-    if isinstance(comp_connection_mat, ImportError):
-        comp_connection_mat = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use WindingCW2LT method comp_connection_mat: "
-                    + str(comp_connection_mat)
-                )
-            )
-        )
-    else:
-        comp_connection_mat = comp_connection_mat
+    comp_connection_mat = LazyMethod(
+        "pyleecan.Methods.Machine.WindingCW2LT.comp_connection_mat"
+    )
     # cf Methods.Machine.WindingCW2LT.get_dim_wind
-    if isinstance(get_dim_wind, ImportError):
-        get_dim_wind = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use WindingCW2LT method get_dim_wind: " + str(get_dim_wind)
-                )
-            )
-        )
-    else:
-        get_dim_wind = get_dim_wind
+    get_dim_wind = LazyMethod("pyleecan.Methods.Machine.WindingCW2LT.get_dim_wind")
     # save method is available in all object
     save = save
 
@@ -99,23 +67,23 @@ class WindingCW2LT(Winding):
                 ],
             )
             # Overwrite default value with init_dict content
-            if "is_reverse_wind" in list(init_dict.keys()):
+            if "is_reverse_wind" in init_dict:
                 is_reverse_wind = init_dict["is_reverse_wind"]
-            if "Nslot_shift_wind" in list(init_dict.keys()):
+            if "Nslot_shift_wind" in init_dict:
                 Nslot_shift_wind = init_dict["Nslot_shift_wind"]
-            if "qs" in list(init_dict.keys()):
+            if "qs" in init_dict:
                 qs = init_dict["qs"]
-            if "Ntcoil" in list(init_dict.keys()):
+            if "Ntcoil" in init_dict:
                 Ntcoil = init_dict["Ntcoil"]
-            if "Npcpp" in list(init_dict.keys()):
+            if "Npcpp" in init_dict:
                 Npcpp = init_dict["Npcpp"]
-            if "type_connection" in list(init_dict.keys()):
+            if "type_connection" in init_dict:
                 type_connection = init_dict["type_connection"]
-            if "p" in list(init_dict.keys()):
+            if "p" in init_dict:
                 p = init_dict["p"]
-            if "Lewout" in list(init_dict.keys()):
+            if "Lewout" in init_dict:
                 Lewout = init_dict["Lewout"]
-            if "conductor" in list(init_dict.keys()):
+            if "conductor" in init_dict:
                 conductor = init_dict["conductor"]
         # Initialisation by argument
         # Call Winding init
@@ -152,17 +120,26 @@ class WindingCW2LT(Winding):
             return False
         return True
 
-    def as_dict(self):
+    def as_dict(self, is_keep_array=False):
         """Convert this objet in a json seriable dict (can be use in __init__)
+        The ndarray are not converted to list if is_keep_array
         """
 
         # Get the properties inherited from Winding
-        WindingCW2LT_dict = super(WindingCW2LT, self).as_dict()
+        WindingCW2LT_dict = super(WindingCW2LT, self).as_dict(
+            is_keep_array=is_keep_array
+        )
         # The class name is added to the dict fordeserialisation purpose
         # Overwrite the mother class name
         WindingCW2LT_dict["__class__"] = "WindingCW2LT"
         return WindingCW2LT_dict
 
+    def _copy_to(self, obj):
+        """Copy the properties of this object in obj (called by copy)"""
+
+        # Copy the properties inherited from Winding
+        super(WindingCW2LT, self)._copy_to(obj)
+
     def _set_None(self):
         """Set all the properties to None (except pyleecan object)"""
 
@@ -4,25 +4,11 @@ WARNING! All changes made in this file will be lost!
 """
 
 from os import linesep
-from pyleecan.Classes._check import check_init_dict, check_var, raise_
+from pyleecan.Classes._check import check_init_dict, check_var
 from pyleecan.Functions.save import save
 from pyleecan.Classes.Winding import Winding
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from pyleecan.Methods.Machine.WindingDW1L.comp_connection_mat import (
-        comp_connection_mat,
-    )
-except ImportError as error:
-    comp_connection_mat = error
-
-try:
-    from pyleecan.Methods.Machine.WindingDW1L.get_dim_wind import get_dim_wind
-except ImportError as error:
-    get_dim_wind = error
-
-
+from pyleecan.Classes._lazy import LazyMethod
 from pyleecan.Classes._check import InitUnKnowClassError
 from pyleecan.Classes.Conductor import Conductor
 
@@ -32,30 +18,12 @@ class WindingDW1L(Winding):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
     # cf Methods.Machine.WindingDW1L.comp_connection_mat
-    if isinstance(comp_connection_mat, ImportError):
-        comp_connection_mat = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use WindingDW1L method comp_connection_mat: "
-                    + str(comp_connection_mat)
-                )
-            )
-        )
-    else:
-        comp_connection_mat = comp_connection_mat
+    comp_connection_mat = LazyMethod(
+        "pyleecan.Methods.Machine.WindingDW1L.comp_connection_mat"
+    )
     # cf Methods.Machine.WindingDW1L.get_dim_wind
-    if isinstance(get_dim_wind, ImportError):
-        get_dim_wind = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use WindingDW1L method get_dim_wind: " + str(get_dim_wind)
-                )
-            )
-        )
-    else:
-        get_dim_wind = get_dim_wind
+    get_dim_wind = LazyMethod("pyleecan.Methods.Machine.WindingDW1L.get_dim_wind")
     # save method is available in all object
     save = save
 
@@ -101,25 +69,25 @@ class WindingDW1L(Winding):
                 ],
             )
             # Overwrite default value with init_dict content
-            if "coil_pitch" in list(init_dict.keys()):
+            if "coil_pitch" in init_dict:
                 coil_pitch = init_dict["coil_pitch"]
-            if "is_reverse_wind" in list(init_dict.keys()):
+            if "is_reverse_wind" in init_dict:
                 is_reverse_wind = init_dict["is_reverse_wind"]
-            if "Nslot_shift_wind" in list(init_dict.keys()):
+            if "Nslot_shift_wind" in init_dict:
                 Nslot_shift_wind = init_dict["Nslot_shift_wind"]
-            if "qs" in list(init_dict.keys()):
+            if "qs" in init_dict:
                 qs = init_dict["qs"]
-            if "Ntcoil" in list(init_dict.keys()):
+            if "Ntcoil" in init_dict:
                 Ntcoil = init_dict["Ntcoil"]
-            if "Npcpp" in list(init_dict.keys()):
+            if "Npcpp" in init_dict:
                 Npcpp = init_dict["Npcpp"]
-            if "type_connection" in list(init_dict.keys()):
+            if "type_connection" in init_dict:
                 type_connection = init_dict["type_connection"]
-            if "p" in list(init_dict.keys()):
+            if "p" in init_dict:
                 p = init_dict["p"]
-            if "Lewout" in list(init_dict.keys()):
+            if "Lewout" in init_dict:
                 Lewout = init_dict["Lewout"]
-            if "conductor" in list(init_dict.keys()):
+            if "conductor" in init_dict:
                 conductor = init_dict["conductor"]
         # Initialisation by argument
         self.coil_pitch = coil_pitch
@@ -160,18 +128,26 @@ class WindingDW1L(Winding):
             return False
         return True
 
-    def as_dict(self):
+    def as_dict(self, is_keep_array=False):
         """Convert this objet in a json seriable dict (can be use in __init__)
+        The ndarray are not converted to list if is_keep_array
         """
 
         # Get the properties inherited from Winding
-        WindingDW1L_dict = super(WindingDW1L, self).as_dict()
+        WindingDW1L_dict = super(WindingDW1L, self).as_dict(is_keep_array=is_keep_array)
         WindingDW1L_dict["coil_pitch"] = self.coil_pitch
         # The class name is added to the dict fordeserialisation purpose
         # Overwrite the mother class name
         WindingDW1L_dict["__class__"] = "WindingDW1L"
         return WindingDW1L_dict
 
+    def _copy_to(self, obj):
+        """Copy the properties of this object in obj (called by copy)"""
+
+        # Copy the properties inherited from Winding
+        super(WindingDW1L, self)._copy_to(obj)
+        obj._coil_pitch = self._coil_pitch
+
     def _set_None(self):
         """Set all the properties to None (except pyleecan object)"""
 
@@ -187,6 +163,7 @@ class WindingDW1L(Winding):
         """setter of coil_pitch"""
         check_var("coil_pitch", value, "int", Vmin=0, Vmax=1000)
         self._coil_pitch = value
+        self._clear_memo()
 
     # winding coil pitch or coil span expressed in slots (coil_pitch1=Zs/(2p)->full-pitch distributed winding, coil_pitch1<Zs/(2p)->chorded/shorted-pitch distributed winding, coil_pitch1=1->tooth-winding). Coil pitch is sometimes written 1/9 means Input.Magnetics.coil_pitch1=9-1=8
     # Type : int, min = 0, max = 1000
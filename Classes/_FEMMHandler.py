@@ -0,0 +1,186 @@
+# -*- coding: utf-8 -*-
+"""Solver backend of the FEMM coupling (MagFEMM, draw_FEMM...)
+
+Every FEMM function of pyleecan calls the solver through a backend object given
+as "femm" parameter. A backend must provide the functions of FEMM_API with the
+pyfemm signatures (mi_* for the preprocessor, mo_* for the postprocessor) and
+the bulk queries mo_getgapb_array and mo_getb_array.
+"""
+
+from os import getpid, remove
+from os.path import join
+from tempfile import gettempdir
+
+from numpy import fromfile, savetxt, column_stack
+
+from pyleecan.Functions.FEMM.create_FEMM_lua import create_FEMM_lua
+
+# Functions of the pyfemm module used by pyleecan (backend interface)
+FEMM_API = (
+    # Session and document
+    "openfemm",
+    "closefemm",
+    "newdocument",
+    "opendocument",
+    "main_minimize",
+    "callfemm",
+    "smartmesh",
+    "mi_probdef",
+    "mi_zoomnatural",
+    "mi_saveas",
+    "mi_close",
+    # Geometry drawing
+    "mi_addnode",
+    "mi_selectnode",
+    "mi_setnodeprop",
+    "mi_addsegment",
+    "mi_selectsegment",
+    "mi_setsegmentprop",
+    "mi_addarc",
+    "mi_selectarcsegment",
+    "mi_setarcsegmentprop",
+    "mi_addblocklabel",
+    "mi_selectlabel",
+    "mi_setblockprop",
+    "mi_clearselected",
+    # Materials
+    "mi_addmaterial",
+    "mi_modifymaterial",
+    "mi_addbhpoint",
+    # Boundary conditions
+    "mi_addboundprop",
+    "mi_modifyboundprop",
+    # Circuits
+    "mi_addcircprop",
+    "mi_modifycircprop",
+    # Solve
+    "mi_createmesh",
+    "mi_setprevious",
+    "mi_analyze",
+    "mi_loadsolution",
+    # Post-processing queries
+    "mo_getgapb",
+    "mo_getb",
+    "mo_seteditmode",
+    "mo_groupselectblock",
+    "mo_blockintegral",
+    "mo_getcircuitproperties",
+    # Bulk post-processing queries (one solver call for all the points)
+    "mo_getgapb_array",
+    "mo_getb_array",
+)
+
+
+class _FEMMHandler(object):
+    """Solver backend running FEMM through the pyfemm module.
+    pyfemm drives one FEMM session per process.
+    """
+
+    # True if each worker process can open its own session of the backend
+    is_parallel = True
+
+    def __getattr__(self, name):
+        """Forward the functions of the backend interface to pyfemm
+
+        Parameters
+        ----------
+        self : _FEMMHandler
+            A _FEMMHandler object
+        name : str
+            Name of the pyfemm function
+
+        Returns
+        -------
+        fct : function
+            The pyfemm function
+        """
+        if name not in FEMM_API:
+            raise AttributeError(
+                "_FEMMHandler has no " + name + " function (not in FEMM_API)"
+            )
+        import femm
+
+        return getattr(femm, name)
+
+    def mo_getgapb_array(self, bc_name, angle):
+        """Get the flux density in a sliding band for all the angles at once
+        (a Lua script loops on mo_getgapb in FEMM)
+
+        Parameters
+        ----------
+        self : _FEMMHandler
+            A _FEMMHandler object
+        bc_name : str
+            Name of the sliding band boundary condition
+        angle : ndarray
+            Angles to get the flux density [deg]
+
+        Returns
+        -------
+        Br, Bt : ndarray
+            Radial and tangential flux density for each angle [T]
+        """
+        return self._call_lua(
+            "get_gap_flux_FEMM.lua", {"my_bc_name": bc_name}, angle.reshape(-1, 1)
+        )
+
+    def mo_getb_array(self, x, y):
+        """Get the flux density for all the points at once
+        (a Lua script loops on mo_getb in FEMM)
+
+        Parameters
+        ----------
+        self : _FEMMHandler
+            A _FEMMHandler object
+        x : ndarray
+            x coordinates of the points [m]
+        y : ndarray
+            y coordinates of the points [m]
+
+        Returns
+        -------
+        Bx, By : ndarray
+            Flux density for each point [T]
+        """
+        return self._call_lua("get_flux_FEMM.lua", dict(), column_stack((x, y)))
+
+    def _call_lua(self, script_name, replace_dict, data_in):
+        """Run a Lua script of Functions/FEMM that reads data_in (one point per
+        line) and writes two values per point
+
+        Parameters
+        ----------
+        self : _FEMMHandler
+            A _FEMMHandler object
+        script_name : str
+            Name of the Lua script template
+        replace_dict : dict
+            Values to set in the template (in addition to the file paths)
+        data_in : ndarray
+            Input of the script (one line per point)
+
+        Returns
+        -------
+        res1, res2 : ndarray
+            The two values written by the script for each point
+        """
+        # Temporary files of the current process (one per worker)
+        path_tmp = join(gettempdir(), "pyleecan_" + str(getpid()) + "_")
+        path_in = path_tmp + "in.txt"
+        path_out = path_tmp + "out.txt"
+        path_lua = path_tmp + script_name
+
+        # Create the Lua script with the current paths
+        replace_dict = dict(replace_dict)
+        replace_dict["my_path_in"] = path_in.replace("\\", "/")
+        replace_dict["my_path_out"] = path_out.replace("\\", "/")
+        path_lua_call = create_FEMM_lua(script_name, path_lua, replace_dict)
+        savetxt(path_in, data_in, fmt="%.16e")
+
+        # Run the script in FEMM (single call)
+        self.callfemm('dofile("' + path_lua_call + '")')
+
+        res = fromfile(path_out, sep=" ").reshape(-1, 2)
+        for path in [path_in, path_out, path_lua]:
+            remove(path)
+        return res[:, 0], res[:, 1]
@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+
+from json import dump, load
+from time import perf_counter
+
+from numpy import ndarray, generic
+
+from pyleecan.Classes._FEMMHandler import FEMM_API
+
+
+class _FEMMRecorder(object):
+    """In-process solver backend that records the calls sent to another
+    backend, or replays a previous record without any solver.
+
+    Replaying a record runs a simulation without FEMM (on a computer without
+    FEMM for instance) and measures the Python time of the simulation apart
+    from the solver time (solver_time of the recording).
+    Only the returned values are recorded: the files written by the scripts of
+    callfemm (mesh and solution of MagFEMM with is_get_mesh or is_save_FEA)
+    are not, so callfemm can't be replayed.
+    """
+
+    # A record is a single ordered session
+    is_parallel = False
+
+    def __init__(self, backend=None, call_list=None):
+        """Constructor of the class
+
+        Parameters
+        ----------
+        self : _FEMMRecorder
+            A _FEMMRecorder object
+        backend :
+            Backend to record (None to replay call_list)
+        call_list : list
+            Recorded calls [name, args, result] to replay
+        """
+        self.backend = backend
+        if call_list is None:
+            call_list = list()
+        self.call_list = call_list
+        self.index = 0  # Index of the next call to replay
+        self.solver_time = 0  # Time spent in the recorded backend [s]
+
+    def __getattr__(self, name):
+        """Return the recording or replaying version of a backend function
+
+        Parameters
+        ----------
+        self : _FEMMRecorder
+            A _FEMMRecorder object
+        name : str
+            Name of the function of the backend interface
+
+        Returns
+        -------
+        fct : function
+            The recording or replaying function
+        """
+        if name not in FEMM_API:
+            raise AttributeError(
+                "_FEMMRecorder has no " + name + " function (not in FEMM_API)"
+            )
+
+        def record(*args):
+            start = perf_counter()
+            result = getattr(self.backend, name)(*args)
+            self.solver_time += perf_counter() - start
+            self.call_list.append([name, list(args), result])
+            return result
+
+        def replay(*args):
+            if self.index >= len(self.call_list):
+                raise FEMMReplayError(
+                    "Call " + name + " is not in the record (end of the record)"
+                )
+            if name == "callfemm":
+                raise FEMMReplayError(
+                    "callfemm can't be replayed: the files written by the FEMM "
+                    "script are not recorded (use is_get_mesh=False and "
+                    "is_save_FEA=False to replay a MagFEMM simulation)"
+                )
+            rec_name, _, result = self.call_list[self.index]
+            if rec_name != name:
+                raise FEMMReplayError(
+                    "Call "
+                    + str(self.index)
+                    + " is "
+                    + name
+                    + ", the record expects "
+                    + rec_name
+                )
+            self.index += 1
+            return result
+
+        if self.backend is None:
+            return replay
+        else:
+            return record
+
+    def save(self, save_path):
+        """Save the recorded calls in a json file
+
+        Parameters
+        ----------
+        self : _FEMMRecorder
+            A _FEMMRecorder object
+        save_path : str
+            Path to the json file
+        """
+        with open(save_path, "w") as json_file:
+            dump(self.call_list, json_file, default=to_json)
+
+
+def load_record(file_path):
+    """Create a _FEMMRecorder to replay the calls saved in a json file
+
+    Parameters
+    ----------
+    file_path : str
+        Path to the json file
+
+    Returns
+    -------
+    recorder : _FEMMRecorder
+        A _FEMMRecorder replaying the saved calls
+    """
+    with open(file_path, "r") as json_file:
+        call_list = load(json_file)
+    return _FEMMRecorder(call_list=call_list)
+
+
+def to_json(value):
+    """Convert the numpy values of the record for json"""
+    if isinstance(value, (ndarray, generic)):
+        return value.tolist()
+    raise TypeError(type(value).__name__ + " is not JSON serializable")
+
+
+class FEMMReplayError(Exception):
+    """Raised when a call doesn't match the record to replay"""
+
+    pass
@@ -6,8 +6,76 @@ check function for classes
 @author pierre_b
 """
 
+from contextlib import contextmanager
+from threading import local
+
 from numpy import array, empty, int32
 
+from pyleecan.Classes._lazy import LazyInit
+
+
+class _TrustLevel(local):
+    """Number of nested trusted() contexts of the current thread"""
+
+    level = 0
+
+
+_trust = _TrustLevel()
+# Precomputed inheritance table: (class, expected type name) => bool
+_type_table = dict()
+
+
+@contextmanager
+def trusted():
+    """Context to create objects from trusted data (already validated): the
+    values and the init_dict keys are not checked
+
+    Examples
+    --------
+    >>> with trusted():
+    ...     machine = load("machine.json")
+    """
+    _trust.level += 1
+    try:
+        yield
+    finally:
+        _trust.level -= 1
+
+
+def is_trusted():
+    """Check if the objects are currently created in a trusted() context
+
+    Returns
+    -------
+    is_trusted : bool
+        True if the checks are skipped
+    """
+    return _trust.level > 0
+
+
+def is_type_of(cls, expect_type):
+    """Check if cls is or inherits from the class named expect_type (the result
+    is stored in a table to avoid walking the class bases at each call)
+
+    Parameters
+    ----------
+    cls : type
+        The class to check
+    expect_type : str
+        The name of the expected class
+
+    Returns
+    -------
+    is_type : bool
+        True if cls is or inherits from expect_type
+    """
+    try:
+        return _type_table[(cls, expect_type)]
+    except KeyError:
+        is_type = any(mother.__name__ == expect_type for mother in cls.__mro__)
+        _type_table[(cls, expect_type)] = is_type
+        return is_type
+
 
 def set_array(obj, prop, value):
     """Set an array that can be None or a list
@@ -56,6 +124,8 @@ def check_init_dict(init_dict, key_list):
 
     """
 
+    if _trust.level > 0:
+        return  # trusted() context
     if not isinstance(init_dict, dict):
         raise NotADictError("Init by dict : init_dict must be a dict")
     msg = "Second argument is the list of variable needed in init_dict"
@@ -63,7 +133,7 @@ def check_init_dict(init_dict, key_list):
 
     # Check that every key of init_dict is expected for this object
     key_list.append("__class__")  # Not a property, added for load
-    for key in list(init_dict.keys()):
+    for key in init_dict:
         if key not in key_list:
             raise UnknowInitDictKeyError("Init by dict : " + key + " is not a property")
 
@@ -95,6 +165,8 @@ def check_var(var_name, value, expect_type, Vmin=None, Vmax=None):
 
     """
 
+    if isinstance(value, LazyInit) or _trust.level > 0:
+        return  # Checked when the object is created (lazy load) or trusted
     if value is not None:
         type_value = type(value).__name__
         if type_value == "float64":
@@ -182,28 +254,20 @@ def check_type(var_name, value, expect_type, type_value):
         # Check type of value element
         expect_type = expect_type[1:-1]
         for element in value:
-            type_value = type(element).__name__
-            # Check if it's the expected type
-            if not type_value == expect_type:
-                # Check if object inherit from the expected type
-                mother = element.__class__.__bases__  # List of inherited class
-                find = False  # Store the result of the research
-                while mother != ():  # Every class inherit from FrozenClass
-                    if mother[0].__name__ == expect_type:
-                        find = True
-                        break
-                    else:
-                        mother = mother[0].__bases__
-                if not find:  # Not the good type
-                    raise CheckTypeError(
-                        "For "
-                        + var_name
-                        + " : "
-                        + expect_type
-                        + " expected, "
-                        + type_value
-                        + " given"
-                    )
+            if isinstance(element, LazyInit):
+                continue  # Checked when the object is created (lazy load)
+            # Check if object is or inherits from the expected type
+            if not is_type_of(element.__class__, expect_type):
+                type_value = type(element).__name__
+                raise CheckTypeError(
+                    "For "
+                    + var_name
+                    + " : "
+                    + expect_type
+                    + " expected, "
+                    + type_value
+                    + " given"
+                )
     elif expect_type[0] == "{" and expect_type[-1] == "}":  # Dict of type
         if not isinstance(value, dict):
             raise CheckTypeError(
@@ -212,28 +276,20 @@ def check_type(var_name, value, expect_type, type_value):
         # Check type of value element
         expect_type = expect_type[1:-1]
         for key, element in value.items():
-            type_value = type(element).__name__
-            # Check if it's the expected type
-            if not type_value == expect_type:
-                # Check if object inherit from the expected type
-                mother = element.__class__.__bases__  # List of inherited class
-                find = False  # Store the result of the research
-                while mother != ():  # Every class inherit from FrozenClass
-                    if mother[0].__name__ == expect_type:
-                        find = True
-                        break
-                    else:
-                        mother = mother[0].__bases__
-                if not find:  # Not the good type
-                    raise CheckTypeError(
-                        "For "
-                        + var_name
-                        + " : "
-                        + expect_type
-                        + " expected, "
-                        + type_value
-                        + " given"
-                    )
+            if isinstance(element, LazyInit):
+                continue  # Checked when the object is created (lazy load)
+            # Check if object is or inherits from the expected type
+            if not is_type_of(element.__class__, expect_type):
+                type_value = type(element).__name__
+                raise CheckTypeError(
+                    "For "
+                    + var_name
+                    + " : "
+                    + expect_type
+                    + " expected, "
+                    + type_value
+                    + " given"
+                )
 
     else:
         if not type_value == expect_type:  # Check if it's the expected type
@@ -250,15 +306,7 @@ def check_type(var_name, value, expect_type, type_value):
                 )
             else:
                 # Check if object inherit from the expected type
-                mother = value.__class__.__bases__  # List of inherited class
-                find = False  # Store the result of the research
-                while mother != ():  # Every class inherit from FrozenClass
-                    if mother[0].__name__ == expect_type:
-                        find = True
-                        break
-                    else:
-                        mother = mother[0].__bases__
-                if not find:  # Not the good type
+                if not is_type_of(value.__class__, expect_type):
                     raise CheckTypeError(
                         "For "
                         + var_name
@@ -363,12 +411,6 @@ def check_max(var_name, value, type_value, Vmax):
         )
 
 
-def raise_(ex):
-    """Function to raise an exeption for the method import lambda
-    """
-    raise ex
-
-
 class CheckError(Exception):
     """ """
 
@@ -9,6 +9,13 @@ class FrozenClass(object):
     """
 
     __isfrozen = False  # Current state
+    # Data computed by the methods from the properties (not saved nor compared)
+    # Set to None to clear it when the properties are modified
+    _cache = None
+    # Results of the memoized methods (cf Functions.memoize), cleared by the
+    # setters of the object and of its children
+    _memo = None
+    parent = None
 
     def __setattr__(self, key, value):
         """Overide to avoid the add of new properties outside of __init__
@@ -27,8 +34,13 @@ class FrozenClass(object):
         FrozenError
             You can't set a new property if the class is frozen
         """
-        # You can't add a new property to a frozen object
-        if self.__isfrozen and not hasattr(self, key):
+        # You can't add a new property to a frozen object (the properties are
+        # looked up on the class to avoid calling their getter)
+        if (
+            self.__isfrozen
+            and key not in self.__dict__
+            and not hasattr(self.__class__, key)
+        ):
             raise FrozenError(
                 self.__class__.__name__ + ' class has no "' + key + '" ' "property"
             )
@@ -50,6 +62,66 @@ class FrozenClass(object):
 
         self.__isfrozen = True
 
+    def _clear_memo(self):
+        """Clear the memoized results of the object and of its parents (the
+        results of the parents may depend on the object). Called by the setters
+
+        Parameters
+        ----------
+        self : FrozenClass
+            The modified FrozenClass object
+
+        Returns
+        -------
+        None
+        """
+
+        obj = self
+        while obj is not None:
+            if obj._memo is not None:
+                obj._memo = None
+            obj = obj.parent
+
+    def copy(self):
+        """Return a copy of the object. Faster than
+        type(self)(init_dict=self.as_dict()): the ndarray are not converted to
+        list and the values are not checked again (cf _copy_to)
+
+        Parameters
+        ----------
+        self : FrozenClass
+            The FrozenClass object to copy
+
+        Returns
+        -------
+        obj : FrozenClass
+            A copy of the object (without parent)
+        """
+
+        obj = self.__class__.__new__(self.__class__)
+        obj.parent = None
+        self._copy_to(obj)
+        obj._freeze()
+        return obj
+
+    def __deepcopy__(self, memo):
+        """Deep copy of the object (same as copy)
+
+        Parameters
+        ----------
+        self : FrozenClass
+            The FrozenClass object to copy
+        memo : dict
+            Objects already copied (unused, the pyleecan objects are trees)
+
+        Returns
+        -------
+        obj : FrozenClass
+            A copy of the object (without parent)
+        """
+
+        return self.copy()
+
     def __eq__(self, other):
         """Two FrozenClass instance are equal if they have the same __dict__
 
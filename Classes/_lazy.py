@@ -0,0 +1,447 @@
+# -*- coding: utf-8 -*-
+
+from collections.abc import Sequence
+from importlib import import_module
+
+from numpy import exp
+
+
+class LazyInit(object):
+    """Unresolved pyleecan object of a lazy load: the object is created from
+    its init_dict by the getter of the parent object when it is first used
+    """
+
+    __slots__ = ("init_fct", "init_dict", "parent")
+
+    def __init__(self, init_fct, init_dict):
+        """Constructor of the class
+
+        Parameters
+        ----------
+        self : LazyInit
+            A LazyInit object
+        init_fct : function
+            Function to create the object from init_dict
+        init_dict : dict
+            Dictionary of the object (as_dict format)
+        """
+        self.init_fct = init_fct
+        self.init_dict = init_dict
+        self.parent = None
+
+    def resolve(self):
+        """Create the object
+
+        Parameters
+        ----------
+        self : LazyInit
+            A LazyInit object
+
+        Returns
+        -------
+        obj : FrozenClass
+            The pyleecan object
+        """
+        return self.init_fct(self.init_dict)
+
+    def copy(self):
+        """Create a copy of the object (cf FrozenClass.copy)
+
+        Parameters
+        ----------
+        self : LazyInit
+            A LazyInit object
+
+        Returns
+        -------
+        obj : FrozenClass
+            A copy of the pyleecan object
+        """
+        return self.resolve().copy()
+
+
+class LazyList(list):
+    """List of pyleecan objects where some objects can be LazyInit objects:
+    they are created when they are accessed (and replace the LazyInit)
+    """
+
+    def __getitem__(self, index):
+        """Get an item (created if needed)
+
+        Parameters
+        ----------
+        self : LazyList
+            A LazyList object
+        index : int or slice
+            Index of the item(s)
+
+        Returns
+        -------
+        obj : FrozenClass
+            The pyleecan object (list for a slice)
+        """
+        if isinstance(index, slice):
+            return [self[ii] for ii in range(*index.indices(len(self)))]
+        obj = list.__getitem__(self, index)
+        if isinstance(obj, LazyInit):
+            obj = obj.resolve()
+            list.__setitem__(self, index, obj)
+        return obj
+
+    def __iter__(self):
+        """Iterate on the items (created if needed)
+
+        Parameters
+        ----------
+        self : LazyList
+            A LazyList object
+        """
+        for ii in range(len(self)):
+            yield self[ii]
+
+    def pop(self, index=-1):
+        """Remove and return an item (created if needed)
+
+        Parameters
+        ----------
+        self : LazyList
+            A LazyList object
+        index : int
+            Index of the item
+
+        Returns
+        -------
+        obj : FrozenClass
+            The pyleecan object
+        """
+        obj = self[index]
+        list.pop(self, index)
+        return obj
+
+
+class LazyMethod(object):
+    """Method of a generated class: the method module is imported when the
+    method is first used (then the function replaces the LazyMethod in the
+    class). Only the methods that are used load their dependencies.
+    """
+
+    __slots__ = ("module_name", "owner", "name")
+
+    def __init__(self, module_name):
+        """Constructor of the class
+
+        Parameters
+        ----------
+        self : LazyMethod
+            A LazyMethod object
+        module_name : str
+            Name of the module of the method (the function has the same name)
+        """
+        self.module_name = module_name
+        self.owner = None
+        self.name = module_name.split(".")[-1]
+
+    def __set_name__(self, owner, name):
+        """Store the class of the method
+
+        Parameters
+        ----------
+        self : LazyMethod
+            A LazyMethod object
+        owner : type
+            The class that defines the method
+        name : str
+            Name of the method in the class
+        """
+        self.owner = owner
+
+    def resolve(self):
+        """Import the method and set it in the class
+
+        Parameters
+        ----------
+        self : LazyMethod
+            A LazyMethod object
+
+        Returns
+        -------
+        fct : function
+            The method
+        """
+        try:
+            fct = getattr(import_module(self.module_name), self.name)
+        except ImportError as error:
+            raise ImportError(
+                "Can't use "
+                + self.owner.__name__
+                + " method "
+                + self.name
+                + ": "
+                + str(error)
+            )
+        setattr(self.owner, self.name, fct)
+        return fct
+
+    def __get__(self, obj, objtype=None):
+        """Get the method (imported if needed)
+
+        Parameters
+        ----------
+        self : LazyMethod
+            A LazyMethod object
+        obj : FrozenClass
+            The object (None for the class)
+        objtype : type
+            The class of the object
+        """
+        if obj is None:
+            try:
+                return self.resolve()
+            except ImportError:
+                # The error is raised when the method is called
+                return self
+        return self.resolve().__get__(obj, objtype)
+
+    def __call__(self, *args, **kwargs):
+        """Call the method from the class (raise the ImportError if the
+        method dependencies are missing)
+
+        Parameters
+        ----------
+        self : LazyMethod
+            A LazyMethod object
+        """
+        return self.resolve()(*args, **kwargs)
+
+
+class LazyClassDict(dict):
+    """Dictionary of the generated classes by name: the class module is
+    imported when the class is first accessed
+    """
+
+    def __init__(self, name_list):
+        """Constructor of the class
+
+        Parameters
+        ----------
+        self : LazyClassDict
+            A LazyClassDict object
+        name_list : list
+            Name of the classes (in pyleecan.Classes)
+        """
+        dict.__init__(self, [(name, "pyleecan.Classes." + name) for name in name_list])
+
+    def __getitem__(self, name):
+        """Get a class (imported if needed)
+
+        Parameters
+        ----------
+        self : LazyClassDict
+            A LazyClassDict object
+        name : str
+            Name of the class
+
+        Returns
+        -------
+        cls : type
+            The class
+        """
+        cls = dict.__getitem__(self, name)
+        if isinstance(cls, str):
+            cls = getattr(import_module(cls), name)
+            dict.__setitem__(self, name, cls)
+        return cls
+
+    def get(self, name, default=None):
+        """Get a class (imported if needed) or default
+
+        Parameters
+        ----------
+        self : LazyClassDict
+            A LazyClassDict object
+        name : str
+            Name of the class
+        default : object
+            Value to return if name is not in the dictionary
+
+        Returns
+        -------
+        cls : type
+            The class
+        """
+        if name in self:
+            return self[name]
+        return default
+
+    def values(self):
+        """List of all the classes (all imported)
+
+        Parameters
+        ----------
+        self : LazyClassDict
+            A LazyClassDict object
+        """
+        return [self[name] for name in self]
+
+    def items(self):
+        """List of (name, class) for all the classes (all imported)
+
+        Parameters
+        ----------
+        self : LazyClassDict
+            A LazyClassDict object
+        """
+        return [(name, self[name]) for name in self]
+
+
+class LazySurfRep(Sequence):
+    """Surfaces made of Nrep copies of a pattern rotated by angle (one slot of
+    a lamination for instance): only the pattern is stored and the copies are
+    created when they are accessed. The labels of the pattern can contain "{}"
+    that is replaced by the index of the copy.
+    """
+
+    def __init__(self, pattern, Nrep, angle):
+        """Constructor of the class
+
+        Parameters
+        ----------
+        self : LazySurfRep
+            A LazySurfRep object
+        pattern : SurfArray
+            Surfaces of the first copy
+        Nrep : int
+            Number of copies
+        angle : float
+            Angle between two copies [rad]
+        """
+        self.pattern = pattern
+        self.Nrep = Nrep
+        self.angle = angle
+
+    def __len__(self):
+        """Number of surfaces (all the copies)
+
+        Parameters
+        ----------
+        self : LazySurfRep
+            A LazySurfRep object
+        """
+        return self.Nrep * len(self.pattern.label)
+
+    def __getitem__(self, index):
+        """Get a surface (the copy of the surface is created)
+
+        Parameters
+        ----------
+        self : LazySurfRep
+            A LazySurfRep object
+        index : int or slice
+            Index of the surface(s) (ordered by copy)
+
+        Returns
+        -------
+        surf : SurfLine
+            The surface (list for a slice)
+        """
+        if isinstance(index, slice):
+            return [self[ii] for ii in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("LazySurfRep index out of range")
+        ii, jj = divmod(index, len(self.pattern.label))
+        return self.get_copy(ii)[jj]
+
+    def __iter__(self):
+        """Iterate on the surfaces (one copy created at a time)
+
+        Parameters
+        ----------
+        self : LazySurfRep
+            A LazySurfRep object
+        """
+        for ii in range(self.Nrep):
+            for surf in self.get_copy(ii):
+                yield surf
+
+    def get_label(self, ii):
+        """Return the labels of the surfaces of a copy
+
+        Parameters
+        ----------
+        self : LazySurfRep
+            A LazySurfRep object
+        ii : int
+            Index of the copy
+
+        Returns
+        -------
+        label_list : list
+            Label of each surface of the copy
+        """
+        return [
+            None if label is None else label.format(ii) for label in self.pattern.label
+        ]
+
+    def get_copy(self, ii):
+        """Create the surfaces of a copy
+
+        Parameters
+        ----------
+        self : LazySurfRep
+            A LazySurfRep object
+        ii : int
+            Index of the copy
+
+        Returns
+        -------
+        surf_list : list
+            The surfaces of the copy
+        """
+        surf_array = self.pattern.duplicate(1, 0)
+        surf_array.rotate(ii * self.angle)
+        surf_array.label = self.get_label(ii)
+        return surf_array.get_surf_list()
+
+    def get_surf_list(self):
+        """Create the surfaces of all the copies (at once)
+
+        Parameters
+        ----------
+        self : LazySurfRep
+            A LazySurfRep object
+
+        Returns
+        -------
+        surf_list : list
+            The surfaces (ordered by copy)
+        """
+        surf_array = self.pattern.duplicate(self.Nrep, self.angle)
+        surf_array.label = [
+            label for ii in range(self.Nrep) for label in self.get_label(ii)
+        ]
+        return surf_array.get_surf_list()
+
+    def discretize(self, nb_point=200):
+        """Discretize all the surfaces without creating them (the pattern is
+        discretized once and rotated)
+
+        Parameters
+        ----------
+        self : LazySurfRep
+            A LazySurfRep object
+        nb_point : int
+            Number of points on each line (in addition to begin and end)
+
+        Returns
+        -------
+        point_list : list
+            List of the complex coordinates of each surface (ordered by copy)
+        """
+        pattern_point = self.pattern.discretize(nb_point)
+        return [
+            point * exp(1j * ii * self.angle)
+            for ii in range(self.Nrep)
+            for point in pattern_point
+        ]
@@ -4,7 +4,6 @@
 @author franco_i
 @todo "Radial" magnetization for HoleMx-Class
 """
-import femm
 from numpy import angle, pi, floor_divide
 from pyleecan.Classes.HoleM50 import HoleM50
 from pyleecan.Classes.HoleM51 import HoleM51
@@ -13,10 +12,12 @@ from pyleecan.Classes.HoleM53 import HoleM53
 from pyleecan.Methods import NotImplementedYetError
 
 
-def assign_FEMM_surface(surf, prop, mesh_dict, rotor, stator):
+def assign_FEMM_surface(femm, surf, prop, mesh_dict, rotor, stator):
     """Assign the property given in parameter to surface having the label given
     Parameters
     ----------
+    femm : _FEMMHandler
+        Solver backend (client to send the commands to FEMM)
     surf : Surface
         the surface to assign
     prop : str
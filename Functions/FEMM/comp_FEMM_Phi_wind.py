@@ -1,12 +1,15 @@
 from numpy import zeros
-from femm import mo_getcircuitproperties
 
 
-def comp_FEMM_Phi_wind(qs, Npcpp, is_stator, Lfemm, L1, sym, is_rescale_flux=True):
+def comp_FEMM_Phi_wind(
+    femm, qs, Npcpp, is_stator, Lfemm, L1, sym, is_rescale_flux=True
+):
     """Compute the total fluxlinkage of the winding phases
 
     Parameters
     ----------
+    femm : _FEMMHandler
+        Solver backend (client to send the commands to FEMM)
     qs : int 
         number of phases
     Npcpp : int
@@ -37,7 +40,7 @@ def comp_FEMM_Phi_wind(qs, Npcpp, is_stator, Lfemm, L1, sym, is_rescale_flux=Tru
 
     # For each phase/circuit
     for q in range(qs):
-        PropCirc = mo_getcircuitproperties(label + str(q))
+        PropCirc = femm.mo_getcircuitproperties(label + str(q))
         # rescaling to account for end winding flux
         if is_rescale_flux:
             Kphi = L1 / Lfemm
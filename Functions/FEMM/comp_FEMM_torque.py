@@ -1,14 +1,25 @@
-from femm import mo_seteditmode, mo_groupselectblock, mo_blockintegral
+def comp_FEMM_torque(femm, FEMM_dict, sym=1):
+    """Compute the torque of the current FEMM simulation result
 
+    Parameters
+    ----------
+    femm : _FEMMHandler
+        Solver backend (client to send the commands to FEMM)
+    FEMM_dict : dict
+        Dictionnary containing the main parameters of FEMM
+    sym : int
+        symmetry factor (ie. 1 = full machine, 2 = half machine ...)
 
-def comp_FEMM_torque(FEMM_dict, sym=1):
-    """Compute the torque of the current FEMM simulation result
+    Returns
+    -------
+    Tem : float
+        Electromagnetic torque [N.m]
     """
 
     # Select rotor groups
-    mo_seteditmode("area")
-    mo_groupselectblock(FEMM_dict["groups"]["GROUP_RC"])
-    mo_groupselectblock(FEMM_dict["groups"]["GROUP_RH"])
-    mo_groupselectblock(FEMM_dict["groups"]["GROUP_RW"])
+    femm.mo_seteditmode("area")
+    femm.mo_groupselectblock(FEMM_dict["groups"]["GROUP_RC"])
+    femm.mo_groupselectblock(FEMM_dict["groups"]["GROUP_RH"])
+    femm.mo_groupselectblock(FEMM_dict["groups"]["GROUP_RW"])
     # sym = 2 => Only half the machine
-    return sym * mo_blockintegral(22)
+    return sym * femm.mo_blockintegral(22)
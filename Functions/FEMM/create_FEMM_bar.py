@@ -4,14 +4,14 @@
 @author franco_i
 """
 
-import femm
 
-
-def create_FEMM_bar(is_mmfr, rho, materials):
+def create_FEMM_bar(femm, is_mmfr, rho, materials):
     """Create the property for LamSquirrel cage on the rotor
 
     Parameters
     ----------
+    femm : _FEMMHandler
+        Solver backend (client to send the commands to FEMM)
     is_mmfr : bool
         1 to compute the rotor magnetomotive force / rotor magnetic field
     rho : float
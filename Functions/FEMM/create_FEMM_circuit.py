@@ -4,15 +4,16 @@
 @author franco_i
 """
 
-import femm
 from numpy import linalg as LA, pi, sign, sqrt
 
 
-def create_FEMM_circuit(label, is_eddies, lam, I, is_mmf, j_t0, materials):
+def create_FEMM_circuit(femm, label, is_eddies, lam, I, is_mmf, j_t0, materials):
     """Set in FEMM circuits property
     
     Parameters
     ----------
+    femm : _FEMMHandler
+        Solver backend (client to send the commands to FEMM)
     label :
         label of the surface
     sym :
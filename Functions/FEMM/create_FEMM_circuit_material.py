@@ -4,7 +4,6 @@
 @author franco_i
 """
 
-import femm
 from numpy import linalg as LA, pi, sign, sqrt
 
 from pyleecan.Functions.FEMM.comp_FEMM_Jcus import comp_FEMM_Jcus
@@ -14,12 +13,14 @@ from pyleecan.Functions.FEMM.set_FEMM_wind_material import set_FEMM_wind_materia
 
 
 def create_FEMM_circuit_material(
-    circuits, label, is_eddies, lam, I, is_mmf, j_t0, materials
+    femm, circuits, label, is_eddies, lam, I, is_mmf, j_t0, materials
 ):
     """Set in FEMM circuits property
     
     Parameters
     ----------
+    femm : _FEMMHandler
+        Solver backend (client to send the commands to FEMM)
     circuits: list
         list the name of all circuits
     label : str
@@ -67,7 +68,7 @@ def create_FEMM_circuit_material(
         Clabel = "Circr" + str(q_id)
     else:
         Clabel = "Circs" + str(q_id)
-    circuits = set_FEMM_circuit_prop(circuits, Clabel, I, is_mmf, Npcpp, j_t0)
+    circuits = set_FEMM_circuit_prop(femm, circuits, Clabel, I, is_mmf, Npcpp, j_t0)
 
     # definition of armature field current sources
     if "Rotor" in label:
@@ -82,7 +83,7 @@ def create_FEMM_circuit_material(
     # adding new current source material if necessary
     Jcus = comp_FEMM_Jcus(lam, cname, I, j_t0, is_mmf)
     materials = set_FEMM_wind_material(
-        materials, cname, Jcus, is_eddies * 1e-6 / rho, sqrt(4 * Swire / pi)
+        femm, materials, cname, Jcus, is_eddies * 1e-6 / rho, sqrt(4 * Swire / pi)
     )
 
     return cname, materials, circuits
@@ -0,0 +1,31 @@
+from os.path import join
+
+from pyleecan.Generator import MAIN_DIR
+
+
+def create_FEMM_lua(script_name, path_lua, replace_dict):
+    """Create a Lua script for FEMM from a template of Functions/FEMM
+
+    Parameters
+    ----------
+    script_name : str
+        Name of the Lua template (ex: "get_mesh_data_FEMM.lua")
+    path_lua : str
+        Path of the Lua script to create
+    replace_dict : dict
+        Values to set in the template {"my_key": value}
+
+    Returns
+    -------
+    path_lua : str
+        Path of the Lua script with "/" separators (to call it with dofile)
+    """
+
+    with open(join(MAIN_DIR, "Functions", "FEMM", script_name), "r") as file_lua:
+        text_lua = file_lua.read()
+    for key, value in replace_dict.items():
+        text_lua = text_lua.replace(key, value)
+    with open(path_lua, "w") as file_lua:
+        file_lua.write(text_lua)
+
+    return path_lua.replace("\\", "/")
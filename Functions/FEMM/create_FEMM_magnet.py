@@ -5,15 +5,16 @@
 @TODO: it would be better to have the magnets as input instead of the lamination
 @TODO: decision about the magnet renaming, removed at the moment
 """
-import femm
 from re import findall
 
 
-def create_FEMM_magnet(label, is_mmf, is_eddies, materials, lam):
+def create_FEMM_magnet(femm, label, is_mmf, is_eddies, materials, lam):
     """Set the material of the magnet in FEMM
 
     Parameters
     ----------
+    femm : _FEMMHandler
+        Solver backend (client to send the commands to FEMM)
     label : str
         label of the magnet
     is_mmfr : bool
@@ -5,7 +5,6 @@
 @todo: why is the label "Lamination_Stator_Bore" and not "Lamination_Stator"
 """
 
-import femm
 from numpy import exp, pi
 
 from pyleecan.Functions.FEMM import GROUP_FM
@@ -17,6 +16,7 @@ from pyleecan.Functions.FEMM.create_FEMM_magnet import create_FEMM_magnet
 
 
 def create_FEMM_materials(
+    femm,
     machine,
     surf_list,
     Is,
@@ -34,6 +34,8 @@ def create_FEMM_materials(
 
     Parameters
     ----------
+    femm : _FEMMHandler
+        Solver backend (client to send the commands to FEMM)
     machine : Machine
         the machine to simulate
     surf_list : list
@@ -121,27 +123,27 @@ def create_FEMM_materials(
             prop_dict[label] = "Air"
         elif "BarR" in label:  # Squirrel cage
             prop, materials = create_FEMM_bar(
-                is_mmfr, rotor.mat_type.elec.rho, materials
+                femm, is_mmfr, rotor.mat_type.elec.rho, materials
             )
             prop_dict[label] = prop
         elif "WindR" in label:  # Rotor Winding
             prop, materials, circuits = create_FEMM_circuit_material(
-                circuits, label, is_eddies, rotor, Ir, is_mmfr, j_t0, materials
+                femm, circuits, label, is_eddies, rotor, Ir, is_mmfr, j_t0, materials
             )
             prop_dict[label] = prop
         elif "WindS" in label:  # Stator Winding
             prop, materials, circuits = create_FEMM_circuit_material(
-                circuits, label, is_eddies, stator, Is, is_mmfs, j_t0, materials
+                femm, circuits, label, is_eddies, stator, Is, is_mmfs, j_t0, materials
             )
             prop_dict[label] = prop
         elif "Magnet" in label and "Rotor" in label:  # Rotor Magnet
             prop, materials = create_FEMM_magnet(
-                label, is_mmfr, is_eddies, materials, rotor
+                femm, label, is_mmfr, is_eddies, materials, rotor
             )
             prop_dict[label] = prop
         elif "Magnet" in label and "Stator" in label:  # Stator Magnet
             prop, materials = create_FEMM_magnet(
-                label, is_mmfs, is_eddies, materials, stator
+                femm, label, is_mmfs, is_eddies, materials, stator
             )
             prop_dict[label] = prop
         elif "No_mesh" in label:  # Sliding band
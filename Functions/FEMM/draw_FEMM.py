@@ -4,7 +4,6 @@
 @author franco_i
 """
 
-import femm
 from pyleecan.Classes.Lamination import Lamination
 from pyleecan.Functions.FEMM import (
     hidebc,
@@ -26,6 +25,7 @@ from pyleecan.Functions.FEMM.get_airgap_surface import get_airgap_surface
 
 
 def draw_FEMM(
+    femm,
     output,
     is_mmfr,
     is_mmfs,
@@ -48,6 +48,8 @@ def draw_FEMM(
     
     Parameters
     ----------
+    femm : _FEMMHandler
+        Solver backend (client to send the commands to FEMM)
     output : Output
         Output object
     is_mmfr : bool
@@ -95,7 +97,7 @@ def draw_FEMM(
     machine = output.simu.machine
 
     # Modifiy the machine to match the conditions
-    machine = type(machine)(init_dict=machine.as_dict())
+    machine = machine.copy()
     if is_remove_slotR:  # Remove all slots on the rotor
         lam_dict = machine.rotor.as_dict()
         machine.rotor = Lamination(init_dict=lam_dict)
@@ -161,6 +163,7 @@ def draw_FEMM(
 
     # Creation of all the materials and circuit in FEMM
     prop_dict, materials, circuits = create_FEMM_materials(
+        femm,
         machine,
         surf_list,
         Is,
@@ -174,7 +177,7 @@ def draw_FEMM(
         is_eddies,
         j_t0=0,
     )
-    create_FEMM_boundary_conditions(sym=sym, is_antiper=is_antiper)
+    create_FEMM_boundary_conditions(femm=femm, sym=sym, is_antiper=is_antiper)
 
     # Draw and assign all the surfaces of the machine
     for surf in surf_list:
@@ -182,6 +185,7 @@ def draw_FEMM(
         # Get the correct element size and group according to the label
         mesh_dict = get_mesh_param(label, FEMM_dict)
         surf.draw_FEMM(
+            femm=femm,
             nodeprop="None",
             maxseg=FEMM_dict["arcspan"],  # max span of arc element in degrees
             propname="None",
@@ -191,7 +195,7 @@ def draw_FEMM(
             group=mesh_dict["group"],
         )
         assign_FEMM_surface(
-            surf, prop_dict[label], mesh_dict, machine.rotor, machine.stator
+            femm, surf, prop_dict[label], mesh_dict, machine.rotor, machine.stator
         )
 
     femm.mi_zoomnatural()  # Zoom out
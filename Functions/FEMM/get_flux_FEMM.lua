@@ -0,0 +1,16 @@
+path_in = "my_path_in" ;
+path_out = "my_path_out" ;
+
+fp_in = openfile(path_in, "r")
+fp_out = openfile(path_out, "w")
+
+x = read(fp_in, "*n")
+while x do
+	y = read(fp_in, "*n")
+	bx, by = mo_getb(x, y);
+	write(fp_out, bx, " ", by, "\n");
+	x = read(fp_in, "*n")
+end
+
+closefile(fp_in);
+closefile(fp_out);
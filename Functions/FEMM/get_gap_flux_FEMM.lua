@@ -0,0 +1,15 @@
+path_in = "my_path_in" ;
+path_out = "my_path_out" ;
+
+fp_in = openfile(path_in, "r")
+fp_out = openfile(path_out, "w")
+
+angle = read(fp_in, "*n")
+while angle do
+	br, bt = mo_getgapb("my_bc_name", angle);
+	write(fp_out, br, " ", bt, "\n");
+	angle = read(fp_in, "*n")
+end
+
+closefile(fp_in);
+closefile(fp_out);
@@ -1,28 +1,82 @@
 path_txt = "my_path_txt" ;
 idworker = my_id_worker ;
+is_get_mesh = my_is_get_mesh ;
 
-mo_smooth("off"); 
+-- Binary records (little-endian): int32 and IEEE 754 float64
+function write_int32(fp, n)
+	if n < 0 then
+		n = n + 4294967296
+	end
+	local b1 = mod(n, 256)
+	n = floor(n / 256)
+	local b2 = mod(n, 256)
+	n = floor(n / 256)
+	local b3 = mod(n, 256)
+	write(fp, strchar(b1, b2, b3, floor(n / 256)))
+end
+
+function write_float64(fp, x)
+	local sign = 0
+	if x < 0 then
+		sign = 128
+		x = -x
+	end
+	local expo = 0
+	local mant = 0
+	if x > 0 then
+		local m, e = frexp(x)
+		expo = e + 1022
+		if expo < 1 then
+			-- Subnormal number
+			mant = ldexp(x, 1074)
+			expo = 0
+		else
+			mant = ldexp(2 * m - 1, 52)
+		end
+	end
+	local b = {}
+	for i = 1, 6 do
+		b[i] = mod(mant, 256)
+		mant = floor(mant / 256)
+	end
+	write(fp, strchar(b[1], b[2], b[3], b[4], b[5], b[6], mod(expo, 16) * 16 + mant, sign + floor(expo / 16)))
+end
+
+mo_smooth("off");
 nelm=mo_numelements();
 nnod=mo_numnodes();
 
-fp1=openfile(path_txt .. "nodes" .. tostring(idworker) .. ".txt","w")
-
-for k=1,nnod do
-    x,y=mo_getnode(k);	
-    write(fp1,x," ",y,"\n");
+if is_get_mesh == 1 then
+	fp1=openfile(path_txt .. "nodes" .. tostring(idworker) .. ".bin","wb")
+	for k=1,nnod do
+		x,y=mo_getnode(k);
+		write_float64(fp1, x);
+		write_float64(fp1, y);
+	end
+	closefile(fp1);
+	fp2=openfile(path_txt .. "elements" .. tostring(idworker) .. ".bin","wb")
 end
 
-closefile(fp1);
-
-fp2=openfile(path_txt .. "elements" .. tostring(idworker) .. ".txt","w")
-fp3=openfile(path_txt .. "results" .. tostring(idworker) .. ".txt","w")
+fp3=openfile(path_txt .. "results" .. tostring(idworker) .. ".bin","wb")
 
 for k=1,nelm do
 	p1,p2,p3,cx,cy,s,grp=mo_getelement(k);
-	a,bx,by,o,nrg,hx,hy,Je,Js,mux,muy=mo_getpointvalues(cx,cy);	
-	write(fp2,p1," ",p2," ",p3," ",cx," ",cy," ",s," ",grp,"\n");
-	write(fp3,bx," ",by," ",hx," ",hy," ",mux," ", a,"\n");
+	a,bx,by,o,nrg,hx,hy,Je,Js,mux,muy=mo_getpointvalues(cx,cy);
+	if is_get_mesh == 1 then
+		write_int32(fp2, p1);
+		write_int32(fp2, p2);
+		write_int32(fp2, p3);
+		write_int32(fp2, grp);
+	end
+	write_float64(fp3, bx);
+	write_float64(fp3, by);
+	write_float64(fp3, hx);
+	write_float64(fp3, hy);
+	write_float64(fp3, mux);
+	write_float64(fp3, a);
 end
 
-closefile(fp2);
+if is_get_mesh == 1 then
+	closefile(fp2);
+end
 closefile(fp3);
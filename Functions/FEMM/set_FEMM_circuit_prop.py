@@ -1,13 +1,14 @@
 # -*- coding: utf-8 -*-
-import femm
 from numpy import linalg as LA
 
 
-def set_FEMM_circuit_prop(circuits, Clabel, I, is_mmf, Npcpp, j_t0):
+def set_FEMM_circuit_prop(femm, circuits, Clabel, I, is_mmf, Npcpp, j_t0):
     """Create or update the property of a circuit
 
     Parameters
     ----------
+    femm : _FEMMHandler
+        Solver backend (client to send the commands to FEMM)
     circuits: list
         list the name of all circuits
     label: str
@@ -30,7 +31,6 @@ def set_FEMM_circuit_prop(circuits, Clabel, I, is_mmf, Npcpp, j_t0):
         list the name of the circuits in FEMM
 
     """
-
     q_id = int(Clabel[5:])
     if Clabel in circuits:
         if I.size != 0 and LA.norm(I) != 0:
@@ -1,11 +1,10 @@
-import femm
-
-
-def set_FEMM_wind_material(materials, cname, Jcus, Cduct=None, dwire=None):
+def set_FEMM_wind_material(femm, materials, cname, Jcus, Cduct=None, dwire=None):
     """Create or update the property of a winding material
 
     Parameters
     ----------
+    femm : _FEMMHandler
+        Solver backend (client to send the commands to FEMM)
     materials: list
         list the name of all materials
     cname: str
@@ -3,7 +3,6 @@
 @date Created on août 22 16:55 2018
 @author franco_i
 """
-import femm
 from numpy import pi
 
 from pyleecan.Functions.FEMM.comp_FEMM_Jcus import comp_FEMM_Jcus
@@ -12,7 +11,7 @@ from pyleecan.Functions.FEMM.set_FEMM_wind_material import set_FEMM_wind_materia
 
 
 def update_FEMM_simulation(
-    output, materials, circuits, is_mmfs, is_mmfr, j_t0, is_sliding_band
+    femm, output, materials, circuits, is_mmfs, is_mmfr, j_t0, is_sliding_band
 ):
     """Update the simulation by changing the rotor position and
     updating the currents
@@ -20,6 +19,8 @@ def update_FEMM_simulation(
     
     Parameters
     ----------
+    femm : _FEMMHandler
+        Solver backend (client to send the commands to FEMM)
     output :
         Output object
     """
@@ -36,6 +37,7 @@ def update_FEMM_simulation(
         for label in circuits:
             if "Circs" in label:  # Stator
                 set_FEMM_circuit_prop(
+                    femm,
                     circuits,
                     label,
                     output.elec.Is,
@@ -45,6 +47,7 @@ def update_FEMM_simulation(
                 )
             if "Circr" in label:  # Rotor
                 set_FEMM_circuit_prop(
+                    femm,
                     circuits,
                     label,
                     output.elec.Ir,
@@ -58,9 +61,9 @@ def update_FEMM_simulation(
                 Jcus = comp_FEMM_Jcus(
                     output.simu.machine.stator, mat, output.elec.Is, j_t0, is_mmfs
                 )
-                materials = set_FEMM_wind_material(materials, mat, Jcus)
+                materials = set_FEMM_wind_material(femm, materials, mat, Jcus)
             elif "Jr" in mat:  # Rotor winding
                 Jcus = comp_FEMM_Jcus(
                     output.simu.machine.rotor, mat, output.elec.Ir, j_t0, is_mmfr
                 )
-                materials = set_FEMM_wind_material(materials, mat, Jcus)
+                materials = set_FEMM_wind_material(femm, materials, mat, Jcus)
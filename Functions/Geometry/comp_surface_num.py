@@ -6,11 +6,12 @@ Computation of the surface of a Polygon function
 @author pierre_b
 """
 
-from numpy import array
+from numpy import array, roll, sum as np_sum
 
 
 def comp_surface_num(point_list):
-    """Compute the surface of the Polygon defined by the points
+    """Compute the surface of the Polygon defined by the points (shoelace
+    formula, the polygon is closed between the last and first points)
 
     Parameters
     ----------
@@ -24,22 +25,11 @@ def comp_surface_num(point_list):
 
     """
 
-    # We have to be sure that the surface is closed
-    # (ie point_list[0]=point_list[end]) If it's already the case Xi+1 - Xi =0
-    point_list.append(point_list[0])
+    point_array = array(point_list, dtype=complex)
 
-    point_array = array(point_list)
-
-    # We translate the points so every point have imag >=0
-    min_imag = min(point_array.imag)
-    if min_imag < 0:
-        point_array += abs(min_imag) * 1j
-
-    S_acc = 0
-    for ii in range(point_array.size - 1):
-        Var_X = point_array[ii + 1].real - point_array[ii].real
-        Var_Y = point_array[ii + 1].imag + point_array[ii].imag
-
-        S_acc += Var_Y * Var_X
+    # Sum of the cross products of the consecutive points
+    x = point_array.real
+    y = point_array.imag
+    S_acc = np_sum(x * roll(y, -1) - roll(x, -1) * y)
 
     return abs(S_acc / 2.0)
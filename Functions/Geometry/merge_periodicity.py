@@ -0,0 +1,44 @@
+from functools import reduce
+from math import gcd
+
+
+def merge_periodicity(per_list):
+    """Merge the angular periodicities of several parts of a machine into the
+    largest periodicity valid for all of them
+
+    Parameters
+    ----------
+    per_list : list
+        list of tuple (per_a, is_antiper_a) with per_a the number of periods
+        of the part (0 for an axisymmetric part) and is_antiper_a True if its
+        sources change sign on half a period (None for a part without source
+        such as slots, notches or ventilations)
+
+    Returns
+    -------
+    per_a : int
+        Number of periods of the merged parts (0 if they are all axisymmetric)
+    is_antiper_a : bool
+        True if the sources are anti-periodic on half a period (None if none
+        of the parts has a source)
+    """
+    # Number of (anti-)periods of each part
+    Nper_list = [2 * per if is_antiper else per for per, is_antiper in per_list]
+    Nper = reduce(gcd, Nper_list, 0)
+    if Nper == 0:
+        return 0, None
+
+    # Check if the sources change sign when rotated by 2*pi/Nper
+    is_sign_set = set(
+        bool(is_antiper) and (Nper_ii // Nper) % 2 == 1
+        for (per, is_antiper), Nper_ii in zip(per_list, Nper_list)
+        if is_antiper is not None
+    )
+    if len(is_sign_set) == 0:  # Geometry only
+        return Nper, None
+    elif is_sign_set == {True}:  # Anti-periodic on 2*pi/Nper
+        return Nper // 2, True
+    elif is_sign_set == {False}:  # Periodic on 2*pi/Nper
+        return Nper, False
+    else:  # Only periodic on 2*2*pi/Nper
+        return Nper // 2, False
@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+
+from numpy import asarray, empty, result_type
+
+
+def append_rows(obj, prop_name, rows):
+    """Append rows to an array property of a pyleecan object. The property is
+    a view on a larger buffer (stored in the cache of the object) whose size is
+    doubled when it is full, so that adding N rows one by one costs O(N).
+
+    Parameters
+    ----------
+    obj : FrozenClass
+        a pyleecan object (NodeMat, ElementMat...)
+    prop_name : str
+        name of the ndarray property to extend (coordinate, connectivity, tag...)
+    rows : numpy.ndarray
+        rows to append (first dimension)
+    """
+
+    rows = asarray(rows)
+    value = getattr(obj, prop_name)
+    if obj._cache is None:
+        obj._cache = dict()
+    buffer = obj._cache.get("buffer_" + prop_name)
+
+    # The buffer can be used only if the property is still a view on it (the
+    # property may have been set to another array)
+    is_valid = (
+        buffer is not None
+        and value is not None
+        and value.base is buffer
+        and buffer.shape[1:] == rows.shape[1:]
+        and buffer.dtype == result_type(buffer, rows)
+    )
+    if value is None or value.size == 0:
+        nb_row = 0
+    else:
+        value = value.reshape((-1,) + rows.shape[1:])
+        nb_row = value.shape[0]
+
+    nb_new = nb_row + rows.shape[0]
+    if not is_valid or nb_new > buffer.shape[0]:
+        # New buffer (twice the needed size)
+        if nb_row == 0:
+            dtype = rows.dtype
+        else:
+            dtype = result_type(value, rows)
+        buffer = empty((max(2 * nb_new, 16),) + rows.shape[1:], dtype=dtype)
+        if nb_row > 0:
+            buffer[:nb_row] = value
+        obj._cache["buffer_" + prop_name] = buffer
+    buffer[nb_row:nb_new] = rows
+    setattr(obj, prop_name, buffer[:nb_new])
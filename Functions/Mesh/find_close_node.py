@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+
+from itertools import product
+
+import numpy as np
+
+# Factors to hash the cell coordinates (a hash collision only adds candidates)
+HASH_FACTOR = np.array([73856093, 19349663, 83492791], dtype=np.int64)
+
+
+def comp_grid_key(coord, delta, shift=None):
+    """Compute the hash of the cells of a uniform grid (cell size delta)
+    containing the points
+
+    Parameters
+    ----------
+    coord : numpy.ndarray
+        coordinates of the points (one point per row)
+    delta : float
+        size of the cells
+    shift : tuple
+        shift of the cells (to get the key of a neighbor cell)
+
+    Returns
+    -------
+    key : numpy.ndarray
+        hash of the cell of each point
+    """
+    cell = np.floor(coord / delta).astype(np.int64)
+    if shift is not None:
+        cell += np.array(shift, dtype=np.int64)
+    return np.bitwise_xor.reduce(cell * HASH_FACTOR[: coord.shape[1]], axis=1)
+
+
+def comp_grid(coord, delta):
+    """Compute the spatial hash of a set of points: the points sorted by the
+    hash of their cell in a uniform grid of cell size delta
+
+    Parameters
+    ----------
+    coord : numpy.ndarray
+        coordinates of the points (one point per row)
+    delta : float
+        size of the cells
+
+    Returns
+    -------
+    grid : tuple
+        (key_sorted, order) sorted cell hash and corresponding point index
+    """
+    key = comp_grid_key(coord, delta)
+    order = np.argsort(key, kind="stable")
+    return key[order], order
+
+
+def find_close_node(coord_ref, coord, delta, grid=None):
+    """Find for each point of coord the first point of coord_ref closer than
+    delta. The points closer than delta are in the neighbor cells of the
+    spatial hash, so each point only checks a few candidates.
+
+    Parameters
+    ----------
+    coord_ref : numpy.ndarray
+        coordinates of the reference points (one point per row)
+    coord : numpy.ndarray
+        coordinates of the points to look for (one point per row)
+    delta : float
+        distance tolerance
+    grid : tuple
+        spatial hash of coord_ref (computed with comp_grid if None)
+
+    Returns
+    -------
+    index : numpy.ndarray
+        smallest index of the points of coord_ref closer than delta to each
+        point of coord (-1 if there is none)
+    """
+    if grid is None:
+        grid = comp_grid(coord_ref, delta)
+    key_sorted, order = grid
+
+    index = np.full(coord.shape[0], -1, dtype=int)
+    for shift in product((-1, 0, 1), repeat=coord.shape[1]):
+        key = comp_grid_key(coord, delta, shift)
+        # Sorted queries are much faster to search (memory locality)
+        key_order = np.argsort(key)
+        start = np.empty(key.size, dtype=int)
+        end = np.empty(key.size, dtype=int)
+        start[key_order] = np.searchsorted(key_sorted, key[key_order], side="left")
+        end[key_order] = np.searchsorted(key_sorted, key[key_order], side="right")
+        # Check the candidates of the cell one after the other (usually one)
+        for ii in range(int(np.max(end - start, initial=0))):
+            cand_id = np.flatnonzero(start + ii < end)
+            ref_id = order[start[cand_id] + ii]
+            dist = np.linalg.norm(coord_ref[ref_id] - coord[cand_id], axis=1)
+            cand_id, ref_id = cand_id[dist <= delta], ref_id[dist <= delta]
+            is_first = (index[cand_id] == -1) | (ref_id < index[cand_id])
+            index[cand_id[is_first]] = ref_id[is_first]
+    return index
@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+
+from numpy import abs as np_abs, arange, sum as np_sum
+from numpy.fft import fft
+
+
+def comp_wind_factor(wind_mat, p, Nharm):
+    """Compute the winding factor of all the phases for the harmonic ranks 1
+    to Nharm (electrical). The slots are regularly distributed so the factors
+    of all the ranks come from the FFT of the winding along the slots.
+
+    Parameters
+    ----------
+    wind_mat : numpy.ndarray
+        Winding Matrix (Nlay_rad, Nlay_tan, Zs, qs)
+    p : int
+        Number of pole pairs
+    Nharm : int
+        Highest harmonic rank to compute
+
+    Returns
+    -------
+    xi : numpy.ndarray
+        Winding factor of each phase and rank (qs, Nharm)
+    """
+    assert len(wind_mat.shape) == 4, "dim 4 expected for wind_mat"
+
+    Zs = wind_mat.shape[2]
+    # Summing on all the layers
+    wind_fft = fft(np_sum(wind_mat, axis=(0, 1)), axis=0)  # (Zs, qs)
+    wind_ref = np_sum(np_abs(wind_mat), axis=(0, 1, 2))  # (qs,)
+
+    # The rank h of the electrical angle is the rank h*p of the slot angle
+    rank = (arange(1, Nharm + 1) * p) % Zs
+    return np_abs(wind_fft[rank, :]).T / wind_ref[:, None]
@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+
+from numpy import arange, pi, sum as np_sum
+from numpy.fft import fft
+
+
+def comp_wind_mmf(wind_mat, Nharm, I=None):
+    """Compute the spatial spectrum of the magnetomotive force of the winding
+    for the mechanical orders 1 to Nharm. The conductors of each slot are
+    concentrated at the slot position (the slot k is at the angle 2*pi*k/Zs)
+    so that the spectrum is computed exactly from the FFT of the winding.
+
+    Parameters
+    ----------
+    wind_mat : numpy.ndarray
+        Winding Matrix (Nlay_rad, Nlay_tan, Zs, qs)
+    Nharm : int
+        Highest mechanical order to compute
+    I : numpy.ndarray
+        Current of each phase (qs,) [A] (None to return the MMF of each phase
+        for a current of 1 A)
+
+    Returns
+    -------
+    mmf : numpy.ndarray
+        Complex amplitude of each order (qs, Nharm) for each phase or (Nharm,)
+        for the currents I [A]: mmf(theta) = sum(real(mmf[n-1]*exp(1j*n*theta)))
+    """
+    assert len(wind_mat.shape) == 4, "dim 4 expected for wind_mat"
+
+    Zs = wind_mat.shape[2]
+    # Summing on all the layers
+    wind_fft = fft(np_sum(wind_mat, axis=(0, 1)), axis=0)  # (Zs, qs)
+
+    # The MMF is the integral of the conductor distribution (Dirac comb), the
+    # spectrum of the distribution is periodic of period Zs
+    order = arange(1, Nharm + 1)
+    mmf = wind_fft[order % Zs, :].T / (1j * pi * order)
+    if I is not None:
+        mmf = I.dot(mmf)
+    return mmf
@@ -5,12 +5,34 @@
 @author pierre_b
 """
 
-from json import load as jload
-from os.path import isfile, isdir, join
-from os import walk
+from concurrent.futures import ProcessPoolExecutor
+from gzip import open as gzip_open
+from json import dump, load as jload, loads
+from logging import getLogger
+from multiprocessing import cpu_count
+from os.path import basename, isfile, isdir, join, relpath
+from os import replace, stat, walk
 from re import match
+from struct import unpack
+from zipfile import ZipFile, ZIP_STORED
+
+from numpy import memmap
+from numpy.lib.format import (
+    read_magic,
+    read_array,
+    read_array_header_1_0,
+    read_array_header_2_0,
+)
+
 from pyleecan.Functions.load_switch import load_switch
+from pyleecan.Functions.save import BINARY_EXT, GZIP_EXT, SKELETON_NAME, ARRAY_KEY
 from pyleecan.Classes.Material import Material
+from pyleecan.Classes._lazy import LazyInit, LazyList
+
+# Name of the index file of a material library (cache of the parsed files)
+MATLIB_INDEX_NAME = ".matlib_index"
+# Minimum number of files to parse to use a process pool
+MATLIB_POOL_MIN = 64
 
 
 def load_json(file_path):
@@ -35,13 +57,134 @@ def load_json(file_path):
         raise LoadMissingFileError(str(file_path) + " doesn't exist")
 
     # Get the data dictionary
-    with open(file_path, "r") as load_file:
+    if file_path[-len(GZIP_EXT) :] == GZIP_EXT:
+        load_file = gzip_open(file_path, "rt")
+    else:
+        load_file = open(file_path, "r")
+    with load_file:
         json_data = jload(load_file)
 
     return json_data
 
 
-def init_data(obj):
+def load_binary(file_path):
+    """Load a binary container (cf save_binary): the json skeleton is decoded
+    and the arrays are memory-mapped (copy on write), so that they are read
+    from the disk only when they are used
+
+    Parameters
+    ----------
+    file_path: str
+        path to the file to load
+
+    Returns
+    -------
+    data: json decoded data type
+        data of the json skeleton with the arrays
+    """
+    # The file (and the folder) should exist
+    if not isfile(file_path):
+        raise LoadMissingFileError(str(file_path) + " doesn't exist")
+
+    with ZipFile(file_path, "r") as zip_file:
+        skeleton = loads(zip_file.read(SKELETON_NAME).decode("utf-8"))
+        array_dict = dict()
+        with open(file_path, "rb") as raw_file:
+            for info in zip_file.infolist():
+                if info.filename != SKELETON_NAME:
+                    array_dict[info.filename] = read_member_array(
+                        zip_file, raw_file, info
+                    )
+
+    return join_array(skeleton, array_dict)
+
+
+def read_member_array(zip_file, raw_file, info):
+    """Read an array of a binary container (memory-mapped if possible)
+
+    Parameters
+    ----------
+    zip_file: ZipFile
+        the binary container
+    raw_file: file
+        the binary container opened as a regular file
+    info: ZipInfo
+        information of the .npy member to read
+
+    Returns
+    -------
+    value: ndarray
+        the array (numpy.memmap if it is not compressed)
+    """
+    if info.compress_type == ZIP_STORED and info.file_size > 0:
+        # Start of the member data: after the local header (30 bytes) and its
+        # variable fields (file name and extra field)
+        raw_file.seek(info.header_offset + 26)
+        name_len, extra_len = unpack("<HH", raw_file.read(4))
+        raw_file.seek(info.header_offset + 30 + name_len + extra_len)
+        version = read_magic(raw_file)
+        if version == (1, 0):
+            shape, fortran_order, dtype = read_array_header_1_0(raw_file)
+        else:
+            shape, fortran_order, dtype = read_array_header_2_0(raw_file)
+        if not dtype.hasobject and 0 not in shape:
+            return memmap(
+                raw_file.name,
+                dtype=dtype,
+                mode="c",
+                offset=raw_file.tell(),
+                shape=shape,
+                order="F" if fortran_order else "C",
+            )
+    # Empty or compressed array: read from the zip file
+    with zip_file.open(info) as member_file:
+        return read_array(member_file, allow_pickle=False)
+
+
+def join_array(data, array_dict):
+    """Replace the references to the arrays of a binary container by the arrays
+
+    Parameters
+    ----------
+    data :
+        json decoded data of the skeleton
+    array_dict: dict
+        arrays of the container (key = member name)
+
+    Returns
+    -------
+    data :
+        data with the arrays
+    """
+    if isinstance(data, list):
+        return [join_array(elem, array_dict) for elem in data]
+    if isinstance(data, dict):
+        if ARRAY_KEY in data:
+            return array_dict[data[ARRAY_KEY]]
+        return {key: join_array(value, array_dict) for key, value in data.items()}
+    return data
+
+
+def load_data(file_path):
+    """Load the data of a json file or of a binary container (according to the
+    file extension)
+
+    Parameters
+    ----------
+    file_path: str
+        path to the file to load
+
+    Returns
+    -------
+    data: json decoded data type
+        data of the file
+    """
+    if file_path[-len(BINARY_EXT) :] == BINARY_EXT:
+        return load_binary(file_path)
+    return load_json(file_path)
+
+
+def init_data(obj, is_lazy=False):
     """ 
     Initialize pyleecan objects (by init_dict) within list and/or dict data structure.
     Non pyleecan, list or dict type data will be kept as they are.
@@ -50,6 +193,9 @@ def init_data(obj):
     ----------
     obj: object
         list/dict containing pyleecan init_dict data
+    is_lazy: bool
+        True to create only the first level of pyleecan objects (the nested
+        pyleecan objects are created when their parent's getter is called)
 
     Returns
     -------
@@ -60,7 +206,7 @@ def init_data(obj):
     if isinstance(obj, list):
         data = []
         for elem in obj:
-            data.append(init_data(elem))
+            data.append(init_data(elem, is_lazy))
         return data
     # --- dict type ---
     if isinstance(obj, dict):
@@ -69,12 +215,14 @@ def init_data(obj):
         if "__class__" in obj:
             # Check if data is a pyleecan class
             if obj["__class__"] in load_switch:
+                if is_lazy:
+                    obj = {key: lazy_data(value) for key, value in obj.items()}
                 return load_switch[obj["__class__"]](init_dict=obj)
 
         # --- 'normal' dict ---
         data = dict()
         for key in obj:
-            data[key] = init_data(obj[key])
+            data[key] = init_data(obj[key], is_lazy)
         return data
 
     # --- other type ---
@@ -83,15 +231,76 @@ def init_data(obj):
         return obj
 
 
-def load(file_path):
-    """Load a pyleecan object from a json file
+def init_lazy(obj):
+    """Initialize a pyleecan object in lazy mode (cf init_data)
+
+    Parameters
+    ----------
+    obj: dict
+        init_dict of the pyleecan object
+
+    Returns
+    -------
+    data: FrozenClass
+        the pyleecan object
+    """
+    return init_data(obj, is_lazy=True)
+
+
+def lazy_data(value):
+    """Replace the pyleecan objects of a property value (object, list or dict of
+    objects) by LazyInit objects
+
+    Parameters
+    ----------
+    value: object
+        value of a property in an init_dict
+
+    Returns
+    -------
+    value: object
+        value with the LazyInit objects
+    """
+    if is_pyleecan_dict(value):
+        return LazyInit(init_lazy, value)
+    elif isinstance(value, dict) and len(value) > 0:
+        # Dict of pyleecan objects (other dict are kept as they are)
+        if all(is_pyleecan_dict(val) or val is None for val in value.values()):
+            return {key: lazy_data(val) for key, val in value.items()}
+    elif isinstance(value, list) and len(value) > 0 and isinstance(value[0], dict):
+        # List of pyleecan objects (other lists are kept as they are)
+        if all(is_pyleecan_dict(val) or val is None for val in value):
+            return [lazy_data(val) for val in value]
+    return value
+
+
+def is_pyleecan_dict(value):
+    """Check if a value is the init_dict of a pyleecan object
+
+    Parameters
+    ----------
+    value: object
+        value to check
+
+    Returns
+    -------
+    is_pyleecan: bool
+        True if value is a dict with a pyleecan "__class__"
+    """
+    return isinstance(value, dict) and value.get("__class__") in load_switch
+
+
+def load(file_path, is_lazy=False):
+    """Load a pyleecan object from a json file (or a binary container)
 
     Parameters
     ----------
     file_path: str
         path to the file to load
+    is_lazy: bool
+        True to create the nested pyleecan objects only when they are used
     """
-    init_dict = load_json(file_path)
+    init_dict = load_data(file_path)
 
     # Check that loaded data are of type dict
     if not isinstance(init_dict, dict):
@@ -109,7 +318,7 @@ def load(file_path):
             init_dict["__class__"] + " is not a pyleecan class"
         )
 
-    return init_data(init_dict)
+    return init_data(init_dict, is_lazy)
 
 
 def _load(file_path, cls_type=None):
@@ -120,7 +329,7 @@ def _load(file_path, cls_type=None):
     file_path: str
         path to the file to load
     """
-    obj = load_json(file_path)
+    obj = load_data(file_path)
 
     # check the initial object's type if set
     if cls_type is not None:
@@ -148,13 +357,20 @@ def load_dict(file_path):
     return _load(file_path, "dict")
 
 
-def load_matlib(mat_path):
-    """Load all the Material json file from a folder and subfolder
+def load_matlib(mat_path, is_lazy=False, nb_worker=None):
+    """Load all the Material json file from a folder and subfolder.
+    The parsed files are cached in an index file (MATLIB_INDEX_NAME) of the
+    folder so that only the new or modified files (path, modification time and
+    size) are read again. The files to read are parsed in parallel.
 
     Parameters
     ----------
     mat_path: str
         path to the file to load
+    is_lazy: bool
+        True to create the materials only when they are accessed (LazyList)
+    nb_worker: int
+        Number of processes to parse the files (default: number of CPU)
 
     Returns
     -------
@@ -166,24 +382,112 @@ def load_matlib(mat_path):
     if not isdir(mat_path):
         raise LoadMissingFolderError("The given path doesn't lead to a directory")
 
-    # Get and Read all the file to create a list dictionary : variable name <=> value
-    matlib = list()
+    # List all the json file in the folder and subfolder (path, mtime, size)
+    file_list = list()
     for (dirpath, dirnames, filenames) in walk(mat_path):
         for file_name in filenames:
-            # For all json file in the folder and subfolder
             if file_name[-5:] == ".json":
                 file_path = join(dirpath, file_name)
-                try:
-                    mat = load(file_path)
-                    # Update the object property
-                    mat.name = file_name[:-5]
-                    mat.path = file_path
-                    # Keep only the materials
-                    if isinstance(mat, Material):
-                        matlib.append(mat)
-                except Exception:
-                    print("When loading matlib, unable to load file: " + file_path)
-    return matlib
+                stat_file = stat(file_path)
+                file_list.append((file_path, stat_file.st_mtime, stat_file.st_size))
+
+    # Get the files already parsed from the index
+    index_path = join(mat_path, MATLIB_INDEX_NAME)
+    try:
+        with open(index_path, "r") as index_file:
+            index = jload(index_file)
+    except (OSError, ValueError):
+        index = dict()
+    new_index = dict()
+    parse_list = list()
+    for file_path, mtime, size in file_list:
+        key = relpath(file_path, mat_path).replace("\\", "/")
+        entry = index.get(key)
+        if entry is not None and entry["mtime"] == mtime and entry["size"] == size:
+            new_index[key] = entry
+        else:
+            parse_list.append((key, file_path, mtime, size))
+
+    # Parse the new files (with a process pool if there are many files)
+    path_list = [file_path for _, file_path, _, _ in parse_list]
+    if nb_worker is None:
+        nb_worker = cpu_count()
+    if len(path_list) >= MATLIB_POOL_MIN and nb_worker > 1:
+        with ProcessPoolExecutor(max_workers=nb_worker) as executor:
+            result_list = list(executor.map(read_matlib_file, path_list, chunksize=16))
+    else:
+        result_list = [read_matlib_file(file_path) for file_path in path_list]
+    for (key, file_path, mtime, size), (init_dict, error) in zip(
+        parse_list, result_list
+    ):
+        if error is not None:
+            getLogger("pyleecan").warning(
+                "When loading matlib, unable to load file: " + file_path + " " + error
+            )
+        else:
+            new_index[key] = {"mtime": mtime, "size": size, "init_dict": init_dict}
+
+    # Update the index (the folder can be read only)
+    if new_index != index:
+        try:
+            with open(index_path + ".tmp", "w") as index_file:
+                dump(new_index, index_file)
+            replace(index_path + ".tmp", index_path)
+        except OSError:
+            pass
+
+    # Create the materials (in the walk order)
+    matlib = LazyList()
+    for file_path, _, _ in file_list:
+        entry = new_index.get(relpath(file_path, mat_path).replace("\\", "/"))
+        if entry is None:
+            continue
+        init_dict = entry["init_dict"]
+        # Keep only the materials
+        if not isinstance(init_dict, dict) or not issubclass(
+            load_switch.get(init_dict.get("__class__"), type(None)), Material
+        ):
+            continue
+        # Update the object property
+        init_dict = dict(init_dict)
+        init_dict["name"] = basename(file_path)[:-5]
+        init_dict["path"] = file_path
+        if is_lazy:
+            matlib.append(LazyInit(init_data, init_dict))
+        else:
+            try:
+                matlib.append(init_data(init_dict))
+            except Exception as error:
+                getLogger("pyleecan").warning(
+                    "When loading matlib, unable to load file: "
+                    + file_path
+                    + " "
+                    + str(error)
+                )
+    if is_lazy:
+        return matlib
+    return list(matlib)
+
+
+def read_matlib_file(file_path):
+    """Parse a json file of a material library (cf load_matlib)
+
+    Parameters
+    ----------
+    file_path: str
+        path to the file to load
+
+    Returns
+    -------
+    init_dict: dict
+        data of the file (None if the file can't be parsed)
+    error: str
+        error message (None if the file is parsed)
+    """
+    try:
+        return load_json(file_path), None
+    except Exception as error:
+        return None, type(error).__name__ + ": " + str(error)
 
 
 class LoadMissingFileError(Exception):
@@ -3,139 +3,143 @@
 WARNING! All changes made in this file will be lost!
 """
 
-from pyleecan.Classes.import_all import *
+from pyleecan.Classes._lazy import LazyClassDict
 
-load_switch = {
-    "Arc": Arc,
-    "Arc1": Arc1,
-    "Arc2": Arc2,
-    "Arc3": Arc3,
-    "Bore": Bore,
-    "BoreFlower": BoreFlower,
-    "Circle": Circle,
-    "CondType11": CondType11,
-    "CondType12": CondType12,
-    "CondType21": CondType21,
-    "CondType22": CondType22,
-    "Conductor": Conductor,
-    "Element": Element,
-    "ElementMat": ElementMat,
-    "Force": Force,
-    "ForceMT": ForceMT,
-    "Frame": Frame,
-    "GUIOption": GUIOption,
-    "Hole": Hole,
-    "HoleM50": HoleM50,
-    "HoleM51": HoleM51,
-    "HoleM52": HoleM52,
-    "HoleM53": HoleM53,
-    "HoleM54": HoleM54,
-    "HoleMag": HoleMag,
-    "Import": Import,
-    "ImportGenMatrixSin": ImportGenMatrixSin,
-    "ImportGenVectLin": ImportGenVectLin,
-    "ImportGenVectSin": ImportGenVectSin,
-    "ImportMatlab": ImportMatlab,
-    "ImportMatrix": ImportMatrix,
-    "ImportMatrixVal": ImportMatrixVal,
-    "ImportMatrixXls": ImportMatrixXls,
-    "InCurrent": InCurrent,
-    "InCurrentDQ": InCurrentDQ,
-    "InFlux": InFlux,
-    "InForce": InForce,
-    "Input": Input,
-    "LamHole": LamHole,
-    "LamSlot": LamSlot,
-    "LamSlotMag": LamSlotMag,
-    "LamSlotMulti": LamSlotMulti,
-    "LamSlotWind": LamSlotWind,
-    "LamSquirrelCage": LamSquirrelCage,
-    "Lamination": Lamination,
-    "Line": Line,
-    "Machine": Machine,
-    "MachineAsync": MachineAsync,
-    "MachineDFIM": MachineDFIM,
-    "MachineIPMSM": MachineIPMSM,
-    "MachineSCIM": MachineSCIM,
-    "MachineSIPMSM": MachineSIPMSM,
-    "MachineSRM": MachineSRM,
-    "MachineSyRM": MachineSyRM,
-    "MachineSync": MachineSync,
-    "MachineWRSM": MachineWRSM,
-    "MagFEMM": MagFEMM,
-    "Magnet": Magnet,
-    "MagnetFlat": MagnetFlat,
-    "MagnetPolar": MagnetPolar,
-    "MagnetType10": MagnetType10,
-    "MagnetType11": MagnetType11,
-    "MagnetType12": MagnetType12,
-    "MagnetType13": MagnetType13,
-    "MagnetType14": MagnetType14,
-    "Magnetics": Magnetics,
-    "MatEconomical": MatEconomical,
-    "MatElectrical": MatElectrical,
-    "MatHT": MatHT,
-    "MatMagnetics": MatMagnetics,
-    "MatStructural": MatStructural,
-    "Material": Material,
-    "Mesh": Mesh,
-    "MeshSolution": MeshSolution,
-    "Node": Node,
-    "NodeMat": NodeMat,
-    "Notch": Notch,
-    "NotchEvenDist": NotchEvenDist,
-    "OutElec": OutElec,
-    "OutGeo": OutGeo,
-    "OutGeoLam": OutGeoLam,
-    "OutMag": OutMag,
-    "OutPost": OutPost,
-    "OutStruct": OutStruct,
-    "Output": Output,
-    "PolarArc": PolarArc,
-    "Segment": Segment,
-    "Shaft": Shaft,
-    "Simu1": Simu1,
-    "Simulation": Simulation,
-    "Slot": Slot,
-    "Slot19": Slot19,
-    "SlotMFlat": SlotMFlat,
-    "SlotMPolar": SlotMPolar,
-    "SlotMag": SlotMag,
-    "SlotUD": SlotUD,
-    "SlotW10": SlotW10,
-    "SlotW11": SlotW11,
-    "SlotW12": SlotW12,
-    "SlotW13": SlotW13,
-    "SlotW14": SlotW14,
-    "SlotW15": SlotW15,
-    "SlotW16": SlotW16,
-    "SlotW21": SlotW21,
-    "SlotW22": SlotW22,
-    "SlotW23": SlotW23,
-    "SlotW24": SlotW24,
-    "SlotW25": SlotW25,
-    "SlotW26": SlotW26,
-    "SlotW27": SlotW27,
-    "SlotW28": SlotW28,
-    "SlotW29": SlotW29,
-    "SlotW60": SlotW60,
-    "SlotW61": SlotW61,
-    "SlotWind": SlotWind,
-    "Solution": Solution,
-    "Structural": Structural,
-    "SurfLine": SurfLine,
-    "Surface": Surface,
-    "Trapeze": Trapeze,
-    "Unit": Unit,
-    "VentilationCirc": VentilationCirc,
-    "VentilationPolar": VentilationPolar,
-    "VentilationTrap": VentilationTrap,
-    "Winding": Winding,
-    "WindingCW1L": WindingCW1L,
-    "WindingCW2LR": WindingCW2LR,
-    "WindingCW2LT": WindingCW2LT,
-    "WindingDW1L": WindingDW1L,
-    "WindingDW2L": WindingDW2L,
-    "WindingSC": WindingSC,
-    "WindingUD": WindingUD,
-}
+# The classes are imported when they are first used
+load_switch = LazyClassDict(
+    [
+        "Arc",
+        "Arc1",
+        "Arc2",
+        "Arc3",
+        "Bore",
+        "BoreFlower",
+        "Circle",
+        "CondType11",
+        "CondType12",
+        "CondType21",
+        "CondType22",
+        "Conductor",
+        "Element",
+        "ElementMat",
+        "Force",
+        "ForceMT",
+        "Frame",
+        "GUIOption",
+        "Hole",
+        "HoleM50",
+        "HoleM51",
+        "HoleM52",
+        "HoleM53",
+        "HoleM54",
+        "HoleMag",
+        "Import",
+        "ImportGenMatrixSin",
+        "ImportGenVectLin",
+        "ImportGenVectSin",
+        "ImportMatlab",
+        "ImportMatrix",
+        "ImportMatrixVal",
+        "ImportMatrixXls",
+        "InCurrent",
+        "InCurrentDQ",
+        "InFlux",
+        "InForce",
+        "Input",
+        "LamHole",
+        "LamSlot",
+        "LamSlotMag",
+        "LamSlotMulti",
+        "LamSlotWind",
+        "LamSquirrelCage",
+        "Lamination",
+        "Line",
+        "Machine",
+        "MachineAsync",
+        "MachineDFIM",
+        "MachineIPMSM",
+        "MachineSCIM",
+        "MachineSIPMSM",
+        "MachineSRM",
+        "MachineSyRM",
+        "MachineSync",
+        "MachineWRSM",
+        "MagFEMM",
+        "Magnet",
+        "MagnetFlat",
+        "MagnetPolar",
+        "MagnetType10",
+        "MagnetType11",
+        "MagnetType12",
+        "MagnetType13",
+        "MagnetType14",
+        "Magnetics",
+        "MatEconomical",
+        "MatElectrical",
+        "MatHT",
+        "MatMagnetics",
+        "MatStructural",
+        "Material",
+        "Mesh",
+        "MeshSolution",
+        "Node",
+        "NodeMat",
+        "Notch",
+        "NotchEvenDist",
+        "OutElec",
+        "OutGeo",
+        "OutGeoLam",
+        "OutMag",
+        "OutPost",
+        "OutStruct",
+        "Output",
+        "PolarArc",
+        "Segment",
+        "Shaft",
+        "Simu1",
+        "Simulation",
+        "Slot",
+        "Slot19",
+        "SlotMFlat",
+        "SlotMPolar",
+        "SlotMag",
+        "SlotUD",
+        "SlotW10",
+        "SlotW11",
+        "SlotW12",
+        "SlotW13",
+        "SlotW14",
+        "SlotW15",
+        "SlotW16",
+        "SlotW21",
+        "SlotW22",
+        "SlotW23",
+        "SlotW24",
+        "SlotW25",
+        "SlotW26",
+        "SlotW27",
+        "SlotW28",
+        "SlotW29",
+        "SlotW60",
+        "SlotW61",
+        "SlotWind",
+        "Solution",
+        "Structural",
+        "SurfArray",
+        "SurfLine",
+        "Surface",
+        "Trapeze",
+        "Unit",
+        "VentilationCirc",
+        "VentilationPolar",
+        "VentilationTrap",
+        "Winding",
+        "WindingCW1L",
+        "WindingCW2LR",
+        "WindingCW2LT",
+        "WindingDW1L",
+        "WindingDW2L",
+        "WindingSC",
+        "WindingUD",
+    ]
+)
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+
+from copy import deepcopy
+from functools import wraps
+
+from numpy import ndarray
+
+
+def memoize(fct):
+    """Decorator to store the result of a method of a pyleecan object until the
+    object is modified. The result is stored in the _memo dict of the object
+    and is valid as long as the object, its children (cf setters) and its
+    parent are not modified. In place modifications (list.append, array[0]=...)
+    are not detected.
+
+    Parameters
+    ----------
+    fct : function
+        Method to memoize (the arguments must be hashable)
+
+    Returns
+    -------
+    memo_fct : function
+        Memoized method
+    """
+
+    @wraps(fct)
+    def memo_fct(self, *args, **kwargs):
+        try:
+            key = (fct, args, tuple(sorted(kwargs.items())))
+            hash(key)
+        except TypeError:  # Unhashable argument (ndarray...)
+            return fct(self, *args, **kwargs)
+
+        # The memo of the parent is cleared when the parent is modified
+        parent = self.parent
+        if parent is not None and parent._memo is None:
+            parent._memo = dict()
+        token = None if parent is None else parent._memo
+
+        if self._memo is not None and key in self._memo:
+            memo_token, result = self._memo[key]
+            if memo_token is token:
+                return copy_result(result)
+
+        result = fct(self, *args, **kwargs)
+        if self._memo is None:
+            self._memo = dict()
+        self._memo[key] = (token, result)
+        return copy_result(result)
+
+    return memo_fct
+
+
+def copy_result(result):
+    """Copy the mutable results (the memoized result must not be modified by
+    the caller)
+
+    Parameters
+    ----------
+    result :
+        Result of a memoized method
+
+    Returns
+    -------
+    result :
+        The result or its copy
+    """
+    if isinstance(result, (dict, list, ndarray)):
+        return deepcopy(result)
+    return result
@@ -5,13 +5,35 @@
 @author pierre_b
 """
 
-from json import dump
-from os.path import join, basename, isdir
+from gzip import open as gzip_open
+from json import dumps
+from os import remove, replace
+from os.path import abspath, basename, isdir, isfile, join
+from zipfile import ZipFile, ZIP_STORED
+
+from numpy import array, memmap, ndarray
+from numpy.lib.format import write_array
+
+# Extension of the binary container (zip of the arrays in .npy format and of the
+# json skeleton of the object, not readable by numpy.load)
+BINARY_EXT = ".pyleecan.zip"
+# Name of the json skeleton in the binary container
+SKELETON_NAME = "skeleton.json"
+# Key of the reference to an array of the container in the skeleton
+ARRAY_KEY = "__ndarray__"
+# Extension of the compressed json files
+GZIP_EXT = ".json.gz"
+# Size of the array blocks converted to json at once [byte]
+CHUNK_SIZE = 2 ** 20
 
 
 def fix_file_name(save_path, obj):
     if isdir(save_path) or not save_path:
         file_path = join(save_path, type(obj).__name__ + ".json")
+    elif basename(save_path)[-len(BINARY_EXT) :] == BINARY_EXT:
+        file_path = save_path
+    elif basename(save_path)[-len(GZIP_EXT) :] == GZIP_EXT:
+        file_path = save_path
     elif ".json" != basename(save_path)[-5:]:
         file_path = save_path + ".json"
     else:
@@ -32,7 +54,7 @@ def has_as_dict(obj):
     return hasattr(obj, "as_dict") and callable(getattr(obj, "as_dict", None))
 
 
-def build_data(obj):
+def build_data(obj, is_keep_array=False):
     """
     Build a json serializable data structure of lists, dicts and pyleecan objects.
     Data that can not be serialized will be set to None. Tuples will also be None.
@@ -41,6 +63,8 @@ def build_data(obj):
     ----------
     obj : 
         An object to serialize
+    is_keep_array : bool
+        True to keep the ndarray as they are (not converted to list)
     
     Returns
     -------
@@ -51,20 +75,23 @@ def build_data(obj):
     if isinstance(obj, list):
         data = []
         for elem in obj:
-            data.append(build_data(elem))
+            data.append(build_data(elem, is_keep_array))
         return data
     # dicts
     if isinstance(obj, dict):
         data = {}
         for key in obj:
-            data[key] = build_data(obj[key])
+            data[key] = build_data(obj[key], is_keep_array)
         return data
     # tuples (excluded)
     if isinstance(obj, tuple):
         return None
     # pyleecan classes, i.e. instances with as_dict method
     if has_as_dict(obj):
-        return obj.as_dict()
+        return obj.as_dict(is_keep_array=is_keep_array)
+    # arrays (stored in the binary container)
+    if is_keep_array and isinstance(obj, ndarray):
+        return obj
     #
     if is_json_serializable(obj):
         return obj
@@ -72,8 +99,170 @@ def build_data(obj):
         return None
 
 
-def save_data(obj, save_path=""):
-    """Save the object to the save_path
+def split_array(data, array_list):
+    """Replace the ndarray of a data structure by references to array_list
+
+    Parameters
+    ----------
+    data :
+        A data structure of lists, dicts and ndarray (cf build_data)
+    array_list : list
+        List to append the ndarray to
+
+    Returns
+    -------
+    data :
+        A json serializable data structure
+    """
+    if isinstance(data, list):
+        return [split_array(elem, array_list) for elem in data]
+    if isinstance(data, dict):
+        return {key: split_array(value, array_list) for key, value in data.items()}
+    if isinstance(data, ndarray):
+        array_list.append(data)
+        return {ARRAY_KEY: "array_" + str(len(array_list) - 1) + ".npy"}
+    return data
+
+
+def is_mapped_to(value, file_path):
+    """Check if an array is memory-mapped to a file (cf load_binary)
+
+    Parameters
+    ----------
+    value : ndarray
+        the array to check (or a view of a memory-mapped array)
+    file_path: str
+        path to the file
+
+    Returns
+    -------
+    is_mapped : bool
+        True if the data of the array are read from file_path
+    """
+    while isinstance(value, ndarray):
+        if isinstance(value, memmap) and value.filename is not None:
+            return abspath(value.filename) == abspath(file_path)
+        value = value.base
+    return False
+
+
+def save_binary(obj, file_path):
+    """Save the object in a binary container: the arrays are stored raw in .npy
+    files (uncompressed to be memory-mapped by load) and the rest of the object
+    in a json skeleton, all in a single zip file.
+    The container is written in a temporary file that then replaces file_path,
+    so that the arrays memory-mapped to file_path can be saved in the same file.
+
+    Parameters
+    ----------
+    obj :
+        A pyleecan object
+    file_path: str
+        path to the file to save
+    """
+    array_list = list()
+    skeleton = split_array(build_data(obj, is_keep_array=True), array_list)
+
+    # The arrays loaded from file_path must not be read from it once replaced
+    array_list = [
+        array(value) if is_mapped_to(value, file_path) else value
+        for value in array_list
+    ]
+
+    tmp_path = file_path + ".tmp"
+    try:
+        with ZipFile(tmp_path, "w", ZIP_STORED, allowZip64=True) as zip_file:
+            zip_file.writestr(SKELETON_NAME, dumps(skeleton, sort_keys=True))
+            for ii, value in enumerate(array_list):
+                with zip_file.open(
+                    "array_" + str(ii) + ".npy", "w", force_zip64=True
+                ) as f:
+                    write_array(f, value, allow_pickle=False)
+        replace(tmp_path, file_path)
+    finally:
+        if isfile(tmp_path):
+            remove(tmp_path)
+
+
+def write_json(data, json_file, indent=None, level=0):
+    """Write a data structure in a json file as json.dump (sorted keys) without
+    building the whole text: the ndarray are converted block by block (the data
+    structure itself is already in memory, cf build_data)
+
+    Parameters
+    ----------
+    data :
+        A data structure of lists, dicts and ndarray (cf build_data)
+    json_file : file
+        File to write (text mode)
+    indent : int
+        Indentation of the json file (None for a compact file)
+    level : int
+        Indentation level of data
+    """
+    if indent is None:
+        item_sep, key_sep, newline, newline_end = ",", ":", "", ""
+    else:
+        item_sep, key_sep = ",", ": "
+        newline = "\n" + " " * indent * (level + 1)
+        newline_end = "\n" + " " * indent * level
+
+    if isinstance(data, dict):
+        if len(data) == 0:
+            json_file.write("{}")
+            return
+        json_file.write("{")
+        for ii, key in enumerate(sorted(data)):
+            if ii > 0:
+                json_file.write(item_sep)
+            json_file.write(newline)
+            json_file.write(dumps(key if isinstance(key, str) else dumps(key)))
+            json_file.write(key_sep)
+            write_json(data[key], json_file, indent, level + 1)
+        json_file.write(newline_end + "}")
+    elif isinstance(data, list):
+        if len(data) == 0:
+            json_file.write("[]")
+            return
+        json_file.write("[")
+        for ii, value in enumerate(data):
+            if ii > 0:
+                json_file.write(item_sep)
+            json_file.write(newline)
+            write_json(value, json_file, indent, level + 1)
+        json_file.write(newline_end + "]")
+    elif isinstance(data, ndarray):
+        if data.ndim == 0:
+            json_file.write(dumps(data.tolist()))
+            return
+        if data.shape[0] == 0:
+            json_file.write("[]")
+            return
+        # Convert the array by blocks of rows (bounded memory)
+        nb_row = max(1, CHUNK_SIZE // max(1, data[0].nbytes))
+        json_file.write("[")
+        for start in range(0, data.shape[0], nb_row):
+            if start > 0:
+                json_file.write(item_sep)
+            block = data[start : start + nb_row].tolist()
+            if indent is None:
+                json_file.write(dumps(block, separators=(",", ":"))[1:-1])
+            else:
+                # Remove the brackets and shift the lines to the current level
+                text = dumps(block, indent=indent)[1:-2]
+                json_file.write(text.replace("\n", newline_end))
+        json_file.write(newline_end + "]")
+    else:
+        json_file.write(dumps(data))
+
+
+def save_data(obj, save_path="", is_compact=False):
+    """Save the object to the save_path (json file, compressed json file if
+    save_path ends with GZIP_EXT or binary container if it ends with BINARY_EXT).
+    The object is first converted to a data structure of dicts and lists that
+    keeps its ndarray by reference (no copy), then the json file is written
+    from it: the ndarray are converted by blocks instead of building the whole
+    text (the memory used by the other properties is not reduced).
 
     Parameters
     ----------
@@ -81,17 +270,26 @@ def save_data(obj, save_path=""):
         A pyleecan object
     save_path: str
         path to the folder to save the object
+    is_compact: bool
+        True to write the json file without indentation
     """
     # correct file name if needed
     file_path = fix_file_name(save_path, obj)
 
     # save
-    obj = build_data(obj)
-    with open(file_path, "w") as json_file:
-        dump(obj, json_file, sort_keys=True, indent=4, separators=(",", ": "))
+    if file_path[-len(BINARY_EXT) :] == BINARY_EXT:
+        save_binary(obj, file_path)
+        return
+    data = build_data(obj, is_keep_array=True)
+    if file_path[-len(GZIP_EXT) :] == GZIP_EXT:
+        json_file = gzip_open(file_path, "wt")
+    else:
+        json_file = open(file_path, "w")
+    with json_file:
+        write_json(data, json_file, indent=None if is_compact else 4)
 
 
-def save(self, save_path=""):
+def save(self, save_path="", is_compact=False):
     """Save the object to the save_path
 
     Parameters
@@ -100,5 +298,7 @@ def save(self, save_path=""):
         A pyleecan object
     save_path: str
         path to the folder to save the object
+    is_compact: bool
+        True to write the json file without indentation
     """
-    save_data(self, save_path=save_path)
+    save_data(self, save_path=save_path, is_compact=is_compact)
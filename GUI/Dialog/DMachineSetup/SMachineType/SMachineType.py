@@ -166,7 +166,7 @@ class SMachineType(Gen_SMachineType, QWidget):
         p = self.machine.stator.winding.p
         # Get the correct machine class
         mach = self.mach_list[index]["init_machine"]
-        self.machine = type(mach)(init_dict=mach.as_dict())
+        self.machine = mach.copy()
         if p is not None:
             self.si_p.setValue(p)
             self.set_p()
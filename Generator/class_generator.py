@@ -11,10 +11,11 @@ from pyleecan.Generator.read_fct import (
     get_value_str,
     is_list_pyleecan_type,
     is_dict_pyleecan_type,
+    is_pyleecan_type,
 )
 
 
-def generate_class(gen_dict, class_name, path_to_gen):
+def generate_class(gen_dict, class_name, path_to_gen, is_check=True):
     """generate the corresponding class file (erase the previous code)
 
     Parameters
@@ -25,6 +26,9 @@ def generate_class(gen_dict, class_name, path_to_gen):
         name of the class to generate
     path_to_gen : str
         path to the file to save the class code
+    is_check : bool
+        False to generate the class without the checks of the values and of
+        the init_dict keys (for trusted data only)
 
     Returns
     -------
@@ -60,11 +64,11 @@ def generate_class(gen_dict, class_name, path_to_gen):
     if "ndarray" in import_type_list:
         class_file.write(
             "from pyleecan.Classes._check import set_array, "
-            + "check_init_dict, check_var, raise_\n"
+            + "check_init_dict, check_var\n"
         )
     else:
         class_file.write(
-            "from pyleecan.Classes._check import check_init_dict, check_var, raise_\n"
+            "from pyleecan.Classes._check import check_init_dict, check_var\n"
         )
     # Save function
     class_file.write("from pyleecan.Functions.save import save\n")
@@ -82,18 +86,6 @@ def generate_class(gen_dict, class_name, path_to_gen):
     else:
         class_file.write("from pyleecan.Classes._frozen import FrozenClass\n\n")
 
-    # Import all the methods of the class
-    # The methods are in Methods.<Main package>.<class name>, one file per method
-    if len(class_dict["methods"]) > 0:
-        class_file.write("# Import all class method\n")
-        class_file.write(
-            "# Try/catch to remove unnecessary dependencies in unused method\n"
-        )
-    for meth in class_dict["methods"]:
-        class_file.write(import_method(class_pack, class_name, meth))
-    if len(class_dict["methods"]) > 0:
-        class_file.write("\n")
-
     if "{ndarray}" in import_type_list and "ndarray" in import_type_list:
         class_file.write("from numpy import array, empty, array_equal\n")
         import_type_list.remove("{ndarray}")
@@ -106,6 +98,27 @@ def generate_class(gen_dict, class_name, path_to_gen):
         class_file.write("from numpy import array, empty\n")
         import_type_list.remove("{ndarray}")
 
+    # deepcopy is needed to copy the list and dict properties
+    if any(prop["type"] in ["list", "dict"] for prop in class_dict["properties"]):
+        class_file.write("from copy import deepcopy\n")
+
+    # LazyInit is needed in the getter of the pyleecan type properties
+    lazy_list = list()
+    if any(
+        is_pyleecan_type(prop["type"])
+        or is_list_pyleecan_type(prop["type"])
+        or is_dict_pyleecan_type(prop["type"])
+        for prop in class_dict["properties"]
+    ):
+        lazy_list.append("LazyInit")
+    # The methods are imported when they are first used
+    if len(class_dict["methods"]) > 0:
+        lazy_list.append("LazyMethod")
+    if len(lazy_list) > 0:
+        class_file.write(
+            "from pyleecan.Classes._lazy import " + ", ".join(lazy_list) + "\n"
+        )
+
     # Import of all needed pyleecan type for empty init
     class_file.write("from pyleecan.Classes._check import InitUnKnowClassError\n")
     for pyleecan_type in import_type_list:
@@ -132,59 +145,19 @@ def generate_class(gen_dict, class_name, path_to_gen):
     class_file.write("\n")
 
     # Asign all the Methods of the class
-    if len(class_dict["methods"]) > 1:
-        class_file.write(
-            TAB
-            + "# Check ImportError to remove unnecessary dependencies in unused method\n"
-        )
+    # The methods are in Methods.<Main package>.<class name>, one file per method
+    # They are imported when they are first used to remove unnecessary
+    # dependencies in unused method (cf LazyMethod)
     for meth in class_dict["methods"]:
-        meth_name = meth.split(".")[-1]
-        class_file.write(
-            TAB + "# cf Methods." + class_pack + "." + class_name + "." + meth + "\n"
-        )
-        class_file.write(TAB + "if isinstance(" + meth_name + ", ImportError):\n")
-        class_file.write(TAB2 + meth_name + " = property(\n")
-        class_file.write(TAB3 + "fget=lambda x: raise_(\n")
-        # PEP8 formating
-        if len(class_name) + 2 * len(meth_name) > 39:
-            # 2 lines Import text
-            class_file.write(TAB4 + "ImportError(\n")
-            class_file.write(
-                TAB5 + """"Can't use """ + class_name + " method " + meth_name + ': "\n'
-            )
-            class_file.write(TAB5 + "+ str(" + meth_name + ")\n")
-            class_file.write(TAB4 + ")\n")
-        elif len(class_name) + 2 * len(meth_name) > 29:
-            # Import text on line different line
-            class_file.write(TAB4 + "ImportError(\n")
-            class_file.write(
-                TAB5 + """"Can't use """ + class_name + " method " + meth_name + ': "'
-            )
-            class_file.write(" + str(" + meth_name + ")\n")
-            class_file.write(TAB4 + ")\n")
-        else:  # On one line
-            class_file.write(
-                TAB4
-                + """ImportError("Can't use """
-                + class_name
-                + " method "
-                + meth_name
-                + ': " + str('
-                + meth_name
-                + "))\n"
-            )
-        class_file.write(TAB3 + ")\n")
-        class_file.write(TAB2 + ")\n")
-        class_file.write(TAB + "else:\n")
-        class_file.write(TAB2 + meth_name + " = " + meth_name + "\n")
+        class_file.write(lazy_method(class_pack, class_name, meth))
     class_file.write(TAB + "# save method is available in all object\n")
     class_file.write(TAB + "save = save\n\n")
 
     # Add the __init__ method
     if len(class_dict["properties"]) == 0 and class_dict["mother"] == "":
-        class_file.write(generate_init_void() + "\n")
+        class_file.write(generate_init_void(is_check) + "\n")
     else:
-        class_file.write(generate_init(gen_dict, class_dict) + "\n")
+        class_file.write(generate_init(gen_dict, class_dict, is_check) + "\n")
 
     # Add the __str__ method
     class_file.write(generate_str(gen_dict, class_dict) + "\n")
@@ -195,19 +168,24 @@ def generate_class(gen_dict, class_name, path_to_gen):
     # Add the as_dict method
     class_file.write(generate_as_dict(gen_dict, class_dict) + "\n")
 
+    # Add the _copy_to method (used by copy)
+    class_file.write(generate_copy_to(gen_dict, class_dict) + "\n")
+
     # Add the _set_None method
     class_file.write(generate_set_None(gen_dict, class_dict))
 
     # Add all the properties getter and setter
     if len(class_dict["properties"]) > 0:
-        class_file.write("\n" + generate_properties(gen_dict, class_dict) + "\n")
+        class_file.write(
+            "\n" + generate_properties(gen_dict, class_dict, is_check) + "\n"
+        )
 
     # End of class generation
     class_file.close()
 
 
-def import_method(class_pack, class_name, meth):
-    """Method to generate the code to import a method (with import check)
+def lazy_method(class_pack, class_name, meth):
+    """Method to generate the code to set a method imported when first used
 
     Parameters
     ----------
@@ -226,25 +204,13 @@ def import_method(class_pack, class_name, meth):
     """
 
     meth_name = meth.split(".")[-1]
-    code = "try:\n"
-    code += (
-        TAB
-        + "from pyleecan.Methods."
-        + class_pack
-        + "."
-        + class_name
-        + "."
-        + meth
-        + " import "
-        + meth_name
-        + "\n"
-    )
-    code += "except ImportError as error:\n"
-    code += TAB + meth_name + " = error\n\n"
+    module = "pyleecan.Methods." + class_pack + "." + class_name + "." + meth
+    code = TAB + "# cf Methods." + class_pack + "." + class_name + "." + meth + "\n"
+    code += TAB + meth_name + ' = LazyMethod("' + module + '")\n'
     return code
 
 
-def generate_init(gen_dict, class_dict):
+def generate_init(gen_dict, class_dict, is_check=True):
     """Generate the code for the __init__ method for the class
 
     Parameters
@@ -255,6 +221,8 @@ def generate_init(gen_dict, class_dict):
     class_dict : dict
         Dictionnary of the class to generate (keys are name, package, properties, methods...)
 
+    is_check : bool
+        False to generate the code without the checks (cf generate_class)
 
     Returns
     -------
@@ -298,7 +266,7 @@ def generate_init(gen_dict, class_dict):
             init_by_var += TAB4 + "if obj is None:  # Default value\n"
             init_by_var += (
                 TAB5
-                + "self."
+                + "self._"
                 + prop["name"]
                 + ".append("
                 + prop["type"][1:-1]
@@ -310,7 +278,7 @@ def generate_init(gen_dict, class_dict):
                 prop["name"], prop["type"][1:-1], daug_list
             )
             init_by_var += TAB4 + "else:\n"
-            init_by_var += TAB5 + "self." + prop["name"] + ".append(obj)\n"
+            init_by_var += TAB5 + "self._" + prop["name"] + ".append(obj)\n"
             init_by_var += TAB2 + "elif " + prop["name"] + " is None:\n"
             init_by_var += TAB3 + "self." + prop["name"] + " = list()\n"
             init_by_var += TAB2 + "else:\n"
@@ -329,6 +297,8 @@ def generate_init(gen_dict, class_dict):
             init_by_var += TAB5 + "value = empty(0)\n"
             init_by_var += TAB4 + "elif isinstance(obj, list):\n"
             init_by_var += TAB5 + "value = array(obj)\n"
+            init_by_var += TAB4 + "else:\n"
+            init_by_var += TAB5 + "value = obj\n"
             init_by_var += TAB4 + "self." + prop["name"] + "[key] = value\n"
 
             init_by_var += TAB2 + "elif " + prop["name"] + " is None:\n"
@@ -412,7 +382,7 @@ def generate_init(gen_dict, class_dict):
     init_MType = ""  # To initialize the pyleecan Type default (-1)
     for prop in all_properties:
         # To overwrite the parameter from init_dict
-        init_by_dict += TAB3 + 'if "' + prop["name"] + '" in list(init_dict.keys()):\n'
+        init_by_dict += TAB3 + 'if "' + prop["name"] + '" in init_dict:\n'
         init_by_dict += TAB4 + prop["name"] + ' = init_dict["' + prop["name"] + '"]\n'
         # For the argument with default value
         if prop["type"] in PYTHON_TYPE:
@@ -474,7 +444,8 @@ def generate_init(gen_dict, class_dict):
 
     init_str += init_MType
     init_str += TAB2 + "if init_dict is not None:  # Initialisation by dict\n"
-    init_str += TAB3 + "check_init_dict(init_dict, [" + check_dict + "])\n"
+    if is_check:
+        init_str += TAB3 + "check_init_dict(init_dict, [" + check_dict + "])\n"
     init_str += TAB3 + "# Overwrite default value with init_dict content\n"
     init_str += init_by_dict
     init_str += TAB2 + "# Initialisation by argument\n"
@@ -547,11 +518,11 @@ def generate_set_class_by_dict_list(prop_name, prop_type, daug_list):
         class_dict_str += TAB5 + ")\n"
         class_dict_str += TAB5 + "class_obj = getattr(module, class_name)\n"
         class_dict_str += (
-            TAB5 + "self." + prop_name + ".append(" + "class_obj(init_dict=obj))\n"
+            TAB5 + "self._" + prop_name + ".append(" + "class_obj(init_dict=obj))\n"
         )
     else:  # No daughter
         class_dict_str += (
-            TAB5 + "self." + prop_name + ".append(" + prop_type + "(init_dict=obj))\n"
+            TAB5 + "self._" + prop_name + ".append(" + prop_type + "(init_dict=obj))\n"
         )
     return class_dict_str
 
@@ -672,9 +643,14 @@ def generate_set_class_by_dict(prop_name, prop_type, daug_list):
     return class_dict_str
 
 
-def generate_init_void():
+def generate_init_void(is_check=True):
     """Generate the code for the init method with no property
 
+    Parameters
+    ----------
+    is_check : bool
+        False to generate the code without the checks (cf generate_class)
+
     Returns
     -------
     init_str : str
@@ -700,8 +676,9 @@ def generate_init_void():
     init_str += TAB2 + "ndarray or list can be given for Vector and Matrix\n"
     init_str += TAB2 + 'object or dict can be given for pyleecan Object"""\n\n'
 
-    init_str += TAB2 + "if init_dict is not None:  # Initialisation by dict\n"
-    init_str += TAB3 + "check_init_dict(init_dict, [])\n"
+    if is_check:
+        init_str += TAB2 + "if init_dict is not None:  # Initialisation by dict\n"
+        init_str += TAB3 + "check_init_dict(init_dict, [])\n"
 
     init_str += (
         TAB2 + "# The class is frozen, for now it's impossible to "
@@ -969,6 +946,16 @@ def generate_as_dict(gen_dict, class_dict):
             # var_str
             var_str += TAB2 + "if self." + prop["name"] + " is None:\n"
             var_str += TAB3 + class_name + '_dict["' + prop["name"] + '"] = None\n'
+            var_str += TAB2 + "elif is_keep_array:\n"
+            var_str += (
+                TAB3
+                + class_name
+                + '_dict["'
+                + prop["name"]
+                + '"] = self.'
+                + prop["name"]
+                + "\n"
+            )
             var_str += TAB2 + "else:\n"
             var_str += (
                 TAB3
@@ -987,7 +974,7 @@ def generate_as_dict(gen_dict, class_dict):
                 + class_name
                 + '_dict["'
                 + prop["name"]
-                + '"].append(obj.as_dict())\n'
+                + '"].append(obj.as_dict(is_keep_array=is_keep_array))\n'
             )
         elif prop["type"] == "{ndarray}":
             var_str += TAB2 + class_name + '_dict["' + prop["name"] + '"] = dict()\n'
@@ -997,7 +984,7 @@ def generate_as_dict(gen_dict, class_dict):
                 + class_name
                 + '_dict["'
                 + prop["name"]
-                + '"][key] = obj.tolist()\n'
+                + '"][key] = obj if is_keep_array else obj.tolist()\n'
             )
         elif is_dict_pyleecan_type(prop["type"]):
             var_str += TAB2 + class_name + '_dict["' + prop["name"] + '"] = dict()\n'
@@ -1007,7 +994,7 @@ def generate_as_dict(gen_dict, class_dict):
                 + class_name
                 + '_dict["'
                 + prop["name"]
-                + '"][key] = obj.as_dict()\n'
+                + '"][key] = obj.as_dict(is_keep_array=is_keep_array)\n'
             )
         else:
             # Add => "class_name ["var_name"] = self.var_name.as_dict()" to
@@ -1022,14 +1009,15 @@ def generate_as_dict(gen_dict, class_dict):
                 + prop["name"]
                 + '"] = self.'
                 + prop["name"]
-                + ".as_dict()\n"
+                + ".as_dict(is_keep_array=is_keep_array)\n"
             )
 
     # Code generation
-    dict_str += TAB + "def as_dict(self):\n"
+    dict_str += TAB + "def as_dict(self, is_keep_array=False):\n"
     dict_str += (
         TAB2 + '"""Convert this objet in a json seriable dict (can '
-        "be use in __init__)\n" + TAB2 + '"""\n\n'
+        "be use in __init__)\n" + TAB2 + "The ndarray are not converted to list if "
+        "is_keep_array\n" + TAB2 + '"""\n\n'
     )
     if class_dict["mother"] != "":
         # Get the properties of the mother class (if needed)
@@ -1037,7 +1025,11 @@ def generate_as_dict(gen_dict, class_dict):
             TAB2 + "# Get the properties inherited from " + class_dict["mother"] + "\n"
         )
         dict_str += (
-            TAB2 + class_name + "_dict = super(" + class_name + ", self).as_dict()\n"
+            TAB2
+            + class_name
+            + "_dict = super("
+            + class_name
+            + ", self).as_dict(is_keep_array=is_keep_array)\n"
         )
     else:
         dict_str += TAB2 + class_name + "_dict = dict()\n"
@@ -1054,6 +1046,85 @@ def generate_as_dict(gen_dict, class_dict):
     return dict_str
 
 
+def generate_copy_to(gen_dict, class_dict):
+    """Generate the code for the _copy_to method of the class (called by copy
+    to copy the properties without the as_dict/init_dict round trip)
+
+    Parameters
+    ----------
+    gen_dict : dict
+        Dict with key = class name and value = class dict (name, package, properties, methods...)
+
+    class_dict : dict
+        Dictionnary of the class to generate (keys are name, package, properties, methods...)
+
+    Returns
+    -------
+    copy_str : str
+        String containing the code for the _copy_to method of the class
+    """
+
+    class_name = class_dict["name"]
+    copy_str = ""  # This string is for the generated code
+
+    var_str = ""  # Code line to copy every properties
+    for prop in class_dict["properties"]:
+        name = prop["name"]
+        if prop["type"] in ["list", "dict"]:
+            var_str += TAB2 + "obj._" + name + " = deepcopy(self._" + name + ")\n"
+        elif prop["type"] in PYTHON_TYPE:
+            # Immutable value (shared)
+            var_str += TAB2 + "obj._" + name + " = self._" + name + "\n"
+        elif prop["type"] == "ndarray":
+            var_str += TAB2 + "if self._" + name + " is None:\n"
+            var_str += TAB3 + "obj._" + name + " = None\n"
+            var_str += TAB2 + "else:\n"
+            var_str += TAB3 + "obj._" + name + " = self._" + name + ".copy()\n"
+        elif is_list_pyleecan_type(prop["type"]):
+            var_str += TAB2 + "obj._" + name + " = list()\n"
+            var_str += TAB2 + "for value in self._" + name + ":\n"
+            var_str += TAB3 + "if value is not None:\n"
+            var_str += TAB4 + "value = value.copy()\n"
+            var_str += TAB4 + "value.parent = obj\n"
+            var_str += TAB3 + "obj._" + name + ".append(value)\n"
+        elif prop["type"] == "{ndarray}":
+            var_str += TAB2 + "obj._" + name + " = dict()\n"
+            var_str += TAB2 + "for key, value in self._" + name + ".items():\n"
+            var_str += TAB3 + "obj._" + name + "[key] = value.copy()\n"
+        elif is_dict_pyleecan_type(prop["type"]):
+            var_str += TAB2 + "obj._" + name + " = dict()\n"
+            var_str += TAB2 + "for key, value in self._" + name + ".items():\n"
+            var_str += TAB3 + "if value is not None:\n"
+            var_str += TAB4 + "value = value.copy()\n"
+            var_str += TAB4 + "value.parent = obj\n"
+            var_str += TAB3 + "obj._" + name + "[key] = value\n"
+        else:  # Pyleecan type
+            var_str += TAB2 + "if self._" + name + " is None:\n"
+            var_str += TAB3 + "obj._" + name + " = None\n"
+            var_str += TAB2 + "else:\n"
+            var_str += TAB3 + "obj._" + name + " = self._" + name + ".copy()\n"
+            var_str += TAB3 + "obj._" + name + ".parent = obj\n"
+
+    # Code generation
+    copy_str += TAB + "def _copy_to(self, obj):\n"
+    copy_str += (
+        TAB2
+        + '"""Copy the properties of this object in obj (called by '
+        + 'copy)"""\n\n'
+    )
+    if class_dict["mother"] != "":
+        # Copy the properties of the mother class (if needed)
+        copy_str += (
+            TAB2 + "# Copy the properties inherited from " + class_dict["mother"] + "\n"
+        )
+        copy_str += TAB2 + "super(" + class_name + ", self)._copy_to(obj)\n"
+    copy_str += var_str
+    if class_dict["mother"] == "" and var_str == "":
+        copy_str += TAB2 + "pass\n"
+
+    return copy_str
+
+
 def generate_set_None(gen_dict, class_dict):
     """Generate the code for the _set_None method of the class
 
@@ -1111,7 +1182,7 @@ def generate_set_None(gen_dict, class_dict):
     return None_str
 
 
-def generate_properties(gen_dict, class_dict):
+def generate_properties(gen_dict, class_dict, is_check=True):
     """Generate the code for the getter and setter of the properties of the class
 
     Parameters
@@ -1121,6 +1192,8 @@ def generate_properties(gen_dict, class_dict):
 
     class_dict : dict
         Dictionnary of the class to generate (keys are name, package, properties, methods...)
+    is_check : bool
+        False to generate the code without the checks (cf generate_class)
 
     Returns
     -------
@@ -1137,7 +1210,11 @@ def generate_properties(gen_dict, class_dict):
         if is_list_pyleecan_type(prop["type"]):
             # TODO: Update the parent should be done only in the setter but
             # their is an issue with .append for list of pyleecan type
-            prop_str += TAB2 + "for obj in self._" + prop["name"] + ":\n"
+            prop_str += TAB2 + "for ii, obj in enumerate(self._" + prop["name"] + "):\n"
+            prop_str += TAB3 + "if isinstance(obj, LazyInit):\n"
+            prop_str += TAB4 + "# Create the object of a lazy load\n"
+            prop_str += TAB4 + "obj = obj.resolve()\n"
+            prop_str += TAB4 + "self._" + prop["name"] + "[ii] = obj\n"
             prop_str += TAB3 + "if obj is not None:\n"
             prop_str += TAB4 + "obj.parent = self\n"
 
@@ -1145,8 +1222,24 @@ def generate_properties(gen_dict, class_dict):
             # TODO: Update the parent should be done only in the setter but
             # their is an issue with .append for list of pyleecan type
             prop_str += TAB2 + "for key, obj in self._" + prop["name"] + ".items():\n"
+            prop_str += TAB3 + "if isinstance(obj, LazyInit):\n"
+            prop_str += TAB4 + "# Create the object of a lazy load\n"
+            prop_str += TAB4 + "obj = obj.resolve()\n"
+            prop_str += TAB4 + "self._" + prop["name"] + "[key] = obj\n"
             prop_str += TAB3 + "if obj is not None:\n"
             prop_str += TAB4 + "obj.parent = self\n"
+
+        elif is_pyleecan_type(prop["type"]):
+            prop_str += TAB2 + "if isinstance(self._" + prop["name"] + ", LazyInit):\n"
+            prop_str += TAB3 + "# Create the object of a lazy load\n"
+            prop_str += (
+                TAB3
+                + "self._set_"
+                + prop["name"]
+                + "(self._"
+                + prop["name"]
+                + ".resolve())\n"
+            )
         prop_str += TAB2 + "return self._" + prop["name"] + "\n\n"
 
         # Setter
@@ -1169,18 +1262,21 @@ def generate_properties(gen_dict, class_dict):
             prop_str += TAB5 + "pass\n"
 
         # Add check_var("var_name",value, "var_type", min=var_min, max=var_max)
-        prop_str += (
-            TAB2 + 'check_var("' + prop["name"] + '", value, "' + prop["type"] + '"'
-        )
-        # Min and max are added only if needed
-        if prop["type"] in ["float", "int", "ndarray"]:
-            if str(prop["min"]) is not "":
-                prop_str += ", Vmin=" + str(prop["min"])
-            if str(prop["max"]) is not "":
-                prop_str += ", Vmax=" + str(prop["max"])
-        prop_str += ")\n"
-
-        prop_str += TAB2 + "self._" + prop["name"] + " = value\n\n"
+        if is_check:
+            prop_str += (
+                TAB2 + 'check_var("' + prop["name"] + '", value, "' + prop["type"] + '"'
+            )
+            # Min and max are added only if needed
+            if prop["type"] in ["float", "int", "ndarray"]:
+                if str(prop["min"]) is not "":
+                    prop_str += ", Vmin=" + str(prop["min"])
+                if str(prop["max"]) is not "":
+                    prop_str += ", Vmax=" + str(prop["max"])
+            prop_str += ")\n"
+
+        prop_str += TAB2 + "self._" + prop["name"] + " = value\n"
+        # The memoized results of the object and its parents are outdated
+        prop_str += TAB2 + "self._clear_memo()\n\n"
         if is_list_pyleecan_type(prop["type"]):
             # List of pyleecan type
             prop_str += TAB2 + "for obj in self._" + prop["name"] + ":\n"
@@ -283,6 +283,29 @@ def is_dict_pyleecan_type(type_name):
     return type_name[0] == "{" and type_name[-1] == "}" and type_name != "{ndarray}"
 
 
+def is_pyleecan_type(type_name):
+    """Check if the type is a Pyleecan type (not a python type, ndarray, list or
+    dict)
+
+    Parameters
+    ----------
+    type_name : str
+        Type of the property
+
+    Returns
+    -------
+    is_pyleecan : bool
+        True if the type is a pyleecan type
+    """
+
+    return (
+        type_name not in PYTHON_TYPE
+        and type_name not in ["ndarray", "{ndarray}"]
+        and not is_list_pyleecan_type(type_name)
+        and not is_dict_pyleecan_type(type_name)
+    )
+
+
 class NotAFile(Exception):
     """Raised when the code generator is call on a wrong path
     """
@@ -17,7 +17,7 @@ from pyleecan.Generator import MAIN_DIR, DOC_DIR, INT_DIR
 PACKAGE_LIST = ["Geometry", "Machine", "Material", "Slot", "Import"]
 
 
-def generate_code(root_path, gen_dict=None):
+def generate_code(root_path, gen_dict=None, is_check=True):
     """Generate pyleecan Classes code according to doc in root_path
 
     Parameters
@@ -26,6 +26,9 @@ def generate_code(root_path, gen_dict=None):
         Path to the main folder of Pyleecan
     gen_dict : dict
         Generation dictionnary (contains all the csv data)
+    is_check : bool
+        False to generate the classes without the checks of the values and of
+        the init_dict keys (faster, for trusted data only)
     Returns
     -------
     None
@@ -57,8 +60,14 @@ def generate_code(root_path, gen_dict=None):
     load_file.write('"""File generated by generate_code() - ' + path + "\n")
     load_file.write('WARNING! All changes made in this file will be lost!\n"""\n\n')
 
-    load_file.write("from pyleecan.Classes.import_all import *\n\n")
-    load_file.write("load_switch = {\n")
+    load_file.write("from pyleecan.Classes._lazy import LazyClassDict\n\n")
+    load_file.write("# The classes are imported when they are first used\n")
+    load_file.write("load_switch = LazyClassDict(\n")
+    load_file.write("    [\n")
+
+    import_file.write("from importlib import import_module\n\n")
+    import_file.write("# The classes are imported when they are first used\n")
+    import_file.write("__all__ = [\n")
 
     # Read all the csv files
     if gen_dict is None:
@@ -66,14 +75,25 @@ def generate_code(root_path, gen_dict=None):
 
     # Generate all the class files (sorted to remove "commit noise")
     for class_name, _ in iter(sorted(list(gen_dict.items()))):
-        import_file.write(
-            "from pyleecan.Classes." + class_name + " import " + class_name + "\n"
-        )
-        load_file.write('    "' + class_name + '": ' + class_name + ",\n")
+        import_file.write('    "' + class_name + '",\n')
+        load_file.write('        "' + class_name + '",\n')
         print("Generation of " + class_name + " class")
-        generate_class(gen_dict, class_name, CLASS_DIR)
+        generate_class(gen_dict, class_name, CLASS_DIR, is_check)
+    import_file.write("]\n\n\n")
+    import_file.write("def __getattr__(name):\n")
+    import_file.write('    """Import a class when it is first used"""\n')
+    import_file.write("    if name not in __all__:\n")
+    import_file.write(
+        '        raise AttributeError("module " + __name__ + " has no attribute " + name)\n'
+    )
+    import_file.write(
+        '    cls = getattr(import_module("pyleecan.Classes." + name), name)\n'
+    )
+    import_file.write("    globals()[name] = cls\n")
+    import_file.write("    return cls\n")
     import_file.close()
-    load_file.write("}\n")
+    load_file.write("    ]\n")
+    load_file.write(")\n")
     load_file.close()
 
     print("Generation of load_switch.py")
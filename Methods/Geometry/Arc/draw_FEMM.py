@@ -4,16 +4,19 @@
 @author franco_i
 """
 
-import femm
 from pyleecan.Functions.FEMM import boundary_prop
 from numpy import abs, exp
 
 
-def draw_FEMM(self, nodeprop=None, maxseg=None, propname=None, hide=False, group=None):
+def draw_FEMM(
+    self, femm, nodeprop=None, maxseg=None, propname=None, hide=False, group=None
+):
     """Draw the Arc object in FEMM and assign the property
 
     Parameters
     ----------
+    femm : _FEMMHandler
+        Solver backend (client to send the commands to FEMM)
     nodeprop :
         Nodal property
          (Default value = None)
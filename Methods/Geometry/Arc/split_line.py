@@ -38,7 +38,7 @@ def split_line(self, Z1, Z2, is_top=True):
 
     if len(Z_int) == 0:
         # No intersection copy the line
-        line = type(self)(init_dict=self.as_dict())
+        line = self.copy()
         if Zb.imag >= 0 and Ze.imag >= 0 and is_top:
             return [line]
         if Zb.imag >= 0 and Ze.imag >= 0 and not is_top:
@@ -75,7 +75,7 @@ def split_line(self, Z1, Z2, is_top=True):
         else:  # Intersection == End
             line2 = None
         # Copy of the complete line (begin or end on cutting line, or cutting line is tangent)
-        line3 = type(self)(init_dict=self.as_dict())
+        line3 = self.copy()
 
         # If the line is tangent, begin and end are on the same side of the line
         if (Zb.imag > DELTA and Ze.imag > DELTA) or (
@@ -162,13 +162,13 @@ def split_line(self, Z1, Z2, is_top=True):
             Zm = (self.get_middle() - Z1) * exp(-1j * angle(Z2 - Z1))
             # begin and end are on the line => Zm.imag != 0
             if Zm.imag > 0 and is_top:
-                return [type(self)(init_dict=self.as_dict())]
+                return [self.copy()]
             elif Zm.imag > 0 and not is_top:
                 return []
             elif Zm.imag < 0 and is_top:
                 return []
             elif Zm.imag < 0 and not is_top:
-                return [type(self)(init_dict=self.as_dict())]
+                return [self.copy()]
 
         # Return the correct line(s) according to the points position
         line_list = list()
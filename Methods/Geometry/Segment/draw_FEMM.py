@@ -4,13 +4,12 @@
 @author franco_i
 """
 
-import femm
-
 from pyleecan.Functions.FEMM import boundary_prop
 
 
 def draw_FEMM(
     self,
+    femm,
     nodeprop=None,
     propname=None,
     elementsize=None,
@@ -22,6 +21,8 @@ def draw_FEMM(
 
     Parameters
     ----------
+    femm : _FEMMHandler
+        Solver backend (client to send the commands to FEMM)
     nodeprop :
         Nodal property
          (Default value = None)
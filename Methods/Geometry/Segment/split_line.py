@@ -31,7 +31,7 @@ def split_line(self, Z1, Z2, is_top=True):
 
     if len(Z_int) == 0:
         # No intersection copy the line
-        line = type(self)(init_dict=self.as_dict())
+        line = self.copy()
         if Zb.imag >= 0 and Ze.imag >= 0 and is_top:
             return line
         if Zb.imag >= 0 and Ze.imag >= 0 and not is_top:
@@ -43,18 +43,18 @@ def split_line(self, Z1, Z2, is_top=True):
         # One intersection => Three possible lines
         # Begin => Intersection
         if np_abs(Z_int[0] - self.begin) > DELTA:
-            line1 = type(self)(init_dict=self.as_dict())
+            line1 = self.copy()
             line1.end = Z_int[0]
         else:  # Begin == Intersection
             line1 = None
         # Intersection => End
         if np_abs(Z_int[0] - self.end) > DELTA:
-            line2 = type(self)(init_dict=self.as_dict())
+            line2 = self.copy()
             line2.begin = Z_int[0]
         else:  # Intersection == End
             line2 = None
         # Copy of the complete line (begin or end on cutting line)
-        line3 = type(self)(init_dict=self.as_dict())
+        line3 = self.copy()
 
         # Return the correct line according to the points position
         if Zb.imag > DELTA and is_top:
@@ -76,4 +76,4 @@ def split_line(self, Z1, Z2, is_top=True):
             return line3
     if len(Z_int) == 2:
         # The segment is on the line => Copy the line
-        return type(self)(init_dict=self.as_dict())
+        return self.copy()
@@ -0,0 +1,4 @@
+# -*- coding: utf-8 -*-
+
+# Code of each type of line in SurfArray.line_type
+LINE_TYPE = {"Segment": 0, "Arc1": 1, "Arc2": 2, "Arc3": 3}
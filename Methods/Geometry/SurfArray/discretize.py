@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+
+from numpy import concatenate, exp, linspace
+
+
+def discretize(self, nb_point=200):
+    """Discretize all the surfaces (same points as SurfLine.discretize)
+
+    Parameters
+    ----------
+    self : SurfArray
+        A SurfArray object
+    nb_point : int
+        Number of points on each line (in addition to begin and end)
+
+    Returns
+    -------
+    point_list : list
+        List of the complex coordinates of each surface (ndarray)
+    """
+
+    t = linspace(0, 1, nb_point + 2)
+    # All the lines at once (one line per row)
+    point = self.begin[:, None] + (self.end - self.begin)[:, None] * t
+    is_arc = self.line_type != 0
+    point[is_arc] = self.center[is_arc, None] + (
+        self.begin[is_arc] - self.center[is_arc]
+    )[:, None] * exp(1j * self.angle[is_arc, None] * t)
+
+    point_list = list()
+    surf_index = self.surf_index
+    for ii in range(len(self.label)):
+        start, stop = surf_index[ii], surf_index[ii + 1]
+        # The end of each line is the begin of the next one
+        surf_point = point[start:stop, :-1].reshape(-1)
+        if self.begin[start] != self.end[stop - 1]:  # Open surface
+            surf_point = concatenate((surf_point, point[stop - 1, -1:]))
+        point_list.append(surf_point)
+    return point_list
@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+
+from numpy import arange, exp, tile, concatenate
+
+from pyleecan.Classes._check import trusted
+
+
+def duplicate(self, Nrep, angle):
+    """Return a SurfArray with Nrep copies of the surfaces, the copy ii is
+    rotated by ii*angle (the surfaces are ordered by copy)
+
+    Parameters
+    ----------
+    self : SurfArray
+        A SurfArray object
+    Nrep : int
+        Number of copies
+    angle : float
+        Angle between two copies [rad]
+
+    Returns
+    -------
+    surf_array : SurfArray
+        The duplicated surfaces
+    """
+
+    rot = exp(1j * angle * arange(Nrep))[:, None]
+    nb_line = self.line_type.size
+    # Index of the first line of each surface of each copy
+    surf_index = self.surf_index[:-1] + nb_line * arange(Nrep)[:, None]
+
+    with trusted():
+        return type(self)(
+            line_type=tile(self.line_type, Nrep),
+            begin=(rot * self.begin).reshape(-1),
+            end=(rot * self.end).reshape(-1),
+            center=(rot * self.center).reshape(-1),
+            angle=tile(self.angle, Nrep),
+            radius=tile(self.radius, Nrep),
+            line_label=self.line_label * Nrep,
+            surf_index=concatenate((surf_index.reshape(-1), [nb_line * Nrep])),
+            label=self.label * Nrep,
+            point_ref=(rot * self.point_ref).reshape(-1),
+        )
@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+
+from numpy import isnan
+
+from pyleecan.Classes._check import trusted
+from pyleecan.Classes.Arc1 import Arc1
+from pyleecan.Classes.Arc2 import Arc2
+from pyleecan.Classes.Arc3 import Arc3
+from pyleecan.Classes.Segment import Segment
+from pyleecan.Classes.SurfLine import SurfLine
+
+
+def get_surf_list(self):
+    """Create the SurfLine objects of the SurfArray
+
+    Parameters
+    ----------
+    self : SurfArray
+        A SurfArray object
+
+    Returns
+    -------
+    surf_list : list
+        List of SurfLine objects
+    """
+
+    # Python types for the object properties
+    line_type = self.line_type.tolist()
+    begin = self.begin.tolist()
+    end = self.end.tolist()
+    center = self.center.tolist()
+    angle = self.angle.tolist()
+    radius = self.radius.tolist()
+    surf_index = self.surf_index.tolist()
+
+    surf_list = list()
+    # The values come from valid lines
+    with trusted():
+        for ii, label in enumerate(self.label):
+            line_list = list()
+            for jj in range(surf_index[ii], surf_index[ii + 1]):
+                if line_type[jj] == 0:
+                    line = Segment(begin=begin[jj], end=end[jj])
+                elif line_type[jj] == 1:
+                    line = Arc1(
+                        begin=begin[jj],
+                        end=end[jj],
+                        radius=radius[jj],
+                        is_trigo_direction=angle[jj] > 0,
+                    )
+                elif line_type[jj] == 2:
+                    line = Arc2(begin=begin[jj], center=center[jj], angle=angle[jj])
+                else:
+                    line = Arc3(
+                        begin=begin[jj], end=end[jj], is_trigo_direction=angle[jj] > 0
+                    )
+                line.label = self.line_label[jj]
+                line_list.append(line)
+            point_ref = self.point_ref[ii]
+            surf_list.append(
+                SurfLine(
+                    line_list=line_list,
+                    label=label,
+                    point_ref=None if isnan(point_ref) else complex(point_ref),
+                )
+            )
+    return surf_list
@@ -0,0 +1,25 @@
+# -*- coding: utf-8 -*-
+
+from numpy import exp
+
+
+def rotate(self, angle):
+    """Rotate all the surfaces
+
+    Parameters
+    ----------
+    self : SurfArray
+        A SurfArray object
+    angle : float
+        the angle of rotation [rad]
+
+    Returns
+    -------
+    None
+    """
+
+    rot = exp(1j * angle)
+    self.begin = self.begin * rot
+    self.end = self.end * rot
+    self.center = self.center * rot
+    self.point_ref = self.point_ref * rot
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+
+from numpy import array, nan
+
+from pyleecan.Methods.Geometry.SurfArray import LINE_TYPE
+
+
+def set_surf_list(self, surf_list):
+    """Set the SurfArray with the lines of a list of surfaces
+
+    Parameters
+    ----------
+    self : SurfArray
+        A SurfArray object
+    surf_list : list
+        List of Surface objects (their lines must be Segment, Arc1, Arc2 or Arc3)
+
+    Returns
+    -------
+    None
+    """
+
+    line_type, begin, end, center, angle, radius = [], [], [], [], [], []
+    line_label = list()
+    surf_index = [0]
+    for surf in surf_list:
+        for line in surf.get_lines():
+            code = LINE_TYPE[type(line).__name__]
+            line_type.append(code)
+            begin.append(line.get_begin())
+            end.append(line.get_end())
+            if code == 0:  # Segment
+                center.append(0)
+                angle.append(0)
+            else:
+                center.append(line.get_center())
+                angle.append(line.get_angle())
+            radius.append(line.radius if code == 1 else 0)
+            line_label.append(line.label)
+        surf_index.append(len(line_type))
+
+    self.line_type = array(line_type, dtype=int)
+    self.begin = array(begin, dtype=complex)
+    self.end = array(end, dtype=complex)
+    self.center = array(center, dtype=complex)
+    self.angle = array(angle, dtype=float)
+    self.radius = array(radius, dtype=float)
+    self.line_label = line_label
+    self.surf_index = array(surf_index, dtype=int)
+    self.label = [surf.label for surf in surf_list]
+    # nan for the surfaces without reference point
+    self.point_ref = array(
+        [nan if surf.point_ref is None else surf.point_ref for surf in surf_list],
+        dtype=complex,
+    )
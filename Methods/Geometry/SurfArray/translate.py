@@ -0,0 +1,22 @@
+# -*- coding: utf-8 -*-
+
+
+def translate(self, delta):
+    """Translate all the surfaces
+
+    Parameters
+    ----------
+    self : SurfArray
+        A SurfArray object
+    delta : complex
+        complex value for translation
+
+    Returns
+    -------
+    None
+    """
+
+    self.begin = self.begin + delta
+    self.end = self.end + delta
+    self.center = self.center + delta
+    self.point_ref = self.point_ref + delta
@@ -4,13 +4,19 @@ Compute the SurfLine surface method
 @date Created on Thu Jul 27 13:51:43 2018
 @copyright (C) 2015-2016 EOMYS ENGINEERING.
 @author pierre_b
-@todo unittest it
 """
+
+from numpy import array, roll, sin
+
+from pyleecan.Classes.Arc import Arc
+from pyleecan.Classes.Segment import Segment
 from pyleecan.Functions.Geometry.comp_surface_num import comp_surface_num
 
 
 def comp_surface(self):
-    """Compute the SurfLine surface
+    """Compute the SurfLine surface. The surface is computed analytically
+    (Green's formula on the segments and arcs), the numerical computation is
+    used only if the SurfLine has other types of line.
 
     Parameters
     ----------
@@ -24,7 +30,24 @@ def comp_surface(self):
 
     """
 
-    # Discretize the surface with lots of points to compute the surface numerically
-    point_list = self.discretize(200)
+    lines = self.get_lines()
+    if not all(isinstance(line, (Segment, Arc)) for line in lines):
+        # Discretize the surface with lots of points to compute the surface numerically
+        return comp_surface_num(self.discretize(200))
+
+    # Polygon of the line ends (chord of each line and junction to the next)
+    point_list = list()
+    for line in lines:
+        point_list.append(line.get_begin())
+        point_list.append(line.get_end())
+    point_array = array(point_list, dtype=complex)
+    S_acc = (point_array.conjugate() * roll(point_array, -1)).imag.sum()
+
+    # Surface between the chord and the arc (circular segment, signed)
+    for line in lines:
+        if isinstance(line, Arc):
+            alpha = line.get_angle()
+            R = abs(line.get_begin() - line.get_center())
+            S_acc += R ** 2 * (alpha - sin(alpha))
 
-    return comp_surface_num(point_list)
+    return abs(S_acc / 2.0)
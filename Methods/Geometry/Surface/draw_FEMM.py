@@ -7,6 +7,7 @@ from pyleecan.Classes.Arc3 import Arc3
 
 def draw_FEMM(
     self,
+    femm,
     nodeprop=None,
     maxseg=None,
     propname=None,
@@ -19,6 +20,8 @@ def draw_FEMM(
 
     Parameters
     ----------
+    femm : _FEMMHandler
+        Solver backend (client to send the commands to FEMM)
     nodeprop :
         Nodal property
          (Default value = None)
@@ -55,6 +58,7 @@ def draw_FEMM(
     for line in lines:
         if type(line) in [Arc1, Arc2, Arc3]:
             line.draw_FEMM(
+                femm=femm,
                 nodeprop=nodeprop,
                 maxseg=maxseg,
                 propname=propname,
@@ -63,6 +67,7 @@ def draw_FEMM(
             )
         else:
             line.draw_FEMM(
+                femm=femm,
                 nodeprop=nodeprop,
                 propname=propname,
                 elementsize=elementsize,
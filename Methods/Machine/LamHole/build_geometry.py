@@ -127,7 +127,7 @@ def build_geometry(self, sym=1, alpha=0, delta=0, is_simplified=False):
         # Copy the hole for Zh / sym
         for ii in range(Zh // sym):
             for surf in surf_hole:
-                new_surf = type(surf)(init_dict=surf.as_dict())
+                new_surf = surf.copy()
                 if "Magnet" in surf.label and ii % 2 != 0:  # if the surf is Magnet
                     # Changing the pole of the magnet (before reference number )
                     new_surf.label = new_surf.label[:-10] + "S" + new_surf.label[-9:]
@@ -8,8 +8,10 @@ Lamination with Buried Magnets computation of all masses method
 
 from numpy import pi
 from pyleecan.Classes.Lamination import Lamination
+from pyleecan.Functions.memoize import memoize
 
 
+@memoize
 def comp_masses(self):
     """Compute the Lamination masses
 
@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+
+from pyleecan.Functions.Geometry.merge_periodicity import merge_periodicity
+from pyleecan.Methods.Machine.Lamination.comp_periodicity import (
+    comp_periodicity as comp_periodicity_lam,
+)
+
+
+def comp_periodicity(self, is_mmf=True):
+    """Compute the angular periodicity of the lamination according to its
+    holes (one pole per hole for the holes with magnets), ventilations and
+    notches
+
+    Parameters
+    ----------
+    self : LamHole
+        A LamHole object
+    is_mmf : bool
+        False to ignore the magnets (geometry only)
+
+    Returns
+    -------
+    per_a : int
+        Number of angular periods of the lamination (0 if axisymmetric)
+    is_antiper_a : bool
+        True if the sources of the lamination are anti-periodic on half a
+        period (None if the lamination has no source)
+    """
+
+    per_list = [comp_periodicity_lam(self)]
+    for hole in self.hole:
+        if is_mmf and hole.has_magnet():
+            # The magnetization changes sign from one hole to the other
+            per_list.append((hole.Zh // 2, True))
+        else:
+            per_list.append((hole.Zh, None))
+
+    return merge_periodicity(per_list)
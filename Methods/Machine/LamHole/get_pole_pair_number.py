@@ -1,5 +1,5 @@
 # -*- coding: utf-8 -*-
-"""@package Methods.Machine.LamSlotMag.get_pole_pair_number
+"""@package Methods.Machine.LamHole.get_pole_pair_number
 Return the number of pair of pole method
 @date Created on Mon Feb 16 13:37:33 2015
 @copyright (C) 2015-2016 EOMYS ENGINEERING.
@@ -13,8 +13,8 @@ def get_pole_pair_number(self):
 
     Parameters
     ----------
-    self : LamSlotMag
-        A LamSlotMag object
+    self : LamHole
+        A LamHole object
 
     Returns
     -------
@@ -23,4 +23,4 @@ def get_pole_pair_number(self):
 
     """
 
-    return self.Nmag // 2
+    return self.hole[0].Zh // 2
@@ -68,7 +68,7 @@ def build_geometry(self, sym=1, alpha=0, delta=0):
     for ii in range(Zs // sym):
         # Duplicate and rotate the slot + bore for each slot
         for line in Slot_lines:
-            new_line = type(line)(init_dict=line.as_dict())
+            new_line = line.copy()
             new_line.rotate(ii * slot_pitch)
             line_list.append(new_line)
         bore_lines = self.get_bore_line(a0 + ii * slot_pitch, a1 + ii * slot_pitch)
@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+
+from pyleecan.Functions.Geometry.merge_periodicity import merge_periodicity
+from pyleecan.Methods.Machine.Lamination.comp_periodicity import (
+    comp_periodicity as comp_periodicity_lam,
+)
+
+
+def comp_periodicity(self, is_mmf=True):
+    """Compute the angular periodicity of the lamination according to its
+    slots, ventilations and notches
+
+    Parameters
+    ----------
+    self : LamSlot
+        A LamSlot object
+    is_mmf : bool
+        False to ignore the sources of the lamination (geometry only)
+
+    Returns
+    -------
+    per_a : int
+        Number of angular periods of the lamination (0 if axisymmetric)
+    is_antiper_a : bool
+        True if the sources of the lamination are anti-periodic on half a
+        period (None if the lamination has no source)
+    """
+
+    per_list = [comp_periodicity_lam(self)]
+    if self.slot is not None:
+        per_list.append((self.slot.Zs, None))
+
+    return merge_periodicity(per_list)
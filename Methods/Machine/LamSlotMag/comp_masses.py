@@ -8,8 +8,10 @@ Lamination with magnets computation of all masses method
 
 from numpy import pi
 from pyleecan.Classes.LamSlot import LamSlot
+from pyleecan.Functions.memoize import memoize
 
 
+@memoize
 def comp_masses(self):
     """Compute the Lamination masses (Mlam, Mmag)
 
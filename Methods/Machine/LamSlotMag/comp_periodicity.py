@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+
+from pyleecan.Functions.Geometry.merge_periodicity import merge_periodicity
+from pyleecan.Methods.Machine.LamSlot.comp_periodicity import (
+    comp_periodicity as comp_periodicity_slot,
+)
+
+
+def comp_periodicity(self, is_mmf=True):
+    """Compute the angular periodicity of the lamination according to its
+    magnets (one pole per slot), slots, ventilations and notches
+
+    Parameters
+    ----------
+    self : LamSlotMag
+        A LamSlotMag object
+    is_mmf : bool
+        False to ignore the magnets (geometry only)
+
+    Returns
+    -------
+    per_a : int
+        Number of angular periods of the lamination (0 if axisymmetric)
+    is_antiper_a : bool
+        True if the sources of the lamination are anti-periodic on half a
+        period (None if the lamination has no source)
+    """
+
+    per_list = [comp_periodicity_slot(self)]
+    if is_mmf and self.slot is not None and len(self.slot.magnet) > 0:
+        # The magnetization changes sign from one pole to the other
+        per_list.append((self.get_pole_pair_number(), True))
+
+    return merge_periodicity(per_list)
@@ -8,8 +8,10 @@ Computation of the mechanical radius of the Lamination
 """
 
 from numpy import array
+from pyleecan.Functions.memoize import memoize
 
 
+@memoize
 def comp_radius_mec(self):
     """Compute the mechanical radius of the Lamination [m]
 
@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+
+from numpy import allclose, exp, pi, roll
+
+from pyleecan.Functions.Geometry.merge_periodicity import merge_periodicity
+from pyleecan.Methods.Machine.Lamination.comp_periodicity import (
+    comp_periodicity as comp_periodicity_lam,
+)
+
+
+def comp_periodicity(self, is_mmf=True):
+    """Compute the angular periodicity of the lamination according to the
+    pattern of its slots (shape and position), ventilations and notches
+
+    Parameters
+    ----------
+    self : LamSlotMulti
+        A LamSlotMulti object
+    is_mmf : bool
+        False to ignore the sources of the lamination (geometry only)
+
+    Returns
+    -------
+    per_a : int
+        Number of angular periods of the lamination (0 if axisymmetric)
+    is_antiper_a : bool
+        True if the sources of the lamination are anti-periodic on half a
+        period (None if the lamination has no source)
+    """
+
+    per_list = [comp_periodicity_lam(self)]
+    Zs = len(self.slot_list)
+    if Zs > 0:
+        # Smallest shift of k slots that gives the same slots at the same
+        # positions rotated by 2*pi*k/Zs
+        for k in range(1, Zs + 1):
+            if Zs % k == 0 and (k == Zs or is_shift_sym(self, k)):
+                per_list.append((Zs // k, None))
+                break
+
+    return merge_periodicity(per_list)
+
+
+def is_shift_sym(self, k):
+    """Check if the slots are the same when shifted by k slots
+
+    Parameters
+    ----------
+    self : LamSlotMulti
+        A LamSlotMulti object
+    k : int
+        Number of slots of the shift
+
+    Returns
+    -------
+    is_sym : bool
+        True if the lamination is the same when rotated by 2*pi*k/Zs
+    """
+    Zs = len(self.slot_list)
+    for ii in range(Zs):
+        if self.slot_list[(ii + k) % Zs] != self.slot_list[ii]:
+            return False
+    angle = roll(self.alpha, -k) - self.alpha - 2 * pi * k / Zs
+    return allclose(exp(1j * angle), 1)
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+
+from numpy import pi
+
+from pyleecan.Classes._lazy import LazySurfRep
+from pyleecan.Classes.SurfArray import SurfArray
+from pyleecan.Classes.Winding import Winding
+from pyleecan.Methods import NotImplementedYetError
+
+
+def build_geometry_wind(self, sym=1, alpha=0, delta=0, is_simplified=False):
+    """Build the winding surfaces of all the slots as one slot pattern and its
+    rotations (the surfaces of each slot are created only when accessed)
+
+    Parameters
+    ----------
+    self : LamSlotWind
+        A LamSlotWind object
+    sym : int
+        Symmetry factor (1= full machine, 2= half of the machine...)
+    alpha : float
+        Angle for rotation [rad]
+    delta : complex
+        Complex value for translation
+    is_simplified: bool
+        True to avoid line superposition
+
+    Returns
+    -------
+    wind_rep : LazySurfRep
+        The winding surfaces (ordered by slot)
+    """
+    # getting number of slot
+    Zs = self.slot.Zs
+    assert (Zs % sym) == 0
+    # getting Nrad and Ntan
+    if type(self.winding) is Winding:
+        Nrad, Ntan = 1, 1
+    else:
+        try:
+            Nrad, Ntan = self.winding.get_dim_wind()
+        except NotImplementedYetError:
+            Nrad, Ntan = 1, 1
+    surf_Wind = self.slot.build_geometry_wind(
+        Nrad=Nrad, Ntan=Ntan, is_simplified=is_simplified, alpha=alpha, delta=delta
+    )
+
+    pattern = SurfArray()
+    pattern.set_surf_list(surf_Wind)
+    # The last character of the label is the slot reference number
+    pattern.label = [surf.label[:-1] + "{}" for surf in surf_Wind]
+    # Shift to have a tooth center on Ox
+    pattern.rotate(pi / Zs)
+
+    return LazySurfRep(pattern=pattern, Nrep=Zs // sym, angle=2 * pi / Zs)
@@ -7,8 +7,10 @@ Lamination with Winding computation of all masses method
 """
 
 from pyleecan.Classes.LamSlot import LamSlot
+from pyleecan.Functions.memoize import memoize
 
 
+@memoize
 def comp_masses(self):
     """Compute the Lamination masses
 
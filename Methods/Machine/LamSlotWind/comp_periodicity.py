@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+
+from pyleecan.Functions.Geometry.merge_periodicity import merge_periodicity
+from pyleecan.Methods.Machine.LamSlot.comp_periodicity import (
+    comp_periodicity as comp_periodicity_slot,
+)
+
+
+def comp_periodicity(self, is_mmf=True):
+    """Compute the angular periodicity of the lamination according to its
+    winding, slots, ventilations and notches
+
+    Parameters
+    ----------
+    self : LamSlotWind
+        A LamSlotWind object
+    is_mmf : bool
+        False to ignore the winding currents (geometry only)
+
+    Returns
+    -------
+    per_a : int
+        Number of angular periods of the lamination (0 if axisymmetric)
+    is_antiper_a : bool
+        True if the sources of the lamination are anti-periodic on half a
+        period (None if the lamination has no source)
+    """
+
+    per_list = [comp_periodicity_slot(self)]
+    if is_mmf and self.winding is not None and self.slot is not None:
+        Nperw, is_asym_wind = self.winding.comp_periodicity()
+        if is_asym_wind:
+            per_list.append((Nperw // 2, True))
+        else:
+            per_list.append((Nperw, False))
+
+    return merge_periodicity(per_list)
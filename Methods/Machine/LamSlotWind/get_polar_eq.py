@@ -17,7 +17,7 @@ def get_polar_eq(self):
     """
 
     # Copy the lamination
-    polar_eq = type(self)(init_dict=self.as_dict())
+    polar_eq = self.copy()
 
     # Compute the polar dimension of the slot
     Hwind = self.slot.comp_height_wind()
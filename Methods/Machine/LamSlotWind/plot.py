@@ -6,12 +6,23 @@ Lamination with Winding plot method
 @author pierre_b
 """
 
-from matplotlib.patches import Patch
+from matplotlib.patches import Patch, Polygon
 from matplotlib.pyplot import axis, legend
+from numpy import column_stack
 
 from pyleecan.Functions.Winding.find_wind_phase_color import find_wind_phase_color
 from pyleecan.Functions.init_fig import init_fig
-from pyleecan.Methods.Machine import PHASE_COLOR, PHASE_NAME, ROTOR_COLOR, STATOR_COLOR
+from pyleecan.Methods.Machine.LamSlot.build_geometry import build_geometry
+from pyleecan.Methods.Machine import (
+    ARC_NPOINT_D,
+    PATCH_COLOR_ALPHA,
+    PATCH_EDGE,
+    PATCH_EDGE_ALPHA,
+    PHASE_COLOR,
+    PHASE_NAME,
+    ROTOR_COLOR,
+    STATOR_COLOR,
+)
 from pyleecan.Classes.WindingSC import WindingSC
 
 
@@ -58,7 +69,7 @@ def plot(
 
     Zs = self.slot.Zs
     # Get the LamSlot surface(s)
-    surf_list = self.build_geometry(sym=sym, alpha=alpha, delta=delta)
+    surf_list = build_geometry(self, sym=sym, alpha=alpha, delta=delta)
 
     patches = list()
     # getting the matrix  wind_mat [Nrad,Ntan,Zs,qs] representing the winding
@@ -77,13 +88,33 @@ def plot(
             patches.append(surf.get_patch(color_lam, is_edge_only=is_edge_only))
         elif surf.label is not None and "_In" in surf.label:
             patches.append(surf.get_patch(is_edge_only=is_edge_only))
-        elif "Wind" in surf.label or "Bar" in surf.label:
-            if not is_lam_only:
-                color = find_wind_phase_color(wind_mat=wind_mat, label=surf.label)
-                patches.append(surf.get_patch(color=color, is_edge_only=is_edge_only))
         else:
             patches.append(surf.get_patch(is_edge_only=is_edge_only))
 
+    if not is_lam_only:
+        # The winding patches are computed from the slot pattern (without
+        # creating the surfaces of every slot)
+        wind_rep = self.build_geometry_wind(sym=sym, alpha=alpha, delta=delta)
+        if is_edge_only:
+            edgecolor = PATCH_EDGE_ALPHA
+        else:
+            edgecolor = PATCH_EDGE
+        label_list = [
+            label for ii in range(wind_rep.Nrep) for label in wind_rep.get_label(ii)
+        ]
+        for label, point in zip(label_list, wind_rep.discretize(ARC_NPOINT_D)):
+            if is_edge_only:
+                color = PATCH_COLOR_ALPHA
+            else:
+                color = find_wind_phase_color(wind_mat=wind_mat, label=label)
+            patches.append(
+                Polygon(
+                    column_stack((point.real, point.imag)),
+                    facecolor=color,
+                    edgecolor=edgecolor,
+                )
+            )
+
     if is_display:
         # Display the result
         (fig, axes, patch_leg, label_leg) = init_fig(fig)
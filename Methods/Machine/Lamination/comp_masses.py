@@ -6,7 +6,10 @@ Lamination computation of masses method
 @author pierre_b
 """
 
+from pyleecan.Functions.memoize import memoize
 
+
+@memoize
 def comp_masses(self):
     """Compute the masses of the Lamination
 
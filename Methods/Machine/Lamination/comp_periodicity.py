@@ -0,0 +1,29 @@
+# -*- coding: utf-8 -*-
+
+from pyleecan.Functions.Geometry.merge_periodicity import merge_periodicity
+
+
+def comp_periodicity(self, is_mmf=True):
+    """Compute the angular periodicity of the lamination according to its
+    ventilations and notches
+
+    Parameters
+    ----------
+    self : Lamination
+        A Lamination object
+    is_mmf : bool
+        False to ignore the sources of the lamination (geometry only)
+
+    Returns
+    -------
+    per_a : int
+        Number of angular periods of the lamination (0 if axisymmetric)
+    is_antiper_a : bool
+        True if the sources of the lamination are anti-periodic on half a
+        period (None if the lamination has no source)
+    """
+
+    per_list = [(vent.Zh, None) for vent in self.axial_vent]
+    per_list.extend([(notch.notch_shape.Zs, None) for notch in self.notch])
+
+    return merge_periodicity(per_list)
@@ -6,7 +6,10 @@ Compute the masses of the machine method
 @author pierre_b
 """
 
+from pyleecan.Functions.memoize import memoize
 
+
+@memoize
 def comp_masses(self):
     """Compute the masses of the machine
     - Mmach : Mass total [kg]
@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+
+from pyleecan.Functions.Geometry.merge_periodicity import merge_periodicity
+
+
+def comp_periodicity(self, is_mmfs=True, is_mmfr=True):
+    """Compute the largest angular periodicity of the machine (stator and
+    rotor geometry and sources). The removal of slots or ventilations only
+    increases the periodicity, so the result is valid for these cases too.
+
+    Parameters
+    ----------
+    self : Machine
+        A Machine object
+    is_mmfs : bool
+        False to ignore the stator sources
+    is_mmfr : bool
+        False to ignore the rotor sources
+
+    Returns
+    -------
+    per_a : int
+        Number of angular periods of the machine
+    is_antiper_a : bool
+        True if the machine is anti-periodic on half a period
+    """
+
+    per_a, is_antiper_a = merge_periodicity(
+        [
+            self.stator.comp_periodicity(is_mmf=is_mmfs),
+            self.rotor.comp_periodicity(is_mmf=is_mmfr),
+        ]
+    )
+    # An axisymmetric machine is computed on a single period
+    return max(per_a, 1), bool(is_antiper_a)
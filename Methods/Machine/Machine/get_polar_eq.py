@@ -16,7 +16,7 @@ def get_polar_eq(self):
     """
 
     # Copy the machine
-    polar_eq = type(self)(init_dict=self.as_dict())
+    polar_eq = self.copy()
 
     polar_eq.rotor = polar_eq.rotor.get_polar_eq()
     polar_eq.stator = polar_eq.stator.get_polar_eq()
@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+
+from pyleecan.Functions.memoize import memoize
+from pyleecan.Functions.Winding.comp_wind_mmf import comp_wind_mmf
+from pyleecan.Methods.Machine.Winding import WindingError
+
+
+@memoize
+def comp_mmf_spectrum(self, Nharm=1, I=None, Zs=None):
+    """Compute the spatial spectrum of the magnetomotive force of the winding
+    for the mechanical orders 1 to Nharm (cf comp_wind_mmf)
+
+    Parameters
+    ----------
+    self : Winding
+        A: Winding object
+    Nharm : int
+        Highest mechanical order to compute
+    I : numpy.ndarray
+        Current of each phase (qs,) [A] (None to return the MMF of each phase
+        for a current of 1 A)
+    Zs : int
+        Number of Slot (Integer >0)
+
+    Returns
+    -------
+    mmf: numpy.ndarray
+        Complex amplitude of each order (qs, Nharm) for each phase or (Nharm,)
+        for the currents I [A]
+    """
+    if Zs is None:
+        if self.parent is None:
+            raise WindingError(
+                "ERROR: The Winding object must be in a Lamination object."
+            )
+
+        if self.parent.slot is None:
+            raise WindingError(
+                "ERROR: The Winding object must be in a Lamination object with Slot."
+            )
+
+        Zs = self.parent.slot.Zs
+
+    assert Zs > 0, "Zs must be >0"
+    assert Zs % 1 == 0, "Zs must be an integer"
+
+    return comp_wind_mmf(self.comp_connection_mat(Zs), Nharm, I=I)
@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+
+from pyleecan.Functions.memoize import memoize
+from pyleecan.Functions.Winding.comp_wind_sym import comp_wind_sym
+from pyleecan.Methods.Machine.Winding import WindingError
+
+
+@memoize
+def comp_periodicity(self, Zs=None):
+    """Compute the periodicity and the anti-periodicity of the winding
+    (cf comp_wind_sym)
+
+    Parameters
+    ----------
+    self : Winding
+        A: Winding object
+    Zs : int
+        Number of Slot (Integer >0)
+
+    Returns
+    -------
+    Nperw: int
+        Number of electrical period of the winding
+    is_asym_wind: bool
+        True if the winding pattern is anti-periodic
+    """
+    if Zs is None:
+        if self.parent is None:
+            raise WindingError(
+                "ERROR: The Winding object must be in a Lamination object."
+            )
+
+        if self.parent.slot is None:
+            raise WindingError(
+                "ERROR: The Winding object must be in a Lamination object with Slot."
+            )
+
+        Zs = self.parent.slot.Zs
+
+    assert Zs > 0, "Zs must be >0"
+    assert Zs % 1 == 0, "Zs must be an integer"
+
+    return comp_wind_sym(self.comp_connection_mat(Zs))
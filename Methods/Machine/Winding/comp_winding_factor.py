@@ -6,7 +6,9 @@ Compute the Winding Factor of Phase 1
 @todo unittest
 @todo check for balanced system
 """
-from numpy import abs, exp, pi, sum, array, linspace
+from numpy import abs, exp, pi, sum, linspace, outer
+
+from pyleecan.Methods.Machine.Winding import WindingError
 
 
 def comp_winding_factor(self, Harmonics=[1]):
@@ -51,11 +53,7 @@ def comp_winding_factor(self, Harmonics=[1]):
     wind_ph1 = sum(wind_mat[:, :, :, phase], (0, 1))
     wind_ref = sum(abs(wind_mat[:, :, :, phase]))
 
-    xi = list()
-
-    for harm in Harmonics:
-        xi.append(abs(sum(exp(1j * slot_ang * harm) * wind_ph1)) / wind_ref)
-
-    xi = array(xi)
+    # All the harmonics at once (cf comp_winding_factor_mat for all the phases)
+    xi = abs(exp(1j * outer(Harmonics, slot_ang)).dot(wind_ph1)) / wind_ref
 
     return xi
@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+
+from pyleecan.Functions.memoize import memoize
+from pyleecan.Functions.Winding.comp_wind_factor import comp_wind_factor
+from pyleecan.Methods.Machine.Winding import WindingError
+
+
+@memoize
+def comp_winding_factor_mat(self, Nharm=1, Zs=None):
+    """Compute the winding factor of all the phases for the harmonic ranks 1
+    to Nharm (electrical)
+
+    Parameters
+    ----------
+    self : Winding
+        A: Winding object
+    Nharm : int
+        Highest harmonic rank to compute
+    Zs : int
+        Number of Slot (Integer >0)
+
+    Returns
+    -------
+    xi: numpy.ndarray
+        Winding factor of each phase and rank (qs, Nharm)
+    """
+    if Zs is None:
+        if self.parent is None:
+            raise WindingError(
+                "ERROR: The Winding object must be in a Lamination object."
+            )
+
+        if self.parent.slot is None:
+            raise WindingError(
+                "ERROR: The Winding object must be in a Lamination object with Slot."
+            )
+
+        Zs = self.parent.slot.Zs
+
+    assert Zs > 0, "Zs must be >0"
+    assert Zs % 1 == 0, "Zs must be an integer"
+
+    return comp_wind_factor(self.comp_connection_mat(Zs), self.p, Nharm)
@@ -6,13 +6,15 @@ Compute the Winding Matrix (for type 2) Method
 @author pierre_b
 """
 
-from numpy import array, power, zeros
+from numpy import add, arange, array, broadcast_to, zeros
 
+from pyleecan.Functions.memoize import memoize
 from pyleecan.Methods.Machine.Winding import WindingError
 from pyleecan.Functions.Winding.reverse_wind_mat import reverse_wind_mat
 from pyleecan.Functions.Winding.shift_wind_mat import shift_wind_mat
 
 
+@memoize
 def comp_connection_mat(self, Zs=None):
     """Compute the Winding Matrix (for winding type 2)
     type 2 : TOOTH WINDING, SINGLE LAYER ALTERNATE TEETH WOUND
@@ -73,15 +75,12 @@ def comp_connection_mat(self, Zs=None):
     # direction of each tooth is reversed
     wind_mat = zeros((1, 1, Zs, qs))
 
-    for k in range(0, int(Nt)):  # winding alternatively the teeth
-        for q in range(0, qs):
-            xenc = q * 2 + k * 2 * qs + array([1, 2])
-            wind_mat[0][0][int((xenc[0] - 1) % Zs)][q] = (
-                power(-1, xenc[0] + q + k + 1) * Ntcoil
-            )
-            wind_mat[0][0][(xenc[1] - 1) % Zs][q] = (
-                power(-1, xenc[1] + q + k + 1) * Ntcoil
-            )
+    # winding alternatively the teeth (tooth k of phase q)
+    k = arange(int(Nt))[:, None, None]
+    q = arange(qs)[None, :, None]
+    xenc = q * 2 + k * 2 * qs + array([1, 2])
+    q = broadcast_to(q, xenc.shape)
+    add.at(wind_mat, (0, 0, (xenc - 1) % Zs, q), (-1.0) ** (xenc + q + k + 1) * Ntcoil)
 
     # Apply the transformations
     if self.is_reverse_wind:
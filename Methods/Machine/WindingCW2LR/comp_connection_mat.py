@@ -5,13 +5,15 @@ Compute the Winding Matrix (for type 5) Method
 @copyright (C) 2015-2016 EOMYS ENGINEERING.
 @author pierre_b
 """
-from numpy import array, mod, zeros
+from numpy import add, arange, broadcast_to, zeros
 
+from pyleecan.Functions.memoize import memoize
 from pyleecan.Methods.Machine.Winding import WindingError
 from pyleecan.Functions.Winding.reverse_wind_mat import reverse_wind_mat
 from pyleecan.Functions.Winding.shift_wind_mat import shift_wind_mat
 
 
+@memoize
 def comp_connection_mat(self, Zs=None):
     """Compute the Winding Matrix (for winding type 5) (Nlay_rad=1,Nlay_tan=1)
     type 5 : TOOTH WINDING, DOUBLE LAYER ALL TEETH WOUND, RADIAL SUPERPOSITION
@@ -65,31 +67,26 @@ def comp_connection_mat(self, Zs=None):
     # creates highest harmonic at Zs/2+1 and Zs/2-1
     if ms == 0.5:  # then Zs/qs is integer
         # traditional non overlapping all teeth wound winding
-        for q in range(0, self.qs):
-            for k in range(0, Zs // self.qs):  # number of Ncgr coils
-                xenc = -(q) + array([1, 0]) - (k) * qs
-                wind_mat[0, 0, mod(xenc[0] - 1, Zs), q] = +Ntcoil  # right/top/2
-                wind_mat[1, 0, mod(xenc[1] - 1, Zs), q] = -Ntcoil  # left/bottom/1
+        # (phase q, coil k of each phase)
+        q = arange(self.qs)[:, None]
+        k = arange(Zs // self.qs)[None, :]
+        xenc = 1 - q - k * self.qs
+        q = broadcast_to(q, xenc.shape)
+        add.at(wind_mat, (0, 0, (xenc - 1) % Zs, q), Ntcoil)  # right/top/2
+        add.at(wind_mat, (1, 0, (xenc - 2) % Zs, q), -Ntcoil)  # left/bottom/1
     elif (
         ms != 0.5 and Ncgr % 1 == 0
     ):  # ms!=0.5 and Ncgr is an integer (ms>0.25 && ms<0.5)
-        # new algorithm to reverse the coils
-        for q in range(0, self.qs):
-            for k in range(0, int((Zs // self.qs) // Ncgr)):  # number of Ncgr coils
-                for l in range(0, int(Ncgr)):
-                    wind_mat[
-                        1, 0, int(mod((q) * Ncgr + (k) * qs * Ncgr - 1 + (l), Zs)), q
-                    ] = (
-                        -(-1) ** (l + q - 1 + k) * Ntcoil
-                    )  # left / bottom / 1
-                    wind_mat[
-                        0,
-                        0,
-                        int(mod((q) * Ncgr + 1 + (k) * qs * Ncgr - 1 + (l), Zs)),
-                        q,
-                    ] = (
-                        +(-1) ** (l + q - 1 + k) * Ntcoil
-                    )  # right / top / 2
+        # new algorithm to reverse the coils (phase q, group k, coil l)
+        Ncgr = int(Ncgr)
+        q = arange(self.qs)[:, None, None]
+        k = arange((Zs // self.qs) // Ncgr)[None, :, None]
+        l = arange(Ncgr)[None, None, :]
+        slot = q * Ncgr + k * self.qs * Ncgr - 1 + l
+        value = (-1.0) ** (l + q - 1 + k) * Ntcoil
+        q = broadcast_to(q, slot.shape)
+        add.at(wind_mat, (1, 0, slot % Zs, q), -value)  # left / bottom / 1
+        add.at(wind_mat, (0, 0, (slot + 1) % Zs, q), value)  # right / top / 2
 
         wind_mat = wind_mat[:, :, ::-1, :]
     else:
@@ -1,13 +1,15 @@
 # -*- coding: utf-8 -*-
 
 
-from numpy import mod, zeros, arange, sign
+from numpy import add, array, arange, broadcast_to, sign, zeros
 
+from pyleecan.Functions.memoize import memoize
 from pyleecan.Methods.Machine.Winding import WindingError
 from pyleecan.Functions.Winding.reverse_wind_mat import reverse_wind_mat
 from pyleecan.Functions.Winding.shift_wind_mat import shift_wind_mat
 
 
+@memoize
 def comp_connection_mat(self, Zs=None):
     """Compute the Winding Matrix (for winding type 3 or 4) (Nlay_rad=1 or 2,Nlay_tan=1)
     type 3 or 4 : DISTRIBUTED SHORTED PITCH INTEGRAL WINDING
@@ -67,28 +69,21 @@ def comp_connection_mat(self, Zs=None):
     tausp = int(tausp)  # if ms is an integer, tausp is
 
     # shorted pitch Nlay-layered integral overlapping windings
-    for nl in range(0, nlay):
-        for i in range(0, p):
-            for k in range(0, qs):
-                ph = abs(phase_order[k])
-                # cf Gieras p36
-                z = (
-                    arange(1, ms + 1)
-                    + i * (Zs / p)
-                    + k * ms
-                    + nl * (coil_pitch - tausp)
-                )
-
-                sp = ((z - 1) % Zs).astype(int)  # positive pole
-                sm = ((z + Zs / 2 / p - 1) % Zs).astype(int)  # negative pole
-                for s in sp:
-                    wind_mat[nl, 0, s, ph - 1] = Ntcoil * sign(
-                        phase_order[k]
-                    )  # Accumulation for a single slot
-                for s in sm:
-                    wind_mat[nl, 0, s, ph - 1] = -Ntcoil * sign(
-                        phase_order[k]
-                    )  # Accumulation for a single slot
+    # cf Gieras p36: slots of each layer (nl), pole pair (i), phase (k) and
+    # coil (last axis), computed at once
+    nl = arange(nlay)[:, None, None, None]
+    i = arange(p)[None, :, None, None]
+    k = arange(qs)[None, None, :, None]
+    z = arange(1, ms + 1) + i * (Zs // p) + k * ms + nl * (coil_pitch - tausp)
+
+    sp = (z - 1) % Zs  # positive pole
+    sm = (z + tausp - 1) % Zs  # negative pole
+    ph = (abs(array(phase_order)) - 1)[None, None, :, None]
+    Nsign = Ntcoil * sign(phase_order)[None, None, :, None]
+    shape = z.shape
+    nl, ph = broadcast_to(nl, shape), broadcast_to(ph, shape)
+    add.at(wind_mat, (nl, 0, sp, ph), broadcast_to(Nsign, shape))
+    add.at(wind_mat, (nl, 0, sm, ph), broadcast_to(-Nsign, shape))
 
     # Apply the transformations
     if self.is_reverse_wind:
@@ -7,13 +7,15 @@ Compute the Winding Matrix (for type 10) Method
 @todo unittest it
 """
 
-from numpy import zeros
+from numpy import add, arange, zeros
 
+from pyleecan.Functions.memoize import memoize
 from pyleecan.Methods.Machine.Winding import WindingError
 from pyleecan.Functions.Winding.reverse_wind_mat import reverse_wind_mat
 from pyleecan.Functions.Winding.shift_wind_mat import shift_wind_mat
 
 
+@memoize
 def comp_connection_mat(self, Zs=None):
     """Compute the Winding Matrix (for winding type 10)
     type 10 : Squirrel cage Winding (elementary circuit loop involving bar n°1
@@ -60,10 +62,10 @@ def comp_connection_mat(self, Zs=None):
 
     wind_mat = zeros((1, 1, Zs, self.qs))
 
-    for ii in range(Zs):
-        # phase n°ii
-        wind_mat[0, 0, ii, ii] = -1
-        wind_mat[0, 0, (ii - 1) % Zs, ii] = 1
+    # phase n°ii
+    ii = arange(Zs)
+    add.at(wind_mat, (0, 0, ii, ii), -1)
+    add.at(wind_mat, (0, 0, (ii - 1) % Zs, ii), 1)
 
     # Apply the transformations
     if self.is_reverse_wind:
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+
+from pyleecan.Functions.Mesh.append_rows import append_rows
+
+
+def add_elements(self, connectivity, tags, groups=-1):
+    """Add several elements at once. The elements which already exist, are
+    repeated in connectivity or have repeated nodes are not added.
+
+    Parameters
+    ----------
+    self : ElementMat
+        an ElementMat object
+    connectivity : numpy.ndarray
+        node tags of the elements (one element per row)
+    tags : numpy.ndarray
+        the new element tags
+    groups : numpy.ndarray
+        the group number of the elements (or one group number for all)
+
+    Returns
+    -------
+    is_created : numpy.ndarray
+        True for the elements of connectivity which have been added
+    """
+
+    nb_node = self.nb_node_per_element
+    connectivity = np.asarray(connectivity).reshape((-1, nb_node))
+    nb_add = connectivity.shape[0]
+    tags = np.broadcast_to(tags, (nb_add,))
+    groups = np.broadcast_to(np.asarray(groups, dtype=int), (nb_add,))
+
+    # The sorted node tags identify an element (whatever the node order)
+    key_dtype = np.dtype([("n" + str(ii), np.int64) for ii in range(nb_node)])
+    new_sorted = np.sort(connectivity, axis=1).astype(np.int64)
+    new_keys = new_sorted.view(key_dtype).ravel()
+    if self._cache is None:
+        self._cache = dict()
+    element_keys = self._cache.get("element_keys")
+    if element_keys is None or element_keys[0] is not self.connectivity:
+        # Sorted keys of the existing elements
+        if self.connectivity.size == 0:
+            keys = np.zeros(0, dtype=key_dtype)
+        else:
+            old_sorted = np.sort(self.connectivity.reshape((-1, nb_node)), axis=1)
+            keys = np.sort(old_sorted.astype(np.int64).view(key_dtype).ravel())
+    else:
+        keys = element_keys[1]
+
+    # Elements with repeated nodes
+    is_created = np.all(new_sorted[:, 1:] != new_sorted[:, :-1], axis=1)
+    # Elements which already exist
+    if keys.size > 0:
+        pos = np.searchsorted(keys, new_keys)
+        pos[pos == keys.size] = keys.size - 1
+        is_created &= keys[pos] != new_keys
+    # Elements repeated in connectivity (only the first one is added)
+    is_first = np.zeros(nb_add, dtype=bool)
+    is_first[np.unique(new_keys, return_index=True)[1]] = True
+    is_created &= is_first
+
+    # Add the elements in the growth buffers
+    if np.any(is_created):
+        append_rows(self, "connectivity", connectivity[is_created])
+        append_rows(self, "tag", tags[is_created])
+        append_rows(self, "group", groups[is_created])
+        self.nb_elem = self.nb_elem + int(np.sum(is_created))
+        added_keys = np.sort(new_keys[is_created])
+        keys = np.insert(keys, np.searchsorted(keys, added_keys), added_keys)
+        # The node to element incidence must be computed again
+        self._cache.pop("node2element", None)
+    self._cache["element_keys"] = (self.connectivity, keys)
+
+    return is_created
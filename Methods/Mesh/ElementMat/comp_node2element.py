@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+
+
+def comp_node2element(self):
+    """Compute the node to element incidence in compressed sparse row format.
+    The incidence is computed once and reused until the elements are modified
+    (add_element).
+
+    Parameters
+    ----------
+    self : ElementMat
+        an ElementMat object
+
+    Returns
+    -------
+    node_tags : numpy.ndarray
+        Sorted tags of the nodes of the elements
+    indptr : numpy.ndarray
+        The elements of node_tags[ii] are elem_index[indptr[ii]:indptr[ii+1]]
+    elem_index : numpy.ndarray
+        Index (row in connectivity) of the elements of each node
+    """
+
+    if self._cache is None:
+        self._cache = dict()
+    node2element = self._cache.get("node2element")
+    if node2element is None or node2element[0] is not self.connectivity:
+        # Sort the nodes of all the elements (the row gives the element)
+        connect = self.connectivity.ravel()
+        order = np.argsort(connect, kind="stable")
+        node_sorted = connect[order]
+        # Start of each node in the sorted nodes
+        is_start = np.ones(node_sorted.size, dtype=bool)
+        is_start[1:] = node_sorted[1:] != node_sorted[:-1]
+        start = np.flatnonzero(is_start)
+        indptr = np.append(start, node_sorted.size)
+        elem_index = order // max(self.nb_node_per_element, 1)
+        node2element = (self.connectivity, node_sorted[start], indptr, elem_index)
+        self._cache["node2element"] = node2element
+
+    return node2element[1:]
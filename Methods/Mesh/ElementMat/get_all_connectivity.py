@@ -25,34 +25,19 @@ def get_all_connectivity(self, group=None):
     connect = self.connectivity
     elem_groups = self.group
     elem_tags = self.tag
-    connect_select = np.array([], dtype=int)
-    tag_select = np.array([], dtype=int)
-
-    if group is not None:
-
-        if isinstance(group, (int, float, complex)):
-            group = np.array([group], dtype=int)
-
-        if type(group) is list or type(group) is np.ndarray:
-            for grp in group:
-                Ipos_select = np.where(elem_groups == grp)[0]
-                tag_select = np.concatenate([tag_select, elem_tags[Ipos_select]])
-                k = 0
-                for Ipos in Ipos_select:
-                    if k == 0:
-                        connect_select = np.append(
-                            connect_select, connect[Ipos, :], axis=0
-                        )
-                        k += 1
-                    else:
-                        connect_select = np.vstack((connect_select, connect[Ipos, :]))
-                        k += 1
-
-    elif group is None:
-        connect_select = connect
-        tag_select = elem_tags
-
-    else:
-        return None, None
+
+    if group is None:
+        return connect, elem_tags
+    if isinstance(group, (int, float, complex)):
+        group = np.array([group], dtype=int)
+    if not (type(group) is list or type(group) is np.ndarray) or connect.size == 0:
+        return np.array([], dtype=int), np.array([], dtype=int)
+
+    # Select all the elements of the groups at once
+    Ipos_select = np.isin(elem_groups, group)
+    connect_select = connect.reshape((-1, self.nb_node_per_element))[Ipos_select]
+    tag_select = elem_tags[Ipos_select]
+    if len(tag_select) == 1:
+        connect_select = connect_select[0]
 
     return connect_select, tag_select
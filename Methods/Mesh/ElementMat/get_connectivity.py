@@ -28,7 +28,7 @@ def get_connectivity(self, elem_tag=None):
         return None
     elif nb_elem == 1:
         if tag[0] == elem_tag:
-            return connect
+            return np.reshape(connect, (-1,))
         else:
             return None
     else:
@@ -21,18 +21,16 @@ def get_group(self, group_number):
      """
     module = __import__("pyleecan.Classes." + "ElementMat", fromlist=["ElementMat"])
     grp_elem = getattr(module, "ElementMat")()
-
-    connect_parent = self.connectivity
-    groups = self.group
-    tags = self.tag
     grp_elem.nb_node_per_element = self.nb_node_per_element
 
     grp_connect, grp_tags = self.get_all_connectivity(group_number)
     nb_elem_grp = len(grp_tags)
-    if nb_elem_grp > 1:
-        for ie in range(nb_elem_grp):
-            grp_elem.add_element(grp_connect[ie], grp_tags[ie])
-    elif nb_elem_grp == 1:
-        grp_elem.add_element(grp_connect, grp_tags[0])
+
+    # The elements of the group are set at once (they are already unique)
+    if nb_elem_grp > 0:
+        grp_elem.connectivity = grp_connect
+        grp_elem.tag = grp_tags
+        grp_elem.group = -np.ones(nb_elem_grp, dtype=int)
+        grp_elem.nb_elem = nb_elem_grp
 
     return grp_elem
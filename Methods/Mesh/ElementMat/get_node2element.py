@@ -3,32 +3,41 @@
 import numpy as np
 
 
-def get_node2element(self, node_tag):
+def get_node2element(self, node_tag, is_index=False):
     """Return all element tags of elements containing the node tag node_tag
+    (or one of the node tags, an element is given once per node it contains)
 
     Parameters
     ----------
     self : ElementMat
         an ElementMat object
     node_tag : int
-        a node tag
+        a node tag (or an array of node tags)
+    is_index : bool
+        True to return the element index (rows of connectivity) instead of the tags
 
     Returns
     -------
-    nodes_to_elements: dict
+    nodes_to_elements: numpy.ndarray
         Element tags of all elements containing the node node_tag
 
     """
 
-    nodes_to_elements = np.array([], dtype=int)
-    connect = self.connectivity
-    tag = self.tag
-
-    if len(connect.shape) > 1:  # If there is more than 1 element
-        Ielem = np.where(connect == node_tag)[0]
-        nodes_to_elements = tag[Ielem]
+    node_tags, indptr, elem_index = self.comp_node2element()
+
+    # Position of the requested nodes in the incidence
+    node_tag = np.atleast_1d(node_tag)
+    if node_tags.size == 0 or node_tag.dtype == object:
+        return np.array([], dtype=int)
+    pos = np.searchsorted(node_tags, node_tag)
+    pos[pos == node_tags.size] = 0
+    pos = pos[node_tags[pos] == node_tag]  # Remove the nodes without element
+
+    # Concatenate the elements of each node
+    nb_elem = indptr[pos + 1] - indptr[pos]
+    index = np.repeat(indptr[pos] - np.cumsum(nb_elem) + nb_elem, nb_elem)
+    index += np.arange(index.size)
+    if is_index:
+        return elem_index[index]
     else:
-        if sum(connect == node_tag) > 0:
-            nodes_to_elements = tag
-
-    return nodes_to_elements
+        return self.tag[elem_index[index]]
@@ -19,16 +19,10 @@ def is_exist(self, node_tags):
             True if the element already exist
     """
 
-    # Check the existence of the element
-    e = np.array([], dtype=int)
-    for nd_tag in node_tags:
-        e = np.concatenate((e, self.get_node2element(nd_tag)))
-
-    unique, unique_counts = np.unique(e, return_counts=True)
-    for ie in range(len(unique)):
-        if unique_counts[ie] == self.nb_node_per_element and unique_counts[ie] == len(
-            node_tags
-        ):
-            # If this condition is valid, the element already exist
-            return True
-    return False
+    # Check the existence of the element: one of the elements of the nodes
+    # contains all the nodes
+    if len(node_tags) != self.nb_node_per_element:
+        return False
+    e = self.get_node2element(node_tags, is_index=True)
+    unique_counts = np.unique(e, return_counts=True)[1]
+    return bool(np.any(unique_counts == len(node_tags)))
@@ -18,7 +18,7 @@ def get_vertice(self, elem_type=None, group=None):
     Returns
     -------
     vertice: numpy.array
-        Selected vertices
+        Selected vertices (None if a node of the elements is missing)
 
     """
 
@@ -26,12 +26,12 @@ def get_vertice(self, elem_type=None, group=None):
     nb_elem = len(tags_select)
     nb_node_per_elem = self.element[elem_type].nb_node_per_element
 
-    if nb_elem == 1:
-        vertices = np.zeros((nb_node_per_elem, 2))
-        vertices = self.node.get_coord(connect_select)
+    if nb_elem == 0:
+        return np.zeros((0, nb_node_per_elem, 2))
     else:
-        vertices = np.zeros((nb_elem, nb_node_per_elem, 2))
-        for ie in range(nb_elem):
-            vertices[ie, :, :] = self.node.get_coord(connect_select[ie, :])
-
-    return vertices
+        # Single gather: (nb_elem, nb_node_per_elem, 2) or (nb_node_per_elem, 2)
+        # if there is only one element
+        index = self.node.get_index(connect_select)
+        if np.any(index < 0):
+            return None
+        return self.node.coordinate[index]
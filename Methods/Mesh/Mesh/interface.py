@@ -1,7 +1,6 @@
 # -*- coding: utf-8 -*-
 from pyleecan.Classes.NodeMat import NodeMat
 from pyleecan.Classes.ElementMat import ElementMat
-from collections import Counter
 import numpy as np
 
 
@@ -32,88 +31,28 @@ def interface(self, other_mesh):
 
         # Find the nodes on the interface (they are in both in and out)
         interface_nodes_tags = np.intersect1d(nodes_tags, other_nodes_tags)
-        nb_interf_nodes = len(interface_nodes_tags)
-
-        tmp_element_tags = np.array([], dtype=int)
-        tmp_element_tags_other = np.array([], dtype=int)
-        node2elem_dict = dict()
-        node2elem_other_dict = dict()
-        # Find the elements in contact with the interface (they contain the interface nodes)
-        for ind in range(nb_interf_nodes):
-            tmp_tag = self.element[key].get_node2element(interface_nodes_tags[ind])
-            node2elem_dict[interface_nodes_tags[ind]] = tmp_tag
-            tmp_element_tags = np.concatenate((tmp_element_tags, tmp_tag))
-
-            tmp_tag = other_mesh.element[key].get_node2element(
-                interface_nodes_tags[ind]
-            )
-            node2elem_other_dict[interface_nodes_tags[ind]] = tmp_tag
-            tmp_element_tags_other = np.concatenate((tmp_element_tags_other, tmp_tag))
-
-        # Find element tags in contact and number of nodes in contact for each element
-        tmp_element_tags_unique = np.unique(
-            tmp_element_tags
-        )  # List of element tag which are in contact with the interface
-        nb_elem_contact = len(tmp_element_tags_unique)
-        nb_element_tags_unique = np.zeros((nb_elem_contact, 1), dtype=int)
-        elem2node_dict = dict()
-        for ind in range(nb_elem_contact):
-            # Number of node on the interface for each element from tmp_element_tags_unique
-            Ipos = np.where(tmp_element_tags_unique[ind] == tmp_element_tags)[0]
-            nb_element_tags_unique[ind] = len(Ipos)
-            # Which nodes exactly are concerned; store them in elem2node_dict
-            nodes_tmp = self.get_node_tags(tmp_element_tags_unique[ind])
-            nodes_tmp_interf = np.array([], dtype=int)
-            for ipos in range(len(nodes_tmp)):
-                if nodes_tmp[ipos] in interface_nodes_tags:
-                    nodes_tmp_interf = np.concatenate(
-                        (nodes_tmp_interf, np.array([nodes_tmp[ipos]], dtype=int))
-                    )
-            elem2node_dict[tmp_element_tags_unique[ind]] = nodes_tmp_interf
-
-        # Build element
-        seg_elem_pos = np.where(nb_element_tags_unique == 2)[
-            0
-        ]  # Position in the vector tmp_element_tags_unique
-        seg_elem_tag = tmp_element_tags_unique[
-            seg_elem_pos
-        ]  # Vector of element tags with only 2 nodes on the interface
-        nb_elem_segm = len(seg_elem_tag)
-        for i_seg in range(nb_elem_segm):
-            tag_two_nodes = elem2node_dict[seg_elem_tag[i_seg]]
-            new_tag = new_mesh.get_new_tag()
-            new_mesh.element["Segment2"].add_element(tag_two_nodes, new_tag)
 
         # The same operation is applied in the other mesh because in the corners, 1 element will contain 3 nodes,
         # and it will not be detected by seg_elem_pos. Applying the same process to the other mesh solve the issue
         # if add_element ignore the already defined elements.
-        tmp_element_tags_other_unique = np.unique(tmp_element_tags_other)
-        nb_node_other_contact = len(tmp_element_tags_other_unique)
-        nb_element_tags_other_unique = np.zeros((nb_node_other_contact, 1), dtype=int)
-        elem2node_other_dict = dict()
-        for ind in range(nb_node_other_contact):
-            Ipos = np.where(
-                tmp_element_tags_other_unique[ind] == tmp_element_tags_other
-            )[0]
-            nb_element_tags_other_unique[ind] = len(Ipos)
-            nodes_tmp = other_mesh.get_node_tags(tmp_element_tags_other_unique[ind])
-            nodes_tmp_interf = np.array([], dtype=int)
-            for ipos in range(len(nodes_tmp)):
-                if nodes_tmp[ipos] in interface_nodes_tags:
-                    nodes_tmp_interf = np.concatenate(
-                        (nodes_tmp_interf, np.array([nodes_tmp[ipos]], dtype=int))
-                    )
-            elem2node_other_dict[tmp_element_tags_other_unique[ind]] = nodes_tmp_interf
+        for mesh in [self, other_mesh]:
+            element = mesh.element[key]
+            connect = element.connectivity.reshape((-1, element.nb_node_per_element))
+
+            # Find the elements in contact with the interface (they contain the interface nodes)
+            # and the number of nodes in contact for each element
+            elem_index, nb_node_contact = np.unique(
+                element.get_node2element(interface_nodes_tags, is_index=True),
+                return_counts=True,
+            )
 
-        # Build segment elements in other mesh
-        seg_elem_pos = np.where(nb_element_tags_other_unique == 2)[0]
-        seg_elem_tag = tmp_element_tags_other_unique[seg_elem_pos]
-        nb_elem_segm = len(seg_elem_tag)
-        for i_seg in range(nb_elem_segm):
-            tag_two_nodes = elem2node_other_dict[seg_elem_tag[i_seg]]
-            # It is not really added if it already exist
-            new_tag = new_mesh.get_new_tag()
-            new_mesh.element["Segment2"].add_element(tag_two_nodes, new_tag)
+            # Build segment elements from the elements with 2 nodes on the interface
+            seg_connect = connect[elem_index[nb_node_contact == 2]]
+            is_interface = np.isin(seg_connect, interface_nodes_tags)
+            for tag_two_nodes in seg_connect[is_interface].reshape((-1, 2)):
+                # It is not really added if it already exist
+                new_tag = new_mesh.get_new_tag()
+                new_mesh.element["Segment2"].add_element(tag_two_nodes, new_tag)
 
     return new_mesh
     # TODO : Extend the code to higher dimension (3 nodes triangles for tetrahedra interfaces ...)
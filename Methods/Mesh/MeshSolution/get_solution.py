@@ -2,6 +2,8 @@
 
 import numpy as np
 
+from pyleecan.Classes.Solution import Solution
+
 
 def get_solution(self, j_t0=0):
     """Return the solution corresponding to a time step.
@@ -16,8 +18,17 @@ def get_solution(self, j_t0=0):
     Returns
     -------
     solution: Solution
-        a Solution object
+        a Solution object (with views on the stacked fields if is_stacked_solution)
 
     """
 
-    return self.solution[j_t0]
+    if self.is_stacked_solution:
+        solution = Solution()
+        for field_type in ["nodal", "edge", "face", "volume"]:
+            for key, field in getattr(self.solution[0], field_type).items():
+                solution.set_field(
+                    field_value=field[j_t0], field_name=key, field_type=field_type
+                )
+        return solution
+    else:
+        return self.solution[j_t0]
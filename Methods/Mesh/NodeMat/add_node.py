@@ -4,34 +4,23 @@ import numpy as np
 
 
 def add_node(self, coord):
-    """Define a new NodeMat object based on a set of elements.
+    """Add a new node if there is no node closer than delta
 
      Parameters
      ----------
      self : NodeMat
          an NodeMat object
-     element : Element
-         an Element object
+     coord : numpy.array
+         coordinate of the node
 
      Returns
      -------
-     node: Node
-         a Node object corresponding to Element
+     new_tag: int
+         tag of the new node (None if the node already exists)
 
      """
-    if self.is_exist(coord):
+    nb_node = self.nb_node
+    new_tag = self.add_nodes(np.reshape(coord, (1, -1)))[0]
+    if self.nb_node == nb_node:
         return None
-    else:
-        if self.coordinate.size > 0:
-            self.coordinate = np.vstack((self.coordinate, coord))
-            new_tag = max(self.tag) + 1
-            self.tag = np.concatenate((self.tag, np.array([new_tag], dtype=int)))
-            self.nb_node = self.nb_node + 1
-        else:
-            self.coordinate = np.concatenate((self.coordinate, coord))
-            new_tag = 0
-            self.tag = np.array([], dtype=int)
-            self.tag = np.concatenate((self.tag, np.array([new_tag], dtype=int)))
-            self.nb_node = self.nb_node + 1
-
     return new_tag
@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+
+from pyleecan.Functions.Mesh.append_rows import append_rows
+from pyleecan.Functions.Mesh.find_close_node import find_close_node
+
+
+def add_nodes(self, coord):
+    """Add several nodes at once. A node closer than delta to an existing node
+    (or to a previous node of coord) is not added.
+
+     Parameters
+     ----------
+     self : NodeMat
+         an NodeMat object
+     coord : numpy.ndarray
+         coordinates of the nodes (one node per row)
+
+     Returns
+     -------
+     tags: numpy.ndarray
+         tag of each node (tag of the existing node for the duplicates)
+
+     """
+
+    coord = np.asarray(coord, dtype=float)
+    coord = coord.reshape((-1, coord.shape[-1]))
+    nb_add = coord.shape[0]
+
+    # Nodes which already exist (spatial hash of the existing nodes)
+    index = self.get_close_index(coord)
+    is_exist = index >= 0
+    if self.tag.size > 0:
+        tags = np.zeros(nb_add, dtype=np.result_type(self.tag, int))
+        tags[is_exist] = self.tag[index[is_exist]]
+        new_tag = np.max(self.tag) + 1
+    else:
+        tags = np.zeros(nb_add, dtype=int)
+        new_tag = 0
+
+    # Nodes repeated in coord: all the close nodes get the tag of the first one
+    new_id = np.flatnonzero(~is_exist)
+    first = find_close_node(coord[new_id], coord[new_id], self.delta)
+    while np.any(first[first] != first):
+        first = first[first]
+    is_first = first == np.arange(new_id.size)
+    new_tags = np.zeros(new_id.size, dtype=tags.dtype)
+    new_tags[is_first] = new_tag + np.arange(np.sum(is_first))
+    tags[new_id] = new_tags[first]
+
+    # Add the nodes in the growth buffers
+    if np.any(is_first):
+        append_rows(self, "coordinate", coord[new_id[is_first]])
+        append_rows(self, "tag", new_tags[is_first])
+        self.nb_node = self.nb_node + int(np.sum(is_first))
+        # The tag index must be built again
+        self._cache.pop("tag_index", None)
+
+    return tags
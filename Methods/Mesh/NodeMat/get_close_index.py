@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+
+from pyleecan.Functions.Mesh.find_close_node import find_close_node
+
+
+def get_close_index(self, coord):
+    """Return the row index in coordinate of the first node closer than delta
+    to each point (batch query with the spatial hash of get_grid)
+
+     Parameters
+     ----------
+     self : NodeMat
+         an NodeMat object
+     coord : np.array
+         coordinates of the points (one point per row)
+
+     Returns
+     -------
+     index: np.array
+         an array of row index (-1 for the points without node)
+
+     """
+
+    coord = np.asarray(coord, dtype=float)
+    coord = coord.reshape((-1, coord.shape[-1]))
+    if self.nb_node == 0:
+        return np.full(coord.shape[0], -1, dtype=int)
+
+    coord_ref = self.coordinate.reshape((-1, coord.shape[1]))
+    return find_close_node(coord_ref, coord, self.delta, self.get_grid())
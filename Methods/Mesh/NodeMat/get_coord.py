@@ -20,17 +20,11 @@ def get_coord(self, node_tags):
 
      """
 
-    nd_case = np.size(node_tags)
-    coord = np.zeros((nd_case, 2))
-    if nd_case == 1:
-        Ipos = np.where(self.tag == node_tags)[0]
-        coord = self.coordinate[Ipos, :]
-    else:
-        for ind in range(nd_case):
-            Ipos = np.where(self.tag == node_tags[ind])[0]
-            coord[ind, :] = self.coordinate[Ipos, :]
+    if node_tags is None:
+        return None
 
-    if np.size(coord) == 0:
+    index = self.get_index(np.ravel(node_tags))
+    if index.size == 0 or np.any(index < 0):
         return None
     else:
-        return coord
+        return self.coordinate[index, :]
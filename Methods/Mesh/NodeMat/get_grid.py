@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+
+from pyleecan.Functions.Mesh.find_close_node import comp_grid, comp_grid_key
+
+
+def get_grid(self):
+    """Return the spatial hash of the nodes (uniform grid of cell size delta).
+    The grid is built once and updated when nodes are added with add_node(s).
+
+     Parameters
+     ----------
+     self : NodeMat
+         an NodeMat object
+
+     Returns
+     -------
+     grid: tuple
+         (key_sorted, order) sorted cell hash and corresponding node index
+
+     """
+
+    if self._cache is None:
+        self._cache = dict()
+    coord = self.coordinate
+    nb_dim = coord.shape[-1]
+    grid = self._cache.get("grid")
+
+    if grid is not None and grid[0] is coord and grid[1] == self.delta:
+        return grid[2:]
+    if (
+        grid is not None
+        and grid[1] == self.delta
+        and grid[0].base is not None
+        and grid[0].base is coord.base
+        and grid[0].ndim == coord.ndim == 2
+        and grid[0].shape[0] <= coord.shape[0]
+    ):
+        # Nodes added at the end of the same buffer: insert the new keys
+        _, _, key_sorted, order = grid
+        nb_old = grid[0].shape[0]
+        key_new = comp_grid_key(coord[nb_old:], self.delta)
+        order_new = np.argsort(key_new, kind="stable")
+        pos = np.searchsorted(key_sorted, key_new[order_new], side="right")
+        key_sorted = np.insert(key_sorted, pos, key_new[order_new])
+        order = np.insert(order, pos, nb_old + order_new)
+    else:
+        key_sorted, order = comp_grid(coord.reshape((-1, nb_dim)), self.delta)
+
+    self._cache["grid"] = (coord, self.delta, key_sorted, order)
+    return key_sorted, order
@@ -16,7 +16,8 @@ def get_group(self, element):
      Returns
      -------
      node: Node
-         a Node object corresponding to Element
+         a Node object corresponding to Element (the node tags of Element
+         missing in self are ignored)
 
      """
     module = __import__("pyleecan.Classes." + "NodeMat", fromlist=["NodeMat"])
@@ -24,12 +25,11 @@ def get_group(self, element):
 
     node_tags = element.get_all_node_tags()
 
-    node.nb_node = len(node_tags)
-    node.coordinate = np.zeros((node.nb_node, 2))  # TO BE Extended to 3D
-    node.tag = np.zeros((node.nb_node))
-    for ind in range(node.nb_node):
-        Ipos = np.where(node_tags[ind] == self.tag)[0]
-        node.coordinate[ind, :] = self.coordinate[Ipos, :]
-        node.tag[ind] = self.tag[Ipos]
+    index = self.get_index(node_tags)
+    index = index[index >= 0]  # Missing node tags
+
+    node.nb_node = len(index)
+    node.coordinate = self.coordinate[index, :]  # TO BE Extended to 3D
+    node.tag = self.tag[index]
 
     return node
@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+
+
+def get_index(self, node_tags):
+    """Return the row index in coordinate of node(s). The tag index is built
+    once (sorted tags) and reused until the nodes are modified (add_node).
+
+     Parameters
+     ----------
+     self : NodeMat
+         an NodeMat object
+     node_tags : np.array
+         an array of node tags
+
+     Returns
+     -------
+     index: np.array
+         an array of row index (-1 for the tags which don't exist)
+
+     """
+
+    if self._cache is None:
+        self._cache = dict()
+    tag_index = self._cache.get("tag_index")
+    if tag_index is None or tag_index[0] is not self.tag:
+        # Build the index (sorted tags and corresponding rows)
+        order = np.argsort(self.tag, kind="stable")
+        tag_index = (self.tag, self.tag[order], order)
+        self._cache["tag_index"] = tag_index
+    _, tag_sorted, order = tag_index
+
+    node_tags = np.atleast_1d(node_tags)
+    if tag_sorted.size == 0:
+        return np.full(node_tags.shape, -1, dtype=int)
+    pos = np.searchsorted(tag_sorted, node_tags)
+    pos[pos == tag_sorted.size] = 0  # Tag after the last one (doesn't exist)
+    index = order[pos]
+    index[tag_sorted[pos] != node_tags] = -1
+    return index
@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+from scipy.spatial import cKDTree
+
+
+def get_nearest(self, coord):
+    """Return the nearest node of each point. The KD-tree of the nodes is built
+    once and reused until the nodes are modified.
+
+     Parameters
+     ----------
+     self : NodeMat
+         an NodeMat object
+     coord : np.array
+         coordinates of the points (one point per row)
+
+     Returns
+     -------
+     tags: np.array
+         tag of the nearest node of each point
+     dist: np.array
+         distance between each point and its nearest node
+
+     """
+
+    if self._cache is None:
+        self._cache = dict()
+    coord = np.asarray(coord, dtype=float)
+    coord = coord.reshape((-1, coord.shape[-1]))
+    if self.nb_node == 0:
+        return None, None
+
+    kd_tree = self._cache.get("kd_tree")
+    if kd_tree is None or kd_tree[0] is not self.coordinate:
+        coord_ref = self.coordinate.reshape((-1, coord.shape[1]))
+        kd_tree = (self.coordinate, cKDTree(coord_ref))
+        self._cache["kd_tree"] = kd_tree
+
+    dist, index = kd_tree[1].query(coord)
+    return self.tag[index], dist
@@ -0,0 +1,27 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+
+
+def get_tag(self, coord):
+    """Return the tags of the nodes defined by their coordinates (a node closer
+    than delta to each point)
+
+     Parameters
+     ----------
+     self : NodeMat
+         an NodeMat object
+     coord : np.array
+         coordinates of the nodes (one node per row)
+
+     Returns
+     -------
+     tags: np.array
+         an array of node tags. Return None if a point has no node
+
+     """
+
+    index = self.get_close_index(coord)
+    if np.any(index < 0):
+        return None
+    return self.tag[index]
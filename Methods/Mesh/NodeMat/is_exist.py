@@ -4,46 +4,26 @@ import numpy as np
 
 
 def is_exist(self, new_coord):
-    """Check the existence of a node defined by its coordinates
+    """Check the existence of node(s) defined by their coordinates (a node
+    closer than delta). The nodes are searched with the spatial hash of
+    get_grid, so that each query only checks the nodes of the neighbor cells.
 
     Parameters
     ----------
     self : NodeMat
         an NodeMat object
-    coord : numpy.array
-        coordinate of the node
+    new_coord : numpy.array
+        coordinate of the node (or one node per row)
 
     Returns
     -------
         bool
-            True if the element already exist
+            True if the node already exist (array of bool for several nodes)
     """
-    # Check the existence of the element
-    delta = self.delta
-    nb_node = self.nb_node
-    coords = self.coordinate
 
-    if nb_node == 0:
-        return False
-    if nb_node == 1:
-        dist = np.sqrt(np.sum(np.square(coords - new_coord)))
-        if dist > delta:
-            return False
-        else:
-            return True
-    else:
-        point = np.tile(new_coord, (nb_node, 1))
-        dist_node = np.reshape(
-            np.sqrt(
-                np.square(coords[:, 0] - point[:, 0])
-                + np.square(coords[:, 1] - point[:, 1])
-            ),
-            (nb_node, 1),
-        )
-
-        min_node_list = np.argsort(dist_node, axis=0)
+    is_node = self.get_close_index(new_coord) >= 0
 
-        if dist_node[min_node_list[0]] > delta:
-            return False
-        else:
-            return True
+    if np.ndim(new_coord) == 1:
+        return bool(is_node[0])
+    else:
+        return is_node
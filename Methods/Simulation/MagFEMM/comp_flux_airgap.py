@@ -5,9 +5,11 @@
 """
 
 from pyleecan.Functions.FEMM.draw_FEMM import draw_FEMM
+from pyleecan.Classes._FEMMHandler import _FEMMHandler
+from pyleecan.Methods.Simulation.Input import InputError
 
 
-def comp_flux_airgap(self, output):
+def comp_flux_airgap(self, output, femm=None):
     """Compute using FEMM the flux in the airgap
 
     Parameters
@@ -16,11 +18,25 @@ def comp_flux_airgap(self, output):
         a MagFEMM object
     output : Output
         an Output object
+    femm : _FEMMHandler
+        Solver backend (None to run FEMM with a new _FEMMHandler)
     """
 
     # Set the symmetry factor if needed
-    if self.is_symmetry_a:
+    if self.is_periodicity_a and not self.is_sliding_band:
+        raise InputError(
+            "ERROR: MagFEMM.is_periodicity_a requires MagFEMM.is_sliding_band"
+        )
+    elif self.is_periodicity_a:
+        # Largest periodicity of the machine geometry and sources
+        sym, is_antiper_a = output.simu.machine.comp_periodicity(
+            is_mmfs=self.is_mmfs, is_mmfr=self.is_mmfr
+        )
+        if is_antiper_a:
+            sym *= 2
+    elif self.is_symmetry_a:
         sym = self.sym_a
+        is_antiper_a = self.is_antiper_a
         if self.is_antiper_a:
             sym *= 2
         if self.is_sliding_band:
@@ -29,15 +45,20 @@ def comp_flux_airgap(self, output):
             )  # When there is a symmetry, there must be a sliding band.
     else:
         sym = 1
+        is_antiper_a = False
+
+    if femm is None:
+        femm = _FEMMHandler()
 
     # Setup the FEMM simulation
     # Geometry building and assigning property in FEMM
     FEMM_dict = draw_FEMM(
+        femm,
         output,
         is_mmfr=self.is_mmfr,
         is_mmfs=self.is_mmfs,
         sym=sym,
-        is_antiper=self.is_antiper_a,
+        is_antiper=is_antiper_a,
         type_calc_leakage=self.type_calc_leakage,
         is_remove_vent=self.is_remove_vent,
         is_remove_slotS=self.is_remove_slotS,
@@ -53,4 +74,4 @@ def comp_flux_airgap(self, output):
     )
 
     # Solve for all time step and store all the results in output
-    self.solve_FEMM(output, sym, FEMM_dict)
+    self.solve_FEMM(femm, output, sym, FEMM_dict, is_antiper_a)
@@ -1,107 +1,81 @@
 import os
 import numpy as np
 
-from pyleecan.Generator import MAIN_DIR
 from pyleecan.Classes.Mesh import Mesh
 from pyleecan.Classes.ElementMat import ElementMat
 from pyleecan.Classes.NodeMat import NodeMat
 from pyleecan.Classes.Solution import Solution
-from femm import callfemm
 from os.path import join
 
 
-def get_meshsolution(self, is_get_mesh, is_save_FEA, save_path, j_t0):
+def get_meshsolution(self, femm, save_path, path_lua, is_get_mesh, idworker="1"):
     """Load the mesh data and solution data. FEMM must be working and a simulation must have been solved.
+    The data are written by FEMM in binary files (little-endian int32 and
+    float64 records) created by the get_mesh_data_FEMM.lua script.
 
     Parameters
     ----------
     self : MagFEMM
         a MagFEMM object
+    femm : _FEMMHandler
+        Solver backend (client to send the commands to FEMM)
+    save_path : str
+        Path to the folder of the binary files
+    path_lua : str
+        Path to the Lua script extracting the data (created from
+        get_mesh_data_FEMM.lua with the same is_get_mesh and idworker)
     is_get_mesh : bool
-        1 to load the mesh and solution into the simulation
-    is_save_FEA : bool
-        1 to save the mesh and solution into a .json file
-    j_t0 : int
-        Targeted time step
+        True to load the mesh (False to load only the solution)
+    idworker : str
+        Worker id (to name the temporary files of the worker)
 
     Returns
     -------
-    res_path: str
-        path to the result folder
+    mesh: Mesh
+        The mesh of the FEMM model (None if not is_get_mesh)
+    solution: Solution
+        The solution on the mesh
     """
 
-    idworker = "1"  # For parallelization TODO
-
-    path_txt = join(MAIN_DIR, "Functions", "FEMM") + "\\"
-    path_txt_lua = path_txt.replace("\\", "/")
-    path_lua_in = join(path_txt, "get_mesh_data_FEMM.lua")
-    path_lua_out = join(save_path, "get_mesh_data_FEMM" + idworker + ".lua")
-    path_txt_out = save_path + "\\"
-    path_txt_out = path_txt_out.replace("\\", "/")
-
-    # Create a new LUA script with current paths
-    file_lua = open(path_lua_in, "r")
-    text_lua = file_lua.read()
-    file_lua.close()
-    text_lua = text_lua.replace("my_path_txt", path_txt_out)
-    text_lua = text_lua.replace("my_id_worker", idworker)
-
-    file_lua_out = open(path_lua_out, "w")
-    file_lua_out.write(text_lua)
-    file_lua_out.close()
-
     # Run the LUA externally using FEMM LUA console and store the data in the
-    # temporary text files
-    path_lua_out2 = path_lua_out.replace("\\", "/")
-    callfemm('dofile("' + path_lua_out2 + '")')
-
-    # Delete the LUA script
-    os.remove(path_lua_out)
-
-    # Read the nodes and elements files
-    path_node = join(save_path, "nodes" + idworker + ".txt")
-    path_element = join(save_path, "elements" + idworker + ".txt")
-    listNd0 = np.loadtxt(path_node, delimiter=" ")
-    listElem0 = np.loadtxt(path_element, dtype="i", delimiter=" ")
-    NbNd = len(listNd0)
-    NbElem = len(listElem0)
-
-    # Node list
-    listNd = np.zeros(shape=(NbNd, 3))
-    listNd[:, 0] = listNd0[:, 0]
-    listNd[:, 1] = listNd0[:, 1]
-
-    # Element list
-    # listElem = np.zeros(shape=(NbElem, 3))
-    listElem = listElem0[:, 0:3] - 1
-
-    # Delete text files
-    os.remove(path_node)
-    os.remove(path_element)
-
-    # Read the results file
-    path_results = join(save_path, "results" + idworker + ".txt")
-    results = np.loadtxt(path_results, delimiter=" ")
-
-    # Delete text files
-    os.remove(path_results)
+    # temporary binary files
+    femm.callfemm('dofile("' + path_lua + '")')
 
     # Create Mesh and Solution dictionaries
-    if (not self.is_sliding_band) or (j_t0 == 0):
+    if is_get_mesh:
+        # Read the nodes (x, y) and elements (3 nodes, group) files
+        path_node = join(save_path, "nodes" + idworker + ".bin")
+        path_element = join(save_path, "elements" + idworker + ".bin")
+        listNd = np.fromfile(path_node, dtype="<f8").reshape(-1, 2)
+        listElem0 = np.fromfile(path_element, dtype="<i4").reshape(-1, 4)
+        NbNd = len(listNd)
+        NbElem = len(listElem0)
+
+        # Delete binary files
+        os.remove(path_node)
+        os.remove(path_element)
+
         mesh = Mesh()
         mesh.element["Triangle3"] = ElementMat(
-            connectivity=listElem,
+            connectivity=listElem0[:, 0:3] - 1,
             nb_elem=NbElem,
-            group=listElem0[:, 6],
+            group=listElem0[:, 3],
             nb_node_per_element=3,
             tag=np.linspace(0, NbElem - 1, NbElem),
         )
         mesh.node = NodeMat(
-            coordinate=listNd[:, 0:2], nb_node=NbNd, tag=np.linspace(0, NbNd - 1, NbNd)
+            coordinate=listNd, nb_node=NbNd, tag=np.linspace(0, NbNd - 1, NbNd)
         )
     else:
         mesh = None
 
+    # Read the results file (Bx, By, Hx, Hy, mu, Az for each element)
+    path_results = join(save_path, "results" + idworker + ".bin")
+    results = np.fromfile(path_results, dtype="<f8").reshape(-1, 6)
+
+    # Delete binary files
+    os.remove(path_results)
+
     B = results[:, 0:2]
     H = results[:, 2:4]
     mu = results[:, 4]
@@ -1,104 +1,125 @@
-import femm
-import numpy as np
-from os.path import basename, splitext
-
-from numpy import zeros, pi, roll, mean, max as np_max, min as np_min
-from pyleecan.Functions.FEMM.update_FEMM_simulation import update_FEMM_simulation
-from pyleecan.Functions.FEMM.comp_FEMM_torque import comp_FEMM_torque
-from pyleecan.Functions.FEMM.comp_FEMM_Phi_wind import comp_FEMM_Phi_wind
+from os.path import splitext
+from shutil import copyfile
+from concurrent.futures import ProcessPoolExecutor
+
+from numpy import zeros, empty, pi, roll, mean, array_split
+from numpy import max as np_max, min as np_min
 from pyleecan.Classes.MeshSolution import MeshSolution
 from pyleecan.Classes.Mesh import Mesh
 from pyleecan.Classes.Solution import Solution
 from os.path import join
 
 
-def solve_FEMM(self, output, sym, FEMM_dict):
+def solve_FEMM(self, femm, output, sym, FEMM_dict, is_antiper=False):
+    """Solve the FEMM model for every time step and store the results in output.
+    With nb_worker > 1, the time steps are split in contiguous blocks solved in
+    parallel by several FEMM sessions (one per worker process).
+
+    Parameters
+    ----------
+    self : MagFEMM
+        a MagFEMM object
+    femm : _FEMMHandler
+        Solver backend (client to send the commands to FEMM)
+    output : Output
+        an Output object
+    sym : int
+        Symmetry factor (1 = full machine, 2 = half machine ...)
+    FEMM_dict : dict
+        Dictionnary containing the main parameters of FEMM (including circuits and materials)
+    is_antiper : bool
+        True if the model is anti-periodic (to rebuild the flux density of the
+        full machine)
+    """
 
     # Loading parameters for readibilitys
-    angle = output.mag.angle
-
-    L1 = output.simu.machine.stator.comp_length()
     Nt_tot = output.mag.Nt_tot  # Number of time step
     Na_tot = output.mag.Na_tot  # Number of angular step
     save_path = self.get_path_save(output)
 
     if hasattr(output.simu.machine.stator, "winding"):
         qs = output.simu.machine.stator.winding.qs  # Winding phase number
-        Npcpp = output.simu.machine.stator.winding.Npcpp
         Phi_wind_stator = zeros((Nt_tot, qs))
     else:
         Phi_wind_stator = None
 
-    # Create the mesh
-    femm.mi_createmesh()
-
     # Initialize results matrix
     Br = zeros((Nt_tot, Na_tot))
     Bt = zeros((Nt_tot, Na_tot))
     Tem = zeros((Nt_tot, 1))
 
-    lam_int = output.simu.machine.get_lamination(True)
-    lam_ext = output.simu.machine.get_lamination(False)
-    Rgap_mec_int = lam_int.comp_radius_mec()
-    Rgap_mec_ext = lam_ext.comp_radius_mec()
+    # The mesh is the same for all the time steps (the rotor rotation is set
+    # on the sliding band boundary condition)
+    meshFEMM = [Mesh()]
+    solutionFEMM = [Solution()]
 
-    if self.is_get_mesh or self.is_save_FEA:
-        meshFEMM = [Mesh() for ii in range(Nt_tot)]
-        solutionFEMM = [Solution() for ii in range(Nt_tot)]
-    else:
-        meshFEMM = [Mesh()]
-        solutionFEMM = [Solution()]
-
-    # Compute the data for each time step
-    for ii in range(Nt_tot):
-        # Update rotor position and currents
-        update_FEMM_simulation(
-            output=output,
-            materials=FEMM_dict["materials"],
-            circuits=FEMM_dict["circuits"],
-            is_mmfs=self.is_mmfs,
-            is_mmfr=self.is_mmfr,
-            j_t0=ii,
-            is_sliding_band=self.is_sliding_band,
-        )
-        # try "previous solution" for speed up of FEMM calculation
-        if self.is_sliding_band:
-            try:
-                base = basename(self.get_path_save_fem(output))
-                ans_file = splitext(base)[0] + ".ans"
-                femm.mi_setprevious(ans_file, 0)
-            except:
-                pass
-
-        # Run the computation
-        femm.mi_analyze()
-        femm.mi_loadsolution()
-
-        # Get the flux result
-        if self.is_sliding_band:
-            for jj in range(Na_tot):
-                Br[ii, jj], Bt[ii, jj] = femm.mo_getgapb("bc_ag2", angle[jj] * 180 / pi)
-        else:
-            Rag = (Rgap_mec_ext + Rgap_mec_int) / 2
-            for jj in range(Na_tot):
-                B = femm.mo_getb(Rag * np.cos(angle[jj]), Rag * np.sin(angle[jj]))
-                Br[ii, jj] = B[0] * np.cos(angle[jj]) + B[1] * np.sin(angle[jj])
-                Bt[ii, jj] = -B[0] * np.sin(angle[jj]) + B[1] * np.cos(angle[jj])
-
-        # Compute the torque
-        Tem[ii] = comp_FEMM_torque(FEMM_dict, sym=sym)
-
-        if hasattr(output.simu.machine.stator, "winding"):
-            # Phi_wind computation
-            Phi_wind_stator[ii, :] = comp_FEMM_Phi_wind(
-                qs, Npcpp, is_stator=True, Lfemm=FEMM_dict["Lfemm"], L1=L1, sym=sym
-            )
+    # Compute the rotor position once for all the workers
+    output.get_angle_rotor()
 
-        # Load mesh data & solution
-        if self.is_get_mesh or self.is_save_FEA:
-            meshFEMM[ii], solutionFEMM[ii] = self.get_meshsolution(
-                self.is_get_mesh, self.is_save_FEA, save_path, ii
+    # Split the time steps in contiguous blocks (one per worker) to keep the
+    # "previous solution" speed up of the sliding band within each block
+    if femm.is_parallel:
+        nb_worker = min(self.nb_worker, Nt_tot)
+    else:
+        nb_worker = 1
+    time_split = array_split(range(Nt_tot), nb_worker)
+
+    if nb_worker == 1:
+        # Solve all the time steps in the current FEMM session
+        res_list = [
+            self.solve_FEMM_worker(
+                femm,
+                output,
+                sym,
+                FEMM_dict,
+                time_split[0].tolist(),
+                is_antiper=is_antiper,
             )
+        ]
+    else:
+        # Each worker solves its own copy of the FEMM model in its own session
+        path_fem = self.get_path_save_fem(output)
+        with ProcessPoolExecutor(max_workers=nb_worker) as executor:
+            future_list = list()
+            for ii, time_list in enumerate(time_split):
+                idworker = str(ii + 1)
+                path_fem_worker = splitext(path_fem)[0] + "_worker" + idworker + ".fem"
+                copyfile(path_fem, path_fem_worker)
+                future_list.append(
+                    executor.submit(
+                        self.solve_FEMM_worker,
+                        femm,
+                        output,
+                        sym,
+                        FEMM_dict,
+                        time_list.tolist(),
+                        idworker,
+                        path_fem_worker,
+                        is_antiper,
+                    )
+                )
+            res_list = [future.result() for future in future_list]
+
+    # Gather the results of all the workers in time step order
+    for time_list, res in zip(time_split, res_list):
+        Br[time_list, :] = res["Br"]
+        Bt[time_list, :] = res["Bt"]
+        Tem[time_list, :] = res["Tem"]
+        if Phi_wind_stator is not None:
+            Phi_wind_stator[time_list, :] = res["Phi_wind_stator"]
+    if self.is_get_mesh or self.is_save_FEA:
+        meshFEMM[0] = res_list[0]["mesh"]
+        # Stack the fields of all the time steps in contiguous (Nt, Nelem, k)
+        # arrays of a single Solution
+        solution_list = [sol for res in res_list for sol in res["solution"]]
+        for field_type in ["nodal", "edge", "face", "volume"]:
+            for key, field in getattr(solution_list[0], field_type).items():
+                field_stack = empty((Nt_tot,) + field.shape, dtype=field.dtype)
+                for ii, solution in enumerate(solution_list):
+                    field_stack[ii] = solution.get_field(key)
+                solutionFEMM[0].set_field(
+                    field_value=field_stack, field_name=key, field_type=field_type
+                )
 
     # Shift to take into account stator position
     roll_id = int(self.angle_stator * Na_tot / (2 * pi))
@@ -116,12 +137,12 @@ def solve_FEMM(self, output, sym, FEMM_dict):
     output.mag.FEMM_dict = FEMM_dict
 
     if self.is_get_mesh:
-        cond = (not self.is_sliding_band) or (Nt_tot == 1)
         output.mag.meshsolution = MeshSolution(
             name="FEMM_magnetic_mesh",
             mesh=meshFEMM,
             solution=solutionFEMM,
-            is_same_mesh=cond,
+            is_same_mesh=True,
+            is_stacked_solution=True,
         )
 
     if self.is_save_FEA:
@@ -0,0 +1,199 @@
+from os import remove
+from os.path import basename, splitext, isfile, join
+
+from numpy import zeros, ones, pi, cos, sin, array
+from pyleecan.Functions.FEMM.update_FEMM_simulation import update_FEMM_simulation
+from pyleecan.Functions.FEMM.comp_FEMM_torque import comp_FEMM_torque
+from pyleecan.Functions.FEMM.comp_FEMM_Phi_wind import comp_FEMM_Phi_wind
+from pyleecan.Functions.FEMM.create_FEMM_lua import create_FEMM_lua
+
+
+def solve_FEMM_worker(
+    self,
+    femm,
+    output,
+    sym,
+    FEMM_dict,
+    time_list,
+    idworker="1",
+    path_fem=None,
+    is_antiper=False,
+):
+    """Solve a block of time steps in a single FEMM session
+
+    Parameters
+    ----------
+    self : MagFEMM
+        a MagFEMM object
+    femm : _FEMMHandler
+        Solver backend (client to send the commands to FEMM)
+    output : Output
+        an Output object
+    sym : int
+        Symmetry factor (1 = full machine, 2 = half machine ...)
+    FEMM_dict : dict
+        Dictionnary containing the main parameters of FEMM (including circuits and materials)
+    time_list : list
+        Index of the time steps to solve
+    idworker : str
+        Worker id (to name the temporary files of the worker)
+    path_fem : str
+        Path to the worker copy of the .fem file to open in a new FEMM session
+        (None to use the current FEMM session)
+    is_antiper : bool
+        True if the model is anti-periodic (the flux density changes sign from
+        one symmetry sector to the next)
+
+    Returns
+    -------
+    res : dict
+        Results of the time steps of time_list (Br, Bt, Tem, Phi_wind_stator,
+        mesh, solution). The mesh is the same for all the time steps.
+    """
+    # Loading parameters for readibility
+    angle = output.mag.angle
+    L1 = output.simu.machine.stator.comp_length()
+    Na_tot = output.mag.Na_tot  # Number of angular step
+    Nt = len(time_list)  # Number of time step of the worker
+    save_path = self.get_path_save(output)
+
+    if hasattr(output.simu.machine.stator, "winding"):
+        qs = output.simu.machine.stator.winding.qs  # Winding phase number
+        Npcpp = output.simu.machine.stator.winding.Npcpp
+        Phi_wind_stator = zeros((Nt, qs))
+    else:
+        Phi_wind_stator = None
+
+    # Open the FEMM model in a new session if needed
+    is_new_session = path_fem is not None
+    if is_new_session:
+        femm.openfemm(1)  # Hidden window
+        femm.opendocument(path_fem)
+    else:
+        path_fem = self.get_path_save_fem(output)
+
+    # Create the mesh
+    femm.mi_createmesh()
+
+    # Initialize results matrix
+    Br = zeros((Nt, Na_tot))
+    Bt = zeros((Nt, Na_tot))
+    Tem = zeros((Nt, 1))
+    mesh = None
+    solution_list = list()
+
+    lam_int = output.simu.machine.get_lamination(True)
+    lam_ext = output.simu.machine.get_lamination(False)
+    Rgap_mec_int = lam_int.comp_radius_mec()
+    Rgap_mec_ext = lam_ext.comp_radius_mec()
+
+    if self.is_get_mesh or self.is_save_FEA:
+        # Lua scripts to extract the mesh and the solution (written once for
+        # all the time steps of the worker)
+        path_lua_dict = dict()
+        for is_get_mesh in [True, False]:
+            name_lua = "get_mesh_data_FEMM" + idworker + "_" + str(int(is_get_mesh))
+            path_lua_dict[is_get_mesh] = create_FEMM_lua(
+                "get_mesh_data_FEMM.lua",
+                join(save_path, name_lua + ".lua"),
+                {
+                    "my_path_txt": join(save_path, "").replace("\\", "/"),
+                    "my_id_worker": idworker,
+                    "my_is_get_mesh": str(int(is_get_mesh)),
+                },
+            )
+
+    # The flux density is computed in the first symmetry sector of the model
+    # and rebuilt on the full machine with the (anti-)periodicity
+    if sym > 1:
+        angle_sym = angle % (2 * pi / sym)
+        if is_antiper:
+            sign = 1 - 2 * ((angle // (2 * pi / sym)) % 2)
+        else:
+            sign = ones(Na_tot)
+    else:
+        angle_sym = angle
+        sign = ones(Na_tot)
+
+    # Compute the data for each time step
+    for ii, j_t0 in enumerate(time_list):
+        # Update rotor position and currents
+        update_FEMM_simulation(
+            femm=femm,
+            output=output,
+            materials=FEMM_dict["materials"],
+            circuits=FEMM_dict["circuits"],
+            is_mmfs=self.is_mmfs,
+            is_mmfr=self.is_mmfr,
+            j_t0=j_t0,
+            is_sliding_band=self.is_sliding_band,
+        )
+        # try "previous solution" for speed up of FEMM calculation
+        if self.is_sliding_band:
+            try:
+                base = basename(path_fem)
+                ans_file = splitext(base)[0] + ".ans"
+                femm.mi_setprevious(ans_file, 0)
+            except:
+                pass
+
+        # Run the computation
+        femm.mi_analyze()
+        femm.mi_loadsolution()
+
+        # Get the flux result (single solver call for all the angles)
+        if self.is_sliding_band:
+            Br[ii, :], Bt[ii, :] = femm.mo_getgapb_array("bc_ag2", angle_sym * 180 / pi)
+        else:
+            Rag = (Rgap_mec_ext + Rgap_mec_int) / 2
+            Bx, By = femm.mo_getb_array(Rag * cos(angle_sym), Rag * sin(angle_sym))
+            Bx, By = array(Bx), array(By)
+            Br[ii, :] = Bx * cos(angle_sym) + By * sin(angle_sym)
+            Bt[ii, :] = -Bx * sin(angle_sym) + By * cos(angle_sym)
+        Br[ii, :] *= sign
+        Bt[ii, :] *= sign
+
+        # Compute the torque
+        Tem[ii] = comp_FEMM_torque(femm, FEMM_dict, sym=sym)
+
+        if hasattr(output.simu.machine.stator, "winding"):
+            # Phi_wind computation
+            Phi_wind_stator[ii, :] = comp_FEMM_Phi_wind(
+                femm,
+                qs,
+                Npcpp,
+                is_stator=True,
+                Lfemm=FEMM_dict["Lfemm"],
+                L1=L1,
+                sym=sym,
+            )
+
+        # Load mesh data & solution (the mesh doesn't change with the time
+        # steps: it is only loaded for the first one)
+        if self.is_get_mesh or self.is_save_FEA:
+            mesh_ii, solution = self.get_meshsolution(
+                femm, save_path, path_lua_dict[ii == 0], ii == 0, idworker
+            )
+            if ii == 0:
+                mesh = mesh_ii
+            solution_list.append(solution)
+
+    if self.is_get_mesh or self.is_save_FEA:
+        for path_lua in path_lua_dict.values():
+            remove(path_lua)
+
+    # Close the worker session and remove its copy of the model
+    if is_new_session:
+        femm.closefemm()
+        for path in [path_fem, splitext(path_fem)[0] + ".ans"]:
+            if isfile(path):
+                remove(path)
+
+    return {
+        "Br": Br,
+        "Bt": Bt,
+        "Tem": Tem,
+        "Phi_wind_stator": Phi_wind_stator,
+        "mesh": mesh,
+        "solution": solution_list,
+    }
@@ -52,7 +52,7 @@ def build_geometry_half_tooth(self, is_top=False, alpha=0, delta=0):
             bot_list.append(line)
         else:  # The line cross the X axis => split
             # Copy the line (split_half modify the object)
-            line2 = type(line)(init_dict=line.as_dict())
+            line2 = line.copy()
             # Split the lines
             line.split_half(is_begin=True)
             line2.split_half(is_begin=False)
@@ -7,8 +7,10 @@ Slot numerical Computation of height method
 """
 
 from numpy import array
+from pyleecan.Functions.memoize import memoize
 
 
+@memoize
 def comp_height(self):
     """Compute the height of the Slot.
     Caution, the bottom of the Slot is an Arc
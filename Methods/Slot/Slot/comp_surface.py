@@ -6,7 +6,10 @@ Slot Computation of surface (Numerical) method
 @author pierre_b
 """
 
+from pyleecan.Functions.memoize import memoize
 
+
+@memoize
 def comp_surface(self):
     """Compute the Slot total surface (by numerical computation).
     Caution, the bottom of the Slot is an Arc
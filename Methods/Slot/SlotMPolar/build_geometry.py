@@ -60,7 +60,7 @@ def build_geometry(self):
         beta = -alpha / 2 + alpha_mag / 2 + ii * (self.W3 + alpha_mag)
         # Duplicate and rotate the slot + bore for each slot
         for line in curve_list:
-            new_line = type(line)(init_dict=line.as_dict())
+            new_line = line.copy()
             new_line.rotate(beta)
             slot_list.append(new_line)
         if ii != len(self.magnet) - 1:  # Add the W3 except for the last slot
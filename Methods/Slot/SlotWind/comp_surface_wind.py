@@ -6,7 +6,10 @@ Slot Winding Computation of surface (Numerical) method
 @author pierre_b
 """
 
+from pyleecan.Functions.memoize import memoize
 
+
+@memoize
 def comp_surface_wind(self):
     """Compute the Slot winding surface (by numerical computation).
     Caution, the bottom of the Slot is an Arc
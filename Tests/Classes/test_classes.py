@@ -18,7 +18,8 @@ from pyleecan.Tests.find import (
 )
 
 from pyleecan.Classes._check import CheckMinError, CheckTypeError, CheckMaxError
-from pyleecan.Classes._check import NotADictError
+from pyleecan.Classes._check import NotADictError, UnknowInitDictKeyError
+from pyleecan.Classes._check import trusted
 from pyleecan.Classes._frozen import FrozenClass, FrozenError
 
 # Get the dict of all the classes and their information
@@ -184,6 +185,23 @@ class test_all_Classes(TestCase):
             if prop["type"] == "ndarray" or prop["type"] in PYTHON_TYPE:
                 self.assertIsNone(test_obj.__getattribute__(prop["name"]))
 
+    @data(*class_list)
+    def test_class_copy(self, class_dict):
+        """Check that copy gives an equal, frozen and independent object"""
+        test_obj = eval(class_dict["name"] + "()")
+        result = test_obj.copy()
+        self.assertIs(type(result), type(test_obj))
+        self.assertIsNone(result.parent)
+        self.assertEqual(result.as_dict(), test_obj.as_dict())
+        with self.assertRaises(FrozenError):
+            result.UnKnow_Property_For_Frozen_Test = 10
+        prop_list = get_mother_attr(gen_dict, class_dict, "properties")[0]
+        for prop in prop_list:
+            value = getattr(test_obj, prop["name"])
+            if prop["type"] not in PYTHON_TYPE[:5] and value is not None:
+                # Mutable values are not shared
+                self.assertIsNot(getattr(result, prop["name"]), value)
+
     @data(*class_list)
     def test_class_frozen(self, class_dict):
         """Check if the class is frozen after __init__"""
@@ -284,6 +302,28 @@ class test_all_Classes(TestCase):
                 with self.assertRaises(CheckMaxError):
                     test_obj.__setattr__(prop["name"], max_val + 1)
 
+    @data(*class_list)
+    def test_class_trusted(self, class_dict):
+        """Check that the values and the init_dict keys are not checked in a
+        trusted context (and checked again after)
+        """
+        test_obj = eval(class_dict["name"] + "()")
+        init_dict = test_obj.as_dict()
+        init_dict["UnKnow_Property_For_Trusted_Test"] = 10
+        with trusted():
+            result = type(test_obj)(init_dict=init_dict)
+            prop_list = get_mother_attr(gen_dict, class_dict, "properties")[0]
+            for prop in prop_list:
+                if prop["min"] != "" and prop["type"] in ["float", "int"]:
+                    min_val = eval(prop["type"] + "(" + str(prop["min"]) + ")")
+                    # No CheckMinError expected
+                    result.__setattr__(prop["name"], min_val - 1)
+        del init_dict["UnKnow_Property_For_Trusted_Test"]
+        self.assertEqual(type(test_obj)(init_dict=init_dict), test_obj)
+        init_dict["UnKnow_Property_For_Trusted_Test"] = 10
+        with self.assertRaises(UnknowInitDictKeyError):
+            type(test_obj)(init_dict=init_dict)
+
     @data(*class_list)
     def test_class_prop_doc(self, class_dict):
         """Check if the property's doc is the same as in the doc file
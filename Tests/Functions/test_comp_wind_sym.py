@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+
+from unittest import TestCase
+
+from ddt import data, ddt
+from numpy import zeros
+
+from pyleecan.Classes.LamSlotWind import LamSlotWind
+from pyleecan.Classes.SlotW10 import SlotW10
+from pyleecan.Classes.WindingCW2LT import WindingCW2LT
+from pyleecan.Classes.WindingDW1L import WindingDW1L
+from pyleecan.Functions.Winding.comp_wind_sym import comp_wind_sym
+
+# winding, Zs, (Nperw, is_asym_wind)
+sym_test = [
+    {
+        "wind": WindingDW1L(qs=3, p=2, Ntcoil=1, coil_pitch=6),
+        "Zs": 24,
+        "res": (4, True),
+    },
+    {
+        "wind": WindingDW1L(qs=3, p=3, Ntcoil=1, coil_pitch=5),
+        "Zs": 54,
+        "res": (6, True),
+    },
+    {"wind": WindingCW2LT(qs=3, p=4, Ntcoil=1), "Zs": 12, "res": (4, False)},
+    {"wind": WindingCW2LT(qs=3, p=5, Ntcoil=1), "Zs": 12, "res": (2, True)},
+]
+
+
+@ddt
+class test_comp_wind_sym(TestCase):
+    """Unittest for the periodicity of the winding"""
+
+    @data(*sym_test)
+    def test_comp_wind_sym(self, test_dict):
+        wind_mat = test_dict["wind"].comp_connection_mat(test_dict["Zs"])
+        self.assertEqual(comp_wind_sym(wind_mat), test_dict["res"])
+
+    def test_one_phase(self):
+        """Check the periodicity of a single phase winding (qs=1)"""
+        wind_mat = zeros((1, 1, 12, 1))
+        wind_mat[0, 0, [0, 6], 0] = 1
+        wind_mat[0, 0, [3, 9], 0] = -1
+        self.assertEqual(comp_wind_sym(wind_mat), (4, True))
+
+    def test_comp_periodicity(self):
+        """The winding method uses the slot number of the lamination"""
+        lam = LamSlotWind(slot=SlotW10(Zs=24))
+        lam.winding = WindingDW1L(qs=3, p=2, Ntcoil=1, coil_pitch=6)
+        self.assertEqual(lam.winding.comp_periodicity(), (4, True))
+        lam.winding.p = 1
+        self.assertEqual(lam.winding.comp_periodicity(), (2, True))
+        lam.slot.Zs = 12
+        self.assertEqual(lam.winding.comp_periodicity(), (2, True))
+        lam.winding.p = 2
+        self.assertEqual(lam.winding.comp_periodicity(), (4, True))
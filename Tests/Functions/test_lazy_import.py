@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+
+from os import environ, pathsep
+from os.path import join
+from subprocess import run
+import sys
+from unittest import TestCase
+
+from pyleecan.Classes._frozen import FrozenClass
+from pyleecan.Classes._lazy import LazyClassDict, LazyMethod
+from pyleecan.Classes.Segment import Segment
+from pyleecan.Functions.load_switch import load_switch
+from pyleecan.Tests import TEST_DIR
+
+
+class ClassMissingDep(FrozenClass):
+    """Class with a method that can't be imported"""
+
+    comp_missing = LazyMethod("pyleecan.Methods.Missing.comp_missing")
+    comp_length = LazyMethod("pyleecan.Methods.Geometry.Segment.comp_length")
+
+
+class test_lazy_import(TestCase):
+    """Check that the classes and methods are imported when first used"""
+
+    def test_load_machine(self):
+        """Loading a machine doesn't import the dependencies of the methods"""
+        code = (
+            "import sys\n"
+            "from pyleecan.Functions.load import load\n"
+            "load("
+            + repr(join(TEST_DIR, "..", "Data", "Machine", "IPMSM_A.json"))
+            + ")\n"
+            "print([name for name in ['matplotlib', 'scipy', 'pandas']"
+            " if name in sys.modules])\n"
+        )
+        env = dict(environ, PYTHONPATH=pathsep.join(sys.path))
+        result = run(
+            [sys.executable, "-c", code], env=env, capture_output=True, text=True
+        )
+        self.assertEqual(result.returncode, 0, msg=result.stderr)
+        self.assertEqual(result.stdout.strip(), "[]")
+
+    def test_lazy_method(self):
+        """Check the method resolution and the ImportError"""
+        # The class attribute is replaced by the function once imported
+        self.assertAlmostEqual(Segment(begin=0, end=1j).comp_length(), 1)
+        self.assertNotIsInstance(Segment.__dict__["comp_length"], LazyMethod)
+
+        obj = ClassMissingDep()
+        self.assertTrue(hasattr(ClassMissingDep, "comp_missing"))
+        with self.assertRaisesRegex(ImportError, "Can't use ClassMissingDep method"):
+            obj.comp_missing()
+        with self.assertRaises(ImportError):
+            ClassMissingDep.comp_missing(obj)
+
+    def test_load_switch(self):
+        """Check that the classes are imported when they are accessed"""
+        class_dict = LazyClassDict(["Segment", "Arc1"])
+        self.assertIn("Segment", class_dict)
+        self.assertIs(class_dict["Segment"], Segment)
+        self.assertIs(class_dict.get("Segment"), Segment)
+        self.assertIsNone(class_dict.get("Circle"))
+        self.assertEqual(
+            [cls.__name__ for cls in class_dict.values()], ["Segment", "Arc1"]
+        )
+        self.assertIs(load_switch["Segment"], Segment)
@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+
+from unittest import TestCase
+
+from pyleecan.Classes.Slot import Slot
+from pyleecan.Tests.Validation.Machine.IPMSM_A import IPMSM_A
+
+
+class test_memoize(TestCase):
+    """Check that the memoized methods are computed again when the object, its
+    children or its parent are modified
+    """
+
+    def test_comp_masses(self):
+        rotor = IPMSM_A.copy().rotor
+        M_dict = rotor.comp_masses()
+        self.assertIsNotNone(rotor._memo)
+        self.assertEqual(rotor.comp_masses(), M_dict)
+        # The result of the caller can be modified
+        M_dict["Mtot"] = 0
+        M_dict = rotor.comp_masses()
+        self.assertNotEqual(M_dict["Mtot"], 0)
+
+        # Modification of a child
+        rotor.hole[0].magnet_0.mat_type.struct.rho = 1000
+        self.assertIsNone(rotor._memo)
+        M_mag = rotor.comp_masses()
+        self.assertLess(M_mag["Mmag"], M_dict["Mmag"])
+        self.assertEqual(M_mag["Mlam"], M_dict["Mlam"])
+
+        # Modification of the object
+        rotor.Rint = rotor.Rint * 1.1
+        M_lam = rotor.comp_masses()
+        self.assertLess(M_lam["Mlam"], M_mag["Mlam"])
+        self.assertEqual(M_lam["Mmag"], M_mag["Mmag"])
+
+    def test_comp_height_parent(self):
+        """The slot depends on its lamination (bore radius)"""
+        lam = IPMSM_A.stator.copy()
+        slot = lam.slot
+        height = Slot.comp_height(slot)
+        self.assertEqual(Slot.comp_height(slot), height)
+
+        lam.Rint = lam.Rint * 0.9
+        self.assertNotEqual(Slot.comp_height(slot), height)
+        self.assertAlmostEqual(
+            Slot.comp_height(slot), Slot.comp_height.__wrapped__(slot), places=12
+        )
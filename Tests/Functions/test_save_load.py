@@ -5,13 +5,15 @@ Created on Mon Dec 01 15:41:23 2014
 @author: pierre_b
 """
 
-from os import remove, getcwd
-from os.path import isfile, join
+from os import remove, getcwd, listdir
+from os.path import isdir, isfile, join
+from shutil import copytree, rmtree
 from unittest import TestCase
 from unittest.mock import patch  # for unittest of input
 
 from ddt import data, ddt
-from numpy import pi
+from numpy import pi, array, arange, memmap
+from numpy.testing import assert_array_equal
 
 from pyleecan.Classes.LamSlotMag import LamSlotMag
 from pyleecan.Classes.LamSlotWind import LamSlotWind
@@ -21,6 +23,13 @@ from pyleecan.Classes.SlotMPolar import SlotMPolar
 from pyleecan.Classes.SlotW10 import SlotW10
 from pyleecan.Classes.WindingDW1L import WindingDW1L
 from pyleecan.Classes.Shaft import Shaft
+from pyleecan.Classes.Mesh import Mesh
+from pyleecan.Classes.NodeMat import NodeMat
+from pyleecan.Classes.ElementMat import ElementMat
+from pyleecan.Classes.Solution import Solution
+from pyleecan.Classes.MeshSolution import MeshSolution
+from pyleecan.Classes.Material import Material
+from pyleecan.Classes._lazy import LazyInit
 from pyleecan.Tests import DATA_DIR, save_load_path as save_path
 from pyleecan.Functions.load import (
     load,
@@ -30,8 +39,11 @@ from pyleecan.Functions.load import (
     LoadWrongDictClassError,
     LoadWrongTypeError,
     LoadSwitchError,
+    load_matlib,
+    read_matlib_file,
+    MATLIB_INDEX_NAME,
 )
-from pyleecan.Functions.save import save_data
+from pyleecan.Functions.save import save_data, BINARY_EXT, GZIP_EXT
 
 load_file_1 = join(DATA_DIR, "test_wrong_slot_load_1.json")
 load_file_2 = join(DATA_DIR, "test_wrong_slot_load_2.json")
@@ -97,6 +109,147 @@ class test_save_load_fct(TestCase):
 
         self.assertEqual(result.frame, None)
 
+    def test_save_load_binary(self):
+        """Check that you can save and load an object with arrays in the
+        binary container (memory-mapped arrays)
+        """
+        mesh = Mesh()
+        mesh.node = NodeMat(
+            coordinate=array([[0, 0], [1, 0], [1, 1.5]]),
+            nb_node=3,
+            tag=array([0, 1, 2]),
+        )
+        mesh.element["Triangle3"] = ElementMat(
+            connectivity=array([[0, 1, 2]]),
+            nb_elem=1,
+            tag=array([0]),
+            group=array([4]),
+            nb_node_per_element=3,
+        )
+        solution = Solution()
+        solution.set_field(
+            field_value=arange(12.0).reshape((2, 3, 2)),
+            field_name="B",
+            field_type="face",
+        )
+        test_obj = MeshSolution(
+            mesh=[mesh], solution=[solution], is_stacked_solution=True
+        )
+
+        file_path = join(save_path, "test_meshsolution" + BINARY_EXT)
+        if isfile(file_path):
+            remove(file_path)
+        test_obj.save(file_path)
+        self.assertTrue(isfile(file_path))
+
+        result = load(file_path)
+        self.assertTrue(type(result) is MeshSolution)
+        self.assertEqual(result.as_dict(), test_obj.as_dict())
+        self.assertTrue(isinstance(result.mesh[0].node.coordinate, memmap))
+        assert_array_equal(
+            result.get_solution(1).get_field("B"), [[6, 7], [8, 9], [10, 11]]
+        )
+        # The file is not modified by the loaded arrays
+        result.solution[0].face["B"][0, 0, 0] = -1
+        self.assertEqual(load(file_path).solution[0].face["B"][0, 0, 0], 0)
+
+        # Save the loaded object in its own file
+        result.save(file_path)
+        assert_array_equal(result.solution[0].face["B"][0, 0], [-1, 1])
+        result_2 = load(file_path)
+        self.assertEqual(result_2.as_dict(), result.as_dict())
+        self.assertEqual(result_2.solution[0].face["B"][0, 0, 0], -1)
+        self.assertFalse(isfile(file_path + ".tmp"))
+
+    def test_save_load_compact(self):
+        """Check that you can save and load an object with arrays in a compact
+        json file and in a compressed json file
+        """
+        solution = Solution()
+        solution.set_field(
+            field_value=arange(12.0).reshape((2, 3, 2)),
+            field_name="B",
+            field_type="face",
+        )
+        solution.set_field(
+            field_value=array(["a b", "c"]), field_name="name", field_type="nodal"
+        )
+        test_obj = MeshSolution(solution=[solution], is_stacked_solution=True)
+
+        file_path = join(save_path, "test_meshsolution_compact.json")
+        test_obj.save(file_path, is_compact=True)
+        with open(file_path, "r") as json_file:
+            self.assertNotIn("\n", json_file.read())
+        result = load(file_path)
+        self.assertEqual(result.as_dict(), test_obj.as_dict())
+
+        file_path = join(save_path, "test_meshsolution" + GZIP_EXT)
+        test_obj.save(file_path)
+        self.assertTrue(isfile(file_path))
+        result = load(file_path)
+        self.assertEqual(result.as_dict(), test_obj.as_dict())
+        assert_array_equal(result.solution[0].nodal["name"], ["a b", "c"])
+
+    def test_load_lazy(self):
+        """Check that the lazy load creates the nested objects when they are used
+        """
+        test_obj = MachineSIPMSM(name="test")
+        test_obj.stator = LamSlotWind(L1=0.45)
+        test_obj.stator.slot = SlotW10(Zs=10, H0=0.21, W0=0.23)
+        test_obj.rotor = LamSlotMag(L1=0.55)
+        test_obj.rotor.slot = SlotMPolar(W0=pi / 4)
+        test_obj.rotor.slot.magnet = [MagnetType11(Wmag=pi / 4, Hmag=3)]
+        file_path = join(save_path, "test_machine_lazy.json")
+        test_obj.save(file_path)
+
+        result = load(file_path, is_lazy=True)
+        self.assertTrue(type(result) is MachineSIPMSM)
+        self.assertTrue(isinstance(result._stator, LazyInit))
+        self.assertEqual(result.stator.L1, 0.45)
+        self.assertTrue(type(result._stator) is LamSlotWind)
+        self.assertTrue(result.stator.parent is result)
+        self.assertTrue(isinstance(result._rotor, LazyInit))
+        self.assertTrue(isinstance(result.rotor.slot._magnet[0], LazyInit))
+        self.assertEqual(result.rotor.slot.magnet[0].Hmag, 3)
+        self.assertTrue(result.rotor.slot.magnet[0].parent is result.rotor.slot)
+        self.assertEqual(load(file_path, is_lazy=True), test_obj)
+
+    @patch("pyleecan.Functions.load.MATLIB_POOL_MIN", 2)
+    def test_load_matlib(self):
+        """Check the material library loading with the index cache
+        """
+        mat_path = join(save_path, "Matlib_index")
+        if isdir(mat_path):
+            rmtree(mat_path)
+        copytree(join(DATA_DIR, "Material"), join(mat_path, "Lamination"))
+        with open(join(mat_path, "Broken.json"), "w") as broken_file:
+            broken_file.write("{")
+
+        # Cold load (process pool)
+        matlib = load_matlib(mat_path, nb_worker=2)
+        self.assertEqual(len(matlib), len(listdir(join(DATA_DIR, "Material"))))
+        self.assertTrue(isfile(join(mat_path, MATLIB_INDEX_NAME)))
+        mat = [mat for mat in matlib if mat.name == "M400-50A"][0]
+        self.assertTrue(isinstance(mat, Material))
+        self.assertEqual(mat.path, join(mat_path, "Lamination", "M400-50A.json"))
+
+        # Only the modified files are parsed again
+        mat.elec.rho = 1.5
+        mat.save(mat.path)
+        with patch(
+            "pyleecan.Functions.load.read_matlib_file", wraps=read_matlib_file
+        ) as read_mock:
+            matlib_2 = load_matlib(mat_path, is_lazy=True)
+        self.assertEqual(
+            sorted([call[0][0] for call in read_mock.call_args_list]),
+            sorted([mat.path, join(mat_path, "Broken.json")]),
+        )
+        self.assertTrue(isinstance(list.__getitem__(matlib_2, 0), LazyInit))
+        self.assertEqual([mat.name for mat in matlib_2], [mat.name for mat in matlib])
+        mat_2 = [mat for mat in matlib_2 if mat.name == "M400-50A"][0]
+        self.assertEqual(mat_2.elec.rho, 1.5)
+        rmtree(mat_path)
+
     def test_save_folder_path(self):
         """Save with a folder path
         """
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+from unittest import TestCase
+
+from numpy import pi, exp
+from numpy.testing import assert_array_almost_equal
+
+from pyleecan.Classes.Arc1 import Arc1
+from pyleecan.Classes.Arc2 import Arc2
+from pyleecan.Classes.Arc3 import Arc3
+from pyleecan.Classes.Segment import Segment
+from pyleecan.Classes.SurfLine import SurfLine
+from pyleecan.Classes.SurfArray import SurfArray
+
+
+def get_surf_list():
+    """Two surfaces with all the line types"""
+    surf1 = SurfLine(
+        line_list=[
+            Segment(begin=0, end=1, label="S1"),
+            Arc1(begin=1, end=1j, radius=1, label="A1"),
+            Segment(begin=1j, end=0),
+        ],
+        label="Surf_0",
+        point_ref=0.3 + 0.3j,
+    )
+    surf2 = SurfLine(
+        line_list=[
+            Arc2(begin=2, center=0, angle=pi / 4),
+            Segment(begin=2 * exp(1j * pi / 4), end=3 * exp(1j * pi / 4)),
+            Arc3(begin=3 * exp(1j * pi / 4), end=-3 * exp(1j * pi / 4)),
+            Segment(begin=-3 * exp(1j * pi / 4), end=2),
+        ],
+        label="Surf_1",
+    )
+    return [surf1, surf2]
+
+
+class test_SurfArray_meth(TestCase):
+    """Unittest for SurfArray methods"""
+
+    def assert_same_surf(self, surf_list, ref_list):
+        """Check that the two lists have the same surfaces"""
+        self.assertEqual(len(surf_list), len(ref_list))
+        for surf, ref in zip(surf_list, ref_list):
+            self.assertEqual(surf.label, ref.label)
+            if ref.point_ref is None:
+                self.assertIsNone(surf.point_ref)
+            else:
+                self.assertAlmostEqual(abs(surf.point_ref - ref.point_ref), 0)
+            lines = surf.get_lines()
+            self.assertEqual(len(lines), len(ref.get_lines()))
+            for line, line_ref in zip(lines, ref.get_lines()):
+                self.assertEqual(type(line), type(line_ref))
+                self.assertEqual(line.label, line_ref.label)
+                self.assertAlmostEqual(abs(line.get_begin() - line_ref.get_begin()), 0)
+                self.assertAlmostEqual(abs(line.get_end() - line_ref.get_end()), 0)
+                self.assertAlmostEqual(
+                    abs(line.get_middle() - line_ref.get_middle()), 0
+                )
+
+    def test_round_trip(self):
+        """Check that the surfaces are unchanged by the SurfArray"""
+        surf_list = get_surf_list()
+        surf_array = SurfArray()
+        surf_array.set_surf_list(surf_list)
+        self.assertEqual(surf_array.line_type.size, 7)
+        self.assertEqual(surf_array.surf_index.tolist(), [0, 3, 7])
+        self.assert_same_surf(surf_array.get_surf_list(), surf_list)
+
+    def test_rotate_translate(self):
+        """Check that the transforms match the ones of SurfLine"""
+        ref_list = get_surf_list()
+        surf_array = SurfArray()
+        surf_array.set_surf_list(ref_list)
+        surf_array.rotate(pi / 3)
+        surf_array.translate(1 - 2j)
+        for surf in ref_list:
+            surf.rotate(pi / 3)
+            surf.translate(1 - 2j)
+        self.assert_same_surf(surf_array.get_surf_list(), ref_list)
+
+    def test_discretize(self):
+        """Check that the points match the ones of SurfLine.discretize"""
+        surf_list = get_surf_list()
+        surf_array = SurfArray()
+        surf_array.set_surf_list(surf_list)
+        point_list = surf_array.discretize(10)
+        for point, surf in zip(point_list, surf_list):
+            assert_array_almost_equal(point, surf.discretize(10))
+
+    def test_duplicate(self):
+        """Check that the copies are rotated and ordered by copy"""
+        surf_list = get_surf_list()
+        surf_array = SurfArray()
+        surf_array.set_surf_list(surf_list)
+        dup_list = surf_array.duplicate(3, pi / 2).get_surf_list()
+        self.assertEqual(len(dup_list), 6)
+        for ii in range(3):
+            ref_list = get_surf_list()
+            for surf in ref_list:
+                surf.rotate(ii * pi / 2)
+            self.assert_same_surf(dup_list[2 * ii : 2 * ii + 2], ref_list)
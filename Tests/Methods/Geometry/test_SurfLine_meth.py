@@ -3,8 +3,10 @@ from unittest import TestCase
 from mock import MagicMock
 from pyleecan.Classes.Arc1 import Arc1
 from pyleecan.Classes.Arc2 import Arc2
+from pyleecan.Classes.Arc3 import Arc3
 from pyleecan.Classes.Segment import Segment
 from pyleecan.Classes.SurfLine import SurfLine
+from pyleecan.Functions.Geometry.comp_surface_num import comp_surface_num
 from numpy import pi
 
 
@@ -57,3 +59,41 @@ class test_SurfLine_meth(TestCase):
         self.assertAlmostEqual(abs(line2.center - 1j), 0)
         self.assertAlmostEqual(abs(line3.begin - 2j), 0)
         self.assertAlmostEqual(line3.end, 1j)
+
+    def test_comp_surface(self):
+        """Check that you can compute the surface with arcs (exact value)
+        """
+        # Quarter of disk
+        line_list = [
+            Segment(begin=0, end=1),
+            Arc1(begin=1, end=1j, radius=1),
+            Segment(begin=1j, end=0),
+        ]
+        surface = SurfLine(line_list=line_list, label="test", point_ref=0.5 + 0.5j)
+        self.assertAlmostEqual(surface.comp_surface(), pi / 4, delta=1e-12)
+
+        # Half disk (clockwise)
+        line_list = [
+            Arc3(begin=-1, end=1, is_trigo_direction=False),
+            Segment(begin=1, end=-1),
+        ]
+        surface = SurfLine(line_list=line_list, label="test", point_ref=0.5j)
+        self.assertAlmostEqual(surface.comp_surface(), pi / 2, delta=1e-12)
+
+        # Square with a concave arc (and a translation)
+        line_list = [
+            Segment(begin=0, end=1),
+            Arc2(begin=1, center=1 + 1j, angle=-pi / 2),
+            Segment(begin=1j, end=0),
+        ]
+        surface = SurfLine(line_list=line_list, label="test", point_ref=0.2 + 0.2j)
+        surface.translate(3 - 2j)
+        self.assertAlmostEqual(surface.comp_surface(), 1 - pi / 4, delta=1e-12)
+
+    def test_comp_surface_num(self):
+        """Check the numerical surface of a polygon (not modified)
+        """
+        point_list = [0, 2, 2 + 1j, 1j]
+        self.assertAlmostEqual(comp_surface_num(point_list), 2)
+        self.assertEqual(len(point_list), 4)
+        self.assertAlmostEqual(comp_surface_num(point_list[::-1]), 2)
@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+from unittest import TestCase
+
+from numpy import pi, exp
+from numpy.testing import assert_array_almost_equal
+
+from pyleecan.Classes.LamSlotWind import LamSlotWind
+from pyleecan.Classes.SlotW10 import SlotW10
+from pyleecan.Classes.WindingDW1L import WindingDW1L
+
+lam = LamSlotWind(Rint=0.1, Rext=0.2, is_internal=False, is_stator=True)
+lam.slot = SlotW10(
+    Zs=12, W0=0.01, W1=0.02, W2=0.02, H0=0.005, H1=0.005, H2=0.04, H1_is_rad=False
+)
+lam.winding = WindingDW1L(qs=3, p=2, Ntcoil=1)
+
+
+def array_rot(point_list, angle):
+    """Rotate a list of complex points"""
+    return [point * exp(1j * angle) for point in point_list]
+
+
+class test_build_geometry_wind(TestCase):
+    """Unittest for the lazy slot replication of LamSlotWind"""
+
+    def test_rep(self):
+        """Check that the copies match the surfaces created at once"""
+        wind_rep = lam.build_geometry_wind(sym=2)
+        self.assertEqual(wind_rep.Nrep, 6)
+        surf_list = wind_rep.get_surf_list()
+        self.assertEqual(len(wind_rep), len(surf_list))
+
+        for surf, ref in zip(wind_rep, surf_list):
+            self.assertEqual(surf.label, ref.label)
+            assert_array_almost_equal(surf.discretize(), ref.discretize())
+        self.assertEqual(wind_rep[-1].label, surf_list[-1].label)
+        self.assertEqual(
+            [surf.label for surf in wind_rep[1:3]],
+            [surf.label for surf in surf_list[1:3]],
+        )
+        with self.assertRaises(IndexError):
+            wind_rep[len(surf_list)]
+
+        # Each slot is the first one rotated
+        Nsurf = len(surf_list) // 6
+        for ii in range(6):
+            for jj in range(Nsurf):
+                surf = surf_list[ii * Nsurf + jj]
+                self.assertEqual(surf.label[-1], str(ii))
+                assert_array_almost_equal(
+                    surf.discretize(),
+                    array_rot(surf_list[jj].discretize(), ii * 2 * pi / 12),
+                )
+
+    def test_discretize(self):
+        """Check that the points computed from the pattern match the surfaces"""
+        wind_rep = lam.build_geometry_wind()
+        for point, surf in zip(wind_rep.discretize(10), wind_rep):
+            assert_array_almost_equal(point, surf.discretize(10))
+
+    def test_build_geometry(self):
+        """Check that build_geometry returns the lamination and all the slots"""
+        surf_list = lam.build_geometry(sym=3)
+        wind_list = [surf for surf in surf_list if "Wind" in surf.label]
+        self.assertEqual(len(wind_list), len(lam.build_geometry_wind(sym=3)))
+        self.assertEqual(wind_list[-1].label[-1], "3")
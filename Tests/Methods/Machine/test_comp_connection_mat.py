@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+from unittest import TestCase
+
+from numpy import array, roll
+from numpy.testing import assert_array_equal
+
+from pyleecan.Classes.LamSlotWind import LamSlotWind
+from pyleecan.Classes.SlotW10 import SlotW10
+from pyleecan.Classes.WindingCW2LR import WindingCW2LR
+from pyleecan.Classes.WindingCW2LT import WindingCW2LT
+from pyleecan.Classes.WindingDW1L import WindingDW1L
+from pyleecan.Classes.WindingDW2L import WindingDW2L
+from pyleecan.Classes.WindingSC import WindingSC
+
+
+class test_comp_connection_mat(TestCase):
+    """Unittest for the winding matrix of each winding type"""
+
+    def test_DW1L(self):
+        wind_mat = WindingDW1L(qs=3, p=1, Ntcoil=2, coil_pitch=6).comp_connection_mat(
+            12
+        )
+        self.assertEqual(wind_mat.shape, (1, 1, 12, 3))
+        result = [
+            [1, 1, 0, 0, 0, 0, -1, -1, 0, 0, 0, 0],
+            [0, 0, 0, 0, 1, 1, 0, 0, 0, 0, -1, -1],
+            [0, 0, -1, -1, 0, 0, 0, 0, 1, 1, 0, 0],
+        ]
+        assert_array_equal(wind_mat[0, 0].T, 2 * array(result))
+
+    def test_DW2L(self):
+        """The second layer is shifted of coil_pitch - Zs/2/p slots"""
+        wind_mat = WindingDW2L(qs=3, p=2, Ntcoil=1, coil_pitch=5).comp_connection_mat(
+            24
+        )
+        self.assertEqual(wind_mat.shape, (2, 1, 24, 3))
+        assert_array_equal(wind_mat[1], roll(wind_mat[0], -1, axis=1))
+
+    def test_CW2LT(self):
+        wind_mat = WindingCW2LT(qs=3, p=2, Ntcoil=1).comp_connection_mat(6)
+        result = [
+            [[1, 0, 0, 1, 0, 0], [0, 0, -1, 0, 0, -1]],
+            [[0, 0, 1, 0, 0, 1], [0, -1, 0, 0, -1, 0]],
+            [[0, 1, 0, 0, 1, 0], [-1, 0, 0, -1, 0, 0]],
+        ]
+        assert_array_equal(wind_mat[0].transpose(2, 0, 1), result)
+        # Same coils with radial superposition
+        wind_mat_rad = WindingCW2LR(qs=3, p=2, Ntcoil=1).comp_connection_mat(6)
+        assert_array_equal(wind_mat_rad, wind_mat.transpose(1, 0, 2, 3))
+
+    def test_SC(self):
+        wind_mat = WindingSC(qs=4).comp_connection_mat(4)
+        result = [[-1, 1, 0, 0], [0, -1, 1, 0], [0, 0, -1, 1], [1, 0, 0, -1]]
+        assert_array_equal(wind_mat[0, 0], result)
+
+    def test_cache(self):
+        """The matrix is computed again when the winding or the slot change"""
+        lam = LamSlotWind(slot=SlotW10(Zs=12))
+        lam.winding = WindingDW1L(qs=3, p=1, Ntcoil=1, coil_pitch=6)
+        wind_mat = lam.winding.comp_connection_mat()
+        # The result of the caller can be modified
+        wind_mat[0, 0, 0, 0] = 10
+        self.assertEqual(lam.winding.comp_connection_mat()[0, 0, 0, 0], 1)
+
+        lam.winding.Ntcoil = 3
+        wind_mat = lam.winding.comp_connection_mat()
+        self.assertEqual(wind_mat[0, 0, 0, 0], 3)
+        lam.winding.is_reverse_wind = True
+        assert_array_equal(lam.winding.comp_connection_mat(), wind_mat[:, :, ::-1, :])
+        lam.slot.Zs = 24
+        self.assertEqual(lam.winding.comp_connection_mat().shape, (1, 1, 24, 3))
@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+from unittest import TestCase
+
+from ddt import data, ddt
+from numpy import linspace, pi
+
+from pyleecan.Classes.LamSlotMulti import LamSlotMulti
+from pyleecan.Classes.LamSlotWind import LamSlotWind
+from pyleecan.Classes.NotchEvenDist import NotchEvenDist
+from pyleecan.Classes.SlotW10 import SlotW10
+from pyleecan.Classes.VentilationCirc import VentilationCirc
+from pyleecan.Classes.WindingDW1L import WindingDW1L
+from pyleecan.Functions.Geometry.merge_periodicity import merge_periodicity
+from pyleecan.Tests.Validation.Machine.IPMSM_A import IPMSM_A
+from pyleecan.Tests.Validation.Machine.SCIM_006 import SCIM_006
+from pyleecan.Tests.Validation.Machine.SPMSM_003 import SPMSM_003
+from pyleecan.Tests.Validation.Machine.SPMSM_015 import SPMSM_015
+from pyleecan.Tests.Validation.Machine.SynRM_001 import SynRM_001
+
+# machine, (per_a, is_antiper_a)
+machine_test = [
+    {"machine": IPMSM_A, "res": (4, True)},  # 48 slots / 8 poles
+    {"machine": SPMSM_003, "res": (1, True)},  # 12 slots / 2 poles
+    {"machine": SPMSM_015, "res": (9, False)},  # 27 slots / 18 poles
+    {"machine": SynRM_001, "res": (2, True)},  # 24 slots / 4 poles
+    {"machine": SCIM_006, "res": (1, False)},  # Independent rotor bars
+]
+
+# per_list, (per_a, is_antiper_a)
+merge_test = [
+    {"per_list": [(4, True), (4, True)], "res": (4, True)},
+    {"per_list": [(4, True), (6, True)], "res": (2, False)},
+    {"per_list": [(4, True), (2, True)], "res": (2, False)},
+    # Anti-periodic on 2*pi/8 for one and periodic for the other
+    {"per_list": [(4, True), (8, False)], "res": (4, False)},
+    {"per_list": [(4, True), (8, True)], "res": (4, False)},
+    # The geometry is periodic on any multiple of its period
+    {"per_list": [(4, True), (8, None)], "res": (4, True)},
+    {"per_list": [(4, True), (4, None)], "res": (4, False)},
+    {"per_list": [(3, None), (6, None)], "res": (3, None)},
+    {"per_list": [(0, None), (3, False)], "res": (3, False)},
+    {"per_list": [(0, None)], "res": (0, None)},
+]
+
+
+@ddt
+class test_comp_periodicity(TestCase):
+    """Unittest for the angular periodicity of the machines"""
+
+    @data(*machine_test)
+    def test_machine(self, test_dict):
+        self.assertEqual(test_dict["machine"].comp_periodicity(), test_dict["res"])
+
+    @data(*merge_test)
+    def test_merge_periodicity(self, test_dict):
+        self.assertEqual(merge_periodicity(test_dict["per_list"]), test_dict["res"])
+
+    def test_lamination(self):
+        """Check the effect of the sources, notches and ventilations"""
+        lam = LamSlotWind(slot=SlotW10(Zs=48))
+        lam.winding = WindingDW1L(qs=3, p=4, Ntcoil=1, coil_pitch=6)
+        self.assertEqual(lam.comp_periodicity(), (4, True))
+        self.assertEqual(lam.comp_periodicity(is_mmf=False), (48, None))
+
+        lam.axial_vent = [VentilationCirc(Zh=16)]
+        self.assertEqual(lam.comp_periodicity(), (4, True))
+        self.assertEqual(lam.comp_periodicity(is_mmf=False), (16, None))
+
+        # The notches don't repeat on half a period
+        lam.notch = [NotchEvenDist(notch_shape=SlotW10(Zs=4))]
+        self.assertEqual(lam.comp_periodicity(), (4, False))
+
+        # Magnets only or geometry only
+        self.assertEqual(IPMSM_A.rotor.get_pole_pair_number(), 4)
+        self.assertEqual(IPMSM_A.comp_periodicity(is_mmfs=False), (4, True))
+        self.assertEqual(IPMSM_A.comp_periodicity(False, False), (8, False))
+
+    def test_slot_multi(self):
+        """Check the periodicity of the pattern of slots"""
+        lam = LamSlotMulti(
+            slot_list=[SlotW10(W0=0.01), SlotW10(W0=0.02)] * 4,
+            alpha=linspace(0, 2 * pi, 8, endpoint=False),
+        )
+        self.assertEqual(lam.comp_periodicity(), (4, None))
+        # Same slots at different positions
+        lam.alpha = linspace(0, 2 * pi, 8, endpoint=False) + 0.01 * (
+            linspace(0, 7, 8) // 4
+        )
+        self.assertEqual(lam.comp_periodicity(), (1, None))
+        # Different slot in the pattern
+        lam.alpha = linspace(0, 2 * pi, 8, endpoint=False)
+        lam.slot_list[-1] = SlotW10(W0=0.03)
+        self.assertEqual(lam.comp_periodicity(), (1, None))
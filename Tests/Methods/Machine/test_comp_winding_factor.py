@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+from unittest import TestCase
+
+from numpy import arange, array, cumsum, exp, pi, real, sin
+from numpy.testing import assert_array_almost_equal
+
+from pyleecan.Classes.LamSlotWind import LamSlotWind
+from pyleecan.Classes.SlotW10 import SlotW10
+from pyleecan.Classes.WindingCW2LT import WindingCW2LT
+from pyleecan.Classes.WindingDW2L import WindingDW2L
+
+
+class test_comp_winding_factor(TestCase):
+    """Unittest for the winding factors and the MMF spectrum of the winding"""
+
+    def test_winding_factor_DW2L(self):
+        """Check the distribution and pitch factors of a shorted pitch winding"""
+        winding = WindingDW2L(qs=3, p=2, Ntcoil=1, coil_pitch=5)
+        lam = LamSlotWind(slot=SlotW10(Zs=24), winding=winding)
+        xi = winding.comp_winding_factor_mat(Nharm=13)
+        self.assertEqual(xi.shape, (3, 13))
+
+        # 2 slots per pole and phase, 5/6 pitch
+        h = arange(1, 14)
+        gamma = pi / 6  # Electrical angle between two slots
+        kd = sin(h * gamma) / (2 * sin(h * gamma / 2))
+        kp = sin(h * 5 / 6 * pi / 2)
+        # No even harmonic (symmetrical winding)
+        for phase in range(3):
+            assert_array_almost_equal(xi[phase, ::2], abs(kd * kp)[::2])
+            assert_array_almost_equal(xi[phase, 1::2], 0)
+
+        # Same as the phase 1 method
+        assert_array_almost_equal(winding.comp_winding_factor(list(h)), xi[0])
+
+    def test_winding_factor_CW2LT(self):
+        """Check the fundamental factor of a concentrated winding"""
+        winding = WindingCW2LT(qs=3, p=5, Ntcoil=1)
+        xi = winding.comp_winding_factor_mat(Nharm=1, Zs=12)
+        assert_array_almost_equal(xi[:, 0], 0.933, decimal=3)
+
+    def test_mmf_spectrum(self):
+        """Check that the spectrum gives back the MMF step function"""
+        winding = WindingDW2L(qs=3, p=2, Ntcoil=1, coil_pitch=5)
+        Zs = 24
+        mmf = winding.comp_mmf_spectrum(Nharm=3000, Zs=Zs)
+        self.assertEqual(mmf.shape, (3, 3000))
+
+        # MMF at the middle of each tooth (integral of the conductors)
+        wind_mat = winding.comp_connection_mat(Zs).sum(axis=(0, 1))
+        mmf_ref = cumsum(wind_mat, axis=0)
+        mmf_ref = mmf_ref - mmf_ref.mean(axis=0)
+        angle = (arange(Zs) + 0.5) * 2 * pi / Zs
+        order = arange(1, 3001)
+        mmf_tooth = real(mmf[:, :, None] * exp(1j * order[:, None] * angle)).sum(1)
+        assert_array_almost_equal(mmf_tooth, mmf_ref.T, decimal=2)
+
+        # Only the odd multiples of p for a symmetrical winding
+        self.assertAlmostEqual(abs(mmf[0, 0]), 0)
+        self.assertGreater(abs(mmf[0, 1]), 0)
+
+        # Total MMF of the phase currents
+        I = array([1, -0.5, -0.5])
+        assert_array_almost_equal(
+            winding.comp_mmf_spectrum(Nharm=10, I=I, Zs=Zs), I.dot(mmf[:, :10])
+        )
@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+
+from unittest import TestCase
+from pyleecan.Classes.ElementMat import ElementMat
+from pyleecan.Classes.NodeMat import NodeMat
+import numpy as np
+from numpy.testing import assert_array_equal, assert_array_almost_equal
+
+
+class unittest_add_elements(TestCase):
+    """unittest for the bulk add_elements / add_nodes methods"""
+
+    def test_ElementMat_add_elements(self):
+        """Check the duplicate detection (any node order) and the buffers"""
+        elem = ElementMat(nb_node_per_element=3)
+        connect = np.array([[0, 1, 2], [1, 2, 3], [2, 1, 0], [3, 4, 4]])
+        is_created = elem.add_elements(connect, [10, 11, 12, 13], 2)
+        assert_array_equal(is_created, [True, True, False, False])
+        assert_array_equal(elem.connectivity, connect[:2])
+        assert_array_equal(elem.tag, [10, 11])
+        assert_array_equal(elem.group, [2, 2])
+        self.assertEqual(elem.nb_elem, 2)
+
+        # Against the existing elements, block after block
+        for ii in range(20):
+            is_created = elem.add_elements([[ii, ii + 1, ii + 2]], 20 + ii, 3)
+            self.assertEqual(bool(is_created[0]), ii > 1)
+        self.assertEqual(elem.nb_elem, 20)
+        assert_array_equal(elem.connectivity[-1], [19, 20, 21])
+        self.assertFalse(elem.add_element([3, 1, 2], 50, 3))
+        self.assertTrue(elem.is_exist([21, 20, 19]))
+
+    def test_NodeMat_add_nodes(self):
+        """Check the duplicate detection with the delta tolerance"""
+        node = NodeMat(delta=1e-6)
+        coord = np.array([[0, 0], [1, 0], [1e-7, 0], [1, 1], [1, 2e-7]])
+        tags = node.add_nodes(coord)
+        assert_array_equal(tags, [0, 1, 0, 2, 1])
+        self.assertEqual(node.nb_node, 3)
+        assert_array_almost_equal(node.coordinate, coord[[0, 1, 3]])
+
+        tags = node.add_nodes(np.array([[1, 1 - 5e-7], [2, 2], [-1e-8, 3e-7]]))
+        assert_array_equal(tags, [2, 3, 0])
+        assert_array_equal(node.tag, [0, 1, 2, 3])
+        self.assertEqual(node.add_node([2, 2]), None)
+        self.assertEqual(node.add_node([3, 2]), 4)
+        assert_array_equal(node.get_coord(4), [[3, 2]])
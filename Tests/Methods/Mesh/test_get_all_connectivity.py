@@ -114,3 +114,15 @@ class unittest_get_all_connectivity(TestCase):
         msg = "Wrong result: returned " + str(result) + ", expected: " + str(solution)
         DELTA = 1e-10
         self.assertAlmostEqual(testA, 0, msg=msg, delta=DELTA)
+
+    def test_ElementMat_3seg_2tgl_2groups(self):
+        """unittest with ElementMat object. Test for a selection of 2 groups."""
+        self.mesh.add_element([0, 1], "Segment2")
+        self.mesh.add_element([1, 2, 3], "Triangle3", group=1)
+        self.mesh.add_element([2, 3, 0], "Triangle3", group=3)
+        self.mesh.add_element([2, 1, 0], "Triangle3", group=2)
+        self.mesh.add_element([3, 1, 0], "Triangle3", group=3)
+        result, tags = self.mesh.get_all_connectivity("Triangle3", group=[2, 3])
+        solution = np.array([[2, 3, 0], [2, 1, 0], [3, 1, 0]])
+        np.testing.assert_array_equal(result, solution)
+        self.assertEqual(len(tags), 3)
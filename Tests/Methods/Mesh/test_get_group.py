@@ -34,3 +34,14 @@ class unittest_get_group(TestCase):
         msg = "Wrong output: returned " + str(results) + ", expected: " + str(solution)
         DELTA = 1e-10
         self.assertAlmostEqual(testA, 0, msg=msg, delta=DELTA)
+
+    def test_NodeMat_missing_tag(self):
+        """unittest for the nodes of a group with a missing node tag"""
+        elem_grp = self.mesh.element["Triangle3"].get_group([3])
+        elem_grp.connectivity[0, 0] = 10  # Missing node
+        node_grp = self.mesh.node.get_group(elem_grp)
+        self.assertEqual(node_grp.nb_node, 3)
+        np.testing.assert_array_equal(node_grp.tag, [1, 2, 3])
+        np.testing.assert_array_almost_equal(
+            node_grp.coordinate, [[1, 0], [1, 2], [2, 3]]
+        )
@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+
+from unittest import TestCase
+from pyleecan.Classes.NodeMat import NodeMat
+import numpy as np
+
+
+class unittest_get_index(TestCase):
+    """unittest for NodeMat get_index method"""
+
+    def setUp(self):
+        self.node = NodeMat()
+        self.node.add_node(np.array([0, 0]))
+        self.node.add_node(np.array([1, 0]))
+        self.node.add_node(np.array([1, 2]))
+
+    def test_NodeMat_index(self):
+        """unittest for existing and missing tags"""
+        index = self.node.get_index(np.array([2, 0, -999, 1, 3]))
+        np.testing.assert_array_equal(index, [2, 0, -1, 1, -1])
+
+    def test_NodeMat_unsorted(self):
+        """unittest for unsorted node tags"""
+        self.node.tag = np.array([7, 3, 5])
+        index = self.node.get_index(np.array([5, 7, 3]))
+        np.testing.assert_array_equal(index, [2, 0, 1])
+        coord = self.node.get_coord(np.array([3, 7]))
+        np.testing.assert_array_equal(coord, [[1, 0], [0, 0]])
+
+    def test_NodeMat_add_node(self):
+        """unittest for the index update after add_node"""
+        self.assertEqual(self.node.get_index(3)[0], -1)
+        self.node.add_node(np.array([2, 3]))
+        self.assertEqual(self.node.get_index(3)[0], 3)
+        np.testing.assert_array_equal(self.node.get_coord(3), [[2, 3]])
+        # The index is not part of the saved data
+        self.assertEqual(NodeMat(init_dict=self.node.as_dict()), self.node)
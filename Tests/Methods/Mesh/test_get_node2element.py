@@ -43,3 +43,17 @@ class unittest_get_node2element(TestCase):
         msg = "Wrong output: returned " + str(elem_tag) + ", expected: " + str(solution)
         DELTA = 1e-10
         self.assertAlmostEqual(testA, 0, msg=msg, delta=DELTA)
+
+    def test_ElementMat_nodes(self):
+        """unittest for several nodes and update after add_element"""
+        element = self.mesh.element["Triangle3"]
+        elem_tag = element.get_node2element(np.array([4, 0, -99]))
+        np.testing.assert_array_equal(elem_tag, [2, 0])
+        elem_index = element.get_node2element(np.array([2, 3]), is_index=True)
+        np.testing.assert_array_equal(elem_index, [0, 1, 2, 1, 2])
+
+        self.assertTrue(element.is_exist(np.array([3, 1, 2])))
+        self.assertFalse(element.is_exist(np.array([3, 1, 4])))
+        self.mesh.add_element(np.array([3, 1, 4]), "Triangle3")
+        self.assertTrue(element.is_exist(np.array([3, 1, 4])))
+        np.testing.assert_array_equal(element.get_node2element(4), [2, 3])
@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+
+from unittest import TestCase
+from pyleecan.Classes.NodeMat import NodeMat
+import numpy as np
+from numpy.testing import assert_array_equal, assert_array_almost_equal
+
+
+class unittest_get_tag(TestCase):
+    """unittest for the spatial queries of NodeMat (get_tag, is_exist, get_nearest)"""
+
+    def setUp(self):
+        self.node = NodeMat(delta=1e-3)
+        x, y = np.meshgrid(np.linspace(0, 1, 11), np.linspace(0, 1, 11))
+        self.coord = np.column_stack((x.ravel(), y.ravel()))
+        self.node.add_nodes(self.coord)
+
+    def test_get_tag(self):
+        """Check the batch queries with the delta tolerance"""
+        tags = self.node.get_tag(self.coord[[5, 17, 120]] + 5e-4)
+        assert_array_equal(tags, [5, 17, 120])
+        self.assertIsNone(self.node.get_tag([[0.05, 0.05], [0, 0]]))
+        assert_array_equal(self.node.get_close_index([[0.05, 0.05], [0, 0]]), [-1, 0])
+        assert_array_equal(
+            self.node.is_exist([[0.05, 0.05], [1, 1 - 1e-4]]), [False, True]
+        )
+        self.assertTrue(self.node.is_exist([0.3, 0.4]))
+        self.assertFalse(self.node.is_exist([0.3, 0.41]))
+
+    def test_get_tag_add_nodes(self):
+        """Check that the spatial hash follows the added nodes"""
+        self.node.get_tag(self.coord)
+        for ii in range(50):
+            tag = self.node.add_node([2 + ii * 0.01, 0])
+            self.assertEqual(tag, 121 + ii)
+            self.assertEqual(self.node.get_tag([[2 + ii * 0.01, 0]])[0], tag)
+        self.assertIsNone(self.node.add_node([2.2 + 1e-4, 0]))
+        self.assertEqual(self.node.nb_node, 171)
+
+    def test_get_nearest(self):
+        """Check the nearest node queries"""
+        tags, dist = self.node.get_nearest([[0.04, 0.02], [1, 1.5]])
+        assert_array_equal(tags, [0, 120])
+        assert_array_almost_equal(dist, [np.sqrt(0.002), 0.5])
+        self.node.add_node([0.04, 0.02])
+        tags, dist = self.node.get_nearest([[0.04, 0.02]])
+        assert_array_equal(tags, [121])
@@ -71,3 +71,17 @@ class unittest_get_vertice(TestCase):
         )
         DELTA = 1e-10
         self.assertAlmostEqual(testA, solution, msg=msg, delta=DELTA)
+
+    def test_ElementMat_group(self):
+        """unittest with ElementMat object. Test for the coordinates of a group"""
+        result = self.mesh.get_vertice("Triangle3", group=3)
+        solution = np.array([[[0, 0], [1, 0], [1, 2]], [[1, 0], [1, 2], [2, 3]]])
+        np.testing.assert_array_almost_equal(result, solution)
+        result = self.mesh.get_vertice("Triangle3", group=2)
+        np.testing.assert_array_almost_equal(result, [[3, 3], [1, 2], [2, 3]])
+
+    def test_ElementMat_missing_node(self):
+        """unittest with ElementMat object. Test for a missing node tag"""
+        self.mesh.add_element(np.array([4, 10]), "Segment2", group=int(2))
+        self.assertIsNone(self.mesh.get_vertice("Segment2"))
+        self.assertIsNone(self.mesh.get_vertice("Segment2", group=2))
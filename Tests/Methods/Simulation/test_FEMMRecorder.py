@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+
+from os.path import join
+from unittest import TestCase
+
+from numpy.testing import assert_array_almost_equal
+
+from pyleecan.Classes._FEMMRecorder import _FEMMRecorder, load_record
+from pyleecan.Classes._FEMMRecorder import FEMMReplayError
+from pyleecan.Tests import save_validation_path as save_path
+from pyleecan.Tests.Methods.Simulation.test_MagFEMM_parallel import (
+    FEMMStandIn,
+    solve,
+)
+
+
+class test_FEMMRecorder(TestCase):
+    """Check that a recorded FEMM session can be replayed without solver"""
+
+    def test_record_replay(self):
+        recorder = _FEMMRecorder(backend=FEMMStandIn())
+        out = solve(recorder)
+        self.assertGreater(len(recorder.call_list), 0)
+        self.assertEqual(recorder.call_list[0][0], "mi_createmesh")
+
+        # Replay from a saved record
+        record_path = join(save_path, "test_FEMMRecorder.json")
+        recorder.save(record_path)
+        replayer = load_record(record_path)
+        out_replay = solve(replayer)
+        self.assertEqual(replayer.index, len(recorder.call_list))
+        assert_array_almost_equal(out_replay.mag.Br, out.mag.Br)
+        assert_array_almost_equal(out_replay.mag.Bt, out.mag.Bt)
+        assert_array_almost_equal(out_replay.mag.Tem, out.mag.Tem)
+        assert_array_almost_equal(
+            out_replay.mag.Phi_wind_stator, out.mag.Phi_wind_stator
+        )
+
+    def test_replay_mesh_error(self):
+        """The files written by callfemm (mesh and solution) are not recorded"""
+        recorder = _FEMMRecorder(backend=FEMMStandIn())
+        solve(recorder, is_get_mesh=True)
+        self.assertIn("callfemm", [call[0] for call in recorder.call_list])
+        replayer = _FEMMRecorder(call_list=recorder.call_list)
+        with self.assertRaisesRegex(FEMMReplayError, "is_get_mesh=False"):
+            solve(replayer, is_get_mesh=True)
+
+    def test_replay_error(self):
+        replayer = _FEMMRecorder(call_list=[["mi_analyze", [], None]])
+        with self.assertRaises(FEMMReplayError):
+            replayer.mi_createmesh()
+        replayer.mi_analyze()
+        with self.assertRaises(FEMMReplayError):
+            replayer.mi_loadsolution()
+        with self.assertRaises(AttributeError):
+            replayer.mi_unknown
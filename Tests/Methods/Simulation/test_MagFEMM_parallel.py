@@ -0,0 +1,251 @@
+# -*- coding: utf-8 -*-
+
+from os import listdir
+from os.path import join, isfile, splitext
+from unittest import TestCase
+
+from numpy import pi, cos, sin, zeros, ones, arctan2, array
+from numpy.testing import assert_array_almost_equal
+
+from pyleecan.Classes.Simu1 import Simu1
+from pyleecan.Classes.InCurrent import InCurrent
+from pyleecan.Classes.ImportGenVectLin import ImportGenVectLin
+from pyleecan.Classes.ImportMatrixVal import ImportMatrixVal
+from pyleecan.Classes.MagFEMM import MagFEMM
+from pyleecan.Classes.Output import Output
+from pyleecan.Methods.Simulation.Input import InputError
+from pyleecan.Tests import save_validation_path as save_path
+from pyleecan.Tests.Validation.Machine.SCIM_006 import SCIM_006
+
+
+class FEMMStandIn(object):
+    """Local stand-in for the FEMM backend: the airgap flux density is a
+    sinusoidal wave rotating with the rotor angle set on the sliding band
+    """
+
+    is_parallel = True
+
+    def __init__(self):
+        self.angle_rotor = 0  # [deg]
+        self.path_fem = None
+
+    def openfemm(self, bHide=0):
+        pass
+
+    def closefemm(self):
+        pass
+
+    def opendocument(self, path_fem):
+        assert isfile(path_fem)
+        self.path_fem = path_fem
+
+    def callfemm(self, cmd):
+        """Run get_mesh_data_FEMM.lua on a 2 triangles mesh"""
+        with open(cmd[len('dofile("') : -len('")')], "r") as lua_file:
+            text_lua = lua_file.read()
+        param = dict()
+        for line in text_lua.split("\n")[:3]:
+            key, value = line.split(" = ")
+            param[key] = value.strip(' ";')
+        path = param["path_txt"]
+        idworker = param["idworker"]
+        if param["is_get_mesh"] == "1":
+            node = array([[0, 0], [1, 0], [1, 1], [0, 1]], dtype="<f8")
+            node.tofile(path + "nodes" + idworker + ".bin")
+            element = array([[1, 2, 3, 2], [1, 3, 4, 14]], dtype="<i4")
+            element.tofile(path + "elements" + idworker + ".bin")
+        # Bx, By, Hx, Hy, mu, Az for each element
+        results = zeros((2, 6), dtype="<f8")
+        results[:, 0] = self.angle_rotor
+        results[:, 5] = [-1, 1]
+        results.tofile(path + "results" + idworker + ".bin")
+
+    def mi_createmesh(self):
+        pass
+
+    def mi_modifyboundprop(self, name, propnum, value):
+        if propnum in [10, 11]:  # Sliding band inner/outer angle
+            self.angle_rotor = value
+
+    def mi_modifycircprop(self, name, propnum, value):
+        pass
+
+    def mi_setprevious(self, name, type):
+        pass
+
+    def mi_analyze(self):
+        pass
+
+    def mi_loadsolution(self):
+        pass
+
+    def mo_getgapb(self, name, angle):
+        alpha = (angle - self.angle_rotor) * pi / 180
+        return cos(2 * alpha), sin(2 * alpha)
+
+    def mo_getgapb_array(self, name, angle):
+        alpha = (angle - self.angle_rotor) * pi / 180
+        return cos(2 * alpha), sin(2 * alpha)
+
+    def mo_getb(self, x, y):
+        theta = arctan2(y, x)
+        Br, Bt = self.mo_getgapb("", theta * 180 / pi)
+        return Br * cos(theta) - Bt * sin(theta), Br * sin(theta) + Bt * cos(theta)
+
+    def mo_getb_array(self, x, y):
+        return self.mo_getb(x, y)
+
+    def mo_seteditmode(self, mode):
+        pass
+
+    def mo_groupselectblock(self, group):
+        pass
+
+    def mo_blockintegral(self, type):
+        return self.angle_rotor
+
+    def mo_getcircuitproperties(self, name):
+        return (0, 0, self.angle_rotor)
+
+
+Nt = 6
+simu = Simu1(name="MagFEMM_parallel", machine=SCIM_006)
+simu.input = InCurrent(
+    Is=ImportMatrixVal(value=zeros((Nt, 3))),
+    Ir=ImportMatrixVal(value=zeros((Nt, 28))),
+    Nr=ImportMatrixVal(value=ones(Nt) * 1500),
+    angle_rotor=None,  # Will be computed
+    time=ImportGenVectLin(start=0, stop=0.01, num=Nt, endpoint=False),
+    angle=ImportGenVectLin(start=0, stop=2 * pi, num=64, endpoint=False),
+    angle_rotor_initial=0.2244,
+)
+simu.mag = MagFEMM(is_stator_linear_BH=2, is_rotor_linear_BH=2)
+simu.struct = None
+
+FEMM_dict = {
+    "materials": list(),
+    "circuits": list(),
+    "Lfemm": SCIM_006.stator.L1,
+    "groups": {"GROUP_RC": 2, "GROUP_RH": 14, "GROUP_RW": 4},
+}
+
+
+def solve(
+    femm, nb_worker=1, is_sliding_band=True, is_get_mesh=False, sym=1, is_antiper=False
+):
+    """Solve the time steps with the femm backend and nb_worker sessions"""
+    simu_solve = Simu1(init_dict=simu.as_dict())
+    simu_solve.mag.nb_worker = nb_worker
+    simu_solve.mag.is_sliding_band = is_sliding_band
+    simu_solve.mag.is_get_mesh = is_get_mesh
+    out = Output(simu=simu_solve)
+    out.path_res = join(save_path, "MagFEMM_parallel_" + str(nb_worker))
+    simu_solve.input.gen_input()
+    simu_solve.mag.comp_time_angle(out)
+    # Model saved by draw_FEMM and copied for each worker
+    path_fem = simu_solve.mag.get_path_save_fem(out)
+    with open(path_fem, "w") as fem_file:
+        fem_file.write("[Format] = 4.0\n")
+    simu_solve.mag.solve_FEMM(femm, out, sym, dict(FEMM_dict), is_antiper)
+    return out
+
+
+class test_MagFEMM_parallel(TestCase):
+    """Check that the worker pool gives the same results as the serial solve"""
+
+    def test_solve_FEMM_worker_pool(self):
+        out1 = solve(FEMMStandIn(), 1)
+        out4 = solve(FEMMStandIn(), 4)
+
+        # Each time step matches the rotor position
+        angle = out1.mag.angle
+        angle_rotor = out1.get_angle_rotor()
+        Br = cos(2 * (angle[None, :] - angle_rotor[:, None]))
+        assert_array_almost_equal(out1.mag.Br, Br)
+        assert_array_almost_equal(out1.mag.Tem[:, 0], angle_rotor * 180 / pi)
+
+        # The pool reassembles the results in time order
+        assert_array_almost_equal(out4.mag.Br, out1.mag.Br)
+        assert_array_almost_equal(out4.mag.Bt, out1.mag.Bt)
+        assert_array_almost_equal(out4.mag.Tem, out1.mag.Tem)
+        assert_array_almost_equal(out4.mag.Phi_wind_stator, out1.mag.Phi_wind_stator)
+
+        # The workers remove their copy of the model
+        path_fem = out4.simu.mag.get_path_save_fem(out4)
+        for ii in range(4):
+            self.assertFalse(isfile(path_fem[:-4] + "_worker" + str(ii + 1) + ".fem"))
+
+    def test_solve_FEMM_no_sliding_band(self):
+        """Check the flux density projection without sliding band"""
+        out = solve(FEMMStandIn(), 1, is_sliding_band=False)
+        # The rotor is not rotated without sliding band
+        angle = out.mag.angle
+        assert_array_almost_equal(out.mag.Br, cos(2 * angle)[None, :].repeat(Nt, 0))
+        assert_array_almost_equal(out.mag.Bt, sin(2 * angle)[None, :].repeat(Nt, 0))
+
+    def test_solve_FEMM_symmetry(self):
+        """Check that the flux density of the full machine is rebuilt from the
+        first symmetry sector
+        """
+        out1 = solve(FEMMStandIn(), 1)
+        # The flux density of the stand-in has 2 pole pairs
+        for nb_worker, is_sliding_band, sym, is_antiper in [
+            (1, True, 4, True),
+            (2, True, 2, False),
+            (1, False, 4, True),
+        ]:
+            out = solve(
+                FEMMStandIn(), nb_worker, is_sliding_band, False, sym, is_antiper
+            )
+            if not is_sliding_band:
+                angle = out.mag.angle
+                assert_array_almost_equal(out.mag.Br[0], cos(2 * angle))
+                assert_array_almost_equal(out.mag.Bt[0], sin(2 * angle))
+            else:
+                assert_array_almost_equal(out.mag.Br, out1.mag.Br)
+                assert_array_almost_equal(out.mag.Bt, out1.mag.Bt)
+                # The torque of the sector is multiplied by sym
+                assert_array_almost_equal(out.mag.Tem, sym * out1.mag.Tem)
+
+    def test_periodicity_no_sliding_band(self):
+        """The periodicity of the machine requires the sliding band"""
+        simu_sym = Simu1(init_dict=simu.as_dict())
+        simu_sym.mag.is_periodicity_a = True
+        simu_sym.mag.is_sliding_band = False
+        with self.assertRaises(InputError):
+            simu_sym.mag.comp_flux_airgap(Output(simu=simu_sym), FEMMStandIn())
+
+    def test_solve_FEMM_meshsolution(self):
+        """Check that the mesh is loaded once and the solution at each step"""
+        out = solve(FEMMStandIn(), 2, is_get_mesh=True)
+        meshsol = out.mag.meshsolution
+        self.assertTrue(meshsol.is_same_mesh)
+        self.assertTrue(meshsol.is_stacked_solution)
+        self.assertEqual(len(meshsol.mesh), 1)
+        self.assertEqual(len(meshsol.solution), 1)
+        self.assertEqual(meshsol.solution[0].get_field("B").shape, (Nt, 2, 2))
+        self.assertEqual(meshsol.solution[0].get_field("mu").shape, (Nt, 2))
+
+        mesh = meshsol.get_mesh(Nt - 1)
+        self.assertEqual(mesh.node.nb_node, 4)
+        assert_array_almost_equal(mesh.node.coordinate[2], [1, 1])
+        element = mesh.element["Triangle3"]
+        assert_array_almost_equal(element.connectivity, [[0, 1, 2], [0, 2, 3]])
+        assert_array_almost_equal(element.group, [2, 14])
+
+        angle_rotor = out.get_angle_rotor() * 180 / pi
+        for ii in range(Nt):
+            solution = meshsol.get_solution(ii)
+            assert_array_almost_equal(solution.get_field("B")[:, 0], angle_rotor[ii])
+            assert_array_almost_equal(solution.get_field("Az"), [-1, 1])
+
+        # The temporary files are removed
+        save_path = out.simu.mag.get_path_save(out)
+        self.assertEqual(
+            [
+                name
+                for name in listdir(save_path)
+                if splitext(name)[1] in [".lua", ".bin"]
+            ],
+            [],
+        )
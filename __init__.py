@@ -1 +1,3 @@
 # -*- coding: utf-8 -*-
+
+from pyleecan.Classes._check import trusted